@@ -187,6 +187,21 @@ class EnvConfig:
             'description': 'Dilithium-3 public verification key (base64) — ADR-078. Safe to distribute.',
             'example': 'set via: python -m omnix_core.tools.key_gen'
         },
+        'OMNIX_SIGNING_KEY_VERSION': {
+            'category': EnvCategory.SECURITY,
+            'required': False,
+            'validator': lambda x: len(x) > 0,
+            'description': 'Label of the active signing key, reported with key_id in signing metadata (default: 1)',
+            'example': '2'
+        },
+        'OMNIX_SIGNING_KEY_PROVIDER': {
+            'category': EnvCategory.SECURITY,
+            'required': False,
+            'default': 'dilithium3',
+            'validator': lambda x: len(x) > 0,
+            'description': 'Crypto provider the env signing key belongs to; other providers never receive it',
+            'example': 'dilithium3'
+        },
         'OMNIX_KEY_MODE': {
             'category': EnvCategory.SECURITY,
             'required': False,
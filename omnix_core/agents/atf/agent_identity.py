@@ -140,9 +140,8 @@ class AgentIdentityEngine:
 
     def _get_conn(self):
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
-            return conn
+            from omnix_services.database_service.connection_provider import get_connection
+            return get_connection("atf", self._db_url)
         except Exception as exc:
             logger.warning(f"[ATF.Identity] DB connection failed: {exc}")
             return None
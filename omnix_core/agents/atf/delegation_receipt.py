@@ -28,12 +28,16 @@ import logging
 import os
 import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.ATF.Delegation")
 
+# The platform fallback key is the Dilithium-3 env key, whatever the active provider is.
+_ATF_SIGNING_PROVIDER = "dilithium3"
+
 DDL_DELEGATION_RECEIPTS = """
 CREATE TABLE IF NOT EXISTS atf_delegation_receipts (
     delegation_id               VARCHAR(64)   PRIMARY KEY,
@@ -183,6 +187,14 @@ class DelegationReceiptEngine:
         self._store: Dict[str, DelegationReceipt] = {}
         self._lock = threading.Lock()
         self._provider = self._load_provider()
+        # Verified-signature cache: (content_hash, pqc_signature, public_key) → valid.
+        # The signature covers content_hash, so the key fully determines the result —
+        # ancestors shared by many chains pay the PQC verify once.
+        self._sig_cache: "OrderedDict[Tuple[str, str, str], bool]" = OrderedDict()
+        self._sig_cache_size = int(os.environ.get("OMNIX_ATF_SIG_CACHE_SIZE", "10000"))
+        # Bumped whenever a stored receipt is replaced (revocation) so callers
+        # memoizing chain results can tell their view is stale.
+        self.revision = 0
 
     def _load_provider(self):
         try:
@@ -193,9 +205,8 @@ class DelegationReceiptEngine:
 
     def _get_conn(self):
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
-            return conn
+            from omnix_services.database_service.connection_provider import get_connection
+            return get_connection("atf", self._db_url)
         except Exception as exc:
             logger.warning(f"[ATF.Delegation] DB connection failed: {exc}")
             return None
@@ -263,11 +274,15 @@ class DelegationReceiptEngine:
         if not self._provider:
             return None, None
 
-        sk_b64 = agent_sk_b64 or os.environ.get("OMNIX_SIGNING_SECRET_KEY_B64", "").strip()
-        if not sk_b64:
-            return None, None
         try:
-            sk = base64.b64decode(sk_b64)
+            from omnix_core.security.crypto_providers import decode_secret_key, get_signing_key
+            if agent_sk_b64:
+                sk = decode_secret_key(agent_sk_b64)
+            else:
+                key = get_signing_key(_ATF_SIGNING_PROVIDER)
+                if key is None:
+                    return None, None
+                sk = key.secret_key
             sig = self._provider.sign(content_hash.encode(), sk)
             if sig:
                 return base64.b64encode(sig).decode(), self._provider.algorithm_name()
@@ -456,14 +471,9 @@ class DelegationReceiptEngine:
 
         if receipt.pqc_signature and pub_key and self._provider:
             pqc_checked = True
-            try:
-                sig = base64.b64decode(receipt.pqc_signature)
-                pk  = base64.b64decode(pub_key)
-                pqc_valid = bool(self._provider.verify(
-                    sig, receipt.content_hash.encode(), pk
-                ))
-            except Exception as exc:
-                logger.warning(f"[ATF.Delegation] PQC verify error: {exc}")
+            pqc_valid = self._verify_signature_cached(
+                receipt.content_hash, receipt.pqc_signature, pub_key
+            )
 
         mar_valid = receipt.authority_budget_granted <= receipt.authority_budget_delegator
         not_expired = not receipt.is_expired()
@@ -489,13 +499,46 @@ class DelegationReceiptEngine:
             "delegate_id":      receipt.delegate_id,
         }
 
-    def get_delegation(self, delegation_id: str) -> Optional[DelegationReceipt]:
+    def _verify_signature_cached(self, content_hash: str, sig_b64: str, pub_key_b64: str) -> bool:
+        key = (content_hash, sig_b64, pub_key_b64)
+        with self._lock:
+            cached = self._sig_cache.get(key)
+            if cached is not None:
+                self._sig_cache.move_to_end(key)
+                return cached
+        try:
+            sig = base64.b64decode(sig_b64)
+            pk  = base64.b64decode(pub_key_b64)
+            valid = bool(self._provider.verify(sig, content_hash.encode(), pk))
+        except Exception as exc:
+            logger.warning(f"[ATF.Delegation] PQC verify error: {exc}")
+            return False
+        with self._lock:
+            self._sig_cache[key] = valid
+            if len(self._sig_cache) > self._sig_cache_size:
+                self._sig_cache.popitem(last=False)
+        return valid
+
+    def get_delegation(
+        self, delegation_id: str, with_ancestors: bool = False
+    ) -> Optional[DelegationReceipt]:
+        """
+        Receipt by ID — in-memory first, then DB.
+
+        with_ancestors=True turns a DB miss into one recursive query that also
+        loads every ancestor up to the root, so a chain walk that follows
+        costs a single round-trip instead of one per depth.
+        """
         with self._lock:
             if delegation_id in self._store:
                 return self._store[delegation_id]
 
         if not self._db_url:
             return None
+        if with_ancestors:
+            self._fetch_ancestors(delegation_id)
+            with self._lock:
+                return self._store.get(delegation_id)
         conn = self._get_conn()
         if not conn:
             return None
@@ -518,6 +561,38 @@ class DelegationReceiptEngine:
             conn.close()
         return None
 
+    def _fetch_ancestors(self, delegation_id: str, max_depth: int = 50) -> int:
+        """Load delegation_id and its ancestors (up to max_depth) into the store."""
+        conn = self._get_conn()
+        if not conn:
+            return 0
+        loaded = 0
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    WITH RECURSIVE ancestry AS (
+                        SELECT r.*, 1 AS hop FROM atf_delegation_receipts r
+                        WHERE r.delegation_id = %s
+                        UNION ALL
+                        SELECT p.*, a.hop + 1 FROM atf_delegation_receipts p
+                        JOIN ancestry a ON p.delegation_id = a.parent_delegation_id
+                        WHERE a.hop < %s
+                    )
+                    SELECT * FROM ancestry
+                """, (delegation_id, max_depth))
+                cols = [d[0] for d in cur.description]
+                receipts = [self._row_to_receipt(dict(zip(cols, r))) for r in cur.fetchall()]
+            with self._lock:
+                for receipt in receipts:
+                    if receipt.delegation_id not in self._store:
+                        self._store[receipt.delegation_id] = receipt
+                        loaded += 1
+        except Exception as exc:
+            logger.warning(f"[ATF.Delegation] fetch_ancestors DB failed: {exc}")
+        finally:
+            conn.close()
+        return loaded
+
     def list_delegations(
         self,
         delegate_id: Optional[str] = None,
@@ -536,6 +611,7 @@ class DelegationReceiptEngine:
 
     def revoke_delegation(self, delegation_id: str) -> bool:
         with self._lock:
+            self.revision += 1
             if delegation_id in self._store:
                 dr = self._store[delegation_id]
                 self._store[delegation_id] = DelegationReceipt(
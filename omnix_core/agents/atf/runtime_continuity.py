@@ -543,6 +543,39 @@ class ContinuitySession:
     metadata:            Dict[str, Any] = field(default_factory=dict)
     governance_risk_tier: str         = "STANDARD"  # ADR-160: LOW/STANDARD/HIGH/CRITICAL
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # While registered with an engine, changes to the indexed fields are
+        # reported so the chain_root_id aggregates stay exact.
+        hook = self.__dict__.get("_index_hook")
+        if hook is None or name not in _INDEXED_SESSION_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        if old != value:
+            hook(self, name, old)
+
+
+_INDEXED_SESSION_FIELDS = frozenset(
+    {"chain_root_id", "status", "budget_at_admission", "budget_remaining"}
+)
+
+
+@dataclass
+class _ChainRootAggregate:
+    """
+    Running budget totals for the live sessions sharing one chain_root_id.
+
+    Maintained on start / stop and on every change to a session's root,
+    status or budget, so the fragmentation guard reads O(1) state instead of
+    scanning every session per sample.
+    """
+    members:          int   = 0
+    admitted:         float = 0.0   # all live sessions — AFG aggregate
+    active_count:     int   = 0
+    active_admission: float = 0.0
+    active_remaining: float = 0.0
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # RuntimeContinuityEngine
@@ -569,6 +602,10 @@ class RuntimeContinuityEngine:
     def __init__(self, db_url: Optional[str] = None):
         self._db_url = db_url or os.environ.get("DATABASE_URL")
         self._sessions:  Dict[str, ContinuitySession] = {}
+        # chain_root_id → running budget aggregates (own lock: session field
+        # updates report in while the caller may already hold _lock)
+        self._root_index: Dict[str, _ChainRootAggregate] = {}
+        self._index_lock = threading.Lock()
         self._rcr_store: Dict[str, RuntimeContinuityRecord] = {}
         self._cee_store: Dict[str, ContinuityEscalationEvent] = {}
         self._rc_store:  Dict[str, ReauthorizationChallenge] = {}
@@ -685,7 +722,11 @@ class RuntimeContinuityEngine:
         )
 
         with self._lock:
+            previous = self._sessions.get(tar_id)
+            if previous is not None:
+                self._index_remove(previous)
             self._sessions[tar_id] = session
+            self._index_add(session)
 
         # Register with RPOL event sampler (ADR-160)
         try:
@@ -732,7 +773,9 @@ class RuntimeContinuityEngine:
         )
 
         with self._lock:
-            self._sessions.pop(tar_id, None)
+            stopped = self._sessions.pop(tar_id, None)
+            if stopped is not None:
+                self._index_remove(stopped)
 
         # Deregister from RPOL event sampler (ADR-160)
         try:
@@ -1213,16 +1256,13 @@ class RuntimeContinuityEngine:
         return max(0, session.dr_expires_at_ns - now_ns)
 
     def _fragmentation_score(self, chain_root_id: str) -> float:
-        """Aggregate budget consumption % across sessions sharing this root."""
-        with self._lock:
-            sessions = [
-                s for s in self._sessions.values()
-                if s.chain_root_id == chain_root_id and s.status == "ACTIVE"
-            ]
-        if not sessions:
-            return 0.0
-        total_admission = sum(s.budget_at_admission for s in sessions)
-        total_remaining = sum(s.budget_remaining for s in sessions)
+        """Aggregate budget consumption % across ACTIVE sessions sharing this root."""
+        with self._index_lock:
+            agg = self._root_index.get(chain_root_id)
+            if agg is None or agg.active_count == 0:
+                return 0.0
+            total_admission = agg.active_admission
+            total_remaining = agg.active_remaining
         if total_admission <= 0:
             return 0.0
         consumed = total_admission - total_remaining
@@ -1230,12 +1270,55 @@ class RuntimeContinuityEngine:
 
     def _aggregate_consumed(self, chain_root_id: str) -> float:
         """Total budget granted across all sessions in a chain."""
-        with self._lock:
-            return sum(
-                s.budget_at_admission
-                for s in self._sessions.values()
-                if s.chain_root_id == chain_root_id
-            )
+        with self._index_lock:
+            agg = self._root_index.get(chain_root_id)
+            return agg.admitted if agg is not None else 0.0
+
+    # ── chain_root_id index ──────────────────────────────────────────────────
+
+    def _index_add(self, session: ContinuitySession) -> None:
+        with self._index_lock:
+            self._index_apply(session.chain_root_id, session.budget_at_admission,
+                              session.status, session.budget_remaining, +1)
+            object.__setattr__(session, "_index_hook", self._on_session_change)
+
+    def _index_remove(self, session: ContinuitySession) -> None:
+        with self._index_lock:
+            if session.__dict__.pop("_index_hook", None) is None:
+                return
+            self._index_apply(session.chain_root_id, session.budget_at_admission,
+                              session.status, session.budget_remaining, -1)
+
+    def _on_session_change(self, session: ContinuitySession, name: str, old: Any) -> None:
+        """Swap the session's old contribution for its new one."""
+        before = {
+            "chain_root_id":       session.chain_root_id,
+            "budget_at_admission": session.budget_at_admission,
+            "status":              session.status,
+            "budget_remaining":    session.budget_remaining,
+        }
+        before[name] = old
+        with self._index_lock:
+            self._index_apply(before["chain_root_id"], before["budget_at_admission"],
+                              before["status"], before["budget_remaining"], -1)
+            self._index_apply(session.chain_root_id, session.budget_at_admission,
+                              session.status, session.budget_remaining, +1)
+
+    def _index_apply(self, root: str, admission: float, status: str,
+                     remaining: float, sign: int) -> None:
+        """Add (sign=+1) or remove (sign=-1) one session's contribution. Caller holds _index_lock."""
+        agg = self._root_index.setdefault(root, _ChainRootAggregate())
+        agg.members += sign
+        agg.admitted += sign * admission
+        if status == "ACTIVE":
+            agg.active_count += sign
+            agg.active_admission += sign * admission
+            agg.active_remaining += sign * remaining
+            if agg.active_count <= 0:
+                # Reset rather than subtract down to ~0 so float error never accumulates.
+                agg.active_count, agg.active_admission, agg.active_remaining = 0, 0.0, 0.0
+        if agg.members <= 0:
+            del self._root_index[root]
 
     def _evaluate_escalation(
         self,
@@ -1459,9 +1542,8 @@ class RuntimeContinuityEngine:
 
     def _get_conn(self):
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
-            return conn
+            from omnix_services.database_service.connection_provider import get_connection
+            return get_connection("atf", self._db_url)
         except Exception as exc:
             logger.warning(f"[RGC] DB connection failed: {exc}")
             return None
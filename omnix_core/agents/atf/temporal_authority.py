@@ -50,6 +50,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.ATF.Temporal")
 
+# TARs are signed with the Dilithium-3 env key, whatever the active provider is.
+_ATF_SIGNING_PROVIDER = "dilithium3"
+
 # ─────────────────────────────────────────────────────────────────────────────
 # COMPILED STALENESS BOUNDS — TAR-INV-006
 #
@@ -216,9 +219,8 @@ class TemporalAuthorityEngine:
 
     def _get_conn(self):
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
-            return conn
+            from omnix_services.database_service.connection_provider import get_connection
+            return get_connection("atf", self._db_url)
         except Exception as exc:
             logger.warning(f"[ATF.Temporal] DB connection failed: {exc}")
             return None
@@ -237,11 +239,12 @@ class TemporalAuthorityEngine:
     def _sign(self, content_hash: str) -> Tuple[Optional[str], Optional[str]]:
         if not self._provider:
             return None, None
-        sk_b64 = os.environ.get("OMNIX_SIGNING_SECRET_KEY_B64", "").strip()
-        if not sk_b64:
+        from omnix_core.security.crypto_providers import get_signing_key
+        key = get_signing_key(_ATF_SIGNING_PROVIDER)
+        if key is None:
             return None, None
         try:
-            sk = base64.b64decode(sk_b64)
+            sk = key.secret_key
             sig = self._provider.sign(content_hash.encode(), sk)
             if sig:
                 return base64.b64encode(sig).decode(), self._provider.algorithm_name()
@@ -13,15 +13,24 @@ Key properties guaranteed by the lattice:
   - Full traceability: any leaf traces to its human root via chain_root_id
   - Independent verifiability: verify_chain() needs no platform access
 
+Verified-prefix memoization: verify_chain() remembers, per receipt, the chain
+state after verifying root → that receipt.  A later chain sharing the ancestor
+resumes from it, so a new leaf under a verified subtree verifies one receipt.
+An entry is reused only while the receipt's recomputed content hash and the
+delegation engine's revision (bumped on revocation) are unchanged; it vouches
+for the ancestors it was built from, which are immutable once issued.
+
 ADR-156 — Harold Nunes — OMNIX QUANTUM LTD — May 2026
 """
 from __future__ import annotations
 
 import logging
+import os
 import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from omnix_core.agents.atf.agent_identity import AgentIdentity, AgentIdentityEngine
 from omnix_core.agents.atf.delegation_receipt import (
@@ -101,6 +110,21 @@ class VerificationResult:
         }
 
 
+@dataclass
+class _VerifiedPrefix:
+    """Chain state after verifying root → one receipt (verify_chain memo entry)."""
+    revision: int
+    fingerprint: str
+    nodes: Tuple[ChainNode, ...]
+    fully_verified: bool
+    mar_valid: bool
+    all_pqc_signed: bool
+    failure_reason: Optional[str]
+    budget: float
+    root_actor_id: str
+    chain_root_id: Optional[str]
+
+
 class TrustLattice:
     """
     The OMNIX Agent Trust Fabric lattice — the authoritative graph of
@@ -122,6 +146,8 @@ class TrustLattice:
         self._delegation_engine = DelegationReceiptEngine(db_url=db_url)
         self._agent_delegations: Dict[str, List[str]] = {}
         self._lock = threading.Lock()
+        self._prefix_cache: "OrderedDict[str, _VerifiedPrefix]" = OrderedDict()
+        self._prefix_cache_size = int(os.environ.get("OMNIX_ATF_PREFIX_CACHE_SIZE", "10000"))
 
     def ensure_tables(self) -> bool:
         a = self._identity_engine.ensure_tables()
@@ -232,15 +258,29 @@ class TrustLattice:
                 failure_reason="No delegation receipt found for agent",
             )
 
-        chain_receipts = self._collect_chain(receipt)
-        chain_nodes: List[ChainNode] = []
-        fully_verified = True
-        mar_valid = True
-        all_pqc_signed = True
-        failure_reason: Optional[str] = None
-        prev_budget = 100.0
-
-        for i, dr in enumerate(chain_receipts):
+        prefix, pending = self._collect_unverified(receipt)
+        revision = self._delegation_engine.revision
+        if prefix is not None:
+            chain_nodes: List[ChainNode] = list(prefix.nodes)
+            fully_verified = prefix.fully_verified
+            mar_valid = prefix.mar_valid
+            all_pqc_signed = prefix.all_pqc_signed
+            failure_reason: Optional[str] = prefix.failure_reason
+            prev_budget = prefix.budget
+            root_actor = prefix.root_actor_id
+            chain_root_id = prefix.chain_root_id
+        else:
+            chain_nodes = []
+            fully_verified = True
+            mar_valid = True
+            all_pqc_signed = True
+            failure_reason = None
+            prev_budget = 100.0
+            root_actor = pending[0].delegator_id
+            chain_root_id = pending[0].chain_root_id
+
+        for dr in pending:
+            i = len(chain_nodes)
             vr = self._delegation_engine.verify_receipt(dr)
 
             if not vr["hash_valid"]:
@@ -282,10 +322,18 @@ class TrustLattice:
                 created_at=dr.created_at,
             )
             chain_nodes.append(node)
-
-        root_actor = chain_receipts[0].delegator_id if chain_receipts else "unknown"
-        leaf_budget = chain_receipts[-1].authority_budget_granted if chain_receipts else 0.0
-        chain_root_id = chain_receipts[0].chain_root_id if chain_receipts else None
+            self._remember_prefix(dr, _VerifiedPrefix(
+                revision=revision,
+                fingerprint=self._fingerprint(dr),
+                nodes=tuple(chain_nodes),
+                fully_verified=fully_verified,
+                mar_valid=mar_valid,
+                all_pqc_signed=all_pqc_signed,
+                failure_reason=failure_reason,
+                budget=prev_budget,
+                root_actor_id=root_actor,
+                chain_root_id=chain_root_id,
+            ))
 
         return VerificationResult(
             agent_id=receipt.delegate_id,
@@ -293,7 +341,7 @@ class TrustLattice:
             fully_verified=fully_verified,
             chain_depth=len(chain_nodes),
             root_actor_id=root_actor,
-            leaf_budget=leaf_budget,
+            leaf_budget=prev_budget,
             mar_valid=mar_valid,
             all_pqc_signed=all_pqc_signed,
             chain_root_id=chain_root_id,
@@ -322,6 +370,67 @@ class TrustLattice:
                 return sorted(delegations, key=lambda d: d.delegation_depth, reverse=True)[0]
         return None
 
+    @staticmethod
+    def _fingerprint(dr: DelegationReceipt) -> str:
+        return DelegationReceiptEngine._compute_content_hash(dr.to_dict())
+
+    def _prefix_hit(self, dr: DelegationReceipt, revision: int) -> Optional[_VerifiedPrefix]:
+        with self._lock:
+            entry = self._prefix_cache.get(dr.delegation_id)
+        if entry is None or entry.revision != revision:
+            return None
+        if entry.fingerprint != self._fingerprint(dr):
+            return None
+        with self._lock:
+            if dr.delegation_id in self._prefix_cache:
+                self._prefix_cache.move_to_end(dr.delegation_id)
+        return entry
+
+    def _remember_prefix(self, dr: DelegationReceipt, entry: _VerifiedPrefix) -> None:
+        with self._lock:
+            self._prefix_cache[dr.delegation_id] = entry
+            self._prefix_cache.move_to_end(dr.delegation_id)
+            while len(self._prefix_cache) > self._prefix_cache_size:
+                self._prefix_cache.popitem(last=False)
+
+    def _collect_unverified(
+        self, leaf: DelegationReceipt
+    ) -> Tuple[Optional[_VerifiedPrefix], List[DelegationReceipt]]:
+        """
+        Walk from the leaf towards the root, stopping at the first receipt with
+        a valid verified-prefix memo.  Returns (prefix or None, receipts still
+        to verify ordered root-side first).  A DB miss loads every remaining
+        ancestor in one query.
+        """
+        revision = self._delegation_engine.revision
+        prefix = self._prefix_hit(leaf, revision)
+        if prefix is not None:
+            return prefix, []
+
+        pending: List[DelegationReceipt] = [leaf]
+        visited = {leaf.delegation_id}
+        current = leaf
+
+        MAX_DEPTH = 50
+        while current.parent_delegation_id and len(pending) < MAX_DEPTH:
+            parent_id = current.parent_delegation_id
+            if parent_id in visited:
+                logger.error(f"[ATF.Lattice] Cycle detected in delegation chain at {parent_id}")
+                break
+            parent = self._delegation_engine.get_delegation(parent_id, with_ancestors=True)
+            if parent is None:
+                logger.warning(f"[ATF.Lattice] Parent receipt {parent_id} not found — chain truncated")
+                break
+            visited.add(parent_id)
+            prefix = self._prefix_hit(parent, revision)
+            if prefix is not None:
+                break
+            pending.append(parent)
+            current = parent
+
+        pending.reverse()
+        return prefix, pending
+
     def _collect_chain(self, leaf: DelegationReceipt) -> List[DelegationReceipt]:
         """
         Traverse the delegation chain from the leaf back to the root.
@@ -338,7 +447,7 @@ class TrustLattice:
             if parent_id in visited:
                 logger.error(f"[ATF.Lattice] Cycle detected in delegation chain at {parent_id}")
                 break
-            parent = self._delegation_engine.get_delegation(parent_id)
+            parent = self._delegation_engine.get_delegation(parent_id, with_ancestors=True)
             if parent is None:
                 logger.warning(f"[ATF.Lattice] Parent receipt {parent_id} not found — chain truncated")
                 break
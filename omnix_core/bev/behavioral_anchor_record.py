@@ -23,12 +23,20 @@ import json
 import logging
 import os
 import uuid
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.BEV.BAR")
 
+# Upper bound on waiting for a worker signature before persisting unsigned
+_SIGN_TIMEOUT_S = float(os.environ.get("OMNIX_BAR_SIGN_TIMEOUT_S", "10"))
+
+# BARs are always signed with Dilithium-3 so pqc_algorithm names what signed (BEV-INV-004)
+_BAR_SIGNING_PROVIDER = "dilithium3"
+_BAR_SIGNING_ALGORITHM = "ML-DSA-65"
+
 
 # ─────────────────────────────────────────────────────────────────
 #  Data model
@@ -190,8 +198,8 @@ class BAREngine:
         return self._pqc
 
     def _get_conn(self):
-        import psycopg
-        return psycopg.connect(self._db_url)
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("bev", self._db_url)
 
     def ensure_tables(self) -> None:
         if not self._db_url:
@@ -223,6 +231,35 @@ class BAREngine:
         The output is hashed (never stored raw), the constraint set is evaluated,
         and the full record is PQC-signed before return.
         """
+        bar, sig_future = self.begin_bar(
+            session_id=session_id,
+            agent_id=agent_id,
+            turn_index=turn_index,
+            output_text=output_text,
+            governing_receipt_id=governing_receipt_id,
+            constraint_set=constraint_set,
+            metadata=metadata,
+        )
+        return self.complete_bar(bar, sig_future)
+
+    def begin_bar(
+        self,
+        session_id: str,
+        agent_id: str,
+        turn_index: int,
+        output_text: str,
+        governing_receipt_id: str,
+        constraint_set: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[BehavioralAnchorRecord, Optional[Future]]:
+        """
+        First half of create_bar(): build the BAR and hand its signing payload
+        to the SigningService. Returns (unsigned bar, signature future or None).
+
+        bar_id, content_hash and bar_status are final here, so callers can run
+        CCS / CTCHC work while the signature is computed in a worker process.
+        Pass both values to complete_bar() to attach the signature and persist.
+        """
         output_bytes = output_text.encode("utf-8")
         output_hash = hashlib.sha3_256(output_bytes).hexdigest()
         output_preview = output_text[:256] if output_text else ""
@@ -247,29 +284,18 @@ class BAREngine:
             constraint_set_hash=constraint_set_hash,
         )
 
-        pqc_sig: Optional[str] = None
-        pqc_alg: Optional[str] = None
+        sig_future: Optional[Future] = None
         pqc = self._get_pqc()
         if pqc.pqc_enabled:
             try:
-                import base64 as _b64
-                _sk_b64 = os.environ.get("OMNIX_SIGNING_SECRET_KEY_B64", "").strip()
-                if _sk_b64:
-                    _sk_bytes = _b64.b64decode(_sk_b64)
-                    _payload = json.dumps({
-                        "bar_id": bar_id,
-                        "content_hash": content_hash,
-                        "governing_receipt_id": governing_receipt_id,
-                        "created_at": created_at,
-                    }, sort_keys=True).encode("utf-8")
-                    _sig_raw = pqc.sign_message(_payload, _sk_bytes)
-                    if _sig_raw:
-                        pqc_sig = _b64.b64encode(_sig_raw).decode("utf-8")
-                        pqc_alg = "ML-DSA-65"
-                    else:
-                        logger.warning("[BAR] sign_message returned None — BAR unsigned")
-                else:
-                    logger.debug("[BAR] OMNIX_SIGNING_SECRET_KEY_B64 not set — BAR unsigned")
+                from omnix_core.security.signing_service import get_signing_service
+                _payload = json.dumps({
+                    "bar_id": bar_id,
+                    "content_hash": content_hash,
+                    "governing_receipt_id": governing_receipt_id,
+                    "created_at": created_at,
+                }, sort_keys=True).encode("utf-8")
+                sig_future = get_signing_service().submit(_payload, provider_id=_BAR_SIGNING_PROVIDER)
             except Exception as exc:
                 logger.warning(f"[BAR] PQC signing failed (non-blocking): {exc}")
 
@@ -286,13 +312,39 @@ class BAREngine:
             content_hash=content_hash,
             bar_status=bar_status,
             halt_reason=halt_reason,
-            pqc_signature=pqc_sig,
-            pqc_algorithm=pqc_alg,
+            pqc_signature=None,
+            pqc_algorithm=None,
             created_at=created_at,
             metadata=metadata or {},
         )
+        return bar, sig_future
+
+    def complete_bar(
+        self,
+        bar: BehavioralAnchorRecord,
+        sig_future: Optional[Future],
+        persist: bool = True,
+    ) -> BehavioralAnchorRecord:
+        """
+        Second half of create_bar(): wait for the signature, attach it, persist.
 
-        self._persist(bar)
+        persist=False leaves the INSERT to the caller (see _insert_params), e.g.
+        the OGR write-behind queue that commits a whole turn in one transaction.
+        """
+        if sig_future is not None:
+            try:
+                import base64 as _b64
+                _sig_raw = sig_future.result(timeout=_SIGN_TIMEOUT_S)
+                if _sig_raw:
+                    bar.pqc_signature = _b64.b64encode(_sig_raw).decode("utf-8")
+                    bar.pqc_algorithm = _BAR_SIGNING_ALGORITHM
+                else:
+                    logger.debug("[BAR] No signing key or signature — BAR unsigned")
+            except Exception as exc:
+                logger.warning(f"[BAR] PQC signing failed (non-blocking): {exc}")
+
+        if persist:
+            self._persist(bar)
         return bar
 
     # ── Constraint evaluation ─────────────────────────────────────
@@ -345,28 +397,34 @@ class BAREngine:
 
     # ── Persistence ───────────────────────────────────────────────
 
+    _INSERT_SQL = """
+        INSERT INTO atf_behavioral_anchor_records
+            (bar_id, session_id, agent_id, turn_index,
+             output_hash, output_preview, governing_receipt_id,
+             constraint_set_hash, atf_layer, content_hash,
+             bar_status, halt_reason, pqc_signature, pqc_algorithm,
+             created_at, metadata)
+        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+        ON CONFLICT (bar_id) DO NOTHING
+    """
+
+    @staticmethod
+    def _insert_params(bar: BehavioralAnchorRecord) -> tuple:
+        return (
+            bar.bar_id, bar.session_id, bar.agent_id, bar.turn_index,
+            bar.output_hash, bar.output_preview, bar.governing_receipt_id,
+            bar.constraint_set_hash, bar.atf_layer, bar.content_hash,
+            bar.bar_status, bar.halt_reason, bar.pqc_signature, bar.pqc_algorithm,
+            bar.created_at, json.dumps(bar.metadata),
+        )
+
     def _persist(self, bar: BehavioralAnchorRecord) -> None:
         if not self._db_url:
             return
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO atf_behavioral_anchor_records
-                            (bar_id, session_id, agent_id, turn_index,
-                             output_hash, output_preview, governing_receipt_id,
-                             constraint_set_hash, atf_layer, content_hash,
-                             bar_status, halt_reason, pqc_signature, pqc_algorithm,
-                             created_at, metadata)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        ON CONFLICT (bar_id) DO NOTHING
-                    """, (
-                        bar.bar_id, bar.session_id, bar.agent_id, bar.turn_index,
-                        bar.output_hash, bar.output_preview, bar.governing_receipt_id,
-                        bar.constraint_set_hash, bar.atf_layer, bar.content_hash,
-                        bar.bar_status, bar.halt_reason, bar.pqc_signature, bar.pqc_algorithm,
-                        bar.created_at, json.dumps(bar.metadata),
-                    ))
+                    cur.execute(self._INSERT_SQL, self._insert_params(bar))
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[BAR] persist failed (non-blocking): {exc}")
@@ -14,6 +14,16 @@ Invariants enforced here:
   BEV-INV-014: CTCHC seal MUST be PQC-signed (ML-DSA-65) before OEP export.
   BEV-INV-018: Every link's governing_receipt_id MUST match the chain's governing_receipt_id.
 
+Verified checkpoints:
+  Every OMNIX_CTCHC_CHECKPOINT_INTERVAL links (default 1000; 0 disables), a
+  successful verify_chain() persists a (turn_index, link_hash) checkpoint with
+  a stamp hash, ML-DSA-65 signed when a signing key is configured.  Later
+  calls start from the newest trusted checkpoint and re-hash only the tail, so
+  a 50k-turn session costs O(K) instead of O(n).  A sealed chain that verified
+  fully is checkpointed at its last link with the seal hash in the stamp.
+  verify_chain(full=True) ignores checkpoints and walks from genesis — use it
+  for offline audits.
+
 Harold Nunes — OMNIX QUANTUM LTD — May 2026
 """
 from __future__ import annotations
@@ -29,6 +39,10 @@ from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.BEV.CTCHC")
 
+# Seals and checkpoints are always signed with Dilithium-3 (labelled ML-DSA-65),
+# whatever the active provider is.
+_CTCHC_SIGNING_PROVIDER = "dilithium3"
+
 
 # ─────────────────────────────────────────────────────────────────
 #  Data models
@@ -61,6 +75,33 @@ class ChainLink:
         }
 
 
+@dataclass
+class ChainCheckpoint:
+    """A verified prefix of a CTCHC: links 0..turn_index re-hashed and found intact."""
+    session_id: str
+    chain_id: str
+    turn_index: int
+    link_hash: str
+    seal_hash: Optional[str]
+    stamp_hash: str
+    stamp_signature: Optional[str]
+    stamp_algorithm: Optional[str]
+    verified_at: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "chain_id": self.chain_id,
+            "turn_index": self.turn_index,
+            "link_hash": self.link_hash,
+            "seal_hash": self.seal_hash,
+            "stamp_hash": self.stamp_hash,
+            "stamp_signature": self.stamp_signature,
+            "stamp_algorithm": self.stamp_algorithm,
+            "verified_at": self.verified_at,
+        }
+
+
 @dataclass
 class CoherenceHashChain:
     """
@@ -164,6 +205,24 @@ class CTCHCEngine:
     CREATE INDEX IF NOT EXISTS idx_links_turn    ON atf_coherence_chain_links(session_id, turn_index);
     """
 
+    _CREATE_CHECKPOINTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS atf_coherence_chain_checkpoints (
+        session_id           TEXT NOT NULL,
+        turn_index           INTEGER NOT NULL,
+        chain_id             TEXT NOT NULL,
+        link_hash            TEXT NOT NULL,
+        seal_hash            TEXT,
+        stamp_hash           TEXT NOT NULL,
+        stamp_signature      TEXT,
+        stamp_algorithm      TEXT,
+        verified_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (session_id, turn_index)
+    );
+    """
+
+    # Newest checkpoints tried before falling back to a full walk.
+    _CHECKPOINT_CANDIDATES = 3
+
     def __init__(self):
         self._db_url = os.environ.get("DATABASE_URL")
         self._pqc = None
@@ -176,6 +235,12 @@ class CTCHCEngine:
         # In-process chain links: session_id → List[ChainLink]
         # Mirrors _chain_cache: populated by append_turn for no-DB operation.
         self._links_cache: Dict[str, List["ChainLink"]] = {}
+        # In-process checkpoints: session_id → List[ChainCheckpoint] (no-DB mirror).
+        self._checkpoint_cache: Dict[str, List[ChainCheckpoint]] = {}
+        try:
+            self._checkpoint_interval = max(0, int(os.environ.get("OMNIX_CTCHC_CHECKPOINT_INTERVAL", "1000")))
+        except ValueError:
+            self._checkpoint_interval = 1000
 
     def _get_pqc(self):
         if self._pqc is None:
@@ -184,8 +249,8 @@ class CTCHCEngine:
         return self._pqc
 
     def _get_conn(self):
-        import psycopg
-        return psycopg.connect(self._db_url)
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("bev", self._db_url)
 
     def ensure_tables(self) -> None:
         if not self._db_url:
@@ -195,6 +260,7 @@ class CTCHCEngine:
                 with conn.cursor() as cur:
                     cur.execute(self._CREATE_CHAIN_TABLE)
                     cur.execute(self._CREATE_LINKS_TABLE)
+                    cur.execute(self._CREATE_CHECKPOINTS_TABLE)
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[CTCHC] ensure_tables failed (non-blocking): {exc}")
@@ -258,11 +324,15 @@ class CTCHCEngine:
         output_hash: str,
         governing_receipt_id: str,
         metadata: Optional[Dict[str, Any]] = None,
+        persist: bool = True,
     ) -> ChainLink:
         """
         BEV-INV-011: Append a turn to the chain.
 
         link_hash = SHA3-256( prev_hash || turn_hash || governing_receipt_id )
+
+        persist=False updates only the in-memory chain; the caller writes the
+        link INSERT and tip UPDATE (see _link_params / _tip_params).
         """
         turn_payload = json.dumps({
             "bar_id": bar_id,
@@ -306,8 +376,9 @@ class CTCHCEngine:
         self._tip_cache[session_id] = chain_link_hash
         # Keep in-memory links list in sync for no-DB operation.
         self._links_cache.setdefault(session_id, []).append(link)
-        self._persist_link(link)
-        self._update_chain_tip(session_id, chain_link_hash, turn_index + 1)
+        if persist:
+            self._persist_link(link)
+        self._update_chain_tip(session_id, chain_link_hash, turn_index + 1, persist=persist)
         return link
 
     # ── Seal (BEV-INV-013 / BEV-INV-014) ────────────────────────
@@ -338,30 +409,11 @@ class CTCHCEngine:
         }, sort_keys=True)
         seal_hash = hashlib.sha3_256(seal_payload.encode()).hexdigest()
 
-        pqc_sig: Optional[str] = None
-        pqc_alg: Optional[str] = None
-        pqc = self._get_pqc()
-        if pqc.pqc_enabled:
-            try:
-                import base64 as _b64, os as _os
-                _sk_b64 = _os.environ.get("OMNIX_SIGNING_SECRET_KEY_B64", "").strip()
-                if _sk_b64:
-                    _sk_bytes = _b64.b64decode(_sk_b64)
-                    _payload = json.dumps({
-                        "chain_id": chain.chain_id,
-                        "seal_hash": seal_hash,
-                        "session_id": session_id,
-                    }, sort_keys=True).encode("utf-8")
-                    _sig_raw = pqc.sign_message(_payload, _sk_bytes)
-                    if _sig_raw:
-                        pqc_sig = _b64.b64encode(_sig_raw).decode("utf-8")
-                        pqc_alg = "ML-DSA-65"
-                    else:
-                        logger.warning("[CTCHC] sign_message returned None — seal unsigned")
-                else:
-                    logger.debug("[CTCHC] OMNIX_SIGNING_SECRET_KEY_B64 not set — seal unsigned")
-            except Exception as exc:
-                logger.warning(f"[CTCHC] PQC seal signing failed (non-blocking): {exc}")
+        pqc_sig, pqc_alg = self._sign(json.dumps({
+            "chain_id": chain.chain_id,
+            "seal_hash": seal_hash,
+            "session_id": session_id,
+        }, sort_keys=True).encode("utf-8"), "seal")
 
         sealed_at = datetime.now(timezone.utc).isoformat()
         self._persist_seal(session_id, seal_hash, pqc_sig, pqc_alg, sealed_at)
@@ -373,20 +425,56 @@ class CTCHCEngine:
         chain.sealed_at = sealed_at
         return chain
 
+    def _sign(self, payload: bytes, what: str) -> Tuple[Optional[str], Optional[str]]:
+        """ML-DSA-65 sign payload with the process signing key → (sig_b64, alg) or (None, None)."""
+        pqc = self._get_pqc()
+        if not pqc.pqc_enabled:
+            return None, None
+        try:
+            import base64 as _b64
+            from omnix_core.security.crypto_providers import get_signing_key
+            _key = get_signing_key(_CTCHC_SIGNING_PROVIDER)
+            if _key is None:
+                logger.debug(f"[CTCHC] OMNIX_SIGNING_SECRET_KEY_B64 not set — {what} unsigned")
+                return None, None
+            _sig_raw = pqc.sign_message(payload, _key.secret_key)
+            if _sig_raw:
+                return _b64.b64encode(_sig_raw).decode("utf-8"), "ML-DSA-65"
+            logger.warning(f"[CTCHC] sign_message returned None — {what} unsigned")
+        except Exception as exc:
+            logger.warning(f"[CTCHC] PQC {what} signing failed (non-blocking): {exc}")
+        return None, None
+
     # ── Verification ─────────────────────────────────────────────
 
-    def verify_chain(self, session_id: str) -> Dict[str, Any]:
+    def verify_chain(self, session_id: str, full: bool = False) -> Dict[str, Any]:
         """
-        Offline verification of the complete CTCHC.
+        Verify the CTCHC.
 
-        Walks every link and recomputes each hash from scratch.
+        By default verification starts from the newest trusted checkpoint and
+        re-hashes only the links after it; full=True walks every link from
+        genesis (offline audits).  A checkpoint whose anchor link no longer
+        matches falls back to the full walk.
         BEV-INV-012: any gap → chain_complete = False.
         """
         chain = self.get_chain(session_id)
         if chain is None:
             return {"verified": False, "reason": "Chain not found", "session_id": session_id}
 
-        links = sorted(self.get_links(session_id), key=lambda x: x.turn_index)
+        checkpoint = None if full else self._latest_trusted_checkpoint(chain)
+        links: List[ChainLink] = []
+        if checkpoint is not None:
+            links = sorted(self.get_links(session_id, from_turn=checkpoint.turn_index),
+                           key=lambda x: x.turn_index)
+            if (not links or links[0].turn_index != checkpoint.turn_index
+                    or links[0].chain_link_hash != checkpoint.link_hash):
+                logger.warning(
+                    f"[CTCHC] Checkpoint at turn {checkpoint.turn_index} no longer matches "
+                    f"session {session_id} — falling back to full verification"
+                )
+                checkpoint = None
+        if checkpoint is None:
+            links = sorted(self.get_links(session_id), key=lambda x: x.turn_index)
 
         if len(links) == 0:
             return {
@@ -399,12 +487,22 @@ class CTCHCEngine:
                 "bev_inv_012": True,
                 "bev_inv_013": chain.is_sealed,
                 "bev_inv_014": chain.seal_pqc_signature is not None,
+                "verification_mode": "full",
+                "checkpoint_turn": None,
+                "links_rehashed": 0,
             }
 
         errors = []
-        prev_hash = chain.genesis_hash
-
-        for expected_idx, link in enumerate(links):
+        if checkpoint is not None:
+            prev_hash = checkpoint.link_hash
+            start = checkpoint.turn_index + 1
+            tail = links[1:]
+        else:
+            prev_hash = chain.genesis_hash
+            start = 0
+            tail = links
+
+        for expected_idx, link in enumerate(tail, start):
             if link.turn_index != expected_idx:
                 errors.append(f"Gap at turn_index {expected_idx} (found {link.turn_index})")
 
@@ -431,29 +529,41 @@ class CTCHCEngine:
             prev_hash = link.chain_link_hash
 
         chain_ok = len(errors) == 0
+        turn_count = start + len(tail)
 
         seal_ok = False
         if chain.is_sealed and chain.seal_hash:
-            seal_payload = json.dumps({
-                "chain_id": chain.chain_id,
-                "session_id": session_id,
-                "governing_receipt_id": chain.governing_receipt_id,
-                "genesis_hash": chain.genesis_hash,
-                "turn_count": len(links),
-                "link_hashes": [lk.chain_link_hash for lk in links],
-                "tip_hash": chain.current_tip_hash,
-            }, sort_keys=True)
-            expected_seal = hashlib.sha3_256(seal_payload.encode()).hexdigest()
-            seal_ok = expected_seal == chain.seal_hash
+            if (checkpoint is not None and not tail
+                    and checkpoint.seal_hash == chain.seal_hash):
+                # The stamp already attests a full verification of this seal.
+                seal_ok = True
+            else:
+                all_links = links if checkpoint is None else sorted(
+                    self.get_links(session_id), key=lambda x: x.turn_index)
+                seal_payload = json.dumps({
+                    "chain_id": chain.chain_id,
+                    "session_id": session_id,
+                    "governing_receipt_id": chain.governing_receipt_id,
+                    "genesis_hash": chain.genesis_hash,
+                    "turn_count": len(all_links),
+                    "link_hashes": [lk.chain_link_hash for lk in all_links],
+                    "tip_hash": chain.current_tip_hash,
+                }, sort_keys=True)
+                expected_seal = hashlib.sha3_256(seal_payload.encode()).hexdigest()
+                seal_ok = expected_seal == chain.seal_hash
 
         receipt_errors = [e for e in errors if "BEV-INV-018" in e]
         bev_inv_018 = len(receipt_errors) == 0
+        verified = chain_ok and (seal_ok if chain.is_sealed else True)
+
+        if verified:
+            self._record_checkpoint(chain, links, checkpoint, seal_ok)
 
         return {
-            "verified": chain_ok and (seal_ok if chain.is_sealed else True),
+            "verified": verified,
             "session_id": session_id,
             "chain_id": chain.chain_id,
-            "turn_count": len(links),
+            "turn_count": turn_count,
             "chain_complete": chain_ok,
             "hash_errors": errors,
             "is_sealed": chain.is_sealed,
@@ -464,8 +574,97 @@ class CTCHCEngine:
             "bev_inv_013": seal_ok,
             "bev_inv_014": chain.seal_pqc_signature is not None,
             "bev_inv_018": bev_inv_018,
+            "verification_mode": "incremental" if checkpoint is not None else "full",
+            "checkpoint_turn": checkpoint.turn_index if checkpoint is not None else None,
+            "links_rehashed": len(tail),
         }
 
+    # ── Checkpoints ──────────────────────────────────────────────
+
+    @staticmethod
+    def _checkpoint_stamp(chain: CoherenceHashChain, turn_index: int,
+                          link_hash: str, seal_hash: Optional[str]) -> str:
+        payload = json.dumps({
+            "chain_id": chain.chain_id,
+            "session_id": chain.session_id,
+            "genesis_hash": chain.genesis_hash,
+            "turn_index": turn_index,
+            "link_hash": link_hash,
+            "seal_hash": seal_hash,
+            "sentinel": "OMNIX-CTCHC-CHECKPOINT",
+        }, sort_keys=True)
+        return hashlib.sha3_256(payload.encode()).hexdigest()
+
+    def _record_checkpoint(self, chain: CoherenceHashChain, links: List[ChainLink],
+                           previous: Optional[ChainCheckpoint], seal_ok: bool) -> None:
+        """Checkpoint the newest K-boundary (or the sealed tip) past the previous checkpoint."""
+        if not self._checkpoint_interval:
+            return
+        last = links[-1].turn_index
+        seal_hash = None
+        if chain.is_sealed and seal_ok:
+            turn_index, seal_hash = last, chain.seal_hash
+        else:
+            turn_index = ((last + 1) // self._checkpoint_interval) * self._checkpoint_interval - 1
+        if turn_index < 0 or (previous is not None and turn_index <= previous.turn_index
+                              and (seal_hash is None or previous.seal_hash == seal_hash)):
+            return
+        anchor = links[turn_index - links[0].turn_index]
+        stamp_hash = self._checkpoint_stamp(chain, turn_index, anchor.chain_link_hash, seal_hash)
+        sig, alg = self._sign(stamp_hash.encode("utf-8"), "checkpoint")
+        checkpoint = ChainCheckpoint(
+            session_id=chain.session_id,
+            chain_id=chain.chain_id,
+            turn_index=turn_index,
+            link_hash=anchor.chain_link_hash,
+            seal_hash=seal_hash,
+            stamp_hash=stamp_hash,
+            stamp_signature=sig,
+            stamp_algorithm=alg,
+            verified_at=datetime.now(timezone.utc).isoformat(),
+        )
+        cached = [c for c in self._checkpoint_cache.get(chain.session_id, [])
+                  if c.turn_index != turn_index]
+        cached.append(checkpoint)
+        self._checkpoint_cache[chain.session_id] = sorted(cached, key=lambda c: c.turn_index)
+        self._persist_checkpoint(checkpoint)
+
+    def _checkpoint_trusted(self, chain: CoherenceHashChain, cp: ChainCheckpoint) -> bool:
+        """Stamp must recompute; if a signing key is configured the stamp must be signed by it."""
+        if cp.chain_id != chain.chain_id:
+            return False
+        if self._checkpoint_stamp(chain, cp.turn_index, cp.link_hash, cp.seal_hash) != cp.stamp_hash:
+            return False
+        try:
+            from omnix_core.security.crypto_providers import get_signing_key
+            key = get_signing_key(_CTCHC_SIGNING_PROVIDER)
+        except Exception:
+            key = None
+        if key is None:
+            return True
+        if not cp.stamp_signature or key.public_key is None:
+            return False
+        try:
+            import base64 as _b64
+            return bool(self._get_pqc().verify_signature(
+                _b64.b64decode(cp.stamp_signature), cp.stamp_hash.encode("utf-8"), key.public_key,
+            ))
+        except Exception as exc:
+            logger.warning(f"[CTCHC] checkpoint signature check failed: {exc}")
+            return False
+
+    def _latest_trusted_checkpoint(self, chain: CoherenceHashChain) -> Optional[ChainCheckpoint]:
+        if not self._checkpoint_interval:
+            return None
+        for cp in self.get_checkpoints(chain.session_id, limit=self._CHECKPOINT_CANDIDATES):
+            if self._checkpoint_trusted(chain, cp):
+                return cp
+            logger.warning(
+                f"[CTCHC] Untrusted checkpoint at turn {cp.turn_index} "
+                f"for session {chain.session_id} — ignored"
+            )
+        return None
+
     # ── Persistence helpers ───────────────────────────────────────
 
     def _persist_chain(self, chain: CoherenceHashChain) -> None:
@@ -490,46 +689,62 @@ class CTCHCEngine:
         except Exception as exc:
             logger.warning(f"[CTCHC] persist_chain failed: {exc}")
 
+    _INSERT_LINK_SQL = """
+        INSERT INTO atf_coherence_chain_links
+            (link_id, session_id, turn_index, prev_link_hash,
+             turn_hash, governing_receipt_id, chain_link_hash,
+             created_at, metadata)
+        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+        ON CONFLICT (session_id, turn_index) DO NOTHING
+    """
+
+    # Guarded so a replayed (older) tip never moves the chain backwards.
+    _UPDATE_TIP_SQL = """
+        UPDATE atf_coherence_hash_chains
+        SET current_tip_hash=%s, turn_count=%s
+        WHERE session_id=%s AND turn_count < %s
+    """
+
+    @staticmethod
+    def _link_params(link: ChainLink) -> tuple:
+        return (
+            link.link_id, link.session_id, link.turn_index,
+            link.prev_link_hash, link.turn_hash, link.governing_receipt_id,
+            link.chain_link_hash, link.created_at,
+            json.dumps(link.metadata),
+        )
+
+    @staticmethod
+    def _tip_params(session_id: str, new_tip: str, new_count: int) -> tuple:
+        return (new_tip, new_count, session_id, new_count)
+
     def _persist_link(self, link: ChainLink) -> None:
         if not self._db_url:
             return
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO atf_coherence_chain_links
-                            (link_id, session_id, turn_index, prev_link_hash,
-                             turn_hash, governing_receipt_id, chain_link_hash,
-                             created_at, metadata)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        ON CONFLICT (session_id, turn_index) DO NOTHING
-                    """, (
-                        link.link_id, link.session_id, link.turn_index,
-                        link.prev_link_hash, link.turn_hash, link.governing_receipt_id,
-                        link.chain_link_hash, link.created_at,
-                        json.dumps(link.metadata),
-                    ))
+                    cur.execute(self._INSERT_LINK_SQL, self._link_params(link))
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[CTCHC] persist_link failed: {exc}")
 
     def _update_chain_tip(
-        self, session_id: str, new_tip: str, new_count: int
+        self, session_id: str, new_tip: str, new_count: int, persist: bool = True
     ) -> None:
         # Always sync the in-memory chain object so no-DB callers see correct state.
         if session_id in self._chain_cache:
             self._chain_cache[session_id].current_tip_hash = new_tip
             self._chain_cache[session_id].turn_count = new_count
-        if not self._db_url:
+        if not self._db_url or not persist:
             return
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE atf_coherence_hash_chains
-                        SET current_tip_hash=%s, turn_count=%s
-                        WHERE session_id=%s
-                    """, (new_tip, new_count, session_id))
+                    cur.execute(
+                        self._UPDATE_TIP_SQL,
+                        self._tip_params(session_id, new_tip, new_count),
+                    )
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[CTCHC] update_chain_tip failed: {exc}")
@@ -558,6 +773,31 @@ class CTCHCEngine:
         except Exception as exc:
             logger.warning(f"[CTCHC] persist_seal failed: {exc}")
 
+    def _persist_checkpoint(self, cp: ChainCheckpoint) -> None:
+        if not self._db_url:
+            return
+        try:
+            with self._get_conn() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        INSERT INTO atf_coherence_chain_checkpoints
+                            (session_id, turn_index, chain_id, link_hash, seal_hash,
+                             stamp_hash, stamp_signature, stamp_algorithm, verified_at)
+                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                        ON CONFLICT (session_id, turn_index) DO UPDATE SET
+                            chain_id=EXCLUDED.chain_id, link_hash=EXCLUDED.link_hash,
+                            seal_hash=EXCLUDED.seal_hash, stamp_hash=EXCLUDED.stamp_hash,
+                            stamp_signature=EXCLUDED.stamp_signature,
+                            stamp_algorithm=EXCLUDED.stamp_algorithm,
+                            verified_at=EXCLUDED.verified_at
+                    """, (
+                        cp.session_id, cp.turn_index, cp.chain_id, cp.link_hash, cp.seal_hash,
+                        cp.stamp_hash, cp.stamp_signature, cp.stamp_algorithm, cp.verified_at,
+                    ))
+                conn.commit()
+        except Exception as exc:
+            logger.warning(f"[CTCHC] persist_checkpoint failed: {exc}")
+
     def _load_tip_from_db(self, session_id: str) -> Optional[str]:
         if not self._db_url:
             return None
@@ -576,6 +816,10 @@ class CTCHCEngine:
             logger.warning(f"[CTCHC] load_tip_from_db failed: {exc}")
         return None
 
+    def forget_session(self, session_id: str) -> None:
+        """Drop the cached tip so the next append_turn reloads it from the DB."""
+        self._tip_cache.pop(session_id, None)
+
     def get_chain(self, session_id: str) -> Optional[CoherenceHashChain]:
         if not self._db_url:
             # No database — return the in-memory cached chain (may be None if
@@ -597,16 +841,17 @@ class CTCHCEngine:
             logger.error(f"[CTCHC] get_chain error: {exc}")
             return None
 
-    def get_links(self, session_id: str) -> List[ChainLink]:
+    def get_links(self, session_id: str, from_turn: int = 0) -> List[ChainLink]:
         if not self._db_url:
             # No database — return cached links (empty list for uninitialised session).
-            return list(self._links_cache.get(session_id, []))
+            return [lk for lk in self._links_cache.get(session_id, []) if lk.turn_index >= from_turn]
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        "SELECT * FROM atf_coherence_chain_links WHERE session_id=%s ORDER BY turn_index ASC",
-                        (session_id,)
+                        "SELECT * FROM atf_coherence_chain_links WHERE session_id=%s AND turn_index>=%s "
+                        "ORDER BY turn_index ASC",
+                        (session_id, from_turn)
                     )
                     cols = [d[0] for d in cur.description]
                     return [self._row_to_link(dict(zip(cols, r))) for r in cur.fetchall()]
@@ -614,6 +859,38 @@ class CTCHCEngine:
             logger.error(f"[CTCHC] get_links error: {exc}")
             return []
 
+    def get_checkpoints(self, session_id: str, limit: int = 3) -> List[ChainCheckpoint]:
+        """Newest-first checkpoints for a session."""
+        if not self._db_url:
+            return list(reversed(self._checkpoint_cache.get(session_id, [])))[:limit]
+        try:
+            with self._get_conn() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT * FROM atf_coherence_chain_checkpoints WHERE session_id=%s "
+                        "ORDER BY turn_index DESC LIMIT %s",
+                        (session_id, limit)
+                    )
+                    cols = [d[0] for d in cur.description]
+                    return [self._row_to_checkpoint(dict(zip(cols, r))) for r in cur.fetchall()]
+        except Exception as exc:
+            logger.error(f"[CTCHC] get_checkpoints error: {exc}")
+            return []
+
+    @staticmethod
+    def _row_to_checkpoint(row: Dict[str, Any]) -> ChainCheckpoint:
+        return ChainCheckpoint(
+            session_id=row["session_id"],
+            chain_id=row["chain_id"],
+            turn_index=int(row["turn_index"]),
+            link_hash=row["link_hash"],
+            seal_hash=row.get("seal_hash"),
+            stamp_hash=row["stamp_hash"],
+            stamp_signature=row.get("stamp_signature"),
+            stamp_algorithm=row.get("stamp_algorithm"),
+            verified_at=str(row["verified_at"]),
+        )
+
     @staticmethod
     def _row_to_chain(row: Dict[str, Any]) -> CoherenceHashChain:
         return CoherenceHashChain(
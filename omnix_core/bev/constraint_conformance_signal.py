@@ -151,8 +151,8 @@ class CCSEngine:
         self._chain_cache: Dict[str, Optional[str]] = {}
 
     def _get_conn(self):
-        import psycopg
-        return psycopg.connect(self._db_url)
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("bev", self._db_url)
 
     def ensure_tables(self) -> None:
         if not self._db_url:
@@ -176,6 +176,7 @@ class CCSEngine:
         bar_status: str,
         constraint_set: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None,
+        persist: bool = True,
     ) -> ConstraintConformanceSignal:
         """
         BEV-INV-005: Compute CCS for a single governed turn.
@@ -183,6 +184,8 @@ class CCSEngine:
         The conformance score is derived from constraint satisfaction.
         Drift is accumulated across the session. When cumulative drift
         exceeds BEV_MAX_CUMULATIVE_DRIFT, verdict becomes HALT (BEV-INV-008).
+
+        persist=False leaves the INSERT to the caller (see _insert_params).
         """
         constraints_evaluated, constraints_violated, violated_names = (
             self._count_violations(output_text, bar_status, constraint_set)
@@ -246,7 +249,8 @@ class CCSEngine:
             metadata=metadata or {},
         )
 
-        self._persist(signal)
+        if persist:
+            self._persist(signal)
         return signal
 
     # ── Verdict logic ─────────────────────────────────────────────
@@ -371,30 +375,36 @@ class CCSEngine:
 
     # ── Persistence ───────────────────────────────────────────────
 
+    _INSERT_SQL = """
+        INSERT INTO atf_constraint_conformance_signals
+            (ccs_id, session_id, bar_id, turn_index,
+             conformance_score, drift_delta, cumulative_drift,
+             constraints_evaluated, constraints_violated,
+             violated_constraints, verdict, watchdog_triggered,
+             agvp_pvr_id, prev_ccs_hash, chain_link_hash,
+             computed_at, metadata)
+        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+        ON CONFLICT (ccs_id) DO NOTHING
+    """
+
+    @staticmethod
+    def _insert_params(sig: ConstraintConformanceSignal) -> tuple:
+        return (
+            sig.ccs_id, sig.session_id, sig.bar_id, sig.turn_index,
+            sig.conformance_score, sig.drift_delta, sig.cumulative_drift,
+            sig.constraints_evaluated, sig.constraints_violated,
+            json.dumps(sig.violated_constraints), sig.verdict,
+            sig.watchdog_triggered, sig.agvp_pvr_id, sig.prev_ccs_hash,
+            sig.chain_link_hash, sig.computed_at, json.dumps(sig.metadata),
+        )
+
     def _persist(self, sig: ConstraintConformanceSignal) -> None:
         if not self._db_url:
             return
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO atf_constraint_conformance_signals
-                            (ccs_id, session_id, bar_id, turn_index,
-                             conformance_score, drift_delta, cumulative_drift,
-                             constraints_evaluated, constraints_violated,
-                             violated_constraints, verdict, watchdog_triggered,
-                             agvp_pvr_id, prev_ccs_hash, chain_link_hash,
-                             computed_at, metadata)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        ON CONFLICT (ccs_id) DO NOTHING
-                    """, (
-                        sig.ccs_id, sig.session_id, sig.bar_id, sig.turn_index,
-                        sig.conformance_score, sig.drift_delta, sig.cumulative_drift,
-                        sig.constraints_evaluated, sig.constraints_violated,
-                        json.dumps(sig.violated_constraints), sig.verdict,
-                        sig.watchdog_triggered, sig.agvp_pvr_id, sig.prev_ccs_hash,
-                        sig.chain_link_hash, sig.computed_at, json.dumps(sig.metadata),
-                    ))
+                    cur.execute(self._INSERT_SQL, self._insert_params(sig))
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[CCS] persist failed (non-blocking): {exc}")
@@ -415,6 +425,11 @@ class CCSEngine:
             logger.error(f"[CCS] list_signals error: {exc}")
             return []
 
+    def forget_session(self, session_id: str) -> None:
+        """Drop cached drift and chain state so the next signal reloads them from the DB."""
+        self._drift_cache.pop(session_id, None)
+        self._chain_cache.pop(session_id, None)
+
     def _load_session_state_from_db(
         self, session_id: str
     ) -> tuple:
@@ -483,12 +483,15 @@ class MIVPEngine:
         self._mas_store: Dict[str, List[MandateAlignmentScore]] = {}
         self._seal_store: Dict[str, MBRSeal] = {}
 
+    def _get_conn(self):
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("bev", self._db_url)
+
     def ensure_tables(self) -> None:
         if not self._db_url:
             return
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute(self._CREATE_MBR_TABLE)
                     cur.execute(self._CREATE_MAS_TABLE)
@@ -503,8 +506,7 @@ class MIVPEngine:
         # table (atf_mandate_binding_records) was not created in the same init order.
         if self._db_url:
             try:
-                import psycopg
-                with psycopg.connect(self._db_url) as conn:
+                with self._get_conn() as conn:
                     with conn.cursor() as cur:
                         cur.execute(self._APPLY_SEAL_FK)
                     conn.commit()
@@ -629,6 +631,7 @@ class MIVPEngine:
         output_text: str,
         ctchc_link_hash: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        persist: bool = True,
     ) -> MandateAlignmentScore:
         """
         Compute the Mandate Alignment Score for one agent turn.
@@ -638,6 +641,8 @@ class MIVPEngine:
         MIVP-INV-003: Must run before output delivery.
         MIVP-INV-004: Score guaranteed in [0.0, 1.0].
         MIVP-INV-006: ctchc_link_hash links MAS to the behavioral chain.
+
+        persist=False leaves the INSERT to the caller (see _mas_params).
         """
         mbr = self.get_mbr(session_id)
         if mbr is None:
@@ -690,7 +695,8 @@ class MIVPEngine:
         if session_id not in self._mas_store:
             self._mas_store[session_id] = []
         self._mas_store[session_id].append(mas)
-        self._persist_mas(mas)
+        if persist:
+            self._persist_mas(mas)
 
         log_fn = logger.warning if verdict != "ALIGNED" else logger.debug
         log_fn(
@@ -873,8 +879,7 @@ class MIVPEngine:
         if not self._db_url:
             return
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute("""
                         INSERT INTO atf_mandate_binding_records
@@ -898,27 +903,32 @@ class MIVPEngine:
         except Exception as exc:
             logger.warning(f"[MIVP] MBR persist failed (non-blocking): {exc}")
 
+    _INSERT_MAS_SQL = """
+        INSERT INTO atf_mandate_alignment_scores
+          (mas_id, session_id, mbr_id, bar_id, turn_index,
+           alignment_score, proxy_activations, dominant_proxy,
+           verdict, ctchc_link_hash, computed_at)
+        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+        ON CONFLICT (mas_id) DO NOTHING
+    """
+
+    @staticmethod
+    def _mas_params(mas: MandateAlignmentScore) -> tuple:
+        return (
+            mas.mas_id, mas.session_id, mas.mbr_id, mas.bar_id,
+            mas.turn_index, mas.alignment_score,
+            json.dumps({k: round(v, 4) for k, v in mas.proxy_activations.items()}),
+            mas.dominant_proxy, mas.verdict,
+            mas.ctchc_link_hash, mas.computed_at,
+        )
+
     def _persist_mas(self, mas: MandateAlignmentScore) -> None:
         if not self._db_url:
             return
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO atf_mandate_alignment_scores
-                          (mas_id, session_id, mbr_id, bar_id, turn_index,
-                           alignment_score, proxy_activations, dominant_proxy,
-                           verdict, ctchc_link_hash, computed_at)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        ON CONFLICT (mas_id) DO NOTHING
-                    """, (
-                        mas.mas_id, mas.session_id, mas.mbr_id, mas.bar_id,
-                        mas.turn_index, mas.alignment_score,
-                        json.dumps({k: round(v, 4) for k, v in mas.proxy_activations.items()}),
-                        mas.dominant_proxy, mas.verdict,
-                        mas.ctchc_link_hash, mas.computed_at,
-                    ))
+                    cur.execute(self._INSERT_MAS_SQL, self._mas_params(mas))
                 conn.commit()
         except Exception as exc:
             logger.warning(f"[MIVP] MAS persist failed (non-blocking): {exc}")
@@ -927,8 +937,7 @@ class MIVPEngine:
         if not self._db_url:
             return
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute("""
                         INSERT INTO atf_mbr_seals
@@ -962,8 +971,7 @@ class MIVPEngine:
         if not self._db_url:
             return None
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
                         "SELECT * FROM atf_mandate_binding_records WHERE session_id=%s",
@@ -1002,8 +1010,7 @@ class MIVPEngine:
         if not self._db_url:
             return []
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
                         "SELECT * FROM atf_mandate_alignment_scores "
@@ -1041,8 +1048,7 @@ class MIVPEngine:
         if not self._db_url:
             return None
         try:
-            import psycopg
-            with psycopg.connect(self._db_url) as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
                         "SELECT * FROM atf_mbr_seals WHERE session_id=%s",
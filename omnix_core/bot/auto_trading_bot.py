@@ -1512,6 +1512,15 @@ class AutoTradingBot:
         self._start_stop_lock = threading.Lock()
         self._thread = None  # Reference to trading loop thread
         
+        # Snapshot de mercado compartido: un fetch OHLC + un análisis por (par, tick),
+        # reutilizado por todos los usuarios del loop multi-usuario
+        self._market_tick = 0
+        self._ohlc_cache: Dict[tuple, tuple] = {}
+        self._ohlc_cache_lock = threading.Lock()
+        self._market_snapshots: Dict[tuple, Optional[Dict]] = {}
+        self._market_snapshot_lock = threading.Lock()
+        self._user_executor = None  # Pool de workers persistente del loop multi-usuario
+        
         # V6.5.4d MULTI-USER: Inicializar UserSessionManager con dependencias
         if USER_SESSION_MANAGER_AVAILABLE and initialize_session_manager:
             try:
@@ -2137,31 +2146,36 @@ class AutoTradingBot:
     def _trading_loop_multi_user(self):
         """
          Loop de trading que procesa TODOS los usuarios activos
-        Usa ThreadPoolExecutor para procesamiento paralelo de usuarios
+        Usa un ThreadPoolExecutor persistente para procesamiento paralelo de usuarios
         
         Arquitectura:
-        - Pool de workers para procesamiento paralelo
-        - Cada usuario se procesa en su propio thread
+        - Pool de workers creado una vez y reutilizado en cada ciclo
+        - Un snapshot de mercado por (par, tick): fetch OHLC + indicadores + decisión
+          calculados una sola vez y compartidos por todos los usuarios
+        - Cada usuario aplica su lógica (límites, ejecución) en su propio thread
         - Lock por usuario para evitar race conditions
-        - Timeout por usuario para evitar bloqueos
+        - Timeout por ciclo para evitar bloqueos
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor, wait
         
         logger.info(f"🔄 {VERSION_BANNER}: Iniciando loop de trading multi-usuario...")
         
         max_workers = min(32, (os.cpu_count() or 1) * 4)
         user_locks: Dict[str, threading.Lock] = {}
+        self._user_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="OMNIX-user-cycle"
+        )
         
-        while self.state.get('running'):
-            try:
-                if USER_SESSION_MANAGER_AVAILABLE and get_session_manager:
-                    session_manager = get_session_manager()
-                    active_users = session_manager.get_active_sessions()
-                    
-                    if active_users:
-                        logger.debug(f"📊 Procesando {len(active_users)} usuarios activos")
+        try:
+            while self.state.get('running'):
+                try:
+                    if USER_SESSION_MANAGER_AVAILABLE and get_session_manager:
+                        session_manager = get_session_manager()
+                        active_users = session_manager.get_active_sessions()
                         
-                        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        if active_users:
+                            logger.debug(f"📊 Procesando {len(active_users)} usuarios activos")
+                            tick = self._next_market_tick()
                             futures = {}
                             
                             for user_entry in active_users:
@@ -2179,36 +2193,95 @@ class AutoTradingBot:
                                 if user_locks[user_id].locked():
                                     continue
                                 
-                                future = executor.submit(
+                                future = self._user_executor.submit(
                                     self._safe_process_user,
                                     user_id,
                                     user_locks[user_id],
-                                    session_manager
+                                    session_manager,
+                                    tick
                                 )
                                 futures[future] = user_id
                             
-                            for future in as_completed(futures, timeout=60):
-                                user_id = futures[future]
+                            done, not_done = wait(futures, timeout=60)
+                            for future in done:
                                 try:
-                                    result = future.result(timeout=30)
+                                    future.result()
                                 except Exception as e:
-                                    logger.error(f"❌ Error procesando user {user_id}: {e}")
-                else:
-                    self._run_trading_cycle()
-                
-                time.sleep(self.config.get('check_interval_seconds', 25))
-                
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'interpreter shutdown' in error_msg or 'cannot schedule new futures' in error_msg:
-                    logger.warning(f"🛑 Shutdown detectado - terminando trading loop gracefully")
-                    break
-                logger.error(f"❌ Error en trading loop: {e}")
-                time.sleep(30)
+                                    logger.error(f"❌ Error procesando user {futures[future]}: {e}")
+                            if not_done:
+                                logger.warning(
+                                    f"⏱️ {len(not_done)} usuario(s) siguen en proceso tras 60s — "
+                                    f"se omiten hasta que liberen su lock"
+                                )
+                    else:
+                        self._run_trading_cycle()
+                    
+                    time.sleep(self.config.get('check_interval_seconds', 25))
+                    
+                except Exception as e:
+                    error_msg = str(e).lower()
+                    if 'interpreter shutdown' in error_msg or 'cannot schedule new futures' in error_msg:
+                        logger.warning(f"🛑 Shutdown detectado - terminando trading loop gracefully")
+                        break
+                    logger.error(f"❌ Error en trading loop: {e}")
+                    time.sleep(30)
+        finally:
+            self._user_executor.shutdown(wait=False)
+            self._user_executor = None
         
         logger.info(f"🛑 {VERSION_BANNER}: Trading loop multi-usuario detenido")
     
-    def _safe_process_user(self, user_id: str, lock: threading.Lock, session_manager) -> bool:
+    def _next_market_tick(self) -> int:
+        """Avanza el tick de mercado: invalida snapshots y OHLC del ciclo anterior."""
+        with self._market_snapshot_lock:
+            self._market_tick += 1
+            self._market_snapshots.clear()
+            return self._market_tick
+    
+    def _get_market_snapshot(self, pair: str, tick: int) -> Optional[Dict]:
+        """
+        Análisis de mercado de `pair` para el tick actual, calculado una sola vez.
+        
+        El primer usuario que pide el par calcula el snapshot (ticker, OHLC,
+        indicadores, régimen, Kalman, decisión V5.2); el resto lo reutiliza.
+        El cálculo se serializa porque _analyze_market usa estado compartido
+        (config['trading_pair'], kernel Non-Markoviano).
+        
+        Returns:
+            Dict de análisis (compartido — usar _fork_analysis antes de mutarlo) o None
+        """
+        key = (pair, tick)
+        snapshots = self._market_snapshots
+        if key in snapshots:
+            return snapshots[key]
+        with self._market_snapshot_lock:
+            if key in self._market_snapshots:
+                return self._market_snapshots[key]
+            self.config['trading_pair'] = pair
+            analysis = self._analyze_market()
+            # ADR-050: Cache market signals for the CAG session check.
+            self._update_cag_signals_cache(analysis)
+            if tick == self._market_tick:
+                self._market_snapshots[key] = analysis
+            return analysis
+    
+    @staticmethod
+    def _fork_analysis(analysis: Optional[Dict]) -> Optional[Dict]:
+        """
+        Copia por usuario de un snapshot compartido.
+        
+        _execute_smart_trade ajusta amount_usd / action y añade a 'reason';
+        esas mutaciones no deben verse en el snapshot de otros usuarios.
+        """
+        if analysis is None:
+            return None
+        forked = dict(analysis)
+        if isinstance(forked.get('reason'), list):
+            forked['reason'] = list(forked['reason'])
+        return forked
+    
+    def _safe_process_user(self, user_id: str, lock: threading.Lock, session_manager,
+                           tick: Optional[int] = None) -> bool:
         """
         Procesar un usuario de forma segura con lock
         
@@ -2216,6 +2289,7 @@ class AutoTradingBot:
             user_id: ID del usuario
             lock: Lock para este usuario
             session_manager: Gestor de sesiones
+            tick: Tick de mercado del ciclo (snapshots compartidos); None = análisis propio
         
         Returns:
             True si se procesó correctamente
@@ -2227,7 +2301,7 @@ class AutoTradingBot:
             session = session_manager.get_session(user_id)
             
             if session.running and not session.paused and not session.emergency_stop:
-                self._process_user_trading_cycle(user_id, session)
+                self._process_user_trading_cycle(user_id, session, tick=tick)
                 return True
             return False
         except Exception as e:
@@ -2236,7 +2310,7 @@ class AutoTradingBot:
         finally:
             lock.release()
     
-    def _process_user_trading_cycle(self, user_id: str, session):
+    def _process_user_trading_cycle(self, user_id: str, session, tick: Optional[int] = None):
         """
         V6.5.4d MULTI-USER: Procesar un ciclo de trading para un usuario específico
         
@@ -2249,9 +2323,14 @@ class AutoTradingBot:
         - Algorithmic Rollback Protocol (verificado en el loop padre)
         - Heartbeats (verificado en el loop padre)
         
+        Con `tick`, el análisis de cada par viene del snapshot compartido del
+        ciclo (_get_market_snapshot): el coste de mercado no crece con el
+        número de usuarios; solo la lógica de decisión por usuario corre aquí.
+        
         Args:
             user_id: ID del usuario
             session: UserTradingSession del usuario
+            tick: Tick de mercado del ciclo; None = análisis propio (legacy)
         """
         try:
             logger.debug(f"📊 Procesando ciclo para user {user_id}")
@@ -2287,24 +2366,29 @@ class AutoTradingBot:
             # 4. Escanear pares configurados
             session_updated = False
             for current_pair in trading_pairs:
-                # NOTA: Temporalmente usamos config compartido, pero pasamos user_id
-                # para que las operaciones de DB sean aisladas
-                self.config['trading_pair'] = current_pair
-                
                 # Verificar si el símbolo está permitido
                 if is_symbol_allowed and not is_symbol_allowed(current_pair, self.trading_profile):
                     continue
 
-                # Análisis completo
-                analysis = self._analyze_market()
+                if tick is not None:
+                    # Snapshot compartido del ciclo — copia propia para este usuario
+                    analysis = self._fork_analysis(self._get_market_snapshot(current_pair, tick))
+                else:
+                    self.config['trading_pair'] = current_pair
+                    # Análisis completo
+                    analysis = self._analyze_market()
 
-                # ADR-050: Cache market signals for NEXT CAG session check.
-                # Called after analysis so the next cycle uses real price-derived inputs.
-                self._update_cag_signals_cache(analysis)
+                    # ADR-050: Cache market signals for NEXT CAG session check.
+                    # Called after analysis so the next cycle uses real price-derived inputs.
+                    self._update_cag_signals_cache(analysis)
 
                 if not analysis:
                     continue
                 
+                # NOTA: Temporalmente usamos config compartido, pero pasamos user_id
+                # para que las operaciones de DB sean aisladas
+                self.config['trading_pair'] = current_pair
+                
                 should_trade = analysis.get('should_trade', False)
                 action = analysis.get('action', 'HOLD')
                 
@@ -2975,6 +3059,7 @@ class AutoTradingBot:
         while self.state['running']:
             try:
                 cycle_counter += 1
+                self._next_market_tick()
                 
                 # V6.5: Log periódico de estado para confirmar que está corriendo
                 if cycle_counter % log_interval == 0:
@@ -7164,11 +7249,34 @@ class AutoTradingBot:
             logger.error(f"❌ ERROR obteniendo balance: {e}")
             return 0.0
     
+    def _fetch_ohlc(self, pair: str, interval: int = 1440) -> Optional[list]:
+        """
+        Velas OHLC de `pair`, una sola llamada REST por (par, intervalo, tick).
+        
+        Precios, volúmenes y OHLC completo de un mismo análisis (y de todos los
+        usuarios del ciclo) comparten el resultado. Una entrada caduca al avanzar
+        el tick de mercado o tras check_interval_seconds, lo que ocurra antes.
+        """
+        if not hasattr(self.trading_service, 'get_ohlc'):
+            return None
+        key = (pair, interval)
+        ttl = float(self.config.get('check_interval_seconds', 25))
+        now = time.monotonic()
+        with self._ohlc_cache_lock:
+            cached = self._ohlc_cache.get(key)
+            if cached and cached[0] == self._market_tick and now - cached[1] < ttl:
+                return cached[2]
+        ohlc = self.trading_service.get_ohlc(pair, interval=interval)
+        if ohlc:
+            with self._ohlc_cache_lock:
+                self._ohlc_cache[key] = (self._market_tick, now, ohlc)
+        return ohlc
+    
     def _get_price_history(self, pair: str, days: int = 100) -> Optional[List[float]]:
         """Obtener histórico de precios"""
         try:
             if hasattr(self.trading_service, 'get_ohlc'):
-                ohlc = self.trading_service.get_ohlc(pair, interval=1440)
+                ohlc = self._fetch_ohlc(pair, interval=1440)
                 if ohlc and len(ohlc) > 0:
                     return [float(candle[4]) for candle in ohlc[-days:]]
             return None
@@ -7180,7 +7288,7 @@ class AutoTradingBot:
         """Obtener histórico de volúmenes"""
         try:
             if hasattr(self.trading_service, 'get_ohlc'):
-                ohlc = self.trading_service.get_ohlc(pair, interval=1440)
+                ohlc = self._fetch_ohlc(pair, interval=1440)
                 if ohlc and len(ohlc) > 0:
                     return [float(candle[6]) for candle in ohlc[-days:]]
             return None
@@ -7206,7 +7314,7 @@ class AutoTradingBot:
                 logger.debug(f"Trading service does not have get_ohlc method for {pair}")
                 return None
             
-            ohlc = self.trading_service.get_ohlc(pair, interval=1440)
+            ohlc = self._fetch_ohlc(pair, interval=1440)
             if not ohlc or len(ohlc) == 0:
                 logger.debug(f"No OHLC data returned for {pair}")
                 return None
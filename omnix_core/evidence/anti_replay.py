@@ -16,8 +16,13 @@ Runtime mode (OMNIX_ANTI_REPLAY_MODE env var):
 Redis key design:
     omnix:ar:{receipt_id}  → value "1", TTL = max(ttl_ms, MIN_WINDOW_MS) ms
 
+In-memory design:
+    OMNIX_ANTI_REPLAY_SHARDS (default 16) lock-striped shards keyed by id hash,
+    each expiring entries through a 1s-tick timing wheel (amortized O(1) purge).
+
 Public interface (unchanged from Phase 1 — ADR-076 guarantee):
     check_and_register(receipt_id, ttl_ms)   → None | raises ReplayDetected
+    check_and_register_many(ids, ttl_ms)     → list[bool] (True = registered)
     is_replay(receipt_id)                    → bool
     get_store()                              → AntiReplayStore
 
@@ -31,6 +36,7 @@ import threading
 import time
 import hashlib
 import logging
+from collections.abc import MutableMapping
 from typing import Optional
 
 logger = logging.getLogger("OMNIX.Evidence.AntiReplay")
@@ -38,6 +44,9 @@ logger = logging.getLogger("OMNIX.Evidence.AntiReplay")
 MIN_WINDOW_MS: int = 30_000     # minimum replay window: 30s (ADR-076)
 MAX_STORE_SIZE: int = 100_000   # safety cap — in-memory only
 
+_SHARD_COUNT: int = int(os.environ.get("OMNIX_ANTI_REPLAY_SHARDS", "16"))
+_WHEEL_TICK_MS: int = 1_000     # expiry granularity of the in-memory timing wheel
+
 _REDIS_KEY_PREFIX = "omnix:ar:"
 _MODE = os.environ.get("OMNIX_ANTI_REPLAY_MODE", "best_effort").lower().strip()
 _STRICT_MODE: bool = _MODE == "strict"
@@ -79,69 +88,218 @@ def _get_redis():
 
 # ── In-memory store ───────────────────────────────────────────────────────────
 
+class _Shard:
+    """
+    One lock stripe of the in-memory store.
+
+    Expiry uses a timing wheel keyed by absolute tick (expiry_ms // tick_ms):
+    each registration appends its id to one bucket, and a purge pops only the
+    buckets that have fully elapsed since the last purge — amortized O(1) per
+    registration instead of a scan over every live entry. Revoked or
+    re-registered ids left in old buckets are skipped when their bucket pops.
+    """
+
+    __slots__ = ("lock", "entries", "wheel", "cursor", "tick_ms")
+
+    def __init__(self, tick_ms: int) -> None:
+        self.lock = threading.Lock()
+        self.entries: dict[str, int] = {}
+        self.wheel: dict[int, list[str]] = {}
+        self.tick_ms = tick_ms
+        self.cursor = int(time.time() * 1000) // tick_ms   # ticks < cursor are purged
+
+    def set_locked(self, receipt_id: str, expiry_ms: int) -> None:
+        self.entries[receipt_id] = expiry_ms
+        tick = expiry_ms // self.tick_ms
+        bucket = self.wheel.get(tick)
+        if bucket is None:
+            self.wheel[tick] = [receipt_id]
+        else:
+            bucket.append(receipt_id)
+        if tick < self.cursor:
+            self.cursor = tick
+
+    def purge_locked(self, now_ms: int) -> int:
+        now_tick = now_ms // self.tick_ms
+        if now_tick <= self.cursor:
+            return 0
+        if now_tick - self.cursor <= len(self.wheel):
+            due = range(self.cursor, now_tick)
+        else:
+            # Idle for longer than there are buckets: visit the buckets, not the ticks
+            due = sorted(t for t in self.wheel if t < now_tick)
+        self.cursor = now_tick
+
+        purged = 0
+        entries = self.entries
+        for tick in due:
+            for receipt_id in self.wheel.pop(tick, ()):
+                expiry = entries.get(receipt_id)
+                if expiry is not None and expiry <= now_ms:
+                    del entries[receipt_id]
+                    purged += 1
+        return purged
+
+
+class _ShardedView(MutableMapping):
+    """
+    dict-like view over every shard's entries (receipt_id → expiry_ms).
+    Kept for test compatibility (ADR-076): writes go through the owning
+    shard so injected entries are scheduled for expiry like registrations.
+    """
+
+    def __init__(self, store: "_InMemoryStore") -> None:
+        self._owner = store
+
+    def __getitem__(self, receipt_id: str) -> int:
+        shard = self._owner._shard(receipt_id)
+        with shard.lock:
+            return shard.entries[receipt_id]
+
+    def __setitem__(self, receipt_id: str, expiry_ms: int) -> None:
+        shard = self._owner._shard(receipt_id)
+        with shard.lock:
+            shard.set_locked(receipt_id, int(expiry_ms))
+
+    def __delitem__(self, receipt_id: str) -> None:
+        shard = self._owner._shard(receipt_id)
+        with shard.lock:
+            del shard.entries[receipt_id]
+
+    def __iter__(self):
+        keys: list[str] = []
+        for shard in self._owner._shards:
+            with shard.lock:
+                keys.extend(shard.entries)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._owner._shards)
+
+
 class _InMemoryStore:
-    """Phase 1 thread-safe in-memory store (ADR-076)."""
+    """
+    Phase 1 thread-safe in-memory store (ADR-076).
 
-    def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._store: dict[str, int] = {}
+    Receipt ids are striped over OMNIX_ANTI_REPLAY_SHARDS independently
+    locked shards by hash, so concurrent registrations of different ids
+    rarely contend. Each shard expires entries through its own timing wheel;
+    once per tick a registration also sweeps the other shards it can lock
+    without waiting, so idle shards do not hold expired ids indefinitely.
+
+    MAX_STORE_SIZE is enforced per shard as an even share of the total.
+    """
+
+    def __init__(self, shards: Optional[int] = None, tick_ms: int = _WHEEL_TICK_MS) -> None:
+        count = max(1, int(shards or _SHARD_COUNT))
+        self._shards = tuple(_Shard(tick_ms) for _ in range(count))
+        self._tick_ms = tick_ms
+        self._next_sweep_ms = 0
+        self._store = _ShardedView(self)
+
+    def _shard(self, receipt_id: str) -> _Shard:
+        return self._shards[hash(receipt_id) % len(self._shards)]
+
+    def _shard_capacity(self) -> int:
+        return max(1, MAX_STORE_SIZE // len(self._shards))
+
+    def _register_locked(self, shard: _Shard, receipt_id: str, now_ms: int, window_ms: int) -> None:
+        existing_expiry = shard.entries.get(receipt_id)
+        if existing_expiry is not None and existing_expiry > now_ms:
+            remaining_s = (existing_expiry - now_ms) / 1000
+            msg = (
+                f"REPLAY_DETECTED receipt_id={receipt_id} "
+                f"expires_in={remaining_s:.1f}s [in-memory]"
+            )
+            logger.warning(msg)
+            raise ReplayDetected(msg)
+
+        if len(shard.entries) >= self._shard_capacity():
+            msg = f"STORE_CAPACITY_EXCEEDED — cannot register {receipt_id}"
+            logger.error(f"AntiReplayStore at capacity ({MAX_STORE_SIZE}). {msg}")
+            raise ReplayDetected(msg)
+
+        shard.set_locked(receipt_id, now_ms + window_ms)
 
     def check_and_register(self, receipt_id: str, ttl_ms: int) -> None:
         window_ms = max(ttl_ms, MIN_WINDOW_MS)
         now_ms = int(time.time() * 1000)
-        expiry_ms = now_ms + window_ms
-
-        with self._lock:
-            self._purge_expired_locked(now_ms)
-
-            if receipt_id in self._store:
-                existing_expiry = self._store[receipt_id]
-                if existing_expiry > now_ms:
-                    remaining_s = (existing_expiry - now_ms) / 1000
-                    msg = (
-                        f"REPLAY_DETECTED receipt_id={receipt_id} "
-                        f"expires_in={remaining_s:.1f}s [in-memory]"
-                    )
-                    logger.warning(msg)
-                    raise ReplayDetected(msg)
-
-            if len(self._store) >= MAX_STORE_SIZE:
-                msg = f"STORE_CAPACITY_EXCEEDED — cannot register {receipt_id}"
-                logger.error(f"AntiReplayStore at capacity ({MAX_STORE_SIZE}). {msg}")
-                raise ReplayDetected(msg)
-
-            self._store[receipt_id] = expiry_ms
-            logger.debug(f"anti-replay [mem] registered {receipt_id} ttl={window_ms/1000:.0f}s")
+
+        shard = self._shard(receipt_id)
+        with shard.lock:
+            shard.purge_locked(now_ms)
+            self._register_locked(shard, receipt_id, now_ms, window_ms)
+        logger.debug(f"anti-replay [mem] registered {receipt_id} ttl={window_ms/1000:.0f}s")
+        self._maybe_sweep(now_ms)
+
+    def check_and_register_many(self, receipt_ids: list, ttl_ms: int) -> list:
+        """
+        Register a batch of ids; returns one bool per input (True = newly
+        registered, False = replay). Each shard is locked once per batch.
+        Repeats within the batch count as replays of the first occurrence.
+        """
+        window_ms = max(ttl_ms, MIN_WINDOW_MS)
+        now_ms = int(time.time() * 1000)
+
+        by_shard: dict[int, list[int]] = {}
+        for pos, receipt_id in enumerate(receipt_ids):
+            by_shard.setdefault(hash(receipt_id) % len(self._shards), []).append(pos)
+
+        results = [False] * len(receipt_ids)
+        for index, positions in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                shard.purge_locked(now_ms)
+                for pos in positions:
+                    try:
+                        self._register_locked(shard, receipt_ids[pos], now_ms, window_ms)
+                        results[pos] = True
+                    except ReplayDetected:
+                        pass
+        self._maybe_sweep(now_ms)
+        return results
+
+    def _maybe_sweep(self, now_ms: int) -> None:
+        if now_ms < self._next_sweep_ms:
+            return
+        self._next_sweep_ms = now_ms + self._tick_ms
+        purged = 0
+        for shard in self._shards:
+            if shard.lock.acquire(blocking=False):
+                try:
+                    purged += shard.purge_locked(now_ms)
+                finally:
+                    shard.lock.release()
+        if purged:
+            logger.debug(f"anti-replay purged {purged} expired entries")
 
     def is_replay(self, receipt_id: str) -> bool:
         now_ms = int(time.time() * 1000)
-        with self._lock:
-            expiry = self._store.get(receipt_id)
+        shard = self._shard(receipt_id)
+        with shard.lock:
+            expiry = shard.entries.get(receipt_id)
             return expiry is not None and expiry > now_ms
 
     def revoke(self, receipt_id: str) -> bool:
-        with self._lock:
-            return self._store.pop(receipt_id, None) is not None
+        shard = self._shard(receipt_id)
+        with shard.lock:
+            return shard.entries.pop(receipt_id, None) is not None
 
     def stats(self) -> dict:
         now_ms = int(time.time() * 1000)
-        with self._lock:
-            active = sum(1 for exp in self._store.values() if exp > now_ms)
-            return {
-                "backend": "in_memory",
-                "total_entries": len(self._store),
-                "active_entries": active,
-                "expired_entries": len(self._store) - active,
-                "mode": _MODE,
-            }
-
-    def _purge_expired_locked(self, now_ms: int) -> int:
-        expired = [k for k, exp in self._store.items() if exp <= now_ms]
-        for k in expired:
-            del self._store[k]
-        if expired:
-            logger.debug(f"anti-replay purged {len(expired)} expired entries")
-        return len(expired)
+        total = active = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.entries)
+                active += sum(1 for exp in shard.entries.values() if exp > now_ms)
+        return {
+            "backend": "in_memory",
+            "total_entries": total,
+            "active_entries": active,
+            "expired_entries": total - active,
+            "shards": len(self._shards),
+            "mode": _MODE,
+        }
 
 
 # ── Redis-backed store ─────────────────────────────────────────────────────────
@@ -177,6 +335,21 @@ class _RedisStore:
 
         logger.debug(f"anti-replay [redis] registered {receipt_id} ttl={window_ms/1000:.0f}s")
 
+    def check_and_register_many(self, receipt_ids: list, ttl_ms: int) -> list:
+        """
+        Pipelined SET NX PX for a batch: one round-trip for N ids.
+        Returns one bool per input (True = newly registered, False = replay).
+        """
+        window_ms = max(ttl_ms, MIN_WINDOW_MS)
+        pipe = self._client.pipeline(transaction=False)
+        for receipt_id in receipt_ids:
+            pipe.set(self._key(receipt_id), "1", px=window_ms, nx=True)
+        results = [bool(r) for r in pipe.execute()]
+        replays = len(results) - sum(results)
+        if replays:
+            logger.warning(f"REPLAY_DETECTED count={replays}/{len(results)} [redis batch]")
+        return results
+
     def is_replay(self, receipt_id: str) -> bool:
         return self._client.exists(self._key(receipt_id)) > 0
 
@@ -279,6 +452,44 @@ class AntiReplayStore:
 
         self._mem.check_and_register(receipt_id, ttl_ms)
 
+    def check_and_register_many(self, receipt_ids: list, ttl_ms: int = MIN_WINDOW_MS) -> list:
+        """
+        Batch form of check_and_register for batch verification paths.
+
+        Returns one bool per receipt_id, in order: True if it was newly
+        registered, False if it is a replay (including a repeat earlier in
+        the same batch). The Redis backend pipelines the whole batch into
+        one round-trip; the in-memory backend locks each shard once.
+
+        Raises:
+            ReplayDetected: If Redis fails in strict mode.
+            ValueError: If any receipt_id is empty or ttl_ms <= 0.
+        """
+        receipt_ids = list(receipt_ids)
+        if not all(receipt_ids):
+            raise ValueError("receipt_id cannot be empty")
+        if ttl_ms <= 0:
+            raise ValueError(f"ttl_ms must be positive, got {ttl_ms}")
+        if not receipt_ids:
+            return []
+
+        if self._redis:
+            try:
+                return self._redis.check_and_register_many(receipt_ids, ttl_ms)
+            except Exception as exc:
+                logger.error(f"AntiReplayStore — Redis check_and_register_many failed: {exc}")
+                if _STRICT_MODE:
+                    raise ReplayDetected(
+                        f"ANTI_REPLAY_BACKEND_FAILURE — Redis unavailable in strict mode. "
+                        f"batch_size={len(receipt_ids)}"
+                    ) from exc
+                logger.warning(
+                    f"AntiReplayStore — Redis down, degrading to in-memory (best_effort). "
+                    f"batch_size={len(receipt_ids)}"
+                )
+
+        return self._mem.check_and_register_many(receipt_ids, ttl_ms)
+
     def is_replay(self, receipt_id: str) -> bool:
         """
         Read-only check: True if receipt_id is currently registered.
@@ -340,6 +551,11 @@ def check_and_register(receipt_id: str, ttl_ms: int = MIN_WINDOW_MS) -> None:
     _default_store.check_and_register(receipt_id, ttl_ms)
 
 
+def check_and_register_many(receipt_ids: list, ttl_ms: int = MIN_WINDOW_MS) -> list:
+    """Module-level convenience — uses the process singleton."""
+    return _default_store.check_and_register_many(receipt_ids, ttl_ms)
+
+
 def is_replay(receipt_id: str) -> bool:
     """Module-level convenience — uses the process singleton."""
     return _default_store.is_replay(receipt_id)
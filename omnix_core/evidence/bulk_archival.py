@@ -0,0 +1,477 @@
+"""
+OMNIX Bulk Receipt Archival — set-based HOT → WARM → COLD (ADR-126)
+
+ReceiptArchivalService migrates one receipt at a time: a SELECT, INSERT,
+re-fetch, three index upserts and a DELETE per row, each with its own
+commit.  BulkReceiptArchiver moves whole chunks with the same guarantees.
+
+HOT → WARM — one transaction per chunk
+──────────────────────────────────────
+  1. Lock the job checkpoint row and read its keyset cursor
+  2. SELECT the next chunk past (created_at, receipt_id)
+  3. Verify PQC signatures for the chunk across a worker pool
+  4. INSERT INTO warm … SELECT … FROM hot WHERE receipt_id IN (…)
+     ON CONFLICT DO NOTHING — rows never leave the server
+  5. Re-read WARM content_hash for the whole chunk in one query, compare
+  6. DELETE FROM hot — verified receipts only
+  7. Multi-row archival_index upserts (ARCHIVED, and ERROR with retry+1)
+  8. Advance the checkpoint, COMMIT
+
+WARM → COLD
+───────────
+  S3/R2:   receipts are encoded into the usual envelope on the worker pool,
+           packed OMNIX_COLD_PACK_RECEIPTS per JSON-lines object and the packs
+           uploaded concurrently (multipart above OMNIX_COLD_PART_SIZE).  Each
+           receipt's storage_location is pack::{key}::{offset}::{length}; the
+           same offset index is written beside the pack as {key}.index.json.
+  Fallback: INSERT … SELECT into decision_receipts_cold, verified like WARM.
+
+Copy, verification, delete and index update commit together, so the
+COPYING / VERIFIED statuses of the per-receipt protocol are never observable
+and are not written.  A pack uploaded by a chunk whose transaction later
+rolls back stays in the bucket unreferenced; packs are content-addressed and
+immutable, so the orphan is harmless.
+
+Checkpoints
+───────────
+  receipt_archival_progress holds one row per job.  A crash or an exhausted
+  time budget leaves the cursor at the last committed chunk and the next
+  cycle resumes there.  A short chunk ends the pass and clears the cursor, so
+  receipts left in ERROR are retried on the next pass.  The row is locked
+  FOR UPDATE for each chunk transaction: concurrent daemons take turns
+  instead of archiving the same receipts twice.
+
+Configuration
+─────────────
+  OMNIX_ARCHIVAL_CHUNK_SIZE      receipts per transaction        (5000)
+  OMNIX_ARCHIVAL_VERIFY_WORKERS  signature / encode / upload pool (cpu_count)
+  OMNIX_ARCHIVAL_MAX_SECONDS     time budget per job per cycle    (1800)
+  OMNIX_COLD_PACK_RECEIPTS       receipts per COLD object         (1000)
+  OMNIX_COLD_PART_SIZE           multipart part size, ≥ 5 MiB     (8 MiB)
+
+ADR-126  /  MiFID II Article 25 — 5-year retention
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from omnix_core.evidence.receipt_archival import (
+    _HOT_COLUMNS,
+    COLD_TABLE,
+    HOT_RETENTION_DAYS,
+    HOT_TABLE,
+    INDEX_TABLE,
+    PROGRESS_TABLE,
+    STATUS_ARCHIVED,
+    STATUS_ERROR,
+    TIER_COLD,
+    TIER_HOT,
+    TIER_WARM,
+    WARM_RETENTION_DAYS,
+    WARM_TABLE,
+    S3ColdBackend,
+    _now_iso,
+    _verify_pqc_signature,
+)
+
+logger = logging.getLogger("OMNIX.ReceiptArchival.Bulk")
+
+JOB_HOT_TO_WARM  = "hot_to_warm"
+JOB_WARM_TO_COLD = "warm_to_cold"
+
+_MIN_PART_SIZE = 5 * 1024 * 1024    # S3 minimum for every part but the last
+_INDEX_BATCH   = 1000               # rows per multi-row archival_index upsert
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+_CHUNK_SIZE     = max(1, _env_int("OMNIX_ARCHIVAL_CHUNK_SIZE", 5000))
+_VERIFY_WORKERS = max(1, _env_int("OMNIX_ARCHIVAL_VERIFY_WORKERS", os.cpu_count() or 2))
+_MAX_SECONDS    = float(_env_int("OMNIX_ARCHIVAL_MAX_SECONDS", 1800))
+_PACK_RECEIPTS  = max(1, _env_int("OMNIX_COLD_PACK_RECEIPTS", 1000))
+_PART_SIZE      = max(_MIN_PART_SIZE, _env_int("OMNIX_COLD_PART_SIZE", 8 * 1024 * 1024))
+
+_COL_LIST = ", ".join(_HOT_COLUMNS)
+
+
+def _in_list(n: int) -> str:
+    return ", ".join(["%s"] * n)
+
+
+def _signature_failures(pool: ThreadPoolExecutor, rows: List[Dict]) -> Dict[str, str]:
+    """receipt_id → reason for every row whose PQC signature is present but invalid."""
+    verdicts = pool.map(_verify_pqc_signature, rows)
+    return {
+        row["receipt_id"]: "ArchivalIntegrityError: PQC signature invalid"
+        for row, ok in zip(rows, verdicts)
+        if ok is False
+    }
+
+
+def _hash_failures(rows: List[Dict], stored: Dict[str, Any]) -> Dict[str, str]:
+    """Compare source content_hash against what the destination now holds."""
+    failures: Dict[str, str] = {}
+    for row in rows:
+        rid = row["receipt_id"]
+        if rid not in stored:
+            failures[rid] = "ArchivalIntegrityError: missing at destination after copy"
+        elif stored[rid] != row.get("content_hash"):
+            failures[rid] = "ArchivalIntegrityError: hash mismatch at destination"
+    return failures
+
+
+class BulkReceiptArchiver:
+    """
+    Chunked, resumable archival engine behind ReceiptArchivalService.
+
+    Usage
+    ─────
+        archiver = BulkReceiptArchiver(service)
+        archived, errors = archiver.archive_hot_to_warm(conn)
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        chunk_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        pack_receipts: Optional[int] = None,
+        part_size: Optional[int] = None,
+    ):
+        self.service       = service
+        self.chunk_size    = max(1, chunk_size or _CHUNK_SIZE)
+        self.workers       = max(1, workers or _VERIFY_WORKERS)
+        self.max_seconds   = _MAX_SECONDS if max_seconds is None else max_seconds
+        self.pack_receipts = max(1, pack_receipts or _PACK_RECEIPTS)
+        self.part_size     = max(_MIN_PART_SIZE, part_size or _PART_SIZE)
+
+    # ── Public entry points ────────────────────────────────────────────────────
+
+    def archive_hot_to_warm(self, conn) -> Tuple[int, int]:
+        """Run HOT → WARM chunks until the pass ends or the budget is spent."""
+        return self._run(conn, JOB_HOT_TO_WARM, self._hot_to_warm_chunk, "[HOT→WARM]")
+
+    def archive_warm_to_cold(self, conn) -> Tuple[int, int]:
+        """Run WARM → COLD chunks until the pass ends or the budget is spent."""
+        # Resolve the backend up front: ColdStorageRequiredError must propagate
+        # before any checkpoint row is locked.
+        self.service._get_cold_backend()
+        return self._run(conn, JOB_WARM_TO_COLD, self._warm_to_cold_chunk, "[WARM→COLD]")
+
+    def _run(self, conn, job: str, chunk_fn, tag: str) -> Tuple[int, int]:
+        deadline = time.monotonic() + self.max_seconds
+        archived, errors, chunks = 0, 0, 0
+        with ThreadPoolExecutor(self.workers, thread_name_prefix=f"archival-{job}") as pool:
+            while True:
+                try:
+                    ok, bad, done = chunk_fn(conn, pool)
+                except Exception as exc:
+                    # Chunk rolled back; its checkpoint is unchanged for next cycle.
+                    logger.error("%s Chunk error: %s: %s", tag, type(exc).__name__, exc)
+                    errors += 1
+                    break
+                archived += ok
+                errors   += bad
+                chunks   += 1
+                if done:
+                    break
+                if time.monotonic() >= deadline:
+                    logger.info("%s Time budget spent after %d chunks — "
+                                "resuming from checkpoint next cycle", tag, chunks)
+                    break
+
+        if archived or errors:
+            logger.info(
+                "%s Bulk cycle complete — archived=%d errors=%d chunks=%d",
+                tag, archived, errors, chunks,
+            )
+        return archived, errors
+
+    # ── Checkpoints ────────────────────────────────────────────────────────────
+
+    def _lock_checkpoint(self, cur, job: str) -> Optional[Tuple[Any, str]]:
+        cur.execute(
+            f"INSERT INTO {PROGRESS_TABLE} (job) VALUES (%s) ON CONFLICT (job) DO NOTHING",
+            (job,),
+        )
+        cur.execute(
+            f"SELECT cursor_ts, cursor_id FROM {PROGRESS_TABLE} WHERE job = %s FOR UPDATE",
+            (job,),
+        )
+        row = cur.fetchone()
+        if not row or row[0] is None:
+            return None
+        return row[0], row[1]
+
+    def _save_checkpoint(
+        self,
+        cur,
+        job: str,
+        cursor: Optional[Tuple[Any, str]],
+        archived: int,
+        errors: int,
+    ) -> None:
+        cursor_ts, cursor_id = cursor if cursor else (None, None)
+        cur.execute(
+            f"""
+            UPDATE {PROGRESS_TABLE}
+            SET cursor_ts  = %s,
+                cursor_id  = %s,
+                archived   = archived + %s,
+                errors     = errors + %s,
+                passes     = passes + %s,
+                updated_at = NOW()
+            WHERE job = %s
+            """,
+            (cursor_ts, cursor_id, archived, errors, 0 if cursor else 1, job),
+        )
+
+    def _select_chunk(
+        self,
+        cur,
+        table: str,
+        order_col: str,
+        retention_days: int,
+        cursor: Optional[Tuple[Any, str]],
+    ) -> Tuple[List[Dict], Optional[Tuple[Any, str]]]:
+        """Next chunk past the keyset cursor → (rows, keyset of the last row)."""
+        after, params = "", []
+        if cursor:
+            after = f"AND ({order_col}, receipt_id) > (%s, %s)"
+            params = list(cursor)
+        cur.execute(
+            f"""
+            SELECT {_COL_LIST}, {order_col}
+            FROM {table}
+            WHERE {order_col} < NOW() - INTERVAL '{retention_days} days'
+              {after}
+            ORDER BY {order_col} ASC, receipt_id ASC
+            LIMIT %s
+            """,
+            params + [self.chunk_size],
+        )
+        fetched = cur.fetchall()
+        rows = [dict(zip(_HOT_COLUMNS, row_tuple)) for row_tuple in fetched]
+        last = (fetched[-1][-1], rows[-1]["receipt_id"]) if rows else None
+        return rows, last
+
+    # ── Set-based steps ────────────────────────────────────────────────────────
+
+    def _copy_and_verify(
+        self, cur, source: str, dest: str, rows: List[Dict], archived_at: str, source_tier: str
+    ) -> Dict[str, str]:
+        """INSERT … SELECT the rows into dest, then verify every hash in one query."""
+        ids = [r["receipt_id"] for r in rows]
+        cur.execute(
+            f"""
+            INSERT INTO {dest} ({_COL_LIST}, archived_at, source_tier)
+            SELECT {_COL_LIST}, %s, %s
+            FROM {source}
+            WHERE receipt_id IN ({_in_list(len(ids))})
+            ON CONFLICT (receipt_id) DO NOTHING
+            """,
+            [archived_at, source_tier] + ids,
+        )
+        cur.execute(
+            f"SELECT receipt_id, content_hash FROM {dest} "
+            f"WHERE receipt_id IN ({_in_list(len(ids))})",
+            ids,
+        )
+        return _hash_failures(rows, dict(cur.fetchall()))
+
+    def _delete(self, cur, table: str, ids: List[str]) -> None:
+        if ids:
+            cur.execute(
+                f"DELETE FROM {table} WHERE receipt_id IN ({_in_list(len(ids))})",
+                ids,
+            )
+
+    def _upsert_index(
+        self,
+        cur,
+        tier: str,
+        archived: List[Tuple[Dict, str]],
+        failed: List[Tuple[Dict, str, str]],
+    ) -> None:
+        """Multi-row archival_index upserts: (row, location) and (row, location, error)."""
+        def base(row: Dict, location: str) -> List[Any]:
+            sig = row.get("signature")
+            return [row["receipt_id"], tier, location, row.get("content_hash", ""),
+                    sig[:40] if sig else None, row.get("timestamp_utc"),
+                    row.get("client_id"), row.get("domain")]
+
+        for start in range(0, len(archived), _INDEX_BATCH):
+            batch = archived[start:start + _INDEX_BATCH]
+            params: List[Any] = []
+            for row, location in batch:
+                params.extend(base(row, location) + [STATUS_ARCHIVED])
+            values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(batch))
+            cur.execute(
+                f"""
+                INSERT INTO {INDEX_TABLE}
+                    (receipt_id, tier, storage_location, content_hash,
+                     signature_prefix, original_ts_utc, client_id, domain,
+                     archival_status)
+                VALUES {values}
+                ON CONFLICT (receipt_id) DO UPDATE SET
+                    tier             = EXCLUDED.tier,
+                    storage_location = EXCLUDED.storage_location,
+                    archival_status  = EXCLUDED.archival_status,
+                    last_error       = NULL,
+                    archived_at      = NOW()
+                """,
+                params,
+            )
+
+        for start in range(0, len(failed), _INDEX_BATCH):
+            batch = failed[start:start + _INDEX_BATCH]
+            params = []
+            for row, location, error in batch:
+                params.extend(base(row, location) + [STATUS_ERROR, error[:200]])
+            values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1)"] * len(batch))
+            cur.execute(
+                f"""
+                INSERT INTO {INDEX_TABLE}
+                    (receipt_id, tier, storage_location, content_hash,
+                     signature_prefix, original_ts_utc, client_id, domain,
+                     archival_status, last_error, retry_count)
+                VALUES {values}
+                ON CONFLICT (receipt_id) DO UPDATE SET
+                    tier             = EXCLUDED.tier,
+                    storage_location = EXCLUDED.storage_location,
+                    archival_status  = EXCLUDED.archival_status,
+                    last_error       = EXCLUDED.last_error,
+                    retry_count      = {INDEX_TABLE}.retry_count + 1,
+                    archived_at      = NOW()
+                """,
+                params,
+            )
+
+    def _finish_chunk(
+        self,
+        conn,
+        cur,
+        job: str,
+        source: str,
+        tier: str,
+        rows: List[Dict],
+        last: Optional[Tuple[Any, str]],
+        failures: Dict[str, str],
+        locations: Dict[str, str],
+        default_location,
+    ) -> Tuple[int, int, bool]:
+        verified = [r for r in rows if r["receipt_id"] not in failures]
+        self._delete(cur, source, [r["receipt_id"] for r in verified])
+        self._upsert_index(
+            cur, tier,
+            [(r, locations.get(r["receipt_id"]) or default_location(r)) for r in verified],
+            [(r, default_location(r), failures[r["receipt_id"]])
+             for r in rows if r["receipt_id"] in failures],
+        )
+        done = len(rows) < self.chunk_size
+        self._save_checkpoint(cur, job, None if done else last,
+                              len(verified), len(failures))
+        conn.commit()
+        for rid, reason in failures.items():
+            logger.error("[%s] receipt_id=%s not archived: %s", job, rid, reason)
+        return len(verified), len(failures), done
+
+    # ── HOT → WARM ─────────────────────────────────────────────────────────────
+
+    def _hot_to_warm_chunk(self, conn, pool: ThreadPoolExecutor) -> Tuple[int, int, bool]:
+        cur = conn.cursor()
+        try:
+            cursor = self._lock_checkpoint(cur, JOB_HOT_TO_WARM)
+            rows, last = self._select_chunk(cur, HOT_TABLE, "created_at", HOT_RETENTION_DAYS, cursor)
+            failures = _signature_failures(pool, rows)
+            candidates = [r for r in rows if r["receipt_id"] not in failures]
+            if candidates:
+                failures.update(self._copy_and_verify(
+                    cur, HOT_TABLE, WARM_TABLE, candidates, _now_iso(), TIER_HOT,
+                ))
+            return self._finish_chunk(
+                conn, cur, JOB_HOT_TO_WARM, HOT_TABLE, TIER_WARM, rows, last, failures, {},
+                lambda r: f"pg::{WARM_TABLE}::{r['receipt_id']}",
+            )
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+    # ── WARM → COLD ────────────────────────────────────────────────────────────
+
+    def _warm_to_cold_chunk(self, conn, pool: ThreadPoolExecutor) -> Tuple[int, int, bool]:
+        backend = self.service._get_cold_backend()
+        archived_at = _now_iso()
+        cur = conn.cursor()
+        try:
+            cursor = self._lock_checkpoint(cur, JOB_WARM_TO_COLD)
+            rows, last = self._select_chunk(cur, WARM_TABLE, "archived_at", WARM_RETENTION_DAYS,
+                                            cursor)
+            failures = _signature_failures(pool, rows)
+            candidates = [r for r in rows if r["receipt_id"] not in failures]
+            locations: Dict[str, str] = {}
+            if candidates and isinstance(backend, S3ColdBackend):
+                locations, pack_failures = self._upload_packs(pool, backend, candidates, archived_at)
+                failures.update(pack_failures)
+            elif candidates:
+                logger.warning(
+                    "[COLD-FALLBACK] %d receipts stored in PostgreSQL cold table "
+                    "(NOT institutional-grade). "
+                    "Set OMNIX_COLD_S3_BUCKET + credentials for production archival.",
+                    len(candidates),
+                )
+                failures.update(self._copy_and_verify(
+                    cur, WARM_TABLE, COLD_TABLE, candidates, archived_at, TIER_WARM,
+                ))
+            return self._finish_chunk(
+                conn, cur, JOB_WARM_TO_COLD, WARM_TABLE, TIER_COLD, rows, last, failures, locations,
+                lambda r: f"pg::{COLD_TABLE}::{r['receipt_id']}",
+            )
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+    def _upload_packs(
+        self,
+        pool: ThreadPoolExecutor,
+        backend: S3ColdBackend,
+        rows: List[Dict],
+        archived_at: str,
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Encode on the pool, upload packs concurrently → (locations, failures)."""
+        blobs = list(pool.map(lambda r: backend.encode_record(r, archived_at), rows))
+        packs = []
+        for start in range(0, len(rows), self.pack_receipts):
+            pack_rows = rows[start:start + self.pack_receipts]
+            records = [(r["receipt_id"], r.get("content_hash", ""), blob)
+                       for r, blob in zip(pack_rows, blobs[start:start + self.pack_receipts])]
+            ts = pack_rows[0].get("timestamp_utc") or pack_rows[0].get("created_at")
+            packs.append((pack_rows, pool.submit(backend.put_pack, records, ts, self.part_size)))
+
+        locations: Dict[str, str] = {}
+        failures: Dict[str, str] = {}
+        for pack_rows, future in packs:
+            try:
+                for row, location in zip(pack_rows, future.result()):
+                    locations[row["receipt_id"]] = location
+            except Exception as exc:
+                reason = f"{type(exc).__name__}: {exc}"
+                logger.error("[WARM→COLD] Pack upload failed (%d receipts): %s",
+                             len(pack_rows), reason)
+                for row in pack_rows:
+                    failures[row["receipt_id"]] = reason
+        return locations, failures
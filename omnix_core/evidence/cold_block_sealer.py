@@ -6,7 +6,7 @@ EAP-INV-001–006 enforcement at block-seal time.
 
 Responsibilities:
   · Collect artifacts from HOT/WARM tier
-  · Compute artifact Merkle root
+  · Compute artifact Merkle root (v1 flat hash, or v2 binary tree)
   · Compute block canonical_hash (deterministic, field-committed)
   · Sign canonical_hash with ML-DSA-65 (Dilithium-3)
   · Write COLD block as JSON manifest (+ optional Parquet)
@@ -21,6 +21,18 @@ Sealing is an APPEND-ONLY operation. Blocks are never modified after seal.
 The public verifier (omnix_atf_verify.py) can reconstruct and verify any
 sealed block offline, without platform access (EAP-INV-005).
 
+Block formats (integrity_manifest.hash_algorithm):
+  sha256-v1         merkle_root = sha256("|".join(sorted(artifact_hashes)));
+                    every artifact hash is listed in the manifest.
+  sha256-merkle-v2  RFC 6962 binary Merkle tree over the artifacts in seal
+                    order. The manifest carries only the root; each
+                    artifact's audit path is written to
+                    {block_id}.proofs.jsonl next to the block, so one
+                    artifact is proven with O(log n) hashes. seal_stream()
+                    consumes an artifact iterator, hashes on a thread pool
+                    and spills tree levels to disk — memory stays bounded
+                    however large the daily block is.
+
 Harold Nunes — OMNIX QUANTUM LTD — May 2026
 """
 from __future__ import annotations
@@ -29,13 +41,19 @@ import base64
 import hashlib
 import json
 import logging
+import mmap
 import os
+import shutil
+import tempfile
 import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.ColdBlockSealer")
 
@@ -45,6 +63,7 @@ logger = logging.getLogger("OMNIX.ColdBlockSealer")
 
 OMNIX_VERSION      = "1.0.0"
 HASH_ALGORITHM_V1  = "sha256-v1"
+HASH_ALGORITHM_V2  = "sha256-merkle-v2"
 PQC_ALGORITHM      = "ML-DSA-65 (FIPS 204)"
 GENESIS_PREDECESSOR = "0" * 64
 
@@ -57,6 +76,12 @@ ALL_EVIDENCE_CLASSES = frozenset({
 # Block ID format: OMNIX-BLOCK-{YYYYMMDD}-{seq:06d}
 BLOCK_ID_TEMPLATE = "OMNIX-BLOCK-{date}-{seq:06d}"
 
+# v2 sealing: artifacts per hashing task, payload read size, pool size
+_HASH_CHUNK_SIZE   = int(os.environ.get("OMNIX_SEAL_HASH_CHUNK", "512"))
+_PAYLOAD_READ_SIZE = 1 << 20
+_DEFAULT_HASH_WORKERS = int(os.environ.get("OMNIX_SEAL_HASH_WORKERS", "0")) or (os.cpu_count() or 4)
+_DIGEST_SIZE       = 32
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Cryptographic primitives (mirrors omnix_atf_verify.py exactly)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -87,6 +112,77 @@ def compute_merkle_root(artifact_hashes: List[str]) -> str:
     return _sha256_prefixed(combined.encode("utf-8"))
 
 
+def merkle_leaf_digest(content_hash: str) -> bytes:
+    """v2 leaf: SHA-256(0x00 || content_hash) — RFC 6962 §2.1 domain separation."""
+    return hashlib.sha256(b"\x00" + content_hash.encode("utf-8")).digest()
+
+
+def _merkle_node_digest(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class StreamingMerkleRoot:
+    """
+    Incremental RFC 6962 root over leaf digests appended in order.
+
+    Keeps only the perfect subtrees on the right edge of the tree — at most
+    log2(n) digests — so the root of any number of artifacts is computed in
+    constant memory.
+    """
+
+    __slots__ = ("_stack", "count")
+
+    def __init__(self) -> None:
+        self._stack: List[Tuple[int, bytes]] = []   # (subtree size, digest)
+        self.count = 0
+
+    def append(self, leaf: bytes) -> None:
+        size, digest = 1, leaf
+        while self._stack and self._stack[-1][0] == size:
+            _, left = self._stack.pop()
+            size, digest = size * 2, _merkle_node_digest(left, digest)
+        self._stack.append((size, digest))
+        self.count += 1
+
+    def root(self) -> str:
+        if not self._stack:
+            return _sha256_prefixed(b"OMNIX-EMPTY-BLOCK")
+        acc = self._stack[-1][1]
+        for _, digest in reversed(self._stack[:-1]):
+            acc = _merkle_node_digest(digest, acc)
+        return "sha256:" + acc.hex()
+
+
+def compute_merkle_root_v2(artifact_hashes: Iterable[str]) -> str:
+    """
+    v2 Merkle root: RFC 6962 tree over artifact content hashes in seal order
+    (not sorted — the leaf index is part of each artifact's proof).
+    Returns a 'sha256:' prefixed hex string.
+    """
+    tree = StreamingMerkleRoot()
+    for h in artifact_hashes:
+        tree.append(merkle_leaf_digest(h))
+    return tree.root()
+
+
+def verify_artifact_proof(
+    content_hash: str,
+    leaf_index: int,
+    tree_size: int,
+    audit_path: List[str],
+    merkle_root: str,
+) -> bool:
+    """Check one artifact's v2 audit path against the block's merkle_root."""
+    from omnix_core.evidence.merkle_log import root_from_inclusion
+    try:
+        root = root_from_inclusion(
+            merkle_leaf_digest(content_hash).hex(), leaf_index, tree_size, audit_path,
+        )
+    except ValueError:
+        return False
+    return root is not None and "sha256:" + root == merkle_root
+
+
 def compute_canonical_hash(
     block_id: str,
     creation_timestamp_ns: int,
@@ -196,6 +292,11 @@ class SealedBlock:
     def block_file_name(self) -> str:
         return f"{self.block_id}.json"
 
+    @property
+    def proofs_file_name(self) -> str:
+        """v2 sidecar: one audit path per artifact, JSON Lines."""
+        return f"{self.block_id}.proofs.jsonl"
+
     @property
     def is_pqc_signed(self) -> bool:
         return self.pqc_signature is not None
@@ -237,6 +338,7 @@ class SealResult:
     errors:           List[str]
     warnings:         List[str]
     seal_duration_ms: float
+    proofs_file:      Optional[str] = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -371,6 +473,111 @@ def _validate_artifacts_for_seal(
     return errors, warnings
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# v2 streaming helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _artifact_id(artifact: Dict[str, Any], idx: int) -> str:
+    return artifact.get("artifact_id") or artifact.get("id") or f"UNKNOWN-{idx}"
+
+
+def _hash_payload(artifact: Dict[str, Any]) -> Optional[str]:
+    """
+    Content hash for artifacts sealed by body rather than by a precomputed
+    hash: 'payload' (bytes) or 'payload_path' (file, read in 1 MiB blocks).
+    hashlib releases the GIL on large buffers, so pool threads run in parallel.
+    """
+    payload = artifact.get("payload")
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return _sha256_prefixed(bytes(payload))
+    path = artifact.get("payload_path")
+    if path:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_PAYLOAD_READ_SIZE), b""):
+                digest.update(block)
+        return "sha256:" + digest.hexdigest()
+    return None
+
+
+def _hash_chunk(
+    chunk: List[Dict[str, Any]],
+) -> List[Tuple[Dict[str, Any], str, Optional[bytes], Optional[str]]]:
+    """Pool task: (artifact, content_hash, leaf digest, error) per artifact."""
+    out = []
+    for artifact in chunk:
+        try:
+            content_hash = artifact.get("content_hash") or _hash_payload(artifact) or ""
+            leaf = merkle_leaf_digest(content_hash) if content_hash else None
+            out.append((artifact, content_hash, leaf, None))
+        except OSError as exc:
+            out.append((artifact, "", None, f"payload unreadable: {exc}"))
+    return out
+
+
+class _MerkleLevels:
+    """
+    Tree levels spilled to files of fixed-width 32-byte digests.
+
+    Level k+1 is built by streaming pairs from level k; a lone last node is
+    promoted unchanged, which yields exactly the RFC 6962 tree shape. Audit
+    paths are then read back through mmap, one sibling per level.
+    """
+
+    def __init__(self, workdir: Path) -> None:
+        self._dir = workdir
+        self._leaf_file = open(workdir / "level-0.bin", "wb")
+        self.sizes: List[int] = [0]
+        self._maps: List[mmap.mmap] = []
+        self._files: List[Any] = []
+
+    def append(self, leaf: bytes) -> None:
+        self._leaf_file.write(leaf)
+        self.sizes[0] += 1
+
+    def build(self) -> Optional[bytes]:
+        """Close the leaf level, write the upper levels, return the root digest."""
+        self._leaf_file.close()
+        level = 0
+        while self.sizes[level] > 1:
+            with open(self._dir / f"level-{level}.bin", "rb") as src, \
+                    open(self._dir / f"level-{level + 1}.bin", "wb") as dst:
+                pair = src.read(2 * _DIGEST_SIZE)
+                while pair:
+                    if len(pair) == 2 * _DIGEST_SIZE:
+                        dst.write(_merkle_node_digest(pair[:_DIGEST_SIZE], pair[_DIGEST_SIZE:]))
+                    else:
+                        dst.write(pair)
+                    pair = src.read(2 * _DIGEST_SIZE)
+            self.sizes.append((self.sizes[level] + 1) // 2)
+            level += 1
+        for lvl, size in enumerate(self.sizes):
+            if size == 0:
+                continue
+            f = open(self._dir / f"level-{lvl}.bin", "rb")
+            self._files.append(f)
+            self._maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return self._maps[-1][:_DIGEST_SIZE] if self._maps else None
+
+    def audit_path(self, index: int) -> List[str]:
+        path: List[str] = []
+        for lvl in range(len(self.sizes) - 1):
+            sibling = index ^ 1
+            if sibling < self.sizes[lvl]:
+                off = sibling * _DIGEST_SIZE
+                path.append(self._maps[lvl][off:off + _DIGEST_SIZE].hex())
+            index >>= 1
+        return path
+
+    def close(self) -> None:
+        if not self._leaf_file.closed:
+            self._leaf_file.close()
+        for m in self._maps:
+            m.close()
+        for f in self._files:
+            f.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # COLD Block Sealer
 # ─────────────────────────────────────────────────────────────────────────────
@@ -391,8 +598,13 @@ class ColdBlockSealer:
         # Emergency seal on HALT (RGC-INV-003)
         result = sealer.seal(artifacts, trigger="halt_event", predecessor_block=last_block)
 
+        # v2 daily block streamed from WARM storage, hashed on all cores
+        sealer = ColdBlockSealer(output_dir, hash_algorithm=HASH_ALGORITHM_V2)
+        result = sealer.seal_stream(iter_warm_artifacts(), on_custody=insert_custody)
+
     Output:
-        Writes OMNIX-BLOCK-YYYYMMDD-NNNNNN.json to output_dir.
+        Writes OMNIX-BLOCK-YYYYMMDD-NNNNNN.json to output_dir (v2 also writes
+        OMNIX-BLOCK-YYYYMMDD-NNNNNN.proofs.jsonl).
         Optionally writes Parquet if pyarrow is installed.
         Returns SealResult with custody log entries for DB insertion.
     """
@@ -402,14 +614,116 @@ class ColdBlockSealer:
         output_dir: str = "cold_archive",
         secret_key_b64: Optional[str] = None,
         write_parquet: bool = False,
+        hash_algorithm: str = HASH_ALGORITHM_V1,
+        hash_workers: Optional[int] = None,
     ):
+        if hash_algorithm not in (HASH_ALGORITHM_V1, HASH_ALGORITHM_V2):
+            raise ValueError(f"Unsupported block hash_algorithm: {hash_algorithm!r}")
         self.output_dir     = Path(output_dir)
         self.secret_key_b64 = secret_key_b64 or os.environ.get(
             "OMNIX_SIGNING_SECRET_KEY_B64", ""
         ).strip()
         self.write_parquet  = write_parquet
+        self.hash_algorithm = hash_algorithm
+        self.hash_workers   = max(1, hash_workers or _DEFAULT_HASH_WORKERS)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    # ── Shared seal steps ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _failed(errors: List[str], warnings: List[str], t_start: Optional[float] = None,
+                block: Optional[SealedBlock] = None) -> SealResult:
+        return SealResult(
+            success=False, block=block, custody_entries=[],
+            block_file=None, errors=errors, warnings=warnings,
+            seal_duration_ms=(time.monotonic() - t_start) * 1000 if t_start else 0.0,
+        )
+
+    @staticmethod
+    def _predecessor_hash(
+        predecessor_block: Optional[Dict[str, Any]],
+        trigger: str,
+        errors: List[str],
+        warnings: List[str],
+    ) -> Optional[str]:
+        """EAP-INV-003 chain link; None (with an error recorded) if unusable."""
+        if predecessor_block is not None:
+            predecessor_hash = predecessor_block.get("canonical_hash", "")
+            if not predecessor_hash:
+                errors.append("EAP-INV-003: predecessor_block has no canonical_hash")
+                return None
+            return predecessor_hash
+        if trigger != "scheduler":
+            warnings.append(
+                "No predecessor block provided — block will use genesis sentinel. "
+                "This is only correct for the very first COLD block in the archive."
+            )
+        return GENESIS_PREDECESSOR
+
+    def _sign_block(self, block_id: str, canonical_hash: str, warnings: List[str]) -> Optional[str]:
+        if not self.secret_key_b64:
+            warnings.append(
+                f"Block {block_id}: No signing key configured — block sealed without PQC signature. "
+                f"Set OMNIX_SIGNING_SECRET_KEY_B64 to enable EAP-INV-002 compliance."
+            )
+            return None
+        pqc_signature = _sign_with_dilithium(canonical_hash, self.secret_key_b64)
+        if pqc_signature:
+            logger.info(f"Block {block_id}: ML-DSA-65 signature applied")
+        else:
+            warnings.append(
+                f"Block {block_id}: PQC signing failed — pypqc unavailable. "
+                f"Block sealed without ML-DSA-65 signature (EAP-INV-002 not satisfied)."
+            )
+        return pqc_signature
+
+    def _write_parquet_sidecar(
+        self, block: SealedBlock, block_file_path: Path, block_dict: Dict[str, Any],
+        warnings: List[str],
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.table({
+                "block_id":        [block.block_id],
+                "canonical_hash":  [block.canonical_hash],
+                "artifact_count":  [block.artifact_count],
+                "merkle_root":     [block.integrity_manifest["merkle_root"]],
+                "predecessor_hash": [block.predecessor_block_hash],
+                "pqc_signature":   [block.pqc_signature or ""],
+                "created_ns":      [block.creation_timestamp_ns],
+                "manifest_json":   [json.dumps(block_dict, indent=2)],
+            })
+            parquet_path = str(block_file_path).replace(".json", ".parquet")
+            pq.write_table(table, parquet_path)
+            logger.info(f"Parquet written: {parquet_path}")
+        except ImportError:
+            warnings.append("pyarrow not installed — Parquet output skipped (JSON only).")
+        except Exception as exc:
+            warnings.append(f"Parquet write failed: {exc}")
+
+    @staticmethod
+    def _custody_entry(
+        artifact_id: str, evidence_class: str, content_hash: str,
+        block_id: str, trigger: str, now_ns: int, to_hash_block: str,
+    ) -> CustodyLogEntry:
+        return CustodyLogEntry(
+            custody_id=        "CUS-" + uuid.uuid4().hex[:16].upper(),
+            artifact_id=       artifact_id,
+            evidence_class=    evidence_class,
+            transition=        "EMERGENCY_COLD" if trigger == "halt_event" else "WARM->COLD",
+            from_hash=         content_hash,
+            to_hash=           to_hash_block,
+            block_id=          block_id,
+            triggered_by=      trigger,
+            transition_ns=     now_ns,
+            integrity_verified=False,
+            verified_at=       None,
+            notes=             f"Sealed in {block_id}",
+        )
+
+    # ── v1 ───────────────────────────────────────────────────────────────────
+
     def seal(
         self,
         artifacts: List[Dict[str, Any]],
@@ -431,7 +745,14 @@ class ColdBlockSealer:
 
         Returns:
             SealResult with the sealed block and custody log entries.
+            A sealer configured for HASH_ALGORITHM_V2 delegates to seal_stream().
         """
+        if self.hash_algorithm == HASH_ALGORITHM_V2:
+            return self.seal_stream(
+                artifacts, trigger=trigger, predecessor_block=predecessor_block,
+                date_str=date_str, sealed_by=sealed_by,
+            )
+
         t_start  = time.monotonic()
         errors:   List[str] = []
         warnings: List[str] = []
@@ -442,11 +763,7 @@ class ColdBlockSealer:
         warnings.extend(val_warnings)
 
         if errors:
-            return SealResult(
-                success=False, block=None, custody_entries=[],
-                block_file=None, errors=errors, warnings=warnings,
-                seal_duration_ms=0.0,
-            )
+            return self._failed(errors, warnings)
 
         # ── Block ID and timestamp ───────────────────────────────────────────
         block_id = _next_block_id(date_str)
@@ -454,31 +771,15 @@ class ColdBlockSealer:
         now_iso  = datetime.now(timezone.utc).isoformat()
 
         # ── Predecessor hash ─────────────────────────────────────────────────
-        if predecessor_block is not None:
-            predecessor_hash = predecessor_block.get("canonical_hash", "")
-            if not predecessor_hash:
-                errors.append("EAP-INV-003: predecessor_block has no canonical_hash")
-                return SealResult(
-                    success=False, block=None, custody_entries=[],
-                    block_file=None, errors=errors, warnings=warnings,
-                    seal_duration_ms=0.0,
-                )
-        else:
-            predecessor_hash = GENESIS_PREDECESSOR
-            if trigger != "scheduler":
-                warnings.append(
-                    "No predecessor block provided — block will use genesis sentinel. "
-                    "This is only correct for the very first COLD block in the archive."
-                )
+        predecessor_hash = self._predecessor_hash(predecessor_block, trigger, errors, warnings)
+        if predecessor_hash is None:
+            return self._failed(errors, warnings)
 
         # ── Artifact metadata ────────────────────────────────────────────────
         artifact_hashes = [
             a.get("content_hash", "") for a in artifacts
         ]
-        artifact_ids = [
-            a.get("artifact_id") or a.get("id") or f"UNKNOWN-{i}"
-            for i, a in enumerate(artifacts)
-        ]
+        artifact_ids = [_artifact_id(a, i) for i, a in enumerate(artifacts)]
         evidence_classes = sorted({
             a.get("evidence_class", "UNKNOWN") for a in artifacts
         })
@@ -497,21 +798,7 @@ class ColdBlockSealer:
         )
 
         # ── PQC signature (Step 4 in verifier) ──────────────────────────────
-        pqc_signature: Optional[str] = None
-        if self.secret_key_b64:
-            pqc_signature = _sign_with_dilithium(canonical_hash, self.secret_key_b64)
-            if pqc_signature:
-                logger.info(f"Block {block_id}: ML-DSA-65 signature applied")
-            else:
-                warnings.append(
-                    f"Block {block_id}: PQC signing failed — pypqc unavailable. "
-                    f"Block sealed without ML-DSA-65 signature (EAP-INV-002 not satisfied)."
-                )
-        else:
-            warnings.append(
-                f"Block {block_id}: No signing key configured — block sealed without PQC signature. "
-                f"Set OMNIX_SIGNING_SECRET_KEY_B64 to enable EAP-INV-002 compliance."
-            )
+        pqc_signature = self._sign_block(block_id, canonical_hash, warnings)
 
         # ── Assemble block ───────────────────────────────────────────────────
         block = SealedBlock(
@@ -545,56 +832,23 @@ class ColdBlockSealer:
             logger.info(f"Block sealed: {block_file_path}")
         except OSError as exc:
             errors.append(f"Failed to write block file: {exc}")
-            return SealResult(
-                success=False, block=block, custody_entries=[],
-                block_file=None, errors=errors, warnings=warnings,
-                seal_duration_ms=(time.monotonic() - t_start) * 1000,
-            )
+            return self._failed(errors, warnings, t_start, block)
 
         # ── Optional Parquet output ──────────────────────────────────────────
         if self.write_parquet:
-            try:
-                import pyarrow as pa
-                import pyarrow.parquet as pq
-                table = pa.table({
-                    "block_id":        [block_id],
-                    "canonical_hash":  [canonical_hash],
-                    "artifact_count":  [len(artifacts)],
-                    "merkle_root":     [merkle_root],
-                    "predecessor_hash": [predecessor_hash],
-                    "pqc_signature":   [pqc_signature or ""],
-                    "created_ns":      [now_ns],
-                    "manifest_json":   [json.dumps(block_dict, indent=2)],
-                })
-                parquet_path = str(block_file_path).replace(".json", ".parquet")
-                pq.write_table(table, parquet_path)
-                logger.info(f"Parquet written: {parquet_path}")
-            except ImportError:
-                warnings.append("pyarrow not installed — Parquet output skipped (JSON only).")
-            except Exception as exc:
-                warnings.append(f"Parquet write failed: {exc}")
+            self._write_parquet_sidecar(block, block_file_path, block_dict, warnings)
 
         # ── Custody log entries ──────────────────────────────────────────────
-        transition    = "EMERGENCY_COLD" if trigger == "halt_event" else "WARM->COLD"
         to_hash_block = _sha256_prefixed(f"{canonical_hash}:{trigger}".encode())
-
-        custody_entries: List[CustodyLogEntry] = []
-        for artifact in artifacts:
-            entry = CustodyLogEntry(
-                custody_id=        "CUS-" + uuid.uuid4().hex[:16].upper(),
-                artifact_id=       artifact.get("artifact_id") or artifact.get("id") or "UNKNOWN",
-                evidence_class=    artifact.get("evidence_class", "UNKNOWN"),
-                transition=        transition,
-                from_hash=         artifact.get("content_hash", ""),
-                to_hash=           to_hash_block,
-                block_id=          block_id,
-                triggered_by=      trigger,
-                transition_ns=     now_ns,
-                integrity_verified=False,
-                verified_at=       None,
-                notes=             f"Sealed in {block_id}",
+        custody_entries: List[CustodyLogEntry] = [
+            self._custody_entry(
+                artifact.get("artifact_id") or artifact.get("id") or "UNKNOWN",
+                artifact.get("evidence_class", "UNKNOWN"),
+                artifact.get("content_hash", ""),
+                block_id, trigger, now_ns, to_hash_block,
             )
-            custody_entries.append(entry)
+            for artifact in artifacts
+        ]
 
         logger.info(
             f"Block {block_id} sealed: {len(artifacts)} artifacts, "
@@ -611,6 +865,211 @@ class ColdBlockSealer:
             seal_duration_ms=(time.monotonic() - t_start) * 1000,
         )
 
+    # ── v2 ───────────────────────────────────────────────────────────────────
+
+    def _hashed_artifacts(
+        self, artifacts: Iterable[Dict[str, Any]], pool: ThreadPoolExecutor,
+    ) -> Iterator[Tuple[Dict[str, Any], str, Optional[bytes], Optional[str]]]:
+        """
+        Hash artifacts on the pool, chunk by chunk, yielding results in input
+        order. At most 2 × workers chunks are in flight, which bounds memory.
+        """
+        it = iter(artifacts)
+        pending: deque = deque()
+        while True:
+            while len(pending) < 2 * self.hash_workers:
+                chunk = list(islice(it, _HASH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_hash_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def seal_stream(
+        self,
+        artifacts: Iterable[Dict[str, Any]],
+        trigger: str = "scheduler",
+        predecessor_block: Optional[Dict[str, Any]] = None,
+        date_str: Optional[str] = None,
+        sealed_by: str = "omnix_archive_pipeline",
+        on_custody: Optional[Callable[[CustodyLogEntry], None]] = None,
+    ) -> SealResult:
+        """
+        Seal an artifact stream into a v2 (sha256-merkle-v2) COLD block.
+
+        Artifacts are consumed once, in order. Each needs content_hash, or a
+        'payload' (bytes) / 'payload_path' (file) that is hashed on the pool
+        into 'sha256:<hex>'. Leaf digests and tree levels are spilled to a
+        scratch directory under output_dir; the block manifest carries only
+        the Merkle root, and {block_id}.proofs.jsonl receives one line per
+        artifact: {leaf_index, artifact_id, evidence_class, content_hash,
+        audit_path}.
+
+        on_custody: receives each CustodyLogEntry as it is produced instead
+        of collecting them in SealResult.custody_entries — pass it for large
+        blocks to keep memory bounded.
+
+        Nothing is written to output_dir unless the whole stream validates.
+        """
+        t_start  = time.monotonic()
+        errors:   List[str] = []
+        warnings: List[str] = []
+
+        predecessor_hash = self._predecessor_hash(predecessor_block, trigger, errors, warnings)
+        if predecessor_hash is None:
+            return self._failed(errors, warnings)
+
+        block_id = _next_block_id(date_str)
+        now_ns   = time.time_ns()
+        now_iso  = datetime.now(timezone.utc).isoformat()
+        workdir  = Path(tempfile.mkdtemp(prefix=f".{block_id}.", dir=self.output_dir))
+        levels   = _MerkleLevels(workdir)
+        stream_root = StreamingMerkleRoot()
+        evidence_classes: set = set()
+        unsigned_immutable = 0
+
+        try:
+            # ── Hash + validate + spill leaves (one pass over the stream) ────
+            with open(workdir / "leaves.jsonl", "w") as leaves_out, \
+                    ThreadPoolExecutor(self.hash_workers, thread_name_prefix="ColdSealHash") as pool:
+                for idx, (artifact, content_hash, leaf, err) in enumerate(
+                    self._hashed_artifacts(artifacts, pool)
+                ):
+                    aid = _artifact_id(artifact, idx)
+                    if err or leaf is None:
+                        errors.append(
+                            f"EAP-INV-001: Artifact {aid} has no content_hash — cannot seal"
+                            + (f" ({err})" if err else "")
+                        )
+                        continue
+                    evidence_class = artifact.get("evidence_class", "")
+                    if not evidence_class:
+                        warnings.append(f"Artifact {aid} has no evidence_class — treating as UNKNOWN")
+                    elif evidence_class not in ALL_EVIDENCE_CLASSES:
+                        warnings.append(f"Artifact {aid} has unrecognised evidence_class: '{evidence_class}'")
+                    if evidence_class in IMMUTABLE_CLASSES and not (
+                        artifact.get("pqc_signatures") or artifact.get("pqc_signature")
+                    ):
+                        unsigned_immutable += 1
+                    if errors:
+                        continue
+                    evidence_classes.add(evidence_class or "UNKNOWN")
+                    levels.append(leaf)
+                    stream_root.append(leaf)
+                    leaves_out.write(json.dumps(
+                        [aid, evidence_class or "UNKNOWN", content_hash], separators=(",", ":"),
+                    ) + "\n")
+
+            if unsigned_immutable:
+                warnings.append(
+                    f"EAP-INV-002 advisory: {unsigned_immutable} IMMUTABLE artifact(s) "
+                    f"have no PQC signature"
+                )
+            if errors:
+                return self._failed(errors, warnings, t_start)
+            artifact_count = stream_root.count
+            if not artifact_count:
+                warnings.append("Sealing an empty block — artifact_count=0")
+
+            # ── Merkle root + tree levels (Step 2 in verifier) ───────────────
+            levels.build()
+            merkle_root = stream_root.root()
+
+            # ── Canonical hash + signature (Steps 3–4 in verifier) ───────────
+            classes = sorted(evidence_classes)
+            canonical_hash = compute_canonical_hash(
+                block_id=block_id,
+                creation_timestamp_ns=now_ns,
+                artifact_count=artifact_count,
+                evidence_classes=classes,
+                merkle_root=merkle_root,
+                predecessor_block_hash=predecessor_hash,
+                hash_algorithm=HASH_ALGORITHM_V2,
+            )
+            pqc_signature = self._sign_block(block_id, canonical_hash, warnings)
+
+            # ── Audit paths + custody (second pass over spilled leaves) ──────
+            to_hash_block = _sha256_prefixed(f"{canonical_hash}:{trigger}".encode())
+            custody_entries: List[CustodyLogEntry] = []
+            proofs_tmp = workdir / "proofs.jsonl"
+            with open(workdir / "leaves.jsonl") as leaves_in, open(proofs_tmp, "w") as proofs_out:
+                for idx, line in enumerate(leaves_in):
+                    aid, evidence_class, content_hash = json.loads(line)
+                    row = json.dumps({
+                        "leaf_index":     idx,
+                        "artifact_id":    aid,
+                        "evidence_class": evidence_class,
+                        "content_hash":   content_hash,
+                        "audit_path":     levels.audit_path(idx),
+                    }, separators=(",", ":")) + "\n"
+                    proofs_out.write(row)
+                    entry = self._custody_entry(
+                        aid, evidence_class, content_hash, block_id, trigger, now_ns, to_hash_block,
+                    )
+                    if on_custody is not None:
+                        on_custody(entry)
+                    else:
+                        custody_entries.append(entry)
+
+            block = SealedBlock(
+                block_id=block_id,
+                creation_timestamp_ns=now_ns,
+                artifact_count=artifact_count,
+                evidence_classes=classes,
+                canonical_hash=canonical_hash,
+                predecessor_block_hash=predecessor_hash,
+                integrity_manifest={
+                    "merkle_root":    merkle_root,
+                    "hash_algorithm": HASH_ALGORITHM_V2,
+                    "leaf_count":     artifact_count,
+                    "proofs_file":    f"{block_id}.proofs.jsonl",
+                },
+                pqc_signature=pqc_signature,
+                pqc_algorithm=PQC_ALGORITHM,
+                omnix_version=OMNIX_VERSION,
+                sealed_at=now_iso,
+                sealed_by=sealed_by,
+                seal_trigger=trigger,
+                artifact_ids=[],   # listed in the proofs file, not the manifest
+            )
+
+            # ── Publish: proofs first, block manifest last ───────────────────
+            block_file_path  = self.output_dir / block.block_file_name
+            proofs_file_path = self.output_dir / block.proofs_file_name
+            block_dict = block.to_dict()
+            try:
+                os.replace(proofs_tmp, proofs_file_path)
+                with open(workdir / "block.json", "w") as f:
+                    json.dump(block_dict, f, indent=2)
+                os.replace(workdir / "block.json", block_file_path)
+                logger.info(f"Block sealed: {block_file_path}")
+            except OSError as exc:
+                errors.append(f"Failed to write block file: {exc}")
+                return self._failed(errors, warnings, t_start, block)
+
+            if self.write_parquet:
+                self._write_parquet_sidecar(block, block_file_path, block_dict, warnings)
+
+            logger.info(
+                f"Block {block_id} sealed (v2): {artifact_count} artifacts, "
+                f"trigger={trigger}, pqc={'YES' if pqc_signature else 'NO'}, "
+                f"workers={self.hash_workers}"
+            )
+            return SealResult(
+                success=True,
+                block=block,
+                custody_entries=custody_entries,
+                block_file=str(block_file_path),
+                errors=errors,
+                warnings=warnings,
+                seal_duration_ms=(time.monotonic() - t_start) * 1000,
+                proofs_file=str(proofs_file_path),
+            )
+        finally:
+            levels.close()
+            shutil.rmtree(workdir, ignore_errors=True)
+
     def seal_emergency(
         self,
         artifacts: List[Dict[str, Any]],
@@ -149,15 +149,8 @@ def _get_db_connection(db_url: str):
     if not db_url:
         return None
     try:
-        import psycopg
-        return psycopg.connect(db_url)
-    except ImportError:
-        try:
-            import psycopg
-            return psycopg.connect(db_url, autocommit=False)
-        except Exception as e:
-            logger.error(f"DB connection failed (psycopg3): {e}")
-            return None
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("evidence", db_url)
     except Exception as e:
         logger.error(f"DB connection failed: {e}")
         return None
@@ -455,11 +448,15 @@ class DecisionReceiptEngine:
         return public_payload
 
     def _append_to_transparency_chain(self, receipt_id: str, payload: Dict[str, Any]) -> None:
-        """Non-blocking: append receipt to transparency log (ADR-044)."""
+        """
+        Non-blocking: append receipt to transparency log (ADR-044).
+
+        The process-wide chain writer queues the receipt; its chain position
+        is assigned under the DB chain lock in a batched background flush.
+        """
         try:
-            from omnix_core.evidence.transparency_chain import TransparencyChain
-            chain = TransparencyChain()
-            chain.append(
+            from omnix_core.evidence.transparency_chain import get_chain_writer
+            get_chain_writer().submit(
                 receipt_id=receipt_id,
                 symbol=payload.get('asset', 'UNKNOWN'),
                 decision=payload.get('decision', 'UNKNOWN'),
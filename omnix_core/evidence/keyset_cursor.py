@@ -0,0 +1,172 @@
+"""
+OMNIX — Keyset Cursor Pagination
+ADR-044 / ADR-131 / ADR-138: receipt and transparency-log listings
+
+LIMIT/OFFSET pages get linearly slower with depth: PostgreSQL has to walk
+and discard every skipped row. Receipt listings are ordered by
+(created_at, id) — or (ts_utc, log_id) for the transparency log — so the
+next page can instead start strictly after the last row returned:
+
+    WHERE (created_at, receipt_id) < (%s, %s)
+    ORDER BY created_at DESC, receipt_id DESC
+    LIMIT n + 1
+
+With a composite index on the same columns every page is one index range
+scan, whatever its depth. The id breaks ties between rows sharing a
+timestamp (batch inserts), so no row is skipped or repeated.
+
+Cursor tokens are opaque to clients: base64url JSON carrying the last
+(timestamp, id) and a short scope hash of the listing's filters, so a
+cursor taken from one filtered listing is rejected by another.
+
+Author: Harold Nunes
+Operational since: March 2026
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("OMNIX.Evidence.KeysetCursor")
+
+CURSOR_VERSION = 1
+MAX_CURSOR_LEN = 512
+
+KeysetKey = Tuple[datetime, str]
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token is malformed or belongs to another listing."""
+
+
+def cursor_scope(*parts: Any) -> str:
+    """Short hash binding a cursor to the listing (tenant + filters) that issued it."""
+    material = "|".join("" if p is None else str(p) for p in parts)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def _as_utc(ts: Any) -> datetime:
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts)
+    if not isinstance(ts, datetime):
+        raise InvalidCursor("cursor timestamp is not a datetime")
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def encode_cursor(ts: Any, key: str, scope: str = "") -> str:
+    """Encode the last row's (timestamp, id) as an opaque cursor token."""
+    body = {"v": CURSOR_VERSION, "t": _as_utc(ts).isoformat(), "k": str(key), "s": scope}
+    raw = json.dumps(body, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, scope: str = "") -> KeysetKey:
+    """
+    Decode a cursor token back into its (timestamp, id) keyset position.
+    Raises InvalidCursor on malformed tokens or a scope mismatch.
+    """
+    if not token or len(token) > MAX_CURSOR_LEN:
+        raise InvalidCursor("cursor is empty or too long")
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        body = json.loads(raw.decode("utf-8"))
+        version, ts, key = body["v"], body["t"], body["k"]
+    except Exception as exc:
+        raise InvalidCursor(f"cursor is not decodable: {exc}") from None
+    if version != CURSOR_VERSION:
+        raise InvalidCursor(f"unsupported cursor version {version!r}")
+    if body.get("s", "") != scope:
+        raise InvalidCursor("cursor was issued for a different listing")
+    try:
+        return _as_utc(ts), str(key)
+    except ValueError as exc:
+        raise InvalidCursor(f"cursor timestamp is invalid: {exc}") from None
+
+
+def keyset_clause(ts_column: str, key_column: str) -> str:
+    """WHERE fragment selecting rows strictly after a (ts, key) position, newest-first."""
+    return f"({ts_column}, {key_column}) < (%s, %s)"
+
+
+def keyset_order(ts_column: str, key_column: str) -> str:
+    """ORDER BY fragment matching keyset_clause and the composite indexes."""
+    return f"{ts_column} DESC, {key_column} DESC"
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], KeysetKey],
+    scope: str = "",
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim a LIMIT n + 1 result to n rows and derive the next cursor.
+    The extra row only signals that another page exists; it is never returned.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    ts, last_key = key(page[-1])
+    return page, encode_cursor(ts, last_key, scope)
+
+
+def iter_keyset(
+    fetch_page: Callable[[Optional[KeysetKey], int], Sequence[Any]],
+    key: Callable[[Any], KeysetKey],
+    page_size: int = 1000,
+    after: Optional[KeysetKey] = None,
+) -> Iterator[Any]:
+    """
+    Yield every row of a listing by following the keyset page by page.
+
+    fetch_page(after, limit) returns up to ``limit`` rows newest-first
+    starting strictly after ``after`` (None = from the top). Each page is a
+    short index range scan, so exports never hold a long transaction open.
+    """
+    while True:
+        rows = fetch_page(after, page_size)
+        for row in rows:
+            yield row
+        if len(rows) < page_size:
+            return
+        after = key(rows[-1])
+
+
+def estimate_count(cur, select_sql: str, params: Sequence[Any] = ()) -> Optional[int]:
+    """
+    Planner row estimate for ``select_sql`` via EXPLAIN (FORMAT JSON).
+    Cheap at any table size; accuracy follows the table statistics.
+    Returns None when the estimate is unavailable. Never raises.
+    """
+    try:
+        cur.execute(f"EXPLAIN (FORMAT JSON) {select_sql}", tuple(params))
+        row = cur.fetchone()
+        plan = row[0] if not isinstance(row, dict) else next(iter(row.values()))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as exc:
+        logger.debug(f"[KeysetCursor] row estimate unavailable: {exc}")
+        try:
+            cur.connection.rollback()
+        except Exception:
+            pass
+        return None
+
+
+def ndjson_lines(rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Serialise rows as newline-delimited JSON; datetimes become ISO strings."""
+    for row in rows:
+        yield json.dumps(row, default=_json_default, separators=(",", ":")) + "\n"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
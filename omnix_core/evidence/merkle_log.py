@@ -0,0 +1,685 @@
+"""
+OMNIX — Merkle Transparency Log (RFC 6962)
+ADR-044: Quantum-Secure Decision Receipts — Transparency Log
+
+The rolling root in transparency_chain.py (root = H(prev_root || hash))
+commits to the whole history, but proving one receipt is in it means
+replaying the chain. This module keeps an append-only Merkle tree over the
+same log entries in the RFC 6962 layout, so that:
+
+  - inclusion of any receipt in a tree of size n is proven with
+    ceil(log2 n) hashes (get_inclusion_proof)
+  - an auditor who saw tree size m can check that size n only appended
+    to it, with O(log n) hashes (get_consistency_proof)
+  - every tree size the log commits to has a signed tree head (STH)
+
+Hashing (RFC 6962 §2.1):
+  leaf  = SHA-256(0x00 || leaf_input)
+  node  = SHA-256(0x01 || left || right)
+  leaf_input = "omnix-tlog-v1|{receipt_id}|{event_type}|{payload_hash}"
+
+Storage: only complete ("perfect") subtrees are stored — node (level, index)
+covers leaves [index·2^level, (index+1)·2^level). They never change once
+written, and any other subtree hash is folded from O(log n) of them.
+
+MerkleLogBuilder tails governance_transparency_log in log_seq order — a
+BIGSERIAL assigned by the database, not the client's ts_utc — so the leaf
+order is fixed by one writer per database no matter how many processes
+append chain entries. Every insert into the log holds the chain advisory
+lock (transparency_chain._CHAIN_LOCK_ID) until commit, so log_seq values
+become visible in order and the watermark never passes an uncommitted row;
+rows re-inserted late (pending reconciliation, flush retries) get a fresh
+log_seq and are picked up on the next cycle. The Merkle tables are never pruned with the chain table,
+so proofs outlive the 90-day transparency-log retention.
+
+Author: Harold Nunes
+Operational since: March 2026
+ADR: ADR-044
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("OMNIX.Evidence.MerkleLog")
+
+LOG_ID = "omnix-tlog-v1"
+HASH_ALGORITHM = "RFC6962-SHA256"
+
+_BUILDER_BATCH_SIZE: int = int(os.environ.get("OMNIX_MERKLE_BATCH_SIZE", "2000"))
+_BUILDER_INTERVAL_S: float = float(os.environ.get("OMNIX_MERKLE_INTERVAL_S", "10"))
+_STATE_NAME = "default"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+NodeKey = Tuple[int, int]      # (level, index)
+Range = Tuple[int, int]        # [start, end) leaf range
+
+
+# ── RFC 6962 hashing ──────────────────────────────────────────────────────────
+
+def leaf_hash(leaf_input: bytes) -> str:
+    return hashlib.sha256(b"\x00" + leaf_input).hexdigest()
+
+
+def node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def entry_leaf_input(receipt_id: str, event_type: str, payload_hash: str) -> bytes:
+    return f"{LOG_ID}|{receipt_id}|{event_type or 'decision'}|{payload_hash}".encode("utf-8")
+
+
+def entry_leaf_hash(receipt_id: str, event_type: str, payload_hash: str) -> str:
+    return leaf_hash(entry_leaf_input(receipt_id, event_type, payload_hash))
+
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+# ── Tree shape ────────────────────────────────────────────────────────────────
+
+def _split(n: int) -> int:
+    """Largest power of two strictly less than n (n >= 2)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+def subtree_nodes(start: int, end: int) -> List[NodeKey]:
+    """
+    Perfect subtrees covering [start, end), left to right. For every range
+    RFC 6962 recursion produces, start is aligned to the first piece, so the
+    pieces are exactly the binary decomposition of (end - start).
+    """
+    keys: List[NodeKey] = []
+    while start < end:
+        level = (end - start).bit_length() - 1
+        keys.append((level, start >> level))
+        start += 1 << level
+    return keys
+
+
+def fold_range(start: int, end: int, lookup: Callable[[NodeKey], str]) -> str:
+    """MTH(D[start:end]) from stored perfect-subtree hashes."""
+    if start >= end:
+        return EMPTY_ROOT
+    keys = subtree_nodes(start, end)
+    acc = lookup(keys[-1])
+    for key in reversed(keys[:-1]):
+        acc = node_hash(lookup(key), acc)
+    return acc
+
+
+def inclusion_ranges(index: int, size: int) -> List[Range]:
+    """Leaf ranges whose MTH form PATH(index, D[0:size]), leaf-side first."""
+    if not 0 <= index < size:
+        raise ValueError(f"leaf index {index} outside tree of size {size}")
+    path: List[Range] = []
+    lo, hi = 0, size
+    while hi - lo > 1:
+        k = _split(hi - lo)
+        if index < lo + k:
+            path.append((lo + k, hi))
+            hi = lo + k
+        else:
+            path.append((lo, lo + k))
+            lo = lo + k
+    path.reverse()
+    return path
+
+
+def consistency_ranges(old_size: int, new_size: int) -> List[Range]:
+    """Leaf ranges whose MTH form PROOF(old_size, D[0:new_size]) (RFC 6962 §2.1.2)."""
+    if not 0 < old_size <= new_size:
+        raise ValueError(f"need 0 < old_size <= new_size, got {old_size}, {new_size}")
+    proof: List[Range] = []
+    lo, hi, m, complete = 0, new_size, old_size, True
+    while m != hi - lo:
+        k = _split(hi - lo)
+        if m <= k:
+            proof.append((lo + k, hi))
+            hi = lo + k
+        else:
+            proof.append((lo, lo + k))
+            lo, m, complete = lo + k, m - k, False
+    if not complete:
+        proof.append((lo, hi))
+    proof.reverse()
+    return proof
+
+
+# ── Verification (RFC 9162 §2.1.3.2 / §2.1.4.2) ───────────────────────────────
+
+def root_from_inclusion(leaf: str, index: int, size: int, path: Sequence[str]) -> Optional[str]:
+    """Recompute the root an inclusion proof commits to; None if the path is malformed."""
+    if not 0 <= index < size:
+        return None
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return None
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return r if sn == 0 else None
+
+
+def verify_inclusion(leaf: str, index: int, size: int, path: Sequence[str], root: str) -> bool:
+    try:
+        return root_from_inclusion(leaf, index, size, path) == root
+    except ValueError:
+        return False
+
+
+def verify_consistency(
+    old_size: int, new_size: int, old_root: str, new_root: str, proof: Sequence[str],
+) -> bool:
+    try:
+        if old_size == new_size:
+            return not proof and old_root == new_root
+        if not 0 < old_size < new_size or not proof:
+            return False
+        proof = list(proof)
+        if old_size & (old_size - 1) == 0:
+            proof.insert(0, old_root)
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+        fr = sr = proof[0]
+        for c in proof[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                fr = node_hash(c, fr)
+                sr = node_hash(c, sr)
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                sr = node_hash(sr, c)
+            fn >>= 1
+            sn >>= 1
+        return sn == 0 and fr == old_root and sr == new_root
+    except ValueError:
+        return False
+
+
+# ── Appending ─────────────────────────────────────────────────────────────────
+
+def extend_tree(
+    size: int, frontier: Dict[NodeKey, str], leaves: Sequence[str],
+) -> Tuple[Dict[NodeKey, str], int]:
+    """
+    Append leaf hashes to a tree of ``size`` leaves.
+
+    frontier holds the hashes of subtree_nodes(0, size) — the only existing
+    nodes a new perfect subtree can have as a left sibling. Returns the
+    newly completed perfect nodes (level 0 included) and the new size.
+    """
+    known = dict(frontier)
+    created: Dict[NodeKey, str] = {}
+    for offset, h in enumerate(leaves):
+        level, idx = 0, size + offset
+        known[(0, idx)] = created[(0, idx)] = h
+        while idx & 1:
+            parent = node_hash(known[(level, idx - 1)], known[(level, idx)])
+            level, idx = level + 1, idx >> 1
+            known[(level, idx)] = created[(level, idx)] = parent
+    return created, size + len(leaves)
+
+
+class MerkleTree:
+    """In-memory RFC 6962 tree over perfect-subtree hashes (tests, offline tooling)."""
+
+    def __init__(self, leaves: Iterable[str] = ()) -> None:
+        self.nodes: Dict[NodeKey, str] = {}
+        self.size = 0
+        self.extend(leaves)
+
+    def extend(self, leaves: Iterable[str]) -> None:
+        frontier = {k: self.nodes[k] for k in subtree_nodes(0, self.size)}
+        created, self.size = extend_tree(self.size, frontier, list(leaves))
+        self.nodes.update(created)
+
+    def root(self, size: Optional[int] = None) -> str:
+        return fold_range(0, self.size if size is None else size, self.nodes.__getitem__)
+
+    def inclusion_proof(self, index: int, size: Optional[int] = None) -> List[str]:
+        size = self.size if size is None else size
+        return [fold_range(a, b, self.nodes.__getitem__) for a, b in inclusion_ranges(index, size)]
+
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[str]:
+        new_size = self.size if new_size is None else new_size
+        if old_size == new_size:
+            return []
+        return [fold_range(a, b, self.nodes.__getitem__) for a, b in consistency_ranges(old_size, new_size)]
+
+
+# ── Signed tree heads ─────────────────────────────────────────────────────────
+
+def tree_head_message(tree_size: int, root_hash: str, timestamp: str) -> bytes:
+    """Canonical bytes an STH signature covers."""
+    return json.dumps(
+        {"log_id": LOG_ID, "tree_size": tree_size, "root_hash": root_hash, "timestamp": timestamp},
+        sort_keys=True, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def sign_tree_head(tree_size: int, root_hash: str) -> Dict[str, Any]:
+    """Build and sign an STH with the active crypto provider. Unsigned if no key. Never raises."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+    sth: Dict[str, Any] = {
+        "log_id": LOG_ID, "tree_size": tree_size, "root_hash": root_hash,
+        "timestamp": timestamp, "signing_provider": "none",
+        "signature_b64": None, "public_key_b64": None, "key_id": None,
+    }
+    try:
+        from omnix_core.security.crypto_providers import get_active_provider, get_signing_key
+        provider = get_active_provider()
+        key = get_signing_key(provider.provider_id(), allow_ephemeral=True)
+        if key is None:
+            return sth
+        sig = provider.sign(tree_head_message(tree_size, root_hash, timestamp), key.secret_key)
+        if sig:
+            sth.update(
+                signing_provider=provider.provider_id(),
+                signature_b64=base64.b64encode(sig).decode("utf-8"),
+                public_key_b64=key.public_key_b64,
+                key_id=key.key_id,
+            )
+    except Exception as exc:
+        logger.warning(f"[MerkleLog] tree head signing failed: {exc}")
+    return sth
+
+
+# ── Database-backed log ───────────────────────────────────────────────────────
+
+_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS transparency_merkle_leaves (
+        leaf_index   BIGINT       PRIMARY KEY,
+        log_id       VARCHAR(64)  NOT NULL UNIQUE,
+        receipt_id   VARCHAR(128) NOT NULL,
+        event_type   VARCHAR(32)  NOT NULL DEFAULT 'decision',
+        payload_hash VARCHAR(64)  NOT NULL,
+        leaf_hash    CHAR(64)     NOT NULL,
+        ts_utc       TIMESTAMPTZ
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_merkle_leaves_receipt ON transparency_merkle_leaves(receipt_id)",
+    """
+    CREATE TABLE IF NOT EXISTS transparency_merkle_nodes (
+        level        SMALLINT     NOT NULL,
+        node_index   BIGINT       NOT NULL,
+        hash         CHAR(64)     NOT NULL,
+        PRIMARY KEY (level, node_index)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS transparency_tree_heads (
+        tree_size        BIGINT       PRIMARY KEY,
+        root_hash        CHAR(64)     NOT NULL,
+        ts_utc           TIMESTAMPTZ  NOT NULL,
+        signing_provider VARCHAR(32)  NOT NULL DEFAULT 'none',
+        signature_b64    TEXT,
+        public_key_b64   TEXT,
+        key_id           VARCHAR(32)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS transparency_merkle_state (
+        name         VARCHAR(32)  PRIMARY KEY,
+        tree_size    BIGINT       NOT NULL DEFAULT 0,
+        last_seq     BIGINT       NOT NULL DEFAULT 0,
+        last_ts      TIMESTAMPTZ  NOT NULL,
+        last_log_id  VARCHAR(64)  NOT NULL DEFAULT '',
+        updated_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW()
+    )
+    """,
+    # Pre-log_seq deployments (see sql/migrations/V7_003_transparency_log_seq.sql)
+    "ALTER TABLE transparency_merkle_state ADD COLUMN IF NOT EXISTS last_seq BIGINT NOT NULL DEFAULT 0",
+    "ALTER TABLE governance_transparency_log ADD COLUMN IF NOT EXISTS log_seq BIGSERIAL",
+    "CREATE INDEX IF NOT EXISTS idx_transparency_log_seq ON governance_transparency_log(log_seq)",
+)
+
+_STH_COLUMNS = "tree_size, root_hash, ts_utc, signing_provider, signature_b64, public_key_b64, key_id"
+
+
+def _default_conn_factory():
+    from omnix_services.database_service.connection_provider import get_connection
+    return get_connection("evidence")
+
+
+def _sth_row_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    size, root, ts, provider, sig, pub, key_id = row
+    return {
+        "log_id": LOG_ID, "tree_size": int(size), "root_hash": root,
+        "timestamp": ts.isoformat() if hasattr(ts, "isoformat") else str(ts),
+        "signing_provider": provider, "signature_b64": sig,
+        "public_key_b64": pub, "key_id": key_id,
+    }
+
+
+class MerkleTransparencyLog:
+    """
+    RFC 6962 tree over governance_transparency_log, stored in PostgreSQL.
+
+    conn_factory returns a DB-API connection (psycopg or psycopg2); each call
+    uses one connection and closes it. Read methods never raise — they log
+    and return None — so they are safe on public endpoints.
+    """
+
+    SOURCE_TABLE = "governance_transparency_log"
+
+    def __init__(
+        self,
+        conn_factory: Optional[Callable[[], Any]] = None,
+        batch_size: int = _BUILDER_BATCH_SIZE,
+    ) -> None:
+        self._conn_factory = conn_factory or _default_conn_factory
+        self._batch_size = batch_size
+        self._schema_ready = False
+
+    # ── schema ──
+
+    def ensure_schema(self, conn) -> None:
+        if self._schema_ready:
+            return
+        cur = conn.cursor()
+        for ddl in _DDL:
+            cur.execute(ddl)
+        cur.execute(
+            "INSERT INTO transparency_merkle_state (name, last_ts) VALUES (%s, %s) "
+            "ON CONFLICT (name) DO NOTHING",
+            (_STATE_NAME, _EPOCH),
+        )
+        conn.commit()
+        cur.close()
+        self._schema_ready = True
+
+    # ── building ──
+
+    @staticmethod
+    def _fetch_nodes(cur, keys: Iterable[NodeKey]) -> Dict[NodeKey, str]:
+        keys = sorted(set(keys))
+        if not keys:
+            return {}
+        values = ", ".join(["(%s, %s)"] * len(keys))
+        params = [v for key in keys for v in key]
+        cur.execute(
+            f"SELECT n.level, n.node_index, n.hash FROM transparency_merkle_nodes n "
+            f"JOIN (VALUES {values}) AS k(level, node_index) "
+            f"ON n.level = k.level AND n.node_index = k.node_index",
+            params,
+        )
+        found = {(int(level), int(idx)): h for level, idx, h in cur.fetchall()}
+        missing = [k for k in keys if k not in found]
+        if missing:
+            raise LookupError(f"merkle nodes missing: {missing[:5]}")
+        return found
+
+    def run_once(self) -> int:
+        """
+        Append one batch of log entries past the log_seq watermark that have
+        no leaf yet, store the new perfect nodes and one signed tree head,
+        all in one transaction. Returns the number of leaves appended.
+
+        The NOT EXISTS guard lets the first cycle after the log_seq migration
+        start from 0 without duplicating entries the (ts_utc, log_id)
+        watermark had already appended.
+        """
+        conn = self._conn_factory()
+        if conn is None:
+            return 0
+        try:
+            self.ensure_schema(conn)
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT tree_size, last_seq FROM transparency_merkle_state "
+                "WHERE name = %s FOR UPDATE",
+                (_STATE_NAME,),
+            )
+            size, last_seq = cur.fetchone()
+            size = int(size)
+            cur.execute(
+                f"""
+                SELECT t.log_seq, t.log_id, t.receipt_id, t.event_type, t.payload_hash, t.ts_utc
+                FROM {self.SOURCE_TABLE} t
+                WHERE t.log_seq > %s
+                  AND NOT EXISTS (
+                      SELECT 1 FROM transparency_merkle_leaves l WHERE l.log_id = t.log_id::text
+                  )
+                ORDER BY t.log_seq
+                LIMIT %s
+                """,
+                (int(last_seq), self._batch_size),
+            )
+            fetched = cur.fetchall()
+            rows = [row[1:] for row in fetched]
+            if not rows:
+                conn.commit()
+                cur.close()
+                return 0
+
+            leaves = [entry_leaf_hash(r[1], r[2], r[3]) for r in rows]
+            frontier = self._fetch_nodes(cur, subtree_nodes(0, size))
+            created, new_size = extend_tree(size, frontier, leaves)
+            known = {**frontier, **created}
+            root = fold_range(0, new_size, known.__getitem__)
+
+            leaf_values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+            leaf_params: List[Any] = []
+            for offset, (row, h) in enumerate(zip(rows, leaves)):
+                log_id, receipt_id, event_type, payload_hash, ts = row
+                leaf_params.extend((size + offset, str(log_id), receipt_id,
+                                    event_type or "decision", payload_hash, h, ts))
+            cur.execute(
+                "INSERT INTO transparency_merkle_leaves "
+                "(leaf_index, log_id, receipt_id, event_type, payload_hash, leaf_hash, ts_utc) "
+                f"VALUES {leaf_values}",
+                leaf_params,
+            )
+            node_values = ", ".join(["(%s, %s, %s)"] * len(created))
+            cur.execute(
+                f"INSERT INTO transparency_merkle_nodes (level, node_index, hash) VALUES {node_values}",
+                [v for (level, idx), h in sorted(created.items()) for v in (level, idx, h)],
+            )
+            sth = sign_tree_head(new_size, root)
+            cur.execute(
+                f"INSERT INTO transparency_tree_heads ({_STH_COLUMNS}) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                (new_size, root, sth["timestamp"], sth["signing_provider"],
+                 sth["signature_b64"], sth["public_key_b64"], sth["key_id"]),
+            )
+            last = rows[-1]
+            cur.execute(
+                "UPDATE transparency_merkle_state SET tree_size = %s, last_seq = %s, "
+                "last_ts = %s, last_log_id = %s, updated_at = NOW() WHERE name = %s",
+                (new_size, int(fetched[-1][0]), last[4], str(last[0]), _STATE_NAME),
+            )
+            conn.commit()
+            cur.close()
+            return len(rows)
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def catch_up(self, max_batches: int = 1000) -> int:
+        """Append until no unlogged entries remain past the watermark (or max_batches)."""
+        total = 0
+        for _ in range(max_batches):
+            n = self.run_once()
+            total += n
+            if n < self._batch_size:
+                break
+        return total
+
+    # ── reading ──
+
+    def _read(self, fn: Callable[[Any], Any], what: str) -> Any:
+        conn = None
+        try:
+            conn = self._conn_factory()
+            if conn is None:
+                return None
+            cur = conn.cursor()
+            try:
+                return fn(cur)
+            finally:
+                cur.close()
+        except Exception as exc:
+            logger.warning(f"[MerkleLog] {what} failed: {type(exc).__name__}: {exc}")
+            return None
+        finally:
+            if conn is not None:
+                try:
+                    conn.rollback()
+                    conn.close()
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _tree_head(cur, tree_size: Optional[int]) -> Optional[Dict[str, Any]]:
+        if tree_size is None:
+            cur.execute(
+                f"SELECT {_STH_COLUMNS} FROM transparency_tree_heads ORDER BY tree_size DESC LIMIT 1"
+            )
+        else:
+            cur.execute(
+                f"SELECT {_STH_COLUMNS} FROM transparency_tree_heads WHERE tree_size = %s",
+                (tree_size,),
+            )
+        row = cur.fetchone()
+        return _sth_row_to_dict(row) if row else None
+
+    def get_tree_head(self, tree_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Latest signed tree head, or the one for ``tree_size``."""
+        return self._read(lambda cur: self._tree_head(cur, tree_size), "get_tree_head")
+
+    def get_inclusion_proof(
+        self, receipt_id: str, tree_size: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compact inclusion proof for the earliest log entry of ``receipt_id``
+        against the latest STH (or the STH for ``tree_size``):
+
+            {leaf_index, tree_size, leaf_hash, leaf_input, audit_path,
+             root_hash, signed_tree_head, algorithm}
+
+        Returns {"status": "PENDING"} while the entry is not yet in a
+        signed tree, {"status": "NOT_LOGGED"} if it has no leaf, and None
+        if the log is unavailable.
+        """
+        def _proof(cur):
+            cur.execute(
+                "SELECT leaf_index, receipt_id, event_type, payload_hash, leaf_hash "
+                "FROM transparency_merkle_leaves WHERE receipt_id = %s "
+                "ORDER BY leaf_index LIMIT 1",
+                (receipt_id,),
+            )
+            leaf = cur.fetchone()
+            if not leaf:
+                return {"status": "NOT_LOGGED", "receipt_id": receipt_id}
+            index, rid, event_type, payload_hash, lh = leaf
+            sth = self._tree_head(cur, tree_size)
+            if sth is None or sth["tree_size"] <= int(index):
+                return {"status": "PENDING", "receipt_id": rid, "leaf_index": int(index)}
+            size = sth["tree_size"]
+            ranges = inclusion_ranges(int(index), size)
+            nodes = self._fetch_nodes(cur, (k for a, b in ranges for k in subtree_nodes(a, b)))
+            path = [fold_range(a, b, nodes.__getitem__) for a, b in ranges]
+            return {
+                "status": "INCLUDED",
+                "algorithm": HASH_ALGORITHM,
+                "leaf_index": int(index),
+                "tree_size": size,
+                "leaf_hash": lh,
+                "leaf_input": {"receipt_id": rid, "event_type": event_type, "payload_hash": payload_hash},
+                "audit_path": path,
+                "root_hash": sth["root_hash"],
+                "signed_tree_head": sth,
+            }
+        return self._read(_proof, "get_inclusion_proof")
+
+    def get_consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Proof that the tree of ``new_size`` (default: latest STH) is an
+        append-only extension of the tree of ``old_size``.
+        """
+        def _proof(cur):
+            new_sth = self._tree_head(cur, new_size)
+            if new_sth is None or not 0 < old_size <= new_sth["tree_size"]:
+                return None
+            size = new_sth["tree_size"]
+            ranges = consistency_ranges(old_size, size) if old_size < size else []
+            keys = [k for a, b in ranges for k in subtree_nodes(a, b)]
+            keys += subtree_nodes(0, old_size)
+            nodes = self._fetch_nodes(cur, keys)
+            return {
+                "algorithm": HASH_ALGORITHM,
+                "old_size": old_size,
+                "new_size": size,
+                "old_root": fold_range(0, old_size, nodes.__getitem__),
+                "new_root": new_sth["root_hash"],
+                "proof": [fold_range(a, b, nodes.__getitem__) for a, b in ranges],
+                "signed_tree_head": new_sth,
+            }
+        return self._read(_proof, "get_consistency_proof")
+
+
+# ── Process-level builder loop ────────────────────────────────────────────────
+
+_loop_lock = threading.Lock()
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid: Optional[int] = None
+
+
+def start_merkle_loop(
+    conn_factory: Optional[Callable[[], Any]] = None,
+    interval_s: float = _BUILDER_INTERVAL_S,
+) -> Optional[threading.Thread]:
+    """
+    Start the tree-building loop once per process (restarted after fork).
+    Concurrent builders in other processes serialise on the state row.
+    Disabled with OMNIX_MERKLE_LOG_ENABLED=false.
+    """
+    global _loop_thread, _loop_pid
+    if os.environ.get("OMNIX_MERKLE_LOG_ENABLED", "true").strip().lower() == "false":
+        return None
+    with _loop_lock:
+        if _loop_thread is not None and _loop_thread.is_alive() and _loop_pid == os.getpid():
+            return _loop_thread
+        log = MerkleTransparencyLog(conn_factory)
+
+        def _loop():
+            while True:
+                try:
+                    n = log.catch_up()
+                    if n:
+                        logger.debug(f"[MerkleLog] appended {n} leaves")
+                except Exception as exc:
+                    logger.warning(f"[MerkleLog] build cycle failed: {type(exc).__name__}: {exc}")
+                time.sleep(interval_s)
+
+        _loop_thread = threading.Thread(target=_loop, name="MerkleLog", daemon=True)
+        _loop_pid = os.getpid()
+        _loop_thread.start()
+        return _loop_thread
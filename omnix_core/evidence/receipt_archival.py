@@ -35,6 +35,13 @@ COLD_STORAGE_REQUIRED
   OMNIX_COLD_STORAGE_REQUIRED=true  → fail hard if no S3/R2 credentials
   OMNIX_COLD_STORAGE_REQUIRED=false → PostgreSQL fallback (dev/staging only)
 
+Bulk mode
+─────────
+  OMNIX_ARCHIVAL_BULK=true (default) routes archive_hot_to_warm and
+  archive_warm_to_cold through bulk_archival.BulkReceiptArchiver, which moves
+  whole chunks per transaction and packs COLD receipts many-per-object.
+  OMNIX_ARCHIVAL_BULK=false keeps the per-receipt protocol below.
+
 ADR-126  /  MiFID II Article 25 — 5-year retention
 """
 from __future__ import annotations
@@ -47,6 +54,8 @@ import time
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from omnix_core.evidence.receipt_locator import get_receipt_locator
+
 logger = logging.getLogger("OMNIX.ReceiptArchival")
 
 # ── Table names ────────────────────────────────────────────────────────────────
@@ -54,6 +63,9 @@ HOT_TABLE   = "decision_receipts"
 WARM_TABLE  = "decision_receipts_warm"
 COLD_TABLE  = "decision_receipts_cold"   # PostgreSQL fallback only
 INDEX_TABLE = "receipt_archival_index"
+PROGRESS_TABLE = "receipt_archival_progress"   # bulk archival checkpoints
+
+_LOOKUP_BATCH = 1000   # receipt_ids per IN (...) in batch retrieval
 
 # ── Retention thresholds ───────────────────────────────────────────────────────
 HOT_RETENTION_DAYS  = 30       # days before moving HOT → WARM
@@ -82,6 +94,20 @@ _HOT_COLUMNS: Tuple[str, ...] = (
     "processing_time_ms",
 )
 
+# ── Packed COLD objects (bulk archival) ───────────────────────────────────────
+PACK_LOCATION_PREFIX = "pack::"
+
+
+def pack_location(key: str, offset: int, length: int) -> str:
+    """storage_location of one receipt inside a packed COLD object."""
+    return f"{PACK_LOCATION_PREFIX}{key}::{offset}::{length}"
+
+
+def parse_pack_location(location: str) -> Tuple[str, int, int]:
+    """Inverse of pack_location → (object key, byte offset, byte length)."""
+    key, offset, length = location[len(PACK_LOCATION_PREFIX):].rsplit("::", 2)
+    return key, int(offset), int(length)
+
 # ── Archival status lifecycle ──────────────────────────────────────────────────
 STATUS_PENDING  = "PENDING"
 STATUS_COPYING  = "COPYING"
@@ -184,10 +210,11 @@ def _verify_pqc_signature(receipt: Dict) -> Optional[bool]:
 
 def _get_db_connection(db_url: str):
     try:
-        import psycopg
-        # FIX-3: connect_timeout=10 prevents the archival daemon from blocking
-        # indefinitely on a slow or unreachable PostgreSQL host.
-        return psycopg.connect(db_url, connect_timeout=10)
+        from omnix_services.database_service.connection_provider import get_connection
+        # FIX-3: the provider's connect_timeout prevents the archival daemon from
+        # blocking indefinitely on a slow or unreachable PostgreSQL host. Pooled
+        # ("archival" subsystem, long statement_timeout); conn.close() returns it.
+        return get_connection("archival", db_url)
     except Exception as exc:
         logger.error("[Archival] DB connection failed: %s", exc)
         return None
@@ -218,6 +245,11 @@ class S3ColdBackend:
             "archival_service": "OMNIX-ReceiptArchival-ADR126"
           }
         }
+
+    Bulk archival packs many envelopes into one JSON-lines object:
+        receipts/packs/{year}/{month}/{pack_sha256[:32]}.jsonl
+        receipts/packs/{year}/{month}/{pack_sha256[:32]}.jsonl.index.json
+    and records each receipt as pack::{key}::{offset}::{length}.
     """
 
     def __init__(
@@ -252,6 +284,26 @@ class S3ColdBackend:
         hash_prefix = (content_hash or "00000000")[:8]
         return f"receipts/{year}/{month}/{hash_prefix}/{receipt_id}.json"
 
+    @staticmethod
+    def encode_record(receipt_dict: Dict, archived_at: str) -> bytes:
+        """Serialize one receipt into the stored envelope (single object or pack line)."""
+        return json.dumps(
+            {
+                "receipt": _serialize_receipt(receipt_dict),
+                "metadata": {
+                    "archived_at":      archived_at,
+                    "tier":             "cold",
+                    "hash":             receipt_dict.get("content_hash", ""),
+                    "signature":        receipt_dict.get("signature"),
+                    "version":          "v1",
+                    "immutable":        True,
+                    "archival_service": "OMNIX-ReceiptArchival-ADR126",
+                },
+            },
+            sort_keys=True,
+            ensure_ascii=True,
+        ).encode("utf-8")
+
     def put(self, receipt_dict: Dict, archived_at: str) -> str:
         """
         Store receipt in cold storage. No-overwrite enforced via head_object check.
@@ -282,22 +334,7 @@ class S3ColdBackend:
             if exc.response["Error"]["Code"] != "404":
                 raise
 
-        body = json.dumps(
-            {
-                "receipt": _serialize_receipt(receipt_dict),
-                "metadata": {
-                    "archived_at":      archived_at,
-                    "tier":             "cold",
-                    "hash":             content_hash,
-                    "signature":        receipt_dict.get("signature"),
-                    "version":          "v1",
-                    "immutable":        True,
-                    "archival_service": "OMNIX-ReceiptArchival-ADR126",
-                },
-            },
-            sort_keys=True,
-            ensure_ascii=True,
-        ).encode("utf-8")
+        body = self.encode_record(receipt_dict, archived_at)
 
         self._client.put_object(
             Bucket=self.bucket,
@@ -315,7 +352,9 @@ class S3ColdBackend:
         return key
 
     def get(self, storage_location: str) -> Optional[Dict]:
-        """Fetch and parse a receipt from cold storage by object key."""
+        """Fetch and parse a receipt from cold storage by object key or pack location."""
+        if storage_location.startswith(PACK_LOCATION_PREFIX):
+            return self._get_packed(storage_location)
         from botocore.exceptions import ClientError
         try:
             resp = self._client.get_object(Bucket=self.bucket, Key=storage_location)
@@ -336,6 +375,148 @@ class S3ColdBackend:
         except ClientError:
             return False
 
+    # ── Packed objects (bulk WARM → COLD) ─────────────────────────────────────
+
+    def _make_pack_key(self, pack_sha256: str, ts_utc: Any) -> str:
+        sample = self._make_key("PACK", "", ts_utc)
+        year, month = sample.split("/")[1:3]
+        return f"receipts/packs/{year}/{month}/{pack_sha256[:32]}.jsonl"
+
+    def _get_packed(self, storage_location: str) -> Optional[Dict]:
+        """Ranged read of one envelope out of a pack (see pack_location)."""
+        from botocore.exceptions import ClientError
+        key, offset, length = parse_pack_location(storage_location)
+        try:
+            resp = self._client.get_object(
+                Bucket=self.bucket, Key=key,
+                Range=f"bytes={offset}-{offset + length - 1}",
+            )
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "NoSuchKey":
+                return None
+            raise
+        body = json.loads(resp["Body"].read().decode("utf-8"))
+        receipt = body.get("receipt")
+        stored_hash = body.get("metadata", {}).get("hash")
+        if receipt is not None and stored_hash != receipt.get("content_hash"):
+            raise ArchivalIntegrityError(
+                f"Pack record hash mismatch location={storage_location}"
+            )
+        return receipt
+
+    def put_pack(
+        self,
+        records: List[Tuple[str, str, bytes]],
+        ts_utc: Any,
+        part_size: int,
+    ) -> List[str]:
+        """
+        Store many encoded receipts as one JSON-lines object.
+
+        records: (receipt_id, content_hash, encode_record(...)) in pack order.
+        Returns one pack_location per record, in the same order.
+
+        The key is derived from the SHA-256 of the pack body, so a pack can
+        never be overwritten with different content; an existing object with
+        the same key is accepted only if its pack_sha256 metadata matches.
+        Bodies larger than part_size go through multipart upload.  A
+        ``<key>.index.json`` sidecar carries the offset index so a pack can be
+        audited without the PostgreSQL archival_index.
+        """
+        from botocore.exceptions import ClientError
+
+        offsets: List[Tuple[int, int]] = []
+        chunks: List[bytes] = []
+        pos = 0
+        for _, _, blob in records:
+            offsets.append((pos, len(blob)))
+            chunks.append(blob)
+            chunks.append(b"\n")
+            pos += len(blob) + 1
+        body = b"".join(chunks)
+        pack_sha256 = hashlib.sha256(body).hexdigest()
+        key = self._make_pack_key(pack_sha256, ts_utc)
+        metadata = {
+            "pack_sha256":   pack_sha256,
+            "receipt_count": str(len(records)),
+            "tier":          "cold",
+        }
+
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=key)
+            logger.info("[COLD] Idempotent: pack already in cold storage key=%s", key)
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] != "404":
+                raise
+            if len(body) > part_size:
+                self._multipart_put(key, body, part_size, metadata)
+            else:
+                self._client.put_object(
+                    Bucket=self.bucket, Key=key, Body=body,
+                    ContentType="application/x-ndjson", Metadata=metadata,
+                )
+
+        if not self.verify_pack(key, pack_sha256, len(body)):
+            raise ArchivalIntegrityError(
+                f"Pack verification failed key={key} sha256={pack_sha256}"
+            )
+
+        index = {
+            "pack_key":    key,
+            "pack_sha256": pack_sha256,
+            "records": [
+                {"receipt_id": rid, "content_hash": ch, "offset": off, "length": ln}
+                for (rid, ch, _), (off, ln) in zip(records, offsets)
+            ],
+        }
+        self._client.put_object(
+            Bucket=self.bucket, Key=f"{key}.index.json",
+            Body=json.dumps(index, sort_keys=True).encode("utf-8"),
+            ContentType="application/json", Metadata={"pack_sha256": pack_sha256},
+        )
+        logger.info("[COLD] Stored pack key=%s receipts=%d bytes=%d",
+                    key, len(records), len(body))
+        return [pack_location(key, off, ln) for off, ln in offsets]
+
+    def _multipart_put(self, key: str, body: bytes, part_size: int, metadata: Dict) -> None:
+        upload = self._client.create_multipart_upload(
+            Bucket=self.bucket, Key=key,
+            ContentType="application/x-ndjson", Metadata=metadata,
+        )
+        upload_id = upload["UploadId"]
+        parts = []
+        try:
+            for number, start in enumerate(range(0, len(body), part_size), start=1):
+                resp = self._client.upload_part(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id,
+                    PartNumber=number, Body=body[start:start + part_size],
+                )
+                parts.append({"ETag": resp["ETag"], "PartNumber": number})
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id,
+                )
+            except Exception:
+                pass
+            raise
+
+    def verify_pack(self, key: str, pack_sha256: str, length: int) -> bool:
+        """Re-verify a pack exists with the expected digest metadata and size."""
+        from botocore.exceptions import ClientError
+        try:
+            resp = self._client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError:
+            return False
+        return (
+            resp.get("Metadata", {}).get("pack_sha256") == pack_sha256
+            and int(resp.get("ContentLength", length)) == length
+        )
+
 
 class PostgreSQLColdBackend:
     """
@@ -418,6 +599,10 @@ class ReceiptArchivalService:
         self._cold_required: bool = (
             os.environ.get("OMNIX_COLD_STORAGE_REQUIRED", "false").lower() == "true"
         )
+        self._locator = get_receipt_locator()
+        self.bulk: bool = (
+            os.environ.get("OMNIX_ARCHIVAL_BULK", "true").lower() == "true"
+        )
         self._warn_production_cold_flag()
 
     def _warn_production_cold_flag(self) -> None:
@@ -594,11 +779,24 @@ class ReceiptArchivalService:
                 ON {INDEX_TABLE}(archival_status)
             """)
 
+            # Bulk archival keyset checkpoints — one row per job
+            cur.execute(f"""
+                CREATE TABLE IF NOT EXISTS {PROGRESS_TABLE} (
+                    job           VARCHAR(32)  PRIMARY KEY,
+                    cursor_ts     TIMESTAMPTZ,
+                    cursor_id     VARCHAR(64),
+                    archived      BIGINT       NOT NULL DEFAULT 0,
+                    errors        BIGINT       NOT NULL DEFAULT 0,
+                    passes        BIGINT       NOT NULL DEFAULT 0,
+                    updated_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW()
+                )
+            """)
+
             conn.commit()
             cur.close()
             logger.info(
-                "[Archival] Schema OK — %s, %s, %s, %s",
-                WARM_TABLE, COLD_TABLE, INDEX_TABLE, HOT_TABLE,
+                "[Archival] Schema OK — %s, %s, %s, %s, %s",
+                WARM_TABLE, COLD_TABLE, INDEX_TABLE, PROGRESS_TABLE, HOT_TABLE,
             )
             return True
         except Exception as exc:
@@ -806,6 +1004,10 @@ class ReceiptArchivalService:
         Move all HOT receipts older than HOT_RETENTION_DAYS to WARM.
         Returns (archived_count, error_count).
         """
+        if self.bulk:
+            from omnix_core.evidence.bulk_archival import BulkReceiptArchiver
+            return BulkReceiptArchiver(self).archive_hot_to_warm(conn)
+
         cur = conn.cursor()
         cur.execute(
             f"""
@@ -967,6 +1169,10 @@ class ReceiptArchivalService:
         Move all WARM receipts older than WARM_RETENTION_DAYS to COLD.
         Returns (archived_count, error_count).
         """
+        if self.bulk:
+            from omnix_core.evidence.bulk_archival import BulkReceiptArchiver
+            return BulkReceiptArchiver(self).archive_warm_to_cold(conn)
+
         cur = conn.cursor()
         cur.execute(
             f"""
@@ -1004,6 +1210,48 @@ class ReceiptArchivalService:
 
     # ── Unified retrieval ──────────────────────────────────────────────────────
 
+    def _fetch_rows(self, conn, table: str, receipt_ids: List[str]) -> Dict[str, Dict]:
+        """receipt_id → row for the ids present in a PostgreSQL tier table."""
+        col_list = ", ".join(_HOT_COLUMNS)
+        found: Dict[str, Dict] = {}
+        cur = conn.cursor()
+        try:
+            for start in range(0, len(receipt_ids), _LOOKUP_BATCH):
+                batch = receipt_ids[start:start + _LOOKUP_BATCH]
+                cur.execute(
+                    f"SELECT {col_list} FROM {table} "
+                    f"WHERE receipt_id IN ({', '.join(['%s'] * len(batch))})",
+                    batch,
+                )
+                for row in cur.fetchall():
+                    found[row[0]] = dict(zip(_HOT_COLUMNS, row))
+        finally:
+            cur.close()
+        return found
+
+    def _fetch_cold(self, conn, storage_location: str) -> Optional[Dict]:
+        """COLD fetch through the process-wide decoded-receipt cache."""
+        cached = self._locator.cold.get(storage_location)
+        if cached is not None:
+            return dict(cached)
+        cold_backend = self._get_cold_backend()
+        if isinstance(cold_backend, S3ColdBackend):
+            receipt = cold_backend.get(storage_location)
+        else:
+            receipt = cold_backend.get(storage_location, conn)
+        if receipt is not None:
+            self._locator.cold.put(storage_location, dict(receipt))
+        return receipt
+
+    def _fetch_from_tier(
+        self, conn, rid: str, tier: str, location: Optional[str]
+    ) -> Optional[Dict]:
+        """Fetch rid from a remembered tier; None if it is not (or no longer) there."""
+        if tier == TIER_COLD:
+            return self._fetch_cold(conn, location) if location else None
+        table = HOT_TABLE if tier == TIER_HOT else WARM_TABLE
+        return self._fetch_rows(conn, table, [rid]).get(rid)
+
     def fetch_receipt_any_tier(
         self,
         conn,
@@ -1014,12 +1262,26 @@ class ReceiptArchivalService:
 
         Returns (receipt_dict, tier) or (None, None) if not found.
 
+        0. Locator: a remembered (tier, location) goes straight to that tier;
+           an ID the Bloom filter has never seen returns without a query.
         1. Fast path: check HOT table directly.
         2. Check archival_index for tier + storage_location.
         3. Fetch from WARM or COLD accordingly.
         """
         col_list = ", ".join(_HOT_COLUMNS)
         rid = receipt_id.strip().upper()
+        locator = self._locator
+
+        # 0. Locator caches
+        remembered = locator.location(rid)
+        if remembered:
+            tier, location = remembered
+            receipt = self._fetch_from_tier(conn, rid, tier, location)
+            if receipt is not None:
+                return receipt, tier
+            locator.forget(rid)   # moved by archival since it was cached
+        if not locator.might_exist(conn, rid):
+            return None, None
 
         cur = conn.cursor()
 
@@ -1031,6 +1293,7 @@ class ReceiptArchivalService:
         row = cur.fetchone()
         if row:
             cur.close()
+            locator.remember(rid, TIER_HOT)
             return dict(zip(_HOT_COLUMNS, row)), TIER_HOT
 
         # 2. Lookup archival_index
@@ -1059,20 +1322,106 @@ class ReceiptArchivalService:
             row = cur2.fetchone()
             cur2.close()
             if row:
+                locator.remember(rid, TIER_WARM)
                 return dict(zip(_HOT_COLUMNS, row)), TIER_WARM
             return None, None
 
         if tier == TIER_COLD:
-            cold_backend = self._get_cold_backend()
-            if isinstance(cold_backend, S3ColdBackend):
-                receipt = cold_backend.get(location)
-                return receipt, TIER_COLD
-            else:
-                receipt = cold_backend.get(location, conn)
-                return receipt, TIER_COLD
+            receipt = self._fetch_cold(conn, location)
+            if receipt is not None:
+                locator.remember(rid, TIER_COLD, location)
+            return receipt, TIER_COLD
 
         return None, None
 
+    def fetch_receipts_any_tier(
+        self,
+        conn,
+        receipt_ids: List[str],
+    ) -> Dict[str, Tuple[Optional[Dict], Optional[str]]]:
+        """
+        Batch form of fetch_receipt_any_tier, grouped by tier.
+
+        Returns {normalized receipt_id: (receipt_dict, tier)}, with
+        (None, None) for IDs found nowhere.  Bloom rejections share one
+        top-up query; remembered WARM / COLD IDs are fetched from their tier
+        directly; all others take one HOT query, one archival_index query and one WARM
+        query per batch of _LOOKUP_BATCH IDs.
+        """
+        ids = list(dict.fromkeys(r.strip().upper() for r in receipt_ids if r and r.strip()))
+        results: Dict[str, Tuple[Optional[Dict], Optional[str]]] = {
+            rid: (None, None) for rid in ids
+        }
+        locator = self._locator
+        started = time.monotonic()
+
+        def resolve(rid: str, receipt: Optional[Dict], tier: str, location=None) -> bool:
+            if receipt is None:
+                return False
+            results[rid] = (receipt, tier)
+            locator.remember(rid, tier, location)
+            return True
+
+        # 0. Bloom rejections and remembered WARM / COLD tiers
+        unresolved: List[str] = []
+        remembered_warm: List[str] = []
+        for rid in ids:
+            if not locator.might_exist(conn, rid, started):
+                continue
+            remembered = locator.location(rid)
+            if remembered and remembered[0] == TIER_WARM:
+                remembered_warm.append(rid)
+            elif remembered and remembered[0] == TIER_COLD and remembered[1]:
+                if not resolve(rid, self._fetch_cold(conn, remembered[1]), TIER_COLD, remembered[1]):
+                    locator.forget(rid)
+                    unresolved.append(rid)
+            else:
+                unresolved.append(rid)
+        if remembered_warm:
+            rows = self._fetch_rows(conn, WARM_TABLE, remembered_warm)
+            for rid in remembered_warm:
+                if not resolve(rid, rows.get(rid), TIER_WARM):
+                    locator.forget(rid)
+                    unresolved.append(rid)
+
+        # 1. HOT
+        if unresolved:
+            rows = self._fetch_rows(conn, HOT_TABLE, unresolved)
+            unresolved = [rid for rid in unresolved if not resolve(rid, rows.get(rid), TIER_HOT)]
+
+        # 2. archival_index, grouped by tier
+        by_tier: Dict[str, List[Tuple[str, str]]] = {TIER_WARM: [], TIER_COLD: []}
+        cur = conn.cursor()
+        try:
+            for start in range(0, len(unresolved), _LOOKUP_BATCH):
+                batch = unresolved[start:start + _LOOKUP_BATCH]
+                cur.execute(
+                    f"SELECT receipt_id, tier, storage_location FROM {INDEX_TABLE} "
+                    f"WHERE receipt_id IN ({', '.join(['%s'] * len(batch))})",
+                    batch,
+                )
+                for rid, tier, location in cur.fetchall():
+                    if tier in by_tier:
+                        by_tier[tier].append((rid, location))
+        finally:
+            cur.close()
+
+        # 3. WARM in one query, COLD through the decoded cache
+        if by_tier[TIER_WARM]:
+            rows = self._fetch_rows(conn, WARM_TABLE, [rid for rid, _ in by_tier[TIER_WARM]])
+            for rid, _ in by_tier[TIER_WARM]:
+                resolve(rid, rows.get(rid), TIER_WARM)
+        if by_tier[TIER_COLD]:
+            if isinstance(self._get_cold_backend(), PostgreSQLColdBackend):
+                rows = self._fetch_rows(conn, COLD_TABLE, [rid for rid, _ in by_tier[TIER_COLD]])
+                for rid, location in by_tier[TIER_COLD]:
+                    resolve(rid, rows.get(rid), TIER_COLD, location)
+            else:
+                for rid, location in by_tier[TIER_COLD]:
+                    resolve(rid, self._fetch_cold(conn, location), TIER_COLD, location)
+
+        return results
+
     # ── Full archival cycle ────────────────────────────────────────────────────
 
     def run_archival_cycle(self) -> Dict[str, Any]:
@@ -1100,6 +1449,7 @@ class ReceiptArchivalService:
             summary["warm_to_cold"] = {"archived": wc_archived, "errors": wc_errors}
 
             summary["cycle_ts"] = _now_iso()
+            summary["mode"] = "bulk" if self.bulk else "per_receipt"
             summary["cold_backend"] = (
                 "s3" if isinstance(self._cold_backend, S3ColdBackend)
                 else "postgres_fallback"
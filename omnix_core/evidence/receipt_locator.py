@@ -0,0 +1,356 @@
+"""
+OMNIX Receipt Locator — process-level lookup caches for tiered receipts (ADR-126)
+
+fetch_receipt_any_tier walks HOT → archival_index → WARM/COLD on every call,
+and ReceiptArchivalService is constructed per request, so nothing survives
+between lookups.  The locator keeps three process-wide structures:
+
+  locations   LRU  receipt_id → (tier, storage_location)
+              A hit goes straight to the owning tier.  Entries can go stale
+              when archival moves a receipt; a miss at the cached tier drops
+              the entry and the caller falls back to the full cascade.
+
+  cold        LRU  storage_location → decoded receipt
+              COLD objects are immutable and S3 GETs are the slowest path.
+
+  bloom       Bloom filter over every receipt_id in HOT ∪ archival_index.
+              A negative answer rejects unknown / mistyped IDs without any
+              query.  Archival never introduces new IDs, so only freshly
+              written HOT receipts can be missing from the filter — possibly
+              written by another worker a moment ago.  A negative is trusted
+              only after a top-up that started after the lookup did: one
+              indexed query for HOT rows created since the watermark (minus
+              an overlap for commit skew), shared by concurrent lookups and
+              by every ID of a batch.  A full rebuild (re-sized for the
+              current row count) runs from start_receipt_bloom_loop.  Until
+              the first build, or when a top-up fails, the filter answers
+              "maybe" for everything.
+
+Configuration
+─────────────
+  OMNIX_RECEIPT_LOCATION_CACHE     location LRU entries         (100000)
+  OMNIX_RECEIPT_COLD_CACHE         decoded COLD receipts        (512)
+  OMNIX_RECEIPT_BLOOM_ENABLED      build the filter             (true)
+  OMNIX_RECEIPT_BLOOM_FP_RATE      target false-positive rate   (0.001)
+  OMNIX_RECEIPT_BLOOM_REBUILD_S    full rebuild interval        (3600)
+
+ADR-126
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger("OMNIX.ReceiptArchival.Locator")
+
+_LOCATION_ENTRIES = int(os.environ.get("OMNIX_RECEIPT_LOCATION_CACHE", "100000"))
+_COLD_ENTRIES     = int(os.environ.get("OMNIX_RECEIPT_COLD_CACHE", "512"))
+_BLOOM_FP_RATE    = float(os.environ.get("OMNIX_RECEIPT_BLOOM_FP_RATE", "0.001"))
+_BLOOM_REBUILD_S  = float(os.environ.get("OMNIX_RECEIPT_BLOOM_REBUILD_S", "3600"))
+_BLOOM_OVERLAP    = timedelta(seconds=60)   # re-read window for late commits
+_BLOOM_HEADROOM   = 1.5                     # capacity over current row count
+_FETCH_BATCH      = 10000
+
+
+class _LRUCache:
+    """Thread-safe bounded LRU mapping."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, max_entries)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.max_entries or value is None:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ReceiptBloomFilter:
+    """
+    Fixed-size Bloom filter keyed by receipt_id.
+
+    Bit positions use double hashing over one BLAKE2b digest
+    (h1 + i·h2 mod m, Kirsch–Mitzenmacher), sized for ``capacity`` items
+    at ``fp_rate``.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = _BLOOM_FP_RATE):
+        capacity = max(1, capacity)
+        fp_rate = min(max(fp_rate, 1e-9), 0.5)
+        self.capacity = capacity
+        self.num_bits = max(64, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, receipt_id: str) -> Iterable[int]:
+        digest = hashlib.blake2b(receipt_id.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        m = self.num_bits
+        return ((h1 + i * h2) % m for i in range(self.num_hashes))
+
+    def add(self, receipt_id: str) -> None:
+        bits = self._bits
+        for pos in self._positions(receipt_id):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, receipt_id: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(receipt_id))
+
+
+class ReceiptLocator:
+    """Process-wide location / COLD caches and the negative Bloom filter."""
+
+    def __init__(
+        self,
+        location_entries: int = _LOCATION_ENTRIES,
+        cold_entries: int = _COLD_ENTRIES,
+        fp_rate: float = _BLOOM_FP_RATE,
+    ):
+        self.locations = _LRUCache(location_entries)
+        self.cold = _LRUCache(cold_entries)
+        self.fp_rate = fp_rate
+        self._bloom: Optional[ReceiptBloomFilter] = None
+        self._watermark: Any = None
+        self._refreshed_at = 0.0
+        self._bloom_lock = threading.Lock()
+        self.bloom_rejections = 0
+        self._pid = os.getpid()
+
+    # ── Location cache ─────────────────────────────────────────────────────────
+
+    def location(self, receipt_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        return self.locations.get(receipt_id)
+
+    def remember(self, receipt_id: str, tier: str, storage_location: Optional[str] = None) -> None:
+        self.locations.put(receipt_id, (tier, storage_location))
+        bloom = self._bloom
+        if bloom is not None:
+            bloom.add(receipt_id)
+
+    def forget(self, receipt_id: str) -> None:
+        self.locations.pop(receipt_id)
+
+    # ── Bloom filter ───────────────────────────────────────────────────────────
+
+    @property
+    def bloom_ready(self) -> bool:
+        return self._bloom is not None
+
+    def might_exist(self, conn, receipt_id: str, not_before: Optional[float] = None) -> bool:
+        """
+        False only when the filter is built and has not seen receipt_id even
+        after a top-up started at or after not_before (time.monotonic(),
+        default now).  Batch callers pass their start time so one top-up
+        covers every ID.  Never raises.
+        """
+        if not_before is None:
+            not_before = time.monotonic()
+        bloom = self._bloom
+        if bloom is None or receipt_id in bloom:
+            return True
+        if not self.top_up(conn, not_before):
+            return True
+        if receipt_id in self._bloom:
+            return True
+        self.bloom_rejections += 1
+        return False
+
+    def top_up(self, conn, not_before: float = 0.0) -> bool:
+        """
+        Add HOT receipts created since the watermark, unless a top-up has
+        already started at or after not_before.  Returns False on error.
+        """
+        with self._bloom_lock:
+            if self._refreshed_at >= not_before:
+                return True
+            bloom, since = self._bloom, self._watermark
+            if bloom is None:
+                return False
+            started = time.monotonic()
+            try:
+                cur = conn.cursor()
+                try:
+                    if since is None:
+                        cur.execute(
+                            "SELECT receipt_id, created_at FROM decision_receipts",
+                        )
+                    else:
+                        cur.execute(
+                            "SELECT receipt_id, created_at FROM decision_receipts "
+                            "WHERE created_at > %s",
+                            (since - _BLOOM_OVERLAP,),
+                        )
+                    watermark = self._add_rows(bloom, cur, since)
+                finally:
+                    cur.close()
+            except Exception as exc:
+                logger.warning("[Locator] Bloom top-up failed: %s: %s", type(exc).__name__, exc)
+                return False
+            self._watermark = watermark
+            self._refreshed_at = started
+            return True
+
+    def rebuild(self, conn) -> bool:
+        """
+        Build a fresh filter over HOT ∪ archival_index, sized for the current
+        row count, and swap it in.  Returns False on error (old filter kept).
+        """
+        try:
+            cur = conn.cursor()
+            try:
+                cur.execute(
+                    "SELECT (SELECT COUNT(*) FROM decision_receipts)"
+                    " + (SELECT COUNT(*) FROM receipt_archival_index)"
+                )
+                total = int((cur.fetchone() or (0,))[0] or 0)
+            finally:
+                cur.close()
+            bloom = ReceiptBloomFilter(int(total * _BLOOM_HEADROOM) + 1024, self.fp_rate)
+            started = time.monotonic()
+            try:
+                # Server-side cursor: stream IDs instead of materialising them.
+                cur = conn.cursor(name="omnix_receipt_bloom")
+            except TypeError:
+                cur = conn.cursor()
+            try:
+                cur.execute(
+                    "SELECT receipt_id, created_at FROM decision_receipts "
+                    "UNION ALL SELECT receipt_id, NULL FROM receipt_archival_index"
+                )
+                watermark = self._add_rows(bloom, cur, None)
+            finally:
+                cur.close()
+            conn.commit()
+        except Exception as exc:
+            logger.warning("[Locator] Bloom rebuild failed: %s: %s", type(exc).__name__, exc)
+            return False
+        with self._bloom_lock:
+            self._bloom = bloom
+            self._watermark = watermark
+            self._refreshed_at = started
+        logger.info("[Locator] Bloom filter rebuilt — ids=%d bits=%d hashes=%d",
+                    bloom.count, bloom.num_bits, bloom.num_hashes)
+        return True
+
+    @staticmethod
+    def _add_rows(bloom: ReceiptBloomFilter, cur, watermark: Any) -> Any:
+        while True:
+            rows = cur.fetchmany(_FETCH_BATCH)
+            if not rows:
+                return watermark
+            for receipt_id, created_at in rows:
+                bloom.add(str(receipt_id).strip().upper())
+                if created_at is not None and (watermark is None or created_at > watermark):
+                    watermark = created_at
+
+    def stats(self) -> Dict[str, Any]:
+        bloom = self._bloom
+        return {
+            "location_entries": len(self.locations),
+            "location_hits":    self.locations.hits,
+            "location_misses":  self.locations.misses,
+            "cold_entries":     len(self.cold),
+            "cold_hits":        self.cold.hits,
+            "bloom_ready":      bloom is not None,
+            "bloom_ids":        bloom.count if bloom else 0,
+            "bloom_rejections": self.bloom_rejections,
+        }
+
+
+_locator_instance: Optional[ReceiptLocator] = None
+_locator_init_lock = threading.Lock()
+
+
+def get_receipt_locator() -> ReceiptLocator:
+    """Process-level ReceiptLocator singleton, rebuilt after fork."""
+    global _locator_instance
+    locator = _locator_instance
+    if locator is None or locator._pid != os.getpid():
+        with _locator_init_lock:
+            locator = _locator_instance
+            if locator is None or locator._pid != os.getpid():
+                locator = ReceiptLocator()
+                _locator_instance = locator
+    return locator
+
+
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def start_receipt_bloom_loop(
+    conn_factory: Callable[[], Any],
+    interval_s: float = _BLOOM_REBUILD_S,
+) -> Optional[threading.Thread]:
+    """
+    Rebuild the negative Bloom filter now and every interval_s, once per
+    process (restarted after fork).  Disabled with OMNIX_RECEIPT_BLOOM_ENABLED=false.
+    """
+    global _loop_thread, _loop_pid
+    if os.environ.get("OMNIX_RECEIPT_BLOOM_ENABLED", "true").strip().lower() == "false":
+        return None
+    with _loop_lock:
+        if _loop_thread is not None and _loop_thread.is_alive() and _loop_pid == os.getpid():
+            return _loop_thread
+
+        def _loop():
+            while True:
+                conn = None
+                try:
+                    conn = conn_factory()
+                    if conn is not None:
+                        get_receipt_locator().rebuild(conn)
+                except Exception as exc:
+                    logger.warning(f"[Locator] rebuild cycle failed: {type(exc).__name__}: {exc}")
+                finally:
+                    if conn is not None:
+                        try:
+                            conn.close()
+                        except Exception:
+                            pass
+                time.sleep(interval_s)
+
+        _loop_thread = threading.Thread(target=_loop, name="ReceiptBloom", daemon=True)
+        _loop_pid = os.getpid()
+        _loop_thread.start()
+        return _loop_thread
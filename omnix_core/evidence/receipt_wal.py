@@ -11,15 +11,60 @@ Problem (ISR-012):
 Solution:
   A lightweight, file-backed WAL that:
     1. Receives a receipt BEFORE the DB write attempt.
-    2. If DB write succeeds → WAL entry is deleted (committed).
-    3. If DB write fails → entry stays in WAL.
+    2. If DB write succeeds → WAL entry is marked committed.
+    3. If DB write fails → entry stays live in the WAL.
     4. On startup and periodically → reconcile_wal(store_fn) drains
        the WAL into the DB, guaranteeing eventual persistence.
 
-WAL format: JSON Lines (one receipt dict per line).
+Segmented layout:
+  Each ReceiptWAL instance (one per process) writes its own namespace of
+  append-only JSONL segment files next to the configured path:
+
+      <wal_path>.<ns>.lock         ← flock held for the writer's lifetime
+      <wal_path>.<ns>.00000001
+      <wal_path>.<ns>.00000002     ← active segment (append target)
+
+  <ns> is unique per instance (w<pid>-<random>), so gunicorn workers
+  sharing one OMNIX_WAL_PATH never append to, compact or unlink each
+  other's segments — the in-memory index of one process only ever
+  describes files that process owns.
+
+  Two record kinds are written:
+      {"_wal_id": ..., "_wal_ts": ..., "_committed": false, **receipt}
+      {"_wal_commit": "<wal_id>", "_wal_ts": ...}        ← tombstone
+
+  Nothing is ever rewritten in place. wal_commit() appends a tombstone,
+  so append and commit are both O(1) regardless of WAL size. An in-memory
+  index (wal_id → segment) is rebuilt from the segments on startup and
+  answers wal_size() without touching disk.
+
+  Segments roll after _SEGMENT_MAX_RECORDS records. Sealed segments are
+  reclaimed oldest first: deleted once every entry in them is committed,
+  or compacted when mostly committed (live entries are re-appended to the
+  active segment, then the old file is unlinked).
+
+Startup recovery (adoption):
+  A new instance scans every namespace under <wal_path>. A namespace whose
+  lock can be taken belongs to a dead process: its live entries are
+  re-appended (same _wal_id) to the new instance's active segment, fsynced,
+  and the orphaned segments and lock file are unlinked. Namespaces whose
+  lock is held belong to a live worker and are left alone. A crash between
+  re-append and unlink only duplicates entries; reconcile_wal()'s store_fn
+  is idempotent (ON CONFLICT DO NOTHING).
+
+  Pre-namespace layouts — the single-file WAL at <wal_path> and segments
+  named <wal_path>.NNNNNNNN — are adopted the same way under <wal_path>.lock.
+
+Durability (group commit):
+  Writers append + flush under the WAL lock, then wait for fsync outside
+  it. One thread performs the fsync and every writer whose record was
+  flushed before it started is covered by the same call, so N concurrent
+  appends cost one fsync instead of N. Disable with OMNIX_WAL_FSYNC=false.
+
 Default path: $OMNIX_WAL_PATH or /tmp/omnix_receipt_wal.jsonl
 
-Thread safety: ReceiptWAL uses a threading.Lock for all file operations.
+Thread safety: all index and file-handle state is guarded by one
+threading.Lock held only for the in-memory update and buffered write.
 
 ISR-012 | ADR-148 | Author: Harold Nunes — OMNIX QUANTUM LTD
 """
@@ -33,37 +78,75 @@ import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: no cross-process adoption
+    fcntl = None
 
 logger = logging.getLogger("OMNIX.Evidence.ReceiptWAL")
 
 _DEFAULT_WAL_PATH = "/tmp/omnix_receipt_wal.jsonl"
 _WAL_MAX_ENTRIES  = 10_000   # safety ceiling — prevents unbounded growth
 
+_SEGMENT_MAX_RECORDS = int(os.environ.get("OMNIX_WAL_SEGMENT_RECORDS", "4096"))
+_COMPACT_LIVE_RATIO  = 0.25  # sealed segments at or below this live/record ratio are compacted
+_LEGACY_SEGMENT      = 0     # pre-segmentation single-file WAL
+_LEGACY_NAMESPACE    = ""    # pre-namespace layout (<wal_path>, <wal_path>.NNNNNNNN)
+_WAL_FSYNC_DEFAULT   = os.environ.get("OMNIX_WAL_FSYNC", "true").lower() not in ("0", "false", "no")
+
 
 class ReceiptWAL:
     """
     Write-Ahead Log for governance decision receipts.
 
     Guarantees that every evaluated governance decision has at least
-    one durable copy (WAL file) before the primary DB write is attempted.
+    one durable copy (WAL segment) before the primary DB write is attempted.
 
     Usage in store_receipt():
         wal = get_receipt_wal()
         wal_id = wal.wal_append(receipt)      # Step 1: WAL first
         ok = db_write(receipt)                # Step 2: DB write
         if ok:
-            wal.wal_commit(wal_id)            # Step 3: delete from WAL
+            wal.wal_commit(wal_id)            # Step 3: tombstone in WAL
         # If not ok → receipt survives in WAL for reconcile_wal()
 
     Recovery:
         wal.reconcile_wal(store_fn)           # drain WAL into DB
     """
 
-    def __init__(self, wal_path: Optional[str] = None):
+    def __init__(
+        self,
+        wal_path: Optional[str] = None,
+        segment_max_records: int = _SEGMENT_MAX_RECORDS,
+        fsync: bool = _WAL_FSYNC_DEFAULT,
+    ):
         self._path = Path(wal_path or os.environ.get("OMNIX_WAL_PATH", _DEFAULT_WAL_PATH))
         self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._segment_max_records = max(1, int(segment_max_records))
+        self._fsync = fsync
+        self._pid = os.getpid()
+        self._ns = f"w{self._pid}-{uuid.uuid4().hex[:8]}"
+        self._ns_lock: Optional[TextIO] = None
+
+        # In-memory live-entry index
+        self._live: Dict[str, int] = {}          # wal_id → segment seq
+        self._seg_live: Dict[int, int] = {}      # segment seq → live entries
+        self._seg_records: Dict[int, int] = {}   # segment seq → records written (entries + tombstones)
+
+        # Active segment
+        self._active_seq = 0
+        self._active_fh: Optional[TextIO] = None
+        self._active_records = 0
+
+        # Group-commit sequence numbers
+        self._written_lsn = 0
+        self._synced_lsn = 0
+
         self._ensure_dir()
+        self._recover()
 
     def _ensure_dir(self) -> None:
         try:
@@ -71,14 +154,279 @@ class ReceiptWAL:
         except Exception as exc:
             logger.warning(f"[WAL] Could not ensure WAL directory: {exc}")
 
+    # ── Segment helpers ────────────────────────────────────────────────────
+
+    def _segment_path(self, seq: int, ns: Optional[str] = None) -> Path:
+        ns = self._ns if ns is None else ns
+        if ns == _LEGACY_NAMESPACE:
+            if seq == _LEGACY_SEGMENT:
+                return self._path
+            return self._path.with_name(f"{self._path.name}.{seq:08d}")
+        return self._path.with_name(f"{self._path.name}.{ns}.{seq:08d}")
+
+    def _lock_path(self, ns: str) -> Path:
+        if ns == _LEGACY_NAMESPACE:
+            return self._path.with_name(f"{self._path.name}.lock")
+        return self._path.with_name(f"{self._path.name}.{ns}.lock")
+
+    def _namespaces(self) -> Dict[str, List[int]]:
+        """Return {namespace: segment seqs (oldest first)} for every writer on disk."""
+        found: Dict[str, List[int]] = {}
+        prefix = self._path.name + "."
+        try:
+            for p in self._path.parent.glob(prefix + "*"):
+                parts = p.name[len(prefix):].split(".")
+                if len(parts) == 1 and len(parts[0]) == 8 and parts[0].isdigit():
+                    found.setdefault(_LEGACY_NAMESPACE, []).append(int(parts[0]))
+                elif len(parts) == 2 and len(parts[1]) == 8 and parts[1].isdigit():
+                    found.setdefault(parts[0], []).append(int(parts[1]))
+                elif len(parts) == 2 and parts[1] == "lock":
+                    found.setdefault(parts[0], [])
+        except Exception as exc:
+            logger.warning(f"[WAL] Could not list WAL segments: {exc}")
+        try:
+            if self._path.exists() and self._path.stat().st_size > 0:
+                found.setdefault(_LEGACY_NAMESPACE, []).append(_LEGACY_SEGMENT)
+        except Exception:
+            pass
+        for seqs in found.values():
+            seqs.sort()
+        return found
+
+    def _try_lock(self, ns: str) -> Optional[TextIO]:
+        """Take the namespace flock without blocking; None if another writer holds it."""
+        try:
+            fh = self._lock_path(ns).open("a", encoding="utf-8")
+        except Exception as exc:
+            logger.warning(f"[WAL] Could not open WAL lock for ns={ns or 'legacy'}: {exc}")
+            return None
+        if fcntl is None:
+            if ns == self._ns:
+                return fh
+            fh.close()
+            return None
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fh
+        except OSError:
+            fh.close()
+            return None
+
+    @staticmethod
+    def _iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+        """Stream parsed records from one segment file."""
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except Exception as exc:
+                        logger.warning(f"[WAL] Corrupt WAL line skipped in {path.name}: {exc}")
+        except FileNotFoundError:
+            return
+
+    def _recover(self) -> None:
+        """
+        Take this instance's namespace and adopt the segments of dead writers.
+
+        Adopted live entries are re-appended to a fresh active segment, so
+        the in-memory index only ever describes files this process owns.
+        """
+        self._ns_lock = self._try_lock(self._ns)
+        self._active_seq = 1
+        adopted = 0
+        for ns, seqs in sorted(self._namespaces().items()):
+            if ns == self._ns:
+                continue
+            lock = self._try_lock(ns)
+            if lock is None:
+                continue                     # a live worker owns it
+            try:
+                adopted += self._adopt_locked(ns, seqs)
+            except Exception as exc:
+                logger.error(f"[WAL][ISR-012] Could not adopt WAL namespace {ns or 'legacy'}: {exc}")
+            finally:
+                lock.close()
+
+        if adopted:
+            logger.info(
+                f"[WAL][ISR-012] Recovered {adopted} pending entries "
+                f"from orphaned WAL segments into ns={self._ns}"
+            )
+
+    def _adopt_locked(self, ns: str, seqs: List[int]) -> int:
+        """Move the live entries of a dead writer's namespace into ours, then unlink it."""
+        live: Dict[str, Dict[str, Any]] = {}
+        for seq in seqs:
+            for rec in self._iter_records(self._segment_path(seq, ns)):
+                committed_id = rec.get("_wal_commit")
+                if committed_id:
+                    live.pop(committed_id, None)
+                    continue
+                wal_id = rec.get("_wal_id")
+                if wal_id:
+                    # Re-appended by compaction — the newest copy wins.
+                    live.pop(wal_id, None)
+                    live[wal_id] = rec
+        if live:
+            fh = self._open_active_locked()
+            for wal_id, rec in live.items():
+                if wal_id in self._live:
+                    continue                 # duplicate from an interrupted adoption
+                fh.write(json.dumps(rec, default=str) + "\n")
+                self._live[wal_id] = self._active_seq
+                self._seg_live[self._active_seq] += 1
+                self._seg_records[self._active_seq] += 1
+                self._active_records += 1
+                self._written_lsn += 1
+            fh.flush()
+            if self._fsync:
+                os.fsync(fh.fileno())
+            self._synced_lsn = self._written_lsn
+        for seq in seqs:
+            try:
+                self._segment_path(seq, ns).unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            self._lock_path(ns).unlink()
+        except FileNotFoundError:
+            pass
+        return len(live)
+
+    def _drop_segment(self, seq: int) -> None:
+        """Unlink a fully-committed segment and forget its counters."""
+        self._seg_live.pop(seq, None)
+        self._seg_records.pop(seq, None)
+        try:
+            self._segment_path(seq).unlink()
+            logger.debug(f"[WAL] Deleted fully-committed segment seq={seq}")
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logger.warning(f"[WAL] Could not delete segment seq={seq}: {exc}")
+
+    def _open_active_locked(self) -> TextIO:
+        if self._active_fh is None:
+            if self._ns_lock is None:
+                self._ns_lock = self._try_lock(self._ns)
+            self._active_fh = self._segment_path(self._active_seq).open("a", encoding="utf-8")
+            self._active_records = 0
+            self._seg_live.setdefault(self._active_seq, 0)
+            self._seg_records.setdefault(self._active_seq, 0)
+        return self._active_fh
+
+    def _write_locked(self, record: Dict[str, Any]) -> int:
+        """Append one record to the active segment. Returns its LSN."""
+        fh = self._open_active_locked()
+        fh.write(json.dumps(record, default=str) + "\n")
+        fh.flush()
+        self._seg_records[self._active_seq] += 1
+        self._active_records += 1
+        self._written_lsn += 1
+        lsn = self._written_lsn
+        if self._active_records >= self._segment_max_records:
+            self._roll_locked()
+        return lsn
+
+    def _roll_locked(self) -> None:
+        """Seal the active segment, start a new one, and compact sealed segments."""
+        fh = self._active_fh
+        if fh is not None:
+            try:
+                if self._fsync:
+                    os.fsync(fh.fileno())
+            finally:
+                fh.close()
+            # Everything written so far is now durable.
+            self._synced_lsn = self._written_lsn
+        self._active_fh = None
+        self._active_seq += 1
+        self._reclaim_locked()
+
+    def _reclaim_locked(self, compact: bool = True) -> None:
+        """
+        Delete or compact sealed segments, strictly oldest first.
+
+        Tombstones always live in the same or a later segment than the entry
+        they commit, so reclaiming in order never drops a tombstone whose
+        target is still on disk (which would resurrect it on restart).
+        The oldest segment is unlinked when fully committed; when it is
+        mostly committed its live entries are re-appended to the active
+        segment first.
+        """
+        while True:
+            sealed = [s for s in self._seg_live if s != self._active_seq]
+            if not sealed:
+                return
+            seq = min(sealed)
+            live = self._seg_live.get(seq, 0)
+            if live <= 0:
+                self._drop_segment(seq)
+                continue
+            total = self._seg_records.get(seq, 0)
+            if not compact or (total and live / total > _COMPACT_LIVE_RATIO):
+                return
+            self._compact_segment_locked(seq)
+
+    def _compact_segment_locked(self, seq: int) -> None:
+        """Re-append live entries of segment `seq` to the active segment, then unlink it."""
+        fh = self._open_active_locked()
+        moved = 0
+        for rec in self._iter_records(self._segment_path(seq)):
+            wal_id = rec.get("_wal_id")
+            if not wal_id or self._live.get(wal_id) != seq:
+                continue
+            fh.write(json.dumps(rec, default=str) + "\n")
+            self._live[wal_id] = self._active_seq
+            self._seg_live[self._active_seq] += 1
+            self._seg_records[self._active_seq] += 1
+            self._active_records += 1
+            self._written_lsn += 1
+            moved += 1
+        fh.flush()
+        if self._fsync:
+            os.fsync(fh.fileno())
+        self._synced_lsn = self._written_lsn
+        self._drop_segment(seq)
+        logger.debug(f"[WAL] Compacted segment seq={seq} ({moved} live entries moved)")
+
+    def _sync_to(self, lsn: int) -> None:
+        """
+        Group commit: make every record up to `lsn` durable.
+
+        Threads that arrive while another thread is inside fsync() block on
+        _sync_lock and usually find their record already covered.
+        """
+        if not self._fsync or self._synced_lsn >= lsn:
+            return
+        with self._sync_lock:
+            if self._synced_lsn >= lsn:
+                return
+            with self._lock:
+                fh = self._active_fh
+                target = self._written_lsn
+            if fh is None:
+                return
+            try:
+                os.fsync(fh.fileno())
+            except (OSError, ValueError):
+                # Segment was sealed concurrently; _roll_locked() fsynced it.
+                return
+            if target > self._synced_lsn:
+                self._synced_lsn = target
+
     # ── Write ──────────────────────────────────────────────────────────────
 
     def wal_append(self, receipt: Dict[str, Any]) -> str:
         """
         Append a receipt to the WAL before attempting DB write.
 
-        Returns a wal_id (UUID) that can be used to commit (delete)
-        the entry once the primary DB write succeeds.
+        Returns a wal_id (UUID) that can be used to commit the entry
+        once the primary DB write succeeds.
 
         Never raises — if WAL write fails, logs an error and returns
         an empty string (caller should proceed with DB write anyway).
@@ -92,7 +440,7 @@ class ReceiptWAL:
         }
         try:
             with self._lock:
-                size = self.wal_size()
+                size = len(self._live)
                 if size >= _WAL_MAX_ENTRIES:
                     logger.error(
                         f"[WAL][ISR-012] WAL ceiling reached ({size} entries). "
@@ -100,8 +448,18 @@ class ReceiptWAL:
                         f"Skipping WAL append for receipt={receipt.get('receipt_id', '?')}"
                     )
                     return ""
-                with self._path.open("a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry, default=str) + "\n")
+                # Index before writing: a segment roll inside _write_locked()
+                # must already see this entry as live in the sealed segment.
+                seq = self._active_seq
+                self._live[wal_id] = seq
+                self._seg_live[seq] = self._seg_live.get(seq, 0) + 1
+                try:
+                    lsn = self._write_locked(entry)
+                except Exception:
+                    self._live.pop(wal_id, None)
+                    self._seg_live[seq] = self._seg_live.get(seq, 1) - 1
+                    raise
+            self._sync_to(lsn)
             logger.debug(
                 f"[WAL][ISR-012] Appended receipt={receipt.get('receipt_id','?')} "
                 f"wal_id={wal_id}"
@@ -115,31 +473,29 @@ class ReceiptWAL:
         """
         Mark a WAL entry as committed (DB write succeeded).
 
-        Rewrites the WAL file excluding the committed entry.
-        Returns True if the entry was found and removed.
+        Appends a tombstone record — the segment file is never rewritten.
+        Returns True if the entry was live and is now committed.
+
+        The tombstone is not fsynced: losing it on crash only means the
+        receipt is re-offered to reconcile_wal(), whose store_fn is
+        idempotent (ON CONFLICT DO NOTHING).
         """
         if not wal_id:
             return False
         try:
             with self._lock:
-                if not self._path.exists():
+                seq = self._live.pop(wal_id, None)
+                if seq is None:
                     return False
-                lines = self._path.read_text(encoding="utf-8").splitlines()
-                new_lines = []
-                found = False
-                for line in lines:
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("_wal_id") == wal_id:
-                            found = True
-                            continue
-                        new_lines.append(line)
-                    except Exception:
-                        new_lines.append(line)
-                if found:
-                    self._path.write_text("\n".join(new_lines) + ("\n" if new_lines else ""), encoding="utf-8")
-                    logger.debug(f"[WAL][ISR-012] Committed wal_id={wal_id}")
-                return found
+                self._seg_live[seq] = self._seg_live.get(seq, 1) - 1
+                self._write_locked({
+                    "_wal_commit": wal_id,
+                    "_wal_ts":     datetime.now(timezone.utc).isoformat(),
+                })
+                if seq != self._active_seq and self._seg_live.get(seq, 0) <= 0:
+                    self._reclaim_locked(compact=False)
+            logger.debug(f"[WAL][ISR-012] Committed wal_id={wal_id}")
+            return True
         except Exception as exc:
             logger.error(f"[WAL][ISR-012] wal_commit failed: {exc}")
             return False
@@ -147,40 +503,47 @@ class ReceiptWAL:
     # ── Read ───────────────────────────────────────────────────────────────
 
     def wal_size(self) -> int:
-        """Return number of uncommitted entries in the WAL."""
-        try:
-            if not self._path.exists():
-                return 0
-            count = 0
-            with self._path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        count += 1
-            return count
-        except Exception:
-            return 0
+        """Return number of uncommitted entries in the WAL (O(1), in-memory index)."""
+        return len(self._live)
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream uncommitted WAL entries segment by segment (oldest segment
+        first; compacted entries appear in the segment they were moved to).
+
+        Memory is bounded by one record at a time; entries committed while
+        iterating are skipped.
+        """
+        with self._lock:
+            seqs = sorted(self._seg_live)
+            if self._active_fh is not None:
+                self._active_fh.flush()
+        for seq in seqs:
+            for rec in self._iter_records(self._segment_path(seq)):
+                wal_id = rec.get("_wal_id")
+                if wal_id and self._live.get(wal_id) == seq:
+                    yield rec
 
     def wal_entries(self) -> List[Dict[str, Any]]:
         """Return all uncommitted WAL entries (oldest first)."""
         try:
-            if not self._path.exists():
-                return []
-            entries = []
-            with self._path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entries.append(json.loads(line))
-                    except Exception as exc:
-                        logger.warning(f"[WAL] Corrupt WAL line skipped: {exc}")
-            return entries
+            return list(self.iter_entries())
         except Exception as exc:
             logger.error(f"[WAL] wal_entries read failed: {exc}")
             return []
 
+    def segment_stats(self) -> Dict[str, Any]:
+        """Return segment layout counters for health/ops endpoints."""
+        with self._lock:
+            return {
+                "namespace":      self._ns,
+                "pending":        len(self._live),
+                "segments":       len(self._seg_live),
+                "active_segment": self._active_seq,
+                "written_lsn":    self._written_lsn,
+                "synced_lsn":     self._synced_lsn,
+            }
+
     # ── Recovery ───────────────────────────────────────────────────────────
 
     def reconcile_wal(self, store_fn: Callable[[Dict[str, Any]], bool]) -> int:
@@ -188,21 +551,25 @@ class ReceiptWAL:
         Drain WAL into the primary DB by calling store_fn for each entry.
 
         store_fn should accept a receipt dict and return True on success.
-        Successfully committed entries are removed from the WAL.
+        Successfully stored entries are committed (tombstoned) in the WAL.
+        Segments are streamed, so reconciliation memory does not grow
+        with WAL size.
 
         Returns number of entries successfully reconciled.
 
         Call on startup and periodically (e.g. every 5 minutes) to ensure
         no receipts are permanently lost after DB outages.
         """
-        entries = self.wal_entries()
-        if not entries:
+        pending = self.wal_size()
+        if not pending:
             return 0
 
-        logger.info(f"[WAL][ISR-012] Reconciling {len(entries)} pending WAL entries...")
+        logger.info(f"[WAL][ISR-012] Reconciling {pending} pending WAL entries...")
         reconciled = 0
+        attempted = 0
 
-        for entry in entries:
+        for entry in self.iter_entries():
+            attempted += 1
             wal_id = entry.get("_wal_id", "")
             receipt = {k: v for k, v in entry.items() if not k.startswith("_")}
 
@@ -227,10 +594,41 @@ class ReceiptWAL:
                 )
 
         if reconciled:
-            logger.info(f"[WAL][ISR-012] Reconciliation complete: {reconciled}/{len(entries)} entries committed.")
+            logger.info(f"[WAL][ISR-012] Reconciliation complete: {reconciled}/{attempted} entries committed.")
 
         return reconciled
 
+    def close(self) -> None:
+        """
+        Flush, fsync and close the active segment, then release the namespace.
+
+        With entries still pending, the segments stay on disk and the next
+        instance adopts them; a fully committed namespace is removed.
+        """
+        with self._lock:
+            fh = self._active_fh
+            try:
+                if fh is not None:
+                    try:
+                        if self._fsync:
+                            os.fsync(fh.fileno())
+                    finally:
+                        fh.close()
+                        self._active_fh = None
+                        self._active_seq += 1
+                        self._synced_lsn = self._written_lsn
+                if not self._live:
+                    for seq in list(self._seg_live):
+                        self._drop_segment(seq)
+                    try:
+                        self._lock_path(self._ns).unlink()
+                    except FileNotFoundError:
+                        pass
+            finally:
+                if self._ns_lock is not None:
+                    self._ns_lock.close()
+                    self._ns_lock = None
+
     @property
     def wal_path(self) -> str:
         return str(self._path)
@@ -247,12 +645,14 @@ _wal_init_lock = threading.Lock()
 def get_receipt_wal() -> ReceiptWAL:
     """
     Return the process-level ReceiptWAL singleton.
-    Thread-safe double-checked locking.
+    Thread-safe double-checked locking; a forked worker gets its own
+    instance (and WAL namespace) instead of the parent's.
     """
     global _wal_instance
-    if _wal_instance is None:
+    wal = _wal_instance
+    if wal is None or wal._pid != os.getpid():
         with _wal_init_lock:
-            if _wal_instance is None:
+            if _wal_instance is None or _wal_instance._pid != os.getpid():
                 _wal_instance = ReceiptWAL()
                 logger.info(
                     f"[WAL][ISR-012] ReceiptWAL initialized — path={_wal_instance.wal_path} "
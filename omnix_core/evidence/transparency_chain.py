@@ -7,6 +7,7 @@ Implements:
   2. Append-only transparency log with verifiable hash chain
   3. Rolling Merkle-style root for chain integrity verification
   4. Public API data: GET /api/transparency/chain
+  5. RFC 6962 inclusion / consistency proofs (merkle_log.py)
 
 Every entry includes:
   - Payload hash of the decision receipt
@@ -24,21 +25,48 @@ Operational since: March 2026
 ADR: ADR-044
 """
 
+import atexit
 import hashlib
 import hmac
 import json
 import logging
 import os
+import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 
+from omnix_core.evidence.keyset_cursor import (
+    cursor_scope, decode_cursor, keyset_clause, keyset_order, split_page,
+)
+
 logger = logging.getLogger("OMNIX.Evidence.TransparencyChain")
 
 _chain_degraded: bool = False
 _STORE_RETRY_DELAYS: tuple = (0.1, 0.3, 0.9)
 
+_WRITER_BATCH_SIZE: int = int(os.environ.get("OMNIX_TLOG_BATCH_SIZE", "64"))
+_WRITER_FLUSH_INTERVAL_S: float = float(os.environ.get("OMNIX_TLOG_FLUSH_INTERVAL_S", "0.05"))
+_WRITER_APPEND_TIMEOUT_S: float = 10.0
+# pg_advisory_xact_lock key serialising chain appends across processes. Every
+# INSERT into the log holds it until commit, so the DB-assigned log_seq the
+# Merkle builder tails (merkle_log.py) becomes visible in order.
+_CHAIN_LOCK_ID: int = 440044001
+
+# Not covered by the entry signature: the timestamp token travels separately,
+# and the signature fields must drop out so a retried entry (still carrying
+# the previous attempt's signature) signs the same bytes a verifier rebuilds.
+_UNSIGNED_FIELDS = ("tst_token", "signing_provider", "signature_b64")
+
+_INSERT_COLUMNS = (
+    "log_id, receipt_id, symbol, event_type, "
+    "payload_hash, prev_log_hash, merkle_root, "
+    "signing_provider, signature_b64, key_id, key_version, ts_utc, chain_version"
+)
+
 
 def _sha256(data: str) -> str:
     return hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -69,9 +97,9 @@ class InternalTimestamp:
     NONCE_SIZE = 16
 
     @staticmethod
-    def create(payload_hash: str) -> Dict[str, Any]:
+    def create(payload_hash: str, at: Optional[datetime] = None) -> Dict[str, Any]:
         nonce = os.urandom(InternalTimestamp.NONCE_SIZE).hex()
-        ts    = datetime.now(timezone.utc).isoformat()
+        ts    = (at or datetime.now(timezone.utc)).isoformat()
         tst_data = {
             "version":      1,
             "hash_alg":     "SHA-256",
@@ -111,25 +139,40 @@ CREATE TABLE IF NOT EXISTS transparency_chain_pending (
     merkle_root  VARCHAR(64)  NOT NULL,
     signing_provider VARCHAR(32) NOT NULL DEFAULT 'none',
     signature_b64 TEXT,
+    key_id       VARCHAR(32),
+    key_version  VARCHAR(64),
     ts_utc       TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
     pending_reason TEXT        NOT NULL DEFAULT '',
     created_at   TIMESTAMPTZ  NOT NULL DEFAULT NOW()
 );
 """
 
+# Signing-key metadata (crypto_providers.SigningKey) stored with every entry
+_DDL_KEY_COLUMNS = (
+    "ALTER TABLE transparency_chain_pending ADD COLUMN IF NOT EXISTS key_id VARCHAR(32)",
+    "ALTER TABLE transparency_chain_pending ADD COLUMN IF NOT EXISTS key_version VARCHAR(64)",
+    "ALTER TABLE governance_transparency_log ADD COLUMN IF NOT EXISTS key_id VARCHAR(32)",
+    "ALTER TABLE governance_transparency_log ADD COLUMN IF NOT EXISTS key_version VARCHAR(64)",
+)
+_schema_ready_pid: Optional[int] = None
+
 
 class TransparencyChain:
     """
     Append-only transparency log for OMNIX governance receipts.
 
-    Each append:
-      1. Creates a trusted timestamp over the payload hash
-      2. Retrieves prev_log_hash from DB (last entry)
-      3. Computes new rolling Merkle root
+    Each append (one transaction, batched by TransparencyChainWriter):
+      1. Takes pg_advisory_xact_lock(_CHAIN_LOCK_ID) and re-reads the tip
+      2. Creates a trusted timestamp over the payload hash (strictly after the tip)
+      3. Takes prev_log_hash from that tip and computes the rolling Merkle root
       4. Signs the entry with the active crypto provider
       5. Inserts into governance_transparency_log (with retry + pending fallback)
 
-    ISR-013 durability: _store_entry retries 3× with exponential backoff.
+    The chain position is assigned inside the locked transaction, so every
+    thread and every gunicorn worker extends the single tip stored in the
+    DB — no process ever chains from its own cached copy of the tip.
+
+    ISR-013 durability: _store_entries retries 3× with exponential backoff.
     On all failures, falls back to transparency_chain_pending table.
     If that also fails, sets process-level _chain_degraded flag.
 
@@ -145,7 +188,9 @@ class TransparencyChain:
         self._ensure_pending_table()
 
     def _ensure_pending_table(self) -> None:
-        if not self._db_url:
+        """Create the pending table and key-metadata columns (once per process)."""
+        global _schema_ready_pid
+        if not self._db_url or _schema_ready_pid == os.getpid():
             return
         conn = self._get_conn()
         if not conn:
@@ -153,9 +198,12 @@ class TransparencyChain:
         try:
             cur = conn.cursor()
             cur.execute(_DDL_PENDING)
+            for ddl in _DDL_KEY_COLUMNS:
+                cur.execute(ddl)
             conn.commit()
             cur.close()
             conn.close()
+            _schema_ready_pid = os.getpid()
         except Exception as exc:
             logger.warning(f"[TransparencyChain] Could not create pending table: {exc}")
             try:
@@ -175,78 +223,86 @@ class TransparencyChain:
         Append a new entry to the transparency log.
         Returns the created log entry dict or None on failure.
         Never raises — failures are logged and swallowed.
+
+        Blocks until the entry's batch is flushed. Hot paths that do not
+        need the stored entry should call get_chain_writer().submit().
         """
+        if not self._db_url:
+            return None
         try:
-            prev_hash, prev_root = self._get_last_entry()
-            timestamp_token = InternalTimestamp.create(payload_hash)
-            merkle_root = compute_rolling_merkle_root(prev_root, payload_hash)
-
-            entry_content = {
-                "log_id":        f"TL-{uuid.uuid4().hex[:12].upper()}",
-                "receipt_id":    receipt_id,
-                "symbol":        symbol,
-                "event_type":    event_type,
-                "payload_hash":  payload_hash,
-                "prev_log_hash": prev_hash,
-                "merkle_root":   merkle_root,
-                "ts_utc":        timestamp_token["ts_utc"],
-                "tst_token":     timestamp_token,
-            }
-
-            signature_b64, provider_id = self._sign_entry(entry_content)
-            entry_content["signing_provider"] = provider_id
-            entry_content["signature_b64"]    = signature_b64
-
-            stored = self._store_entry(entry_content)
-            if stored:
-                logger.info(
-                    f"[TransparencyChain] Entry appended: {entry_content['log_id']} "
-                    f"receipt={receipt_id} symbol={symbol}"
-                )
-            return entry_content if stored else None
-
+            return get_chain_writer().submit(
+                receipt_id=receipt_id,
+                symbol=symbol,
+                decision=decision,
+                payload_hash=payload_hash,
+                event_type=event_type,
+                wait=True,
+            )
         except Exception as e:
             logger.error(f"[TransparencyChain] append failed (non-blocking): {e}")
             return None
 
-    def get_chain(self, symbol: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    def get_chain(
+        self, symbol: Optional[str] = None, limit: int = 20, cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Return recent transparency log entries, optionally filtered by symbol.
 
         ISR-022: Internally verifies chain integrity on every read.
         If chain breaks are detected, logs a WARNING.
         Returns entries newest-first (as before); integrity check uses oldest-first.
+
+        cursor: next_cursor from get_chain_page() — continue strictly after
+        that entry instead of from the tip.
+        """
+        return self.get_chain_page(symbol=symbol, limit=limit, cursor=cursor)["entries"]
+
+    def get_chain_page(
+        self, symbol: Optional[str] = None, limit: int = 20, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Keyset page of the transparency log, newest-first:
+          {"entries": [...], "next_cursor": str | None}
+
+        Pages on (ts_utc, log_id) rather than OFFSET, so walking the full
+        log costs one index range scan per page at any depth.
+        Raises InvalidCursor for a malformed or foreign cursor; every
+        other failure is logged and returns an empty page.
         """
+        scope = cursor_scope("tlog", symbol)
+        after = decode_cursor(cursor, scope) if cursor else None
+        empty: Dict[str, Any] = {"entries": [], "next_cursor": None}
         if not self._db_url:
-            return []
+            return empty
         conn = self._get_conn()
         if not conn:
-            return []
+            return empty
         try:
             cur = conn.cursor()
+            clauses, params = [], []
             if symbol:
-                cur.execute(f"""
-                    SELECT log_id, receipt_id, symbol, event_type,
-                           payload_hash, prev_log_hash, merkle_root,
-                           signing_provider, ts_utc, chain_version
-                    FROM {self.TABLE}
-                    WHERE symbol = %s
-                    ORDER BY ts_utc DESC
-                    LIMIT %s
-                """, (symbol, limit))
-            else:
-                cur.execute(f"""
-                    SELECT log_id, receipt_id, symbol, event_type,
-                           payload_hash, prev_log_hash, merkle_root,
-                           signing_provider, ts_utc, chain_version
-                    FROM {self.TABLE}
-                    ORDER BY ts_utc DESC
-                    LIMIT %s
-                """, (limit,))
+                clauses.append("symbol = %s")
+                params.append(symbol)
+            if after:
+                clauses.append(keyset_clause("ts_utc", "log_id"))
+                params.extend(after)
+            where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            cur.execute(f"""
+                SELECT log_id, receipt_id, symbol, event_type,
+                       payload_hash, prev_log_hash, merkle_root,
+                       signing_provider, ts_utc, chain_version
+                FROM {self.TABLE}
+                {where_sql}
+                ORDER BY {keyset_order("ts_utc", "log_id")}
+                LIMIT %s
+            """, tuple(params) + (limit + 1,))
             cols = [d[0] for d in cur.description]
             rows = [dict(zip(cols, r)) for r in cur.fetchall()]
             cur.close()
             conn.close()
+            rows, next_cursor = split_page(
+                rows, limit, lambda r: (r["ts_utc"], r["log_id"]), scope,
+            )
             for r in rows:
                 if r.get("ts_utc"):
                     r["ts_utc"] = r["ts_utc"].isoformat()
@@ -263,14 +319,14 @@ class TransparencyChain:
                         f"length={integrity['length']} symbol={symbol or 'ALL'}"
                     )
 
-            return rows
+            return {"entries": rows, "next_cursor": next_cursor}
         except Exception as e:
             logger.error(f"[TransparencyChain] get_chain failed: {e}")
             try:
                 conn.close()
             except Exception:
                 pass
-            return []
+            return empty
 
     def get_chain_with_integrity(
         self, symbol: Optional[str] = None, limit: int = 20,
@@ -350,47 +406,100 @@ class TransparencyChain:
             "breaks":  breaks,
         }
 
+    def get_inclusion_proof(
+        self, receipt_id: str, tree_size: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        O(log n) RFC 6962 inclusion proof for receipt_id's log entry against
+        a signed tree head. See MerkleTransparencyLog.get_inclusion_proof.
+        """
+        if not self._db_url:
+            return None
+        from omnix_core.evidence.merkle_log import MerkleTransparencyLog
+        return MerkleTransparencyLog(self._get_conn).get_inclusion_proof(receipt_id, tree_size)
+
+    def get_consistency_proof(
+        self, old_size: int, new_size: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        O(log n) RFC 6962 proof that tree new_size extends tree old_size.
+        See MerkleTransparencyLog.get_consistency_proof.
+        """
+        if not self._db_url:
+            return None
+        from omnix_core.evidence.merkle_log import MerkleTransparencyLog
+        return MerkleTransparencyLog(self._get_conn).get_consistency_proof(old_size, new_size)
 
     def _get_last_entry(self) -> tuple:
         """Returns (prev_payload_hash, prev_merkle_root) from the last log entry."""
         if not self._db_url:
             return "", ""
-        conn = self._get_conn()
-        if not conn:
-            return "", ""
         try:
-            cur = conn.cursor()
-            cur.execute(f"""
-                SELECT payload_hash, merkle_root
-                FROM {self.TABLE}
-                ORDER BY ts_utc DESC
-                LIMIT 1
-            """)
-            row = cur.fetchone()
-            cur.close()
-            conn.close()
-            if row:
-                return row[0] or "", row[1] or ""
-            return "", ""
+            with self._connection() as conn:
+                if conn is None:
+                    return "", ""
+                cur = conn.cursor()
+                tip = self._read_tip(cur)
+                cur.close()
+            return tip[0], tip[1]
         except Exception as e:
             logger.warning(f"[TransparencyChain] _get_last_entry failed: {e}")
-            try:
-                conn.close()
-            except Exception:
-                pass
             return "", ""
 
+    def _read_tip(self, cur) -> tuple:
+        """(payload_hash, merkle_root, ts_utc) of the newest entry, or ("", "", None)."""
+        cur.execute(f"""
+            SELECT payload_hash, merkle_root, ts_utc
+            FROM {self.TABLE}
+            ORDER BY ts_utc DESC, log_id DESC
+            LIMIT 1
+        """)
+        row = cur.fetchone()
+        if not row:
+            return "", "", None
+        ts = row[2]
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
+        return row[0] or "", row[1] or "", ts
+
+    @staticmethod
+    def _link_entries(entries: List[Dict[str, Any]], tip: tuple) -> tuple:
+        """
+        Assign timestamp, prev_log_hash and merkle_root to entries (in order)
+        after `tip` = (payload_hash, merkle_root, ts_utc). Timestamps are
+        forced strictly after the tip so ts_utc order equals chain order even
+        across hosts with skewed clocks. Returns the new tip.
+        """
+        prev_hash, prev_root, prev_ts = tip
+        for entry in entries:
+            ts = datetime.now(timezone.utc)
+            if prev_ts is not None and ts <= prev_ts:
+                ts = prev_ts + timedelta(microseconds=1)
+            token = InternalTimestamp.create(entry["payload_hash"], at=ts)
+            merkle_root = compute_rolling_merkle_root(prev_root, entry["payload_hash"])
+            entry["prev_log_hash"] = prev_hash
+            entry["merkle_root"] = merkle_root
+            entry["ts_utc"] = token["ts_utc"]
+            entry["tst_token"] = token
+            prev_hash, prev_root, prev_ts = entry["payload_hash"], merkle_root, ts
+        return prev_hash, prev_root, prev_ts
+
     def _sign_entry(self, entry: Dict[str, Any]) -> tuple:
-        """Sign the entry content using the active crypto provider."""
+        """
+        Sign the entry content using the active crypto provider and the
+        process-cached signing key (persisted env key, else one ephemeral
+        key per process — never a fresh keypair per entry).
+        """
         try:
-            from omnix_core.security.crypto_providers import get_active_provider
+            from omnix_core.security.crypto_providers import get_active_provider, get_signing_key
             provider = get_active_provider()
-            kp = provider.generate_keypair()
-            if kp is None:
+            key = get_signing_key(provider.provider_id(), allow_ephemeral=True)
+            if key is None:
                 return None, "none"
-            pub, sec = kp
+            sec = key.secret_key
+            entry["key_id"], entry["key_version"] = key.key_id, key.key_version
             canonical = json.dumps(
-                {k: v for k, v in entry.items() if k not in ("tst_token",)},
+                {k: v for k, v in entry.items() if k not in _UNSIGNED_FIELDS},
                 sort_keys=True
             ).encode("utf-8")
             sig_bytes = provider.sign(canonical, sec)
@@ -402,47 +511,95 @@ class TransparencyChain:
             logger.warning(f"[TransparencyChain] signing failed: {e}")
             return None, "none"
 
+    def _sign_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Batch form of _sign_entry(): one SigningService batch fanned across
+        worker processes. Sets signing_provider / signature_b64 on each entry.
+        """
+        import base64
+        try:
+            from omnix_core.security.crypto_providers import get_active_provider, get_signing_key
+            from omnix_core.security.signing_service import get_signing_service
+            provider_id = get_active_provider().provider_id()
+            key = get_signing_key(provider_id, allow_ephemeral=True)
+            if key is None:
+                provider_id = "none"
+            for entry in entries:
+                # Signed with the entry: verifiers pick the public key by key_id.
+                entry["key_id"] = key.key_id if key else None
+                entry["key_version"] = key.key_version if key else None
+            canonicals = [
+                json.dumps(
+                    {k: v for k, v in entry.items() if k not in _UNSIGNED_FIELDS},
+                    sort_keys=True
+                ).encode("utf-8")
+                for entry in entries
+            ]
+            signatures = get_signing_service().sign_batch(
+                canonicals, provider_id=provider_id, allow_ephemeral=True,
+            )
+        except Exception as e:
+            logger.warning(f"[TransparencyChain] batch signing failed: {e}")
+            provider_id, signatures = "none", [None] * len(entries)
+        for entry, sig in zip(entries, signatures):
+            entry["signing_provider"] = provider_id
+            entry["signature_b64"] = base64.b64encode(sig).decode("utf-8") if sig else None
+
     def _store_entry(self, entry: Dict[str, Any]) -> bool:
         """
         ISR-013: Store with retry (3×) + pending-table fallback + degraded flag.
         Never raises. Returns True only if primary table write succeeded.
         """
+        return self._store_entries([entry])
+
+    def _store_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        fallback_tip: tuple = ("", "", None),
+    ) -> bool:
+        """
+        Chain, sign and store a batch of entries (in submission order) with
+        one multi-row INSERT in one transaction.
+
+        Inside the transaction the chain advisory lock is taken and the tip
+        is re-read, so prev_log_hash / merkle_root / ts_utc are computed
+        against the tip every other process sees — concurrent writers are
+        serialised instead of forking the chain. ISR-013 retry / pending /
+        degraded semantics apply to the batch as a whole; when the DB cannot
+        be reached at all, pending entries are chained after fallback_tip
+        (the last tip this process stored).
+        Never raises. Returns True only if primary table write succeeded.
+        """
         global _chain_degraded
-        if not self._db_url:
+        if not self._db_url or not entries:
             return False
 
         last_exc: Optional[Exception] = None
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(entries))
 
         for attempt, delay in enumerate(_STORE_RETRY_DELAYS, start=1):
-            conn = self._get_conn()
-            if not conn:
-                time.sleep(delay)
-                continue
             try:
-                cur = conn.cursor()
-                cur.execute(f"""
-                    INSERT INTO {self.TABLE} (
-                        log_id, receipt_id, symbol, event_type,
-                        payload_hash, prev_log_hash, merkle_root,
-                        signing_provider, signature_b64, ts_utc, chain_version
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (log_id) DO NOTHING
-                """, (
-                    entry["log_id"],
-                    entry["receipt_id"],
-                    entry["symbol"],
-                    entry["event_type"],
-                    entry["payload_hash"],
-                    entry.get("prev_log_hash") or None,
-                    entry["merkle_root"],
-                    entry["signing_provider"],
-                    entry.get("signature_b64"),
-                    entry["ts_utc"],
-                    1,
-                ))
-                conn.commit()
-                cur.close()
-                conn.close()
+                with self._connection() as conn:
+                    if conn is None:
+                        raise ConnectionError("no database connection")
+                    try:
+                        cur = conn.cursor()
+                        cur.execute("SELECT pg_advisory_xact_lock(%s)", (_CHAIN_LOCK_ID,))
+                        self._link_entries(entries, self._read_tip(cur))
+                        self._sign_entries(entries)
+                        cur.execute(f"""
+                            INSERT INTO {self.TABLE} ({_INSERT_COLUMNS})
+                            VALUES {placeholders}
+                            ON CONFLICT (log_id) DO NOTHING
+                        """, self._insert_params(entries))
+                        conn.commit()
+                        cur.close()
+                    except Exception:
+                        try:
+                            conn.rollback()
+                        except Exception:
+                            pass
+                        raise
                 if _chain_degraded:
                     logger.info("[TransparencyChain][ISR-013] Primary write succeeded — degraded flag cleared.")
                     _chain_degraded = False
@@ -450,31 +607,53 @@ class TransparencyChain:
             except Exception as exc:
                 last_exc = exc
                 logger.warning(
-                    f"[TransparencyChain][ISR-013] Primary write attempt {attempt}/{len(_STORE_RETRY_DELAYS)} failed: {exc}"
+                    f"[TransparencyChain][ISR-013] Primary write attempt {attempt}/{len(_STORE_RETRY_DELAYS)} "
+                    f"failed (batch={len(entries)}): {exc}"
                 )
-                try:
-                    conn.rollback()
-                    conn.close()
-                except Exception:
-                    pass
                 if attempt < len(_STORE_RETRY_DELAYS):
                     time.sleep(delay)
 
         logger.error(
             f"[TransparencyChain][ISR-013] All {len(_STORE_RETRY_DELAYS)} retry attempts failed — "
-            f"writing to pending table. last_error={last_exc}"
+            f"writing {len(entries)} entries to pending table. last_error={last_exc}"
         )
-        pending_ok = self._store_pending(entry, reason=str(last_exc))
-        if not pending_ok:
-            _chain_degraded = True
-            logger.error(
-                "[TransparencyChain][ISR-013] CRITICAL: Both primary and pending writes failed. "
-                "Audit chain has a gap. _chain_degraded=True. "
-                "Inspect DATABASE_URL and PostgreSQL connectivity."
-            )
-            self._send_degraded_alert(entry.get("log_id", "?"), str(last_exc))
+        if "merkle_root" not in entries[0]:
+            self._link_entries(entries, fallback_tip)
+        if "signing_provider" not in entries[0]:
+            self._sign_entries(entries)
+        for entry in entries:
+            pending_ok = self._store_pending(entry, reason=str(last_exc))
+            if not pending_ok:
+                _chain_degraded = True
+                logger.error(
+                    "[TransparencyChain][ISR-013] CRITICAL: Both primary and pending writes failed. "
+                    "Audit chain has a gap. _chain_degraded=True. "
+                    "Inspect DATABASE_URL and PostgreSQL connectivity."
+                )
+                self._send_degraded_alert(entry.get("log_id", "?"), str(last_exc))
         return False
 
+    @staticmethod
+    def _insert_params(entries: List[Dict[str, Any]]) -> List[Any]:
+        params: List[Any] = []
+        for entry in entries:
+            params.extend((
+                entry["log_id"],
+                entry["receipt_id"],
+                entry["symbol"],
+                entry["event_type"],
+                entry["payload_hash"],
+                entry.get("prev_log_hash") or None,
+                entry["merkle_root"],
+                entry["signing_provider"],
+                entry.get("signature_b64"),
+                entry.get("key_id"),
+                entry.get("key_version"),
+                entry["ts_utc"],
+                1,
+            ))
+        return params
+
     def _store_pending(self, entry: Dict[str, Any], reason: str = "") -> bool:
         """Write to transparency_chain_pending as fallback (ISR-013)."""
         conn = self._get_conn()
@@ -486,8 +665,9 @@ class TransparencyChain:
                 INSERT INTO {self.TABLE_PENDING} (
                     log_id, receipt_id, symbol, event_type,
                     payload_hash, prev_log_hash, merkle_root,
-                    signing_provider, signature_b64, ts_utc, pending_reason
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    signing_provider, signature_b64, key_id, key_version,
+                    ts_utc, pending_reason
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 ON CONFLICT (log_id) DO NOTHING
             """, (
                 entry["log_id"],
@@ -499,6 +679,8 @@ class TransparencyChain:
                 entry["merkle_root"],
                 entry["signing_provider"],
                 entry.get("signature_b64"),
+                entry.get("key_id"),
+                entry.get("key_version"),
                 entry["ts_utc"],
                 reason[:500],
             ))
@@ -558,7 +740,8 @@ class TransparencyChain:
             cur = conn.cursor()
             cur.execute(f"""
                 SELECT log_id, receipt_id, symbol, event_type, payload_hash,
-                       prev_log_hash, merkle_root, signing_provider, signature_b64, ts_utc
+                       prev_log_hash, merkle_root, signing_provider, signature_b64,
+                       key_id, key_version, ts_utc
                 FROM {self.TABLE_PENDING}
                 ORDER BY created_at ASC
                 LIMIT 100
@@ -576,7 +759,8 @@ class TransparencyChain:
 
         for row in rows:
             (log_id, receipt_id, symbol, event_type, payload_hash,
-             prev_log_hash, merkle_root, signing_provider, signature_b64, ts_utc) = row
+             prev_log_hash, merkle_root, signing_provider, signature_b64,
+             key_id, key_version, ts_utc) = row
             entry = {
                 "log_id": log_id,
                 "receipt_id": receipt_id,
@@ -587,6 +771,8 @@ class TransparencyChain:
                 "merkle_root": merkle_root,
                 "signing_provider": signing_provider or "none",
                 "signature_b64": signature_b64,
+                "key_id": key_id,
+                "key_version": key_version,
                 "ts_utc": ts_utc,
             }
             conn2 = self._get_conn()
@@ -594,16 +780,19 @@ class TransparencyChain:
                 break
             try:
                 cur2 = conn2.cursor()
+                cur2.execute("SELECT pg_advisory_xact_lock(%s)", (_CHAIN_LOCK_ID,))
                 cur2.execute(f"""
                     INSERT INTO {self.TABLE} (
                         log_id, receipt_id, symbol, event_type,
                         payload_hash, prev_log_hash, merkle_root,
-                        signing_provider, signature_b64, ts_utc, chain_version
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        signing_provider, signature_b64, key_id, key_version,
+                        ts_utc, chain_version
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT (log_id) DO NOTHING
                 """, (
                     log_id, receipt_id, symbol, event_type, payload_hash,
-                    prev_log_hash, merkle_root, signing_provider, signature_b64, ts_utc, 1,
+                    prev_log_hash, merkle_root, signing_provider, signature_b64,
+                    key_id, key_version, ts_utc, 1,
                 ))
                 cur2.execute(
                     f"DELETE FROM {self.TABLE_PENDING} WHERE log_id = %s",
@@ -629,19 +818,39 @@ class TransparencyChain:
         if not self._db_url:
             return None
         try:
-            import psycopg
-            return psycopg.connect(self._db_url)
-        except ImportError:
-            try:
-                import psycopg
-                return psycopg.connect(self._db_url, autocommit=False)
-            except Exception as e:
-                logger.error(f"[TransparencyChain] DB connection failed: {e}")
-                return None
+            from omnix_services.database_service.connection_provider import get_connection
+            return get_connection("evidence", self._db_url)
         except Exception as e:
             logger.error(f"[TransparencyChain] DB connection failed: {e}")
             return None
 
+    @contextmanager
+    def _connection(self):
+        """
+        Yield a connection from the shared DatabaseGateway pool, falling back
+        to a dedicated connection when the pool is unavailable. Yields None
+        if no connection can be obtained.
+        """
+        pool = None
+        try:
+            from omnix_services.database_service.database_gateway import DatabaseGateway
+            pool = DatabaseGateway.get_pool()
+        except Exception:
+            pool = None
+        if pool is not None:
+            with pool.connection() as conn:
+                yield conn
+            return
+        conn = self._get_conn()
+        try:
+            yield conn
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
     # ── Audit convenience API (ADR-121) ─────────────────────────────────────────
 
     def append_entry(self, payload: dict) -> Optional[Dict[str, Any]]:
@@ -669,6 +878,270 @@ class TransparencyChain:
         return self.append(receipt_id, symbol, decision, payload_hash, event_type)
 
 
+class _PendingAppend:
+    """
+    Queued log entries plus the completion signal for synchronous callers.
+
+    A group from submit_many() is one _PendingAppend and is never split
+    across flushes, so its entries land in a single INSERT transaction.
+    """
+
+    __slots__ = ("entries", "done", "stored")
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+        self.done = threading.Event()
+        self.stored = False
+
+
+class TransparencyChainWriter:
+    """
+    Process-wide, batching writer for the transparency log.
+
+    submit() queues entries in call order; a single background flusher
+    writes queued entries in multi-row INSERT batches over the pooled
+    connection. The chain position (prev_log_hash, merkle_root, ts_utc)
+    and the signature are computed at flush time inside the INSERT
+    transaction, after pg_advisory_xact_lock and a fresh read of the tip
+    (TransparencyChain._store_entries), so:
+
+      - ordering within a process is the order of submit() calls
+      - gunicorn workers share one chain: batches from different processes
+        are serialised by the advisory lock, never forked off cached tips
+      - the evaluate hot path does no DB round-trip for the chain
+      - N decisions arriving within one flush interval cost one INSERT
+
+    Failed batches follow the ISR-013 path (retry → pending table →
+    degraded flag).
+
+    Fork-safe: get_chain_writer() builds a fresh writer per PID.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = _WRITER_BATCH_SIZE,
+        flush_interval_s: float = _WRITER_FLUSH_INTERVAL_S,
+    ):
+        self._chain = TransparencyChain()
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_s = max(0.0, float(flush_interval_s))
+        self._pid = os.getpid()
+
+        # Last tip this process stored — only used to chain pending-table
+        # entries when the DB (and so the real tip) is unreachable.
+        self._last_tip: tuple = ("", "", None)
+
+        self._queue: "deque[_PendingAppend]" = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._flusher: Optional[threading.Thread] = None
+
+        self._batches_flushed = 0
+        self._entries_flushed = 0
+        self._entries_failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._chain._db_url)
+
+    def tip(self) -> tuple:
+        """Return (last payload_hash, merkle_root) as stored in the DB."""
+        return self._chain._get_last_entry()
+
+    # ── Submission ────────────────────────────────────────────────────────────
+
+    def submit(
+        self,
+        receipt_id: str,
+        symbol: str,
+        decision: str,
+        payload_hash: str,
+        event_type: str = "decision",
+        wait: bool = False,
+        timeout: float = _WRITER_APPEND_TIMEOUT_S,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Queue a receipt for the transparency log.
+
+        wait=False (hot path): returns the entry immediately; prev_log_hash,
+        merkle_root, ts_utc, signing_provider and signature_b64 are filled in
+        by the flusher once the entry's chain position is assigned.
+        wait=True: blocks until the batch is written; returns the entry only
+        if the primary table write succeeded (TransparencyChain.append contract).
+        """
+        entries = self.submit_many(
+            [{
+                "receipt_id":   receipt_id,
+                "symbol":       symbol,
+                "decision":     decision,
+                "payload_hash": payload_hash,
+                "event_type":   event_type,
+            }],
+            wait=wait,
+            timeout=timeout,
+        )
+        return entries[0] if entries else None
+
+    def submit_many(
+        self,
+        items: List[Dict[str, Any]],
+        wait: bool = False,
+        timeout: float = _WRITER_APPEND_TIMEOUT_S,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Queue several receipts as one group for contiguous chain positions.
+
+        Each item carries receipt_id, symbol, payload_hash and optionally
+        decision / event_type. The group is written by a single multi-row
+        INSERT (one transaction) regardless of OMNIX_TLOG_BATCH_SIZE, and no
+        other submitter — in this or any other process — can interleave
+        entries between its positions.
+
+        Returns the entries in item order (see submit() for the wait contract).
+        """
+        if not self.enabled or not items:
+            return None
+        entries = [
+            {
+                "log_id":       f"TL-{uuid.uuid4().hex[:12].upper()}",
+                "receipt_id":   item["receipt_id"],
+                "symbol":       item["symbol"],
+                "event_type":   item.get("event_type", "decision"),
+                "payload_hash": item["payload_hash"],
+            }
+            for item in items
+        ]
+        pending = _PendingAppend(entries)
+        with self._cond:
+            self._ensure_flusher_locked()
+            self._queue.append(pending)
+            self._cond.notify()
+
+        if not wait:
+            return entries
+        if not pending.done.wait(timeout):
+            logger.warning(
+                f"[TransparencyChain] append wait timed out after {timeout}s "
+                f"log_id={entries[0]['log_id']} (entries stay queued)"
+            )
+            return None
+        return entries if pending.stored else None
+
+    # ── Flushing ──────────────────────────────────────────────────────────────
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._stopped = False
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            daemon=True,
+            name=f"TransparencyChainWriter-{self._pid}",
+        )
+        self._flusher.start()
+
+    def _take_batch(self) -> List[_PendingAppend]:
+        with self._cond:
+            while not self._queue and not self._stopped:
+                self._cond.wait()
+            if not self._queue:
+                return []
+            # Short linger lets concurrent decisions share one INSERT.
+            if self._queued_entries_locked() < self._batch_size and self._flush_interval_s and not self._stopped:
+                self._cond.wait(self._flush_interval_s)
+            # Whole groups only; an oversized group is flushed on its own.
+            batch, size = [], 0
+            while self._queue:
+                n = len(self._queue[0].entries)
+                if batch and size + n > self._batch_size:
+                    break
+                batch.append(self._queue.popleft())
+                size += n
+            return batch
+
+    def _queued_entries_locked(self) -> int:
+        return sum(len(p.entries) for p in self._queue)
+
+    def _flush_batch(self, batch: List[_PendingAppend]) -> None:
+        entries = [e for p in batch for e in p.entries]
+        stored = self._chain._store_entries(entries, fallback_tip=self._last_tip)
+        self._batches_flushed += 1
+        if "merkle_root" in entries[-1]:
+            last = entries[-1]
+            self._last_tip = (
+                last["payload_hash"], last["merkle_root"], datetime.fromisoformat(last["ts_utc"]),
+            )
+        if stored:
+            self._entries_flushed += len(entries)
+            logger.debug(
+                f"[TransparencyChain] Flushed {len(entries)} entries "
+                f"({entries[0]['log_id']}..{entries[-1]['log_id']})"
+            )
+        else:
+            self._entries_failed += len(entries)
+        for p in batch:
+            p.stored = stored
+            p.done.set()
+
+    def _flush_loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            try:
+                self._flush_batch(batch)
+            except Exception as exc:
+                logger.error(f"[TransparencyChain] flush failed (non-blocking): {exc}")
+                for p in batch:
+                    p.done.set()
+
+    def flush(self, timeout: float = _WRITER_APPEND_TIMEOUT_S) -> bool:
+        """Block until every entry queued so far has been written (or failed)."""
+        with self._cond:
+            last = self._queue[-1] if self._queue else None
+        return True if last is None else last.done.wait(timeout)
+
+    def close(self, timeout: float = _WRITER_APPEND_TIMEOUT_S) -> None:
+        """Drain the queue and stop the flusher thread."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._flusher is not None and self._flusher.is_alive():
+            self._flusher.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            queued = self._queued_entries_locked()
+        return {
+            "queued":          queued,
+            "batches_flushed": self._batches_flushed,
+            "entries_flushed": self._entries_flushed,
+            "entries_failed":  self._entries_failed,
+            "pid":             self._pid,
+        }
+
+
+_writer_instance: Optional[TransparencyChainWriter] = None
+_writer_init_lock = threading.Lock()
+
+
+def get_chain_writer() -> TransparencyChainWriter:
+    """
+    Return the process-level TransparencyChainWriter singleton.
+    Rebuilt after fork so gunicorn workers never share a flusher thread.
+    """
+    global _writer_instance
+    writer = _writer_instance
+    if writer is None or writer._pid != os.getpid():
+        with _writer_init_lock:
+            writer = _writer_instance
+            if writer is None or writer._pid != os.getpid():
+                writer = TransparencyChainWriter()
+                _writer_instance = writer
+                atexit.register(writer.close)
+    return writer
+
+
 def compute_chain_completeness_score(
     entries: List[Dict[str, Any]],
     pending_table_count: int = 0,
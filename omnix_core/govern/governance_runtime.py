@@ -30,14 +30,18 @@ Harold Nunes — OMNIX QUANTUM LTD — May 2026
 """
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
 import logging
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.OGR")
 
@@ -220,6 +224,118 @@ class OGRTurnResult:
 #  GovernanceRuntime — the one body
 # ─────────────────────────────────────────────────────────────────
 
+# ─────────────────────────────────────────────────────────────────
+#  Bounded session cache
+# ─────────────────────────────────────────────────────────────────
+
+class _SessionCache:
+    """
+    LRU + TTL cache of OGRSession objects, replacing the unbounded dict.
+
+    Eviction (swept at most every OMNIX_OGR_SESSION_SWEEP_S seconds, and on
+    overflow):
+      - CLOSED / HALTED / EXPIRED sessions idle for OMNIX_OGR_CLOSED_TTL_S
+      - any session idle for OMNIX_OGR_SESSION_IDLE_S
+      - least recently used sessions beyond OMNIX_OGR_SESSION_CACHE_SIZE
+
+    A session is never evicted while `is_pinned(session_id)` is true (turn
+    writes still queued) and, while `is_authoritative()` (no DATABASE_URL —
+    the cache is the only copy), only terminal sessions are evicted.
+    """
+
+    _TERMINAL = (STATUS_CLOSED, STATUS_HALTED, STATUS_EXPIRED)
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        idle_ttl_s: Optional[float] = None,
+        closed_ttl_s: Optional[float] = None,
+        sweep_s: Optional[float] = None,
+    ):
+        env = os.environ.get
+        self.max_entries = int(max_entries or env("OMNIX_OGR_SESSION_CACHE_SIZE", "10000"))
+        self.idle_ttl_s = float(idle_ttl_s if idle_ttl_s is not None
+                                else env("OMNIX_OGR_SESSION_IDLE_S", "3600"))
+        self.closed_ttl_s = float(closed_ttl_s if closed_ttl_s is not None
+                                  else env("OMNIX_OGR_CLOSED_TTL_S", "300"))
+        self.sweep_s = float(sweep_s if sweep_s is not None
+                             else env("OMNIX_OGR_SESSION_SWEEP_S", "30"))
+        self.is_authoritative: Callable[[], bool] = lambda: True
+        self.is_pinned: Callable[[str], bool] = lambda session_id: False
+        self._entries: "OrderedDict[str, Tuple[OGRSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self.evictions = 0
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, session_id: str) -> OGRSession:
+        session = self.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session
+
+    def __setitem__(self, session_id: str, session: OGRSession) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[session_id] = (session, now)
+            self._entries.move_to_end(session_id)
+            overflow = len(self._entries) > self.max_entries
+        if overflow or now - self._last_sweep >= self.sweep_s:
+            self.sweep(now)
+
+    def get(self, session_id: str) -> Optional[OGRSession]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            self._entries[session_id] = (entry[0], time.monotonic())
+            self._entries.move_to_end(session_id)
+            return entry[0]
+
+    def pop(self, session_id: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+        return entry[0] if entry is not None else default
+
+    def _evictable(self, session_id: str, session: OGRSession) -> bool:
+        if session.session_status not in self._TERMINAL and self.is_authoritative():
+            return False
+        return not self.is_pinned(session_id)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Evict expired sessions, then LRU entries beyond capacity. Returns evicted count."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._last_sweep = now
+            doomed = []
+            for session_id, (session, touched) in self._entries.items():
+                idle = now - touched
+                ttl = self.closed_ttl_s if session.session_status in self._TERMINAL else self.idle_ttl_s
+                if idle >= ttl and self._evictable(session_id, session):
+                    doomed.append(session_id)
+            excess = len(self._entries) - len(doomed) - self.max_entries
+            if excess > 0:
+                doomed_set = set(doomed)
+                for session_id, (session, _) in self._entries.items():
+                    if excess <= 0:
+                        break
+                    if session_id not in doomed_set and self._evictable(session_id, session):
+                        doomed.append(session_id)
+                        excess -= 1
+            for session_id in doomed:
+                del self._entries[session_id]
+            self.evictions += len(doomed)
+        if doomed:
+            logger.debug(f"[OGR] Session cache evicted {len(doomed)} session(s)")
+        return len(doomed)
+
+
 class GovernanceRuntime:
     """
     OMNIX Governance Runtime — six ATF layers, one integration point.
@@ -278,10 +394,17 @@ class GovernanceRuntime:
         self._ccs_engine = None
         self._ctchc_engine = None
         self._mivp_engine = None   # MIVP — lazy, only created when first needed (ADR-194)
-        # In-memory session cache — used as primary store when DATABASE_URL absent
-        # and as a read-through cache in production to reduce DB round-trips on
-        # record_turn (hot path). Always authoritative for the current process.
-        self._session_cache: Dict[str, "OGRSession"] = {}
+        # In-memory session cache — the primary store when DATABASE_URL is absent.
+        # With a DB it only holds sessions started or written by this process;
+        # the DB row wins for turn state (see get_session / _merge_session).
+        # Bounded: closed and idle sessions are evicted (see _SessionCache).
+        self._session_cache = _SessionCache()
+        self._session_cache.is_pinned = self._has_pending_writes
+        self._session_cache.is_authoritative = lambda: not self._db_url
+        self._write_behind = None
+        self._write_behind_enabled = os.environ.get(
+            "OMNIX_OGR_WRITE_BEHIND", "false"
+        ).lower() in ("1", "true", "yes")
 
     def _get_bar(self):
         if self._bar_engine is None:
@@ -309,8 +432,27 @@ class GovernanceRuntime:
         return self._mivp_engine
 
     def _get_conn(self):
-        import psycopg
-        return psycopg.connect(self._db_url)
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("governance", self._db_url)
+
+    def _get_write_behind(self):
+        """Turn write-behind queue — None without a DB or when disabled."""
+        if not self._db_url or not self._write_behind_enabled:
+            return None
+        if self._write_behind is None:
+            from omnix_core.govern.turn_write_behind import get_turn_write_behind
+            self._write_behind = get_turn_write_behind(self._get_conn)
+        return self._write_behind
+
+    def _has_pending_writes(self, session_id: str) -> bool:
+        wb = self._write_behind
+        return wb is not None and wb.pending(session_id) > 0
+
+    def _flush_writes(self, session_id: Optional[str] = None) -> None:
+        """Read-your-writes: wait for queued turn writes before reading the DB."""
+        wb = self._write_behind
+        if wb is not None and not wb.flush(session_id):
+            logger.warning(f"[OGR] Write-behind flush timed out (session={session_id})")
 
     # ── Startup ───────────────────────────────────────────────────
 
@@ -329,6 +471,15 @@ class GovernanceRuntime:
             self._get_ctchc().ensure_tables()
             self._get_mivp().ensure_tables()   # MIVP tables (ADR-194)
             logger.info("[OGR] All governance runtime tables ready (BEV + MIVP)")
+            wb = self._get_write_behind()
+            if wb is not None:
+                replayed = wb.reconcile()
+            else:
+                # Turns queued by write-behind before it was switched off.
+                from omnix_core.govern.turn_write_behind import replay_wal
+                replayed = replay_wal(self._get_conn)
+            if replayed:
+                logger.info(f"[OGR] Replayed {replayed} turn(s) from the write-behind WAL")
         except Exception as exc:
             logger.warning(f"[OGR] ensure_tables failed (non-blocking): {exc}")
 
@@ -451,8 +602,85 @@ class GovernanceRuntime:
         This is the core innovation: three new artifact classes produced
         in one atomic call, all cryptographically bound to each other and
         to the governing receipt. Nothing else in the market does this.
+
+        With a database, every statement of the turn is committed in one
+        transaction under a per-session advisory lock (_record_turn_locked),
+        so workers never record the same turn_index or chain from a stale
+        tip.  OMNIX_OGR_WRITE_BEHIND=true queues the turn instead — only for
+        deployments that pin each session to one process.
         """
-        session = self.get_session(session_id)
+        if self._db_url and self._get_write_behind() is None:
+            result = self._record_turn_locked(session_id, output_text, turn_metadata)
+        else:
+            session = self._turn_session(session_id, self.get_session(session_id))
+            wb = self._get_write_behind()
+            if wb is not None:
+                # This process owns the session's queued writes: later turns
+                # continue from the cached copy until the queue drains.
+                self._session_cache[session_id] = session
+            result, statements = self._build_turn(session, output_text, turn_metadata)
+            if wb is not None:
+                # HALT is the forensic record (BEV-INV-003) — commit it before returning.
+                wb.submit(session_id, result.turn_index, statements,
+                          synchronous=result.should_halt)
+
+        if result.should_halt:
+            logger.warning(
+                f"[OGR] Session HALTED: {session_id} | turn={result.turn_index} "
+                f"| reason={result.halt_reason}"
+            )
+        return result
+
+    # Two-key form: (class, hashtext(session_id)) stays clear of single-key locks.
+    _SESSION_LOCK_CLASS = 4401
+    _SESSION_LOCK_SQL = "SELECT pg_advisory_xact_lock(%s, hashtext(%s))"
+
+    def _record_turn_locked(
+        self,
+        session_id: str,
+        output_text: str,
+        turn_metadata: Optional[Dict[str, Any]],
+    ) -> OGRTurnResult:
+        """
+        DB path of record_turn(): one transaction per turn, serialised per session.
+
+        The advisory lock is held until commit, so a turn recorded by another
+        worker is always visible when this one reads the session row; the turn
+        index and chain tip come from that row, never from a local copy.
+        """
+        from omnix_core.govern.turn_write_behind import execute_statements
+
+        with contextlib.ExitStack() as stack:
+            try:
+                conn = stack.enter_context(self._get_conn())
+                cur = stack.enter_context(conn.cursor())
+                cur.execute(self._SESSION_LOCK_SQL, (self._SESSION_LOCK_CLASS, session_id))
+                row = self._fetch_session(cur, session_id)
+            except Exception as exc:
+                logger.warning(f"[OGR] Session lock failed — turn will not be persisted: {exc}")
+                stack.close()
+                conn = row = None
+
+            session = self._turn_session(
+                session_id, self._merge_session(self._session_cache.get(session_id), row)
+            )
+            result, statements = self._build_turn(session, output_text, turn_metadata)
+            if conn is None:
+                return result
+            try:
+                execute_statements(cur, statements)
+                conn.commit()
+            except Exception as exc:
+                # The next turn sees the DB tip differ from ours and reloads.
+                logger.warning(f"[OGR] Turn write failed (non-blocking): {exc}")
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+        return result
+
+    def _turn_session(self, session_id: str, session: Optional[OGRSession]) -> OGRSession:
+        """Validate the session for a new turn and align engine state with it."""
         if session is None:
             raise ValueError(f"OGR session not found: {session_id}")
         if session.session_status != STATUS_ACTIVE:
@@ -460,13 +688,31 @@ class GovernanceRuntime:
                 f"Session {session_id} is not ACTIVE "
                 f"(current: {session.session_status})"
             )
+        if self._db_url:
+            ctchc = self._get_ctchc()
+            if ctchc._tip_cache.get(session_id) != session.chain_tip_hash:
+                # Another process extended the chain — reload tip, drift and
+                # CCS chain from the DB instead of continuing a stale copy.
+                ctchc.forget_session(session_id)
+                self._get_ccs().forget_session(session_id)
+        return session
 
+    def _build_turn(
+        self,
+        session: OGRSession,
+        output_text: str,
+        turn_metadata: Optional[Dict[str, Any]],
+    ) -> Tuple[OGRTurnResult, List[Tuple[str, tuple]]]:
+        """Run every ATF layer for one turn. Returns the result and its DB statements."""
+        session_id = session.session_id
         turn_index = session.turn_count
         processed_at = datetime.now(timezone.utc).isoformat()
 
         # ── Step 1: BAR (BEV-INV-001) ─────────────────────────────
+        # Signature is computed by the SigningService while CCS / CTCHC / MIVP
+        # run below; complete_bar() attaches it and persists before the verdict.
         bar_engine = self._get_bar()
-        bar = bar_engine.create_bar(
+        bar, bar_sig_future = bar_engine.begin_bar(
             session_id=session_id,
             agent_id=session.agent_id,
             turn_index=turn_index,
@@ -486,6 +732,7 @@ class GovernanceRuntime:
             bar_status=bar.bar_status,
             constraint_set=session.constraint_set,
             metadata=turn_metadata,
+            persist=False,
         )
 
         # ── Step 3: CTCHC append (BEV-INV-011) ────────────────────
@@ -498,6 +745,7 @@ class GovernanceRuntime:
             ccs_id=ccs.ccs_id,
             output_hash=output_hash,
             governing_receipt_id=session.governing_receipt_id,
+            persist=False,
         )
 
         # ── Step 4: MIVP — Mandate Alignment Score (MIVP-INV-003) ───
@@ -512,10 +760,13 @@ class GovernanceRuntime:
                     output_text=output_text,
                     ctchc_link_hash=link.chain_link_hash,
                     metadata=turn_metadata,
+                    persist=False,
                 )
             except Exception as mivp_exc:
                 logger.warning(f"[OGR] MIVP MAS computation failed (non-blocking): {mivp_exc}")
 
+        bar = bar_engine.complete_bar(bar, bar_sig_future, persist=False)
+
         # ── Step 5: Determine OGR verdict ─────────────────────────
         mivp_halt = mas is not None and mas.verdict == "HALT"
         should_halt = (
@@ -543,15 +794,23 @@ class GovernanceRuntime:
             last_verdict=ogr_verdict,
             new_status=new_status,
             halt_reason=halt_reason,
+            persist=False,
         )
 
-        if should_halt:
-            logger.warning(
-                f"[OGR] Session HALTED: {session_id} | turn={turn_index} "
-                f"| reason={halt_reason}"
-            )
-
-        return OGRTurnResult(
+        statements = [
+            ("bar", bar_engine._insert_params(bar)),
+            ("ccs", ccs_engine._insert_params(ccs)),
+            ("ctchc_link", ctchc_engine._link_params(link)),
+            ("ctchc_tip", ctchc_engine._tip_params(session_id, link.chain_link_hash, turn_index + 1)),
+        ]
+        if mas is not None:
+            statements.append(("mas", self._get_mivp()._mas_params(mas)))
+        statements.append(("ogr_turn", self._turn_params(
+            session_id, turn_index + 1, ccs.cumulative_drift,
+            link.chain_link_hash, ogr_verdict, new_status, halt_reason,
+        )))
+
+        result = OGRTurnResult(
             session_id=session_id,
             turn_index=turn_index,
             bar_id=bar.bar_id,
@@ -575,6 +834,7 @@ class GovernanceRuntime:
             mas_verdict=mas.verdict if mas else None,
             mandate_dominant_proxy=mas.dominant_proxy if mas else None,
         )
+        return result, statements
 
     # ─────────────────────────────────────────────────────────────
     #  3. CLOSE SESSION
@@ -603,6 +863,7 @@ class GovernanceRuntime:
         if session.session_status == STATUS_CLOSED:
             return {"session_id": session_id, "already_closed": True}
 
+        self._flush_writes(session_id)
         ctchc_engine = self._get_ctchc()
         sealed_chain = ctchc_engine.seal_chain(session_id)
 
@@ -728,6 +989,7 @@ class GovernanceRuntime:
 
         This proof package is the OGR's core deliverable.
         """
+        self._flush_writes(session_id)
         session = self.get_session(session_id)
         if session is None:
             raise ValueError(f"OGR session not found: {session_id}")
@@ -780,6 +1042,7 @@ class GovernanceRuntime:
 
     def get_status(self, session_id: str) -> Dict[str, Any]:
         """Full governance status dashboard for a session."""
+        self._flush_writes(session_id)
         session = self.get_session(session_id)
         if session is None:
             raise ValueError(f"OGR session not found: {session_id}")
@@ -824,6 +1087,7 @@ class GovernanceRuntime:
         artifact_type: str,
         artifact_id: str,
         artifact_data: Optional[Dict[str, Any]] = None,
+        full_verify: bool = False,
     ) -> Dict[str, Any]:
         """
         Offline verification of any OGR artifact.
@@ -832,12 +1096,14 @@ class GovernanceRuntime:
           artifact_type = "BAR" | "CTCHC" | "SESSION"
           artifact_id   = the artifact's primary key
           artifact_data = optional embedded dict (for fully offline use)
+          full_verify   = re-hash the CTCHC from genesis, ignoring checkpoints
 
         Note: "CCS" verification requires DB access and is not supported
         in the offline verify endpoint. Use compliance_report for CCS data.
 
         Returns verification result with BEV invariant flags.
         """
+        self._flush_writes()
         artifact_type = (artifact_type or "").upper()
 
         if artifact_type == "BAR":
@@ -857,13 +1123,13 @@ class GovernanceRuntime:
             return bar_engine.verify_bar(bar)
 
         if artifact_type == "CTCHC":
-            return self._get_ctchc().verify_chain(artifact_id)
+            return self._get_ctchc().verify_chain(artifact_id, full=full_verify)
 
         if artifact_type == "SESSION":
             session = self.get_session(artifact_id)
             if session is None:
                 return {"verified": False, "reason": f"Session not found: {artifact_id}"}
-            ctchc_result = self._get_ctchc().verify_chain(artifact_id)
+            ctchc_result = self._get_ctchc().verify_chain(artifact_id, full=full_verify)
             return {
                 "artifact_type": "SESSION",
                 "session_id": artifact_id,
@@ -890,6 +1156,7 @@ class GovernanceRuntime:
         This report is suitable for regulatory submission, audit evidence,
         or third-party governance verification.
         """
+        self._flush_writes(session_id)
         session = self.get_session(session_id)
         if session is None:
             raise ValueError(f"OGR session not found: {session_id}")
@@ -996,26 +1263,51 @@ class GovernanceRuntime:
     # ─────────────────────────────────────────────────────────────
 
     def get_session(self, session_id: str) -> Optional[OGRSession]:
-        # Check in-memory cache first (no DB round-trip on hot path)
-        if session_id in self._session_cache:
-            return self._session_cache[session_id]
-        if not self._db_url:
-            return None
+        cached = self._session_cache.get(session_id)
+        # Without a DB the cache is the only copy; with queued turn writes it
+        # is ahead of the DB.  Otherwise the DB row wins — another worker may
+        # have recorded turns since this process cached the session.
+        if not self._db_url or self._has_pending_writes(session_id):
+            return cached
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT * FROM atf_ogr_sessions WHERE session_id=%s",
-                        (session_id,)
-                    )
-                    row = cur.fetchone()
-                    if row is None:
-                        return None
-                    cols = [d[0] for d in cur.description]
-                    return self._row_to_session(dict(zip(cols, row)))
+                    row = self._fetch_session(cur, session_id)
         except Exception as exc:
             logger.error(f"[OGR] get_session error: {exc}")
+            return cached
+        return self._merge_session(cached, row)
+
+    @classmethod
+    def _fetch_session(cls, cur: Any, session_id: str) -> Optional[OGRSession]:
+        cur.execute("SELECT * FROM atf_ogr_sessions WHERE session_id=%s", (session_id,))
+        row = cur.fetchone()
+        if row is None:
             return None
+        cols = [d[0] for d in cur.description]
+        return cls._row_to_session(dict(zip(cols, row)))
+
+    @staticmethod
+    def _merge_session(
+        cached: Optional[OGRSession], fresh: Optional[OGRSession]
+    ) -> Optional[OGRSession]:
+        """The DB row's turn state over the cached session (which keeps mbr_id)."""
+        if cached is None or fresh is None:
+            return fresh or cached
+        import dataclasses
+        return dataclasses.replace(
+            cached,
+            turn_count=fresh.turn_count,
+            total_drift=fresh.total_drift,
+            chain_tip_hash=fresh.chain_tip_hash,
+            chain_sealed=fresh.chain_sealed,
+            chain_seal_hash=fresh.chain_seal_hash,
+            last_verdict=fresh.last_verdict,
+            session_status=fresh.session_status,
+            halt_reason=fresh.halt_reason,
+            oep_export_id=fresh.oep_export_id,
+            closed_at=fresh.closed_at,
+        )
 
     def list_sessions(
         self,
@@ -1025,6 +1317,7 @@ class GovernanceRuntime:
     ) -> List[OGRSession]:
         if not self._db_url:
             return []
+        self._flush_writes()
         try:
             conditions = []
             params = []
@@ -1083,6 +1376,29 @@ class GovernanceRuntime:
         except Exception as exc:
             logger.warning(f"[OGR] persist_session failed: {exc}")
 
+    # Guarded so a replayed (older) turn never moves the session backwards.
+    _UPDATE_TURN_SQL = """
+        UPDATE atf_ogr_sessions
+        SET turn_count=%s, total_drift=%s, chain_tip_hash=%s,
+            last_verdict=%s, session_status=%s, halt_reason=%s
+        WHERE session_id=%s AND turn_count < %s
+    """
+
+    @staticmethod
+    def _turn_params(
+        session_id: str,
+        new_turn_count: int,
+        total_drift: float,
+        chain_tip_hash: str,
+        last_verdict: str,
+        new_status: str,
+        halt_reason: Optional[str],
+    ) -> tuple:
+        return (
+            new_turn_count, total_drift, chain_tip_hash,
+            last_verdict, new_status, halt_reason, session_id, new_turn_count,
+        )
+
     def _update_session_turn(
         self,
         session_id: str,
@@ -1092,6 +1408,7 @@ class GovernanceRuntime:
         last_verdict: str,
         new_status: str,
         halt_reason: Optional[str],
+        persist: bool = True,
     ) -> None:
         # Always update in-memory cache regardless of DB availability
         cached = self._session_cache.get(session_id)
@@ -1106,19 +1423,14 @@ class GovernanceRuntime:
                 session_status=new_status,
                 halt_reason=halt_reason,
             )
-        if not self._db_url:
+        if not self._db_url or not persist:
             return
         try:
             with self._get_conn() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE atf_ogr_sessions
-                        SET turn_count=%s, total_drift=%s, chain_tip_hash=%s,
-                            last_verdict=%s, session_status=%s, halt_reason=%s
-                        WHERE session_id=%s
-                    """, (
-                        new_turn_count, total_drift, chain_tip_hash,
-                        last_verdict, new_status, halt_reason, session_id,
+                    cur.execute(self._UPDATE_TURN_SQL, self._turn_params(
+                        session_id, new_turn_count, total_drift, chain_tip_hash,
+                        last_verdict, new_status, halt_reason,
                     ))
                 conn.commit()
         except Exception as exc:
@@ -1188,6 +1500,8 @@ class GovernanceRuntime:
             halt_reason=row.get("halt_reason"),
             oep_export_id=row.get("oep_export_id"),
             atf_layers_active=_jl(row.get("atf_layers_active")),
+            mbr_id=row.get("mbr_id"),
+            mandate_bound=bool(row.get("mandate_bound", False)),
             started_at=str(row["started_at"]),
             closed_at=str(row["closed_at"]) if row.get("closed_at") else None,
             metadata=_j(row.get("metadata")),
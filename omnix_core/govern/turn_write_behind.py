@@ -0,0 +1,348 @@
+"""
+OMNIX Governance Runtime — Turn Write-Behind Queue
+ADR-184 · ADR-148 (WAL)
+
+record_turn() used to persist each turn with four to six separate
+connections and transactions (BAR, CCS, CTCHC link, CTCHC tip, MAS,
+session row).  The write-behind queue replaces that with group commit:
+
+  1. record_turn() builds the turn's statements as (kind, params) pairs
+     and submits them as one TurnBundle.
+  2. submit() appends the bundle to a dedicated ReceiptWAL (group-commit
+     fsync) before returning — a crash after record_turn() returns never
+     loses a turn.
+  3. A single background writer drains the queue and executes all
+     statements of up to OMNIX_OGR_WB_BATCH turns in ONE transaction,
+     then tombstones their WAL entries.
+
+Statement kinds map to SQL owned by each engine (BAREngine._INSERT_SQL,
+CTCHCEngine._INSERT_LINK_SQL, …), so the WAL stores kinds and parameters,
+never raw SQL.  Every statement is idempotent (ON CONFLICT DO NOTHING or
+a monotonic turn_count guard), so replaying WAL entries after a crash —
+or retrying a batch — is safe in any order.
+
+Write-behind acknowledges a turn before its DB commit, so it is only
+correct when every turn of a session is recorded by the same process
+(one worker, or sticky routing per session).  It is therefore opt-in
+(OMNIX_OGR_WRITE_BEHIND=true); by default record_turn() commits each turn
+itself, under a per-session advisory lock, with execute_statements().
+
+Failure handling:
+  - A failed batch is retried turn by turn, so one bad bundle cannot block
+    the others.  Bundles that still fail stay live in the WAL and are
+    replayed by reconcile() (called from GovernanceRuntime.ensure_tables).
+  - Queue full → the caller writes its own bundle synchronously
+    (back-pressure instead of dropping).
+  - Synchronous submits (HALT turns) wait for their commit.
+  - Every process opens the same WAL path; ReceiptWAL gives each one its
+    own flock-guarded namespace and adopts the entries of dead writers, so
+    reconcile() also replays turns left behind by crashed workers.
+
+Configuration:
+  OMNIX_OGR_WB_BATCH       max turns per transaction        (default 32)
+  OMNIX_OGR_WB_FLUSH_MS    max wait to fill a batch         (default 20)
+  OMNIX_OGR_WB_QUEUE       max queued turns                 (default 8192)
+  OMNIX_OGR_WAL_PATH       WAL location  (default /tmp/omnix_ogr_turn_wal.jsonl)
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("OMNIX.OGR.WriteBehind")
+
+_DEFAULT_WAL_PATH = "/tmp/omnix_ogr_turn_wal.jsonl"
+_WAL_KIND = "ogr_turn"
+
+Statement = Tuple[str, Sequence[Any]]
+
+
+def _statement_sql(kind: str) -> str:
+    """Resolve a statement kind to the SQL owned by its engine."""
+    if kind == "bar":
+        from omnix_core.bev.behavioral_anchor_record import BAREngine
+        return BAREngine._INSERT_SQL
+    if kind == "ccs":
+        from omnix_core.bev.constraint_conformance_signal import CCSEngine
+        return CCSEngine._INSERT_SQL
+    if kind == "ctchc_link":
+        from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+        return CTCHCEngine._INSERT_LINK_SQL
+    if kind == "ctchc_tip":
+        from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+        return CTCHCEngine._UPDATE_TIP_SQL
+    if kind == "mas":
+        from omnix_core.bev.mandate_integrity_verification import MIVPEngine
+        return MIVPEngine._INSERT_MAS_SQL
+    if kind == "ogr_turn":
+        from omnix_core.govern.governance_runtime import GovernanceRuntime
+        return GovernanceRuntime._UPDATE_TURN_SQL
+    raise ValueError(f"unknown write-behind statement kind: {kind}")
+
+
+def execute_statements(cur: Any, statements: Sequence[Statement]) -> None:
+    """Run one turn's statements on an open cursor (the caller commits)."""
+    for kind, params in statements:
+        cur.execute(_statement_sql(kind), tuple(params))
+
+
+def wal_base_path() -> str:
+    return os.environ.get("OMNIX_OGR_WAL_PATH", _DEFAULT_WAL_PATH)
+
+
+def replay_wal(conn_factory: Callable[[], Any]) -> int:
+    """
+    Replay turn bundles left in the WAL by dead processes, without starting
+    a writer — for when write-behind has been switched off since they were
+    queued.  Returns the number of turns replayed.
+    """
+    from omnix_core.evidence.receipt_wal import ReceiptWAL
+
+    wal = ReceiptWAL(wal_base_path())
+    try:
+        return wal.reconcile_wal(lambda entry: _replay_entry(conn_factory, entry))
+    finally:
+        wal.close()
+
+
+def _replay_entry(conn_factory: Callable[[], Any], entry: Dict[str, Any]) -> bool:
+    if entry.get("kind") != _WAL_KIND:
+        return False
+    return _execute(conn_factory, [entry.get("statements") or []])
+
+
+def _execute(conn_factory: Callable[[], Any], groups: List[List[Statement]]) -> bool:
+    """Run the groups in one transaction. False (logged) on failure."""
+    try:
+        with conn_factory() as conn:
+            try:
+                with conn.cursor() as cur:
+                    for statements in groups:
+                        execute_statements(cur, statements)
+                conn.commit()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+        return True
+    except Exception as exc:
+        logger.warning(f"[OGR.WB] Turn write failed ({len(groups)} turn(s)): {exc}")
+        return False
+
+
+@dataclass
+class TurnBundle:
+    """All DB statements produced by one record_turn() call."""
+    session_id: str
+    turn_index: int
+    statements: List[Statement]
+    wal_id: str = ""
+    done: Optional[threading.Event] = field(default=None, repr=False)
+
+
+class TurnWriteBehind:
+    """
+    Single background writer that group-commits OGR turn bundles.
+
+    Thread-safety: submit(), pending(), flush() and reconcile() may be
+    called from any thread.
+    """
+
+    def __init__(
+        self,
+        conn_factory: Callable[[], Any],
+        wal: Any = None,
+        batch_size: Optional[int] = None,
+        flush_ms: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self._conn_factory = conn_factory
+        self._wal = wal
+        self._batch_size = max(1, int(batch_size or os.environ.get("OMNIX_OGR_WB_BATCH", "32")))
+        self._flush_ms = float(flush_ms if flush_ms is not None
+                               else os.environ.get("OMNIX_OGR_WB_FLUSH_MS", "20"))
+        self._q: "queue.Queue[TurnBundle]" = queue.Queue(
+            maxsize=int(max_queue or os.environ.get("OMNIX_OGR_WB_QUEUE", "8192"))
+        )
+        self._pending: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self.batches_committed = 0
+        self.turns_committed = 0
+        self.turns_failed = 0
+        self._pid = os.getpid()
+        self._worker = threading.Thread(
+            target=self._drain, daemon=True, name="OGRTurnWriteBehind-worker"
+        )
+        self._worker.start()
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def submit(
+        self,
+        session_id: str,
+        turn_index: int,
+        statements: List[Statement],
+        synchronous: bool = False,
+    ) -> bool:
+        """
+        Queue one turn's statements.  Returns once the bundle is durable in the
+        WAL (or, with synchronous=True, once it is committed to the DB).
+        Never raises.
+        """
+        bundle = TurnBundle(session_id=session_id, turn_index=turn_index,
+                            statements=[(k, list(p)) for k, p in statements])
+        if self._wal is not None:
+            bundle.wal_id = self._wal.wal_append({
+                "kind":       _WAL_KIND,
+                "session_id": session_id,
+                "turn_index": turn_index,
+                "statements": bundle.statements,
+            })
+        if synchronous:
+            bundle.done = threading.Event()
+        with self._cond:
+            self._pending[session_id] = self._pending.get(session_id, 0) + 1
+        try:
+            self._q.put_nowait(bundle)
+        except queue.Full:
+            logger.warning("[OGR.WB] Write-behind queue full — writing turn synchronously")
+            self._write_batch([bundle])
+            return True
+        if bundle.done is not None:
+            bundle.done.wait()
+        return True
+
+    def pending(self, session_id: Optional[str] = None) -> int:
+        """Number of submitted but not yet written turns (for one session or all)."""
+        with self._cond:
+            if session_id is None:
+                return sum(self._pending.values())
+            return self._pending.get(session_id, 0)
+
+    def flush(self, session_id: Optional[str] = None, timeout: float = 5.0) -> bool:
+        """Block until the session's (or every) pending turn is written. True if drained."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                outstanding = (sum(self._pending.values()) if session_id is None
+                               else self._pending.get(session_id, 0))
+                remaining = deadline - time.monotonic()
+                if outstanding == 0:
+                    return True
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+
+    def reconcile(self) -> int:
+        """Replay turn bundles left live in the WAL by a crash or DB outage."""
+        if self._wal is None:
+            return 0
+        return self._wal.reconcile_wal(
+            lambda entry: _replay_entry(self._conn_factory, entry)
+        )
+
+    def stop(self, drain_timeout: float = 10.0) -> None:
+        """Graceful shutdown — drain the queue then stop the worker."""
+        self._stopped.set()
+        self._worker.join(timeout=drain_timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued":            self._q.qsize(),
+            "pending_turns":     self.pending(),
+            "batches_committed": self.batches_committed,
+            "turns_committed":   self.turns_committed,
+            "turns_failed":      self.turns_failed,
+            "wal_pending":       self._wal.wal_size() if self._wal is not None else 0,
+        }
+
+    # ── Internal ──────────────────────────────────────────────────
+
+    def _drain(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                first = self._q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self._flush_ms / 1000.0
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._q.get(timeout=remaining) if remaining > 0
+                                 else self._q.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+        while True:
+            try:
+                self._write_batch([self._q.get_nowait()])
+            except queue.Empty:
+                break
+
+    def _write_batch(self, bundles: List[TurnBundle]) -> None:
+        """One transaction for the whole batch; on failure retry turn by turn."""
+        if self._execute([b.statements for b in bundles]):
+            self.batches_committed += 1
+            ok = bundles
+        else:
+            ok = [b for b in bundles if self._execute([b.statements])]
+            failed = len(bundles) - len(ok)
+            if failed:
+                self.turns_failed += failed
+                logger.error(
+                    f"[OGR.WB] {failed} turn(s) not written — kept in WAL for reconcile()"
+                )
+        self.turns_committed += len(ok)
+        if self._wal is not None:
+            for b in ok:
+                self._wal.wal_commit(b.wal_id)
+        with self._cond:
+            for b in bundles:
+                left = self._pending.get(b.session_id, 0) - 1
+                if left > 0:
+                    self._pending[b.session_id] = left
+                else:
+                    self._pending.pop(b.session_id, None)
+            self._cond.notify_all()
+        for b in bundles:
+            if b.done is not None:
+                b.done.set()
+
+    def _execute(self, groups: List[List[Statement]]) -> bool:
+        return _execute(self._conn_factory, groups)
+
+
+# ─────────────────────────────────────────────────────────────────
+#  Process-level singleton (one WAL per path)
+# ─────────────────────────────────────────────────────────────────
+
+_instance: Optional[TurnWriteBehind] = None
+_instance_lock = threading.Lock()
+
+
+def get_turn_write_behind(conn_factory: Callable[[], Any]) -> TurnWriteBehind:
+    """Process-level TurnWriteBehind.  Rebuilt after fork (the worker thread does not survive it)."""
+    global _instance
+    if _instance is None or _instance._pid != os.getpid():
+        with _instance_lock:
+            if _instance is None or _instance._pid != os.getpid():
+                from omnix_core.evidence.receipt_wal import ReceiptWAL
+                wal = ReceiptWAL(wal_base_path())
+                _instance = TurnWriteBehind(conn_factory, wal=wal)
+                logger.info(
+                    f"[OGR.WB] Turn write-behind started — wal={wal.wal_path} "
+                    f"pending={wal.wal_size()}"
+                )
+    return _instance
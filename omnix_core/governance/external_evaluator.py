@@ -13,7 +13,7 @@ ADR-053: Trajectory Invariant Enforcement (TIE) — post-pipeline gate
 
 import logging
 import os
-from typing import Any
+from typing import Any, Sequence
 
 try:
     from omnix_core.governance.trajectory_invariant_engine import (
@@ -123,6 +123,23 @@ def validate_threshold_against_floor(checkpoint_id: str, threshold: float) -> tu
         )
     return True, ""
 
+
+def _batch_columns(batch: Any, np: Any) -> dict[str, Any]:
+    """Normalise a dict of arrays / structured array into float64 columns."""
+    names = getattr(getattr(batch, "dtype", None), "names", None)
+    if names:
+        raw = {name: batch[name] for name in names}
+    elif isinstance(batch, dict):
+        raw = dict(batch)
+    else:
+        raise TypeError("batch must be a dict of arrays or a NumPy structured array")
+    columns = {name: np.asarray(col, dtype=np.float64).reshape(-1) for name, col in raw.items()}
+    lengths = {len(col) for col in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"batch columns have different lengths: {sorted(lengths)}")
+    return columns
+
+
 CHECKPOINT_DEFAULTS = [
     {
         "id": "CP-0",
@@ -277,11 +294,210 @@ class GovernanceEvaluationEngine:
             }
         """
         metadata = metadata or {}
-        gate_results = []
         veto_chain = []
         decision_trace = []
+        cfg = compliance_config or {}
+
+        early, avm_block, context_admission_block = self._admission_stage(
+            signals, asset, domain, metadata, cfg, decision_trace, veto_chain,
+        )
+        if early is not None:
+            return early
+
+        resolved_signals, applied_defaults = self._resolve_signals(signals, decision_trace)
+
+        gate_results = []
         overall_blocked = False
+        for cp in self.checkpoints:
+            score = resolved_signals.get(cp["signal"], 0.0)
+            if cp["operator"] == "gte":
+                passed = score >= cp["threshold"]
+            elif cp["operator"] == "lte":
+                passed = score <= cp["threshold"]
+            else:
+                passed = False
+            if not self._record_gate(cp, score, passed, gate_results, decision_trace, veto_chain):
+                overall_blocked = True
+
+        return self._finalize(
+            overall_blocked, asset, domain, metadata, cfg, compliance_config,
+            resolved_signals, applied_defaults, gate_results, decision_trace, veto_chain,
+            avm_block, context_admission_block,
+        )
+
+    def evaluate_batch(
+        self,
+        batch: Any,
+        asset: str | Sequence[str] = "UNKNOWN",
+        domain: str = "generic",
+        metadata: dict[str, Any] | Sequence[dict[str, Any] | None] | None = None,
+        compliance_config: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate a columnar batch of signal vectors.
+
+        `batch` is a dict of equal-length arrays (signal name → column) or a
+        NumPy structured array whose field names are signal names. NaN marks a
+        signal as not supplied for that row, exactly like omitting the key from
+        the dict passed to evaluate(). `asset` and `metadata` may be given once
+        for the whole batch or per row.
+
+        The 11-checkpoint grid — default substitution, every threshold
+        comparison, the veto mask and the per-row blocked flag — is computed
+        column-wise. The pre-pipeline gates (Layer 0, AVM, CAG) and the
+        post-pipeline gates (CP-9/10/11, TIE) still run per row because they
+        depend on asset, per-row context and external state.
+
+        Returns one result per row, equal to evaluate(row_signals, ...) —
+        used by replay, backfill and multi-asset scans.
+        """
+        import numpy as np
+
+        columns = _batch_columns(batch, np)
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        assets = [asset] * n_rows if isinstance(asset, str) else list(asset)
+        if len(assets) != n_rows:
+            raise ValueError(f"asset has {len(assets)} entries for a batch of {n_rows} rows")
+        if metadata is None or isinstance(metadata, dict):
+            metadatas = [metadata] * n_rows
+        else:
+            metadatas = list(metadata)
+            if len(metadatas) != n_rows:
+                raise ValueError(f"metadata has {len(metadatas)} entries for a batch of {n_rows} rows")
+        if n_rows == 0:
+            return []
+
+        supplied = {name: ~np.isnan(col) for name, col in columns.items()}
+
+        # ── Vectorized checkpoint grid: rows × checkpoints ───────────────────
+        def _resolved(signal_name: str):
+            fallback = OPTIONAL_SIGNAL_DEFAULTS.get(signal_name, 0.0)
+            if signal_name not in columns:
+                return np.full(n_rows, fallback, dtype=np.float64)
+            return np.where(supplied[signal_name], columns[signal_name], fallback)
+
+        scores = np.column_stack([_resolved(cp["signal"]) for cp in self.checkpoints])
+        thresholds = np.array([float(cp["threshold"]) for cp in self.checkpoints])
+        operators = np.array([cp["operator"] for cp in self.checkpoints])
+        passed = np.where(
+            operators == "gte", scores >= thresholds,
+            np.where(operators == "lte", scores <= thresholds, False),
+        )
+        blocked = ~passed.all(axis=1)
+
+        # Gate scores and condition text per column; per-checkpoint templates
+        # keep evaluate()'s key order, so the row loop below only fills in the
+        # row-specific fields
+        passed_rows = passed.tolist()
+        score_cols = scores.T.tolist()
+        condition_cols = []
+        gate_templates = []
+        veto_templates = []
+        trace_prefixes = []
+        for cp, col in zip(self.checkpoints, score_cols):
+            threshold = cp["threshold"]
+            if cp["operator"] == "gte":
+                condition_cols.append([f"{score:.1f} ≥ {threshold}" for score in col])
+            elif cp["operator"] == "lte":
+                condition_cols.append([f"{score:.1f} ≤ {threshold}" for score in col])
+            else:
+                condition_cols.append([f"unknown operator: {cp['operator']}"] * n_rows)
+            gate_templates.append({
+                "checkpoint": cp["id"],
+                "name": cp["name"],
+                "signal": cp["signal"],
+                "score": None,
+                "threshold": threshold,
+                "condition": None,
+                "result": None,
+                "description": cp["description"],
+                "optional": cp.get("optional", False),
+            })
+            veto_templates.append({
+                "checkpoint_id": cp["id"],
+                "checkpoint_name": cp["name"],
+                "signal": cp["signal"],
+                "score": None,
+                "threshold": threshold,
+                "result": "VETO",
+            })
+            trace_prefixes.append(f"{cp['id']} {cp['name']}: ")
+        n_checkpoints = len(self.checkpoints)
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Per-row signal dicts, built once from the columns (NaN → omitted)
+        names = list(columns)
+        values = [columns[name].tolist() for name in names]
+        present = [supplied[name].tolist() for name in names]
+
         cfg = compliance_config or {}
+        results: list[dict[str, Any]] = []
+        for i in range(n_rows):
+            signals = {
+                name: values[k][i] for k, name in enumerate(names) if present[k][i]
+            }
+            row_asset = assets[i]
+            row_metadata = metadatas[i] or {}
+            veto_chain: list = []
+            decision_trace: list = []
+
+            early, avm_block, context_admission_block = self._admission_stage(
+                signals, row_asset, domain, row_metadata, cfg, decision_trace, veto_chain,
+            )
+            if early is not None:
+                results.append(early)
+                continue
+
+            resolved_signals, applied_defaults = self._resolve_signals(signals, decision_trace)
+
+            gate_results: list = []
+            row_passed = passed_rows[i]
+            for j in range(n_checkpoints):
+                score = score_cols[j][i]
+                condition_str = condition_cols[j][i]
+                result = "PASS" if row_passed[j] else "BLOCKED"
+                gate = gate_templates[j].copy()
+                gate["score"] = score
+                gate["condition"] = condition_str
+                gate["result"] = result
+                gate_results.append(gate)
+                trace_entry = f"{trace_prefixes[j]}{condition_str} → {result}"
+                decision_trace.append(trace_entry)
+                if debug:
+                    logger.debug(trace_entry)
+                if not row_passed[j]:
+                    veto = veto_templates[j].copy()
+                    veto["score"] = score
+                    veto_chain.append(veto)
+
+            results.append(self._finalize(
+                bool(blocked[i]), row_asset, domain, row_metadata, cfg, compliance_config,
+                resolved_signals, applied_defaults, gate_results, decision_trace, veto_chain,
+                avm_block, context_admission_block,
+            ))
+        return results
+
+    # ── Pipeline stages (shared by evaluate and evaluate_batch) ─────────────
+
+    def _admission_stage(
+        self,
+        signals: dict[str, float],
+        asset: str,
+        domain: str,
+        metadata: dict[str, Any],
+        cfg: dict[str, Any],
+        decision_trace: list,
+        veto_chain: list,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Layer 0 (SAE), AVM and CAG — the pre-pipeline gates.
+
+        Returns (early_result, avm_block, context_admission_block); early_result
+        is the complete BLOCKED response when a gate stops the request before
+        any checkpoint runs, otherwise None.
+        """
+        avm_block: dict[str, Any] | None = None
+        context_admission_block: dict[str, Any] | None = None
 
         # ── Layer 0: Structural Admissibility Engine — pre-construction gate ─────
         # Runs BEFORE everything else — constitutive, not evaluative.
@@ -335,7 +551,7 @@ class GovernanceEvaluationEngine:
                             f"asset={asset} op={_sae_operation} jur={_sae_jurisdiction}"
                         )
                         all_signals = list(REQUIRED_SIGNALS) + list(OPTIONAL_SIGNAL_DEFAULTS.keys())
-                        return {
+                        early = {
                             "decision": "BLOCKED",
                             "asset": asset,
                             "domain": domain,
@@ -366,6 +582,7 @@ class GovernanceEvaluationEngine:
                             "checkpoints_passed": 0,
                             "checkpoints_blocked": 1,
                         }
+                        return early, avm_block, context_admission_block
                     logger.debug(
                         f"[Layer 0] ADMISSIBLE — {_layer0_result} "
                         f"→ proceeding to Layer 1"
@@ -376,7 +593,7 @@ class GovernanceEvaluationEngine:
                         f"asset={asset} domain={domain}"
                     )
                     all_signals = list(REQUIRED_SIGNALS) + list(OPTIONAL_SIGNAL_DEFAULTS.keys())
-                    return {
+                    early = {
                         "decision": "BLOCKED",
                         "asset": asset,
                         "domain": domain,
@@ -396,12 +613,12 @@ class GovernanceEvaluationEngine:
                         "checkpoints_passed": 0,
                         "checkpoints_blocked": 1,
                     }
+                    return early, avm_block, context_admission_block
 
         # ── AVM: Assumption Validity Monitor — pre-pipeline drift gate ─────────
         # Runs after Layer 0 — before CAG, before any checkpoint.
         # If calibration assumptions have drifted beyond tolerance, no evaluation
         # is performed and no receipt can be certified. ADR-064.
-        avm_block: dict[str, Any] | None = None
         if _AVM_AVAILABLE:
             try:
                 avm_enabled = cfg.get("avm_enabled",
@@ -468,7 +685,7 @@ class GovernanceEvaluationEngine:
                                 f"[AVM] event-driven suspension skipped: {_avm_susp_err}"
                             )
                         all_signals = list(REQUIRED_SIGNALS) + list(OPTIONAL_SIGNAL_DEFAULTS.keys())
-                        return {
+                        early = {
                             "decision": "BLOCKED",
                             "asset": asset,
                             "domain": domain,
@@ -482,6 +699,7 @@ class GovernanceEvaluationEngine:
                             "checkpoints_blocked": 0,
                             "avm_result": avm_block,
                         }
+                        return early, avm_block, context_admission_block
                     else:
                         if avm_result.warnings:
                             for w in avm_result.warnings:
@@ -524,7 +742,6 @@ class GovernanceEvaluationEngine:
         # ── CAG: Context Admission Gate — session-level pre-admission ──────────
         # Runs BEFORE any signal enters the checkpoint pipeline.
         # If CAG blocks, no executable state is formed — pipeline never starts.
-        context_admission_block: dict[str, Any] | None = None
         if _CAG_AVAILABLE:
             try:
                 cag_enabled = cfg.get("cag_enabled",
@@ -631,7 +848,7 @@ class GovernanceEvaluationEngine:
                             "checkpoints_blocked": 0,
                             "context_admission": context_admission_block,
                         }
-                        return result
+                        return result, avm_block, context_admission_block
                     else:
                         decision_trace.append(
                             f"CAG SESSION_ADMITTED: score={cag_result.admission_score:.0f}/100"
@@ -640,6 +857,12 @@ class GovernanceEvaluationEngine:
                 logger.warning(f"⚠️ [CAG] Exception in B2B evaluate: {e} → pass-through")
         # ─────────────────────────────────────────────────────────────────────
 
+        return None, avm_block, context_admission_block
+
+    def _resolve_signals(
+        self, signals: dict[str, float], decision_trace: list,
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """Apply OPTIONAL_SIGNAL_DEFAULTS; returns (resolved_signals, applied_defaults)."""
         resolved_signals = dict(signals)
         applied_defaults: dict[str, float] = {}
         for opt_signal, default_val in OPTIONAL_SIGNAL_DEFAULTS.items():
@@ -659,51 +882,75 @@ class GovernanceEvaluationEngine:
             )
             logger.debug(f"[EPISTEMIC] SIGNAL_DEFAULT_APPLIED: {sig}={val:.1f}{cp_str}")
         # ─────────────────────────────────────────────────────────────────────
+        return resolved_signals, applied_defaults
 
-        for cp in self.checkpoints:
-            signal_name = cp["signal"]
-            threshold = cp["threshold"]
-            operator = cp["operator"]
-            score = resolved_signals.get(signal_name, 0.0)
-
-            if operator == "gte":
-                passed = score >= threshold
-                condition_str = f"{score:.1f} ≥ {threshold}"
-            elif operator == "lte":
-                passed = score <= threshold
-                condition_str = f"{score:.1f} ≤ {threshold}"
-            else:
-                passed = False
-                condition_str = f"unknown operator: {operator}"
+    @staticmethod
+    def _record_gate(
+        cp: dict[str, Any],
+        score: float,
+        passed: bool,
+        gate_results: list,
+        decision_trace: list,
+        veto_chain: list,
+    ) -> bool:
+        """Append one checkpoint outcome to the gate results, trace and veto chain."""
+        signal_name = cp["signal"]
+        threshold = cp["threshold"]
+        operator = cp["operator"]
+        if operator == "gte":
+            condition_str = f"{score:.1f} ≥ {threshold}"
+        elif operator == "lte":
+            condition_str = f"{score:.1f} ≤ {threshold}"
+        else:
+            passed = False
+            condition_str = f"unknown operator: {operator}"
 
-            result = "PASS" if passed else "BLOCKED"
-            gate_results.append({
-                "checkpoint": cp["id"],
-                "name": cp["name"],
+        result = "PASS" if passed else "BLOCKED"
+        gate_results.append({
+            "checkpoint": cp["id"],
+            "name": cp["name"],
+            "signal": signal_name,
+            "score": score,
+            "threshold": threshold,
+            "condition": condition_str,
+            "result": result,
+            "description": cp["description"],
+            "optional": cp.get("optional", False),
+        })
+
+        trace_entry = f"{cp['id']} {cp['name']}: {condition_str} → {result}"
+        decision_trace.append(trace_entry)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(trace_entry)
+
+        if not passed:
+            veto_chain.append({
+                "checkpoint_id": cp["id"],
+                "checkpoint_name": cp["name"],
                 "signal": signal_name,
                 "score": score,
                 "threshold": threshold,
-                "condition": condition_str,
-                "result": result,
-                "description": cp["description"],
-                "optional": cp.get("optional", False),
+                "result": "VETO",
             })
+        return bool(passed)
 
-            trace_entry = f"{cp['id']} {cp['name']}: {condition_str} → {result}"
-            decision_trace.append(trace_entry)
-            logger.debug(trace_entry)
-
-            if not passed:
-                overall_blocked = True
-                veto_chain.append({
-                    "checkpoint_id": cp["id"],
-                    "checkpoint_name": cp["name"],
-                    "signal": signal_name,
-                    "score": score,
-                    "threshold": threshold,
-                    "result": "VETO",
-                })
-
+    def _finalize(
+        self,
+        overall_blocked: bool,
+        asset: str,
+        domain: str,
+        metadata: dict[str, Any],
+        cfg: dict[str, Any],
+        compliance_config: dict[str, Any] | None,
+        resolved_signals: dict[str, float],
+        applied_defaults: dict[str, float],
+        gate_results: list,
+        decision_trace: list,
+        veto_chain: list,
+        avm_block: dict[str, Any] | None,
+        context_admission_block: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Compliance gates (CP-9/10/11), TIE, and the response envelope."""
         decision = "BLOCKED" if overall_blocked else "APPROVED"
 
         compliance_blocks: dict[str, Any] = {}
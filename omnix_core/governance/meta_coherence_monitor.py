@@ -411,6 +411,11 @@ class MetaCoherenceMonitor:
         if not self._db_url:
             logger.warning("[MCM] No DB URL — operating in offline mode")
 
+    def _connect(self):
+        """Pooled connection ("governance" subsystem); conn.close() returns it."""
+        from omnix_services.database_service.connection_provider import get_connection
+        return get_connection("governance", self._db_url)
+
     # ── Public API ─────────────────────────────────────────────────────────────
 
     def run_full_analysis(
@@ -543,8 +548,7 @@ class MetaCoherenceMonitor:
             return False
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             rows_written = 0
@@ -713,8 +717,7 @@ class MetaCoherenceMonitor:
             return result
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             # Pull verdict counts for both windows in one query.
@@ -894,8 +897,7 @@ class MetaCoherenceMonitor:
             return result
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             cur.execute("""
@@ -1045,8 +1047,7 @@ class MetaCoherenceMonitor:
             return result
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             # Load AVM calibration snapshot for this domain
@@ -1241,8 +1242,7 @@ class MetaCoherenceMonitor:
             return result
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             # Pull per-period verdict counts using DATE_TRUNC for stable weekly
@@ -1708,8 +1708,7 @@ class MetaCoherenceMonitor:
         if not self._db_url:
             return []
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
             cur.execute(
                 "SELECT domain FROM avm_calibration_snapshots WHERE is_active = true ORDER BY domain"
@@ -1746,8 +1745,7 @@ class MetaCoherenceMonitor:
             return False
 
         try:
-            import psycopg
-            conn = psycopg.connect(self._db_url)
+            conn = self._connect()
             cur  = conn.cursor()
 
             # ── Rate-limit: 1 remediation per domain per 6h ────────────────────
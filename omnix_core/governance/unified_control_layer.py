@@ -653,12 +653,14 @@ class UnifiedDecisionControlLayer:
         client_id:  str,
         metadata:   dict,
         control_id: str,
+        receipt_engine=None,
     ) -> tuple:
         """Returns (PillarResult, receipt_id: str | None)."""
         t0         = time.perf_counter()
         receipt_id = None
         try:
-            receipt_engine = self._receipt_engine_cls()
+            if receipt_engine is None:
+                receipt_engine = self._receipt_engine_cls()
             prev_hash      = receipt_engine.get_last_hash()
             decision_payload = {
                 "symbol":      asset,
@@ -675,12 +677,10 @@ class UnifiedDecisionControlLayer:
                     "udcl_adr":        "ADR-138",
                 },
             }
-            receipt    = receipt_engine.generate_receipt(
-                decision_payload = decision_payload,
-                prev_hash        = prev_hash,
-                client_id        = client_id,
-                domain           = domain,
-            )
+            receipt    = receipt_engine.generate_receipt(decision_payload, prev_hash=prev_hash)
+            receipt["client_id"] = client_id
+            receipt["domain"]    = domain
+            receipt_engine.store_receipt(receipt)
             receipt_id = receipt.get("receipt_id")
             return PillarResult(
                 pillar    = "pqc_receipt",
@@ -858,6 +858,7 @@ class UnifiedDecisionControlLayer:
         cbg_enabled:          bool           = False,
         ctag_enabled:         bool           = False,
         cag_enabled:          bool           = False,
+        receipt_engine                       = None,
     ) -> ControlReceipt:
         """
         Full multi-pillar governance evaluation. Returns ControlReceipt.
@@ -881,6 +882,9 @@ class UnifiedDecisionControlLayer:
                           Fail-closed: exception → BLOCKED per ADR-116.
             ctag_enabled: If True, Commit-Time Admissibility Gate (Layer 5) runs.
                           Requires metadata["ctag_original_control"] to be set.
+            receipt_engine: Optional receipt engine instance for Layer 3 instead of
+                          a fresh receipt_engine_cls(). Batch callers pass a
+                          ReceiptBatch so receipts are linked and written together.
         """
         t_total           = time.perf_counter()
         control_id        = self._new_control_id()
@@ -941,6 +945,7 @@ class UnifiedDecisionControlLayer:
         # Generate PQC receipt regardless of pipeline decision (BLOCKED receipts are auditable)
         pqc_r, receipt_id = self._run_pqc_receipt(
             evaluation, asset, domain, client_id, metadata, control_id,
+            receipt_engine=receipt_engine,
         )
         pillar_results.append(pqc_r)
 
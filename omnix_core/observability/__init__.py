@@ -22,6 +22,7 @@ Usage:
     with registry.phase_timer(session_id, PHASE_CTCHC_HASH):
         ...
     snapshot = registry.export_snapshot()
+    text     = registry.export_prometheus()   # Prometheus text format 0.0.4
 """
 
 from omnix_core.observability.metrics import (
@@ -31,6 +32,7 @@ from omnix_core.observability.metrics import (
     MetricsSnapshot,
     LatencyHistogram,
     ErrorCounter,
+    PROMETHEUS_CONTENT_TYPE,
     PHASE_SESSION_START,
     PHASE_TURN_RECORD,
     PHASE_SESSION_CLOSE,
@@ -52,6 +54,7 @@ __all__ = [
     "MetricsSnapshot",
     "LatencyHistogram",
     "ErrorCounter",
+    "PROMETHEUS_CONTENT_TYPE",
     "PHASE_SESSION_START",
     "PHASE_TURN_RECORD",
     "PHASE_SESSION_CLOSE",
@@ -23,17 +23,20 @@ Harold Nunes — OMNIX QUANTUM LTD — May 2026 — ADR-198
 """
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+import math
 import os
 import threading
 import time
 import uuid
-from collections import defaultdict, deque
+import weakref
+from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.Observability.GOL")
 
@@ -71,75 +74,267 @@ _ERROR_BUCKETS = (
     "Other",
 )
 
-# Histogram window size (number of samples kept per phase)
+# Histogram window size (number of recent samples the percentiles cover)
 _HISTOGRAM_WINDOW = int(os.environ.get("OMNIX_OBS_HISTOGRAM_WINDOW", "1000"))
 
+# Log-bucket sketch: every bucket spans a (1 ± accuracy) relative band, so any
+# reported percentile is within `accuracy` of a real sample.  Values are
+# clamped to [_HIST_MIN_MS, _HIST_MAX_MS] (1 µs … 1 h → ≤ ~1100 buckets).
+_HIST_ACCURACY = float(os.environ.get("OMNIX_OBS_HISTOGRAM_ACCURACY", "0.01"))
+_HIST_MIN_MS   = 1e-3
+_HIST_MAX_MS   = 3_600_000.0
+
+# Prometheus `le` bounds (ms) for phase latency histograms
+_PROM_BUCKETS_MS = tuple(
+    float(b) for b in os.environ.get(
+        "OMNIX_OBS_PROM_BUCKETS_MS",
+        "0.5,1,2.5,5,10,25,50,100,250,500,1000,2500,5000,10000",
+    ).split(",") if b.strip()
+)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  LatencyHistogram
 # ─────────────────────────────────────────────────────────────────────────────
 
-class LatencyHistogram:
+class _LogBuckets:
+    """Sparse log-bucket counts plus exact count / sum / min / max. Mergeable."""
+
+    __slots__ = ("counts", "count", "total", "low", "high")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.low   = math.inf
+        self.high  = -math.inf
+
+    def add(self, index: int, value: float) -> None:
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.low:
+            self.low = value
+        if value > self.high:
+            self.high = value
+
+    def merge(self, other: "_LogBuckets") -> None:
+        counts = self.counts
+        for index, n in other.counts.items():
+            counts[index] = counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.low    = min(self.low, other.low)
+        self.high   = max(self.high, other.high)
+
+
+class _HistogramShard:
     """
-    Rolling-window latency histogram with p50 / p95 / p99 / min / max / mean.
+    One thread's slice of a LatencyHistogram.
 
-    Thread-safe. Window size is configurable via OMNIX_OBS_HISTOGRAM_WINDOW.
-    All values stored in milliseconds.
+    `current` / `previous` are the two newest window generations (percentiles);
+    `cumulative` never rolls over (Prometheus _bucket / _sum / _count).
+    The lock is only contended while a snapshot merges this shard.
     """
 
-    __slots__ = ("_phase", "_window", "_lock", "_samples", "_total", "_count")
+    __slots__ = ("lock", "epoch", "current", "previous", "cumulative", "thread")
 
-    def __init__(self, phase: str, window: int = _HISTOGRAM_WINDOW) -> None:
-        self._phase   = phase
-        self._window  = window
-        self._lock    = threading.Lock()
-        self._samples: deque[float] = deque(maxlen=window)
-        self._total   = 0.0
-        self._count   = 0
+    def __init__(self, epoch: int, thread: Optional[threading.Thread]) -> None:
+        self.lock       = threading.Lock()
+        self.epoch      = epoch
+        self.current    = _LogBuckets()
+        self.previous   = _LogBuckets()
+        self.cumulative = _LogBuckets()
+        self.thread     = weakref.ref(thread) if thread is not None else None
+
+    def align(self, epoch: int) -> None:
+        """Roll generations forward to `epoch`. Caller holds self.lock."""
+        if epoch == self.epoch:
+            return
+        self.previous = self.current if epoch == self.epoch + 1 else _LogBuckets()
+        self.current  = _LogBuckets()
+        self.epoch    = epoch
+
+    def alive(self) -> bool:
+        thread = self.thread() if self.thread is not None else None
+        return thread is not None and thread.is_alive()
+
+
+class LatencyHistogram:
+    """
+    Streaming latency histogram with p50 / p95 / p99 / min / max / mean.
+
+    Constant memory: samples go into log-spaced buckets (relative accuracy
+    OMNIX_OBS_HISTOGRAM_ACCURACY, default 1 %) instead of a sorted window.
+    Each recording thread owns a shard, so record() takes only its own
+    uncontended lock; snapshots merge the shards in O(buckets).
+
+    Percentiles / min / max cover the most recent samples: the window rolls
+    over every OMNIX_OBS_HISTOGRAM_WINDOW / 2 samples and the newest two
+    generations are reported, i.e. between window/2 and window samples.
+    count / mean and the Prometheus buckets are cumulative and survive
+    rollover.  All values in milliseconds.  Thread-safe.
+    """
+
+    __slots__ = ("_phase", "_window", "_rollover", "_lock", "_local", "_shards",
+                 "_retired", "_seq", "_epoch", "_inv_log_gamma", "_gamma")
+
+    def __init__(self, phase: str, window: int = _HISTOGRAM_WINDOW,
+                 accuracy: float = _HIST_ACCURACY) -> None:
+        self._phase    = phase
+        self._window   = window
+        self._rollover = max(1, window // 2)
+        self._lock     = threading.Lock()
+        self._local    = threading.local()
+        self._shards: List[_HistogramShard] = []
+        self._retired  = _HistogramShard(0, None)
+        self._seq      = itertools.count(1)
+        self._epoch    = 0
+        self._gamma    = (1.0 + accuracy) / (1.0 - accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+
+    # ── Recording ─────────────────────────────────────────────────────────────
 
     def record(self, elapsed_ms: float) -> None:
+        value = min(max(float(elapsed_ms), _HIST_MIN_MS), _HIST_MAX_MS)
+        index = math.ceil(math.log(value) * self._inv_log_gamma)
+        if next(self._seq) % self._rollover == 0:
+            with self._lock:
+                self._epoch += 1
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+        with shard.lock:
+            shard.align(self._epoch)
+            shard.current.add(index, value)
+            shard.cumulative.add(index, value)
+
+    def _new_shard(self) -> _HistogramShard:
+        shard = _HistogramShard(self._epoch, threading.current_thread())
         with self._lock:
-            self._samples.append(elapsed_ms)
-            self._total += elapsed_ms
-            self._count += 1
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
 
-    def percentile(self, p: float) -> Optional[float]:
+    # ── Merging ───────────────────────────────────────────────────────────────
+
+    def _merged(self) -> Tuple[_LogBuckets, _LogBuckets]:
+        """(window, cumulative) merged across shards; folds dead threads' shards."""
+        window, cumulative = _LogBuckets(), _LogBuckets()
+        with self._lock:
+            epoch = self._epoch
+            dead = [s for s in self._shards if not s.alive()]
+            if dead:
+                self._shards = [s for s in self._shards if s.alive()]
+            shards = list(self._shards)
+            retired = self._retired
+            with retired.lock:
+                retired.align(epoch)
+                for shard in dead:
+                    with shard.lock:
+                        shard.align(epoch)
+                        retired.current.merge(shard.current)
+                        retired.previous.merge(shard.previous)
+                        retired.cumulative.merge(shard.cumulative)
+        for shard in shards + [retired]:
+            with shard.lock:
+                if shard.epoch == epoch:
+                    window.merge(shard.previous)
+                    window.merge(shard.current)
+                elif shard.epoch == epoch - 1:
+                    window.merge(shard.current)
+                cumulative.merge(shard.cumulative)
+        return window, cumulative
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Fold another histogram's samples into this one (same accuracy required)."""
+        if other._gamma != self._gamma:
+            raise ValueError("cannot merge histograms with different accuracy")
+        window, cumulative = other._merged()
         with self._lock:
-            if not self._samples:
-                return None
-            sorted_samples = sorted(self._samples)
-            idx = int(len(sorted_samples) * p / 100.0)
-            idx = min(idx, len(sorted_samples) - 1)
-            return round(sorted_samples[idx], 3)
+            retired = self._retired
+            with retired.lock:
+                retired.align(self._epoch)
+                retired.current.merge(window)
+                retired.cumulative.merge(cumulative)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of (gamma^(i-1), gamma^i] with equal relative error to both ends
+        return 2.0 * self._gamma ** index / (self._gamma + 1.0)
+
+    def _quantiles(self, buckets: _LogBuckets, ps: Tuple[float, ...]) -> List[Optional[float]]:
+        """Nearest-rank percentiles from one pass over the sorted buckets."""
+        if not buckets.count:
+            return [None] * len(ps)
+        ranks = [min(int(buckets.count * p / 100.0), buckets.count - 1) for p in ps]
+        out: List[Optional[float]] = [None] * len(ps)
+        order = sorted(range(len(ps)), key=lambda k: ranks[k])
+        seen, k = 0, 0
+        for index in sorted(buckets.counts):
+            seen += buckets.counts[index]
+            while k < len(order) and ranks[order[k]] < seen:
+                value = min(max(self._value(index), buckets.low), buckets.high)
+                out[order[k]] = round(value, 3)
+                k += 1
+            if k == len(order):
+                break
+        return out
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def percentile(self, p: float) -> Optional[float]:
+        return self._quantiles(self._merged()[0], (p,))[0]
 
     def mean(self) -> Optional[float]:
-        with self._lock:
-            if not self._count:
-                return None
-            return round(self._total / self._count, 3)
+        cumulative = self._merged()[1]
+        if not cumulative.count:
+            return None
+        return round(cumulative.total / cumulative.count, 3)
 
     def minimum(self) -> Optional[float]:
-        with self._lock:
-            return round(min(self._samples), 3) if self._samples else None
+        window = self._merged()[0]
+        return round(window.low, 3) if window.count else None
 
     def maximum(self) -> Optional[float]:
-        with self._lock:
-            return round(max(self._samples), 3) if self._samples else None
+        window = self._merged()[0]
+        return round(window.high, 3) if window.count else None
 
     def sample_count(self) -> int:
-        with self._lock:
-            return self._count
+        return self._merged()[1].count
+
+    def cumulative_buckets(self, bounds: Tuple[float, ...] = _PROM_BUCKETS_MS) -> Dict[str, Any]:
+        """
+        Cumulative (never rolled over) counts per upper bound, for Prometheus
+        histograms: {"buckets": [(le, count≤le), …], "count": n, "sum": ms}.
+        """
+        cumulative = self._merged()[1]
+        edges = sorted(bounds)
+        per_edge = [0] * len(edges)
+        for index, n in cumulative.counts.items():
+            value = self._value(index)
+            for e, edge in enumerate(edges):
+                if value <= edge:
+                    per_edge[e] += n
+                    break
+        running, buckets = 0, []
+        for edge, n in zip(edges, per_edge):
+            running += n
+            buckets.append((edge, running))
+        return {"buckets": buckets, "count": cumulative.count, "sum": cumulative.total}
 
     def to_dict(self) -> Dict[str, Any]:
+        window, cumulative = self._merged()
+        p50, p95, p99 = self._quantiles(window, (50, 95, 99))
         return {
             "phase":   self._phase,
-            "count":   self.sample_count(),
-            "p50_ms":  self.percentile(50),
-            "p95_ms":  self.percentile(95),
-            "p99_ms":  self.percentile(99),
-            "min_ms":  self.minimum(),
-            "max_ms":  self.maximum(),
-            "mean_ms": self.mean(),
+            "count":   cumulative.count,
+            "p50_ms":  p50,
+            "p95_ms":  p95,
+            "p99_ms":  p99,
+            "min_ms":  round(window.low, 3) if window.count else None,
+            "max_ms":  round(window.high, 3) if window.count else None,
+            "mean_ms": round(cumulative.total / cumulative.count, 3) if cumulative.count else None,
         }
 
 
@@ -262,6 +457,9 @@ class DBPoolStatsSnapshot:
     requests_waiting:  int
     avg_query_time_ms: float
     total_requests:    int
+    # Per-subsystem pools from connection_provider — "<driver>:<subsystem>" → stats
+    # (size, in_use, timeouts, pool-wait p50/p95/p99 ms)
+    subsystems:        Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -313,6 +511,46 @@ class MetricsSnapshot:
         return True
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  Prometheus text exposition helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# connection_provider per-pool stat → (metric suffix, type)
+_PROM_POOL_FIELDS = (
+    ("pool_size",      "size",            "gauge"),
+    ("pool_available", "available",       "gauge"),
+    ("in_use",         "in_use",          "gauge"),
+    ("peak_in_use",    "peak_in_use",     "gauge"),
+    ("opened",         "opened_total",    "counter"),
+    ("acquired",       "acquired_total",  "counter"),
+    ("timeouts",       "timeouts_total",  "counter"),
+    ("discarded",      "discarded_total", "counter"),
+)
+
+
+def _prom_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(round(value, 6))
+
+
+def _prom_labels(**labels: str) -> str:
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  GovernanceMetricsRegistry — singleton
 # ─────────────────────────────────────────────────────────────────────────────
@@ -330,6 +568,7 @@ class GovernanceMetricsRegistry:
         registry.on_db_error(exc)
         registry.observe_pool_stats()          # call periodically
         snapshot = registry.export_snapshot()  # export at any time
+        text = registry.export_prometheus()    # GET /metrics scrape body
 
     OBS-INV-001 — All lifecycle events emit metrics here.
     OBS-INV-005 — No PII stored. agent_id and session payload are NOT recorded.
@@ -541,16 +780,25 @@ class GovernanceMetricsRegistry:
 
     def observe_pool_stats(self) -> Optional[DBPoolStatsSnapshot]:
         """
-        Pull current pool stats from DatabaseGateway and store them.
-        Returns the snapshot, or None if DatabaseGateway is unavailable.
+        Pull current pool stats from DatabaseGateway and the per-subsystem
+        pools of connection_provider (pool-wait latency, timeouts) and store them.
+        Returns the snapshot, or None if neither source is available.
 
         OBS-INV-003: values are stored verbatim, not interpolated.
         """
+        raw: Dict[str, Any] = {}
+        subsystems: Dict[str, Any] = {}
         try:
             from omnix_services.database_service.database_gateway import DatabaseGateway
             raw = DatabaseGateway.get_pool_stats()
         except Exception as exc:
-            logger.debug("[GOL] observe_pool_stats unavailable: %s", exc)
+            logger.debug("[GOL] observe_pool_stats gateway unavailable: %s", exc)
+        try:
+            from omnix_services.database_service.connection_provider import get_pool_stats
+            subsystems = get_pool_stats()
+        except Exception as exc:
+            logger.debug("[GOL] observe_pool_stats provider unavailable: %s", exc)
+        if not raw and not subsystems:
             return None
 
         snapshot = DBPoolStatsSnapshot(
@@ -561,6 +809,7 @@ class GovernanceMetricsRegistry:
             requests_waiting  = int(raw.get("requests_waiting", 0)),
             avg_query_time_ms = float(raw.get("avg_query_time_ms", 0.0)),
             total_requests    = int(raw.get("total_requests", 0)),
+            subsystems        = subsystems,
         )
         with self._registry_lock:
             self._latest_pool_snapshot = snapshot
@@ -618,6 +867,96 @@ class GovernanceMetricsRegistry:
             throughput_turns_per_min    = throughput_turns,
         )
 
+    def export_prometheus(self) -> str:
+        """
+        Render the registry in Prometheus text exposition format 0.0.4.
+
+        Phase latencies are exported twice: as a cumulative histogram
+        (omnix_gol_phase_latency_ms_bucket / _sum / _count, `le` bounds from
+        OMNIX_OBS_PROM_BUCKETS_MS) and as windowed quantile gauges.  Pool
+        stats are refreshed on every scrape.  OBS-INV-005: labels are phase,
+        tier, error class and pool name only.
+        """
+        self.observe_pool_stats()
+        with self._registry_lock:
+            counters = (
+                ("sessions_started", self._sessions_started, "Governance sessions opened."),
+                ("sessions_closed",  self._sessions_closed,  "Governance sessions closed normally."),
+                ("sessions_halted",  self._sessions_halted,  "Governance sessions halted."),
+                ("turns",            self._turns_total,      "Governance turns recorded."),
+            )
+            sessions_active = sum(
+                1 for m in self._active_sessions.values() if m.status == "ACTIVE"
+            )
+            mandate_tiers = dict(self._mandate_tiers)
+            pool_snap     = self._latest_pool_snapshot
+
+        out: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+
+        for key, value, help_text in counters:
+            family(f"omnix_gol_{key}_total", "counter", help_text)
+            out.append(f"omnix_gol_{key}_total {value}")
+        family("omnix_gol_sessions_active", "gauge", "Governance sessions currently ACTIVE.")
+        out.append(f"omnix_gol_sessions_active {sessions_active}")
+
+        family("omnix_gol_mandate_tier_total", "counter", "Closed sessions per mandate tier.")
+        for tier, value in mandate_tiers.items():
+            out.append(f"omnix_gol_mandate_tier_total{_prom_labels(tier=tier)} {value}")
+
+        family("omnix_gol_phase_latency_ms", "histogram", "Governance phase latency in milliseconds.")
+        for phase, hist in self._histograms.items():
+            data = hist.cumulative_buckets()
+            for le, count in data["buckets"]:
+                out.append(
+                    f"omnix_gol_phase_latency_ms_bucket{_prom_labels(phase=phase, le=_prom_value(le))} {count}"
+                )
+            out.append(f"omnix_gol_phase_latency_ms_bucket{_prom_labels(phase=phase, le='+Inf')} {data['count']}")
+            out.append(f"omnix_gol_phase_latency_ms_sum{_prom_labels(phase=phase)} {_prom_value(data['sum'])}")
+            out.append(f"omnix_gol_phase_latency_ms_count{_prom_labels(phase=phase)} {data['count']}")
+
+        family("omnix_gol_phase_latency_window_ms", "gauge",
+               "Phase latency quantiles over the recent sample window (ms).")
+        for phase, hist in self._histograms.items():
+            stats = hist.to_dict()
+            for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                if stats[key] is not None:
+                    out.append(
+                        f"omnix_gol_phase_latency_window_ms{_prom_labels(phase=phase, quantile=quantile)} "
+                        f"{_prom_value(stats[key])}"
+                    )
+
+        family("omnix_gol_db_errors_total", "counter", "Database errors by class (OBS-INV-004).")
+        for bucket, value in self._error_counter.to_dict().items():
+            out.append(f"omnix_gol_db_errors_total{_prom_labels(error_class=bucket)} {value}")
+
+        if pool_snap is not None:
+            for key in ("pool_size", "pool_available", "requests_waiting", "avg_query_time_ms"):
+                family(f"omnix_gol_db_gateway_{key}", "gauge", f"DatabaseGateway {key.replace('_', ' ')}.")
+                out.append(f"omnix_gol_db_gateway_{key} {_prom_value(getattr(pool_snap, key))}")
+            family("omnix_gol_db_gateway_requests_total", "counter", "DatabaseGateway requests since start.")
+            out.append(f"omnix_gol_db_gateway_requests_total {pool_snap.total_requests}")
+            for stat, suffix, kind in _PROM_POOL_FIELDS:
+                name = f"omnix_gol_db_pool_{suffix}"
+                family(name, kind, f"Per-subsystem pool {stat.replace('_', ' ')}.")
+                for pool, stats in sorted(pool_snap.subsystems.items()):
+                    if isinstance(stats, dict) and stats.get(stat) is not None:
+                        out.append(f"{name}{_prom_labels(pool=pool)} {_prom_value(stats[stat])}")
+            family("omnix_gol_db_pool_wait_ms", "gauge", "Per-subsystem pool wait quantiles (ms).")
+            for pool, stats in sorted(pool_snap.subsystems.items()):
+                wait = stats.get("wait") if isinstance(stats, dict) else None
+                for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                    if isinstance(wait, dict) and wait.get(key) is not None:
+                        out.append(
+                            f"omnix_gol_db_pool_wait_ms{_prom_labels(pool=pool, quantile=quantile)} "
+                            f"{_prom_value(wait[key])}"
+                        )
+
+        return "\n".join(out) + "\n"
+
     # ── Convenience: active session count ─────────────────────────────────────
 
     @property
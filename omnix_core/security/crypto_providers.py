@@ -20,6 +20,15 @@ Backward compatibility:
 Security: provider_id is bound into the signed payload to prevent
 algorithm confusion / downgrade attacks.
 
+Signing-key cache:
+  get_signing_key() decodes OMNIX_SIGNING_SECRET_KEY_B64 once per process
+  and returns the same SigningKey (secret + public key, key_id, key_version)
+  to every signer — transparency log, BAR, CTCHC, delegation and temporal
+  authority records. When the env key is absent, callers that previously
+  signed with a throwaway keypair get ONE ephemeral keypair per process
+  (allow_ephemeral=True), so their signatures verify against a stable key.
+  Key version: OMNIX_SIGNING_KEY_VERSION (default "1").
+
 Author: Harold Nunes
 Operational since: March 2026
 ADR: ADR-043
@@ -27,8 +36,13 @@ ADR: ADR-043
 
 import os
 import base64
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 
 logger = logging.getLogger("OMNIX.Security.CryptoAgility")
@@ -240,14 +254,159 @@ def list_providers() -> Dict[str, Dict[str, Any]]:
 
 def get_agility_status() -> Dict[str, Any]:
     active = get_active_provider()
+    key = get_signing_key(active.provider_id())
     return {
         "active_provider":       active.provider_id(),
         "active_algorithm":      active.algorithm_name(),
         "env_var":               "ACTIVE_SIGNING_PROVIDER",
         "current_value":         os.environ.get("ACTIVE_SIGNING_PROVIDER", "(derived from PQC_SIGNING_LEVEL)"),
         "available_providers":   list(list_providers().keys()),
+        "signing_key":           key.metadata() if key else None,
         "swap_requires_restart": True,
         "swap_requires_rewrite": False,
         "adr":                   "ADR-043",
         "note":                  "Change ACTIVE_SIGNING_PROVIDER env var to swap. No code changes needed.",
     }
+
+
+# ─── Signing-Key Cache ───────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Process-cached signing key with the metadata verifiers need."""
+
+    provider_id: str
+    secret_key: bytes
+    public_key: Optional[bytes]
+    key_id: Optional[str]        # sha256(public_key)[:16] — same as key_gen / ADR-078
+    key_version: str
+    source: str                  # "env" | "ephemeral"
+    loaded_at: str
+
+    @property
+    def public_key_b64(self) -> Optional[str]:
+        if self.public_key is None:
+            return None
+        return base64.b64encode(self.public_key).decode("utf-8")
+
+    def metadata(self) -> Dict[str, Any]:
+        """Public, log-safe description (never includes secret material)."""
+        return {
+            "provider_id": self.provider_id,
+            "key_id":      self.key_id,
+            "key_version": self.key_version,
+            "source":      self.source,
+            "loaded_at":   self.loaded_at,
+        }
+
+
+_signing_key_lock = threading.Lock()
+_env_signing_keys: Dict[Tuple[str, str, str, str], SigningKey] = {}
+_ephemeral_signing_keys: Dict[Tuple[int, str], SigningKey] = {}
+_mismatch_logged: set = set()
+
+
+@lru_cache(maxsize=256)
+def decode_secret_key(secret_key_b64: str) -> bytes:
+    """base64-decode a secret key once; repeated calls are cache hits."""
+    return base64.b64decode(secret_key_b64)
+
+
+def _key_id(public_key: Optional[bytes]) -> Optional[str]:
+    return hashlib.sha256(public_key).hexdigest()[:16] if public_key else None
+
+
+def get_signing_key(
+    provider_id: Optional[str] = None,
+    allow_ephemeral: bool = False,
+) -> Optional[SigningKey]:
+    """
+    Return the process signing key for `provider_id` (default: active provider).
+
+    Order:
+      1. OMNIX_SIGNING_SECRET_KEY_B64 (+ OMNIX_SIGNING_PUBLIC_KEY_B64) — decoded
+         once per distinct env value and cached for the life of the process.
+         The env key belongs to OMNIX_SIGNING_KEY_PROVIDER (default dilithium3);
+         asking for any other provider returns None instead of a key the
+         provider cannot sign with.
+      2. allow_ephemeral=True → one generated keypair per process and provider.
+      3. None — caller signs nothing (previous behaviour for BAR/CTCHC/ATF).
+    """
+    pid = provider_id or _resolve_default_provider_id()
+    sk_b64 = os.environ.get("OMNIX_SIGNING_SECRET_KEY_B64", "").strip()
+    pk_b64 = os.environ.get("OMNIX_SIGNING_PUBLIC_KEY_B64", "").strip()
+    version = os.environ.get("OMNIX_SIGNING_KEY_VERSION", "1").strip() or "1"
+
+    if sk_b64:
+        key_pid = os.environ.get("OMNIX_SIGNING_KEY_PROVIDER", "dilithium3").strip() or "dilithium3"
+        if key_pid != pid:
+            if pid not in _mismatch_logged:
+                _mismatch_logged.add(pid)
+                logger.error(
+                    f"[CryptoAgility] env signing key belongs to '{key_pid}', "
+                    f"not '{pid}' — refusing to sign with it"
+                )
+            return None
+        cache_key = (pid, sk_b64, pk_b64, version)
+        key = _env_signing_keys.get(cache_key)
+        if key is not None:
+            return key
+        with _signing_key_lock:
+            key = _env_signing_keys.get(cache_key)
+            if key is None:
+                try:
+                    pk = base64.b64decode(pk_b64) if pk_b64 else None
+                    key = SigningKey(
+                        provider_id=pid,
+                        secret_key=decode_secret_key(sk_b64),
+                        public_key=pk,
+                        key_id=_key_id(pk),
+                        key_version=version,
+                        source="env",
+                        loaded_at=datetime.now(timezone.utc).isoformat(),
+                    )
+                except Exception as e:
+                    logger.error(f"[CryptoAgility] OMNIX_SIGNING_SECRET_KEY_B64 could not be decoded: {e}")
+                    return None
+                _env_signing_keys[cache_key] = key
+                logger.info(f"[CryptoAgility] Signing key loaded from env: {key.metadata()}")
+        return key
+
+    if not allow_ephemeral:
+        return None
+
+    cache_key = (os.getpid(), pid)
+    key = _ephemeral_signing_keys.get(cache_key)
+    if key is not None:
+        return key
+    with _signing_key_lock:
+        key = _ephemeral_signing_keys.get(cache_key)
+        if key is None:
+            provider = get_provider(pid)
+            kp = provider.generate_keypair() if provider is not None else None
+            if kp is None:
+                return None
+            pub, sec = kp
+            key = SigningKey(
+                provider_id=pid,
+                secret_key=sec,
+                public_key=pub,
+                key_id=_key_id(pub),
+                key_version=f"ephemeral-{version}",
+                source="ephemeral",
+                loaded_at=datetime.now(timezone.utc).isoformat(),
+            )
+            _ephemeral_signing_keys[cache_key] = key
+            logger.warning(
+                f"[CryptoAgility] OMNIX_SIGNING_SECRET_KEY_B64 not set — process-scoped "
+                f"ephemeral signing key generated: {key.metadata()}"
+            )
+    return key
+
+
+def reset_signing_key_cache() -> None:
+    """Drop cached keys (key rotation in long-lived processes, tests)."""
+    with _signing_key_lock:
+        _env_signing_keys.clear()
+        _ephemeral_signing_keys.clear()
+    decode_secret_key.cache_clear()
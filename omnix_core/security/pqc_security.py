@@ -123,7 +123,7 @@ class PostQuantumSecurity:
             return None
         try:
             signature = _dilithium.sign(message, secret_key)
-            self.logger.info(f"Message signed with {self.algorithm_name}. Signature: {len(signature)}B")
+            self.logger.debug(f"Message signed with {self.algorithm_name}. Signature: {len(signature)}B")
             return signature
         except Exception as e:
             self.logger.error(f"Message signing failed: {e}")
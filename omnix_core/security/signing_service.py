@@ -0,0 +1,294 @@
+"""
+OMNIX — Batch Signing Service
+=============================
+Fans canonical payloads across a process pool so PQC signing scales with
+cores instead of serialising on the GIL.
+
+  pqc.sign.dilithium3 is CPU-bound and holds the GIL for the whole call, so
+  threads do not help: a turn that signs a BAR, a CTCHC link and an MIVP
+  record — or a transparency-log flush of 64 entries — runs one signature at
+  a time. SigningService sends each batch to worker processes that hold the
+  process signing key (crypto_providers.get_signing_key) from start-up, so
+  only payloads and signatures cross the process boundary.
+
+  submit() / submit_batch() return concurrent.futures.Future objects, letting
+  callers overlap DB persistence with signing and collect signatures later.
+  sign_batch() is the blocking convenience wrapper.
+
+Configuration:
+  OMNIX_SIGNING_WORKERS   worker processes (default: cpu_count; 0 under
+                          TESTING=true). 0 = sign inline in the caller.
+  OMNIX_SIGNING_MP_START  multiprocessing start method (default: spawn —
+                          safe with the flusher threads already running).
+
+Observability: per-batch latency histograms bucketed by batch size
+(LatencyHistogram, ADR-198) via SigningService.stats().
+
+Never raises to callers: a failed payload resolves to None, exactly like
+CryptoProvider.sign(). A broken pool falls back to inline signing.
+
+Author: Harold Nunes
+ADR: ADR-043 (Crypto-Agility), ADR-078 (Signing Key Persistence)
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from omnix_core.observability.metrics import LatencyHistogram
+from omnix_core.security.crypto_providers import SigningKey, get_provider, get_signing_key
+
+logger = logging.getLogger("OMNIX.Security.SigningService")
+
+
+def _default_workers() -> int:
+    raw = os.environ.get("OMNIX_SIGNING_WORKERS", "").strip()
+    if raw:
+        return max(0, int(raw))
+    if os.environ.get("TESTING", "").lower() == "true":
+        return 0
+    return os.cpu_count() or 1
+
+
+_SIGNING_MP_START = os.environ.get("OMNIX_SIGNING_MP_START", "spawn").strip() or "spawn"
+
+# Batch-size buckets for the latency histograms — label → inclusive upper bound
+_BATCH_BUCKETS = (("1", 1), ("2-8", 8), ("9-64", 64), ("65+", None))
+
+
+def _bucket_for(size: int) -> str:
+    for label, upper in _BATCH_BUCKETS:
+        if upper is None or size <= upper:
+            return label
+    return _BATCH_BUCKETS[-1][0]
+
+
+# ─── Worker side ─────────────────────────────────────────────────────────────
+
+_worker_provider = None
+_worker_secret_key: Optional[bytes] = None
+
+
+def _init_worker(provider_id: str, secret_key: bytes) -> None:
+    global _worker_provider, _worker_secret_key
+    _worker_provider = get_provider(provider_id)
+    _worker_secret_key = secret_key
+
+
+def _sign_chunk(payloads: List[bytes]) -> List[Optional[bytes]]:
+    if _worker_provider is None or _worker_secret_key is None:
+        return [None] * len(payloads)
+    return [_worker_provider.sign(p, _worker_secret_key) for p in payloads]
+
+
+def _sign_inline(key: SigningKey, payloads: Sequence[bytes]) -> List[Optional[bytes]]:
+    provider = get_provider(key.provider_id)
+    if provider is None:
+        return [None] * len(payloads)
+    return [provider.sign(p, key.secret_key) for p in payloads]
+
+
+# ─── Service ─────────────────────────────────────────────────────────────────
+
+class SigningService:
+    """Process-pool signer for batches of canonical payloads."""
+
+    def __init__(self, workers: Optional[int] = None, start_method: str = _SIGNING_MP_START):
+        self._workers = _default_workers() if workers is None else max(0, workers)
+        self._start_method = start_method
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_key: Optional[SigningKey] = None
+        self._pid = os.getpid()
+        self._histograms: Dict[str, LatencyHistogram] = {
+            label: LatencyHistogram(f"SIGN_BATCH_{label}") for label, _ in _BATCH_BUCKETS
+        }
+        self._batches = 0
+        self._payloads = 0
+        self._unsigned = 0
+        self._pool_failures = 0
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    # ── Public API ───────────────────────────────────────────────
+
+    def submit(
+        self,
+        payload: bytes,
+        provider_id: Optional[str] = None,
+        allow_ephemeral: bool = False,
+    ) -> "Future[Optional[bytes]]":
+        """Sign one payload; resolves to the raw signature or None."""
+        batch = self.submit_batch([payload], provider_id, allow_ephemeral)
+        single: Future = Future()
+        batch.add_done_callback(lambda f: single.set_result(f.result()[0]))
+        return single
+
+    def submit_batch(
+        self,
+        payloads: Sequence[bytes],
+        provider_id: Optional[str] = None,
+        allow_ephemeral: bool = False,
+    ) -> "Future[List[Optional[bytes]]]":
+        """
+        Sign `payloads` with the process signing key of `provider_id`.
+
+        Resolves to a list aligned with `payloads` (None where signing failed
+        or no key is configured — same semantics as get_signing_key()).
+        """
+        payloads = list(payloads)
+        result: Future = Future()
+        key = get_signing_key(provider_id, allow_ephemeral=allow_ephemeral)
+        if key is None or not payloads:
+            result.set_result([None] * len(payloads))
+            return result
+
+        t0 = time.perf_counter()
+        result.add_done_callback(lambda f: self._record(len(payloads), t0, f))
+
+        executor = self._get_executor(key) if self._workers > 0 else None
+        if executor is None:
+            result.set_result(_sign_inline(key, payloads))
+            return result
+
+        n_chunks = min(self._workers, len(payloads))
+        size = -(-len(payloads) // n_chunks)
+        chunks = [payloads[i:i + size] for i in range(0, len(payloads), size)]
+        parts: List[Optional[List[Optional[bytes]]]] = [None] * len(chunks)
+        remaining = [len(chunks)]
+        parts_lock = threading.Lock()
+
+        def _on_chunk(idx: int, fut: Future) -> None:
+            try:
+                signed = fut.result()
+            except Exception as exc:
+                self._pool_failures += 1
+                logger.warning(f"[SigningService] worker failed — signing chunk inline: {exc}")
+                self._discard_executor(executor)
+                signed = _sign_inline(key, chunks[idx])
+            with parts_lock:
+                parts[idx] = signed
+                remaining[0] -= 1
+                done = remaining[0] == 0
+            if done:
+                result.set_result([sig for part in parts for sig in part])
+
+        for idx, chunk in enumerate(chunks):
+            try:
+                fut = executor.submit(_sign_chunk, chunk)
+            except Exception as exc:
+                fut = Future()
+                fut.set_exception(exc)
+            fut.add_done_callback(lambda f, i=idx: _on_chunk(i, f))
+        return result
+
+    def sign_batch(
+        self,
+        payloads: Sequence[bytes],
+        provider_id: Optional[str] = None,
+        allow_ephemeral: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[Optional[bytes]]:
+        """Blocking form of submit_batch()."""
+        return self.submit_batch(payloads, provider_id, allow_ephemeral).result(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers":            self._workers,
+            "start_method":       self._start_method,
+            "pool_active":        self._executor is not None,
+            "batches":            self._batches,
+            "payloads":           self._payloads,
+            "unsigned":           self._unsigned,
+            "pool_failures":      self._pool_failures,
+            "batch_latency":      {label: h.to_dict() for label, h in self._histograms.items()},
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor, self._executor_key = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=False)
+
+    # ── Internals ────────────────────────────────────────────────
+
+    def _record(self, n: int, t0: float, fut: Future) -> None:
+        self._histograms[_bucket_for(n)].record((time.perf_counter() - t0) * 1000.0)
+        self._batches += 1
+        self._payloads += n
+        try:
+            self._unsigned += sum(1 for s in fut.result() if s is None)
+        except Exception:
+            self._unsigned += n
+
+    def _get_executor(self, key: SigningKey) -> Optional[ProcessPoolExecutor]:
+        """Pool bound to `key`; rebuilt after fork or key rotation."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Inherited across fork — the parent's worker processes are not ours.
+                self._executor, self._executor_key = None, None
+                self._pid = os.getpid()
+            if self._executor is not None and self._executor_key is key:
+                return self._executor
+            stale = self._executor
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context(self._start_method),
+                    initializer=_init_worker,
+                    initargs=(key.provider_id, key.secret_key),
+                )
+                self._executor_key = key
+                logger.info(
+                    f"[SigningService] Process pool started: workers={self._workers} "
+                    f"start={self._start_method} key={key.metadata()}"
+                )
+            except Exception as exc:
+                logger.warning(f"[SigningService] Process pool unavailable — signing inline: {exc}")
+                self._executor, self._executor_key = None, None
+        if stale is not None:
+            stale.shutdown(wait=False)
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor, self._executor_key = None, None
+        executor.shutdown(wait=False)
+
+
+# ─── Process-wide instance ───────────────────────────────────────────────────
+
+_service: Optional[SigningService] = None
+_service_pid: Optional[int] = None
+_service_lock = threading.Lock()
+
+
+def get_signing_service() -> SigningService:
+    """Process-wide SigningService (recreated in forked children)."""
+    global _service, _service_pid
+    pid = os.getpid()
+    if _service is not None and _service_pid == pid:
+        return _service
+    with _service_lock:
+        if _service is None or _service_pid != pid:
+            _service = SigningService()
+            _service_pid = pid
+            atexit.register(_service.close)
+    return _service
+
+
+def reset_signing_service() -> None:
+    """Close and drop the process-wide service (tests, key rotation)."""
+    global _service, _service_pid
+    with _service_lock:
+        service, _service, _service_pid = _service, None, None
+    if service is not None:
+        service.close()
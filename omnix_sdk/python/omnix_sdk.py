@@ -56,7 +56,7 @@ import os
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 __version__ = "2.0.0"
 __author__  = "OMNIX Quantum Ltd"
@@ -418,6 +418,83 @@ class OmnixClient:
             )
         return self._request("POST", "/api/governance/evaluate", signals)
 
+    def evaluate_many(
+        self,
+        items: List[Dict[str, Any]],
+        cbg_enabled: bool = False,
+        ctag_enabled: bool = False,
+        cag_enabled: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Submit several decisions for governance evaluation in one request.
+
+        Every item runs through the full Unified Decision Control Layer.
+        Receipts are hash-linked in item order and committed to the
+        transparency chain together, so a batch costs one round-trip
+        instead of ``len(items)``.
+
+        Parameters
+        ----------
+        items : list of dict
+            Each item is either a flat signal dict as accepted by
+            :meth:`evaluate` (``asset`` / ``domain`` / ``scenario`` keys are
+            lifted out of the signals) or an explicit
+            ``{"signals": {...}, "asset": ..., "domain": ..., "metadata": {...}}``
+            object. The server caps the batch size (default 100).
+        cbg_enabled, ctag_enabled, cag_enabled : bool
+            Opt-in pillars, applied to every item.
+
+        Returns
+        -------
+        dict
+            - ``count`` / ``succeeded`` / ``failed`` (int): Item totals
+            - ``results`` (list): One entry per item, in order, with
+              ``index`` and ``success``; successful entries carry the control
+              receipt (``decision``, ``receipt_id``, ``control_id``, …),
+              failed entries carry ``error``
+
+        Raises
+        ------
+        OmnixValidationError
+            If ``items`` is empty or any item is missing required signals.
+
+        Example
+        -------
+        ::
+
+            batch = client.evaluate_many([signals_a, signals_b])
+            for result in batch["results"]:
+                if result["success"] and result["decision"] == "APPROVED":
+                    place_order(result["receipt_id"])
+        """
+        if not items:
+            raise OmnixValidationError("evaluate_many() requires at least one item.")
+        payload_items = []
+        for index, item in enumerate(items):
+            if "signals" in item:
+                entry = dict(item)
+            else:
+                signals = dict(item)
+                entry = {}
+                for key in ("asset", "domain"):
+                    if key in signals:
+                        entry[key] = signals.pop(key)
+                if "scenario" in signals:
+                    entry["metadata"] = {"scenario": signals.pop("scenario")}
+                entry["signals"] = signals
+            missing = [f for f in REQUIRED_SIGNALS if f not in entry["signals"]]
+            if missing:
+                raise OmnixValidationError(
+                    f"Item {index}: missing required signal fields: {missing}."
+                )
+            payload_items.append(entry)
+        return self._request("POST", "/api/governance/evaluate:batch", {
+            "items":        payload_items,
+            "cbg_enabled":  cbg_enabled,
+            "ctag_enabled": ctag_enabled,
+            "cag_enabled":  cag_enabled,
+        })
+
     # ── 2. Execution integrity ───────────────────────────────────────────────
 
     def execute(
@@ -592,6 +669,8 @@ class OmnixClient:
         domain   : Optional[str] = None,
         asset    : Optional[str] = None,
         decision : Optional[str] = None,
+        cursor   : Optional[str] = None,
+        total    : Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         List your governance receipts (paginated, most recent first).
@@ -599,7 +678,7 @@ class OmnixClient:
         Parameters
         ----------
         page : int
-            Page number (1-indexed). Default: 1.
+            Page number (1-indexed). Default: 1. Ignored when ``cursor`` is set.
         per_page : int
             Results per page (max 100). Default: 20.
         domain : str, optional
@@ -608,23 +687,65 @@ class OmnixClient:
             Filter by asset (e.g. ``"BTC/USD"``).
         decision : str, optional
             Filter by decision: ``"APPROVED"`` | ``"BLOCKED"`` | ``"HOLD"``.
+        cursor : str, optional
+            ``next_cursor`` from the previous page. Cursor pages stay fast at
+            any depth, unlike page numbers.
+        total : str, optional
+            ``"exact"`` | ``"approx"`` | ``"none"``. Default: exact for page
+            numbers, none when following a cursor.
 
         Returns
         -------
         dict
             - ``receipts`` (list): List of receipt summary objects
-            - ``total`` (int): Total matching receipts
+            - ``total`` (int | None): Total matching receipts
+            - ``next_cursor`` (str | None): Token for the next page, None on the last
             - ``page`` (int): Current page
             - ``per_page`` (int): Results per page
         """
         return self._request("GET", "/api/governance/receipts", params={
             "page"    : page,
             "per_page": per_page,
+            "limit"   : per_page,
+            "offset"  : None if cursor else (page - 1) * per_page,
             "domain"  : domain,
             "asset"   : asset,
             "decision": decision,
+            "cursor"  : cursor,
+            "total"   : total,
         })
 
+    def iter_receipts(
+        self,
+        per_page : int           = 100,
+        domain   : Optional[str] = None,
+        asset    : Optional[str] = None,
+        decision : Optional[str] = None,
+        cursor   : Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all your governance receipts, most recent first.
+
+        Follows ``next_cursor`` automatically, fetching one page at a time,
+        so full histories can be exported without deep-page slowdowns.
+
+        Example
+        -------
+        ::
+
+            for receipt in client.iter_receipts(decision="BLOCKED"):
+                print(receipt["receipt_id"])
+        """
+        while True:
+            result = self.list_receipts(
+                per_page=per_page, domain=domain, asset=asset,
+                decision=decision, cursor=cursor, total="none",
+            )
+            yield from result.get("receipts", [])
+            cursor = result.get("next_cursor")
+            if not cursor:
+                return
+
     # ── 4. Verification ──────────────────────────────────────────────────────
 
     def verify(self, receipt_id: str) -> Dict[str, Any]:
@@ -0,0 +1,463 @@
+"""
+OMNIX Pooled Connection Provider
+Shared, fork-safe PostgreSQL connection pools for code that used to open a
+fresh connection per call (evidence, BEV, ATF, governance and web API).
+
+Every psycopg.connect() / psycopg2.connect() pays TCP + TLS + auth setup.
+This provider keeps one small pool per (driver, subsystem, conninfo) and
+hands out connections that behave like the driver's own:
+
+    conn = get_connection("bev", db_url)       # conn.close() returns it to the pool
+    with get_connection("bev", db_url) as conn: # psycopg v3: commit/rollback + return
+        ...
+    with pooled_connection("evidence") as conn: # commit on success, rollback on error
+        ...
+
+Drivers:
+  PSYCOPG (v3) is built in. psycopg2 callers in omnix_web pass their own
+  PoolDriver (see omnix_web/api/db_pool.py) — production code under
+  omnix_core / omnix_services stays psycopg2-free (ADR-199, REG-INV-003).
+
+Per-subsystem limits (env overrides, <SUB> = upper-cased subsystem):
+  OMNIX_DB_POOL_<SUB>_MAX               max open connections (see _SUBSYSTEM_DEFAULTS)
+  OMNIX_DB_STATEMENT_TIMEOUT_MS_<SUB>   server-side statement_timeout per connection
+  OMNIX_DB_POOL_TIMEOUT_S               max wait for a free connection (default 10)
+  OMNIX_DB_POOL_MAX_IDLE_S              idle connections older than this are dropped (default 600)
+  OMNIX_DB_POOLING                      "false" → direct connections (default: off
+                                        under TESTING=true, on otherwise)
+
+Fork safety: pools are owned by the creating PID. A forked child (Gunicorn
+worker) starts with empty pools and never closes the parent's sockets —
+inherited connections are parked, not finalised, so libpq does not send a
+Terminate on the parent's sessions.
+
+Metrics: pool-wait latency (LatencyHistogram, ADR-198), acquisitions,
+timeouts and in-use counts per pool via get_pool_stats(); exported by
+GovernanceMetricsRegistry.observe_pool_stats() (OBS-INV-003).
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from omnix_core.observability.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# subsystem → (max connections, statement_timeout ms)
+_SUBSYSTEM_DEFAULTS: Dict[str, Tuple[int, int]] = {
+    "web":        (10, 10_000),
+    "governance": (8, 15_000),
+    "evidence":   (4, 15_000),
+    "bev":        (6, 10_000),
+    "atf":        (6, 10_000),
+    "archival":   (2, 300_000),
+    "default":    (4, 30_000),
+}
+
+_CONNECT_TIMEOUT_S = int(os.environ.get("OMNIX_DB_CONNECT_TIMEOUT_S", "5"))
+
+
+class PoolTimeout(Exception):
+    """No connection became free within OMNIX_DB_POOL_TIMEOUT_S (ErrorCounter bucket: PoolTimeout)."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def pooling_enabled() -> bool:
+    raw = os.environ.get("OMNIX_DB_POOLING", "").strip().lower()
+    if raw:
+        return raw in ("1", "true", "yes", "on")
+    return os.environ.get("TESTING", "").lower() != "true"
+
+
+def resolve_database_url() -> Optional[str]:
+    """DATABASE_URL → OMNIX_DB_URL → POSTGRES_URL → DATABASE_PUBLIC_URL."""
+    for var in ("DATABASE_URL", "OMNIX_DB_URL", "POSTGRES_URL", "DATABASE_PUBLIC_URL"):
+        url = os.environ.get(var)
+        if url:
+            if url.startswith("postgres://"):
+                url = url.replace("postgres://", "postgresql://", 1)
+            return url
+    return None
+
+
+def subsystem_limits(subsystem: str) -> Tuple[int, int]:
+    """(max connections, statement_timeout ms) for `subsystem` after env overrides."""
+    default_max, default_timeout = _SUBSYSTEM_DEFAULTS.get(subsystem, _SUBSYSTEM_DEFAULTS["default"])
+    key = subsystem.upper()
+    return (
+        max(1, _env_int(f"OMNIX_DB_POOL_{key}_MAX", default_max)),
+        max(0, _env_int(f"OMNIX_DB_STATEMENT_TIMEOUT_MS_{key}", default_timeout)),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Drivers
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PoolDriver:
+    """
+    Adapter between the pool and a DB-API driver.
+
+    closes_on_exit: whether `with conn:` ends the connection's life
+    (psycopg v3: yes; psycopg2: no — it only scopes a transaction).
+    """
+
+    name = "abstract"
+    closes_on_exit = True
+
+    def connect(self, conninfo: str, statement_timeout_ms: int) -> Any:
+        raise NotImplementedError
+
+    def is_usable(self, conn: Any) -> bool:
+        raise NotImplementedError
+
+    def reset(self, conn: Any) -> None:
+        """Return `conn` to a clean idle state before it goes back to the pool."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _options(statement_timeout_ms: int) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"connect_timeout": _CONNECT_TIMEOUT_S}
+        if statement_timeout_ms:
+            kwargs["options"] = f"-c statement_timeout={statement_timeout_ms}"
+        return kwargs
+
+
+class PsycopgDriver(PoolDriver):
+    """psycopg v3."""
+
+    name = "psycopg"
+    closes_on_exit = True
+
+    def connect(self, conninfo: str, statement_timeout_ms: int) -> Any:
+        import psycopg
+        return psycopg.connect(conninfo, **self._options(statement_timeout_ms))
+
+    def is_usable(self, conn: Any) -> bool:
+        return not conn.closed and not getattr(conn, "broken", False)
+
+    def reset(self, conn: Any) -> None:
+        from psycopg.pq import TransactionStatus
+        from psycopg.rows import tuple_row
+        if conn.info.transaction_status != TransactionStatus.IDLE:
+            conn.rollback()
+        if conn.autocommit:
+            conn.autocommit = False
+        conn.row_factory = tuple_row
+
+
+PSYCOPG = PsycopgDriver()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Pool
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SubsystemPool:
+    """Bounded pool of idle connections for one (driver, subsystem, conninfo)."""
+
+    def __init__(
+        self,
+        driver: PoolDriver,
+        subsystem: str,
+        conninfo: str,
+        max_size: int,
+        statement_timeout_ms: int,
+        wait_timeout_s: float,
+        max_idle_s: float,
+    ):
+        self.driver = driver
+        self.subsystem = subsystem
+        self.label = f"{driver.name}:{subsystem}"
+        self._conninfo = conninfo
+        self.max_size = max_size
+        self.statement_timeout_ms = statement_timeout_ms
+        self._wait_timeout_s = wait_timeout_s
+        self._max_idle_s = max_idle_s
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._wait = LatencyHistogram(f"POOL_WAIT_{self.label}")
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._opened = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._discarded = 0
+
+    def acquire(self) -> Any:
+        t0 = time.perf_counter()
+        if not self._slots.acquire(timeout=self._wait_timeout_s):
+            with self._lock:
+                self._timeouts += 1
+            raise PoolTimeout(
+                f"{self.label}: no connection free after {self._wait_timeout_s}s "
+                f"(max={self.max_size})"
+            )
+        self._wait.record((time.perf_counter() - t0) * 1000.0)
+        try:
+            conn = self._take_idle()
+            if conn is None:
+                conn = self.driver.connect(self._conninfo, self.statement_timeout_ms)
+                with self._lock:
+                    self._opened += 1
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._acquired += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        return conn
+
+    def _take_idle(self) -> Optional[Any]:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn, idle_since = self._idle.pop()
+            if now - idle_since <= self._max_idle_s and self.driver.is_usable(conn):
+                return conn
+            self._close_quietly(conn)
+
+    def release(self, conn: Any) -> None:
+        try:
+            reusable = self.driver.is_usable(conn)
+            if reusable:
+                self.driver.reset(conn)
+        except Exception:
+            reusable = False
+        if reusable:
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+        else:
+            self._close_quietly(conn)
+        with self._lock:
+            self._in_use -= 1
+        self._slots.release()
+
+    def _close_quietly(self, conn: Any) -> None:
+        with self._lock:
+            self._discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _ in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {
+                "driver":               self.driver.name,
+                "subsystem":            self.subsystem,
+                "max_size":             self.max_size,
+                "statement_timeout_ms": self.statement_timeout_ms,
+                "pool_size":            self._in_use + len(self._idle),
+                "pool_available":       len(self._idle),
+                "in_use":               self._in_use,
+                "peak_in_use":          self._peak_in_use,
+                "opened":               self._opened,
+                "acquired":             self._acquired,
+                "timeouts":             self._timeouts,
+                "discarded":            self._discarded,
+            }
+        counters["wait"] = self._wait.to_dict()
+        return counters
+
+
+class PooledConnection:
+    """
+    Driver connection on loan from a SubsystemPool.
+
+    Attribute access is delegated to the real connection. close() returns it
+    to the pool (idempotent); `with` follows the driver's own semantics.
+    """
+
+    def __init__(self, pool: SubsystemPool, conn: Any):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        conn = self.__dict__.get("_conn")
+        if conn is None:
+            raise AttributeError(f"pooled connection already returned ({name})")
+        return getattr(conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("_pool", "_conn"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    @property
+    def closed(self) -> Any:
+        conn = self.__dict__.get("_conn")
+        return True if conn is None else conn.closed
+
+    def close(self) -> None:
+        conn = self.__dict__.get("_conn")
+        if conn is not None:
+            object.__setattr__(self, "_conn", None)
+            self._pool.release(conn)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        conn = self.__dict__.get("_conn")
+        if conn is None:
+            return
+        try:
+            if exc_type is None:
+                conn.commit()
+            else:
+                conn.rollback()
+        finally:
+            if self._pool.driver.closes_on_exit:
+                self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Registry (fork-safe)
+# ─────────────────────────────────────────────────────────────────────────────
+
+_registry_lock = threading.Lock()
+_pools: Dict[Tuple[str, str, str], SubsystemPool] = {}
+_pools_pid: Optional[int] = None
+_parked: List[SubsystemPool] = []   # inherited across fork — never finalised in the child
+
+
+def _get_pool(driver: PoolDriver, subsystem: str, conninfo: str) -> SubsystemPool:
+    global _pools, _pools_pid
+    key = (driver.name, subsystem, conninfo)
+    pid = os.getpid()
+    pool = _pools.get(key) if _pools_pid == pid else None
+    if pool is not None:
+        return pool
+    with _registry_lock:
+        if _pools_pid != pid:
+            if _pools:
+                logger.info(f"[DBPool] Fork detected (pid={pid}) — starting fresh pools")
+                _parked.extend(_pools.values())
+            else:
+                atexit.register(close_all_pools)
+            _pools = {}
+            _pools_pid = pid
+        pool = _pools.get(key)
+        if pool is None:
+            max_size, stmt_timeout = subsystem_limits(subsystem)
+            pool = SubsystemPool(
+                driver, subsystem, conninfo,
+                max_size=max_size,
+                statement_timeout_ms=stmt_timeout,
+                wait_timeout_s=float(os.environ.get("OMNIX_DB_POOL_TIMEOUT_S", "10")),
+                max_idle_s=float(os.environ.get("OMNIX_DB_POOL_MAX_IDLE_S", "600")),
+            )
+            _pools[key] = pool
+            logger.info(
+                f"[DBPool] {pool.label} pool created (pid={pid}): "
+                f"max={max_size} statement_timeout={stmt_timeout}ms"
+            )
+    return pool
+
+
+def get_connection(
+    subsystem: str = "default",
+    conninfo: Optional[str] = None,
+    driver: PoolDriver = PSYCOPG,
+    row_factory: Optional[Callable] = None,
+) -> Optional[Any]:
+    """
+    Borrow a connection for `subsystem`. Returns None when no database URL is
+    configured. With pooling disabled the driver connection is returned as-is.
+    Raises the driver's connection errors and PoolTimeout, like connect() does.
+    """
+    conninfo = conninfo or resolve_database_url()
+    if not conninfo:
+        return None
+    if not pooling_enabled():
+        _, stmt_timeout = subsystem_limits(subsystem)
+        conn = driver.connect(conninfo, stmt_timeout)
+    else:
+        pool = _get_pool(driver, subsystem, conninfo)
+        conn = PooledConnection(pool, pool.acquire())
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    return conn
+
+
+@contextmanager
+def pooled_connection(
+    subsystem: str = "default",
+    conninfo: Optional[str] = None,
+    driver: PoolDriver = PSYCOPG,
+    row_factory: Optional[Callable] = None,
+):
+    """Commit on success, roll back on error, always return the connection."""
+    conn = get_connection(subsystem, conninfo, driver, row_factory)
+    if conn is None:
+        raise RuntimeError("No database URL configured (DATABASE_URL / OMNIX_DB_URL)")
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        raise
+    finally:
+        conn.close()
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-pool stats for this process, keyed by "<driver>:<subsystem>"."""
+    if _pools_pid != os.getpid():
+        return {}
+    stats: Dict[str, Dict[str, Any]] = {}
+    for pool in list(_pools.values()):
+        s = pool.stats()
+        prev = stats.get(pool.label)
+        if prev is None:
+            stats[pool.label] = s
+        else:  # same subsystem against several conninfos — sum the counters
+            for k in ("pool_size", "pool_available", "in_use", "opened", "acquired", "timeouts", "discarded"):
+                prev[k] += s[k]
+    return stats
+
+
+def close_all_pools() -> None:
+    """Close idle connections of this process's pools (shutdown, tests)."""
+    global _pools
+    with _registry_lock:
+        pools = list(_pools.values()) if _pools_pid == os.getpid() else []
+        _pools = {}
+    for pool in pools:
+        pool.close()
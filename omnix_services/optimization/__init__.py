@@ -6,6 +6,7 @@ Optimización, aprendizaje automático y pesos adaptativos
 from .adaptive_weights import AdaptiveWeightSystem, AdaptiveWeights, create_adaptive_system, interpret_regime
 from .auto_learner import AutoLearningSystem
 from .auto_optimizer import GeneticOptimizer, ABTestingEngine, AutoAdjustmentEngine
+from .backtest_fitness import BacktestFitnessEvaluator, genome_strategy
 from .ml_module import AdvancedMLModule
 from .math_helpers import MathematicalOptimizer, generate_unique_nonce
 from .performance_optimizer import PerformanceOptimizer
@@ -19,6 +20,8 @@ __all__ = [
     'GeneticOptimizer',
     'ABTestingEngine',
     'AutoAdjustmentEngine',
+    'BacktestFitnessEvaluator',
+    'genome_strategy',
     'AdvancedMLModule',
     'MathematicalOptimizer',
     'generate_unique_nonce',
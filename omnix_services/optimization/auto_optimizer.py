@@ -226,6 +226,8 @@ class Individual:
     profit_usd: float = 0.0
     sharpe_ratio: float = 0.0
     max_drawdown: float = 0.0
+    holdout_fitness: Optional[float] = None  # Fitness en datos held-out (BacktestFitnessEvaluator)
+    pruned: bool = False  # Evaluación cortada por early stopping
     
     def calculate_fitness(self) -> float:
         """
@@ -275,7 +277,11 @@ class GeneticOptimizer:
     Optimizador usando Algoritmo Genético
     
     Optimiza los parámetros de las estrategias de trading
-    mediante selección natural, crossover y mutación
+    mediante selección natural, crossover y mutación.
+    
+    Con fitness_evaluator (BacktestFitnessEvaluator) el fitness de cada
+    generación sale de backtests paralelos en ventanas held-out; sin él se
+    usa Individual.calculate_fitness() sobre las métricas ya registradas.
     """
     
     def __init__(
@@ -284,13 +290,18 @@ class GeneticOptimizer:
         generations: int = 100,
         mutation_rate: float = 0.1,
         elite_size: int = 5,
-        tournament_size: int = 5
+        tournament_size: int = 5,
+        fitness_evaluator=None
     ):
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.elite_size = elite_size
         self.tournament_size = tournament_size
+        self.fitness_evaluator = fitness_evaluator
+        if fitness_evaluator is not None:
+            # El early stopping protege al menos a los candidatos a élite
+            fitness_evaluator.keep_top = max(1, elite_size)
         
         self.population: List[Individual] = []
         self.best_individual: Optional[Individual] = None
@@ -328,8 +339,7 @@ class GeneticOptimizer:
             return
         
         # 1. Evaluar fitness de todos los individuos
-        for individual in self.population:
-            individual.calculate_fitness()
+        self.evaluate_population()
         
         # 2. Ordenar por fitness
         self.population.sort(key=lambda ind: ind.fitness, reverse=True)
@@ -400,13 +410,48 @@ class GeneticOptimizer:
             if gen % 10 == 0:
                 logger.info(f"⏳ Generación {gen}/{gens} completada")
         
+        if self.fitness_evaluator is not None:
+            # La última generación también se evalúa antes de elegir campeones
+            self.evaluate_population()
+            current_best = max(self.population, key=lambda ind: ind.fitness)
+            if not self.best_individual or current_best.fitness > self.best_individual.fitness:
+                self.best_individual = current_best
+        
         logger.info(f"✅ Optimización completada - Mejor fitness: {self.best_individual.fitness:.2f}")
         return self.best_individual
     
+    def evaluate_population(self) -> None:
+        """Calcula fitness de la población (backtests si hay fitness_evaluator)"""
+        if self.fitness_evaluator is not None:
+            self.fitness_evaluator.evaluate_population(self.population)
+            return
+        for individual in self.population:
+            individual.calculate_fitness()
+    
     def get_top_individuals(self, n: int = 10) -> List[Individual]:
         """Retorna los N mejores individuos"""
         self.population.sort(key=lambda ind: ind.fitness, reverse=True)
         return self.population[:n]
+    
+    def get_champions(self, n: int = 2) -> List[Individual]:
+        """
+        Retorna los N mejores genomas distintos listos para A/B testing
+        
+        Con fitness_evaluator se toman de todas las generaciones evaluadas
+        por completo y se validan en el tramo holdout (holdout_fitness).
+        """
+        if self.fitness_evaluator is not None:
+            return self.fitness_evaluator.champions(n)
+        
+        champions, seen = [], set()
+        for individual in self.get_top_individuals(len(self.population)):
+            key = json.dumps(individual.parameters.to_dict(), sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                champions.append(individual)
+            if len(champions) >= n:
+                break
+        return champions
 
 
 class ABTestingEngine:
@@ -480,6 +525,56 @@ class ABTestingEngine:
         logger.info(f"✅ Test A/B creado: {test_id} - {test_name}")
         return test_id
     
+    def create_test_from_champions(
+        self,
+        test_name: str,
+        champions: List[Any],
+        control_params: Optional[StrategyParameters] = None,
+        duration_hours: int = 24,
+        min_samples: int = 50
+    ) -> str:
+        """
+        Crea test A/B con los campeones del GeneticOptimizer como variantes
+        
+        Args:
+            test_name: Nombre descriptivo del test
+            champions: 1-2 Individual (o StrategyParameters), mejor primero
+            control_params: Baseline (parámetros por defecto si None)
+            duration_hours: Duración del test en horas
+            min_samples: Mínimo de trades por variante
+            
+        Returns:
+            test_id: ID único del test
+        """
+        if not champions:
+            raise ValueError("Se necesita al menos un campeón para el test A/B")
+        
+        params = [c.parameters if isinstance(c, Individual) else c for c in champions[:2]]
+        test_id = self.create_test(
+            test_name,
+            control_params or StrategyParameters(),
+            params[0],
+            params[1] if len(params) > 1 else None,
+            duration_hours=duration_hours,
+            min_samples=min_samples
+        )
+        
+        # Guardar evidencia de backtest de cada variante
+        variants = (TestVariant.VARIANT_A, TestVariant.VARIANT_B)
+        for variant, champion in zip(variants, champions[:2]):
+            if isinstance(champion, Individual):
+                self.active_tests[test_id]['variants'][variant]['backtest'] = {
+                    'fitness': champion.fitness,
+                    'holdout_fitness': champion.holdout_fitness,
+                    'trades': champion.trades_count,
+                    'win_rate': champion.win_rate,
+                    'profit_usd': champion.profit_usd,
+                    'sharpe_ratio': champion.sharpe_ratio,
+                    'max_drawdown': champion.max_drawdown
+                }
+        
+        return test_id
+    
     def assign_variant(self, test_id: str) -> TestVariant:
         """Asigna variante aleatoriamente (distribución uniforme)"""
         if test_id not in self.active_tests:
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OMNIX - BACKTEST-GROUNDED FITNESS FOR THE GENETIC OPTIMIZER
+Fitness del GeneticOptimizer calculado con backtests reales, en paralelo
+
+Individual.calculate_fitness() puntuaba métricas que ningún backtest había
+producido, y la población se evaluaba individuo a individuo.  Este módulo:
+
+  1. Backtest columnar de cada genoma (genome_strategy): las señales del bot
+     (quantum momentum, Kalman, Monte Carlo, régimen HMM, Black Swan,
+     sentimiento) se calculan sobre OHLCV y se combinan con los pesos del
+     genoma; entrada con min_confidence_threshold, salida por señal o SL/TP
+  2. Ventanas held-out: los datos se dividen en ventanas de entrenamiento
+     contiguas más un tramo final de validación (holdout) que el optimizador
+     nunca ve — solo se usa para validar a los campeones
+  3. Evaluación por etapas en paralelo: cada generación se evalúa ventana a
+     ventana con ParameterSweep (pool de procesos, OHLCV en memoria
+     compartida).  Tras cada ventana se descartan los candidatos claramente
+     dominados (early stopping) y solo los supervivientes siguen
+  4. Caché de fitness por genoma: élites y genomas duplicados no se vuelven
+     a ejecutar nunca
+
+La puntuación sigue siendo Individual.calculate_fitness() — solo cambian sus
+entradas, que ahora vienen del backtest (con trades y profit proyectados al
+total de ventanas cuando la evaluación es parcial).
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .auto_optimizer import Individual, StrategyParameters
+
+logger = logging.getLogger(__name__)
+
+# Componentes de señal que se pueden reconstruir desde OHLCV: (peso, señal)
+OBSERVABLE_SIGNALS = (
+    "quantum", "kalman", "monte_carlo", "hmm", "black_swan", "sentiment",
+)
+WARMUP_BARS = 50
+_COSTS_KEY = "_costs"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Genome backtest (runs inside ParameterSweep workers)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def genome_signals(close: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+    """
+    Blended long probability in [0, 1] per candle from the genome's weights.
+    NaN during the indicator warm-up.
+    """
+    import pandas as pd
+
+    s = pd.Series(close)
+    returns = s.pct_change()
+
+    roc = (s / s.shift(10) - 1) * 100
+    quantum = (roc / params["quantum_threshold"]).clip(-1, 1)
+
+    ema = s.ewm(span=20, adjust=False).mean()
+    kalman = ((s - ema) / ema * 100 / params["kalman_threshold"]).clip(-1, 1)
+
+    p_up = (returns > 0).astype(float).rolling(20).mean()
+    conf = params["monte_carlo_confidence"]
+    monte_carlo = np.where(p_up >= conf, 1.0, np.where(p_up <= 1 - conf, -1.0, (p_up - 0.5) * 2))
+
+    sma = s.rolling(WARMUP_BARS).mean()
+    hmm = np.sign(sma - sma.shift(5))
+
+    kurt = returns.rolling(WARMUP_BARS).kurt()
+    black_swan = np.where(kurt > params["black_swan_kurtosis_threshold"], -1.0, 0.0)
+
+    delta = s.diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+    rsi = 100 - 100 / (1 + gain / loss.replace(0, np.nan))
+    band = params["sentiment_threshold"]
+    sentiment = np.where(rsi > band, 1.0, np.where(rsi < 100 - band, -1.0, 0.0))
+
+    signals = {
+        "quantum": np.asarray(quantum, dtype=float),
+        "kalman": np.asarray(kalman, dtype=float),
+        "monte_carlo": np.asarray(monte_carlo, dtype=float),
+        "hmm": np.asarray(hmm, dtype=float),
+        "black_swan": black_swan,
+        "sentiment": sentiment,
+    }
+    weights = np.array([max(0.0, float(params[f"{k}_weight"])) for k in OBSERVABLE_SIGNALS])
+    total = weights.sum() or 1.0
+    blend = sum(w * np.nan_to_num(signals[k]) for w, k in zip(weights, OBSERVABLE_SIGNALS)) / total
+    prob = (blend + 1) / 2
+    prob[:WARMUP_BARS] = np.nan
+    return prob
+
+
+def genome_strategy(data, start: int, end: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    ParameterSweep strategy: backtest one StrategyParameters genome on
+    data[start:end].  Long only; position size capped by max_position_size_usd.
+    """
+    from omnix_testing.backtesting.vectorized_engine import first_hit
+
+    costs = params.get(_COSTS_KEY, {})
+    capital0 = float(costs.get("initial_capital", 10000.0))
+    commission = float(costs.get("commission_rate", 0.001))
+    slippage = float(costs.get("slippage", 0.0005))
+
+    close = np.asarray(data.column("close")[start:end], dtype=np.float64)
+    n = len(close)
+    prob = genome_signals(close, params)
+    entries = np.flatnonzero(prob >= params["min_confidence_threshold"])
+    exits = np.flatnonzero(prob < 0.5)
+    sl, tp = params["stop_loss_percentage"], params["take_profit_percentage"]
+
+    capital = capital0
+    cash = np.empty(n, dtype=np.float64)
+    size = np.zeros(n, dtype=np.float64)
+    pnls: List[float] = []
+    flat_from, cursor = 0, 0
+    while True:
+        k = np.searchsorted(entries, cursor)
+        if k >= len(entries):
+            break
+        entry = int(entries[k])
+        cash[flat_from:entry] = capital
+        value = min(capital, float(params["max_position_size_usd"]))
+        if value <= 0:
+            break
+        qty = value * (1 - commission) / (close[entry] * (1 + slippage))
+        b = np.searchsorted(exits, entry + 1)
+        next_exit = int(exits[b]) if b < len(exits) else n
+        exit_ = first_hit(close, entry + 1, next_exit, close[entry] * (1 - sl), close[entry] * (1 + tp))
+        stop = min(exit_, n)
+        cash[entry:stop] = capital - value
+        size[entry:stop] = qty
+        exit_idx = min(exit_, n - 1)
+        proceeds = qty * close[exit_idx] * (1 - slippage) * (1 - commission)
+        capital = capital - value + proceeds
+        pnls.append(proceeds - value)
+        flat_from = stop
+        if exit_ >= n:
+            break
+        cursor = exit_ + 1
+    cash[flat_from:] = capital
+
+    equity = cash + close * size
+    peak = np.maximum.accumulate(equity)
+    max_drawdown = float(np.max((peak - equity) / peak)) if n else 0.0
+    rets = np.diff(equity) / equity[:-1] if n > 1 else np.array([])
+    ts = data.column("timestamp")[start:end]
+    bar_ns = float(np.median(np.diff(ts))) if n > 1 else 0.0
+    bars_per_year = 365 * 86400e9 / bar_ns if bar_ns > 0 else 252.0
+    std = float(rets.std()) if len(rets) > 1 else 0.0
+    sharpe = float(rets.mean() / std * np.sqrt(bars_per_year)) if std > 0 else 0.0
+
+    wins = sum(1 for p in pnls if p > 0)
+    return {
+        "metrics": {
+            "total_trades": len(pnls),
+            "winning_trades": wins,
+            "profit_usd": float(capital - capital0),
+            "total_return": float((capital - capital0) / capital0 * 100),
+            "sharpe_ratio": sharpe,
+            "max_drawdown": max_drawdown,
+        },
+        "final_capital": float(capital),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Evaluator
+# ─────────────────────────────────────────────────────────────────────────────
+
+def genome_key(parameters: StrategyParameters) -> str:
+    return json.dumps(parameters.to_dict(), sort_keys=True)
+
+
+def _aggregate(window_metrics: List[Dict[str, Any]]) -> Dict[str, float]:
+    trades = sum(int(m.get("total_trades", 0)) for m in window_metrics)
+    wins = sum(int(m.get("winning_trades", 0)) for m in window_metrics)
+    return {
+        "trades": trades,
+        "win_rate": wins / trades * 100 if trades else 0.0,
+        "profit_usd": sum(float(m.get("profit_usd", 0.0)) for m in window_metrics),
+        "sharpe_ratio": float(np.mean([m.get("sharpe_ratio", 0.0) for m in window_metrics])) if window_metrics else 0.0,
+        "max_drawdown": max((float(m.get("max_drawdown", 0.0)) for m in window_metrics), default=0.0),
+    }
+
+
+def _score(parameters: StrategyParameters, agg: Dict[str, float], scale: float) -> Tuple[Individual, float]:
+    """Individual.calculate_fitness on backtest metrics projected by `scale` (full / evaluated data)."""
+    ind = Individual(
+        parameters=parameters,
+        trades_count=int(round(agg["trades"] * scale)),
+        win_rate=agg["win_rate"],
+        profit_usd=agg["profit_usd"] * scale,
+        sharpe_ratio=agg["sharpe_ratio"],
+        max_drawdown=agg["max_drawdown"],
+    )
+    return ind, ind.calculate_fitness()
+
+
+class BacktestFitnessEvaluator:
+    """
+    Population fitness from staged, parallel backtests on held-out windows.
+
+    Usage:
+        with BacktestFitnessEvaluator(ohlcv_df) as evaluator:
+            ga = GeneticOptimizer(population_size=40, fitness_evaluator=evaluator)
+            ga.optimize(20)
+            champions = ga.get_champions(2)
+            ABTestingEngine().create_test_from_champions("GA run", champions)
+    """
+
+    def __init__(
+        self,
+        data,
+        n_windows: int = 3,
+        holdout_ratio: float = 0.2,
+        prune_ratio: float = 0.5,
+        min_windows: int = 1,
+        keep_top: int = 5,
+        initial_capital: float = 10000.0,
+        commission_rate: float = 0.001,
+        slippage: float = 0.0005,
+        max_workers: Optional[int] = None,
+        strategy: Callable[..., Dict] = genome_strategy,
+    ):
+        from omnix_testing.parameter_sweep import ParameterSweep
+
+        self.sweep = ParameterSweep(data, initial_capital=initial_capital,
+                                    commission_rate=commission_rate, slippage=slippage,
+                                    max_workers=max_workers)
+        self.strategy = strategy
+        self.costs = {"initial_capital": initial_capital,
+                      "commission_rate": commission_rate, "slippage": slippage}
+        self.prune_ratio = prune_ratio
+        self.min_windows = max(1, min_windows)
+        self.keep_top = max(1, keep_top)
+
+        n = len(self.sweep.data)
+        holdout = int(n * holdout_ratio)
+        train_end = n - holdout
+        step = train_end // max(1, n_windows)
+        if step <= WARMUP_BARS * 2:
+            raise ValueError(f"not enough data for {n_windows} windows ({n} candles)")
+        self.windows = [(i * step, (i + 1) * step if i < n_windows - 1 else train_end)
+                        for i in range(n_windows)]
+        self.holdout = (train_end, n) if holdout > WARMUP_BARS * 2 else None
+
+        self.fitness_cache: Dict[str, Dict[str, Any]] = {}
+        self.holdout_cache: Dict[str, float] = {}
+        self.cache_hits = 0
+        self.pruned = 0
+        self.backtests = 0
+
+        logger.info(
+            f"🧪 Backtest fitness: {n} velas, {len(self.windows)} ventanas de {step}, "
+            f"holdout={holdout}, workers={self.sweep.max_workers}"
+        )
+
+    # ── Population evaluation ────────────────────────────────────────────────
+
+    def evaluate_population(self, population: List[Individual]) -> None:
+        """Set fitness and backtest metrics on every individual (in place)."""
+        todo: Dict[str, List[Individual]] = {}
+        for ind in population:
+            key = genome_key(ind.parameters)
+            entry = self.fitness_cache.get(key)
+            if entry is not None:
+                self.cache_hits += 1
+                self._apply(ind, entry)
+            else:
+                todo.setdefault(key, []).append(ind)
+        if not todo:
+            return
+
+        params = {key: {**inds[0].parameters.to_dict(), _COSTS_KEY: self.costs}
+                  for key, inds in todo.items()}
+        partial: Dict[str, List[Dict[str, Any]]] = {key: [] for key in todo}
+        alive = set(todo)
+        cached_fitness = [ind.fitness for ind in population if genome_key(ind.parameters) not in todo]
+        n_windows = len(self.windows)
+
+        for w, rng in enumerate(self.windows):
+            by_sweep_key = {self.sweep.key(self.strategy, params[k], rng): k for k in alive}
+            jobs = [(self.strategy, params[k], rng) for k in alive]
+            for result in self.sweep.run_jobs(jobs):
+                key = by_sweep_key[result.key]
+                partial[key].append(result.metrics if result.ok else {})
+                self.backtests += 0 if result.cached else 1
+
+            done = w + 1
+            if done >= n_windows or done < self.min_windows:
+                continue
+            scores = {k: _score(todo[k][0].parameters, _aggregate(partial[k]), n_windows / done)[1]
+                      for k in alive}
+            ranked = sorted(list(scores.values()) + cached_fitness, reverse=True)
+            reference = ranked[min(self.keep_top, len(ranked)) - 1]
+            if reference <= 0:
+                continue
+            dominated = {k for k, f in scores.items() if f < self.prune_ratio * reference}
+            if dominated:
+                self.pruned += len(dominated)
+                logger.debug(f"✂️ {len(dominated)} candidatos dominados tras {done}/{n_windows} ventanas")
+                for k in dominated:
+                    self._store(k, todo[k][0].parameters, partial[k], n_windows / done, done)
+                alive -= dominated
+
+        for k in alive:
+            self._store(k, todo[k][0].parameters, partial[k], 1.0, n_windows)
+        for key, inds in todo.items():
+            for ind in inds:
+                self._apply(ind, self.fitness_cache[key])
+
+    def _store(self, key: str, parameters: StrategyParameters, window_metrics: List[Dict[str, Any]],
+               scale: float, windows_done: int) -> None:
+        agg = _aggregate(window_metrics)
+        _, fitness = _score(parameters, agg, scale)
+        self.fitness_cache[key] = {
+            "parameters": parameters.to_dict(),
+            "fitness": fitness,
+            "trades": agg["trades"],
+            "win_rate": agg["win_rate"],
+            "profit_usd": agg["profit_usd"],
+            "sharpe_ratio": agg["sharpe_ratio"],
+            "max_drawdown": agg["max_drawdown"],
+            "windows": windows_done,
+            "pruned": windows_done < len(self.windows),
+        }
+
+    @staticmethod
+    def _apply(ind: Individual, entry: Dict[str, Any]) -> None:
+        ind.fitness = entry["fitness"]
+        ind.trades_count = entry["trades"]
+        ind.win_rate = entry["win_rate"]
+        ind.profit_usd = entry["profit_usd"]
+        ind.sharpe_ratio = entry["sharpe_ratio"]
+        ind.max_drawdown = entry["max_drawdown"]
+        ind.pruned = entry["pruned"]
+
+    # ── Champions ────────────────────────────────────────────────────────────
+
+    def champions(self, n: int = 2) -> List[Individual]:
+        """
+        Best n fully evaluated genomes seen in any generation, each validated
+        on the holdout segment (Individual.holdout_fitness).
+        """
+        ranked = sorted(
+            (e for e in self.fitness_cache.values() if not e["pruned"]),
+            key=lambda e: e["fitness"], reverse=True,
+        )[:n]
+        champions = []
+        for entry in ranked:
+            ind = Individual(parameters=StrategyParameters.from_dict(entry["parameters"]))
+            self._apply(ind, entry)
+            champions.append(ind)
+        self.validate(champions)
+        return champions
+
+    def validate(self, individuals: List[Individual]) -> None:
+        """Backtest individuals on the holdout segment; sets holdout_fitness."""
+        if self.holdout is None:
+            return
+        train_len = self.windows[-1][1] - self.windows[0][0]
+        scale = train_len / (self.holdout[1] - self.holdout[0])
+        pending: Dict[str, Tuple[Dict[str, Any], StrategyParameters]] = {}
+        for ind in individuals:
+            key = genome_key(ind.parameters)
+            if key not in self.holdout_cache:
+                pending[key] = ({**ind.parameters.to_dict(), _COSTS_KEY: self.costs}, ind.parameters)
+        by_sweep_key = {self.sweep.key(self.strategy, p, self.holdout): k for k, (p, _) in pending.items()}
+        for result in self.sweep.run_jobs((self.strategy, p, self.holdout) for p, _ in pending.values()):
+            key = by_sweep_key[result.key]
+            _, fitness = _score(pending[key][1], _aggregate([result.metrics] if result.ok else []), scale)
+            self.holdout_cache[key] = fitness
+        for ind in individuals:
+            ind.holdout_fitness = self.holdout_cache.get(genome_key(ind.parameters))
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "windows": len(self.windows),
+            "holdout": self.holdout,
+            "genomes_evaluated": len(self.fitness_cache),
+            "backtests": self.backtests,
+            "cache_hits": self.cache_hits,
+            "pruned": self.pruned,
+        }
+
+    def close(self) -> None:
+        self.sweep.close()
+
+    def __enter__(self) -> "BacktestFitnessEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -45,6 +45,11 @@ class KrakenAPIClient:
         self._nonce_counter = 0
         self._last_nonce_time = 0
         
+        # MarketDataHub (WebSocket-fed local state) — set by TradingServiceEnterprise.
+        # When attached, public market data reads are served locally and REST is
+        # only used for recovery.
+        self._market_data_hub = None
+        
         logger.info("🏦 Kraken API Client initialized")
     
     def _generate_signature(self, urlpath: str, data: Dict, nonce: str) -> str:
@@ -139,7 +144,11 @@ class KrakenAPIClient:
             logger.error(f"Failed to get balance: {e}")
             return {}
     
-    @cache_result(ttl=10, key_prefix="kraken_price")
+    def attach_market_data_hub(self, hub) -> None:
+        """Serve get_ticker / get_ohlc / get_order_book from a MarketDataHub when fresh."""
+        self._market_data_hub = hub
+        hub.attach_rest(self)
+    
     def get_ticker(self, pair: str) -> Dict[str, Any]:
         """
         Get ticker information for trading pair
@@ -150,6 +159,20 @@ class KrakenAPIClient:
         Note: Kraken accepts short forms (XBTUSD) but returns extended forms (XXBTZUSD)
         This method handles both formats automatically.
         """
+        hub = self._market_data_hub
+        if hub is not None:
+            local = hub.peek_ticker(pair)
+            if local is not None:
+                return local
+            hub.track(pair)
+        return self._cached_ticker(pair)
+    
+    @cache_result(ttl=10, key_prefix="kraken_price")
+    def _cached_ticker(self, pair: str) -> Dict[str, Any]:
+        return self._rest_get_ticker(pair)
+    
+    def _rest_get_ticker(self, pair: str) -> Dict[str, Any]:
+        """Ticker via REST /0/public/Ticker (uncached)."""
         try:
             result = self._request('/0/public/Ticker', data={'pair': pair})
             if not result:
@@ -172,7 +195,6 @@ class KrakenAPIClient:
             logger.error(f"Failed to get ticker for {pair}: {e}")
             return {}
     
-    @cache_result(ttl=300, key_prefix="kraken_ohlc")
     def get_ohlc(self, pair: str, interval: int = 60, since: Optional[int] = None) -> List[List]:
         """
         Get OHLC (candlestick) data for historical analysis
@@ -185,6 +207,24 @@ class KrakenAPIClient:
         Returns:
             List of OHLC data: [time, open, high, low, close, vwap, volume, count]
         """
+        hub = self._market_data_hub
+        if hub is not None:
+            local = hub.peek_ohlc(pair, interval, since)
+            if local is not None:
+                return local
+            hub.track(pair, intervals=(interval,))
+            rows = self._rest_get_ohlc(pair, interval=interval, since=since)
+            if since is None:
+                hub.seed_ohlc(pair, interval, rows)
+            return rows
+        return self._cached_ohlc(pair, interval=interval, since=since)
+    
+    @cache_result(ttl=300, key_prefix="kraken_ohlc")
+    def _cached_ohlc(self, pair: str, interval: int = 60, since: Optional[int] = None) -> List[List]:
+        return self._rest_get_ohlc(pair, interval=interval, since=since)
+    
+    def _rest_get_ohlc(self, pair: str, interval: int = 60, since: Optional[int] = None) -> List[List]:
+        """OHLC via REST /0/public/OHLC (uncached)."""
         try:
             data = {'pair': pair, 'interval': interval}
             if since:
@@ -207,6 +247,16 @@ class KrakenAPIClient:
     
     def get_order_book(self, pair: str, count: int = 10) -> Dict[str, Any]:
         """Get order book for analysis"""
+        hub = self._market_data_hub
+        if hub is not None:
+            local = hub.peek_order_book(pair, count)
+            if local is not None:
+                return local
+            hub.track(pair, book=True)
+        return self._rest_get_order_book(pair, count=count)
+    
+    def _rest_get_order_book(self, pair: str, count: int = 10) -> Dict[str, Any]:
+        """Order book via REST /0/public/Depth."""
         try:
             result = self._request('/0/public/Depth', data={'pair': pair, 'count': count})
             if not result:
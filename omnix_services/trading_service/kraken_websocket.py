@@ -43,6 +43,7 @@ class KrakenWebSocketClient:
         self.running = False
         self.subscriptions = {}
         self.listeners = {}  # {channel: [callbacks]}
+        self.raw_listeners = []  # callbacks con cada mensaje de mercado sin procesar (MarketDataHub)
         
         # Estado
         self.connected = False
@@ -156,11 +157,18 @@ class KrakenWebSocketClient:
                     return
             
             # Datos de mercado (array format)
+            # [channelID, payload, channelName, pair] — los mensajes de book pueden
+            # traer dos payloads (asks y bids), por eso nombre y par se leen del final
             if isinstance(data, list) and len(data) >= 2:
-                channel_id = data[0]
+                for raw_callback in self.raw_listeners:
+                    try:
+                        raw_callback(data)
+                    except Exception as e:
+                        logger.error(f"Error in raw listener callback: {e}")
+                
                 channel_data = data[1]
-                channel_name = data[2] if len(data) > 2 else None
-                pair = data[3] if len(data) > 3 else None
+                channel_name = data[-2] if len(data) > 3 else (data[2] if len(data) > 2 else None)
+                pair = data[-1] if len(data) > 3 else None
                 
                 # Broadcast a listeners (solo si channel_name existe)
                 if channel_name:
@@ -289,6 +297,57 @@ class KrakenWebSocketClient:
         
         logger.info(f"✅ Trades listener added for {pair}")
     
+    def subscribe_book(self, pair: str, depth: int, callback: Callable):
+        """
+        Suscribirse al order book L2
+        
+        Args:
+            pair: Par de trading
+            depth: Niveles por lado (10, 25, 100, 500, 1000)
+            callback: Función a llamar con cada update
+        """
+        channel = f"book_{pair}"
+        
+        self.subscriptions[channel] = {
+            "pair": [pair],
+            "subscription": {"name": "book", "depth": depth}
+        }
+        
+        if channel not in self.listeners:
+            self.listeners[channel] = []
+        self.listeners[channel].append(callback)
+        
+        if self.connected and self._loop:
+            asyncio.run_coroutine_threadsafe(
+                self._subscribe_channel(channel, self.subscriptions[channel]),
+                self._loop
+            )
+        
+        logger.info(f"✅ Book listener added for {pair} (depth={depth})")
+    
+    def resubscribe(self, channel: str):
+        """
+        Cancelar y volver a suscribir un canal (Kraken reenvía el snapshot).
+        Usado por el MarketDataHub cuando el checksum del book no coincide.
+        """
+        config = self.subscriptions.get(channel)
+        if not config or not (self.connected and self._loop):
+            return
+        
+        async def _cycle():
+            try:
+                await self.ws.send(json.dumps({"event": "unsubscribe", **config}))
+            except Exception as e:
+                logger.error(f"Error unsubscribing {channel}: {e}")
+            await self._subscribe_channel(channel, config)
+        
+        asyncio.run_coroutine_threadsafe(_cycle(), self._loop)
+    
+    def add_raw_listener(self, callback: Callable):
+        """Recibir cada mensaje de mercado (lista v1 sin procesar)"""
+        if callback not in self.raw_listeners:
+            self.raw_listeners.append(callback)
+    
     def get_status(self) -> Dict:
         """Obtener estado del WebSocket"""
         return {
@@ -0,0 +1,516 @@
+"""
+🛰️ OMNIX MARKET DATA HUB - PROCESS-LOCAL MARKET STATE FROM THE KRAKEN WEBSOCKET
+In-memory tickers, checksummed L2 order books and OHLC ring buffers
+
+KrakenAPIClient.get_ticker / get_ohlc / get_order_book hit REST on every call even
+though KrakenWebSocketClient already streams the same data.  The hub keeps the
+latest state in memory, fed by the WebSocket, and answers those reads locally:
+
+  - Ticker:  last WS ticker payload (same dict shape as REST /0/public/Ticker)
+  - Book:    L2 book per pair, CRC32-verified against Kraken's "c" checksum on
+             every update; a mismatch invalidates the book and resubscribes
+  - OHLC:    ring buffer per (pair, interval) in REST row format
+             [time, open, high, low, close, vwap, volume, count]
+
+REST is only used for recovery: seeding a ring, backfilling a candle gap after
+a reconnect, and serving a read while the local copy is missing, invalid or
+stale.  peek_* never touches the network (used by KrakenAPIClient); get_* falls
+back to REST.  Every consumer — bot, arbitrage scanner, correlation engine —
+goes through the same read API; correlation_inputs() builds the
+CrossAssetCorrelationEngine.update() payload.
+
+Replay: replay(path) feeds a recorded message file through the same handler
+(record with OMNIX_MDH_RECORD_PATH), so the hub can be tested offline.
+
+Configuration:
+  OMNIX_MARKET_DATA_HUB     enable the hub in TradingServiceEnterprise (default true)
+  OMNIX_MDH_STALE_S         ticker / book max age before REST fallback (default 30)
+  OMNIX_MDH_OHLC_STALE_S    candle ring max age before REST reseed     (default 300)
+  OMNIX_MDH_RING_SIZE       candles kept per (pair, interval)          (default 720)
+  OMNIX_MDH_BOOK_DEPTH      WS book depth subscribed                   (default 25)
+  OMNIX_MDH_RECORD_PATH     append every WS message to this JSONL file (default off)
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_BASE_ALIASES = {"BTC": "XBT", "XXBT": "XBT", "XETH": "ETH", "DOGE": "XDG", "XXDG": "XDG"}
+_QUOTES = ("USDT", "USDC", "ZUSD", "ZEUR", "USD", "EUR", "GBP")
+_QUOTE_ALIASES = {"ZUSD": "USD", "ZEUR": "EUR"}
+
+
+def normalize_pair(pair: str) -> str:
+    """'BTC/USD', 'XBTUSD', 'XXBTZUSD', 'xbt/usd' → 'XBT/USD' (WebSocket v1 naming)."""
+    p = (pair or "").upper().replace("-", "/")
+    if "/" in p:
+        base, quote = p.split("/", 1)
+    else:
+        base, quote = p, ""
+        for q in _QUOTES:
+            if p.endswith(q) and len(p) > len(q):
+                base, quote = p[: -len(q)], q
+                break
+    if len(base) == 4 and base[0] == "X" and base not in _BASE_ALIASES and quote in ("ZUSD", "ZEUR"):
+        base = base[1:]
+    return f"{_BASE_ALIASES.get(base, base)}/{_QUOTE_ALIASES.get(quote, quote)}"
+
+
+def _checksum_field(value: str) -> str:
+    return value.replace(".", "").lstrip("0")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  L2 order book
+# ─────────────────────────────────────────────────────────────────────────────
+
+class L2Book:
+    """
+    One side-sorted L2 book, kept with Kraken's original price / volume strings
+    so the CRC32 checksum can be recomputed exactly.  Not thread-safe on its
+    own — the hub serialises access.
+    """
+
+    __slots__ = ("depth", "asks", "bids", "valid", "updated_at")
+
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.asks: Dict[str, Tuple[float, str, str]] = {}   # price str → (price, volume str, ts)
+        self.bids: Dict[str, Tuple[float, str, str]] = {}
+        self.valid = False
+        self.updated_at = 0.0
+
+    def load_snapshot(self, asks: Iterable[List[str]], bids: Iterable[List[str]]) -> None:
+        self.asks = {a[0]: (float(a[0]), a[1], a[2]) for a in asks}
+        self.bids = {b[0]: (float(b[0]), b[1], b[2]) for b in bids}
+        self.valid = True
+        self.updated_at = time.monotonic()
+
+    def apply(self, side: str, levels: Iterable[List[str]]) -> None:
+        book = self.asks if side == "a" else self.bids
+        for level in levels:
+            price, volume = level[0], level[1]
+            if float(volume) == 0.0:
+                book.pop(price, None)
+            else:
+                book[price] = (float(price), volume, level[2])
+        self.updated_at = time.monotonic()
+
+    def truncate(self) -> None:
+        """Drop levels beyond the subscribed depth (required for the checksum)."""
+        for side, reverse in ((self.asks, False), (self.bids, True)):
+            if len(side) > self.depth:
+                for price, _ in self.sorted_side(side, reverse)[self.depth:]:
+                    side.pop(price, None)
+
+    @staticmethod
+    def sorted_side(side: Dict[str, Tuple[float, str, str]], reverse: bool):
+        return sorted(side.items(), key=lambda kv: kv[1][0], reverse=reverse)
+
+    def checksum(self) -> int:
+        parts = []
+        for side, reverse in ((self.asks, False), (self.bids, True)):
+            for price, (_, volume, _) in self.sorted_side(side, reverse)[:10]:
+                parts.append(_checksum_field(price) + _checksum_field(volume))
+        return zlib.crc32("".join(parts).encode()) & 0xFFFFFFFF
+
+    def to_rest(self, count: int) -> Dict[str, List[List[Any]]]:
+        """REST /0/public/Depth shape: {'asks': [[price, volume, ts], …], 'bids': […]}."""
+        return {
+            "asks": [[p, v, t] for p, (_, v, t) in self.sorted_side(self.asks, False)[:count]],
+            "bids": [[p, v, t] for p, (_, v, t) in self.sorted_side(self.bids, True)[:count]],
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  OHLC ring buffer
+# ─────────────────────────────────────────────────────────────────────────────
+
+class CandleRing:
+    """Rolling candles for one (pair, interval) in REST row format, oldest first."""
+
+    __slots__ = ("interval_s", "rows", "updated_at", "backfilling")
+
+    def __init__(self, interval_min: int, size: int) -> None:
+        self.interval_s = interval_min * 60
+        self.rows: Deque[List[Any]] = deque(maxlen=size)
+        self.updated_at = 0.0
+        self.backfilling = False
+
+    def last_start(self) -> Optional[int]:
+        return int(self.rows[-1][0]) if self.rows else None
+
+    def merge(self, rows: Iterable[List[Any]]) -> None:
+        """Insert / replace REST-format rows (used for seeding and backfill)."""
+        by_start = {int(r[0]): list(r) for r in self.rows}
+        for r in rows:
+            by_start[int(r[0])] = [int(r[0])] + list(r[1:])
+        self.rows.clear()
+        for start in sorted(by_start)[-self.rows.maxlen:]:
+            self.rows.append(by_start[start])
+        self.updated_at = time.monotonic()
+
+    def upsert(self, row: List[Any]) -> None:
+        """Apply one live candle: replace the in-progress candle or append a new one."""
+        start = int(row[0])
+        last = self.last_start()
+        if last is not None and start == last:
+            self.rows[-1] = row
+        elif last is None or start > last:
+            self.rows.append(row)
+        self.updated_at = time.monotonic()
+
+    def since(self, since: Optional[int]) -> List[List[Any]]:
+        if since is None:
+            return [list(r) for r in self.rows]
+        return [list(r) for r in self.rows if int(r[0]) > since]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Hub
+# ─────────────────────────────────────────────────────────────────────────────
+
+class MarketDataHub:
+    """
+    Process-local market state shared by every consumer.
+
+    Thread-safety: WS updates arrive on the WebSocket loop thread; reads come
+    from any thread.  One lock guards all state; reads copy out small slices.
+    """
+
+    def __init__(
+        self,
+        rest: Any = None,
+        ws: Any = None,
+        stale_s: Optional[float] = None,
+        ohlc_stale_s: Optional[float] = None,
+        ring_size: Optional[int] = None,
+        book_depth: Optional[int] = None,
+        record_path: Optional[str] = None,
+    ):
+        self._rest = rest
+        self._ws = None
+        self.stale_s = float(stale_s if stale_s is not None
+                             else os.environ.get("OMNIX_MDH_STALE_S", "30"))
+        self.ohlc_stale_s = float(ohlc_stale_s if ohlc_stale_s is not None
+                                  else os.environ.get("OMNIX_MDH_OHLC_STALE_S", "300"))
+        self.ring_size = int(ring_size or os.environ.get("OMNIX_MDH_RING_SIZE", "720"))
+        self.book_depth = int(book_depth or os.environ.get("OMNIX_MDH_BOOK_DEPTH", "25"))
+        self._record_path = record_path if record_path is not None \
+            else os.environ.get("OMNIX_MDH_RECORD_PATH") or None
+        self._record_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._tickers: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._books: Dict[str, L2Book] = {}
+        self._rings: Dict[Tuple[str, int], CandleRing] = {}
+        self._tracked: set = set()
+
+        self.messages = 0
+        self.checksum_failures = 0
+        self.local_hits = 0
+        self.rest_fallbacks = 0
+        self.backfills = 0
+
+        if ws is not None:
+            self.attach_ws(ws)
+
+    # ── Wiring ───────────────────────────────────────────────────────────────
+
+    def attach_ws(self, ws: Any) -> None:
+        """Tap the WebSocket client's raw message stream."""
+        self._ws = ws
+        ws.add_raw_listener(self.on_message)
+
+    def attach_rest(self, rest: Any) -> None:
+        self._rest = rest
+
+    def track(self, pair: str, intervals: Iterable[int] = (), book: bool = False) -> None:
+        """Subscribe the WS feeds a pair needs (idempotent)."""
+        key = normalize_pair(pair)
+        wanted = [("ticker", None)] + [("ohlc", int(i)) for i in intervals]
+        if book:
+            wanted.append(("book", self.book_depth))
+        ws = self._ws
+        for kind, arg in wanted:
+            tag = (key, kind, arg)
+            if tag in self._tracked:
+                continue
+            self._tracked.add(tag)
+            if ws is None:
+                continue
+            try:
+                if kind == "ticker":
+                    ws.subscribe_ticker(key, _noop)
+                elif kind == "ohlc":
+                    ws.subscribe_ohlc(key, arg, _noop)
+                else:
+                    ws.subscribe_book(key, arg, _noop)
+            except Exception as e:
+                logger.warning(f"⚠️ [MDH] Subscribe {kind} {key} failed: {e}")
+
+    # ── Ingest ───────────────────────────────────────────────────────────────
+
+    def on_message(self, message: Any) -> None:
+        """Handle one WS v1 message (raw JSON text or already-parsed). Never raises."""
+        try:
+            data = json.loads(message) if isinstance(message, (str, bytes)) else message
+            if self._record_path:
+                self._record(data)
+            if not isinstance(data, list) or len(data) < 4:
+                return
+            channel, pair = data[-2], normalize_pair(data[-1])
+            payloads = data[1:-2]
+            self.messages += 1
+            if channel == "ticker":
+                with self._lock:
+                    self._tickers[pair] = (time.monotonic(), payloads[0])
+            elif isinstance(channel, str) and channel.startswith("ohlc-"):
+                self._on_candle(pair, int(channel.split("-", 1)[1]), payloads[0])
+            elif isinstance(channel, str) and channel.startswith("book-"):
+                self._on_book(pair, int(channel.split("-", 1)[1]), payloads)
+        except Exception as e:
+            logger.error(f"❌ [MDH] Error handling message: {e}")
+
+    def _on_candle(self, pair: str, interval: int, candle: List[Any]) -> None:
+        # WS: [time, etime, open, high, low, close, vwap, volume, count]
+        start = int(float(candle[1])) - interval * 60
+        row = [start, candle[2], candle[3], candle[4], candle[5], candle[6], candle[7], int(candle[8])]
+        backfill_from = None
+        with self._lock:
+            ring = self._rings.get((pair, interval))
+            if ring is None:
+                ring = self._rings[(pair, interval)] = CandleRing(interval, self.ring_size)
+            last = ring.last_start()
+            if last is not None and start > last + ring.interval_s and not ring.backfilling:
+                ring.backfilling = self._rest is not None
+                backfill_from = last if ring.backfilling else None
+            ring.upsert(row)
+        if backfill_from is not None:
+            threading.Thread(
+                target=self._backfill, args=(pair, interval, backfill_from),
+                daemon=True, name="MDH-backfill",
+            ).start()
+
+    def _backfill(self, pair: str, interval: int, since: int) -> None:
+        """Fill a candle gap (missed while disconnected) from REST."""
+        try:
+            rows = self._rest_call("get_ohlc", pair, interval=interval, since=since)
+            with self._lock:
+                ring = self._rings[(pair, interval)]
+                if rows:
+                    ring.merge(rows)
+                ring.backfilling = False
+            self.backfills += 1
+            logger.info(f"🔁 [MDH] Backfilled {len(rows or [])} {interval}m candles for {pair}")
+        except Exception as e:
+            logger.warning(f"⚠️ [MDH] Backfill {pair} {interval}m failed: {e}")
+            with self._lock:
+                self._rings[(pair, interval)].backfilling = False
+
+    def _on_book(self, pair: str, depth: int, payloads: List[Dict[str, Any]]) -> None:
+        resync = False
+        with self._lock:
+            book = self._books.get(pair)
+            if book is None or book.depth != depth:
+                book = self._books[pair] = L2Book(depth)
+            merged: Dict[str, Any] = {}
+            for p in payloads:
+                merged.update(p)
+            if "as" in merged or "bs" in merged:
+                book.load_snapshot(merged.get("as", []), merged.get("bs", []))
+                return
+            if not book.valid:
+                return
+            for side in ("a", "b"):
+                if side in merged:
+                    book.apply(side, merged[side])
+            book.truncate()
+            expected = merged.get("c")
+            if expected is not None and book.checksum() != int(expected):
+                book.valid = False
+                self.checksum_failures += 1
+                resync = True
+        if resync:
+            logger.warning(f"⚠️ [MDH] Book checksum mismatch for {pair} — resubscribing")
+            ws = self._ws
+            if ws is not None:
+                try:
+                    ws.resubscribe(f"book_{pair}")
+                except Exception as e:
+                    logger.warning(f"⚠️ [MDH] Book resubscribe {pair} failed: {e}")
+
+    # ── Local reads (never touch the network) ────────────────────────────────
+
+    def peek_ticker(self, pair: str) -> Optional[Dict[str, Any]]:
+        key = normalize_pair(pair)
+        with self._lock:
+            entry = self._tickers.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.stale_s:
+                return None
+            self.local_hits += 1
+            return dict(entry[1])
+
+    def peek_ohlc(self, pair: str, interval: int, since: Optional[int] = None) -> Optional[List[List[Any]]]:
+        key = (normalize_pair(pair), int(interval))
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None or not ring.rows or ring.backfilling:
+                return None
+            if time.monotonic() - ring.updated_at > self.ohlc_stale_s:
+                return None
+            if since is not None and int(ring.rows[0][0]) > since:
+                return None                      # ring does not reach back that far
+            self.local_hits += 1
+            return ring.since(since)
+
+    def peek_order_book(self, pair: str, count: int = 10) -> Optional[Dict[str, Any]]:
+        key = normalize_pair(pair)
+        with self._lock:
+            book = self._books.get(key)
+            if book is None or not book.valid or count > book.depth:
+                return None
+            if time.monotonic() - book.updated_at > self.stale_s:
+                return None
+            self.local_hits += 1
+            return book.to_rest(count)
+
+    # ── Reads with REST recovery ─────────────────────────────────────────────
+
+    def get_ticker(self, pair: str) -> Dict[str, Any]:
+        local = self.peek_ticker(pair)
+        if local is not None:
+            return local
+        self.track(pair)
+        return self._rest_call("get_ticker", pair) or {}
+
+    def get_ohlc(self, pair: str, interval: int = 60, since: Optional[int] = None) -> List[List[Any]]:
+        local = self.peek_ohlc(pair, interval, since)
+        if local is not None:
+            return local
+        self.track(pair, intervals=(interval,))
+        rows = self._rest_call("get_ohlc", pair, interval=interval, since=since) or []
+        if since is None:
+            self.seed_ohlc(pair, interval, rows)
+        return rows
+
+    def get_order_book(self, pair: str, count: int = 10) -> Dict[str, Any]:
+        local = self.peek_order_book(pair, count)
+        if local is not None:
+            return local
+        self.track(pair, book=True)
+        return self._rest_call("get_order_book", pair, count=count) or {}
+
+    def seed_ohlc(self, pair: str, interval: int, rows: List[List[Any]]) -> None:
+        """Load REST candles into the ring (snapshot recovery)."""
+        if not rows:
+            return
+        key = (normalize_pair(pair), int(interval))
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                ring = self._rings[key] = CandleRing(int(interval), self.ring_size)
+            ring.merge(rows)
+
+    def correlation_inputs(self, symbols: Iterable[str], quote: str = "USD") -> Dict[str, Dict[str, float]]:
+        """
+        CrossAssetCorrelationEngine.update() payload from local tickers:
+        {'BTC': {'price': last, 'volume': 24h volume}, …}.  Symbols without a
+        fresh ticker are omitted.
+        """
+        out: Dict[str, Dict[str, float]] = {}
+        for symbol in symbols:
+            ticker = self.peek_ticker(f"{symbol}/{quote}")
+            if ticker and ticker.get("c"):
+                volume = ticker.get("v") or [0, 0]
+                out[symbol] = {"price": float(ticker["c"][0]), "volume": float(volume[-1])}
+        return out
+
+    def _rest_call(self, method: str, pair: str, **kwargs: Any) -> Any:
+        if self._rest is None:
+            return None
+        self.rest_fallbacks += 1
+        fn = getattr(self._rest, f"_rest_{method}", None) or getattr(self._rest, method)
+        return fn(pair, **kwargs)
+
+    # ── Record / replay ──────────────────────────────────────────────────────
+
+    def _record(self, data: Any) -> None:
+        line = json.dumps({"t": time.time(), "m": data}, separators=(",", ":"))
+        with self._record_lock:
+            with open(self._record_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def replay(self, path: str, realtime: bool = False,
+               on_message: Optional[Callable[[Any], None]] = None) -> int:
+        """
+        Feed a recorded message file through on_message().  Lines are either
+        {"t": epoch, "m": message} (as written by OMNIX_MDH_RECORD_PATH) or a
+        bare WS message.  realtime=True sleeps between messages by their
+        recorded spacing.  Returns the number of messages replayed.
+        """
+        count, prev_t = 0, None
+        record_path, self._record_path = self._record_path, None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    if isinstance(entry, dict) and "m" in entry:
+                        t, message = entry.get("t"), entry["m"]
+                    else:
+                        t, message = None, entry
+                    if realtime and t is not None and prev_t is not None:
+                        time.sleep(max(0.0, t - prev_t))
+                    prev_t = t if t is not None else prev_t
+                    self.on_message(message)
+                    if on_message is not None:
+                        on_message(message)
+                    count += 1
+        finally:
+            self._record_path = record_path
+        return count
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tickers":           len(self._tickers),
+                "books":             sum(1 for b in self._books.values() if b.valid),
+                "candle_rings":      len(self._rings),
+                "messages":          self.messages,
+                "local_hits":        self.local_hits,
+                "rest_fallbacks":    self.rest_fallbacks,
+                "checksum_failures": self.checksum_failures,
+                "backfills":         self.backfills,
+            }
+
+
+def _noop(_data: Any) -> None:
+    return None
+
+
+# Singleton global: un hub por proceso, compartido por bot, arbitraje y correlación
+_global_hub: Optional[MarketDataHub] = None
+_global_hub_lock = threading.Lock()
+
+
+def get_market_data_hub() -> MarketDataHub:
+    """Obtener instancia global del MarketDataHub (rebuilt after fork)."""
+    global _global_hub
+    if _global_hub is None or getattr(_global_hub, "_pid", None) != os.getpid():
+        with _global_hub_lock:
+            if _global_hub is None or getattr(_global_hub, "_pid", None) != os.getpid():
+                _global_hub = MarketDataHub()
+                _global_hub._pid = os.getpid()
+    return _global_hub
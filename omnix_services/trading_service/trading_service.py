@@ -3,6 +3,7 @@ OMNIX V5.1 ENTERPRISE - Trading Service Orchestrator
 Coordina todos los módulos de trading: Kraken API, Monte Carlo, Black Swan, PQC
 """
 
+import os
 from typing import Dict, Any, Optional, List
 from omnix_config.settings import settings
 from omnix_core.utils.logger import get_logger
@@ -56,6 +57,22 @@ class TradingServiceEnterprise:
             logger.warning(f"⚠️ WebSocket not available: {e}")
             self.ws = None
         
+        # MarketDataHub: tickers, L2 books y candles locales alimentados por el WebSocket.
+        # KrakenAPIClient.get_ticker / get_ohlc / get_order_book leen de aquí y solo
+        # usan REST para recuperación (arranque, huecos tras reconexión, datos stale).
+        self.market_data = None
+        if self.ws is not None and os.getenv("OMNIX_MARKET_DATA_HUB", "true").lower() == "true":
+            try:
+                from .market_data_hub import get_market_data_hub
+                self.market_data = get_market_data_hub()
+                if self.market_data._ws is not self.ws:
+                    self.market_data.attach_ws(self.ws)
+                self.kraken.attach_market_data_hub(self.market_data)
+                logger.info("🛰️ MarketDataHub enabled - market reads served from WebSocket state")
+            except Exception as e:
+                logger.warning(f"⚠️ MarketDataHub not available: {e}")
+                self.market_data = None
+        
         # Backtesting Engine para validar estrategias
         try:
             self.backtesting = BacktestingEngine(kraken_client=self.kraken)
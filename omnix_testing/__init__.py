@@ -5,6 +5,8 @@ Desarrollado por Harold Nunes - Noviembre 2025
 
 COMPONENTES:
 - BacktestingEngine: Motor de backtesting con datos reales de Kraken
+- VectorizedBacktestingEngine: Motor columnar (NumPy) con resultados idénticos
+- ParameterSweep: Barrido de parámetros en paralelo sobre OHLCV en memoria compartida
 - ProfessionalValidator: Validación anti-overfitting (Walk-Forward + Monte Carlo)
 - KrakenDataDownloader: Descarga de datos históricos
 - MetricsCalculator: Cálculo de métricas institucionales
@@ -14,6 +16,8 @@ __version__ = "1.1.0"
 __author__ = "Harold Nunes"
 
 from omnix_testing.backtesting.backtesting_engine import BacktestingEngine
+from omnix_testing.backtesting.vectorized_engine import VectorizedBacktestingEngine
+from omnix_testing.parameter_sweep import ParameterSweep, SharedOHLCV, SweepResult, parameter_grid
 from omnix_testing.backtesting.kraken_data_downloader import KrakenDataDownloader
 from omnix_testing.backtesting.metrics_calculator import MetricsCalculator
 
@@ -35,6 +39,11 @@ from omnix_testing.institutional_stress_suite import (
 
 __all__ = [
     'BacktestingEngine',
+    'VectorizedBacktestingEngine',
+    'ParameterSweep',
+    'SharedOHLCV',
+    'SweepResult',
+    'parameter_grid',
     'KrakenDataDownloader', 
     'MetricsCalculator',
     'ProfessionalValidator',
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OMNIX - Columnar Vectorized Backtesting Engine
+Motor de backtesting columnar: mismos resultados que BacktestingEngine.run_backtest,
+sin recorrer las velas una a una con df.iloc[i]
+
+BacktestingEngine procesa cada vela en Python (df.iloc[i], np.mean sobre una
+lista de 100 precios, equity_curve.append).  Para un año de velas de 1 minuto
+eso son ~525K iteraciones por estrategia.  Este motor trabaja por columnas:
+
+  1. Indicadores y señales precalculados como arrays NumPy
+     (medias móviles con sliding_window_view, cruces como máscaras booleanas)
+  2. Solo se itera sobre EVENTOS (entradas / salidas), no sobre velas: la
+     siguiente salida se busca con máscaras vectorizadas (cruce bajista,
+     stop loss, take profit)
+  3. Fills, comisión y slippage reutilizan _open_position / _close_position
+     del motor original — una llamada por trade, mismas fórmulas
+  4. Equity y drawdown se construyen con operaciones acumuladas sobre arrays
+
+Paridad: los resultados (trades, equity_curve, final_capital, métricas)
+coinciden con BacktestingEngine.run_backtest bit a bit — las medias usan la
+misma suma por pares de np.mean y las ventanas reproducen el buffer de 100
+precios del motor original.  Las estrategias sin versión columnar
+(ares_v1_swing, ares_v2_scalping) delegan en el motor original.
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from omnix_testing.backtesting.backtesting_engine import BacktestingEngine
+except ImportError:
+    from .backtesting_engine import BacktestingEngine
+
+logger = logging.getLogger(__name__)
+
+# Tamaño del buffer price_history del motor original
+PRICE_HISTORY_LEN = 100
+
+# Estrategias con implementación columnar
+VECTORIZED_STRATEGIES = ("simple_ma_cross", "buy_hold", "rsi_divergence")
+
+
+def _trailing_means(x: np.ndarray, ends: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Mean of x[end - length + 1 : end + 1] for each (end, length) pair.
+
+    Uses np.mean over contiguous windows so every value is bit-identical to
+    np.mean(prices[-length:]) in the per-candle engine.
+    """
+    out = np.empty(len(ends), dtype=np.float64)
+    for k in np.unique(lengths):
+        sel = lengths == k
+        starts = ends[sel] - int(k) + 1
+        view = sliding_window_view(x, int(k))
+        if len(starts) * 4 > len(view):
+            out[sel] = view.mean(axis=1)[starts]
+        else:
+            out[sel] = view[starts].mean(axis=1)
+    return out
+
+
+def ma_cross_signals(close: np.ndarray, fast_period: int, slow_period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bullish / bearish MA-cross masks, replicating _strategy_ma_cross exactly:
+    means over a price buffer capped at PRICE_HISTORY_LEN, no signal until the
+    buffer holds at least 30 prices and more than slow_period prices.
+    """
+    n = len(close)
+    bullish = np.zeros(n, dtype=bool)
+    bearish = np.zeros(n, dtype=bool)
+    first = max(29, slow_period)
+    if first >= n or slow_period >= PRICE_HISTORY_LEN:
+        return bullish, bearish
+
+    idx = np.arange(first, n)
+    buf = np.minimum(idx + 1, PRICE_HISTORY_LEN)      # len(price_history) at each candle
+    fast_cur = _trailing_means(close, idx, np.minimum(fast_period, buf))
+    slow_cur = _trailing_means(close, idx, np.minimum(slow_period, buf))
+    fast_prev = _trailing_means(close, idx - 1, np.minimum(fast_period, buf - 1))
+    slow_prev = _trailing_means(close, idx - 1, np.minimum(slow_period, buf - 1))
+
+    bullish[first:] = (fast_prev <= slow_prev) & (fast_cur > slow_cur)
+    bearish[first:] = (fast_prev >= slow_prev) & (fast_cur < slow_cur)
+    return bullish, bearish
+
+
+def drawdown_series(equity: np.ndarray) -> np.ndarray:
+    """Drawdown in % from the running peak (0 at new highs, negative below)."""
+    peak = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peak > 0, (equity - peak) / peak * 100, 0.0)
+    return dd
+
+
+def first_hit(close: np.ndarray, start: int, stop: int, low: float, high: float) -> int:
+    """First index in [start, stop) with close <= low or close >= high, else stop."""
+    chunk = 256
+    i = start
+    while i < stop:
+        end = min(stop, i + chunk)
+        seg = close[i:end]
+        hit = (seg <= low) | (seg >= high)
+        if hit.any():
+            return i + int(hit.argmax())
+        i = end
+        chunk = min(chunk * 4, 1 << 20)
+    return stop
+
+
+class VectorizedBacktestingEngine(BacktestingEngine):
+    """
+    Drop-in replacement for BacktestingEngine with a columnar simulation core.
+
+    run_backtest() returns the same dictionary as the original (plus
+    'drawdown_curve'); simulate() runs directly on NumPy arrays, without
+    downloading, for parameter sweeps and optimizers.
+    """
+
+    def run_backtest(
+        self,
+        pair: str = "XBTUSD",
+        interval: str = "1h",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy_name: str = "simple_ma_cross",
+        strategy_params: Optional[Dict] = None
+    ) -> Dict:
+        """Run complete backtest (same signature and result as BacktestingEngine)."""
+        if strategy_name not in VECTORIZED_STRATEGIES:
+            logger.info(f"↩️ {strategy_name} sin versión columnar — usando motor por velas")
+            return super().run_backtest(pair, interval, start_date, end_date,
+                                        strategy_name, strategy_params)
+
+        df = self.data_downloader.download_ohlcv(
+            pair=pair,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if df is None or len(df) < 50:
+            logger.error("❌ Datos insuficientes para backtesting")
+            return {'error': 'Insufficient data'}
+
+        return self.run_on_dataframe(df, strategy_name, strategy_params,
+                                     pair=pair, interval=interval)
+
+    def run_on_dataframe(
+        self,
+        df,
+        strategy_name: str = "simple_ma_cross",
+        strategy_params: Optional[Dict] = None,
+        pair: str = "XBTUSD",
+        interval: str = "1h"
+    ) -> Dict:
+        """Backtest an already loaded OHLCV DataFrame (columns timestamp, close, …)."""
+        close = df['close'].to_numpy(dtype=np.float64)
+        timestamps = df['timestamp']
+        sim = self.simulate(close, timestamps, strategy_name, strategy_params)
+
+        metrics = self.metrics_calculator.calculate_all_metrics(
+            sim['trades'],
+            self.initial_capital
+        )
+        results = {
+            'pair': pair,
+            'interval': interval,
+            'strategy': strategy_name,
+            'start_date': timestamps.iloc[0],
+            'end_date': timestamps.iloc[-1],
+            'total_candles': len(df),
+            'trades': sim['trades'],
+            'equity_curve': sim['equity_curve'],
+            'drawdown_curve': sim['drawdown_curve'],
+            'metrics': metrics,
+            'final_capital': sim['final_capital']
+        }
+        logger.info(
+            f"✅ Backtest columnar {strategy_name}: {len(df)} velas, "
+            f"{len(sim['trades'])} trades"
+        )
+        return results
+
+    def simulate(
+        self,
+        close: np.ndarray,
+        timestamps: Sequence[Any],
+        strategy_name: str = "simple_ma_cross",
+        strategy_params: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Columnar simulation core.
+
+        Args:
+            close: Close prices (float64 array)
+            timestamps: Candle timestamps (pandas Series / DatetimeIndex, or a
+                        datetime64 array) — only read at trade events
+            strategy_name: One of VECTORIZED_STRATEGIES
+            strategy_params: Strategy parameters
+
+        Returns:
+            {'trades', 'equity_curve', 'drawdown_curve', 'final_capital'}
+        """
+        params = strategy_params or {}
+        close = np.asarray(close, dtype=np.float64)
+        n = len(close)
+        self._reset_state()
+
+        events = self._strategy_events(close, strategy_name, params)
+
+        # Cash / position size por vela: constantes a trozos entre eventos
+        cash = np.empty(n, dtype=np.float64)
+        size = np.zeros(n, dtype=np.float64)
+        flat_from = 0
+        for entry, exit_ in events:
+            cash[flat_from:entry] = self.capital
+            self._open_position('long', close[entry], _timestamp_at(timestamps, entry))
+            stop = n if exit_ is None else exit_
+            cash[entry:stop] = self.capital
+            size[entry:stop] = self.position['size']
+            flat_from = stop
+            if exit_ is not None:
+                self._close_position(close[exit_], _timestamp_at(timestamps, exit_))
+        cash[flat_from:] = self.capital
+
+        equity = cash + close * size
+        if self.position is not None:
+            self._close_position(close[-1], _timestamp_at(timestamps, n - 1))
+
+        equity_curve = np.concatenate(([self.initial_capital], equity))
+        self.equity_curve = equity_curve.tolist()
+        return {
+            'trades': self.trades,
+            'equity_curve': self.equity_curve,
+            'drawdown_curve': drawdown_series(equity_curve).tolist(),
+            'final_capital': self.capital,
+        }
+
+    def _strategy_events(
+        self,
+        close: np.ndarray,
+        strategy_name: str,
+        params: Dict
+    ) -> List[Tuple[int, Optional[int]]]:
+        """(entry_index, exit_index or None) pairs for a long-only strategy."""
+        n = len(close)
+        if n == 0:
+            return []
+        if strategy_name == "buy_hold":
+            return [(0, None)]
+        if strategy_name != "simple_ma_cross":
+            return []                                  # rsi_divergence: placeholder, sin trades
+
+        bullish, bearish = ma_cross_signals(
+            close,
+            int(params.get('fast_period', 10)),
+            int(params.get('slow_period', 30)),
+        )
+        entries = np.flatnonzero(bullish)
+        exits = np.flatnonzero(bearish)
+
+        events: List[Tuple[int, Optional[int]]] = []
+        start = 0
+        while True:
+            k = np.searchsorted(entries, start)
+            if k >= len(entries):
+                break
+            entry = int(entries[k])
+            price = close[entry]
+            stop_loss = price * 0.97
+            take_profit = price * 1.05
+            b = np.searchsorted(exits, entry + 1)
+            next_bear = int(exits[b]) if b < len(exits) else n
+            exit_ = first_hit(close, entry + 1, next_bear, stop_loss, take_profit)
+            if exit_ >= n:
+                events.append((entry, None))
+                break
+            events.append((entry, exit_))
+            start = exit_ + 1
+        return events
+
+    def run_monte_carlo_simulation(
+        self,
+        trades: List[Dict],
+        num_simulations: int = 1000,
+        future_trades: int = 100
+    ) -> Dict:
+        """
+        Monte Carlo vectorizado: todas las simulaciones avanzan a la vez, un
+        paso por trade futuro.  Consume np.random en el mismo orden que el
+        bucle anidado original, así que con la misma semilla da lo mismo.
+        """
+        if not trades or len(trades) < 10:
+            return {'error': 'Insufficient historical trades'}
+
+        pnls = [t['pnl'] for t in trades]
+        pnl_mean = np.mean(pnls)
+        pnl_std = np.std(pnls)
+
+        draws = np.random.normal(pnl_mean, pnl_std, size=(num_simulations, future_trades))
+        final_capitals = np.full(num_simulations, self.initial_capital, dtype=np.float64)
+        for step in range(future_trades):
+            final_capitals += draws[:, step]
+
+        return {
+            'num_simulations': num_simulations,
+            'future_trades': future_trades,
+            'mean_final_capital': final_capitals.mean(),
+            'median_final_capital': np.median(final_capitals),
+            'percentile_5': np.percentile(final_capitals, 5),
+            'percentile_25': np.percentile(final_capitals, 25),
+            'percentile_50': np.percentile(final_capitals, 50),
+            'percentile_75': np.percentile(final_capitals, 75),
+            'percentile_95': np.percentile(final_capitals, 95),
+            'probability_profit': (final_capitals > self.initial_capital).sum() / num_simulations,
+            'max_simulated': final_capitals.max(),
+            'min_simulated': final_capitals.min()
+        }
+
+
+def _timestamp_at(timestamps: Sequence[Any], i: int):
+    """Timestamp of candle i as a pandas Timestamp (as df.iloc[i]['timestamp'])."""
+    if hasattr(timestamps, 'iloc'):
+        return timestamps.iloc[i]
+    value = timestamps[i]
+    if isinstance(value, (np.datetime64, np.integer)):
+        import pandas as pd
+        return pd.Timestamp(value)
+    return value
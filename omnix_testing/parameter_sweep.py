@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OMNIX - Parallel Parameter Sweep Runner
+Barrido de parámetros en paralelo sobre un dataset OHLCV en memoria compartida
+
+StrategyComparator, GeneticOptimizer y el walk-forward de ProfessionalValidator
+ejecutaban backtests uno tras otro y cada uno volvía a leer las velas.  El
+runner de barrido:
+
+  1. Carga el dataset UNA vez en un bloque multiprocessing.shared_memory
+     (SharedOHLCV) — los workers lo adjuntan sin copiarlo
+  2. Evalúa una rejilla o población de parámetros en un ProcessPoolExecutor,
+     con un VectorizedBacktestingEngine por proceso
+  3. Memoriza resultados por hash de (estrategia, parámetros, huella de datos,
+     rango de datos, configuración del motor) — nada se calcula dos veces
+  4. Devuelve los resultados en streaming según van terminando (as_completed)
+
+Estrategias: nombre de una estrategia columnar (simple_ma_cross, buy_hold, …)
+o una función a nivel de módulo fn(data: SharedOHLCV, start, end, params) -> dict
+con 'metrics' (y opcionalmente 'final_capital', 'trades').
+
+Configuración:
+  OMNIX_SWEEP_WORKERS      procesos del pool        (default os.cpu_count())
+  OMNIX_SWEEP_MP_CONTEXT   fork / spawn / forkserver (default: el de la plataforma)
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+Strategy = Union[str, Callable[..., Dict]]
+DataRange = Tuple[int, int]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Shared-memory OHLCV
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class SharedOHLCVSpec:
+    """Picklable handle that lets a worker attach to a SharedOHLCV block."""
+    name: str
+    length: int
+    columns: Tuple[str, ...]
+    fingerprint: str
+
+
+class SharedOHLCV:
+    """
+    Columnar OHLCV arrays in one shared-memory block.
+
+    Column i lives at offset i * length * 8; 'timestamp' is int64 nanoseconds,
+    every other column float64.  Views handed out are read-only.
+    """
+
+    def __init__(self, spec: SharedOHLCVSpec, shm: shared_memory.SharedMemory, owner: bool):
+        self.spec = spec
+        self._shm = shm
+        self._owner = owner
+        self._arrays: Dict[str, np.ndarray] = {}
+        for i, col in enumerate(spec.columns):
+            dtype = np.int64 if col == "timestamp" else np.float64
+            arr = np.ndarray((spec.length,), dtype=dtype, buffer=shm.buf, offset=i * spec.length * 8)
+            arr.flags.writeable = False
+            self._arrays[col] = arr
+
+    @classmethod
+    def from_dataframe(cls, df, columns: Sequence[str] = OHLCV_COLUMNS) -> "SharedOHLCV":
+        """Copy an OHLCV DataFrame (as returned by KrakenDataDownloader) into shared memory."""
+        cols = tuple(c for c in columns if c in df.columns)
+        if "close" not in cols or "timestamp" not in cols:
+            raise ValueError("OHLCV data needs 'timestamp' and 'close' columns")
+        n = len(df)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, n * len(cols) * 8))
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            for i, col in enumerate(cols):
+                if col == "timestamp":
+                    values = df[col].to_numpy(dtype="datetime64[ns]").view(np.int64)
+                else:
+                    values = df[col].to_numpy(dtype=np.float64)
+                dst = np.ndarray((n,), dtype=values.dtype, buffer=shm.buf, offset=i * n * 8)
+                dst[:] = values
+                digest.update(col.encode())
+                digest.update(dst.tobytes())
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        spec = SharedOHLCVSpec(name=shm.name, length=n, columns=cols, fingerprint=digest.hexdigest())
+        logger.info(f"📦 OHLCV en memoria compartida: {n} velas × {len(cols)} columnas ({shm.size / 1e6:.1f} MB)")
+        return cls(spec, shm, owner=True)
+
+    @classmethod
+    def attach(cls, spec: SharedOHLCVSpec) -> "SharedOHLCV":
+        return cls(spec, shared_memory.SharedMemory(name=spec.name), owner=False)
+
+    def __len__(self) -> int:
+        return self.spec.length
+
+    def column(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Timestamps as a datetime64[ns] view."""
+        return self._arrays["timestamp"].view("datetime64[ns]")
+
+    def to_dataframe(self, start: int = 0, end: Optional[int] = None):
+        """Copy a row range back into a DataFrame (for code that needs one)."""
+        import pandas as pd
+        data = {c: self._arrays[c][start:end] for c in self.spec.columns if c != "timestamp"}
+        return pd.DataFrame({"timestamp": self.timestamps[start:end], **data})
+
+    def close(self) -> None:
+        """Release this process's mapping; the owner also frees the block."""
+        self._arrays = {}
+        try:
+            self._shm.close()
+        except Exception:
+            pass
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._owner = False
+
+    def __enter__(self) -> "SharedOHLCV":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Results and memoization
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class SweepResult:
+    """One evaluated (strategy, params, data range)."""
+    key: str
+    strategy: str
+    params: Dict[str, Any]
+    data_range: DataRange
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    final_capital: Optional[float] = None
+    trades: Optional[List[Dict]] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def score(self, metric: str = "sharpe_ratio") -> float:
+        value = self.metrics.get(metric) if self.ok else None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return float("-inf")
+        return value if value == value else float("-inf")   # NaN → -inf
+
+
+def _strategy_name(strategy: Strategy) -> str:
+    if isinstance(strategy, str):
+        return strategy
+    return f"{strategy.__module__}.{getattr(strategy, '__qualname__', strategy.__name__)}"
+
+
+def sweep_key(strategy: Strategy, params: Dict[str, Any], fingerprint: str,
+              data_range: DataRange, engine_config: Dict[str, Any]) -> str:
+    """Stable memo key for one evaluation."""
+    payload = json.dumps({
+        "s": _strategy_name(strategy),
+        "p": params,
+        "d": fingerprint,
+        "r": list(data_range),
+        "e": engine_config,
+    }, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def parameter_grid(grid: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """{'fast_period': [5, 10], 'slow_period': [20, 30]} → list of 4 param dicts."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(list(grid[k]) for k in keys))]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Worker side
+# ─────────────────────────────────────────────────────────────────────────────
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _worker_init(spec: SharedOHLCVSpec, engine_config: Dict[str, Any]) -> None:
+    """Attach the shared dataset and build one engine per worker process."""
+    logging.getLogger("omnix_testing").setLevel(logging.WARNING)
+    _worker_state.clear()
+    _worker_state["data"] = SharedOHLCV.attach(spec)
+    _worker_state["engine_config"] = engine_config
+    _worker_state["engine"] = None
+
+
+def _engine():
+    engine = _worker_state.get("engine")
+    if engine is None:
+        from omnix_testing.backtesting.vectorized_engine import VectorizedBacktestingEngine
+        engine = VectorizedBacktestingEngine(**_worker_state["engine_config"])
+        _worker_state["engine"] = engine
+    return engine
+
+
+def _evaluate(strategy: Strategy, params: Dict[str, Any], data_range: DataRange,
+              include_trades: bool) -> Dict[str, Any]:
+    data: SharedOHLCV = _worker_state["data"]
+    start, end = data_range
+    if callable(strategy):
+        out = strategy(data, start, end, params) or {}
+        return {
+            "metrics": out.get("metrics", {}),
+            "final_capital": out.get("final_capital"),
+            "trades": out.get("trades") if include_trades else None,
+        }
+
+    engine = _engine()
+    sim = engine.simulate(data.column("close")[start:end], data.timestamps[start:end], strategy, params)
+    metrics = engine.metrics_calculator.calculate_all_metrics(sim["trades"], engine.initial_capital)
+    return {
+        "metrics": metrics,
+        "final_capital": float(sim["final_capital"]),
+        "trades": sim["trades"] if include_trades else None,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Sweep runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ParameterSweep:
+    """
+    Evaluate many parameter sets over one shared OHLCV dataset.
+
+    Usage:
+        with ParameterSweep(df) as sweep:
+            for result in sweep.run("simple_ma_cross", parameter_grid(grid)):
+                ...
+
+    The cache (a plain dict key → SweepResult) can be passed in and shared
+    between sweeps over the same data.
+    """
+
+    def __init__(
+        self,
+        data,
+        initial_capital: float = 10000.0,
+        commission_rate: float = 0.001,
+        slippage: float = 0.0005,
+        max_workers: Optional[int] = None,
+        cache: Optional[Dict[str, SweepResult]] = None,
+        mp_context: Optional[str] = None,
+    ):
+        if isinstance(data, SharedOHLCV):
+            self.data, self._owns_data = data, False
+        else:
+            self.data, self._owns_data = SharedOHLCV.from_dataframe(data), True
+        self.engine_config = {
+            "initial_capital": initial_capital,
+            "commission_rate": commission_rate,
+            "slippage": slippage,
+        }
+        self.max_workers = max(1, int(max_workers or os.environ.get("OMNIX_SWEEP_WORKERS", 0)
+                                      or os.cpu_count() or 1))
+        self._mp_context = mp_context or os.environ.get("OMNIX_SWEEP_MP_CONTEXT") or None
+        self.cache: Dict[str, SweepResult] = cache if cache is not None else {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self.evaluated = 0
+        self.cache_hits = 0
+
+    # ── Pool lifecycle ───────────────────────────────────────────────────────
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                ctx = multiprocessing.get_context(self._mp_context) if self._mp_context else None
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=ctx,
+                    initializer=_worker_init,
+                    initargs=(self.data.spec, self.engine_config),
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Shut the pool down and free the shared block if this sweep created it."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+        if self._owns_data:
+            self.data.close()
+
+    def __enter__(self) -> "ParameterSweep":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── Evaluation ───────────────────────────────────────────────────────────
+
+    def key(self, strategy: Strategy, params: Dict[str, Any], data_range: DataRange) -> str:
+        return sweep_key(strategy, params, self.data.spec.fingerprint, data_range, self.engine_config)
+
+    def run(
+        self,
+        strategy: Strategy,
+        param_sets: Iterable[Dict[str, Any]],
+        data_range: Optional[DataRange] = None,
+        include_trades: bool = False,
+    ) -> Iterator[SweepResult]:
+        """
+        Evaluate every param set on one data range; yield results as they finish
+        (cached results first).  Duplicate param sets are evaluated once.
+        """
+        rng = self._range(data_range)
+        return self.run_jobs(((strategy, params, rng) for params in param_sets), include_trades)
+
+    def run_jobs(
+        self,
+        jobs: Iterable[Tuple[Strategy, Dict[str, Any], DataRange]],
+        include_trades: bool = False,
+    ) -> Iterator[SweepResult]:
+        """Evaluate arbitrary (strategy, params, data_range) jobs; stream results."""
+        pending: Dict[str, Tuple[SweepResult, Strategy]] = {}
+        duplicates: Dict[str, int] = {}
+        for strategy, params, data_range in jobs:
+            rng = self._range(data_range)
+            params = dict(params)
+            key = self.key(strategy, params, rng)
+            hit = self.cache.get(key)
+            if hit is not None and (hit.trades is not None or not include_trades):
+                self.cache_hits += 1
+                yield SweepResult(**{**hit.__dict__, "cached": True})
+                continue
+            if key in pending:
+                duplicates[key] = duplicates.get(key, 0) + 1
+                continue
+            pending[key] = (SweepResult(key=key, strategy=_strategy_name(strategy),
+                                        params=params, data_range=rng), strategy)
+
+        if not pending:
+            return
+
+        if self.max_workers == 1:
+            if _worker_state.get("data") is not self.data or \
+                    _worker_state.get("engine_config") != self.engine_config:
+                _worker_state.clear()
+                _worker_state.update(data=self.data, engine_config=self.engine_config, engine=None)
+            for key, (result, strategy) in pending.items():
+                try:
+                    self._finish(result, _evaluate(strategy, result.params,
+                                                   result.data_range, include_trades))
+                except Exception as e:
+                    self._fail(result, e)
+                yield from self._emit(result, duplicates.get(key, 0))
+            return
+
+        pool = self._executor()
+        futures = {
+            pool.submit(_evaluate, strategy, r.params, r.data_range, include_trades): key
+            for key, (r, strategy) in pending.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            result = pending[key][0]
+            try:
+                self._finish(result, future.result())
+            except Exception as e:
+                self._fail(result, e)
+            yield from self._emit(result, duplicates.get(key, 0))
+
+    def run_all(self, strategy: Strategy, param_sets: Iterable[Dict[str, Any]],
+                data_range: Optional[DataRange] = None,
+                metric: str = "sharpe_ratio") -> List[SweepResult]:
+        """Evaluate everything and return results ranked by metric (best first)."""
+        results = list(self.run(strategy, param_sets, data_range))
+        results.sort(key=lambda r: r.score(metric), reverse=True)
+        return results
+
+    # ── Internal ─────────────────────────────────────────────────────────────
+
+    def _range(self, data_range: Optional[DataRange]) -> DataRange:
+        n = len(self.data)
+        if data_range is None:
+            return (0, n)
+        start, end = data_range
+        start, end = max(0, int(start)), min(n, int(end))
+        if end <= start:
+            raise ValueError(f"empty data range {data_range}")
+        return (start, end)
+
+    def _finish(self, result: SweepResult, out: Dict[str, Any]) -> None:
+        result.metrics = out.get("metrics") or {}
+        result.final_capital = out.get("final_capital")
+        result.trades = out.get("trades")
+        self.evaluated += 1
+        self.cache[result.key] = result
+
+    def _fail(self, result: SweepResult, error: Exception) -> None:
+        result.error = f"{type(error).__name__}: {error}"
+        logger.warning(f"⚠️ Sweep {result.strategy} {result.params} falló: {result.error}")
+
+    @staticmethod
+    def _emit(result: SweepResult, copies: int) -> Iterator[SweepResult]:
+        yield result
+        for _ in range(copies):
+            yield SweepResult(**{**result.__dict__, "cached": True})
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "candles": len(self.data),
+            "evaluated": self.evaluated,
+            "cache_hits": self.cache_hits,
+            "cached_results": len(self.cache),
+        }
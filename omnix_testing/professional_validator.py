@@ -261,7 +261,122 @@ class ProfessionalValidator:
                        f"Overfitting Score={overfitting_score:.2f}")
         
         return results
-    
+
+    def run_walk_forward_sweep(
+        self,
+        strategy_name: str,
+        data,
+        param_grid: Dict[str, List],
+        in_sample_ratio: float = 0.7,
+        num_iterations: int = 5,
+        metric: str = 'sharpe_ratio',
+        initial_balance: float = 10000.0,
+        max_workers: Optional[int] = None
+    ) -> List[WalkForwardResult]:
+        """
+        Walk-Forward con optimización de parámetros en paralelo
+
+        Mismas ventanas que run_walk_forward_analysis.  En cada ventana se
+        elige la mejor configuración de la rejilla in-sample y se valida
+        out-of-sample.  Todas las evaluaciones de todas las ventanas van al
+        mismo pool (ParameterSweep) sobre una única copia compartida de las
+        velas.  Costes: taker_fee como comisión y slippage_bps del CostModel.
+
+        Args:
+            strategy_name: Estrategia columnar (ej: "simple_ma_cross")
+            data: DataFrame OHLCV o SharedOHLCV
+            param_grid: Rejilla de parámetros
+            in_sample_ratio: Proporción in-sample de cada ventana
+            num_iterations: Número de ventanas
+            metric: Métrica para elegir la mejor configuración IS
+            initial_balance: Balance inicial
+            max_workers: Procesos (default: todos los cores)
+
+        Returns:
+            Lista de resultados Walk-Forward (in_sample_metrics incluye best_params)
+        """
+        from omnix_testing.parameter_sweep import ParameterSweep, parameter_grid
+
+        param_sets = parameter_grid(param_grid)
+        logger.info(f"🔄 Walk-Forward Sweep: {num_iterations} ventanas × {len(param_sets)} configuraciones")
+
+        with ParameterSweep(
+            data,
+            initial_capital=initial_balance,
+            commission_rate=self.cost_model.taker_fee,
+            slippage=self.cost_model.slippage_bps / 10000,
+            max_workers=max_workers
+        ) as sweep:
+            total = len(sweep.data)
+            window_size = total // num_iterations
+            windows = []
+            for i in range(num_iterations):
+                start_idx = i * window_size
+                end_idx = min((i + 2) * window_size, total)
+                split_idx = start_idx + int((end_idx - start_idx) * in_sample_ratio)
+                if end_idx - start_idx < 50 or split_idx - start_idx < 30 or end_idx - split_idx < 10:
+                    continue
+                windows.append((i, (start_idx, split_idx), (split_idx, end_idx)))
+
+            # 1. In-sample: toda la rejilla de todas las ventanas en un solo barrido
+            best: Dict[Tuple[int, int], Any] = {}
+            jobs = [(strategy_name, params, is_range) for _, is_range, _ in windows for params in param_sets]
+            for result in sweep.run_jobs(jobs):
+                current = best.get(result.data_range)
+                if current is None or result.score(metric) > current.score(metric):
+                    best[result.data_range] = result
+
+            # 2. Out-of-sample: la mejor configuración de cada ventana
+            oos_jobs = [(strategy_name, best[is_range].params, oos_range)
+                        for _, is_range, oos_range in windows if is_range in best]
+            oos = {r.data_range: r for r in sweep.run_jobs(oos_jobs)}
+            timestamps = sweep.data.timestamps
+
+            def _wf_metrics(result, params):
+                metrics = result.metrics if result is not None else {}
+                return {
+                    'total_return_pct': metrics.get('total_return', 0),
+                    'win_rate': metrics.get('win_rate', 0),
+                    'sharpe_ratio': metrics.get('sharpe_ratio', 0),
+                    'max_drawdown_pct': metrics.get('max_drawdown_pct', 0),
+                    'total_trades': metrics.get('total_trades', 0),
+                    'best_params': params
+                }
+
+            def _period(rng):
+                return (timestamps[rng[0]].astype('datetime64[us]').item(),
+                        timestamps[rng[1] - 1].astype('datetime64[us]').item())
+
+            results = []
+            for i, is_range, oos_range in windows:
+                if is_range not in best:
+                    continue
+                params = best[is_range].params
+                is_metrics = _wf_metrics(best[is_range], params)
+                oos_metrics = _wf_metrics(oos.get(oos_range), params)
+                is_return = is_metrics['total_return_pct']
+                oos_return = oos_metrics['total_return_pct']
+
+                if oos_return != 0:
+                    overfitting_score = is_return / oos_return if oos_return > 0 else abs(is_return)
+                else:
+                    overfitting_score = float('inf') if is_return > 0 else 0
+
+                results.append(WalkForwardResult(
+                    iteration=i + 1,
+                    in_sample_period=_period(is_range),
+                    out_sample_period=_period(oos_range),
+                    in_sample_metrics=is_metrics,
+                    out_sample_metrics=oos_metrics,
+                    overfitting_score=overfitting_score
+                ))
+
+                logger.info(f"   📊 Iteration {i+1}: best={params} IS Return={is_return:.1f}%, "
+                           f"OOS Return={oos_return:.1f}%, "
+                           f"Overfitting Score={overfitting_score:.2f}")
+
+        return results
+
     def run_regime_testing(
         self,
         strategy: Callable,
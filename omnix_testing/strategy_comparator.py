@@ -154,6 +154,65 @@ class StrategyComparator:
             end_date=end_date
         )
     
+    def compare_parameter_sets(
+        self,
+        strategy: str,
+        param_grid: Dict[str, List],
+        data,
+        metric: str = 'sharpe_ratio',
+        initial_capital: float = 10000.0,
+        max_workers: int = None
+    ) -> Dict:
+        """
+        Compara configuraciones de una estrategia en paralelo (ParameterSweep)
+
+        Las velas se cargan una sola vez en memoria compartida y cada
+        combinación de la rejilla se evalúa en un pool de procesos.
+
+        Args:
+            strategy: Estrategia columnar (ej: "simple_ma_cross")
+            param_grid: {'fast_period': [5, 10], 'slow_period': [20, 30]}
+            data: DataFrame OHLCV o SharedOHLCV ya cargado
+            metric: Métrica para ordenar
+            initial_capital: Capital inicial
+            max_workers: Procesos (default: todos los cores)
+
+        Returns:
+            Dictionary con resultados ordenados (mejor primero)
+        """
+        from omnix_testing.parameter_sweep import ParameterSweep, parameter_grid
+
+        param_sets = parameter_grid(param_grid)
+        logger.info(f"🔬 Barrido {strategy}: {len(param_sets)} configuraciones")
+
+        with ParameterSweep(data, initial_capital=initial_capital, max_workers=max_workers) as sweep:
+            ranked = sweep.run_all(strategy, param_sets, metric=metric)
+            stats = sweep.stats()
+
+        rows = []
+        for result in ranked:
+            metrics = result.metrics
+            rows.append({
+                'params': result.params,
+                'total_return': metrics.get('total_return', 0),
+                'win_rate': metrics.get('win_rate', 0),
+                'sharpe_ratio': metrics.get('sharpe_ratio', 0),
+                'max_drawdown': metrics.get('max_drawdown_pct', 0),
+                'profit_factor': metrics.get('profit_factor', 0),
+                'total_trades': metrics.get('total_trades', 0),
+                'final_capital': result.final_capital,
+                'error': result.error
+            })
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'strategy': strategy,
+            'metric': metric,
+            'results': rows,
+            'best': rows[0] if rows else None,
+            'sweep_stats': stats
+        }
+
     def _generate_comparison(self, results: Dict, strategies: List[str]) -> Dict:
         """Generate comparative analysis"""
         comparison = {
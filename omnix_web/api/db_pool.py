@@ -0,0 +1,80 @@
+"""
+OMNIX Web — pooled psycopg2 connections
+
+The web API still speaks psycopg2. This module supplies the psycopg2 driver
+for the shared connection provider
+(omnix_services/database_service/connection_provider.py), so the API server,
+the governance blueprint and the Enterprise endpoints draw from the same
+fork-safe, per-subsystem pools as the psycopg v3 engines instead of opening
+a connection per request.
+
+    conn = get_pg_connection("web")   # same object shape as psycopg2.connect()
+    ...
+    conn.close()                      # returns the connection to the pool
+
+If the provider is unavailable (standalone deployment without
+omnix_services), connections are opened directly as before.
+"""
+
+import logging
+from typing import Any, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+try:
+    from omnix_services.database_service.connection_provider import (
+        PoolDriver,
+        get_connection,
+        resolve_database_url,
+    )
+    _PROVIDER_AVAILABLE = True
+except Exception as _exc:  # pragma: no cover - standalone deployment
+    logger.warning(f"[DBPool] connection provider unavailable — direct psycopg2 connections: {_exc}")
+    PoolDriver = object  # type: ignore
+    _PROVIDER_AVAILABLE = False
+
+
+class Psycopg2Driver(PoolDriver):
+    """psycopg2 — `with conn:` scopes a transaction and does not close."""
+
+    name = "psycopg2"
+    closes_on_exit = False
+
+    def connect(self, conninfo: str, statement_timeout_ms: int) -> Any:
+        return psycopg2.connect(conninfo, **self._options(statement_timeout_ms))
+
+    def is_usable(self, conn: Any) -> bool:
+        return conn.closed == 0 and (
+            conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+        )
+
+    def reset(self, conn: Any) -> None:
+        if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        if conn.autocommit:
+            conn.autocommit = False
+        conn.cursor_factory = None
+
+
+PSYCOPG2 = Psycopg2Driver() if _PROVIDER_AVAILABLE else None
+
+
+def get_pg_connection(subsystem: str = "web", database_url: Optional[str] = None, **kwargs: Any) -> Any:
+    """
+    Borrow a psycopg2 connection for `subsystem` (None when no URL is set).
+
+    Extra kwargs (e.g. connect_timeout) only apply to direct connections;
+    pooled connections use the provider's connect/statement timeouts.
+    """
+    if not _PROVIDER_AVAILABLE:
+        import os
+        database_url = database_url or (
+            os.environ.get("DATABASE_URL") or
+            os.environ.get("OMNIX_DB_URL") or
+            os.environ.get("POSTGRES_URL")
+        )
+        return psycopg2.connect(database_url, **kwargs) if database_url else None
+    return get_connection(subsystem, database_url or resolve_database_url(), driver=PSYCOPG2)
@@ -0,0 +1,609 @@
+"""
+OMNIX Web — incremental decision-analytics rollups
+
+The public dashboards (/api/analytics/decisions, /api/live-metrics,
+/api/metrics/live) and the per-client receipt listing used to COUNT(*) and
+GROUP BY over decision_receipts on every request. This module keeps compact
+counter tables instead, maintained by a tailing job:
+
+    decision_rollup_minute       (bucket, domain, decision, client_id) → receipts
+                                 recent window only (OMNIX_ROLLUP_MINUTE_RETENTION_DAYS)
+    decision_rollup_day          (day, domain, decision, client_id)    → receipts
+    decision_rollup_totals       (domain, decision, client_id)         → receipts,
+                                 first/last created_at, last receipt_id
+    decision_rollup_checkpoints  (checkpoint)                          → block_count
+    decision_rollup_state        tail watermark + version (drives ETags)
+
+Tailing: DecisionRollupTailer.run_once() locks the state row, reads receipts
+past the (created_at, receipt_id) watermark in keyset order, folds them into
+the counters and advances the watermark — all in one transaction, so each
+receipt is counted exactly once even with several gunicorn workers running
+the loop. Receipts younger than OMNIX_ROLLUP_LAG_S are left for the next
+cycle so rows from transactions still in flight are never skipped.
+
+Counters are insert-driven: a receipt archived HOT → WARM → COLD keeps being
+counted. backfill() rebuilds everything from HOT plus the PostgreSQL WARM /
+COLD tables (receipts held only in S3 COLD storage are not replayed):
+
+    python scripts/backfill_decision_rollups.py
+
+Readers never touch decision_receipts except read_client_total(), which adds
+the not-yet-tailed delta so the per-client count stays exact.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("OMNIX.Web.DecisionRollups")
+
+_ROLLUP_INTERVAL_S: float = float(os.environ.get("OMNIX_ROLLUP_INTERVAL_S", "15"))
+_ROLLUP_LAG_S: float = float(os.environ.get("OMNIX_ROLLUP_LAG_S", "5"))
+_ROLLUP_BATCH_SIZE: int = int(os.environ.get("OMNIX_ROLLUP_BATCH_SIZE", "5000"))
+_MINUTE_RETENTION_DAYS: int = int(os.environ.get("OMNIX_ROLLUP_MINUTE_RETENTION_DAYS", "7"))
+
+_STATE_NAME = "decision_receipts"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+HOT_TABLE = "decision_receipts"
+ARCHIVE_TABLES = ("decision_receipts_warm", "decision_receipts_cold")
+
+APPROVED_DECISIONS = ("APPROVED", "APPROVE", "PASS")
+BLOCKED_DECISIONS = ("BLOCKED", "BLOCK")
+BLOCKED_OR_HOLD_DECISIONS = ("BLOCKED", "BLOCK", "HOLD", "REJECT")
+
+_CP_RE = re.compile(r"CP-(\d+)")
+
+_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS decision_rollup_minute (
+        bucket     TIMESTAMPTZ  NOT NULL,
+        domain     VARCHAR(50)  NOT NULL,
+        decision   VARCHAR(20)  NOT NULL,
+        client_id  VARCHAR(100) NOT NULL,
+        receipts   BIGINT       NOT NULL DEFAULT 0,
+        PRIMARY KEY (bucket, domain, decision, client_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS decision_rollup_day (
+        day        DATE         NOT NULL,
+        domain     VARCHAR(50)  NOT NULL,
+        decision   VARCHAR(20)  NOT NULL,
+        client_id  VARCHAR(100) NOT NULL,
+        receipts   BIGINT       NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, domain, decision, client_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS decision_rollup_totals (
+        domain           VARCHAR(50)  NOT NULL,
+        decision         VARCHAR(20)  NOT NULL,
+        client_id        VARCHAR(100) NOT NULL,
+        receipts         BIGINT       NOT NULL DEFAULT 0,
+        first_created_at TIMESTAMPTZ,
+        last_created_at  TIMESTAMPTZ,
+        last_receipt_id  VARCHAR(64),
+        PRIMARY KEY (domain, decision, client_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS decision_rollup_checkpoints (
+        checkpoint   VARCHAR(16) PRIMARY KEY,
+        block_count  BIGINT      NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS decision_rollup_state (
+        name             VARCHAR(32) PRIMARY KEY,
+        last_created_at  TIMESTAMPTZ NOT NULL,
+        last_receipt_id  VARCHAR(64) NOT NULL DEFAULT '',
+        version          BIGINT      NOT NULL DEFAULT 0,
+        updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_rollup_minute_client ON decision_rollup_minute(client_id, bucket)",
+    "CREATE INDEX IF NOT EXISTS idx_rollup_totals_client ON decision_rollup_totals(client_id)",
+)
+
+# Columns read from receipt tables, in RollupAccumulator.add() order
+_SOURCE_COLUMNS = "created_at, receipt_id, domain, decision, client_id, veto_chain"
+
+
+def blocking_checkpoints(veto_chain: Any) -> List[str]:
+    """CP-n identifiers of the veto_chain entries that blocked or vetoed."""
+    try:
+        entries = json.loads(veto_chain) if isinstance(veto_chain, str) else (veto_chain or [])
+    except (TypeError, ValueError):
+        return []
+    found = []
+    for entry in entries:
+        txt = str(entry)
+        upper = txt.upper()
+        if "BLOCKED" in upper or "VETO" in upper:
+            m = _CP_RE.search(txt)
+            if m:
+                found.append(f"CP-{m.group(1)}")
+    return found
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+class RollupAccumulator:
+    """In-memory deltas for one tail batch; flushed with one upsert per table."""
+
+    def __init__(self, minute_since: Optional[datetime] = None):
+        self._minute_since = minute_since
+        self.minute: Dict[tuple, int] = {}
+        self.day: Dict[tuple, int] = {}
+        self.totals: Dict[tuple, list] = {}
+        self.checkpoints: Dict[str, int] = {}
+        self.rows = 0
+        self.last_key: Optional[Tuple[datetime, str]] = None
+
+    def add(self, created_at, receipt_id, domain, decision, client_id, veto_chain) -> None:
+        ts = _as_utc(created_at)
+        dims = (domain or "", decision or "", client_id or "")
+        if self._minute_since is None or ts >= self._minute_since:
+            minute_key = (ts.replace(second=0, microsecond=0),) + dims
+            self.minute[minute_key] = self.minute.get(minute_key, 0) + 1
+        day_key = (ts.date(),) + dims
+        self.day[day_key] = self.day.get(day_key, 0) + 1
+
+        agg = self.totals.get(dims)
+        if agg is None:
+            self.totals[dims] = [1, ts, ts, receipt_id]
+        else:
+            agg[0] += 1
+            if ts < agg[1]:
+                agg[1] = ts
+            if ts >= agg[2]:
+                agg[2], agg[3] = ts, receipt_id
+
+        if (decision or "").upper() in BLOCKED_DECISIONS:
+            for cp in blocking_checkpoints(veto_chain):
+                self.checkpoints[cp] = self.checkpoints.get(cp, 0) + 1
+
+        self.rows += 1
+        self.last_key = (created_at, receipt_id)
+
+    def flush(self, cur) -> None:
+        """Upsert the accumulated deltas (caller owns the transaction)."""
+        if self.minute:
+            _upsert_counts(cur, "decision_rollup_minute", "bucket", self.minute)
+        if self.day:
+            _upsert_counts(cur, "decision_rollup_day", "day", self.day)
+        if self.totals:
+            rows = [dims + tuple(agg) for dims, agg in self.totals.items()]
+            cur.execute(
+                f"""
+                INSERT INTO decision_rollup_totals
+                    (domain, decision, client_id, receipts,
+                     first_created_at, last_created_at, last_receipt_id)
+                VALUES {", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(rows))}
+                ON CONFLICT (domain, decision, client_id) DO UPDATE SET
+                    receipts         = decision_rollup_totals.receipts + EXCLUDED.receipts,
+                    first_created_at = LEAST(decision_rollup_totals.first_created_at, EXCLUDED.first_created_at),
+                    last_receipt_id  = CASE
+                        WHEN decision_rollup_totals.last_created_at IS NULL
+                          OR EXCLUDED.last_created_at >= decision_rollup_totals.last_created_at
+                        THEN EXCLUDED.last_receipt_id
+                        ELSE decision_rollup_totals.last_receipt_id END,
+                    last_created_at  = GREATEST(decision_rollup_totals.last_created_at, EXCLUDED.last_created_at)
+                """,
+                [v for row in rows for v in row],
+            )
+        if self.checkpoints:
+            rows = list(self.checkpoints.items())
+            cur.execute(
+                f"""
+                INSERT INTO decision_rollup_checkpoints (checkpoint, block_count)
+                VALUES {", ".join(["(%s, %s)"] * len(rows))}
+                ON CONFLICT (checkpoint) DO UPDATE SET
+                    block_count = decision_rollup_checkpoints.block_count + EXCLUDED.block_count
+                """,
+                [v for row in rows for v in row],
+            )
+
+
+def _upsert_counts(cur, table: str, time_col: str, counts: Dict[tuple, int]) -> None:
+    rows = [key + (n,) for key, n in counts.items()]
+    cur.execute(
+        f"""
+        INSERT INTO {table} ({time_col}, domain, decision, client_id, receipts)
+        VALUES {", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))}
+        ON CONFLICT ({time_col}, domain, decision, client_id) DO UPDATE SET
+            receipts = {table}.receipts + EXCLUDED.receipts
+        """,
+        [v for row in rows for v in row],
+    )
+
+
+class DecisionRollupTailer:
+    """
+    Folds new decision_receipts rows into the rollup tables.
+
+    conn_factory returns a DB-API connection (psycopg2 or psycopg v3);
+    close() is expected to hand it back to the pool.
+    """
+
+    def __init__(
+        self,
+        conn_factory: Callable[[], Any],
+        batch_size: int = _ROLLUP_BATCH_SIZE,
+        lag_s: float = _ROLLUP_LAG_S,
+        minute_retention_days: int = _MINUTE_RETENTION_DAYS,
+    ):
+        self._conn_factory = conn_factory
+        self._batch_size = max(1, int(batch_size))
+        self._lag_s = max(0.0, float(lag_s))
+        self._minute_retention_days = max(1, int(minute_retention_days))
+        self._schema_ready = False
+
+    def _minute_cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=self._minute_retention_days)
+
+    def ensure_schema(self, conn) -> None:
+        if self._schema_ready:
+            return
+        cur = conn.cursor()
+        for stmt in _SCHEMA_SQL:
+            cur.execute(stmt)
+        cur.execute(
+            """
+            INSERT INTO decision_rollup_state (name, last_created_at, last_receipt_id, version)
+            VALUES (%s, %s, '', 0)
+            ON CONFLICT (name) DO NOTHING
+            """,
+            (_STATE_NAME, _EPOCH),
+        )
+        conn.commit()
+        cur.close()
+        self._schema_ready = True
+
+    def run_once(self) -> int:
+        """Tail one batch. Returns the number of receipts folded in."""
+        conn = self._conn_factory()
+        if conn is None:
+            return 0
+        try:
+            self.ensure_schema(conn)
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT last_created_at, last_receipt_id FROM decision_rollup_state "
+                "WHERE name = %s FOR UPDATE",
+                (_STATE_NAME,),
+            )
+            last_created_at, last_receipt_id = cur.fetchone()
+            cur.execute(
+                f"""
+                SELECT {_SOURCE_COLUMNS} FROM {HOT_TABLE}
+                WHERE (created_at, receipt_id) > (%s, %s)
+                  AND created_at < NOW() - %s * INTERVAL '1 second'
+                ORDER BY created_at, receipt_id
+                LIMIT %s
+                """,
+                (last_created_at, last_receipt_id, self._lag_s, self._batch_size),
+            )
+            acc = RollupAccumulator(minute_since=self._minute_cutoff())
+            for row in cur.fetchall():
+                acc.add(*row)
+            if acc.rows:
+                acc.flush(cur)
+                cur.execute(
+                    """
+                    UPDATE decision_rollup_state
+                    SET last_created_at = %s, last_receipt_id = %s,
+                        version = version + 1, updated_at = NOW()
+                    WHERE name = %s
+                    """,
+                    (acc.last_key[0], acc.last_key[1], _STATE_NAME),
+                )
+                cur.execute(
+                    "DELETE FROM decision_rollup_minute "
+                    "WHERE bucket < NOW() - %s * INTERVAL '1 day'",
+                    (self._minute_retention_days,),
+                )
+            conn.commit()
+            cur.close()
+            return acc.rows
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def catch_up(self, max_batches: int = 1000) -> int:
+        """Tail until the watermark reaches the lag horizon (or max_batches)."""
+        total = 0
+        for _ in range(max_batches):
+            n = self.run_once()
+            total += n
+            if n < self._batch_size:
+                break
+        return total
+
+    def backfill(self) -> Dict[str, Any]:
+        """
+        Rebuild every rollup table from history in one transaction.
+
+        HOT, WARM and COLD (PostgreSQL) receipts are read under one
+        REPEATABLE READ snapshot, so receipts moved between tiers while the
+        backfill runs are counted once. The watermark is left at the last HOT
+        receipt below the lag horizon; the tailer continues from there.
+        """
+        conn = self._conn_factory()
+        if conn is None:
+            raise RuntimeError("no database connection")
+        t0 = time.perf_counter()
+        try:
+            self.ensure_schema(conn)
+            cur = conn.cursor()
+            cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cur.execute(
+                "SELECT 1 FROM decision_rollup_state WHERE name = %s FOR UPDATE",
+                (_STATE_NAME,),
+            )
+            for table in ("decision_rollup_minute", "decision_rollup_day",
+                          "decision_rollup_totals", "decision_rollup_checkpoints"):
+                cur.execute(f"DELETE FROM {table}")
+
+            per_table: Dict[str, int] = {}
+            last_key: Tuple[datetime, str] = (_EPOCH, "")
+            for table in (HOT_TABLE,) + ARCHIVE_TABLES:
+                cur.execute("SELECT to_regclass(%s)", (table,))
+                if cur.fetchone()[0] is None:
+                    continue
+                where, params = "WHERE created_at IS NOT NULL", ()
+                if table == HOT_TABLE:
+                    where += " AND created_at < NOW() - %s * INTERVAL '1 second'"
+                    params = (self._lag_s,)
+                # Server-side cursor: stream history instead of loading it all
+                src = conn.cursor(name=f"rollup_backfill_{table}")
+                src.execute(
+                    f"SELECT {_SOURCE_COLUMNS} FROM {table} {where} "
+                    f"ORDER BY created_at, receipt_id",
+                    params,
+                )
+                count = 0
+                while True:
+                    rows = src.fetchmany(self._batch_size)
+                    if not rows:
+                        break
+                    acc = RollupAccumulator(minute_since=self._minute_cutoff())
+                    for row in rows:
+                        acc.add(*row)
+                    acc.flush(cur)
+                    count += acc.rows
+                    if table == HOT_TABLE:
+                        last_key = acc.last_key
+                src.close()
+                per_table[table] = count
+
+            cur.execute(
+                """
+                UPDATE decision_rollup_state
+                SET last_created_at = %s, last_receipt_id = %s,
+                    version = version + 1, updated_at = NOW()
+                WHERE name = %s
+                """,
+                (last_key[0], last_key[1], _STATE_NAME),
+            )
+            cur.execute(
+                "DELETE FROM decision_rollup_minute WHERE bucket < NOW() - %s * INTERVAL '1 day'",
+                (self._minute_retention_days,),
+            )
+            conn.commit()
+            cur.close()
+            return {
+                "receipts": sum(per_table.values()),
+                "by_table": per_table,
+                "watermark": [str(last_key[0]), last_key[1]],
+                "seconds": round(time.perf_counter() - t0, 2),
+            }
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+# ── Readers ───────────────────────────────────────────────────────────────────
+
+def read_version(cur) -> Optional[int]:
+    """Current rollup version, or None when the rollups have never been built."""
+    try:
+        cur.execute("SELECT version FROM decision_rollup_state WHERE name = %s", (_STATE_NAME,))
+        row = cur.fetchone()
+    except Exception:
+        return None
+    return int(row[0]) if row else None
+
+
+def rollup_etag(version: Optional[int], scope: str) -> Optional[str]:
+    """
+    Weak ETag for a response derived only from the rollups. The UTC date is
+    part of the tag because "today" / 30-day windows move without new receipts.
+    """
+    if version is None:
+        return None
+    day = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return f'W/"rollup-{scope}-{version}-{day}"'
+
+
+def payload_etag(payload: Dict[str, Any], exclude: Iterable[str] = ("last_updated", "generated_at")) -> str:
+    """Weak ETag over a response body, ignoring its generation timestamps."""
+    skip = set(exclude)
+    body = json.dumps({k: v for k, v in payload.items() if k not in skip}, sort_keys=True, default=str)
+    return f'W/"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def read_decision_counts(cur, domain: Optional[str] = None) -> Dict[str, int]:
+    """All-time receipts per raw decision value (optionally for one domain)."""
+    if domain is None:
+        cur.execute("SELECT decision, SUM(receipts) FROM decision_rollup_totals GROUP BY decision")
+    else:
+        cur.execute(
+            "SELECT decision, SUM(receipts) FROM decision_rollup_totals WHERE domain = %s GROUP BY decision",
+            (domain,),
+        )
+    return {row[0]: int(row[1] or 0) for row in cur.fetchall()}
+
+
+def read_domain_counts(cur, limit: int = 10) -> Dict[str, int]:
+    cur.execute(
+        """
+        SELECT domain, SUM(receipts) FROM decision_rollup_totals
+        WHERE domain <> ''
+        GROUP BY domain ORDER BY SUM(receipts) DESC LIMIT %s
+        """,
+        (limit,),
+    )
+    return {row[0]: int(row[1] or 0) for row in cur.fetchall()}
+
+
+def read_today_count(cur, domain: Optional[str] = None) -> int:
+    sql = "SELECT COALESCE(SUM(receipts), 0) FROM decision_rollup_minute WHERE bucket >= CURRENT_DATE"
+    params: tuple = ()
+    if domain is not None:
+        sql += " AND domain = %s"
+        params = (domain,)
+    cur.execute(sql, params)
+    return int(cur.fetchone()[0] or 0)
+
+
+def read_first_created_at(cur) -> Optional[datetime]:
+    cur.execute("SELECT MIN(first_created_at) FROM decision_rollup_totals")
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def read_last_receipt_id(cur, domain: str) -> Optional[str]:
+    cur.execute(
+        """
+        SELECT last_receipt_id FROM decision_rollup_totals
+        WHERE domain = %s ORDER BY last_created_at DESC NULLS LAST LIMIT 1
+        """,
+        (domain,),
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def read_top_blocking_checkpoints(cur, limit: int = 5) -> List[Tuple[str, int]]:
+    cur.execute(
+        "SELECT checkpoint, block_count FROM decision_rollup_checkpoints "
+        "ORDER BY block_count DESC, checkpoint LIMIT %s",
+        (limit,),
+    )
+    return [(row[0], int(row[1])) for row in cur.fetchall()]
+
+
+def read_daily_trend(cur, days: int = 30) -> List[Tuple[Any, str, int]]:
+    """(day, UPPER(decision), receipts) for the last `days` days."""
+    cur.execute(
+        """
+        SELECT day, UPPER(decision), SUM(receipts) FROM decision_rollup_day
+        WHERE day >= CURRENT_DATE - %s
+        GROUP BY 1, 2 ORDER BY 1
+        """,
+        (days,),
+    )
+    return [(row[0], row[1], int(row[2] or 0)) for row in cur.fetchall()]
+
+
+def read_active_client_count(cur) -> int:
+    cur.execute(
+        """
+        SELECT COUNT(DISTINCT client_id) FROM decision_rollup_totals
+        WHERE client_id <> '' AND client_id <> 'PUBLIC'
+        """
+    )
+    return int(cur.fetchone()[0] or 0)
+
+
+def read_client_total(cur, client_id: str, decision: Optional[str] = None) -> int:
+    """
+    Exact receipt count for one client: rolled-up total plus the receipts
+    past the tail watermark (an index range on created_at).
+    """
+    params: list = [client_id]
+    decision_sql = ""
+    if decision:
+        decision_sql = " AND decision = %s"
+        params.append(decision)
+    cur.execute(
+        f"SELECT COALESCE(SUM(receipts), 0) FROM decision_rollup_totals "
+        f"WHERE client_id = %s{decision_sql}",
+        params,
+    )
+    rolled = int(cur.fetchone()[0] or 0)
+    cur.execute(
+        f"""
+        SELECT COUNT(*) FROM {HOT_TABLE}, decision_rollup_state s
+        WHERE s.name = %s
+          AND ({HOT_TABLE}.created_at, {HOT_TABLE}.receipt_id) > (s.last_created_at, s.last_receipt_id)
+          AND {HOT_TABLE}.client_id = %s{decision_sql}
+        """,
+        [_STATE_NAME] + params,
+    )
+    return rolled + int(cur.fetchone()[0] or 0)
+
+
+# ── Background loop ───────────────────────────────────────────────────────────
+
+_loop_lock = threading.Lock()
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid: Optional[int] = None
+
+
+def start_rollup_loop(
+    conn_factory: Callable[[], Any],
+    interval_s: float = _ROLLUP_INTERVAL_S,
+) -> Optional[threading.Thread]:
+    """
+    Start the tailing loop once per process (restarted after fork).
+    Disabled with OMNIX_ROLLUPS_ENABLED=false.
+    """
+    global _loop_thread, _loop_pid
+    if os.environ.get("OMNIX_ROLLUPS_ENABLED", "true").strip().lower() == "false":
+        return None
+    with _loop_lock:
+        if _loop_thread is not None and _loop_thread.is_alive() and _loop_pid == os.getpid():
+            return _loop_thread
+        tailer = DecisionRollupTailer(conn_factory)
+
+        def _loop():
+            while True:
+                try:
+                    n = tailer.catch_up()
+                    if n:
+                        logger.debug(f"[Rollups] folded {n} receipts")
+                except Exception as exc:
+                    logger.warning(f"[Rollups] tail cycle failed: {type(exc).__name__}: {exc}")
+                time.sleep(interval_s)
+
+        _loop_thread = threading.Thread(target=_loop, name="DecisionRollups", daemon=True)
+        _loop_pid = os.getpid()
+        _loop_thread.start()
+        return _loop_thread
@@ -14,6 +14,17 @@ Auth flow:
   X-API-Key header → SHA-256 hash → lookup in b2b_clients → return client row
   client_id comes from DB, NOT from X-Client-ID header → no spoofing possible
 
+Auth cache (per process):
+  hash_api_key(key) → client row (TTL + LRU), unknown/inactive keys cached as
+  negative entries so repeated bad keys never reach the DB. Legacy mode
+  (empty b2b_clients) is a cached flag instead of a COUNT(*) per request.
+  rotate/deactivate/reactivate/create invalidate the affected entries in this
+  process; other workers converge within the TTL.
+    OMNIX_AUTH_CACHE_TTL_S            positive entries (default 30, 0 = cache off)
+    OMNIX_AUTH_CACHE_NEGATIVE_TTL_S   unknown keys (default 10)
+    OMNIX_AUTH_CACHE_MAX              LRU capacity (default 10000)
+    OMNIX_AUTH_LEGACY_CHECK_TTL_S     legacy-mode flag refresh (default 300)
+
 ADR-052: API Key Expiry (90-day rolling window)
 ADR-053: Generic Webhook Push System
 """
@@ -23,15 +34,27 @@ import logging
 import os
 import secrets
 import string
+import threading
+import time
+from collections import OrderedDict
 
 import psycopg2
 import psycopg2.extras
 
+try:
+    from api.db_pool import get_pg_connection
+except ImportError:
+    try:
+        from .db_pool import get_pg_connection
+    except ImportError:
+        def get_pg_connection(subsystem, database_url=None, **kwargs):
+            return psycopg2.connect(database_url, **kwargs)
+
 logger = logging.getLogger(__name__)
 
 
 def _get_conn():
-    return psycopg2.connect(os.environ["DATABASE_URL"])
+    return get_pg_connection("web", os.environ["DATABASE_URL"])
 
 
 def hash_api_key(key: str) -> str:
@@ -65,27 +88,187 @@ def _ensure_key_expiry_column() -> None:
 _KEY_EXPIRY_DAYS = 90
 
 
+# ── AUTH CACHE ────────────────────────────────────────────────────────────────
+
+class _AuthCache:
+    """
+    TTL + LRU map of api_key_hash → client row (None = negative entry).
+    Thread-safe. A client_id index lets admin operations invalidate every
+    cached key of a client without knowing the plaintext key.
+    """
+
+    def __init__(self, ttl_s: float, negative_ttl_s: float, max_entries: int):
+        self.ttl_s = ttl_s
+        self.negative_ttl_s = negative_ttl_s
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, dict | None]]" = OrderedDict()
+        self._by_client: dict[str, set[str]] = {}
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0 and self.max_entries > 0
+
+    def get(self, key_hash: str) -> tuple[bool, dict | None]:
+        """Return (found, client). client is None for a cached negative entry."""
+        with self._lock:
+            item = self._entries.get(key_hash)
+            if item is None:
+                self.misses += 1
+                return False, None
+            expires_at, client = item
+            if expires_at <= time.monotonic():
+                self._drop_locked(key_hash)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key_hash)
+            if client is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return True, client
+
+    def put(self, key_hash: str, client: dict | None) -> None:
+        ttl = self.ttl_s if client is not None else self.negative_ttl_s
+        if not self.enabled or ttl <= 0:
+            return
+        with self._lock:
+            self._drop_locked(key_hash)
+            self._entries[key_hash] = (time.monotonic() + ttl, client)
+            if client is not None:
+                self._by_client.setdefault(client["client_id"], set()).add(key_hash)
+            while len(self._entries) > self.max_entries:
+                self._drop_locked(next(iter(self._entries)))
+
+    def invalidate_client(self, client_id: str) -> int:
+        with self._lock:
+            hashes = list(self._by_client.get(client_id, ()))
+            for key_hash in hashes:
+                self._drop_locked(key_hash)
+            return len(hashes)
+
+    def invalidate_hash(self, key_hash: str) -> None:
+        with self._lock:
+            self._drop_locked(key_hash)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_client.clear()
+
+    def _drop_locked(self, key_hash: str) -> None:
+        item = self._entries.pop(key_hash, None)
+        if item is not None and item[1] is not None:
+            client_id = item[1]["client_id"]
+            hashes = self._by_client.get(client_id)
+            if hashes is not None:
+                hashes.discard(key_hash)
+                if not hashes:
+                    del self._by_client[client_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "ttl_s": self.ttl_s,
+                "negative_ttl_s": self.negative_ttl_s,
+                "max_entries": self.max_entries,
+            }
+
+
+_auth_cache = _AuthCache(
+    ttl_s=float(os.environ.get("OMNIX_AUTH_CACHE_TTL_S", "30")),
+    negative_ttl_s=float(os.environ.get("OMNIX_AUTH_CACHE_NEGATIVE_TTL_S", "10")),
+    max_entries=int(os.environ.get("OMNIX_AUTH_CACHE_MAX", "10000")),
+)
+
+_LEGACY_CHECK_TTL_S = float(os.environ.get("OMNIX_AUTH_LEGACY_CHECK_TTL_S", "300"))
+_legacy_mode: tuple[float, bool] | None = None   # (checked_at monotonic, table_is_empty)
+_legacy_lock = threading.Lock()
+
+
+def _is_legacy_mode(refresh: bool = False) -> bool:
+    """Cached "b2b_clients is empty" flag — replaces a COUNT(*) per request."""
+    global _legacy_mode
+    cached = _legacy_mode
+    if not refresh and cached is not None and time.monotonic() - cached[0] < _LEGACY_CHECK_TTL_S:
+        return cached[1]
+    with _legacy_lock:
+        conn = _get_conn()
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT EXISTS (SELECT 1 FROM b2b_clients)")
+            empty = not cur.fetchone()[0]
+        finally:
+            cur.close()
+            conn.close()
+        _legacy_mode = (time.monotonic(), empty)
+    return empty
+
+
+def invalidate_client_auth(client_id: str, key_hash: str | None = None) -> None:
+    """Drop cached auth entries for a client (and optionally one key hash)."""
+    dropped = _auth_cache.invalidate_client(client_id)
+    if key_hash:
+        _auth_cache.invalidate_hash(key_hash)
+    logger.debug(f"RBAC: auth cache invalidated client_id={client_id} entries={dropped}")
+
+
+def clear_auth_cache() -> None:
+    """Drop every cached auth entry and the legacy-mode flag."""
+    global _legacy_mode
+    _auth_cache.clear()
+    _legacy_mode = None
+
+
+def get_auth_cache_stats() -> dict:
+    return _auth_cache.stats()
+
+
+def _key_expired(client: dict) -> bool:
+    if client.get("key_expires_at") is None:
+        return False
+    import datetime as _dt
+    exp = client["key_expires_at"]
+    if hasattr(exp, 'tzinfo') and exp.tzinfo is None:
+        exp = exp.replace(tzinfo=_dt.timezone.utc)
+    return exp < _dt.datetime.now(_dt.timezone.utc)
+
+
 def authenticate_client(api_key: str) -> dict | None:
     """
     Authenticate an API key against b2b_clients table.
     Returns the client row as dict if active and not expired, None otherwise.
     Falls back to B2B_API_KEY env var if b2b_clients table is empty (dev mode).
+    Results are cached per key hash (see module docstring).
     """
     if not api_key:
         return None
 
-    try:
-        conn = _get_conn()
-        cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-        cur.execute("SELECT COUNT(*) as cnt FROM b2b_clients")
-        count = cur.fetchone()["cnt"]
+    key_hash = hash_api_key(api_key)
+    found, cached = _auth_cache.get(key_hash)
+    if found:
+        if cached is None:
+            return None
+        if _key_expired(cached):
+            logger.warning(f"RBAC: expired key used by client_id={cached['client_id']}")
+            return None
+        return dict(cached)
 
-        if count == 0:
-            env_key = os.environ.get("B2B_API_KEY", "")
-            if env_key and secrets.compare_digest(api_key, env_key):
-                cur.close()
-                conn.close()
+    try:
+        env_key = os.environ.get("B2B_API_KEY", "")
+        env_match = bool(env_key) and secrets.compare_digest(api_key, env_key)
+        # A non-env key in legacy mode re-checks the table: clients may have
+        # been created by another worker since the flag was cached.
+        if _is_legacy_mode() and (env_match or _is_legacy_mode(refresh=True)):
+            if env_match:
                 return {
                     "client_id": "legacy-env-client",
                     "name": "Legacy ENV Client",
@@ -94,11 +277,10 @@ def authenticate_client(api_key: str) -> dict | None:
                     "email": None,
                     "key_expires_at": None,
                 }
-            cur.close()
-            conn.close()
             return None
 
-        key_hash = hash_api_key(api_key)
+        conn = _get_conn()
+        cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
         cur.execute(
             """
             SELECT client_id, name, email, role, is_active, created_at, last_seen_at, key_expires_at
@@ -112,20 +294,17 @@ def authenticate_client(api_key: str) -> dict | None:
         conn.close()
 
         if row is None:
+            _auth_cache.put(key_hash, None)
             return None
 
         client = dict(row)
+        _auth_cache.put(key_hash, client)
 
-        if client.get("key_expires_at") is not None:
-            import datetime as _dt
-            exp = client["key_expires_at"]
-            if hasattr(exp, 'tzinfo') and exp.tzinfo is None:
-                exp = exp.replace(tzinfo=_dt.timezone.utc)
-            if exp < _dt.datetime.now(_dt.timezone.utc):
-                logger.warning(f"RBAC: expired key used by client_id={client['client_id']}")
-                return None
+        if _key_expired(client):
+            logger.warning(f"RBAC: expired key used by client_id={client['client_id']}")
+            return None
 
-        return client
+        return dict(client)
 
     except Exception as e:
         logger.error(f"RBAC authenticate_client error: {e}")
@@ -174,6 +353,7 @@ def create_client(
         )
         conn.commit()
         logger.info(f"RBAC: created client client_id={client_id} role={role} expires_in=90d")
+        clear_auth_cache()  # table may have left legacy mode; new key may be negatively cached
         return api_key
     except psycopg2.errors.UniqueViolation:
         conn.rollback()
@@ -197,6 +377,7 @@ def deactivate_client(client_id: str) -> bool:
         )
         affected = cur.rowcount
         conn.commit()
+        invalidate_client_auth(client_id)
         if affected > 0:
             logger.info(f"RBAC: deactivated client client_id={client_id}")
             return True
@@ -212,11 +393,14 @@ def reactivate_client(client_id: str) -> bool:
     cur = conn.cursor()
     try:
         cur.execute(
-            "UPDATE b2b_clients SET is_active = TRUE WHERE client_id = %s",
+            "UPDATE b2b_clients SET is_active = TRUE WHERE client_id = %s RETURNING api_key_hash",
             (client_id,),
         )
+        row = cur.fetchone()
         affected = cur.rowcount
         conn.commit()
+        # The key was negatively cached while inactive — drop that entry too
+        invalidate_client_auth(client_id, row[0] if row else None)
         return affected > 0
     finally:
         cur.close()
@@ -248,6 +432,7 @@ def rotate_api_key(client_id: str) -> str:
         if cur.rowcount == 0:
             raise ValueError(f"client_id '{client_id}' not found")
         conn.commit()
+        invalidate_client_auth(client_id, key_hash)
         logger.info(f"RBAC: rotated API key for client_id={client_id} — new expiry in 90d")
         return new_key
     finally:
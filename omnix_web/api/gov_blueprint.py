@@ -88,6 +88,22 @@ except ImportError:
     def set_client_webhook(client_id, url, secret): return False
     def delete_client_webhook(client_id): return False
 
+try:
+    from api.db_pool import get_pg_connection
+except ImportError:
+    try:
+        from .db_pool import get_pg_connection
+    except ImportError:
+        def get_pg_connection(subsystem, database_url=None, **kwargs):
+            return psycopg2.connect(database_url, **kwargs)
+
+try:
+    from api import decision_rollups as _rollups
+except ImportError:
+    from . import decision_rollups as _rollups
+
+from omnix_core.evidence import keyset_cursor as _keyset
+
 _alerts_trigger = None
 
 def _get_alerts_trigger():
@@ -231,6 +247,10 @@ _quota_db_failures: dict = defaultdict(list)   # client_id -> [timestamps]
 _ENGINE_AVAILABLE = False
 _GovernanceEvaluationEngine = None
 _DecisionReceiptEngine = None
+_ReceiptBatch = None
+
+# Upper bound on decisions per POST /api/governance/evaluate:batch request
+_EVALUATE_BATCH_MAX = int(os.environ.get('OMNIX_EVALUATE_BATCH_MAX', '100'))
 
 
 # ── HELPERS ──────────────────────────────────────────────────────────────────
@@ -262,7 +282,7 @@ def _encrypt_payload(data: str) -> tuple[str | None, str]:
 
 
 def _load_engine():
-    global _ENGINE_AVAILABLE, _GovernanceEvaluationEngine, _DecisionReceiptEngine
+    global _ENGINE_AVAILABLE, _GovernanceEvaluationEngine, _DecisionReceiptEngine, _ReceiptBatch
     if _ENGINE_AVAILABLE:
         return True
     try:
@@ -291,10 +311,11 @@ def _load_engine():
         # the trust registry, breaking independent verification.
         # Direct import reuses the already-loaded module so both share the same stable key.
         try:
-            from api.omnix_engine.decision_receipt import DecisionReceiptEngine as _DRE
+            from api.omnix_engine.decision_receipt import DecisionReceiptEngine as _DRE, ReceiptBatch as _RB
         except ImportError:
-            from omnix_engine.decision_receipt import DecisionReceiptEngine as _DRE
+            from omnix_engine.decision_receipt import DecisionReceiptEngine as _DRE, ReceiptBatch as _RB
         _DecisionReceiptEngine = _DRE
+        _ReceiptBatch = _RB
 
         _ENGINE_AVAILABLE = True
         logger.info(
@@ -330,16 +351,20 @@ def _is_rate_limited(client_ip: str) -> bool:
     return False
 
 
-def _is_client_rate_limited(client_id: str) -> bool:
-    """Per-client rate limit: max 30 calls per minute. Protects against accidental loops."""
+def _is_client_rate_limited(client_id: str, cost: int = 1) -> bool:
+    """
+    Per-client rate limit: max _CLIENT_RATE_LIMIT_MAX calls per minute. Protects
+    against accidental loops. `cost` charges several calls at once (one per
+    batch item); the request is refused whole if they do not all fit.
+    """
     now = time.time()
     window_start = now - _CLIENT_RATE_LIMIT_WINDOW
     _client_rate_limit_store[client_id] = [
         ts for ts in _client_rate_limit_store[client_id] if ts > window_start
     ]
-    if len(_client_rate_limit_store[client_id]) >= _CLIENT_RATE_LIMIT_MAX:
+    if len(_client_rate_limit_store[client_id]) + cost > _CLIENT_RATE_LIMIT_MAX:
         return True
-    _client_rate_limit_store[client_id].append(now)
+    _client_rate_limit_store[client_id].extend([now] * cost)
     return False
 
 
@@ -460,10 +485,18 @@ def _auto_ban_ip(ip: str, reason: str, violation_count: int = 3) -> None:
     threading.Thread(target=_run, daemon=True).start()
 
 
-def _check_client_quota(client_id: str) -> tuple:
+def _quota_remaining_note(remaining: int, requested: int) -> str:
+    """Tell batch callers how many items would still fit (empty for single calls)."""
+    if requested <= 1:
+        return ''
+    return f'Batch of {requested} exceeds the {max(remaining, 0)} evaluations remaining. '
+
+
+def _check_client_quota(client_id: str, requested: int = 1) -> tuple:
     """
     Enforce per-client daily and monthly hard quotas (ADR-081).
-    Queries decision_receipts for real usage counts.
+    Queries decision_receipts for real usage counts; the request is allowed
+    only if all `requested` receipts (batch size) fit under both quotas.
 
     Fail-open / fail-closed policy:
       - First _QUOTA_DB_FAIL_OPEN_MAX-1 consecutive DB errors within _QUOTA_DB_FAIL_WINDOW
@@ -483,12 +516,13 @@ def _check_client_quota(client_id: str) -> tuple:
             (client_id,),
         )
         daily_count = cur.fetchone()[0]
-        if daily_count >= _CLIENT_DAILY_QUOTA_MAX:
+        if daily_count + requested > _CLIENT_DAILY_QUOTA_MAX:
             conn.close()
-            logger.warning(f"[QUOTA] Daily limit hit: client={client_id} count={daily_count}")
+            logger.warning(f"[QUOTA] Daily limit hit: client={client_id} count={daily_count} requested={requested}")
             return False, (
                 'Daily evaluation quota reached. '
-                'Contact support@omnixquantum.net to discuss a higher-tier plan.'
+                + _quota_remaining_note(_CLIENT_DAILY_QUOTA_MAX - daily_count, requested)
+                + 'Contact support@omnixquantum.net to discuss a higher-tier plan.'
             )
 
         cur.execute(
@@ -498,11 +532,12 @@ def _check_client_quota(client_id: str) -> tuple:
         )
         monthly_count = cur.fetchone()[0]
         conn.close()
-        if monthly_count >= _CLIENT_MONTHLY_QUOTA_MAX:
-            logger.warning(f"[QUOTA] Monthly limit hit: client={client_id} count={monthly_count}")
+        if monthly_count + requested > _CLIENT_MONTHLY_QUOTA_MAX:
+            logger.warning(f"[QUOTA] Monthly limit hit: client={client_id} count={monthly_count} requested={requested}")
             return False, (
                 'Monthly evaluation quota reached. '
-                'Contact support@omnixquantum.net to discuss a higher-tier plan.'
+                + _quota_remaining_note(_CLIENT_MONTHLY_QUOTA_MAX - monthly_count, requested)
+                + 'Contact support@omnixquantum.net to discuss a higher-tier plan.'
             )
 
         # DB recovered — clear failure history for this client
@@ -571,7 +606,7 @@ def _get_db_conn():
     )
     if not db_url:
         raise RuntimeError("No database URL configured (DATABASE_URL / OMNIX_DB_URL)")
-    return psycopg2.connect(db_url)
+    return get_pg_connection("web", db_url)
 
 
 # ── WEBHOOK UTILITIES (ADR-053) ────────────────────────────────────────────────
@@ -1956,12 +1991,114 @@ def api_governance_receipt_vc():
 
 # ── CLIENT RECEIPTS ENDPOINT ──────────────────────────────────────────────────
 
+_LISTING_TOTAL_MODES = ("exact", "approx", "none")
+_EXPORT_PAGE_SIZE = int(os.environ.get("OMNIX_EXPORT_PAGE_SIZE", "1000"))
+
+
+def _listing_args(scope: str):
+    """
+    Parse the keyset query params shared by the receipt listings.
+
+      cursor — opaque token from a previous page's next_cursor
+      total  — exact | approx | none (default: exact for offset pages,
+               none once a cursor is followed)
+      format — json (default) | ndjson (stream the whole listing)
+
+    Returns (args, None) or (None, error_response).
+    """
+    token = request.args.get("cursor") or None
+    try:
+        after = _keyset.decode_cursor(token, scope) if token else None
+    except _keyset.InvalidCursor as exc:
+        return None, (jsonify({"error": f"Invalid cursor: {exc}", "status": 400}), 400)
+
+    total_mode = (request.args.get("total") or ("none" if token else "exact")).lower()
+    if total_mode not in _LISTING_TOTAL_MODES:
+        return None, (jsonify({
+            "error": f"total must be one of: {', '.join(_LISTING_TOTAL_MODES)}",
+            "status": 400,
+        }), 400)
+
+    fmt = (request.args.get("format") or "json").lower()
+    if fmt not in ("json", "ndjson"):
+        return None, (jsonify({"error": "format must be json or ndjson", "status": 400}), 400)
+
+    return {"after": after, "total": total_mode, "ndjson": fmt == "ndjson"}, None
+
+
+def _ndjson_export(conn_factory, fetch_page, key, shape, after, filename: str):
+    """
+    Stream a whole listing as NDJSON, one keyset page per query.
+    Each page commits, so an export of any length never holds a long
+    transaction or a server-side cursor open between pages.
+    """
+    from flask import Response
+
+    def _generate():
+        conn = None
+        try:
+            conn = conn_factory()
+            cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
+            def _page(position, size):
+                rows = fetch_page(cur, position, size)
+                conn.commit()
+                return rows
+
+            rows = _keyset.iter_keyset(_page, key, page_size=_EXPORT_PAGE_SIZE, after=after)
+            yield from _keyset.ndjson_lines(shape(r) for r in rows)
+        except Exception as exc:
+            logger.error(f"NDJSON export {filename} interrupted: {exc}")
+            yield json.dumps({"error": "Export interrupted", "status": 500}) + "\n"
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    resp = Response(_generate(), mimetype="application/x-ndjson")
+    resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    resp.headers["Cache-Control"] = "no-store"
+    return resp
+
+
+def _decision_receipts_page(cur, client_id, decision, after, limit, offset=0):
+    """One newest-first page of decision_receipts; keyset when ``after`` is set."""
+    where_clause = "WHERE client_id = %s"
+    params = [client_id]
+    if decision:
+        where_clause += " AND decision = %s"
+        params.append(decision)
+    if after:
+        where_clause += " AND " + _keyset.keyset_clause("created_at", "receipt_id")
+        params.extend(after)
+        offset = 0
+    cur.execute(
+        f"""
+        SELECT receipt_id, timestamp_utc, asset, decision, veto_chain, created_at
+        FROM decision_receipts
+        {where_clause}
+        ORDER BY {_keyset.keyset_order("created_at", "receipt_id")}
+        LIMIT %s OFFSET %s
+        """,
+        params + [limit, offset],
+    )
+    return cur.fetchall()
+
+
+def _receipt_key(row):
+    return row["created_at"], row["receipt_id"]
+
+
 @governance_bp.route('/api/governance/receipts', methods=['GET'])
 def api_governance_receipts():
     """
     Returns the authenticated client's own governance receipts.
     Isolation guaranteed: WHERE client_id = authenticated client's ID.
-    Query params: limit (default 20, max 100), offset (default 0), decision (optional filter).
+    Query params: limit (default 20, max 100), offset (default 0), decision (optional filter),
+    cursor (keyset page token from next_cursor; replaces offset), total (exact | approx | none),
+    format=ndjson (stream every matching receipt).
     """
     client, err = _require_auth()
     if err:
@@ -1975,32 +2112,42 @@ def api_governance_receipts():
         return jsonify({'error': 'limit and offset must be integers', 'status': 400}), 400
 
     decision_filter = request.args.get('decision')
+    decision = decision_filter.upper() if decision_filter else None
+    scope = _keyset.cursor_scope("receipts", client_id, decision)
+    listing, err = _listing_args(scope)
+    if err:
+        return err
+
+    if listing["ndjson"]:
+        return _ndjson_export(
+            _get_db_conn,
+            lambda cur, after, n: _decision_receipts_page(cur, client_id, decision, after, n),
+            _receipt_key, dict, listing["after"], "governance_receipts.ndjson",
+        )
 
     try:
         conn = _get_db_conn()
         cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        rows = _decision_receipts_page(cur, client_id, decision, listing["after"], limit + 1, offset)
+        page, next_cursor = _keyset.split_page(rows, limit, _receipt_key, scope)
+        receipts = [dict(r) for r in page]
 
-        where_clause = "WHERE client_id = %s"
-        params = [client_id]
-
-        if decision_filter:
-            where_clause += " AND decision = %s"
-            params.append(decision_filter.upper())
-
-        cur.execute(
-            f"""
-            SELECT receipt_id, timestamp_utc, asset, decision, veto_chain, created_at
-            FROM decision_receipts
-            {where_clause}
-            ORDER BY created_at DESC
-            LIMIT %s OFFSET %s
-            """,
-            params + [limit, offset],
-        )
-        receipts = [dict(r) for r in cur.fetchall()]
-
-        cur.execute(f"SELECT COUNT(*) as cnt FROM decision_receipts {where_clause}", params)
-        total = cur.fetchone()["cnt"]
+        total = None
+        if listing["total"] != "none":
+            # The rollups make the per-client total cheap, so approx and exact coincide here.
+            try:
+                total = _rollups.read_client_total(conn.cursor(), client_id, decision)
+            except Exception as _re:
+                logger.debug(f"Rollup count unavailable, counting receipts directly: {_re}")
+                conn.rollback()
+                cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+                params = [client_id] + ([decision] if decision else [])
+                cur.execute(
+                    "SELECT COUNT(*) as cnt FROM decision_receipts WHERE client_id = %s"
+                    + (" AND decision = %s" if decision else ""),
+                    params,
+                )
+                total = cur.fetchone()["cnt"]
 
         cur.close()
         conn.close()
@@ -2008,9 +2155,11 @@ def api_governance_receipts():
         return jsonify({
             'client_id': client_id,
             'total': total,
+            'total_mode': listing["total"],
             'limit': limit,
-            'offset': offset,
+            'offset': 0 if listing["after"] else offset,
             'receipts': receipts,
+            'next_cursor': next_cursor,
             'verifiable_at': 'https://omnibotgenesis-production.up.railway.app/verify',
         }), 200
 
@@ -3746,6 +3895,11 @@ def _ensure_udcl_table() -> None:
             "CREATE INDEX IF NOT EXISTS idx_udcl_created_at "
             "ON udcl_control_receipts(created_at DESC)"
         )
+        # Keyset pagination: (created_at, control_id) < cursor per client
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_udcl_client_created_control "
+            "ON udcl_control_receipts(client_id, created_at DESC, control_id DESC)"
+        )
         conn.commit()
         cur.close()
         conn.close()
@@ -3755,40 +3909,49 @@ def _ensure_udcl_table() -> None:
         logger.warning("[UDCL] Table ensure failed: %s", exc)
 
 
+_UDCL_INSERT_COLUMNS = (
+    "control_id, client_id, decision, blocking_pillar, block_reason, "
+    "receipt_id, domain, asset, pillar_results, control_hash, "
+    "cbg_enabled, total_latency_ms, pillars_evaluated, pillars_passed, "
+    "standing_margin, sbe_result, ctag_result, issued_at"
+)
+
+
+def _control_receipt_row(receipt_dict: dict, client_id: str) -> tuple:
+    return (
+        receipt_dict.get("control_id"),
+        client_id,
+        receipt_dict.get("decision"),
+        receipt_dict.get("blocking_pillar"),
+        receipt_dict.get("block_reason"),
+        receipt_dict.get("receipt_id"),
+        receipt_dict.get("domain"),
+        receipt_dict.get("asset"),
+        json.dumps(receipt_dict.get("pillar_results", {})),
+        receipt_dict.get("control_hash", ""),
+        bool(receipt_dict.get("cbg_enabled", False)),
+        receipt_dict.get("total_latency_ms"),
+        receipt_dict.get("pillars_evaluated", 0),
+        receipt_dict.get("pillars_passed", 0),
+        receipt_dict.get("standing_margin"),
+        json.dumps(receipt_dict.get("sbe_result")) if receipt_dict.get("sbe_result") else None,
+        json.dumps(receipt_dict.get("ctag_result")) if receipt_dict.get("ctag_result") else None,
+        receipt_dict.get("issued_at"),
+    )
+
+
 def _persist_control_receipt(receipt_dict: dict, client_id: str) -> None:
     """Persist ControlReceipt to udcl_control_receipts. Runs in caller thread."""
     try:
         _ensure_udcl_table()
         conn = _get_db_conn()
         cur  = conn.cursor()
-        cur.execute("""
+        cur.execute(f"""
             INSERT INTO udcl_control_receipts
-                (control_id, client_id, decision, blocking_pillar, block_reason,
-                 receipt_id, domain, asset, pillar_results, control_hash,
-                 cbg_enabled, total_latency_ms, pillars_evaluated, pillars_passed,
-                 standing_margin, sbe_result, ctag_result, issued_at)
+                ({_UDCL_INSERT_COLUMNS})
             VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
             ON CONFLICT (control_id) DO NOTHING
-        """, (
-            receipt_dict.get("control_id"),
-            client_id,
-            receipt_dict.get("decision"),
-            receipt_dict.get("blocking_pillar"),
-            receipt_dict.get("block_reason"),
-            receipt_dict.get("receipt_id"),
-            receipt_dict.get("domain"),
-            receipt_dict.get("asset"),
-            json.dumps(receipt_dict.get("pillar_results", {})),
-            receipt_dict.get("control_hash", ""),
-            bool(receipt_dict.get("cbg_enabled", False)),
-            receipt_dict.get("total_latency_ms"),
-            receipt_dict.get("pillars_evaluated", 0),
-            receipt_dict.get("pillars_passed", 0),
-            receipt_dict.get("standing_margin"),
-            json.dumps(receipt_dict.get("sbe_result")) if receipt_dict.get("sbe_result") else None,
-            json.dumps(receipt_dict.get("ctag_result")) if receipt_dict.get("ctag_result") else None,
-            receipt_dict.get("issued_at"),
-        ))
+        """, _control_receipt_row(receipt_dict, client_id))
         conn.commit()
         cur.close()
         conn.close()
@@ -3796,6 +3959,31 @@ def _persist_control_receipt(receipt_dict: dict, client_id: str) -> None:
         logger.warning("[UDCL] Persist control receipt failed: %s", exc)
 
 
+def _persist_control_receipts(receipt_dicts: list, client_id: str) -> None:
+    """Persist a batch of ControlReceipts with one multi-row INSERT."""
+    if not receipt_dicts:
+        return
+    try:
+        _ensure_udcl_table()
+        conn = _get_db_conn()
+        cur  = conn.cursor()
+        psycopg2.extras.execute_values(
+            cur,
+            f"""
+            INSERT INTO udcl_control_receipts ({_UDCL_INSERT_COLUMNS})
+            VALUES %s
+            ON CONFLICT (control_id) DO NOTHING
+            """,
+            [_control_receipt_row(r, client_id) for r in receipt_dicts],
+            page_size=max(len(receipt_dicts), 1),
+        )
+        conn.commit()
+        cur.close()
+        conn.close()
+    except Exception as exc:
+        logger.warning("[UDCL] Persist %d control receipts failed: %s", len(receipt_dicts), exc)
+
+
 def _load_udcl() -> object | None:
     """
     Lazy-load UnifiedDecisionControlLayer, reusing the already-loaded
@@ -4078,6 +4266,259 @@ def api_udcl_evaluate():
     return jsonify({"success": True, **receipt_dict}), 200
 
 
+_ALLOWED_BATCH_KEYS      = {"items", "cbg_enabled", "ctag_enabled", "cag_enabled"}
+_ALLOWED_BATCH_ITEM_KEYS = {"signals", "asset", "domain", "metadata", "compliance_config"}
+
+
+def _validate_batch_item(item) -> tuple:
+    """
+    Validate one evaluate:batch item with the /control/evaluate rules.
+    Returns (parsed: dict | None, error: str | None).
+    """
+    if not isinstance(item, dict) or "signals" not in item:
+        return None, "Item must be a JSON object including a 'signals' field."
+    unknown = set(item.keys()) - _ALLOWED_BATCH_ITEM_KEYS
+    if unknown:
+        return None, f"Item contains unrecognised fields: {sorted(unknown)}"
+
+    asset_raw  = item.get("asset", "UNKNOWN")
+    domain_raw = item.get("domain", "generic")
+    if not isinstance(asset_raw, str):
+        return None, '"asset" must be a string.'
+    if not isinstance(domain_raw, str):
+        return None, '"domain" must be a string.'
+
+    meta_raw = item.get("metadata", {})
+    if meta_raw is not None and not isinstance(meta_raw, dict):
+        return None, '"metadata" must be a JSON object or omitted.'
+    if isinstance(meta_raw, dict) and len(meta_raw) > 50:
+        return None, "Item payload exceeds allowed limits."
+
+    cc_raw = item.get("compliance_config", {})
+    if not isinstance(cc_raw, dict):
+        return None, '"compliance_config" must be a JSON object or omitted.'
+
+    signals = item.get("signals", {})
+    is_valid, error_msg = _GovernanceEvaluationEngine.validate_signals(signals)
+    if not is_valid:
+        return None, f"Invalid signals: {error_msg}"
+
+    return {
+        "signals":           signals,
+        "asset":             asset_raw[:64],
+        "domain":            domain_raw[:32],
+        "metadata":          meta_raw if isinstance(meta_raw, dict) else {},
+        "compliance_config": cc_raw,
+    }, None
+
+
+@governance_bp.route('/api/governance/evaluate:batch', methods=['POST'])
+def api_governance_evaluate_batch():
+    """
+    POST /api/governance/evaluate:batch
+    Evaluate up to OMNIX_EVALUATE_BATCH_MAX decisions in one request.
+
+    Body: {"items": [{signals, asset, domain, metadata, compliance_config}, ...],
+           "cbg_enabled": bool, "ctag_enabled": bool, "cag_enabled": bool}
+
+    Every item runs through UnifiedDecisionControlLayer.evaluate (MOD-014).
+    Decision receipts are hash-linked in item order, stored with one
+    multi-row INSERT and appended to the transparency chain as one
+    contiguous group. Invalid items are reported per index and do not
+    fail the batch.
+
+    Requires X-API-Key authentication. Each item counts as one request
+    against the per-client rate limit and one receipt against the daily and
+    monthly quotas; a batch that does not fit is rejected whole (429) before
+    any item is evaluated.
+    ADR-138.
+    """
+    client, err = _require_auth()
+    if err:
+        return err
+
+    client_id  = client["client_id"]
+    client_ip  = _get_client_ip()
+
+    if _is_ip_blocked(client_ip):
+        return jsonify({"error": "Access denied — try again later", "status": 403}), 403
+
+    if not request.is_json:
+        return jsonify({"error": "Request must be Content-Type: application/json", "status": 400}), 400
+    try:
+        body = request.get_json(force=True)
+    except Exception:
+        return jsonify({"error": "Invalid JSON body", "status": 400}), 400
+
+    if not isinstance(body, dict) or not isinstance(body.get("items"), list):
+        return jsonify({
+            "error": "Request body must include an 'items' array. See GET /api/governance/control/schema.",
+            "status": 400,
+        }), 400
+
+    unknown = set(body.keys()) - _ALLOWED_BATCH_KEYS
+    if unknown:
+        return jsonify({
+            "error": f"Request contains unrecognised fields: {sorted(unknown)}",
+            "status": 400,
+        }), 400
+
+    items = body["items"]
+    if not items:
+        return jsonify({"error": "'items' must not be empty.", "status": 400}), 400
+    if len(items) > _EVALUATE_BATCH_MAX:
+        return jsonify({
+            "error":     f"Batch exceeds {_EVALUATE_BATCH_MAX} items.",
+            "status":    413,
+            "max_items": _EVALUATE_BATCH_MAX,
+        }), 413
+
+    if _is_client_rate_limited(client_id, cost=len(items)):
+        ref_id = str(uuid.uuid4())[:8]
+        return jsonify({
+            "error":    f"Rate limit exceeded — {_CLIENT_RATE_LIMIT_MAX} requests per minute "
+                        f"(a batch counts one request per item)",
+            "status":   429,
+            "reference": ref_id,
+            "retry_after_seconds": _CLIENT_RATE_LIMIT_WINDOW,
+        }), 429
+
+    quota_ok, quota_error = _check_client_quota(client_id, requested=len(items))
+    if not quota_ok:
+        return jsonify({"error": quota_error, "status": 429, "type": "quota_exceeded"}), 429
+
+    cbg_enabled  = bool(body.get("cbg_enabled",  False))
+    ctag_enabled = bool(body.get("ctag_enabled", False))
+    cag_enabled  = bool(body.get("cag_enabled",  False))
+
+    udcl = _load_udcl()
+    if udcl is None or _ReceiptBatch is None:
+        return jsonify({"error": "Unified Decision Control Layer unavailable", "status": 503}), 503
+
+    checkpoint_overrides = _load_client_checkpoint_overrides(client_id)
+    thresholds_source = "client_custom" if any(
+        cp.get("_source") == "client_custom" for cp in checkpoint_overrides
+    ) else "default"
+    clean_overrides = [
+        {k: v for k, v in cp.items() if k != "_source"} for cp in checkpoint_overrides
+    ]
+
+    receipt_batch = _ReceiptBatch(_DecisionReceiptEngine())
+    results, control_receipts = [], []
+    for index, item in enumerate(items):
+        parsed, item_error = _validate_batch_item(item)
+        if item_error:
+            results.append({"index": index, "success": False, "error": item_error, "status": 400})
+            continue
+        compliance_config = {**parsed["compliance_config"], "client_id": client_id}
+        compliance_config["layer0_enabled"] = True  # Layer 0 always active
+        try:
+            control_receipt = udcl.evaluate(
+                signals              = parsed["signals"],
+                asset                = parsed["asset"],
+                domain               = parsed["domain"],
+                client_id            = client_id,
+                metadata             = parsed["metadata"],
+                compliance_config    = compliance_config,
+                checkpoint_overrides = clean_overrides or None,
+                cbg_enabled          = cbg_enabled,
+                ctag_enabled         = ctag_enabled,
+                cag_enabled          = cag_enabled,
+                receipt_engine       = receipt_batch,
+            )
+        except Exception as exc:
+            ref_id = str(uuid.uuid4())[:8]
+            logger.error("[UDCL] batch item %d exception ref=%s: %s", index, ref_id, exc)
+            results.append({
+                "index": index, "success": False, "status": 500,
+                "error": "Internal UDCL evaluation error", "reference": ref_id,
+            })
+            continue
+        receipt_dict = control_receipt.to_dict()
+        control_receipts.append(receipt_dict)
+        receipt_dict["verify_url"] = (
+            f"https://omnixquantum.net/verify#{receipt_dict.get('receipt_id')}"
+            if receipt_dict.get("receipt_id") else None
+        )
+        results.append({"index": index, "success": True, **receipt_dict})
+
+    receipts_stored = receipt_batch.commit()
+
+    try:
+        threading.Thread(
+            target=_persist_control_receipts,
+            args=(control_receipts, client_id),
+            daemon=True,
+        ).start()
+    except Exception as _pe:
+        logger.debug("[UDCL] Batch persist thread start failed: %s", _pe)
+
+    _check_monthly_alert(client_id)
+
+    succeeded = len(control_receipts)
+    response = {
+        "success":           True,
+        "count":             len(items),
+        "succeeded":         succeeded,
+        "failed":            len(items) - succeeded,
+        "receipts_stored":   receipts_stored,
+        "thresholds_source": thresholds_source,
+        "cag_enabled":       cag_enabled,
+        "ctag_enabled":      ctag_enabled,
+        "module":            "MOD-014",
+        "results":           results,
+    }
+
+    key_expires_in_days = client.get("key_expires_in_days")
+    if key_expires_in_days is not None:
+        response["key_expiry_warning"] = {
+            "expires_in_days": key_expires_in_days,
+            "message": (
+                f"Your API key expires in {key_expires_in_days} day(s). "
+                "Rotate via POST /api/governance/admin/clients/<id>/rotate."
+            ),
+        }
+
+    logger.info(
+        "[UDCL] evaluate:batch: client=%s items=%d succeeded=%d receipts=%d "
+        "stored=%s thresholds=%s ip=%s",
+        client_id, len(items), succeeded, len(receipt_batch),
+        receipts_stored, thresholds_source, client_ip,
+    )
+
+    # Webhook push — one control.evaluated event per decision, sent from one thread
+    try:
+        webhook_cfg = get_client_webhook(client_id)
+        if webhook_cfg and webhook_cfg.get("webhook_url") and control_receipts:
+            def _push_batch_webhooks():
+                for rd in control_receipts:
+                    _push_receipt_webhook(
+                        client_id,
+                        rd.get("control_id", ""),
+                        rd.get("decision", ""),
+                        {
+                            "event":           "control.evaluated",
+                            "control_id":      rd.get("control_id"),
+                            "receipt_id":      rd.get("receipt_id"),
+                            "client_id":       client_id,
+                            "asset":           rd.get("asset"),
+                            "domain":          rd.get("domain"),
+                            "decision":        rd.get("decision"),
+                            "blocking_pillar": rd.get("blocking_pillar"),
+                            "control_hash":    rd.get("control_hash"),
+                            "module":          "MOD-014",
+                            "adr":             "ADR-138",
+                        },
+                        webhook_cfg["webhook_url"],
+                        webhook_cfg["webhook_secret"],
+                    )
+            threading.Thread(target=_push_batch_webhooks, daemon=True).start()
+    except Exception as _we:
+        logger.debug("[UDCL] Batch webhook push thread skipped: %s", _we)
+
+    return jsonify(response), 200
+
+
 @governance_bp.route('/api/governance/control/receipts/<control_id>', methods=['GET'])
 def api_udcl_receipt(control_id: str):
     """
@@ -4149,12 +4590,56 @@ def api_udcl_receipt(control_id: str):
         return jsonify({"error": "Internal server error", "status": 500}), 500
 
 
+def _udcl_receipts_page(cur, client_id, after, limit, offset=0):
+    """One newest-first page of udcl_control_receipts; keyset when ``after`` is set."""
+    where_sql, params = "client_id = %s", [client_id]
+    if after:
+        where_sql += " AND " + _keyset.keyset_clause("created_at", "control_id")
+        params.extend(after)
+        offset = 0
+    cur.execute(
+        f"""
+        SELECT control_id, decision, blocking_pillar, receipt_id,
+               domain, asset, total_latency_ms, pillars_evaluated, pillars_passed,
+               cbg_enabled, created_at
+        FROM udcl_control_receipts
+        WHERE {where_sql}
+        ORDER BY {_keyset.keyset_order("created_at", "control_id")}
+        LIMIT %s OFFSET %s
+        """,
+        params + [limit, offset],
+    )
+    return cur.fetchall() or []
+
+
+def _udcl_item(r) -> dict:
+    return {
+        "control_id":      r["control_id"],
+        "decision":        r["decision"],
+        "blocking_pillar": r["blocking_pillar"],
+        "receipt_id":      r["receipt_id"],
+        "domain":          r["domain"],
+        "asset":           r["asset"],
+        "total_latency_ms": float(r["total_latency_ms"]) if r["total_latency_ms"] else None,
+        "pillars_evaluated": r["pillars_evaluated"],
+        "pillars_passed":    r["pillars_passed"],
+        "cbg_enabled":     r["cbg_enabled"],
+        "created_at":      str(r["created_at"]),
+    }
+
+
+def _udcl_key(row):
+    return row["created_at"], row["control_id"]
+
+
 @governance_bp.route('/api/governance/control/receipts', methods=['GET'])
 def api_udcl_receipts_list():
     """
     GET /api/governance/control/receipts
     MOD-014: Paginated list of UDCL control receipts for authenticated client.
-    Query params: page (default 1), per_page (default 20, max 100).
+    Query params: page (default 1), per_page (default 20, max 100),
+    cursor (keyset page token from next_cursor; replaces page), total (exact | approx | none),
+    format=ndjson (stream every control receipt).
     ADR-138.
     """
     client, err = _require_auth()
@@ -4166,56 +4651,48 @@ def api_udcl_receipts_list():
     per_page = min(100, max(1, int(request.args.get("per_page", 20))))
     offset   = (page - 1) * per_page
 
+    scope = _keyset.cursor_scope("udcl", client_id)
+    listing, err = _listing_args(scope)
+    if err:
+        return err
+
+    _ensure_udcl_table()
+    if listing["ndjson"]:
+        return _ndjson_export(
+            _get_db_conn,
+            lambda cur, after, n: _udcl_receipts_page(cur, client_id, after, n),
+            _udcl_key, _udcl_item, listing["after"], "control_receipts.ndjson",
+        )
+
     try:
-        _ensure_udcl_table()
         conn = _get_db_conn()
         cur  = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
 
-        cur.execute(
-            "SELECT COUNT(*) AS cnt FROM udcl_control_receipts WHERE client_id = %s",
-            (client_id,),
-        )
-        total = int((cur.fetchone() or {}).get("cnt", 0))
+        rows = _udcl_receipts_page(cur, client_id, listing["after"], per_page + 1, offset)
+        rows, next_cursor = _keyset.split_page(rows, per_page, _udcl_key, scope)
 
-        cur.execute(
-            """
-            SELECT control_id, decision, blocking_pillar, receipt_id,
-                   domain, asset, total_latency_ms, pillars_evaluated, pillars_passed,
-                   cbg_enabled, created_at
-            FROM udcl_control_receipts
-            WHERE client_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s OFFSET %s
-            """,
-            (client_id, per_page, offset),
-        )
-        rows = cur.fetchall() or []
+        total = None
+        if listing["total"] == "exact":
+            cur.execute(
+                "SELECT COUNT(*) AS cnt FROM udcl_control_receipts WHERE client_id = %s",
+                (client_id,),
+            )
+            total = int((cur.fetchone() or {}).get("cnt", 0))
+        elif listing["total"] == "approx":
+            total = _keyset.estimate_count(
+                cur, "SELECT 1 FROM udcl_control_receipts WHERE client_id = %s", (client_id,),
+            )
         cur.close()
         conn.close()
 
-        items = [
-            {
-                "control_id":      r["control_id"],
-                "decision":        r["decision"],
-                "blocking_pillar": r["blocking_pillar"],
-                "receipt_id":      r["receipt_id"],
-                "domain":          r["domain"],
-                "asset":           r["asset"],
-                "total_latency_ms": float(r["total_latency_ms"]) if r["total_latency_ms"] else None,
-                "pillars_evaluated": r["pillars_evaluated"],
-                "pillars_passed":    r["pillars_passed"],
-                "cbg_enabled":     r["cbg_enabled"],
-                "created_at":      str(r["created_at"]),
-            }
-            for r in rows
-        ]
-
         return jsonify({
             "status":   "ok",
             "total":    total,
-            "page":     page,
+            "total_mode": listing["total"],
+            "page":     None if listing["after"] else page,
             "per_page": per_page,
-            "items":    items,
+            "items":    [_udcl_item(r) for r in rows],
+            "next_cursor": next_cursor,
             "module":   "MOD-014",
             "adr":      "ADR-138",
         }), 200
@@ -4609,6 +5086,41 @@ def _get_execution_receipt_engine():
     return engine
 
 
+def _execution_receipts_page(cur, where_clauses, params, after, limit, offset=0):
+    """One newest-first page of execution_receipts; keyset when ``after`` is set."""
+    where_clauses, params = list(where_clauses), list(params)
+    if after:
+        where_clauses.append(_keyset.keyset_clause("created_at", "receipt_id"))
+        params.extend(after)
+        offset = 0
+    cur.execute(f"""
+        SELECT
+            receipt_id, order_id, decision_receipt_id, symbol, side, size_usd,
+            requested_price, requested_quantity, executed_price,
+            filled_quantity, fill_ratio, slippage_bps,
+            execution_style, final_status, failure_reason,
+            receipt_hash, vc_issued, created_at, updated_at
+        FROM execution_receipts
+        WHERE {" AND ".join(where_clauses)}
+        ORDER BY {_keyset.keyset_order("created_at", "receipt_id")}
+        LIMIT %s OFFSET %s
+    """, params + [limit, offset])
+    return cur.fetchall() or []
+
+
+def _execution_item(r) -> dict:
+    item = dict(r)
+    if item.get("created_at"):
+        item["created_at"] = str(item["created_at"])
+    if item.get("updated_at"):
+        item["updated_at"] = str(item["updated_at"])
+    return item
+
+
+def _execution_key(row):
+    return row["created_at"], row["receipt_id"]
+
+
 @governance_bp.route('/api/governance/execution/receipts', methods=['GET'])
 def api_execution_receipts_list():
     """
@@ -4621,6 +5133,9 @@ def api_execution_receipts_list():
       status              — filter by final_status: PENDING | FILLED | PARTIAL | FAILED.
       limit               — max records (default 20, max 100).
       offset              — pagination offset (default 0).
+      cursor              — keyset page token from next_cursor (replaces offset).
+      total               — exact | approx | none.
+      format              — ndjson streams every matching receipt.
 
     Authentication: X-API-Key (B2B clients).
     ADR-131.
@@ -4645,59 +5160,55 @@ def api_execution_receipts_list():
             "status": 400,
         }), 400
 
-    try:
-        import os
-        import psycopg2
-        import psycopg2.extras
-        db_url = os.environ.get("DATABASE_URL")
-        if not db_url:
-            return jsonify({"error": "Database unavailable.", "status": 503}), 503
+    where_clauses = ["decision_receipt_id IS NOT NULL"]
+    params: list = []
 
-        conn = psycopg2.connect(db_url)
-        conn.cursor_factory = psycopg2.extras.RealDictCursor
-        cur = conn.cursor()
+    if decision_receipt_id:
+        where_clauses.append("decision_receipt_id = %s")
+        params.append(decision_receipt_id)
+    if status_filter:
+        where_clauses.append("final_status = %s")
+        params.append(status_filter.upper())
 
-        where_clauses = ["decision_receipt_id IS NOT NULL"]
-        params: list = []
+    scope = _keyset.cursor_scope("execution", client_id, decision_receipt_id,
+                                 status_filter.upper() if status_filter else None)
+    listing, err = _listing_args(scope)
+    if err:
+        return err
 
-        if decision_receipt_id:
-            where_clauses.append("decision_receipt_id = %s")
-            params.append(decision_receipt_id)
-        if status_filter:
-            where_clauses.append("final_status = %s")
-            params.append(status_filter.upper())
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        return jsonify({"error": "Database unavailable.", "status": 503}), 503
 
-        where_sql = " AND ".join(where_clauses)
+    if listing["ndjson"]:
+        return _ndjson_export(
+            lambda: psycopg2.connect(db_url),
+            lambda cur, after, n: _execution_receipts_page(cur, where_clauses, params, after, n),
+            _execution_key, _execution_item, listing["after"], "execution_receipts.ndjson",
+        )
 
-        cur.execute(f"""
-            SELECT
-                order_id, decision_receipt_id, symbol, side, size_usd,
-                requested_price, requested_quantity, executed_price,
-                filled_quantity, fill_ratio, slippage_bps,
-                execution_style, final_status, failure_reason,
-                receipt_hash, vc_issued, created_at, updated_at
-            FROM execution_receipts
-            WHERE {where_sql}
-            ORDER BY created_at DESC
-            LIMIT %s OFFSET %s
-        """, params + [limit, offset])
+    try:
+        conn = psycopg2.connect(db_url)
+        conn.cursor_factory = psycopg2.extras.RealDictCursor
+        cur = conn.cursor()
 
-        rows = cur.fetchall() or []
+        rows = _execution_receipts_page(cur, where_clauses, params, listing["after"], limit + 1, offset)
+        rows, next_cursor = _keyset.split_page(rows, limit, _execution_key, scope)
 
-        cur.execute(f"SELECT COUNT(*) FROM execution_receipts WHERE {where_sql}", params)
-        total = (cur.fetchone() or {}).get("count", 0)
+        where_sql = " AND ".join(where_clauses)
+        total = None
+        if listing["total"] == "exact":
+            cur.execute(f"SELECT COUNT(*) FROM execution_receipts WHERE {where_sql}", params)
+            total = int((cur.fetchone() or {}).get("count", 0))
+        elif listing["total"] == "approx":
+            total = _keyset.estimate_count(
+                cur, f"SELECT 1 FROM execution_receipts WHERE {where_sql}", params,
+            )
 
         cur.close()
         conn.close()
 
-        items = []
-        for r in rows:
-            item = dict(r)
-            if item.get("created_at"):
-                item["created_at"] = str(item["created_at"])
-            if item.get("updated_at"):
-                item["updated_at"] = str(item["updated_at"])
-            items.append(item)
+        items = [_execution_item(r) for r in rows]
 
     except Exception as exc:
         logger.error("[EIL] execution receipts list error: %s", exc)
@@ -4706,11 +5217,13 @@ def api_execution_receipts_list():
     resp = jsonify({
         "status":   "ok",
         "adr":      "ADR-131",
-        "total":    int(total),
+        "total":    total,
+        "total_mode": listing["total"],
         "limit":    limit,
-        "offset":   offset,
+        "offset":   0 if listing["after"] else offset,
         "receipts": items,
         "items":    items,
+        "next_cursor": next_cursor,
     })
     resp.headers["X-OMNIX-ADR"] = "ADR-131"
     return resp, 200
@@ -327,6 +327,8 @@ def verify_artifact():
         artifact_type   (required) — "BAR" | "CTCHC" | "SESSION"
         artifact_id     (required) — the artifact's primary key
         artifact_data   (optional) — embedded artifact for fully offline use
+        full_verify     (optional) — re-hash the CTCHC from genesis, ignoring
+                                     verified checkpoints (offline audits)
     """
     data = request.get_json(silent=True) or {}
     artifact_type = (data.get("artifact_type") or "").strip()
@@ -343,6 +345,7 @@ def verify_artifact():
             artifact_type=artifact_type,
             artifact_id=artifact_id,
             artifact_data=data.get("artifact_data"),
+            full_verify=bool(data.get("full_verify", False)),
         )
         return jsonify({
             "status": "verified" if result.get("verified") else "invalid",
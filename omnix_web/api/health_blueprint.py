@@ -6,6 +6,7 @@ Endpoints:
   GET  /api/health/live        — liveness probe (200) for Railway / load balancers
   GET  /api/health/ready       — readiness probe (200 / 503) — DB must be UP
   POST /api/health/reconcile-wal — trigger WAL reconciliation (admin only)
+  GET  /metrics                — GOL metrics, Prometheus text format 0.0.4 (ADR-198)
 
 Design: all 6 probes are implemented directly in this blueprint using
 libraries already present in omnix_web/requirements.txt (psycopg2, pypqc).
@@ -24,7 +25,7 @@ from datetime import datetime, timezone
 from functools import wraps
 from typing import Any, Dict, List, Optional
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 
 # ── Path bootstrap — add workspace root so omnix_core is importable ───────────
 _THIS_DIR       = os.path.dirname(os.path.abspath(__file__))
@@ -521,3 +522,22 @@ def reconcile_wal():
     except Exception as e:
         logger.error(f"[health_bp] WAL reconciliation failed: {e}")
         return jsonify({"error": str(e)}), 500
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# /metrics
+# ─────────────────────────────────────────────────────────────────────────────
+
+@health_bp.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    try:
+        from omnix_core.observability.metrics import (
+            PROMETHEUS_CONTENT_TYPE,
+            GovernanceMetricsRegistry,
+        )
+        body = GovernanceMetricsRegistry.get_instance().export_prometheus()
+        return Response(body, status=200, content_type=PROMETHEUS_CONTENT_TYPE)
+    except Exception as e:
+        logger.error(f"[health_bp] Metrics export failed: {e}")
+        return Response(f"# metrics unavailable: {type(e).__name__}\n", status=503,
+                        content_type="text/plain; charset=utf-8")
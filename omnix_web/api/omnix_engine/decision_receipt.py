@@ -5,7 +5,7 @@ import logging
 import uuid
 import os
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger("OMNIX.Evidence")
 
@@ -150,6 +150,20 @@ def _get_db_connection(db_url: str):
         return None
 
 
+_RECEIPT_COLUMNS = (
+    "receipt_id, timestamp_utc, asset, decision, veto_chain, "
+    "policy_version, engine_version, prev_hash, content_hash, "
+    "signature, signature_algorithm, public_key, "
+    "client_id, encrypted_payload, retention_until, domain, "
+    "processing_time_ms"
+)
+
+
+def _retention_until():
+    from datetime import timedelta
+    return (datetime.now(timezone.utc) + timedelta(days=365)).date()
+
+
 class DecisionReceiptEngine:
 
     def __init__(self, db_url: Optional[str] = None):
@@ -181,6 +195,12 @@ class DecisionReceiptEngine:
         return None
 
     def generate_receipt(self, decision: Dict[str, Any], prev_hash: str = "", processing_time_ms: Optional[int] = None) -> Dict[str, Any]:
+        receipt = self.build_receipt(decision, prev_hash=prev_hash, processing_time_ms=processing_time_ms)
+        self._append_to_transparency_chain(receipt['receipt_id'], receipt)
+        return receipt
+
+    def build_receipt(self, decision: Dict[str, Any], prev_hash: str = "", processing_time_ms: Optional[int] = None) -> Dict[str, Any]:
+        """Hash and sign a receipt without appending it to the transparency log."""
         receipt_id = f"OMNIX-{uuid.uuid4().hex[:12].upper()}"
         timestamp = datetime.now(timezone.utc).isoformat()
 
@@ -240,16 +260,18 @@ class DecisionReceiptEngine:
         if processing_time_ms is not None:
             public_payload['processing_time_ms'] = processing_time_ms
 
-        self._append_to_transparency_chain(receipt_id, public_payload)
-
         return public_payload
 
     def _append_to_transparency_chain(self, receipt_id: str, payload: Dict[str, Any]) -> None:
-        """Non-blocking: append receipt to transparency log (ADR-044)."""
+        """
+        Non-blocking: append receipt to transparency log (ADR-044).
+
+        The process-wide chain writer queues the receipt; its chain position
+        is assigned under the DB chain lock in a batched background flush.
+        """
         try:
-            from omnix_core.evidence.transparency_chain import TransparencyChain
-            chain = TransparencyChain()
-            chain.append(
+            from omnix_core.evidence.transparency_chain import get_chain_writer
+            get_chain_writer().submit(
                 receipt_id=receipt_id,
                 symbol=payload.get('asset', 'UNKNOWN'),
                 decision=payload.get('decision', 'UNKNOWN'),
@@ -290,38 +312,13 @@ class DecisionReceiptEngine:
             logger.warning("Failed to connect to DB for receipt storage")
             return False
         try:
-            from datetime import timedelta
-            retention_until = (datetime.now(timezone.utc) + timedelta(days=365)).date()
-
             cur = conn.cursor()
-            cur.execute("""
+            cur.execute(f"""
                 INSERT INTO decision_receipts 
-                (receipt_id, timestamp_utc, asset, decision, veto_chain, 
-                 policy_version, engine_version, prev_hash, content_hash,
-                 signature, signature_algorithm, public_key,
-                 client_id, encrypted_payload, retention_until, domain,
-                 processing_time_ms)
+                ({_RECEIPT_COLUMNS})
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 ON CONFLICT (receipt_id) DO NOTHING
-            """, (
-                receipt['receipt_id'],
-                receipt['timestamp'],
-                receipt['asset'],
-                receipt['decision'],
-                json.dumps(receipt['veto_chain']),
-                receipt['policy_version'],
-                receipt['engine_version'],
-                receipt['prev_hash'],
-                receipt['content_hash'],
-                receipt['signature'],
-                receipt['signature_algorithm'],
-                receipt['public_key'],
-                receipt.get('client_id'),
-                receipt.get('encrypted_payload'),
-                retention_until,
-                receipt.get('domain'),
-                receipt.get('processing_time_ms'),
-            ))
+            """, self._receipt_row(receipt, _retention_until()))
             conn.commit()
             cur.close()
             conn.close()
@@ -334,6 +331,72 @@ class DecisionReceiptEngine:
                 pass
             return False
 
+    def store_receipts(self, receipts: List[Dict[str, Any]]) -> bool:
+        """
+        Store several receipts with one multi-row INSERT in one transaction.
+
+        created_at is written as NOW() plus one microsecond per row so that
+        get_last_hash() (ORDER BY created_at) sees the last receipt of the
+        batch as the chain tip, not an arbitrary row sharing the same NOW().
+        """
+        if not receipts:
+            return True
+        if not self.db_url:
+            logger.warning("No database URL configured - receipts not stored")
+            return False
+        conn = _get_db_connection(self.db_url)
+        if not conn:
+            logger.warning("Failed to connect to DB for receipt storage")
+            return False
+        try:
+            retention_until = _retention_until()
+            row_sql = "(" + ", ".join(["%s"] * 17) + ", NOW() + %s * INTERVAL '1 microsecond')"
+            params: list = []
+            for i, receipt in enumerate(receipts):
+                params.extend(self._receipt_row(receipt, retention_until))
+                params.append(i)
+            cur = conn.cursor()
+            cur.execute(f"""
+                INSERT INTO decision_receipts
+                ({_RECEIPT_COLUMNS}, created_at)
+                VALUES {", ".join([row_sql] * len(receipts))}
+                ON CONFLICT (receipt_id) DO NOTHING
+            """, params)
+            conn.commit()
+            cur.close()
+            conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store {len(receipts)} receipts: {e}")
+            try:
+                conn.rollback()
+                conn.close()
+            except Exception:
+                pass
+            return False
+
+    @staticmethod
+    def _receipt_row(receipt: Dict[str, Any], retention_until) -> tuple:
+        return (
+            receipt['receipt_id'],
+            receipt['timestamp'],
+            receipt['asset'],
+            receipt['decision'],
+            json.dumps(receipt['veto_chain']),
+            receipt['policy_version'],
+            receipt['engine_version'],
+            receipt['prev_hash'],
+            receipt['content_hash'],
+            receipt['signature'],
+            receipt['signature_algorithm'],
+            receipt['public_key'],
+            receipt.get('client_id'),
+            receipt.get('encrypted_payload'),
+            retention_until,
+            receipt.get('domain'),
+            receipt.get('processing_time_ms'),
+        )
+
     def get_last_hash(self) -> str:
         if not self.db_url:
             return ""
@@ -358,6 +421,78 @@ class DecisionReceiptEngine:
             return ""
 
 
+class ReceiptBatch:
+    """
+    Receipt engine for one batch of decisions, committed together.
+
+    Drop-in for DecisionReceiptEngine inside an evaluation loop
+    (get_last_hash → generate_receipt → store_receipt), except nothing
+    leaves the process until commit():
+
+      - get_last_hash() reads the DB tip once, then returns the previous
+        receipt of the batch, so receipts are hash-linked in call order
+      - generate_receipt() hashes and signs but does not touch the
+        transparency log
+      - store_receipt() only queues the receipt
+      - commit() writes all queued receipts with one multi-row INSERT and
+        appends them to the transparency log as one contiguous group
+        (one INSERT transaction, see TransparencyChainWriter.submit_many)
+    """
+
+    def __init__(self, engine: Optional[DecisionReceiptEngine] = None):
+        self._engine = engine or DecisionReceiptEngine()
+        self._tip: Optional[str] = None
+        self._generated: List[Dict[str, Any]] = []
+        self._queued: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._queued)
+
+    @property
+    def receipts(self) -> List[Dict[str, Any]]:
+        return list(self._queued)
+
+    def get_last_hash(self) -> str:
+        if self._generated:
+            return self._generated[-1]['content_hash']
+        if self._tip is None:
+            self._tip = self._engine.get_last_hash()
+        return self._tip
+
+    def generate_receipt(self, decision: Dict[str, Any], prev_hash: Optional[str] = None, processing_time_ms: Optional[int] = None) -> Dict[str, Any]:
+        """prev_hash is always the batch tip; the argument is accepted for engine compatibility."""
+        receipt = self._engine.build_receipt(
+            decision, prev_hash=self.get_last_hash(), processing_time_ms=processing_time_ms,
+        )
+        self._generated.append(receipt)
+        return receipt
+
+    def store_receipt(self, receipt: Dict[str, Any]) -> bool:
+        self._queued.append(receipt)
+        return True
+
+    def commit(self) -> bool:
+        """Persist queued receipts and append them to the transparency log."""
+        if not self._queued:
+            return True
+        stored = self._engine.store_receipts(self._queued)
+        try:
+            from omnix_core.evidence.transparency_chain import get_chain_writer
+            get_chain_writer().submit_many([
+                {
+                    'receipt_id':   r['receipt_id'],
+                    'symbol':       r.get('asset', 'UNKNOWN'),
+                    'decision':     r.get('decision', 'UNKNOWN'),
+                    'payload_hash': r.get('content_hash', ''),
+                    'event_type':   'decision',
+                }
+                for r in self._queued
+            ])
+        except Exception as e:
+            logger.debug(f"Transparency chain batch append skipped (non-blocking): {e}")
+        return stored
+
+
 class ReceiptVerifier:
 
     @staticmethod
@@ -127,6 +127,9 @@ CREATE INDEX IF NOT EXISTS idx_execution_receipts_final_status
 
 CREATE INDEX IF NOT EXISTS idx_execution_receipts_created_at
     ON execution_receipts(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_execution_receipts_created_receipt
+    ON execution_receipts(created_at DESC, receipt_id DESC);
 """
 
 # ── Enums ──────────────────────────────────────────────────────────────────────
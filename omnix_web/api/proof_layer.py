@@ -133,6 +133,17 @@ def _fetch_receipt_all_tiers(receipt_id_clean: str) -> "tuple[tuple | None, str
     if not conn:
         return None, None
 
+    # ── Bloom pre-check: IDs never seen in any tier skip the cascade. ─────────
+    # Content-hash lookups (64 hex) are not in the filter and always cascade.
+    if len(receipt_id_clean) != 64:
+        try:
+            from omnix_core.evidence.receipt_locator import get_receipt_locator
+            if not get_receipt_locator().might_exist(conn, receipt_id_clean):
+                conn.close()
+                return None, None
+        except ImportError:
+            pass
+
     try:
         cur = conn.cursor()
 
@@ -35,6 +35,15 @@ import uuid
 from datetime import datetime, timezone
 import re
 
+try:
+    from api.db_pool import get_pg_connection
+except ImportError:
+    from omnix_web.api.db_pool import get_pg_connection
+try:
+    from api import decision_rollups as _rollups
+except ImportError:
+    from omnix_web.api import decision_rollups as _rollups
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -1120,10 +1129,10 @@ def _receipt_archival_loop(
                     "[ARCHIVAL] ✅ Ciclo completo — "
                     "HOT→WARM: %d archivados, %d errores | "
                     "WARM→COLD: %d archivados, %d errores | "
-                    "cold_backend=%s",
+                    "cold_backend=%s modo=%s",
                     hw.get("archived", 0), hw.get("errors", 0),
                     wc.get("archived", 0), wc.get("errors", 0),
-                    summary.get("cold_backend", "?"),
+                    summary.get("cold_backend", "?"), summary.get("mode", "?"),
                 )
         except ImportError as _arch_imp:
             _alog_.debug(
@@ -1157,6 +1166,7 @@ except Exception as _arch_err:
 
 
 def get_db_connection():
+    """Pooled psycopg2 connection ("web" subsystem); conn.close() returns it to the pool."""
     database_url = (
         os.environ.get('DATABASE_URL') or
         os.environ.get('OMNIX_DB_URL') or
@@ -1164,7 +1174,40 @@ def get_db_connection():
     )
     if not database_url:
         return None
-    return psycopg2.connect(database_url, connect_timeout=5)
+    return get_pg_connection('web', database_url, connect_timeout=5)
+
+
+try:
+    if _rollups.start_rollup_loop(get_db_connection):
+        logger.info("[startup] Decision rollup tailer started (analytics read rollups only)")
+except Exception as _rollup_err:
+    logger.warning("[startup] Decision rollup tailer failed to start: %s", _rollup_err)
+
+try:
+    from omnix_core.evidence.merkle_log import start_merkle_loop as _start_merkle_loop
+    if _start_merkle_loop(get_db_connection):
+        logger.info("[startup] Transparency Merkle log builder started (RFC 6962 proofs)")
+except Exception as _merkle_err:
+    logger.warning("[startup] Transparency Merkle log builder failed to start: %s", _merkle_err)
+
+try:
+    from omnix_core.evidence.receipt_locator import start_receipt_bloom_loop as _start_bloom_loop
+    if _start_bloom_loop(get_db_connection):
+        logger.info("[startup] Receipt Bloom filter loop started (negative lookups skip the DB)")
+except Exception as _bloom_err:
+    logger.warning("[startup] Receipt Bloom filter loop failed to start: %s", _bloom_err)
+
+
+def _etag_response(payload: dict, etag: str, max_age: int = 15):
+    """jsonify(payload) with ETag / Cache-Control, or 304 when If-None-Match matches."""
+    if etag and etag in request.headers.get('If-None-Match', ''):
+        resp = app.response_class(status=304)
+    else:
+        resp = jsonify(payload)
+    if etag:
+        resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return resp
 
 
 @app.route('/api/live-metrics', methods=['GET'])
@@ -1193,14 +1236,9 @@ def get_live_metrics():
         cur.execute("SELECT COUNT(*) FROM shadow_trade_events")
         eval_cycles = (cur.fetchone()[0] or 0) + 580581
 
-        cur.execute("SELECT COUNT(*) FROM decision_receipts")
-        receipts = cur.fetchone()[0] or 0
-
-        cur.execute("""
-            SELECT COUNT(*) FROM decision_receipts
-            WHERE decision IN ('BLOCK', 'BLOCKED')
-        """)
-        decisions_blocked = cur.fetchone()[0] or 0
+        by_decision = _rollups.read_decision_counts(cur)
+        receipts = sum(by_decision.values())
+        decisions_blocked = sum(by_decision.get(d, 0) for d in _rollups.BLOCKED_DECISIONS)
 
         cur.execute("""
             SELECT COUNT(*) FROM exit_governance_receipts
@@ -1219,14 +1257,19 @@ def get_live_metrics():
             capital_preserved = 98.42
 
         earliest_dates = []
-        for table in ('shadow_trade_events', 'decision_receipts'):
-            try:
-                cur.execute(f"SELECT MIN(created_at) FROM {table}")
-                row = cur.fetchone()
-                if row and row[0]:
-                    earliest_dates.append(row[0])
-            except Exception as e:
-                logger.debug("[OMNIX.API] best-effort skipped: %s: %s", type(e).__name__, e)
+        try:
+            cur.execute("SELECT MIN(created_at) FROM shadow_trade_events")
+            row = cur.fetchone()
+            if row and row[0]:
+                earliest_dates.append(row[0])
+        except Exception as e:
+            logger.debug("[OMNIX.API] best-effort skipped: %s: %s", type(e).__name__, e)
+        try:
+            first_receipt = _rollups.read_first_created_at(cur)
+            if first_receipt:
+                earliest_dates.append(first_receipt)
+        except Exception as e:
+            logger.debug("[OMNIX.API] best-effort skipped: %s: %s", type(e).__name__, e)
 
         LAUNCH_FALLBACK = datetime(2025, 11, 28, tzinfo=timezone.utc)
         if earliest_dates:
@@ -1240,7 +1283,7 @@ def get_live_metrics():
         cur.close()
         conn.close()
 
-        return jsonify({
+        payload = {
             'success': True,
             'live': True,
             'metrics': {
@@ -1253,7 +1296,8 @@ def get_live_metrics():
                 'system_uptime_days': uptime_days,
             },
             'last_updated': datetime.now(timezone.utc).isoformat()
-        })
+        }
+        return _etag_response(payload, _rollups.payload_etag(payload))
 
     except Exception as e:
         logger.error("[OMNIX.API] [live_metrics] %s: %s", type(e).__name__, e)
@@ -1324,38 +1368,23 @@ def get_metrics_live():
 
         cur = conn.cursor()
 
-        # ── Total receipts and decisions ──────────────────────────────────────
-        cur.execute("SELECT COUNT(*) FROM decision_receipts")
-        receipts_total = int(cur.fetchone()[0] or 0)
-
-        cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE decision IN ('APPROVED','APPROVE','PASS')")
-        approved_total = int(cur.fetchone()[0] or 0)
+        # ── Total receipts and decisions (decision_rollup_* tables) ───────────
+        by_decision = _rollups.read_decision_counts(cur)
+        receipts_total = sum(by_decision.values())
+        approved_total = sum(by_decision.get(d, 0) for d in _rollups.APPROVED_DECISIONS)
+        blocked_hold_total = sum(by_decision.get(d, 0) for d in _rollups.BLOCKED_OR_HOLD_DECISIONS)
+        decisions_today = _rollups.read_today_count(cur)
 
-        cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE decision IN ('BLOCKED','BLOCK','HOLD','REJECT')")
-        blocked_hold_total = int(cur.fetchone()[0] or 0)
-
-        cur.execute("""
-            SELECT COUNT(*) FROM decision_receipts
-            WHERE created_at >= CURRENT_DATE
-        """)
-        decisions_today = int(cur.fetchone()[0] or 0)
-
-        # ── Trading vertical (decision_receipts domain=trading) ───────────────
+        # ── Trading vertical (decision_receipts domain=trading, via rollups) ──
         trading_total = trading_approved = trading_blocked = trading_today = 0
         trading_receipt_id = None
         try:
-            cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE domain='trading'")
-            trading_total = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE domain='trading' AND decision IN ('APPROVED','APPROVE','PASS')")
-            trading_approved = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE domain='trading' AND decision IN ('BLOCKED','BLOCK','HOLD','REJECT')")
-            trading_blocked = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT COUNT(*) FROM decision_receipts WHERE domain='trading' AND created_at >= CURRENT_DATE")
-            trading_today = int(cur.fetchone()[0] or 0)
-            cur.execute("SELECT receipt_id FROM decision_receipts WHERE domain='trading' ORDER BY created_at DESC LIMIT 1")
-            row = cur.fetchone()
-            if row:
-                trading_receipt_id = row[0]
+            trading_by_decision = _rollups.read_decision_counts(cur, domain='trading')
+            trading_total = sum(trading_by_decision.values())
+            trading_approved = sum(trading_by_decision.get(d, 0) for d in _rollups.APPROVED_DECISIONS)
+            trading_blocked = sum(trading_by_decision.get(d, 0) for d in _rollups.BLOCKED_OR_HOLD_DECISIONS)
+            trading_today = _rollups.read_today_count(cur, domain='trading')
+            trading_receipt_id = _rollups.read_last_receipt_id(cur, 'trading')
         except Exception as e:
             logger.debug("[OMNIX.API] best-effort skipped: %s: %s", type(e).__name__, e)
 
@@ -1537,7 +1566,7 @@ def get_metrics_live():
         if decisions_total == 0:
             decisions_total = receipts_total
 
-        return jsonify({
+        payload = {
             'success': True,
             'generated_at': datetime.now(timezone.utc).isoformat(),
             'totals': {
@@ -1693,7 +1722,8 @@ def get_metrics_live():
                 },
             },
             'impact_phrases': IMPACT_PHRASES,
-        })
+        }
+        return _etag_response(payload, _rollups.payload_etag(payload))
 
     except Exception as e:
         logger.error("[OMNIX.API] [metrics/live] fallback: %s: %s", type(e).__name__, e)
@@ -2529,21 +2559,24 @@ def analytics_decisions():
     try:
         cur = conn.cursor()
 
-        cur.execute("SELECT COUNT(*) FROM decision_receipts")
-        total = cur.fetchone()[0] or 0
+        # Served from the decision_rollup_* tables only (see api/decision_rollups.py).
+        # The rollup version changes only when new receipts are folded in, so an
+        # unchanged dashboard is answered with 304 before any aggregation runs.
+        etag = _rollups.rollup_etag(_rollups.read_version(cur), 'analytics-decisions')
+        if etag and etag in request.headers.get('If-None-Match', ''):
+            cur.close()
+            conn.close()
+            return _etag_response({}, etag, max_age=30)
 
-        cur.execute("""
-            SELECT UPPER(decision), COUNT(*) FROM decision_receipts
-            GROUP BY UPPER(decision)
-        """)
         by_decision = {}
-        for row in cur.fetchall():
-            key = row[0]
+        for raw, cnt in _rollups.read_decision_counts(cur).items():
+            key = raw.upper()
             if key in ('BLOCK',):
                 key = 'BLOCKED'
             elif key in ('APPROVE',):
                 key = 'APPROVED'
-            by_decision[key] = by_decision.get(key, 0) + row[1]
+            by_decision[key] = by_decision.get(key, 0) + cnt
+        total = sum(by_decision.values())
 
         approved = by_decision.get('APPROVED', 0)
         blocked = by_decision.get('BLOCKED', 0) + by_decision.get('BLOCK', 0)
@@ -2552,33 +2585,7 @@ def analytics_decisions():
         def _pct(n):
             return round(n / total * 100, 1) if total > 0 else 0.0
 
-        cur.execute("""
-            SELECT domain, COUNT(*) FROM decision_receipts
-            WHERE domain IS NOT NULL
-            GROUP BY domain ORDER BY COUNT(*) DESC LIMIT 10
-        """)
-        by_domain = {row[0]: row[1] for row in cur.fetchall()}
-
-        cur.execute("""
-            SELECT veto_chain FROM decision_receipts
-            WHERE decision IN ('BLOCK','BLOCKED') AND veto_chain IS NOT NULL
-            ORDER BY created_at DESC LIMIT 2000
-        """)
-        import json as _json
-        cp_block_counts: dict = {}
-        for (vc_raw,) in cur.fetchall():
-            try:
-                entries = _json.loads(vc_raw) if isinstance(vc_raw, str) else (vc_raw or [])
-                for entry in entries:
-                    txt = str(entry)
-                    if 'BLOCKED' in txt.upper() or 'VETO' in txt.upper():
-                        import re as _re
-                        m = _re.search(r'CP-(\d+)', txt)
-                        if m:
-                            cp_key = f'CP-{m.group(1)}'
-                            cp_block_counts[cp_key] = cp_block_counts.get(cp_key, 0) + 1
-            except Exception as e:
-                logger.debug("[OMNIX.API] best-effort skipped: %s: %s", type(e).__name__, e)
+        by_domain = _rollups.read_domain_counts(cur, limit=10)
 
         _cp_labels = {
             'CP-1': 'Signal Integrity Validator',
@@ -2593,22 +2600,13 @@ def analytics_decisions():
             'CP-10': 'Fraud Detection',
             'CP-11': 'Jurisdiction Compliance',
         }
-        top_blocking = sorted(cp_block_counts.items(), key=lambda x: x[1], reverse=True)[:5]
         top_blocking_out = [
             {'checkpoint': k, 'name': _cp_labels.get(k, k), 'block_count': v}
-            for k, v in top_blocking
+            for k, v in _rollups.read_top_blocking_checkpoints(cur, limit=5)
         ]
 
-        cur.execute("""
-            SELECT DATE_TRUNC('day', created_at)::date, UPPER(decision), COUNT(*)
-            FROM decision_receipts
-            WHERE created_at >= NOW() - INTERVAL '30 days'
-            GROUP BY 1, 2
-            ORDER BY 1
-        """)
-        trend_raw = cur.fetchall()
         trend: dict = {}
-        for (day, dec, cnt) in trend_raw:
+        for (day, dec, cnt) in _rollups.read_daily_trend(cur, days=30):
             day_str = str(day)
             if day_str not in trend:
                 trend[day_str] = {'date': day_str, 'approved': 0, 'blocked': 0, 'hold': 0}
@@ -2619,16 +2617,12 @@ def analytics_decisions():
             elif dec == 'HOLD':
                 trend[day_str]['hold'] += cnt
 
-        cur.execute("""
-            SELECT COUNT(DISTINCT client_id) FROM decision_receipts
-            WHERE client_id IS NOT NULL AND client_id != 'PUBLIC'
-        """)
-        b2b_clients_active = cur.fetchone()[0] or 0
+        b2b_clients_active = _rollups.read_active_client_count(cur)
 
         cur.close()
         conn.close()
 
-        return jsonify({
+        payload = {
             'live': True,
             'generated_at': datetime.now(timezone.utc).isoformat(),
             'total_decisions': total,
@@ -2640,7 +2634,8 @@ def analytics_decisions():
             'top_blocking_checkpoints': top_blocking_out,
             'trend_30d': sorted(trend.values(), key=lambda x: x['date']),
             'b2b_clients_active': b2b_clients_active,
-        })
+        }
+        return _etag_response(payload, etag or _rollups.payload_etag(payload), max_age=30)
 
     except Exception as e:
         logger.error("[OMNIX.API] [analytics_decisions] %s: %s", type(e).__name__, e)
@@ -3361,6 +3356,57 @@ def _build_integrity_block(
     return block
 
 
+def _merkle_log():
+    from omnix_core.evidence.merkle_log import MerkleTransparencyLog
+    return MerkleTransparencyLog(get_db_connection)
+
+
+def _transparency_proof_block(receipt_id):
+    """
+    ADR-044: compact RFC 6962 inclusion proof for the receipt's transparency
+    log entry — leaf, audit path and the signed tree head it resolves to.
+    status: INCLUDED | PENDING (logged, next tree head not built yet) |
+    NOT_LOGGED | UNAVAILABLE.
+    """
+    try:
+        proof = _merkle_log().get_inclusion_proof(receipt_id)
+    except Exception as _proof_err:
+        logger.debug("[server] transparency proof error: %s", _proof_err)
+        proof = None
+    return proof or {'status': 'UNAVAILABLE'}
+
+
+@app.route('/api/public/transparency/sth', methods=['GET'])
+def public_transparency_tree_head():
+    """Latest signed tree head, or the one for ?tree_size=N."""
+    try:
+        size = request.args.get('tree_size', type=int)
+        sth = _merkle_log().get_tree_head(size)
+    except Exception as e:
+        logger.error("[OMNIX.API] [public_transparency_tree_head] %s: %s", type(e).__name__, e)
+        sth = None
+    if not sth:
+        return jsonify({'found': False}), 404
+    return jsonify(sth)
+
+
+@app.route('/api/public/transparency/consistency', methods=['GET'])
+def public_transparency_consistency():
+    """Consistency proof ?old_size=M[&new_size=N] (N defaults to the latest tree head)."""
+    old_size = request.args.get('old_size', type=int)
+    new_size = request.args.get('new_size', type=int)
+    if not old_size or old_size < 1 or (new_size is not None and new_size < old_size):
+        return jsonify({'error': 'old_size must be >= 1 and <= new_size'}), 400
+    try:
+        proof = _merkle_log().get_consistency_proof(old_size, new_size)
+    except Exception as e:
+        logger.error("[OMNIX.API] [public_transparency_consistency] %s: %s", type(e).__name__, e)
+        proof = None
+    if not proof:
+        return jsonify({'found': False}), 404
+    return jsonify(proof)
+
+
 @app.route('/api/public/verify/<path:receipt_id>', methods=['GET'])
 def public_verify_receipt(receipt_id):
     import json as _json
@@ -3515,6 +3561,7 @@ def public_verify_receipt(receipt_id):
         'schema_url':             'https://omnixquantum.net/schemas/omnix-receipt-schema-v6.5.4e.json',
         'context_url':            'https://omnixquantum.net/schemas/omnix-receipt-v1.jsonld',
         'vc_endpoint':            f'https://omnixquantum.net/api/governance/receipt/vc',
+        'transparency_proof':     _transparency_proof_block(rid),
     }
     if jurisdiction_semantics:
         response_body['jurisdiction_semantics'] = jurisdiction_semantics
@@ -26,6 +26,13 @@ Usage — COLD Archive Block (ADR-163 / EAP-INV-005):
                                --public-key omnix_public_key.b64 \\
                                --verify-chain \\
                                --predecessor-block OMNIX-BLOCK-20260514-000000.json
+    # v2 blocks (sha256-merkle-v2): the proofs sidecar next to the block is
+    # picked up automatically; --proofs overrides its location
+    python omnix_atf_verify.py --archive-block OMNIX-BLOCK-20260514-000002.json \\
+                               --proofs OMNIX-BLOCK-20260514-000002.proofs.jsonl
+    # Prove ONE artifact is in a v2 block (O(log n) hashes, no other artifacts)
+    python omnix_atf_verify.py --archive-block OMNIX-BLOCK-20260514-000002.json \\
+                               --artifact-proof artifact_proof.json
 
 Usage — Batch replay:
     python omnix_atf_verify.py --mode replay
@@ -73,7 +80,7 @@ import sys
 import argparse
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 VERIFIER_VERSION = "1.1.0"
 VERIFIER_PROTOCOL = "RFC-ATF-1 + RFC-ATF-2 + ADR-162/163"
@@ -131,6 +138,7 @@ BLOCK_BANNER = f"""{BOLD}{CYAN}
 BLOCK_ID_PATTERN     = re.compile(r"^OMNIX-BLOCK-\d{8}-\d{6}$")
 GENESIS_PREDECESSOR  = "0" * 64
 HASH_ALGORITHM_V1    = "sha256-v1"
+HASH_ALGORITHM_V2    = "sha256-merkle-v2"
 PQC_ALGORITHM_LABEL  = "ML-DSA-65 (FIPS 204)"
 
 IMMUTABLE_EVIDENCE_CLASSES = {"LEGAL", "PQC", "CONTRACT", "EXCEPTION"}
@@ -187,6 +195,102 @@ def _compute_merkle_root(artifact_hashes: List[str]) -> str:
     return _sha256_prefixed(combined.encode("utf-8"))
 
 
+def _merkle_leaf_v2(content_hash: str) -> bytes:
+    """v2 leaf: SHA-256(0x00 || content_hash) — RFC 6962 §2.1."""
+    return hashlib.sha256(b"\x00" + content_hash.encode("utf-8")).digest()
+
+
+def _merkle_node_v2(left: bytes, right: bytes) -> bytes:
+    """v2 interior node: SHA-256(0x01 || left || right) — RFC 6962 §2.1."""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _compute_merkle_root_v2(artifact_hashes: Iterable[str]) -> str:
+    """
+    v2 Merkle root: RFC 6962 binary tree over artifact content hashes in
+    seal order, built incrementally (only log2(n) digests are kept).
+    """
+    stack: List[Tuple[int, bytes]] = []
+    for h in artifact_hashes:
+        size, digest = 1, _merkle_leaf_v2(h)
+        while stack and stack[-1][0] == size:
+            size, digest = size * 2, _merkle_node_v2(stack.pop()[1], digest)
+        stack.append((size, digest))
+    if not stack:
+        return _sha256_prefixed(b"OMNIX-EMPTY-BLOCK")
+    acc = stack[-1][1]
+    for _, digest in reversed(stack[:-1]):
+        acc = _merkle_node_v2(digest, acc)
+    return "sha256:" + acc.hex()
+
+
+def _root_from_audit_path(
+    content_hash: str, leaf_index: int, tree_size: int, audit_path: List[str],
+) -> Optional[str]:
+    """
+    Recompute the v2 Merkle root from one artifact's audit path
+    (RFC 9162 §2.1.3.2). None if the path does not fit the tree shape.
+    """
+    if not 0 <= leaf_index < tree_size:
+        return None
+    fn, sn, r = leaf_index, tree_size - 1, _merkle_leaf_v2(content_hash)
+    try:
+        for p in audit_path:
+            if sn == 0:
+                return None
+            sibling = bytes.fromhex(p)
+            if fn & 1 or fn == sn:
+                r = _merkle_node_v2(sibling, r)
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                r = _merkle_node_v2(r, sibling)
+            fn >>= 1
+            sn >>= 1
+    except (TypeError, ValueError):
+        return None
+    return "sha256:" + r.hex() if sn == 0 else None
+
+
+def _check_v2_proofs(
+    proofs: Iterable[Dict[str, Any]], stored_merkle: str, tree_size: int,
+) -> Tuple[str, int, List[str]]:
+    """
+    Stream a v2 proofs file: recompute the root from the content hashes in
+    order and check every audit path against the stored root.
+    Returns (recomputed_root, proof_count, problems).
+    """
+    problems: List[str] = []
+    count = 0
+
+    def _hashes() -> Iterator[str]:
+        nonlocal count
+        for idx, proof in enumerate(proofs):
+            content_hash = str(proof.get("content_hash", ""))
+            if proof.get("leaf_index") != idx:
+                problems.append(f"proof line {idx}: leaf_index {proof.get('leaf_index')!r} out of order")
+            elif _root_from_audit_path(
+                content_hash, idx, tree_size, proof.get("audit_path") or []
+            ) != stored_merkle:
+                problems.append(
+                    f"artifact {proof.get('artifact_id', idx)}: audit path does not resolve to merkle_root"
+                )
+            count += 1
+            yield content_hash
+
+    recomputed = _compute_merkle_root_v2(_hashes())
+    return recomputed, count, problems
+
+
+def _load_block_proofs(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily read a v2 {block_id}.proofs.jsonl sidecar, one proof per line."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 def _compute_block_canonical_hash(block: Dict[str, Any]) -> str:
     """
     Compute the canonical_hash of a COLD archive block.
@@ -590,11 +694,15 @@ class ArchiveBlockResult:
     failure_reasons:       List[str]
     warnings:              List[str]
 
+    # v2 blocks verified without their proofs file skip Steps 2 and 6
+    merkle_checked:        bool = True
+
 
 def verify_archive_block(
     block: Dict[str, Any],
     public_key_b64: Optional[str] = None,
     predecessor_block: Optional[Dict[str, Any]] = None,
+    proofs: Optional[Iterable[Dict[str, Any]]] = None,
 ) -> ArchiveBlockResult:
     """
     Verify a COLD archive block (ADR-163 §3, EAP-INV-001–006).
@@ -609,6 +717,9 @@ def verify_archive_block(
                            If None, PQC signature step is skipped.
         predecessor_block: Parsed predecessor block dict (for --verify-chain).
                            If None, genesis block assumption is tested.
+        proofs:            v2 blocks only — the {block_id}.proofs.jsonl rows,
+                           in order (any iterable; consumed once). If None,
+                           the Merkle root is not recomputed (warning only).
 
     Returns:
         ArchiveBlockResult with overall verdict and per-step results.
@@ -639,16 +750,41 @@ def verify_archive_block(
         )
 
     # ── Validation 1: Hash algorithm ────────────────────────────────────────
-    if hash_algorithm != HASH_ALGORITHM_V1:
+    is_v2 = hash_algorithm == HASH_ALGORITHM_V2
+    if hash_algorithm not in (HASH_ALGORITHM_V1, HASH_ALGORITHM_V2):
         warnings.append(
             f"Hash algorithm '{hash_algorithm}' is not the canonical '{HASH_ALGORITHM_V1}'"
+            f" or '{HASH_ALGORITHM_V2}'"
         )
 
     # ── Step 2: Recompute Merkle root ───────────────────────────────────────
-    recomputed_merkle = _compute_merkle_root(artifact_hashes)
-    merkle_valid      = (recomputed_merkle == stored_merkle)
+    merkle_checked = True
+    proof_problems: List[str] = []
+    if is_v2 and proofs is None:
+        merkle_checked    = False
+        recomputed_merkle = ""
+        merkle_valid      = False
+        warnings.append(
+            "v2 block verified without its proofs file — Merkle root not recomputed.\n"
+            "   Provide --proofs (whole block) or --artifact-proof (one artifact)."
+        )
+    elif is_v2:
+        recomputed_merkle, proof_count, proof_problems = _check_v2_proofs(
+            proofs, stored_merkle, artifact_count
+        )
+        artifact_hashes = [""] * proof_count   # Step 6 compares the count only
+        merkle_valid = (recomputed_merkle == stored_merkle) and not proof_problems
+    else:
+        recomputed_merkle = _compute_merkle_root(artifact_hashes)
+        merkle_valid      = (recomputed_merkle == stored_merkle)
 
-    if not merkle_valid:
+    if proof_problems:
+        failure_reasons.append(
+            "EAP-INV-001 VIOLATION — Artifact audit paths invalid\n   "
+            + "\n   ".join(proof_problems[:5])
+            + (f"\n   … and {len(proof_problems) - 5} more" if len(proof_problems) > 5 else "")
+        )
+    elif merkle_checked and not merkle_valid:
         failure_reasons.append(
             f"EAP-INV-001 VIOLATION — Merkle root mismatch\n"
             f"   Stored:     {stored_merkle}\n"
@@ -736,7 +872,7 @@ def verify_archive_block(
             )
 
     # ── Step 6: Artifact hash count integrity ───────────────────────────────
-    artifact_hashes_valid = (len(artifact_hashes) == artifact_count)
+    artifact_hashes_valid = (len(artifact_hashes) == artifact_count) or not merkle_checked
     if not artifact_hashes_valid:
         failure_reasons.append(
             f"EAP-INV-001 VIOLATION — Artifact count mismatch\n"
@@ -786,9 +922,32 @@ def verify_archive_block(
         block_id_format_valid=block_id_valid,
         failure_reasons=failure_reasons,
         warnings=warnings,
+        merkle_checked=merkle_checked,
     )
 
 
+def verify_artifact_proof(block: Dict[str, Any], proof: Dict[str, Any]) -> Tuple[bool, str]:
+    """
+    Verify that one artifact is sealed in a v2 COLD block, from its line in
+    {block_id}.proofs.jsonl alone. Trust in the result rests on the block's
+    canonical hash and ML-DSA-65 signature — run verify_archive_block too.
+    """
+    manifest = block.get("integrity_manifest", {})
+    if manifest.get("hash_algorithm") != HASH_ALGORITHM_V2:
+        return False, "Per-artifact proofs require a sha256-merkle-v2 block"
+    root = _root_from_audit_path(
+        str(proof.get("content_hash", "")),
+        int(proof.get("leaf_index", -1)),
+        int(block.get("artifact_count", 0)),
+        proof.get("audit_path") or [],
+    )
+    if root is not None and root == manifest.get("merkle_root"):
+        return True, (f"Artifact {proof.get('artifact_id', '?')} is leaf {proof.get('leaf_index')} "
+                      f"of {block.get('artifact_count')} ({len(proof.get('audit_path') or [])} hashes)")
+    return False, (f"Audit path for artifact {proof.get('artifact_id', '?')} does NOT resolve "
+                   f"to the block merkle_root")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Terminal output helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -886,10 +1045,14 @@ def _print_block_result(res: ArchiveBlockResult, verbose: bool = False) -> None:
     print()
 
     # Step 2 — Merkle root
-    print(f"{BOLD}  Step 2 — Merkle Root (artifact_hashes){RESET}")
-    print(_ok("Merkle root valid") if res.merkle_valid
-          else _fail("Merkle root MISMATCH — artifact hashes were modified"))
-    if verbose or not res.merkle_valid:
+    source = "audit paths" if res.hash_algorithm == HASH_ALGORITHM_V2 else "artifact_hashes"
+    print(f"{BOLD}  Step 2 — Merkle Root ({source}){RESET}")
+    if not res.merkle_checked:
+        print(_skip("Merkle root not recomputed — provide --proofs to enable"))
+    else:
+        print(_ok("Merkle root valid") if res.merkle_valid
+              else _fail("Merkle root MISMATCH — artifact hashes were modified"))
+    if res.merkle_checked and (verbose or not res.merkle_valid):
         print(f"{GRAY}             Stored:     {res.merkle_stored}{RESET}")
         print(f"{GRAY}             Recomputed: {res.merkle_recomputed}{RESET}")
 
@@ -925,10 +1088,13 @@ def _print_block_result(res: ArchiveBlockResult, verbose: bool = False) -> None:
 
     # Step 6 — Artifact hash count
     print(f"\n{BOLD}  Step 6 — Artifact Count Integrity{RESET}")
-    print(_ok(f"Artifact count consistent ({res.artifact_hashes_count} hashes in manifest)")
-          if res.artifact_hashes_valid
-          else _fail(f"Artifact count MISMATCH — declared {res.artifact_count},"
-                     f" manifest has {res.artifact_hashes_count}"))
+    if not res.merkle_checked:
+        print(_skip("Artifact count not checked — provide --proofs to enable"))
+    else:
+        print(_ok(f"Artifact count consistent ({res.artifact_hashes_count} hashes in manifest)")
+              if res.artifact_hashes_valid
+              else _fail(f"Artifact count MISMATCH — declared {res.artifact_count},"
+                         f" manifest has {res.artifact_hashes_count}"))
 
     # Format check
     if not res.block_id_format_valid:
@@ -1074,6 +1240,18 @@ def main() -> int:
         metavar="PREDECESSOR_FILE",
         help="Path to predecessor COLD archive block JSON",
     )
+    parser.add_argument(
+        "--proofs",
+        dest="proofs",
+        metavar="PROOFS_FILE",
+        help="v2 blocks: path to {block_id}.proofs.jsonl (default: next to the block)",
+    )
+    parser.add_argument(
+        "--artifact-proof",
+        dest="artifact_proof",
+        metavar="PROOF_FILE",
+        help="v2 blocks: one artifact's proof (a line of the proofs file) to verify",
+    )
 
     args = parser.parse_args()
 
@@ -1129,7 +1307,40 @@ def main() -> int:
                 print(f"{RED}ERROR: Invalid JSON in predecessor: {exc}{RESET}", file=sys.stderr)
                 return 2
 
-        result = verify_archive_block(block, public_key_b64, predecessor_block)
+        # v2 proofs sidecar — streamed, never loaded whole
+        proofs_path: Optional[str] = args.proofs
+        manifest = block.get("integrity_manifest", {})
+        if (proofs_path is None and manifest.get("hash_algorithm") == HASH_ALGORITHM_V2
+                and not args.artifact_proof):
+            candidate = os.path.join(os.path.dirname(os.path.abspath(block_file)),
+                                     manifest.get("proofs_file") or "")
+            if manifest.get("proofs_file") and os.path.exists(candidate):
+                proofs_path = candidate
+        if proofs_path and not os.path.exists(proofs_path):
+            print(f"{RED}ERROR: Proofs file not found: {proofs_path}{RESET}", file=sys.stderr)
+            return 2
+
+        artifact_proof: Optional[Dict] = None
+        if args.artifact_proof:
+            try:
+                with open(args.artifact_proof) as f:
+                    artifact_proof = json.load(f)
+            except (OSError, json.JSONDecodeError) as exc:
+                print(f"{RED}ERROR: Cannot read artifact proof: {exc}{RESET}", file=sys.stderr)
+                return 2
+
+        try:
+            result = verify_archive_block(
+                block, public_key_b64, predecessor_block,
+                proofs=_load_block_proofs(proofs_path) if proofs_path else None,
+            )
+        except json.JSONDecodeError as exc:
+            print(f"{RED}ERROR: Invalid JSON in proofs file: {exc}{RESET}", file=sys.stderr)
+            return 2
+
+        proof_ok, proof_msg = (verify_artifact_proof(block, artifact_proof)
+                               if artifact_proof is not None else (True, ""))
+        passed = result.verdict == VERDICT_PASS and proof_ok
 
         if args.json_output:
             out = {
@@ -1149,13 +1360,21 @@ def main() -> int:
                 "block_id_format_valid": result.block_id_format_valid,
                 "failure_reasons":       result.failure_reasons,
                 "warnings":              result.warnings,
+                "hash_algorithm":        result.hash_algorithm,
+                "merkle_checked":        result.merkle_checked,
             }
+            if artifact_proof is not None:
+                out["artifact_proof"] = {"valid": proof_ok, "message": proof_msg}
             print(json.dumps(out, indent=2))
-            return 0 if result.verdict == VERDICT_PASS else 1
+            return 0 if passed else 1
 
         _print_block_result(result, verbose=args.verbose)
+        if artifact_proof is not None:
+            print(f"{BOLD}  Artifact Proof (v2 audit path){RESET}")
+            print(_ok(proof_msg) if proof_ok else _fail(proof_msg))
+            print()
         print(ATF_FOOTER)
-        return 0 if result.verdict == VERDICT_PASS else 1
+        return 0 if passed else 1
 
     # ── Replay mode ──────────────────────────────────────────────────────────
     if args.mode == "replay":
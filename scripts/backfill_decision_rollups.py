@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+OMNIX Decision Rollup Backfill
+==============================
+Rebuilds the decision-analytics rollup tables (decision_rollup_*) from the
+receipt history in decision_receipts plus the PostgreSQL WARM / COLD archive
+tables, then leaves the tail watermark where the live tailing job picks up.
+
+Safe to run while the API is serving: the rebuild is one REPEATABLE READ
+transaction holding the rollup state row, so the tailing loop waits for it
+and dashboards keep reading the previous rollups until it commits.
+
+Usage:
+    python scripts/backfill_decision_rollups.py
+    python scripts/backfill_decision_rollups.py --batch-size 20000 --json
+    python scripts/backfill_decision_rollups.py --tail-only   # just catch up
+
+Run on Railway using:
+    railway run python scripts/backfill_decision_rollups.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "omnix_web"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild decision-analytics rollups from history")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Receipts per fetch / upsert")
+    parser.add_argument("--tail-only", action="store_true",
+                        help="Do not rebuild; fold receipts past the watermark and exit")
+    parser.add_argument("--json", action="store_true", help="Output the summary as JSON")
+    args = parser.parse_args()
+
+    db_url = os.environ.get("DATABASE_URL") or os.environ.get("OMNIX_DB_URL")
+    if not db_url:
+        print("[ERROR] DATABASE_URL is not set")
+        return 1
+
+    try:
+        import psycopg2
+        from api.decision_rollups import DecisionRollupTailer
+    except Exception as exc:
+        print(f"[ERROR] rollup backfill unavailable: {exc}")
+        return 1
+
+    tailer = DecisionRollupTailer(lambda: psycopg2.connect(db_url), batch_size=args.batch_size)
+    if args.tail_only:
+        summary = {"tailed": tailer.catch_up(max_batches=1_000_000)}
+    else:
+        summary = tailer.backfill()
+        summary["tailed_after"] = tailer.catch_up()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>14}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+OMNIX — Anti-Replay Store Contention Benchmark
+==============================================
+Measures in-memory AntiReplayStore registration throughput and per-call
+latency (p50 / p99) with many threads registering distinct receipt ids
+against a store already holding --prefill live entries.
+
+  full_scan  : Phase 1 layout — one global lock, every registration scans
+               the whole dict for expired entries (reference baseline)
+  shards=1   : timing-wheel expiry, single lock
+  shards=N   : timing-wheel expiry, N lock-striped shards
+
+Usage:
+    python scripts/bench_anti_replay.py
+    python scripts/bench_anti_replay.py --threads 16 32 64 --shards 16 64 --json
+    python scripts/bench_anti_replay.py --prefill 50000 --per-thread 500
+
+ADR-076 / ADR-077 — Anti-Replay Guard
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _FullScanStore:
+    """Phase 1 algorithm, kept here only as the benchmark baseline."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._store: dict = {}
+
+    def check_and_register(self, receipt_id: str, ttl_ms: int) -> None:
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            for k in [k for k, exp in self._store.items() if exp <= now_ms]:
+                del self._store[k]
+            if self._store.get(receipt_id, 0) > now_ms:
+                raise RuntimeError("replay")
+            self._store[receipt_id] = now_ms + ttl_ms
+
+
+def _percentiles(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100.0))], 4)
+
+    return {"p50_ms": pct(50), "p99_ms": pct(99), "max_ms": round(ordered[-1], 4)}
+
+
+def _run(store, threads: int, per_thread: int, tag: str) -> dict:
+    barrier = threading.Barrier(threads + 1)
+    samples: list = [None] * threads
+
+    def worker(t: int) -> None:
+        ids = [f"OMNIX-BENCH-{tag}-{t}-{i}" for i in range(per_thread)]
+        local = []
+        barrier.wait()
+        for rid in ids:
+            t0 = time.perf_counter()
+            store.check_and_register(rid, 60_000)
+            local.append((time.perf_counter() - t0) * 1000.0)
+        samples[t] = local
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for th in pool:
+        th.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for th in pool:
+        th.join()
+    elapsed = time.perf_counter() - t0
+
+    flat = [s for chunk in samples for s in chunk]
+    return {"ops_per_sec": round(len(flat) / elapsed, 1), **_percentiles(flat)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Anti-replay store contention benchmark")
+    parser.add_argument("--threads", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--prefill", type=int, default=20000, help="Live entries before the run")
+    parser.add_argument("--per-thread", type=int, default=200, help="Registrations per thread")
+    parser.add_argument("--skip-baseline", action="store_true", help="Do not run the full-scan baseline")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    try:
+        from omnix_core.evidence import anti_replay
+    except Exception as exc:
+        print(f"[ERROR] anti-replay store unavailable: {exc}")
+        return 1
+    anti_replay.MAX_STORE_SIZE = max(anti_replay.MAX_STORE_SIZE,
+                                     2 * (args.prefill + max(args.threads) * args.per_thread))
+
+    layouts = [] if args.skip_baseline else [("full_scan", _FullScanStore)]
+    layouts += [(f"shards={n}", lambda n=n: anti_replay._InMemoryStore(shards=n)) for n in args.shards]
+
+    results: dict = {}
+    for name, factory in layouts:
+        results[name] = {}
+        for threads in args.threads:
+            store = factory()
+            for i in range(args.prefill):
+                store.check_and_register(f"OMNIX-BENCH-PREFILL-{i}", 600_000)
+            results[name][str(threads)] = _run(store, threads, args.per_thread, name)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, by_threads in results.items():
+            for threads, r in by_threads.items():
+                print(f"{name:<10} threads={threads:>3}  {r['ops_per_sec']:>11.1f} ops/s  "
+                      f"p50={r['p50_ms']:>8.4f}ms  p99={r['p99_ms']:>8.4f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+OMNIX — Governance API Auth-Path Benchmark
+==========================================
+Measures gov_auth_rbac.authenticate_client() latency (p50 / p95 / p99) with
+the in-process auth cache disabled and enabled, against the real
+b2b_clients table.
+
+  cache off : every call borrows a connection and runs the hash lookup
+  cache on  : first call per key hits the DB, the rest are served in-process
+
+Both a valid key and an unknown key (negative cache) are measured.
+
+Usage:
+    DATABASE_URL=... python scripts/bench_auth_cache.py --api-key OMNIX-xxxx
+    DATABASE_URL=... python scripts/bench_auth_cache.py --api-key OMNIX-xxxx -n 2000 --json
+
+ADR-052 — API Key Expiry
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _percentiles(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100.0))], 3)
+
+    return {"p50_ms": pct(50), "p95_ms": pct(95), "p99_ms": pct(99), "max_ms": round(ordered[-1], 3)}
+
+
+def _run(rbac, api_key: str, n: int) -> dict:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        rbac.authenticate_client(api_key)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return _percentiles(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Auth-path latency benchmark")
+    parser.add_argument("--api-key", required=True, help="A valid B2B API key")
+    parser.add_argument("-n", "--iterations", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("[ERROR] DATABASE_URL is required")
+        return 1
+
+    from omnix_web.api import gov_auth_rbac as rbac
+
+    if rbac.authenticate_client(args.api_key) is None:
+        print("[ERROR] --api-key did not authenticate")
+        return 1
+
+    configured_ttl = rbac._auth_cache.ttl_s or 30.0
+    results = {}
+    for mode, ttl in (("cache_off", 0.0), ("cache_on", configured_ttl)):
+        rbac._auth_cache.ttl_s = ttl
+        rbac.clear_auth_cache()
+        results[mode] = {
+            "valid_key": _run(rbac, args.api_key, args.iterations),
+            "unknown_key": _run(rbac, "OMNIX-bench-unknown-key", args.iterations),
+        }
+    results["cache_stats"] = rbac.get_auth_cache_stats()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for mode in ("cache_off", "cache_on"):
+            for kind in ("valid_key", "unknown_key"):
+                r = results[mode][kind]
+                print(f"{mode:<10} {kind:<12} p50={r['p50_ms']:>8.3f}ms  "
+                      f"p95={r['p95_ms']:>8.3f}ms  p99={r['p99_ms']:>8.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
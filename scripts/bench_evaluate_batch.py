@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+OMNIX — Batch Governance Evaluation Benchmark
+=============================================
+Measures GovernanceEvaluationEngine throughput (rows/sec) for the scalar
+path — one evaluate() call per signal dict — against evaluate_batch() on
+the same rows supplied as columns.
+
+By default Layer 0, AVM, CAG and TIE are switched off so the numbers isolate
+the 11-checkpoint grid that evaluate_batch() vectorizes. --full-pipeline runs
+every stage; those stages execute per row in both paths, so the gap narrows.
+
+Usage:
+    python scripts/bench_evaluate_batch.py
+    python scripts/bench_evaluate_batch.py --rows 1000 10000 50000 --json
+    python scripts/bench_evaluate_batch.py --full-pipeline
+
+ADR-028 — External Signal Evaluation API
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _rows(n: int, signals: list, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [{name: rng.uniform(20.0, 100.0) for name in signals} for _ in range(n)]
+
+
+def _rate(n: int, fn) -> dict:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    return {"seconds": round(elapsed, 4), "rows_per_sec": round(n / elapsed, 1) if elapsed else None}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Batch governance evaluation throughput")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--full-pipeline", action="store_true",
+                        help="Keep Layer 0 / AVM / CAG / TIE enabled (per-row stages)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    os.environ.setdefault("TESTING", "true")
+    if not args.full_pipeline:
+        for var in ("SAE_ENABLED", "AVM_ENABLED", "CAG_ENABLED", "TIE_ENABLED"):
+            os.environ[var] = "false"
+    logging.disable(logging.WARNING)
+
+    try:
+        import numpy as np
+
+        from omnix_core.governance.external_evaluator import (
+            OPTIONAL_SIGNAL_DEFAULTS,
+            REQUIRED_SIGNALS,
+            GovernanceEvaluationEngine,
+        )
+    except Exception as exc:
+        print(f"[ERROR] evaluator unavailable: {exc}")
+        return 1
+
+    signals = REQUIRED_SIGNALS + list(OPTIONAL_SIGNAL_DEFAULTS)
+    engine = GovernanceEvaluationEngine()
+    results = {"full_pipeline": args.full_pipeline, "runs": []}
+
+    for n in args.rows:
+        rows = _rows(n, signals)
+        columns = {name: np.array([r[name] for r in rows]) for name in signals}
+        engine.evaluate_batch({k: v[:10] for k, v in columns.items()})   # warm-up
+
+        scalar = _rate(n, lambda: [engine.evaluate(r, "BENCH") for r in rows])
+        batch = _rate(n, lambda: engine.evaluate_batch(columns, "BENCH"))
+        speedup = (
+            round(batch["rows_per_sec"] / scalar["rows_per_sec"], 2)
+            if batch["rows_per_sec"] and scalar["rows_per_sec"] else None
+        )
+        results["runs"].append({"rows": n, "scalar": scalar, "batch": batch, "speedup": speedup})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        mode = "full pipeline" if args.full_pipeline else "checkpoint grid (Layer 0/AVM/CAG/TIE off)"
+        print(f"GovernanceEvaluationEngine throughput — {mode}")
+        print(f"{'rows':>8}  {'scalar rows/s':>14}  {'batch rows/s':>13}  {'speedup':>8}")
+        for run in results["runs"]:
+            print(
+                f"{run['rows']:>8}  {run['scalar']['rows_per_sec']:>14,.0f}  "
+                f"{run['batch']['rows_per_sec']:>13,.0f}  {run['speedup']:>7}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
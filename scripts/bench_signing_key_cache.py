@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+OMNIX — Signing-Key Cache Benchmark
+===================================
+Measures signatures/sec on the hot signing path before and after the
+process-wide signing-key cache (crypto_providers.get_signing_key).
+
+  before : a fresh keypair is generated for every signature
+           (the former TransparencyChain._sign_entry fallback behaviour)
+  after  : the key is resolved once and reused from the cache
+
+Usage:
+    python scripts/bench_signing_key_cache.py             # 200 signatures per mode
+    python scripts/bench_signing_key_cache.py -n 1000     # custom iteration count
+    python scripts/bench_signing_key_cache.py --json      # machine-readable output
+
+ADR-078 — Production Signing Key Persistence
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _payload(i: int) -> bytes:
+    return json.dumps({"seq": i, "decision": "ALLOW", "domain": "bench"}, sort_keys=True).encode()
+
+
+def bench_keypair_per_sign(provider, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        _pk, sk = provider.generate_keypair()
+        provider.sign(_payload(i), sk)
+    return n / (time.perf_counter() - start)
+
+
+def bench_cached_key(provider, n: int) -> float:
+    from omnix_core.security.crypto_providers import get_signing_key, reset_signing_key_cache
+
+    reset_signing_key_cache()
+    start = time.perf_counter()
+    for i in range(n):
+        key = get_signing_key(provider.provider_id(), allow_ephemeral=True)
+        provider.sign(_payload(i), key.secret_key)
+    return n / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Signing-key cache benchmark")
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    from omnix_core.security.crypto_providers import get_active_provider
+
+    provider = get_active_provider()
+    if provider.generate_keypair() is None:
+        print(f"[ERROR] provider '{provider.provider_id()}' backend unavailable — install the PQC library")
+        return 1
+    before = bench_keypair_per_sign(provider, args.iterations)
+    after = bench_cached_key(provider, args.iterations)
+    result = {
+        "provider": provider.provider_id(),
+        "iterations": args.iterations,
+        "keypair_per_sign_sigs_per_sec": round(before, 1),
+        "cached_key_sigs_per_sec": round(after, 1),
+        "speedup": round(after / before, 2) if before else None,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Provider               : {result['provider']}")
+        print(f"Iterations             : {result['iterations']}")
+        print(f"Keypair per signature  : {result['keypair_per_sign_sigs_per_sec']:>10.1f} sig/s")
+        print(f"Cached signing key     : {result['cached_key_sigs_per_sec']:>10.1f} sig/s")
+        print(f"Speedup                : {result['speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
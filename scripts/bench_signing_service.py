@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+OMNIX — Batch Signing Service Benchmark
+=======================================
+Measures signatures/sec through SigningService.sign_batch() for an
+increasing number of worker processes, to confirm that bulk signing
+(transparency-log flushes, turn recording, replay) scales with cores.
+
+Usage:
+    python scripts/bench_signing_service.py                  # workers 0,1,2,4,... up to cpu_count
+    python scripts/bench_signing_service.py -n 2000 -b 64    # 2000 payloads in batches of 64
+    python scripts/bench_signing_service.py --workers 0 4 8  # explicit worker counts
+    python scripts/bench_signing_service.py --json
+
+ADR-043 — Crypto-Agility Layer
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _default_worker_counts() -> list:
+    counts, n = [0, 1], 2
+    while n <= (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts
+
+
+def bench(workers: int, payloads: list, batch_size: int) -> dict:
+    from omnix_core.security.signing_service import SigningService
+
+    svc = SigningService(workers=workers)
+    try:
+        svc.sign_batch(payloads[:batch_size], allow_ephemeral=True)  # warm the pool
+        start = time.perf_counter()
+        futures = [
+            svc.submit_batch(payloads[i:i + batch_size], allow_ephemeral=True)
+            for i in range(0, len(payloads), batch_size)
+        ]
+        signed = sum(1 for f in futures for sig in f.result() if sig)
+        elapsed = time.perf_counter() - start
+        latency = svc.stats()["batch_latency"]
+    finally:
+        svc.close()
+    return {
+        "workers": workers,
+        "signed": signed,
+        "sigs_per_sec": round(len(payloads) / elapsed, 1),
+        "batch_latency": {k: v for k, v in latency.items() if v["count"]},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Batch signing service benchmark")
+    parser.add_argument("-n", "--payloads", type=int, default=1000)
+    parser.add_argument("-b", "--batch-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    from omnix_core.security.crypto_providers import get_active_provider, get_signing_key
+
+    provider = get_active_provider()
+    if get_signing_key(provider.provider_id(), allow_ephemeral=True) is None:
+        print(f"[ERROR] provider '{provider.provider_id()}' backend unavailable — install the PQC library")
+        return 1
+
+    payloads = [
+        json.dumps({"seq": i, "decision": "ALLOW", "domain": "bench"}, sort_keys=True).encode()
+        for i in range(args.payloads)
+    ]
+    results = [bench(w, payloads, args.batch_size) for w in (args.workers or _default_worker_counts())]
+
+    if args.json:
+        print(json.dumps({"provider": provider.provider_id(), "results": results}, indent=2))
+    else:
+        base = results[0]["sigs_per_sec"] or 1.0
+        print(f"Provider: {provider.provider_id()}  payloads={args.payloads}  batch={args.batch_size}")
+        for r in results:
+            print(f"  workers={r['workers']:>3}  {r['sigs_per_sec']:>10.1f} sig/s  "
+                  f"({r['sigs_per_sec'] / base:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+OMNIX QUANTUM — Offline Verifier Parallel Engine
+================================================
+Shared --jobs machinery for the offline verifiers:
+
+  scripts/verify_treasury_execution_trace.py   (OMNIX-RTE-001, ADR-201)
+  scripts/verify_evidence_package.py           (RCEP, ADR-200)
+  scripts/verify_pogc_offline.py               (PoGC, ADR-205)
+
+What it provides:
+  · Signature batch — with --jobs N > 1 a package is verified twice.  The
+    first pass runs silently and only collects the (signature, message)
+    pairs the checks ask for; the unique pairs are verified on N worker
+    processes; the second pass prints the real report from those results.
+    Checks, counts and output are identical to --jobs 1.
+  · Hash memo — canonical-JSON hashes memoized per object id, live across
+    both passes and cleared at the start and end of every run.
+  · Directory mode + benchmark — many files verified N at a time, each
+    report printed whole in file-name order, followed by a summary; the
+    benchmark times --jobs 1 against --jobs N and prints checks per second.
+
+Standard library only.  Every verifier imports this module optionally and
+stays a sequential single-file tool when it is shipped on its own.
+
+Author: Harold Nunes — OMNIX QUANTUM LTD
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# verify_one(path, jobs=N) -> (exit code, number of checks)
+VerifyOne = Callable[..., Tuple[int, int]]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Hash memo
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Keyed by (id(obj), *key).  The object is kept in the entry so its id cannot
+# be reused while cached; run_batched() clears the memo around every run.
+_HASH_MEMO: Dict[Tuple, Tuple[Any, str]] = {}
+
+
+def memo_hash(obj: Any, key: Tuple, compute: Callable[[], str]) -> str:
+    """compute() once per (obj, key) within a run."""
+    memo_key = (id(obj),) + key
+    hit = _HASH_MEMO.get(memo_key)
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    value = compute()
+    _HASH_MEMO[memo_key] = (obj, value)
+    return value
+
+
+def clear_memo() -> None:
+    _HASH_MEMO.clear()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Signature batch
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SignatureBatch:
+    """
+    (signature, message) pairs requested during one run.
+
+    While collecting, verify() records the pair and answers True so the
+    checks keep going; resolve() then verifies every unique pair once, on a
+    process pool.  Afterwards verify() serves the stored result — an error
+    is re-raised with the same message, so callers build the same detail.
+    """
+
+    def __init__(self, loader: Callable[[str], Tuple[Any, Any]], pk_b64: str, jobs: int):
+        self.loader     = loader
+        self.pk_b64     = pk_b64
+        self.jobs       = jobs
+        self.collecting = True
+        self.requested  = 0
+        self.results: Dict[Tuple[bytes, bytes], Tuple[bool, str]] = {}
+
+    def verify(self, pqc, sig_bytes: bytes, raw: bytes, pk_bytes: bytes) -> bool:
+        key = (sig_bytes, raw)
+        if self.collecting:
+            self.requested += 1
+            self.results.setdefault(key, (True, ""))
+            return True
+        hit = self.results.get(key)
+        if hit is None:
+            # The first pass never asked for this pair — verify it inline.
+            return pqc.verify_signature(sig_bytes, raw, pk_bytes)
+        ok, error = hit
+        if error:
+            raise RuntimeError(error)
+        return ok
+
+    def resolve(self, pqc, pk_bytes: bytes) -> None:
+        """Verify every collected pair once; in-process if the pool is unavailable."""
+        self.collecting = False
+        keys = list(self.results)
+        if not keys:
+            return
+        try:
+            chunksize = max(1, len(keys) // (self.jobs * 4))
+            with ProcessPoolExecutor(self.jobs, initializer=_init_worker,
+                                     initargs=(self.loader, self.pk_b64)) as pool:
+                outcomes = list(pool.map(_worker_verify, keys, chunksize=chunksize))
+        except Exception as e:
+            # Pool unavailable (sandbox, fork limits) — verify in-process instead.
+            print(f"[WARN] Signature pool failed ({e}) — verifying sequentially", file=sys.stderr)
+            outcomes = [_verify_pair(pqc, pk_bytes, key) for key in keys]
+        self.results = dict(zip(keys, outcomes))
+
+
+_ACTIVE_BATCH: Optional[SignatureBatch] = None
+_WORKER: Tuple[Any, Any] = (None, None)
+
+
+def _init_worker(loader: Callable[[str], Tuple[Any, Any]], pk_b64: str) -> None:
+    global _WORKER
+    with _silenced():
+        _WORKER = loader(pk_b64)
+
+
+def _worker_verify(key: Tuple[bytes, bytes]) -> Tuple[bool, str]:
+    pqc, pk_bytes = _WORKER
+    if pqc is None:
+        raise RuntimeError("PQC library unavailable in worker")
+    return _verify_pair(pqc, pk_bytes, key)
+
+
+def _verify_pair(pqc, pk_bytes: bytes, key: Tuple[bytes, bytes]) -> Tuple[bool, str]:
+    sig_bytes, raw = key
+    try:
+        return bool(pqc.verify_signature(sig_bytes, raw, pk_bytes)), ""
+    except Exception as e:
+        return False, str(e)
+
+
+def pqc_verify(pqc, sig_bytes: bytes, raw: bytes, pk_bytes: bytes) -> bool:
+    """pqc.verify_signature, routed through the active batch when there is one."""
+    if _ACTIVE_BATCH is not None:
+        return _ACTIVE_BATCH.verify(pqc, sig_bytes, raw, pk_bytes)
+    return pqc.verify_signature(sig_bytes, raw, pk_bytes)
+
+
+@contextlib.contextmanager
+def _silenced():
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        yield
+
+
+def run_batched(run: Callable[[], T], pqc=None, pk_bytes: Optional[bytes] = None,
+                loader: Optional[Callable[[str], Tuple[Any, Any]]] = None,
+                pk_b64: str = "", jobs: int = 1) -> T:
+    """
+    Run one package verification with a fresh hash memo.
+
+    run() must build its own report.  With jobs > 1 and PQC loaded it is
+    called twice — silently to collect signatures, then for real once the
+    batch has been verified — and the second result is returned.
+    """
+    global _ACTIVE_BATCH
+    clear_memo()
+    try:
+        if pqc is None or loader is None or jobs <= 1:
+            return run()
+        batch = _ACTIVE_BATCH = SignatureBatch(loader, pk_b64, jobs)
+        with _silenced():
+            run()
+        batch.resolve(pqc, pk_bytes)
+        return run()
+    finally:
+        _ACTIVE_BATCH = None
+        clear_memo()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  Directory mode + benchmark
+# ─────────────────────────────────────────────────────────────────────────────
+
+def add_parallel_arguments(parser: argparse.ArgumentParser, unit: str = "packages") -> None:
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help=f"Worker processes: PQC signature checks for one file, "
+                             f"or {unit} at a time in directory mode (default 1 — sequential)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time verification with --jobs 1 and --jobs N and print checks/s")
+
+
+def verify_captured(verify_one: VerifyOne, path: str, jobs: int = 1) -> Tuple[str, int, int, str]:
+    """Verify one file with its output captured. Returns (path, code, checks, output)."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            code, checks = verify_one(path, jobs=jobs)
+        except SystemExit as e:
+            code, checks = (e.code if isinstance(e.code, int) else 2), 0
+        except Exception as e:
+            print(f"\n[ERROR] Verifier crashed: {e}")
+            code, checks = 2, 0
+    return path, code, checks, buf.getvalue()
+
+
+def verify_many(verify_one: VerifyOne, paths: List[str], jobs: int) -> List[Tuple[str, int, int, str]]:
+    """
+    Verify paths with captured output, in input order.
+
+    A single file uses jobs for its signature pool; several files are spread
+    over jobs processes, each verified sequentially inside its worker.
+    """
+    if len(paths) == 1:
+        return [verify_captured(verify_one, paths[0], jobs)]
+    if jobs <= 1:
+        return [verify_captured(verify_one, p) for p in paths]
+    with ProcessPoolExecutor(min(jobs, len(paths))) as pool:
+        return list(pool.map(functools.partial(verify_captured, verify_one), paths))
+
+
+def run_directory(verify_one: VerifyOne, paths: List[str], jobs: int, unit: str = "package") -> int:
+    """Print every report in order, then a per-file summary. Returns the worst exit code."""
+    results = verify_many(verify_one, paths, jobs)
+    for _, _, _, output in results:
+        sys.stdout.write(output)
+    print()
+    print("═" * 65)
+    print(f"  DIRECTORY SUMMARY — {len(results)} {unit}(s) · jobs={jobs}")
+    print("─" * 65)
+    verdicts = {0: "PASS", 1: "FAIL", 2: "ERROR"}
+    for path, code, checks, _ in results:
+        print(f"  {verdicts.get(code, 'ERROR'):<5}  {checks:>4} checks  {os.path.basename(path)}")
+    print("═" * 65)
+    return max(code for _, code, _, _ in results)
+
+
+def run_benchmark(verify_one: VerifyOne, paths: List[str], jobs: int, title: str,
+                  unit: str = "package") -> int:
+    """Time the same verification with --jobs 1 and --jobs N; print checks/s."""
+    job_counts = [1] if jobs <= 1 else [1, jobs]
+    print("=" * 65)
+    print(f"  {title} benchmark — {len(paths)} {unit}(s)")
+    print("─" * 65)
+    baseline = None
+    worst = 0
+    for n in job_counts:
+        started = time.perf_counter()
+        results = verify_many(verify_one, paths, n)
+        elapsed = time.perf_counter() - started
+        checks  = sum(r[2] for r in results)
+        worst   = max([worst] + [r[1] for r in results])
+        baseline = baseline or elapsed
+        print(f"  jobs={n:<3} {elapsed:8.3f}s  {checks:>6} checks  "
+              f"{checks / elapsed if elapsed else 0.0:10.1f} checks/s  "
+              f"x{baseline / elapsed if elapsed else 0.0:.2f}")
+    print("=" * 65)
+    return worst
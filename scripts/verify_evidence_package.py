@@ -41,6 +41,14 @@ Verifier scope limits (written to report):
 
 Usage:
   python scripts/verify_evidence_package.py <package_file.json>
+  python scripts/verify_evidence_package.py <package_file.json> --jobs 8 (PQC signatures on 8 processes)
+  python scripts/verify_evidence_package.py <directory>         --jobs 8 (8 packages at a time)
+  python scripts/verify_evidence_package.py <package_file.json> --jobs 8 --benchmark
+
+Parallel mode (--jobs N) uses scripts/offline_verify_parallel.py, shared with
+the RTE-001 verifier: signature checks are verified on N processes with the
+same checks and output as --jobs 1, a directory verifies every
+omnix_evidence_package_*.json in it, and --benchmark prints checks/s.
 
 Exit codes:
   0 — all verifications PASS
@@ -52,7 +60,9 @@ ADR: ADR-200 (Route-Complete Evidence Package)
 
 from __future__ import annotations
 
+import argparse
 import base64
+import glob
 import hashlib
 import json
 import os
@@ -61,6 +71,12 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import offline_verify_parallel as _parallel
+except ImportError:  # verifier shipped on its own — sequential only
+    _parallel = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -140,6 +156,22 @@ def _load_pqc(pk_b64: str):
         return None, None
 
 
+def _pqc_verify(pqc, sig_bytes: bytes, raw: bytes, pk_bytes: bytes) -> bool:
+    """pqc.verify_signature, batched onto the --jobs pool when one is collecting."""
+    if _parallel is None:
+        return pqc.verify_signature(sig_bytes, raw, pk_bytes)
+    return _parallel.pqc_verify(pqc, sig_bytes, raw, pk_bytes)
+
+
+def _hash_excluding(record: Dict, exclude, hasher) -> str:
+    """hasher(record minus exclude), memoized per record for the current package run."""
+    def compute() -> str:
+        return hasher({k: v for k, v in record.items() if k not in exclude})
+    if _parallel is None:
+        return compute()
+    return _parallel.memo_hash(record, (hasher.__name__,) + tuple(sorted(exclude)), compute)
+
+
 def _sha3_default(data: Dict) -> str:
     """SHA3-256 with DEFAULT json.dumps separators. Used for generator-native hashes."""
     canonical = json.dumps(data, sort_keys=True, default=str)
@@ -167,7 +199,7 @@ def _verify_sig_compact(pqc, pk_bytes: bytes, payload: Dict, sig_b64: Optional[s
     try:
         sig_bytes = base64.b64decode(sig_b64)
         raw       = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        ok        = pqc.verify_signature(sig_bytes, raw, pk_bytes)
+        ok        = _pqc_verify(pqc, sig_bytes, raw, pk_bytes)
         return ok, "OK" if ok else "signature mismatch"
     except Exception as e:
         return False, str(e)
@@ -182,7 +214,7 @@ def _verify_sig_default(pqc, pk_bytes: bytes, payload: Dict, sig_b64: Optional[s
     try:
         sig_bytes = base64.b64decode(sig_b64)
         raw       = json.dumps(payload, sort_keys=True).encode("utf-8")
-        ok        = pqc.verify_signature(sig_bytes, raw, pk_bytes)
+        ok        = _pqc_verify(pqc, sig_bytes, raw, pk_bytes)
         return ok, "OK" if ok else "signature mismatch"
     except Exception as e:
         return False, str(e)
@@ -204,8 +236,7 @@ def verify_dr(dr: Dict, pqc, pk_bytes: bytes, report: VerificationReport, prefix
 
     # 2. content_hash integrity — DelegationReceiptEngine uses SHA-256 + compact separators
     exclude = {"content_hash", "pqc_signature", "pqc_algorithm"}
-    clean   = {k: v for k, v in dr.items() if k not in exclude}
-    expected_hash = _sha256_compact(clean)
+    expected_hash = _hash_excluding(dr, exclude, _sha256_compact)
     hash_ok = dr.get("content_hash") == expected_hash
     report.add(f"{prefix}.DR.HASH", f"DR {did[:20]} — content_hash integrity", hash_ok,
                f"stored={dr.get('content_hash','?')[:16]}... expected={expected_hash[:16]}...")
@@ -216,7 +247,7 @@ def verify_dr(dr: Dict, pqc, pk_bytes: bytes, report: VerificationReport, prefix
         try:
             sig_bytes = base64.b64decode(sig_b64)
             raw_ch    = dr.get("content_hash", "").encode("utf-8")
-            sig_ok    = pqc.verify_signature(sig_bytes, raw_ch, pk_bytes)
+            sig_ok    = _pqc_verify(pqc, sig_bytes, raw_ch, pk_bytes)
             sig_detail = "OK" if sig_ok else "mismatch"
         except Exception as e:
             sig_ok, sig_detail = False, str(e)
@@ -231,8 +262,7 @@ def verify_tar(tar: Dict, pqc, pk_bytes: bytes, report: VerificationReport, pref
 
     # 1. content_hash integrity — TemporalAuthorityEngine uses SHA-256 + compact separators
     exclude = {"content_hash", "pqc_signature", "pqc_algorithm"}
-    clean   = {k: v for k, v in tar.items() if k not in exclude}
-    expected  = _sha256_compact(clean)
+    expected  = _hash_excluding(tar, exclude, _sha256_compact)
     hash_ok   = tar.get("content_hash") == expected
     report.add(f"{prefix}.TAR.HASH", f"TAR {tar_id[:20]} — content_hash integrity", hash_ok,
                f"stored={tar.get('content_hash','?')[:16]}... expected={expected[:16]}...")
@@ -253,7 +283,7 @@ def verify_tar(tar: Dict, pqc, pk_bytes: bytes, report: VerificationReport, pref
         try:
             sig_bytes = base64.b64decode(sig_b64)
             raw_ch    = tar.get("content_hash", "").encode("utf-8")
-            sig_ok    = pqc.verify_signature(sig_bytes, raw_ch, pk_bytes)
+            sig_ok    = _pqc_verify(pqc, sig_bytes, raw_ch, pk_bytes)
             sig_detail = "OK" if sig_ok else "mismatch"
         except Exception as e:
             sig_ok, sig_detail = False, str(e)
@@ -406,8 +436,7 @@ def verify_pogc(pogc: Dict, pqc, pk_bytes: bytes, report: VerificationReport, pr
     # Exclude ONLY content_hash and pqc_signature. pqc_algorithm IS part of the hash.
     # Uses SHA3-256 + default separators (ADR-200 §4.3).
     exclude  = {"content_hash", "pqc_signature"}
-    clean    = {k: v for k, v in pogc.items() if k not in exclude}
-    expected = _sha3_default(clean)
+    expected = _hash_excluding(pogc, exclude, _sha3_default)
     stored   = pogc.get("content_hash", "")
     hash_ok  = stored == expected
     report.add(f"{prefix}.POGC.HASH", f"PoGC {pogc_id[:20]} — content_hash integrity", hash_ok,
@@ -445,8 +474,7 @@ def verify_receipt(receipt: Dict, id_field: str, hash_field: str,
 
     # content_hash — default separators, excl. hash field, sig field, pqc_algorithm
     exclude  = {hash_field, sig_field, "pqc_algorithm"}
-    clean    = {k: v for k, v in receipt.items() if k not in exclude}
-    expected = _sha3_default(clean)
+    expected = _hash_excluding(receipt, exclude, _sha3_default)
     stored   = receipt.get(hash_field, "")
     hash_ok  = stored == expected
     report.add(f"{prefix}.HASH", f"{label} {rec_id[:20]} — content_hash integrity", hash_ok,
@@ -473,8 +501,7 @@ def verify_continuity_hash(record: Dict, hash_field: str, label: str, check_pref
     exclude = {hash_field, "pqc_signature", "pqc_algorithm"}
     if exclude_extra:
         exclude.update(exclude_extra)
-    clean    = {k: v for k, v in record.items() if k not in exclude}
-    expected = _sha3_default(clean)
+    expected = _hash_excluding(record, exclude, _sha3_default)
     stored   = record.get(hash_field, "")
     hash_ok  = stored == expected
     report.add(check_prefix, label, hash_ok,
@@ -495,8 +522,7 @@ def verify_route_a(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 1. source_state hash — SHA3-256, default separators, excl. source_state_hash
     ss = steps.get("1_source_state", {})
     stored_ss_hash = ss.get("source_state_hash", "")
-    clean_ss = {k: v for k, v in ss.items() if k != "source_state_hash"}
-    expected_ss = _sha3_default(clean_ss)
+    expected_ss = _hash_excluding(ss, {"source_state_hash"}, _sha3_default)
     report.add("A.SS.HASH", "Source state — hash integrity",
                stored_ss_hash == expected_ss,
                f"stored={stored_ss_hash[:16]}... expected={expected_ss[:16]}...")
@@ -507,8 +533,8 @@ def verify_route_a(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 3. Continuity posture — SHA3-256, default separators
     cont = steps.get("3_continuity", {})
     stored_cont_hash = cont.get("posture_hash", "")
-    clean_cont = {k: v for k, v in cont.items() if k not in ("posture_hash", "pqc_signature", "pqc_algorithm")}
-    expected_cont = _sha3_default(clean_cont)
+    expected_cont = _hash_excluding(cont, {"posture_hash", "pqc_signature", "pqc_algorithm"},
+                                    _sha3_default)
     report.add("A.RCR.HASH", "Continuity posture — hash integrity",
                stored_cont_hash == expected_cont,
                f"ces_score={cont.get('ces_score')} band={cont.get('ces_band')}")
@@ -519,8 +545,8 @@ def verify_route_a(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 5. Binding record — SHA3-256, default separators; Route A binding has no PQC sig
     binding = steps.get("5_binding", {})
     stored_bh = binding.get("binding_hash", "")
-    clean_b   = {k: v for k, v in binding.items() if k not in ("binding_hash", "pqc_signature", "pqc_algorithm")}
-    expected_bh = _sha3_default(clean_b)
+    expected_bh = _hash_excluding(binding, {"binding_hash", "pqc_signature", "pqc_algorithm"},
+                                  _sha3_default)
     report.add("A.BIND.HASH", "Binding record — hash integrity",
                stored_bh == expected_bh,
                f"status={binding.get('binding_status')}")
@@ -556,8 +582,7 @@ def verify_route_b(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 1. source_state — SHA3-256, default separators
     ss = steps.get("1_source_state", {})
     stored_ss_hash = ss.get("source_state_hash", "")
-    clean_ss = {k: v for k, v in ss.items() if k != "source_state_hash"}
-    expected_ss = _sha3_default(clean_ss)
+    expected_ss = _hash_excluding(ss, {"source_state_hash"}, _sha3_default)
     report.add("B.SS.HASH", "Source state — hash integrity",
                stored_ss_hash == expected_ss,
                f"stored={stored_ss_hash[:16]}... expected={expected_ss[:16]}...")
@@ -568,8 +593,8 @@ def verify_route_b(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 3. RCR — SHA3-256, default separators, compact sig
     cont = steps.get("3_continuity", {})
     stored_rcr_hash = cont.get("rcr_hash", "")
-    clean_rcr = {k: v for k, v in cont.items() if k not in ("rcr_hash", "pqc_signature", "pqc_algorithm")}
-    expected_rcr = _sha3_default(clean_rcr)
+    expected_rcr = _hash_excluding(cont, {"rcr_hash", "pqc_signature", "pqc_algorithm"},
+                                   _sha3_default)
     hash_ok = stored_rcr_hash == expected_rcr
     report.add("B.RCR.HASH", "RCR — hash integrity", hash_ok,
                f"ces={cont.get('ces_score')} band={cont.get('ces_band')}")
@@ -593,8 +618,8 @@ def verify_route_b(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # 5. Binding — SHA3-256, default separators, compact sig
     binding = steps.get("5_binding", {})
     stored_bh = binding.get("binding_hash", "")
-    clean_b = {k: v for k, v in binding.items() if k not in ("binding_hash", "pqc_signature", "pqc_algorithm")}
-    expected_bh = _sha3_default(clean_b)
+    expected_bh = _hash_excluding(binding, {"binding_hash", "pqc_signature", "pqc_algorithm"},
+                                  _sha3_default)
     report.add("B.BIND.HASH", "Binding record — hash integrity",
                stored_bh == expected_bh,
                f"status={binding.get('binding_status')}")
@@ -622,8 +647,8 @@ def verify_route_b(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
     # Commit hash integrity (additional check — addresses architect gap finding)
     if commit.get("commit_hash"):
         stored_ch = commit.get("commit_hash", "")
-        clean_commit = {k: v for k, v in commit.items() if k not in ("commit_hash", "pqc_signature", "pqc_algorithm")}
-        expected_ch = _sha3_default(clean_commit)
+        expected_ch = _hash_excluding(commit, {"commit_hash", "pqc_signature", "pqc_algorithm"},
+                                      _sha3_default)
         report.add("B.COMMIT.HASH", "Commit record — commit_hash integrity",
                    stored_ch == expected_ch,
                    f"stored={stored_ch[:16]}... expected={expected_ch[:16]}...")
@@ -662,15 +687,11 @@ def verify_route_b(route: Dict, pqc, pk_bytes: bytes, report: VerificationReport
 #  Main
 # ─────────────────────────────────────────────────────────────────────────────
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/verify_evidence_package.py <package_file.json>")
-        sys.exit(1)
-
-    package_path = sys.argv[1]
+def verify_package(package_path: str, jobs: int = 1) -> Tuple[int, Optional[VerificationReport]]:
+    """Verify one package, print its report and write *_verification_report.json next to it."""
     if not os.path.isfile(package_path):
         print(f"[ERROR] File not found: {package_path}")
-        sys.exit(1)
+        return 1, None
 
     with open(package_path, "r", encoding="utf-8") as f:
         package = json.load(f)
@@ -699,21 +720,28 @@ def main():
 
     pqc, pk_bytes = _load_pqc(pk_b64) if pk_b64 else (None, None)
 
-    report = VerificationReport(package_id)
-
     routes  = package.get("routes", {})
     route_a = routes.get("route_a_refusal", {})
     route_b = routes.get("route_b_admission", {})
 
-    if route_a:
-        verify_route_a(route_a, pqc, pk_bytes, report)
-    else:
-        print("\n  [WARN] Route A not found in package")
+    # With --jobs N the engine runs this twice (silent signature collection, then the report).
+    def run() -> VerificationReport:
+        report = VerificationReport(package_id)
+        if route_a:
+            verify_route_a(route_a, pqc, pk_bytes, report)
+        else:
+            print("\n  [WARN] Route A not found in package")
 
-    if route_b:
-        verify_route_b(route_b, pqc, pk_bytes, report)
+        if route_b:
+            verify_route_b(route_b, pqc, pk_bytes, report)
+        else:
+            print("\n  [WARN] Route B not found in package")
+        return report
+
+    if _parallel is None:
+        report = run()
     else:
-        print("\n  [WARN] Route B not found in package")
+        report = _parallel.run_batched(run, pqc, pk_bytes, _load_pqc, pk_b64, jobs)
 
     print()
     all_ok = report.summary()
@@ -737,7 +765,54 @@ def main():
         print("      (initialized_at format varies; security maintained by PQC-signed seal).")
     print()
 
-    sys.exit(0 if all_ok else 1)
+    return (0 if all_ok else 1), report
+
+
+def _verify_checks(package_path: str, jobs: int = 1) -> Tuple[int, int]:
+    """Engine entry point: (exit code, number of checks) for one package."""
+    code, report = verify_package(package_path, jobs)
+    return code, len(report.checks) if report else 0
+
+
+def _list_packages(directory: str) -> List[str]:
+    """Package files in directory, skipping saved *_verification_report.json outputs."""
+    return sorted(p for p in glob.glob(os.path.join(directory, "omnix_evidence_package_*.json"))
+                  if not p.endswith("_verification_report.json"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="OMNIX Route-Complete Evidence Package (RCEP) Offline Verifier",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("package", nargs="?", default=None,
+                        help="Path to an RCEP JSON package, or a directory of packages")
+    if _parallel is not None:
+        _parallel.add_parallel_arguments(parser)
+    args = parser.parse_args()
+    jobs = max(1, getattr(args, "jobs", 1))
+
+    package_path = args.package
+    if package_path is None:
+        print("Usage: python scripts/verify_evidence_package.py <package_file.json>")
+        sys.exit(1)
+
+    if os.path.isdir(package_path):
+        if _parallel is None:
+            print("[ERROR] Directory mode needs scripts/offline_verify_parallel.py next to this verifier")
+            sys.exit(1)
+        package_paths = _list_packages(package_path)
+        if not package_paths:
+            print(f"[ERROR] No omnix_evidence_package_*.json packages in {package_path}")
+            sys.exit(1)
+    else:
+        package_paths = [package_path]
+
+    if _parallel is not None and args.benchmark:
+        sys.exit(_parallel.run_benchmark(_verify_checks, package_paths, jobs, "RCEP verifier"))
+    if len(package_paths) > 1 or os.path.isdir(package_path):
+        sys.exit(_parallel.run_directory(_verify_checks, package_paths, jobs))
+    sys.exit(verify_package(package_path, jobs)[0])
 
 
 if __name__ == "__main__":
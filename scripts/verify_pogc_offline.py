@@ -22,6 +22,14 @@ Usage:
     # Machine-readable JSON output:
     python verify_pogc_offline.py --file cert.json --json
 
+    # Directory mode — every POGC-*.json in a folder, 8 certificates at a time:
+    python verify_pogc_offline.py --file certificates/ --jobs 8
+    python verify_pogc_offline.py --file certificates/ --jobs 8 --benchmark
+
+    --jobs, directory mode and --benchmark use offline_verify_parallel.py (shared
+    with the RCEP and RTE-001 verifiers) when it sits next to this file.  Each
+    certificate carries one signature, so --jobs parallelises across files.
+
 Requirements:
     Python 3.8+  — no external dependencies for core verification (hash + status).
     oqs-python   — OPTIONAL, required for ML-DSA-65 PQC cryptographic verification:
@@ -51,14 +59,24 @@ from __future__ import annotations
 
 import argparse
 import base64
+import functools
+import glob
 import hashlib
 import json
+import os
 import sys
 import urllib.request
 import urllib.error
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import offline_verify_parallel as _parallel
+except ImportError:  # verifier shipped on its own — single certificate only
+    _parallel = None
+
 # ── Constants ─────────────────────────────────────────────────────────────────
 
 DEFAULT_ENDPOINT  = "https://omnixquantum.net"
@@ -506,6 +524,62 @@ def _print_verdict(valid: bool, pogc_id: str,
     print()
 
 
+def _print_result(cert: Dict[str, Any], pogc_id: str, valid: bool,
+                  checks: List[Tuple[str, Optional[bool], str]], as_json: bool) -> None:
+    if as_json:
+        result = {
+            "valid":      valid,
+            "pogc_id":    pogc_id,
+            "canonical_version": _detect_canonical_version(cert),
+            "checks":     [
+                {"label": lbl, "passed": p, "detail": det}
+                for lbl, p, det in checks
+            ],
+            "verified_at":   datetime.now(timezone.utc).isoformat(),
+            "verifier":      f"OMNIX-OfflineVerifier/{VERSION}",
+            "adr_ref":       ADR_REF,
+        }
+        print(json.dumps(result, indent=2))
+    else:
+        _print_banner()
+        _print_cert_summary(cert)
+        _print_checks(checks)
+        _print_verdict(valid, pogc_id, checks)
+
+
+def _load_certificate_file(path: str) -> Dict[str, Any]:
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        print(f"{RED('Error')}: File not found: {path}", file=sys.stderr)
+        sys.exit(2)
+    except json.JSONDecodeError as exc:
+        print(f"{RED('Error')}: Invalid JSON in {path}: {exc}", file=sys.stderr)
+        sys.exit(2)
+
+
+def verify_certificate_file(path: str, jobs: int = 1, *,
+                            platform_key_b64: Optional[str] = None,
+                            allow_sim: bool = False,
+                            as_json: bool = False) -> Tuple[int, int]:
+    """
+    Verify one certificate file and print its result.  Directory-mode entry
+    point; jobs is accepted for the engine and unused (one signature per file).
+
+    Returns (exit code, number of checks).
+    """
+    cert = _load_certificate_file(path)
+    valid, checks = verify_certificate(cert, platform_key_b64=platform_key_b64,
+                                       allow_sim=allow_sim)
+    _print_result(cert, cert.get("pogc_id", path), valid, checks, as_json)
+    return (0 if valid else 1), len(checks)
+
+
+def _list_certificates(directory: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(directory, "POGC-*.json")))
+
+
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
 def main():
@@ -575,23 +649,36 @@ def main():
     parser.add_argument(
         "--version", action="version", version=f"%(prog)s {VERSION}"
     )
+    if _parallel is not None:
+        _parallel.add_parallel_arguments(parser, unit="certificates")
 
     args = parser.parse_args()
 
     if not args.pogc_id and not args.file:
         parser.error("Provide a POGC-ID or use --file PATH")
 
-    # ── Load certificate ───────────────────────────────────────────────────
-    if args.file:
-        try:
-            with open(args.file) as fh:
-                cert = json.load(fh)
-        except FileNotFoundError:
-            print(f"{RED('Error')}: File not found: {args.file}", file=sys.stderr)
+    # ── Directory mode / benchmark ─────────────────────────────────────────
+    if args.file and (os.path.isdir(args.file) or getattr(args, "benchmark", False)):
+        if _parallel is None:
+            print(f"{RED('Error')}: Directory mode and --benchmark need "
+                  "offline_verify_parallel.py next to this verifier", file=sys.stderr)
             sys.exit(2)
-        except json.JSONDecodeError as exc:
-            print(f"{RED('Error')}: Invalid JSON in {args.file}: {exc}", file=sys.stderr)
+        paths = _list_certificates(args.file) if os.path.isdir(args.file) else [args.file]
+        if not paths:
+            print(f"{RED('Error')}: No POGC-*.json certificates in {args.file}", file=sys.stderr)
             sys.exit(2)
+        verify_one = functools.partial(verify_certificate_file,
+                                       platform_key_b64=args.platform_key or None,
+                                       allow_sim=args.allow_sim, as_json=args.json)
+        jobs = max(1, args.jobs)
+        if args.benchmark:
+            sys.exit(_parallel.run_benchmark(verify_one, paths, jobs, "PoGC verifier",
+                                             unit="certificate"))
+        sys.exit(_parallel.run_directory(verify_one, paths, jobs, unit="certificate"))
+
+    # ── Load certificate ───────────────────────────────────────────────────
+    if args.file:
+        cert = _load_certificate_file(args.file)
         pogc_id = cert.get("pogc_id", args.file)
     else:
         pogc_id = args.pogc_id
@@ -616,25 +703,7 @@ def main():
         allow_sim=args.allow_sim,
     )
 
-    if args.json:
-        result = {
-            "valid":      valid,
-            "pogc_id":    pogc_id,
-            "canonical_version": _detect_canonical_version(cert),
-            "checks":     [
-                {"label": lbl, "passed": p, "detail": det}
-                for lbl, p, det in checks
-            ],
-            "verified_at":   datetime.now(timezone.utc).isoformat(),
-            "verifier":      f"OMNIX-OfflineVerifier/{VERSION}",
-            "adr_ref":       ADR_REF,
-        }
-        print(json.dumps(result, indent=2))
-    else:
-        _print_banner()
-        _print_cert_summary(cert)
-        _print_checks(checks)
-        _print_verdict(valid, pogc_id, checks)
+    _print_result(cert, pogc_id, valid, checks, args.json)
 
     sys.exit(0 if valid else 1)
 
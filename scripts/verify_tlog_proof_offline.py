@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Transparency Log Proof Offline Verifier — v1.0.0
+=================================================
+Standalone verifier for the RFC 6962 Merkle proofs published by the OMNIX
+governance transparency log (ADR-044, OMNIX QUANTUM LTD).
+
+This script has ZERO dependency on OMNIX infrastructure, APIs, accounts,
+or proprietary code. It reimplements the RFC 6962 / RFC 9162 hashing and
+proof-verification algorithms and checks:
+
+  Inclusion proof  (GET /api/public/verify/<receipt_id> → transparency_proof)
+    TLOG-I1  leaf_hash recomputed from leaf_input
+    TLOG-I2  audit path resolves the leaf to root_hash at tree_size
+    TLOG-I3  root_hash / tree_size match the signed tree head
+    TLOG-S1  signed tree head signature
+
+  Consistency proof  (GET /api/public/transparency/consistency?old_size=M)
+    TLOG-C1  proof links old_root (size M) to new_root (size N)
+    TLOG-C2  new_root / new_size match the signed tree head
+    TLOG-C3  old_root matches a tree head you pinned earlier (--old-root)
+    TLOG-S1  signed tree head signature
+
+Requirements:
+    Python 3.8+
+    pip install oqs-python     ← optional; enables Dilithium STH signatures
+    pip install cryptography   ← optional; enables Ed25519 STH signatures
+
+Usage:
+    # Full /api/public/verify response or a bare inclusion proof
+    python verify_tlog_proof_offline.py --file verify_response.json
+
+    # Consistency proof, checked against the root you recorded at size M
+    python verify_tlog_proof_offline.py --file consistency.json --old-root <hex>
+
+    # Machine-readable JSON output / pinned signing key
+    python verify_tlog_proof_offline.py --file proof.json --json --platform-key <base64>
+
+Exit codes:
+    0  All checks passed (VERIFIED)
+    1  One or more checks failed (INVALID)
+    2  File not found, not parseable, or not a transparency proof
+
+ADR-044 — Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# ---------------------------------------------------------------------------
+# Version
+# ---------------------------------------------------------------------------
+
+VERIFIER_VERSION = "1.0.0"
+ADR_REFERENCE    = "ADR-044"
+TOOL_NAME        = "verify_tlog_proof_offline.py"
+LOG_ID           = "omnix-tlog-v1"
+
+# ---------------------------------------------------------------------------
+# Colour helpers
+# ---------------------------------------------------------------------------
+
+_TTY = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+
+def _c(code: str, text: str) -> str:
+    return f"\033[{code}m{text}\033[0m" if _TTY else text
+
+def grn(t: str) -> str: return _c("32;1", t)
+def red(t: str) -> str: return _c("31;1", t)
+def wht(t: str) -> str: return _c("97;1", t)
+def dim(t: str) -> str: return _c("2",    t)
+
+# ---------------------------------------------------------------------------
+# RFC 6962 §2.1 hashing — leaf = H(0x00 || input), node = H(0x01 || l || r)
+# ---------------------------------------------------------------------------
+
+def _leaf_hash(leaf_input: bytes) -> str:
+    return hashlib.sha256(b"\x00" + leaf_input).hexdigest()
+
+
+def _node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def _entry_leaf_input(receipt_id: str, event_type: str, payload_hash: str) -> bytes:
+    return f"{LOG_ID}|{receipt_id}|{event_type or 'decision'}|{payload_hash}".encode("utf-8")
+
+# ---------------------------------------------------------------------------
+# RFC 9162 §2.1.3.2 — inclusion proof verification
+# ---------------------------------------------------------------------------
+
+def _root_from_inclusion(leaf: str, index: int, size: int, path: Sequence[str]) -> Optional[str]:
+    if not 0 <= index < size:
+        return None
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return None
+        if fn & 1 or fn == sn:
+            r = _node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = _node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return r if sn == 0 else None
+
+# ---------------------------------------------------------------------------
+# RFC 9162 §2.1.4.2 — consistency proof verification
+# ---------------------------------------------------------------------------
+
+def _verify_consistency(old_size: int, new_size: int, old_root: str, new_root: str,
+                        proof: Sequence[str]) -> bool:
+    if old_size == new_size:
+        return not proof and old_root == new_root
+    if not 0 < old_size < new_size or not proof:
+        return False
+    proof = list(proof)
+    if old_size & (old_size - 1) == 0:
+        proof.insert(0, old_root)
+    fn, sn = old_size - 1, new_size - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+    fr = sr = proof[0]
+    for c in proof[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = _node_hash(c, fr)
+            sr = _node_hash(c, sr)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = _node_hash(sr, c)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and fr == old_root and sr == new_root
+
+# ---------------------------------------------------------------------------
+# Signed tree head signature — optional (oqs-python / cryptography)
+# ---------------------------------------------------------------------------
+
+_OQS_ALGORITHMS = {"dilithium3": ("Dilithium3", "ML-DSA-65"), "dilithium5": ("Dilithium5", "ML-DSA-87")}
+
+
+def _tree_head_message(sth: Dict[str, Any]) -> bytes:
+    return json.dumps(
+        {"log_id": sth.get("log_id", LOG_ID), "tree_size": sth["tree_size"],
+         "root_hash": sth["root_hash"], "timestamp": sth["timestamp"]},
+        sort_keys=True, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _verify_signature(provider: str, message: bytes, sig_b64: str, pk_b64: str) -> Tuple[bool, str]:
+    try:
+        sig = base64.b64decode(sig_b64)
+        pk  = base64.b64decode(pk_b64)
+    except Exception as exc:
+        return False, f"signature / key not valid base64: {exc}"
+    if provider in _OQS_ALGORITHMS:
+        oqs_name, label = _OQS_ALGORITHMS[provider]
+        try:
+            import oqs
+        except ImportError:
+            return True, "SKIP — oqs-python not installed (pip install oqs-python to enable)"
+        try:
+            if oqs.Signature(oqs_name).verify(message, sig, pk):
+                return True, f"{label} ({oqs_name}) tree head signature valid ✓"
+            return False, f"{label} tree head signature INVALID — tree head may have been forged"
+        except Exception as exc:
+            return False, f"PQC verification error: {exc}"
+    if provider == "ed25519":
+        try:
+            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+        except ImportError:
+            return True, "SKIP — cryptography not installed (pip install cryptography to enable)"
+        try:
+            Ed25519PublicKey.from_public_bytes(pk).verify(sig, message)
+            return True, "Ed25519 tree head signature valid ✓"
+        except Exception:
+            return False, "Ed25519 tree head signature INVALID — tree head may have been forged"
+    return True, f"SKIP — unsupported signing provider '{provider}'"
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+CheckResult = Tuple[str, bool, str]   # (check_id, passed, message)
+
+
+def _check_sth_signature(sth: Dict, pk_override: Optional[str]) -> CheckResult:
+    sig = sth.get("signature_b64")
+    if not sig:
+        return ("TLOG-S1", True,
+                "SKIP — tree head is unsigned (hash proofs still verified)")
+    pk_b64 = pk_override or sth.get("public_key_b64")
+    if not pk_b64:
+        return ("TLOG-S1", True,
+                "SKIP — signed tree head carries no public key. "
+                "Use --platform-key <base64> to verify the signature.")
+    try:
+        message = _tree_head_message(sth)
+    except KeyError as exc:
+        return ("TLOG-S1", False, f"signed tree head missing field {exc}")
+    ok, msg = _verify_signature(str(sth.get("signing_provider", "")).lower(), message, sig, pk_b64)
+    return ("TLOG-S1", ok, msg)
+
+
+def _check_inclusion(proof: Dict, pk_override: Optional[str]) -> List[CheckResult]:
+    checks: List[CheckResult] = []
+    leaf_input = proof.get("leaf_input") or {}
+    stored_leaf = proof.get("leaf_hash", "")
+    computed_leaf = _leaf_hash(_entry_leaf_input(
+        str(leaf_input.get("receipt_id", "")),
+        str(leaf_input.get("event_type", "")),
+        str(leaf_input.get("payload_hash", "")),
+    ))
+    if computed_leaf == stored_leaf:
+        checks.append(("TLOG-I1", True, f"leaf_hash recomputed from leaf_input: {stored_leaf[:16]}…"))
+    else:
+        checks.append(("TLOG-I1", False,
+                       f"leaf_hash MISMATCH — stored: {stored_leaf[:16]}… computed: {computed_leaf[:16]}…"))
+
+    index, size = int(proof.get("leaf_index", -1)), int(proof.get("tree_size", 0))
+    path = proof.get("audit_path") or []
+    try:
+        root = _root_from_inclusion(computed_leaf, index, size, path)
+    except ValueError:
+        root = None
+    if root is not None and root == proof.get("root_hash"):
+        checks.append(("TLOG-I2", True,
+                       f"leaf {index} included in tree of size {size} "
+                       f"({len(path)} audit hashes) → root {root[:16]}… ✓"))
+    else:
+        checks.append(("TLOG-I2", False,
+                       f"audit path does NOT resolve leaf {index} to root_hash at size {size}"))
+
+    sth = proof.get("signed_tree_head") or {}
+    if sth.get("root_hash") == proof.get("root_hash") and int(sth.get("tree_size", -1)) == size:
+        checks.append(("TLOG-I3", True, f"root_hash matches signed tree head (size {size})"))
+    else:
+        checks.append(("TLOG-I3", False, "root_hash / tree_size differ from the signed tree head"))
+    checks.append(_check_sth_signature(sth, pk_override))
+    return checks
+
+
+def _check_consistency(proof: Dict, pk_override: Optional[str],
+                       pinned_old_root: Optional[str]) -> List[CheckResult]:
+    checks: List[CheckResult] = []
+    old_size, new_size = int(proof.get("old_size", 0)), int(proof.get("new_size", 0))
+    old_root, new_root = proof.get("old_root", ""), proof.get("new_root", "")
+    try:
+        ok = _verify_consistency(old_size, new_size, old_root, new_root, proof.get("proof") or [])
+    except ValueError:
+        ok = False
+    if ok:
+        checks.append(("TLOG-C1", True,
+                       f"tree {new_size} is an append-only extension of tree {old_size} ✓"))
+    else:
+        checks.append(("TLOG-C1", False,
+                       f"consistency proof does NOT link size {old_size} to size {new_size} "
+                       "— the log may have been rewritten"))
+
+    sth = proof.get("signed_tree_head") or {}
+    if sth.get("root_hash") == new_root and int(sth.get("tree_size", -1)) == new_size:
+        checks.append(("TLOG-C2", True, f"new_root matches signed tree head (size {new_size})"))
+    else:
+        checks.append(("TLOG-C2", False, "new_root / new_size differ from the signed tree head"))
+
+    if not pinned_old_root:
+        checks.append(("TLOG-C3", True,
+                       "SKIP — no pinned root. Use --old-root <hex> with the root you saw at "
+                       f"size {old_size}."))
+    elif pinned_old_root.lower() == old_root:
+        checks.append(("TLOG-C3", True, f"old_root matches pinned root {old_root[:16]}…"))
+    else:
+        checks.append(("TLOG-C3", False,
+                       f"old_root {old_root[:16]}… differs from pinned root {pinned_old_root[:16]}… "
+                       "— the log history you saw was altered"))
+    checks.append(_check_sth_signature(sth, pk_override))
+    return checks
+
+# ---------------------------------------------------------------------------
+# Input shapes
+# ---------------------------------------------------------------------------
+
+def _classify(data: Dict) -> Tuple[str, Dict]:
+    """('inclusion' | 'consistency' | 'pending' | 'unknown', proof dict)."""
+    proof = data.get("transparency_proof", data) if isinstance(data, dict) else {}
+    if not isinstance(proof, dict):
+        return "unknown", {}
+    if "audit_path" in proof:
+        return "inclusion", proof
+    if "old_size" in proof and "proof" in proof:
+        return "consistency", proof
+    if proof.get("status") in ("PENDING", "NOT_LOGGED", "UNAVAILABLE"):
+        return "pending", proof
+    return "unknown", proof
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog=TOOL_NAME,
+        description=(
+            "Standalone offline verifier for OMNIX transparency log proofs.\n"
+            "Zero OMNIX dependencies. Reimplements RFC 6962 / RFC 9162 verification."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Examples:\n"
+            "  python verify_tlog_proof_offline.py --file verify_response.json\n"
+            "  python verify_tlog_proof_offline.py --file consistency.json --old-root <hex>\n"
+            "  python verify_tlog_proof_offline.py --file proof.json --json\n\n"
+            "Exit codes:\n"
+            "  0  All checks passed (VERIFIED)\n"
+            "  1  One or more checks failed (INVALID)\n"
+            "  2  File not found, unparseable, or not a proof\n\n"
+            f"Algorithm reference: {ADR_REFERENCE}, RFC 6962 §2.1, RFC 9162 §2.1.3-2.1.4\n"
+            "OMNIX QUANTUM LTD — https://omnixquantum.com"
+        ),
+    )
+    parser.add_argument("--file", "-f", metavar="PATH", required=True,
+                        help="Inclusion proof, consistency proof, or /api/public/verify response JSON")
+    parser.add_argument("--old-root", metavar="HEX",
+                        help="Root hash you recorded earlier at old_size (consistency proofs)")
+    parser.add_argument("--json", action="store_true", help="Output machine-readable JSON result")
+    parser.add_argument("--platform-key", metavar="B64",
+                        help="Base64-encoded STH public key (overrides embedded key)")
+    args = parser.parse_args()
+
+    path = Path(args.file)
+    if not path.exists():
+        print(red(f"Error: file not found: {path}"), file=sys.stderr)
+        return 2
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as exc:
+        print(red(f"Error: not valid JSON: {exc}"), file=sys.stderr)
+        return 2
+
+    kind, proof = _classify(data)
+    if kind == "pending":
+        print(red(f"Error: no proof yet — status {proof.get('status')}"), file=sys.stderr)
+        return 2
+    if kind == "unknown":
+        print(red("Error: file holds neither an inclusion nor a consistency proof"), file=sys.stderr)
+        return 2
+
+    if kind == "inclusion":
+        checks = _check_inclusion(proof, args.platform_key)
+        subject = f"receipt {(proof.get('leaf_input') or {}).get('receipt_id', '?')}"
+    else:
+        checks = _check_consistency(proof, args.platform_key, args.old_root)
+        subject = f"tree {proof.get('old_size')} → {proof.get('new_size')}"
+
+    failed  = [c for c in checks if not c[1]]
+    skipped = [c for c in checks if c[1] and c[2].startswith("SKIP")]
+    valid   = not failed
+
+    if args.json:
+        print(json.dumps({
+            "verifier":      TOOL_NAME,
+            "version":       VERIFIER_VERSION,
+            "adr_reference": ADR_REFERENCE,
+            "file":          str(path),
+            "proof_type":    kind,
+            "valid":         valid,
+            "checks": [{"id": c[0], "passed": c[1], "message": c[2]} for c in checks],
+            "n_passed":      sum(1 for c in checks if c[1]),
+            "n_failed":      len(failed),
+            "n_checks":      len(checks),
+        }, indent=2))
+        return 0 if valid else 1
+
+    print()
+    print(wht(f"  OMNIX Transparency Log Proof Verifier {VERIFIER_VERSION}"))
+    print(dim(f"  File: {path}"))
+    print(dim(f"  {ADR_REFERENCE} — {kind} proof for {subject}"))
+    print()
+    for check_id, ok, msg in checks:
+        icon = grn("✓") if ok else red("✗")
+        color = dim if ok else red
+        print(f"  {icon} [{check_id}] {color(msg)}")
+    print()
+    if valid:
+        print(f"  {grn('VERIFIED')} — {len(checks) - len(skipped)}/{len(checks)} checks passed "
+              f"({len(skipped)} skipped)")
+    else:
+        print(f"  {red('INVALID')} — {len(failed)} check(s) FAILED")
+        for _, _, msg in failed:
+            print(f"  {red('  →')} {msg}")
+    print()
+    return 0 if valid else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
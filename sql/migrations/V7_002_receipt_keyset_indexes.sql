@@ -0,0 +1,33 @@
+-- =============================================================================
+-- OMNIX Migration: Keyset pagination indexes for receipt listings
+-- Purpose: Cursor pages on (created_at, id) / (ts_utc, log_id) instead of
+--          LIMIT/OFFSET. Each index matches the listing's WHERE + ORDER BY
+--          exactly, so every page is one index range scan at any depth.
+--
+-- CONCURRENTLY keeps the tables writable during the build; run this file
+-- outside a transaction block (psql -f, not inside BEGIN/COMMIT).
+--
+-- udcl_control_receipts and execution_receipts get their indexes from the
+-- lazy DDL in gov_blueprint.py / execution_receipt.py; they are repeated
+-- here so existing deployments can build them without blocking writes.
+-- =============================================================================
+
+-- GET /api/governance/receipts
+--   WHERE client_id = ? [AND decision = ?] AND (created_at, receipt_id) < (?, ?)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decision_receipts_client_created_receipt
+    ON decision_receipts(client_id, created_at DESC, receipt_id DESC);
+
+-- GET /api/governance/control/receipts
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_udcl_client_created_control
+    ON udcl_control_receipts(client_id, created_at DESC, control_id DESC);
+
+-- GET /api/governance/execution/receipts
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_execution_receipts_created_receipt
+    ON execution_receipts(created_at DESC, receipt_id DESC);
+
+-- TransparencyChain.get_chain_page (all symbols / one symbol)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transparency_log_ts_log
+    ON governance_transparency_log(ts_utc DESC, log_id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transparency_log_symbol_ts_log
+    ON governance_transparency_log(symbol, ts_utc DESC, log_id DESC);
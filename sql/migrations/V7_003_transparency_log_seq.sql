@@ -0,0 +1,23 @@
+-- =============================================================================
+-- OMNIX Migration: DB-assigned sequence for the Merkle log builder
+-- Purpose: MerkleTransparencyLog.run_once tails governance_transparency_log on
+--          log_seq instead of the client-assigned (ts_utc, log_id). Rows that
+--          commit late (pending reconciliation, flush retries) used to land
+--          behind the watermark and were never given a leaf.
+--
+-- Adding a BIGSERIAL column rewrites the table and numbers existing rows;
+-- run it in a maintenance window on large logs. The builder's lazy DDL
+-- (merkle_log._DDL) applies the same statements if this file has not run.
+-- The index is built CONCURRENTLY, so run this file outside a transaction
+-- block (psql -f, not inside BEGIN/COMMIT).
+-- =============================================================================
+
+ALTER TABLE governance_transparency_log
+    ADD COLUMN IF NOT EXISTS log_seq BIGSERIAL;
+
+ALTER TABLE IF EXISTS transparency_merkle_state
+    ADD COLUMN IF NOT EXISTS last_seq BIGINT NOT NULL DEFAULT 0;
+
+-- MerkleTransparencyLog.run_once: WHERE log_seq > ? ORDER BY log_seq
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_transparency_log_seq
+    ON governance_transparency_log(log_seq);
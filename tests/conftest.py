@@ -54,3 +54,156 @@ def sample_market_data():
         "high_24h": 51000.0,
         "low_24h": 49000.0,
     }
+
+
+class FakeChainDB:
+    """
+    In-memory governance_transparency_log for TransparencyChainWriter tests.
+
+    Models what the writer relies on: pg_advisory_xact_lock held until
+    commit/rollback, the tip SELECT, and the multi-row INSERT. Several
+    writers sharing one FakeChainDB behave like gunicorn workers sharing
+    one database.
+    """
+
+    COLUMNS = ("log_id", "receipt_id", "symbol", "event_type", "payload_hash",
+               "prev_log_hash", "merkle_root", "signing_provider", "signature_b64",
+               "key_id", "key_version", "ts_utc", "chain_version")
+
+    def __init__(self):
+        import threading
+        self.rows = []
+        self.batches = []
+        self.tip_reads = 0
+        self.fail = False
+        self.fail_inserts = 0          # fail this many INSERTs, then recover
+        self._lock = threading.Lock()
+
+    def add_row(self, payload_hash, merkle_root, ts_utc, log_id="TL-EXTERNAL"):
+        from datetime import datetime
+        if isinstance(ts_utc, str):
+            ts_utc = datetime.fromisoformat(ts_utc)
+        self.rows.append({"log_id": log_id, "payload_hash": payload_hash,
+                          "merkle_root": merkle_root, "ts_utc": ts_utc})
+
+    def chain(self):
+        """Stored rows in chain (ts_utc, log_id) order."""
+        return sorted(self.rows, key=lambda r: (r["ts_utc"], r["log_id"]))
+
+    def connection(self):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _connection():
+            conn = _FakeChainConn(self)
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+        return _connection()
+
+
+class _FakeChainConn:
+    def __init__(self, db):
+        self.db, self.staged, self.locked = db, [], False
+
+    def cursor(self):
+        return _FakeChainCursor(self)
+
+    def commit(self):
+        if self.staged:
+            self.db.rows.extend(self.staged)
+            self.db.batches.append(self.staged)
+        self.staged = []
+        self._release()
+
+    def rollback(self):
+        self.staged = []
+        self._release()
+
+    def _release(self):
+        if self.locked:
+            self.locked = False
+            self.db._lock.release()
+
+
+class _FakeChainCursor:
+    def __init__(self, conn):
+        self.conn, self._row = conn, None
+
+    def execute(self, sql, params=()):
+        from datetime import datetime
+        db = self.conn.db
+        if "pg_advisory_xact_lock" in sql:
+            db._lock.acquire()
+            self.conn.locked = True
+        elif sql.lstrip().startswith("SELECT payload_hash, merkle_root, ts_utc"):
+            db.tip_reads += 1
+            chain = db.chain()
+            tip = chain[-1] if chain else None
+            self._row = (tip["payload_hash"], tip["merkle_root"], tip["ts_utc"]) if tip else None
+        elif "INSERT INTO governance_transparency_log" in sql:
+            if db.fail or db.fail_inserts > 0:
+                db.fail_inserts = max(0, db.fail_inserts - 1)
+                raise RuntimeError("primary write failed")
+            width = len(FakeChainDB.COLUMNS)
+            for i in range(0, len(params), width):
+                row = dict(zip(FakeChainDB.COLUMNS, params[i:i + width]))
+                row["ts_utc"] = datetime.fromisoformat(row["ts_utc"])
+                self.conn.staged.append(row)
+
+    def fetchone(self):
+        return self._row
+
+    def close(self):
+        pass
+
+
+class FakeSigner:
+    """SigningService stand-in: deterministic signature = b"sig:" + sha256(payload)."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def sign_batch(self, payloads, provider_id=None, allow_ephemeral=False, timeout=None):
+        import hashlib
+        self.payloads.extend(payloads)
+        return [b"sig:" + hashlib.sha256(p).digest() for p in payloads]
+
+
+@pytest.fixture
+def chain_db(monkeypatch):
+    """
+    FakeChainDB plus stubbed signing hooks used by TransparencyChain._sign_entries
+    (active provider, process signing key and the SigningService).
+
+    Returns (db, make_writer); make_writer(**kwargs) builds a
+    TransparencyChainWriter wired to db.
+    """
+    from types import SimpleNamespace
+
+    import omnix_core.security.crypto_providers as crypto_providers
+    import omnix_core.security.signing_service as signing_service
+    from omnix_core.evidence.transparency_chain import TransparencyChainWriter
+
+    signer = FakeSigner()
+    provider = SimpleNamespace(provider_id=lambda: "fake-pqc")
+    monkeypatch.setattr(crypto_providers, "get_active_provider", lambda: provider)
+    monkeypatch.setattr(crypto_providers, "get_signing_key",
+                        lambda *a, **k: SimpleNamespace(secret_key=b"k", key_id="fake-key", key_version="3"))
+    monkeypatch.setattr(signing_service, "get_signing_service", lambda: signer)
+
+    db = FakeChainDB()
+    db.signer = signer
+    writers = []
+
+    def make_writer(**kwargs):
+        writer = TransparencyChainWriter(**kwargs)
+        writer._chain._db_url = "postgresql://test"
+        writer._chain._connection = db.connection
+        writers.append(writer)
+        return writer
+
+    yield db, make_writer
+    for writer in writers:
+        writer.close()
@@ -0,0 +1,163 @@
+"""
+Sharded in-memory AntiReplayStore + batch registration (ADR-076 / ADR-077)
+
+  TestTimingWheel  — expiry through elapsed wheel buckets, not full scans
+  TestShards       — lock striping, cross-shard sweep, per-shard capacity
+  TestBatch        — check_and_register_many on both backends
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import omnix_core.evidence.anti_replay as ar
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+class TestTimingWheel:
+
+    def test_purge_pops_only_elapsed_buckets(self):
+        shard = ar._Shard(tick_ms=1000)
+        now = _now_ms()
+        shard.set_locked("old", now - 5_000)
+        shard.set_locked("live", now + 60_000)
+        assert shard.purge_locked(now) == 1
+        assert set(shard.entries) == {"live"}
+        assert all(tick >= now // 1000 for tick in shard.wheel)
+
+    def test_reregistered_id_survives_its_old_bucket(self):
+        shard = ar._Shard(tick_ms=1000)
+        now = _now_ms()
+        shard.set_locked("rid", now - 2_000)
+        shard.set_locked("rid", now + 60_000)
+        shard.purge_locked(now)
+        assert shard.entries["rid"] == now + 60_000
+
+    def test_revoked_id_is_skipped(self):
+        shard = ar._Shard(tick_ms=1000)
+        now = _now_ms()
+        shard.set_locked("rid", now - 2_000)
+        del shard.entries["rid"]
+        assert shard.purge_locked(now) == 0
+
+    def test_long_idle_visits_buckets_not_ticks(self):
+        shard = ar._Shard(tick_ms=1)
+        shard.set_locked("ancient", 5)
+        # cursor rewinds to tick 5; ~1.7e12 elapsed ticks, one bucket to pop
+        assert shard.purge_locked(_now_ms()) == 1
+        assert shard.wheel == {}
+
+
+class TestShards:
+
+    def test_ids_spread_over_shards(self):
+        store = ar._InMemoryStore(shards=8)
+        for i in range(400):
+            store.check_and_register(f"OMNIX-TRD-{i:012X}", ttl_ms=30_000)
+        sizes = [len(s.entries) for s in store._shards]
+        assert sum(sizes) == 400
+        assert min(sizes) > 0
+        assert store.stats()["shards"] == 8
+
+    def test_registration_sweeps_other_shards(self):
+        store = ar._InMemoryStore(shards=8)
+        past = _now_ms() - 10_000
+        for i in range(50):
+            store._store[f"OMNIX-TRD-OLD{i:09X}"] = past
+        store.check_and_register("OMNIX-TRD-FRESH0000000", ttl_ms=30_000)
+        assert store.stats()["total_entries"] == 1
+
+    def test_sweep_skips_busy_shards(self):
+        store = ar._InMemoryStore(shards=2)
+        past = _now_ms() - 10_000
+        store._shards[1].set_locked("stale", past)
+        with store._shards[1].lock:
+            store._maybe_sweep(_now_ms())
+        assert "stale" in store._shards[1].entries
+
+    def test_capacity_is_per_shard_share(self):
+        store = ar._InMemoryStore(shards=4)
+        with patch.object(ar, "MAX_STORE_SIZE", 8):
+            shard = store._shards[0]
+            ids = [f"OMNIX-{i}" for i in range(200) if store._shard(f"OMNIX-{i}") is shard]
+            for rid in ids[:2]:
+                store.check_and_register(rid, ttl_ms=30_000)
+            with pytest.raises(ar.ReplayDetected, match="CAPACITY"):
+                store.check_and_register(ids[2], ttl_ms=30_000)
+
+    def test_exactly_one_winner_per_id_under_contention(self):
+        store = ar._InMemoryStore(shards=16)
+        wins = []
+
+        def attempt(t):
+            for i in range(50):
+                try:
+                    store.check_and_register(f"OMNIX-TRD-RACE{i:08X}", ttl_ms=30_000)
+                    wins.append(i)
+                except ar.ReplayDetected:
+                    pass
+
+        threads = [threading.Thread(target=attempt, args=(t,)) for t in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(wins) == list(range(50))
+
+
+class TestBatch:
+
+    def _store(self, redis_client=None):
+        store = ar.AntiReplayStore.__new__(ar.AntiReplayStore)
+        store._mem = ar._InMemoryStore(shards=4)
+        store._redis = ar._RedisStore(redis_client) if redis_client else None
+        return store
+
+    def test_in_memory_batch_flags_replays_in_order(self):
+        store = self._store()
+        store.check_and_register("R-1", ttl_ms=30_000)
+        assert store.check_and_register_many(["R-0", "R-1", "R-2", "R-0"]) == [True, False, True, False]
+        assert store.is_replay("R-2")
+
+    def test_redis_batch_is_one_pipeline(self):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [True, None, True]
+        store = self._store(client)
+        assert store.check_and_register_many(["A", "B", "C"], ttl_ms=100) == [True, False, True]
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 3
+        key, value = pipe.set.call_args_list[0].args
+        assert key == "omnix:ar:A"
+        assert pipe.set.call_args_list[0].kwargs == {"px": ar.MIN_WINDOW_MS, "nx": True}
+        pipe.execute.assert_called_once()
+        client.set.assert_not_called()
+
+    def test_redis_failure_best_effort_uses_memory(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+        store = self._store(client)
+        with patch.object(ar, "_STRICT_MODE", False):
+            assert store.check_and_register_many(["A", "A"]) == [True, False]
+        assert store._mem.is_replay("A")
+
+    def test_redis_failure_strict_raises(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+        store = self._store(client)
+        with patch.object(ar, "_STRICT_MODE", True):
+            with pytest.raises(ar.ReplayDetected, match="BACKEND_FAILURE"):
+                store.check_and_register_many(["A"])
+
+    def test_validation(self):
+        store = self._store()
+        assert store.check_and_register_many([]) == []
+        with pytest.raises(ValueError):
+            store.check_and_register_many(["A", ""])
+        with pytest.raises(ValueError):
+            store.check_and_register_many(["A"], ttl_ms=0)
@@ -0,0 +1,215 @@
+"""
+ATF verification caches — TrustLattice / DelegationReceiptEngine / RuntimeContinuityEngine
+==========================================================================================
+  · PQC signature results cached by (content_hash, signature, public key)
+  · verified-prefix memo: a new leaf re-verifies only itself; revocation and
+    field tampering invalidate the memo
+  · a DB miss loads the whole ancestry in one recursive query
+  · chain_root_id aggregates match a full session scan
+
+ADR-156 / ADR-160 — Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omnix_core.agents.atf.delegation_receipt import DelegationReceiptEngine
+from omnix_core.agents.atf.runtime_continuity import RuntimeContinuityEngine
+from omnix_core.agents.atf.trust_lattice import TrustLattice
+
+
+def _chain(lattice: TrustLattice, depth: int = 3):
+    """Linear chain HUMAN → A1 → … → A<depth>; returns the receipts root-first."""
+    receipts = []
+    delegator, budget = "HUMAN-TIER1", 90.0
+    for level in range(1, depth + 1):
+        agent = lattice.register_agent(f"Agent {level}", "FINANCE", authority_budget=budget)
+        parent = receipts[-1] if receipts else None
+        dr = lattice.delegate(
+            delegator_id=delegator,
+            delegate_id=agent.agent_id,
+            task_scope={"level": level},
+            authority_budget_delegator=budget,
+            authority_budget_granted=budget - 10.0,
+            parent_delegation_id=parent.delegation_id if parent else None,
+            chain_root_id=receipts[0].delegation_id if receipts else None,
+            delegation_depth=level,
+        )
+        receipts.append(dr)
+        delegator, budget = agent.agent_id, budget - 10.0
+    return receipts
+
+
+def _extend(lattice: TrustLattice, parent, level: int):
+    agent = lattice.register_agent(f"Agent {level}", "FINANCE", authority_budget=10.0)
+    return lattice.delegate(
+        delegator_id=parent.delegate_id,
+        delegate_id=agent.agent_id,
+        task_scope={"level": level},
+        authority_budget_delegator=parent.authority_budget_granted,
+        authority_budget_granted=parent.authority_budget_granted - 5.0,
+        parent_delegation_id=parent.delegation_id,
+        chain_root_id=parent.chain_root_id,
+        delegation_depth=level,
+    )
+
+
+class TestSignatureCache:
+    def test_repeat_verification_hits_cache(self):
+        engine = DelegationReceiptEngine(db_url=None)
+        engine._provider = MagicMock()
+        engine._provider.verify.return_value = True
+        for _ in range(3):
+            assert engine._verify_signature_cached("h" * 64, "c2ln", "cGs=")
+        assert engine._provider.verify.call_count == 1
+        engine._verify_signature_cached("h" * 64, "c2ln", "b3RoZXI=")
+        assert engine._provider.verify.call_count == 2
+
+    def test_cache_is_bounded(self):
+        with patch.dict("os.environ", {"OMNIX_ATF_SIG_CACHE_SIZE": "2"}):
+            engine = DelegationReceiptEngine(db_url=None)
+        engine._provider = MagicMock()
+        engine._provider.verify.return_value = False
+        for i in range(5):
+            engine._verify_signature_cached(f"{i:064x}", "c2ln", "cGs=")
+        assert len(engine._sig_cache) == 2
+
+
+class TestVerifiedPrefix:
+    def test_new_leaf_verifies_only_itself(self):
+        lattice = TrustLattice(db_url=None)
+        receipts = _chain(lattice)
+        assert lattice.verify_chain(delegation_id=receipts[-1].delegation_id).fully_verified
+        leaf = _extend(lattice, receipts[-1], 4)
+        engine = lattice._delegation_engine
+        with patch.object(engine, "verify_receipt", wraps=engine.verify_receipt) as verify:
+            result = lattice.verify_chain(delegation_id=leaf.delegation_id)
+        assert verify.call_count == 1
+        assert result.fully_verified and result.chain_depth == 4
+        assert [n.delegation_id for n in result.chain] == \
+            [r.delegation_id for r in receipts] + [leaf.delegation_id]
+        assert result.leaf_budget == leaf.authority_budget_granted
+
+    def test_memoized_result_matches_cold_result(self):
+        warm = TrustLattice(db_url=None)
+        receipts = _chain(warm, depth=5)
+        leaf_id = receipts[-1].delegation_id
+        first = warm.verify_chain(delegation_id=leaf_id).summary()
+        second = warm.verify_chain(delegation_id=leaf_id).summary()
+        first.pop("verified_at", None), second.pop("verified_at", None)
+        assert first == second
+
+    def test_revocation_invalidates_memo(self):
+        lattice = TrustLattice(db_url=None)
+        receipts = _chain(lattice)
+        lattice.verify_chain(delegation_id=receipts[-1].delegation_id)
+        lattice._delegation_engine.revoke_delegation(receipts[0].delegation_id)
+        engine = lattice._delegation_engine
+        with patch.object(engine, "verify_receipt", wraps=engine.verify_receipt) as verify:
+            lattice.verify_chain(delegation_id=receipts[-1].delegation_id)
+        assert verify.call_count == 3
+
+    def test_tampered_receipt_not_served_from_memo(self):
+        lattice = TrustLattice(db_url=None)
+        receipts = _chain(lattice)
+        assert lattice.verify_chain(delegation_id=receipts[-1].delegation_id).fully_verified
+        receipts[1].task_scope = {"level": 2, "action": "wire_funds"}
+        result = lattice.verify_chain(delegation_id=receipts[1].delegation_id)
+        assert not result.fully_verified
+        assert "Content hash mismatch at depth 2" in result.failure_reason
+
+    def test_tampered_leaf_detected(self):
+        lattice = TrustLattice(db_url=None)
+        receipts = _chain(lattice)
+        lattice.verify_chain(delegation_id=receipts[-1].delegation_id)
+        receipts[-1].authority_budget_granted = 70.0
+        result = lattice.verify_chain(delegation_id=receipts[-1].delegation_id)
+        assert not result.fully_verified
+        assert "Content hash mismatch at depth 3" in result.failure_reason
+
+
+class TestAncestorFetch:
+    def test_db_miss_loads_ancestry_in_one_query(self):
+        source = TrustLattice(db_url=None)
+        receipts = _chain(source)
+        rows = [r.to_dict() for r in reversed(receipts)]
+        cols = list(rows[0])
+        cur = MagicMock()
+        cur.description = [(c,) for c in cols]
+        cur.fetchall.return_value = [tuple(row[c] for c in cols) for row in rows]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cur
+
+        engine = DelegationReceiptEngine(db_url="postgresql://test/test")
+        with patch.object(engine, "_get_conn", return_value=conn):
+            leaf = engine.get_delegation(receipts[-1].delegation_id, with_ancestors=True)
+            assert leaf is not None and leaf.delegation_id == receipts[-1].delegation_id
+            for r in receipts[:-1]:
+                assert engine.get_delegation(r.delegation_id) is not None
+        sql, params = cur.execute.call_args.args
+        assert cur.execute.call_count == 1
+        assert "WITH RECURSIVE" in sql and params == (receipts[-1].delegation_id, 50)
+
+
+def _session(engine: RuntimeContinuityEngine, root: str, budget: float):
+    now = time.time()
+    return engine.start_session(
+        tar_id=f"ATFTAR-{uuid.uuid4().hex[:16].upper()}",
+        delegation_id=f"ATFDR-{uuid.uuid4().hex[:16].upper()}",
+        agent_id=f"AID-FINANCE-{uuid.uuid4().hex[:16].upper()}",
+        chain_root_id=root,
+        domain="FINANCE",
+        budget_at_admission=budget,
+        dr_expires_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now + 3600)),
+        dr_issued_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
+    )
+
+
+def _scan(engine: RuntimeContinuityEngine, root: str):
+    """The pre-index O(sessions) computation, for comparison."""
+    sessions = [s for s in engine._sessions.values() if s.chain_root_id == root]
+    active = [s for s in sessions if s.status == "ACTIVE"]
+    admitted = sum(s.budget_at_admission for s in sessions)
+    total = sum(s.budget_at_admission for s in active)
+    remaining = sum(s.budget_remaining for s in active)
+    score = round((total - remaining) / total * 100.0, 4) if total > 0 else 0.0
+    return admitted, score
+
+
+class TestChainRootIndex:
+    def test_aggregates_track_lifecycle(self):
+        engine = RuntimeContinuityEngine(db_url=None)
+        root = "ATFDR-ROOT-INDEX"
+        a = _session(engine, root, 40.0)
+        b = _session(engine, root, 30.0)
+        _session(engine, "ATFDR-ROOT-OTHER", 99.0)
+        engine.sample(a.tar_id, budget_consumed=10.0)
+        engine.sample(b.tar_id, budget_consumed=6.0)
+        assert (engine._aggregate_consumed(root), engine._fragmentation_score(root)) == _scan(engine, root)
+        engine.stop_session(a.tar_id, budget_consumed=5.0)
+        assert (engine._aggregate_consumed(root), engine._fragmentation_score(root)) == _scan(engine, root)
+        engine.stop_session(b.tar_id)
+        assert engine._aggregate_consumed(root) == 0.0
+        assert root not in engine._root_index
+
+    def test_direct_root_reassignment_moves_session(self):
+        engine = RuntimeContinuityEngine(db_url=None)
+        sess = _session(engine, "ATFDR-ROOT-A", 50.0)
+        sess.chain_root_id = "ATFDR-ROOT-B"
+        assert engine._aggregate_consumed("ATFDR-ROOT-A") == 0.0
+        assert engine._aggregate_consumed("ATFDR-ROOT-B") == 50.0
+
+    def test_status_change_leaves_active_aggregate(self):
+        engine = RuntimeContinuityEngine(db_url=None)
+        root = "ATFDR-ROOT-HALT"
+        a = _session(engine, root, 50.0)
+        b = _session(engine, root, 50.0)
+        engine.sample(a.tar_id, budget_consumed=25.0)
+        a.status = "HALTED"
+        assert engine._fragmentation_score(root) == _scan(engine, root)[1] == 0.0
+        engine.sample(b.tar_id, budget_consumed=10.0)
+        assert engine._fragmentation_score(root) == pytest.approx(20.0)
@@ -0,0 +1,142 @@
+"""
+Backtest-grounded GA fitness (omnix_services.optimization.backtest_fitness)
+==========================================================================
+  · genome backtest produces real trades/metrics from OHLCV
+  · staged evaluation: dominated genomes stop early, survivors see every window
+  · per-genome fitness cache — elites and duplicates are never re-run
+  · champions are validated on the holdout and seed an A/B test
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+try:
+    from omnix_services.optimization import auto_optimizer
+    from omnix_services.optimization.auto_optimizer import (
+        ABTestingEngine,
+        GeneticOptimizer,
+        Individual,
+        StrategyParameters,
+    )
+    from omnix_services.optimization.backtest_fitness import (
+        BacktestFitnessEvaluator,
+        genome_key,
+        genome_strategy,
+    )
+    from omnix_testing.parameter_sweep import SharedOHLCV
+except Exception:                                   # pragma: no cover - optional deps
+    pytest.skip("omnix_services/omnix_testing not importable in test env", allow_module_level=True)
+
+
+def _ohlcv(n: int = 3000, seed: int = 11) -> "pd.DataFrame":
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0.0002, 0.006, n)))
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="1h"),
+        "open": close, "high": close * 1.002, "low": close * 0.998, "close": close,
+        "volume": rng.uniform(1, 10, n),
+    })
+
+
+def _population(n: int, seed: int = 0):
+    import random
+
+    random.seed(seed)
+    return [Individual(parameters=StrategyParameters().mutate(0.5)) for _ in range(n)]
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+class TestGenomeStrategy:
+    def test_backtest_produces_trades(self):
+        params = {**StrategyParameters(min_confidence_threshold=0.55).to_dict(), "_costs": {}}
+        with SharedOHLCV.from_dataframe(_ohlcv()) as data:
+            out = genome_strategy(data, 0, len(data), params)
+        m = out["metrics"]
+        assert m["total_trades"] > 0 and 0 <= m["winning_trades"] <= m["total_trades"]
+        assert 0 <= m["max_drawdown"] < 1
+        assert out["final_capital"] == pytest.approx(10000 + m["profit_usd"])
+
+    def test_unreachable_threshold_never_trades(self):
+        params = {**StrategyParameters(min_confidence_threshold=1.01).to_dict(), "_costs": {}}
+        with SharedOHLCV.from_dataframe(_ohlcv(500)) as data:
+            out = genome_strategy(data, 0, len(data), params)
+        assert out["metrics"]["total_trades"] == 0 and out["final_capital"] == 10000
+
+
+class TestBacktestFitnessEvaluator:
+    def test_windows_and_holdout_are_disjoint(self):
+        with BacktestFitnessEvaluator(_ohlcv(), n_windows=3, holdout_ratio=0.2, max_workers=1) as ev:
+            assert ev.windows == [(0, 800), (800, 1600), (1600, 2400)]
+            assert ev.holdout == (2400, 3000)
+
+    def test_cache_and_early_stopping(self):
+        population = _population(12)
+        with BacktestFitnessEvaluator(_ohlcv(), n_windows=3, prune_ratio=0.9, keep_top=2,
+                                      max_workers=1) as ev:
+            ev.evaluate_population(population)
+            assert len(ev.fitness_cache) == 12
+            assert ev.backtests < 12 * 3                       # dominated genomes stopped early
+            survivors = [i for i in population if not i.pruned]
+            assert survivors and max(i.fitness for i in survivors) == max(i.fitness for i in population)
+
+            backtests = ev.backtests
+            clone = Individual(parameters=StrategyParameters.from_dict(population[0].parameters.to_dict()))
+            ev.evaluate_population(population + [clone])
+            assert ev.backtests == backtests and ev.cache_hits == 13
+            assert clone.fitness == population[0].fitness
+
+    def test_fitness_uses_individual_formula(self):
+        (ind,) = _population(1, seed=3)
+        with BacktestFitnessEvaluator(_ohlcv(), n_windows=2, max_workers=1) as ev:
+            ev.evaluate_population([ind])
+            entry = ev.fitness_cache[genome_key(ind.parameters)]
+        check = Individual(parameters=ind.parameters, trades_count=entry["trades"],
+                           win_rate=entry["win_rate"], profit_usd=entry["profit_usd"],
+                           sharpe_ratio=entry["sharpe_ratio"], max_drawdown=entry["max_drawdown"])
+        assert ind.fitness == pytest.approx(check.calculate_fitness())
+
+    def test_pool_matches_serial(self):
+        population = _population(4, seed=5)
+        with BacktestFitnessEvaluator(_ohlcv(), prune_ratio=0, max_workers=1) as ev:
+            ev.evaluate_population(population)
+            serial = [i.fitness for i in population]
+        population = _population(4, seed=5)
+        with BacktestFitnessEvaluator(_ohlcv(), prune_ratio=0, max_workers=2) as ev:
+            ev.evaluate_population(population)
+        assert [i.fitness for i in population] == serial
+
+
+class TestGeneticOptimizerIntegration:
+    def test_optimize_and_ab_test_from_champions(self):
+        with BacktestFitnessEvaluator(_ohlcv(), n_windows=2, max_workers=1) as ev:
+            ga = GeneticOptimizer(population_size=8, generations=3, elite_size=2,
+                                  tournament_size=3, fitness_evaluator=ev)
+            best = ga.optimize()
+            assert ev.keep_top == 2
+            champions = ga.get_champions(2)
+            assert champions[0].fitness == best.fitness == max(e["fitness"] for e in ev.fitness_cache.values())
+
+        assert 1 <= len(champions) <= 2
+        assert all(c.holdout_fitness is not None and not c.pruned for c in champions)
+        engine = ABTestingEngine()
+        test_id = engine.create_test_from_champions("ga champions", champions)
+        variants = engine.active_tests[test_id]["variants"]
+        assert variants[auto_optimizer.TestVariant.VARIANT_A]["params"] == champions[0].parameters.to_dict()
+        assert variants[auto_optimizer.TestVariant.VARIANT_A]["backtest"]["holdout_fitness"] == champions[0].holdout_fitness
+
+    def test_without_evaluator_keeps_legacy_fitness(self):
+        ga = GeneticOptimizer(population_size=6, elite_size=2, tournament_size=2)
+        ga.initialize_population()
+        ga.population[0].trades_count, ga.population[0].win_rate = 20, 60.0
+        ga.evaluate_population()
+        assert ga.population[0].fitness == pytest.approx(18.0)
+        assert ga.get_champions(1)[0] is ga.population[0]
@@ -0,0 +1,355 @@
+"""
+Bulk receipt archival (ADR-126) — BulkReceiptArchiver
+=====================================================
+  · HOT → WARM via INSERT … SELECT, set-based hash verification, batched index
+  · keyset checkpoints: time budget resume, rollback leaves the cursor alone
+  · WARM → COLD: PostgreSQL fallback and packed objects with an offset index
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+
+import omnix_core.evidence.bulk_archival as ba
+from omnix_core.evidence.receipt_archival import (
+    _HOT_COLUMNS,
+    COLD_TABLE,
+    HOT_TABLE,
+    INDEX_TABLE,
+    PROGRESS_TABLE,
+    WARM_TABLE,
+    PostgreSQLColdBackend,
+    ReceiptArchivalService,
+    S3ColdBackend,
+    pack_location,
+    parse_pack_location,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def _receipt(i: int, age_days: int) -> Dict:
+    row = {c: None for c in _HOT_COLUMNS}
+    rid = f"OMNIX-TRD-{i:012X}"
+    ts = NOW - timedelta(days=age_days, seconds=i)
+    row.update(receipt_id=rid, timestamp_utc=ts, created_at=ts, asset="BTC",
+               decision="APPROVED", client_id="c1", domain="trading",
+               content_hash=hashlib.sha256(rid.encode()).hexdigest())
+    return row
+
+
+class FakeDB:
+    def __init__(self):
+        self.tables = {HOT_TABLE: {}, WARM_TABLE: {}, COLD_TABLE: {}}
+        self.index: Dict[str, Dict] = {}
+        self.progress: Dict[str, list] = {}
+        self.statements = []
+        self.fail_on = None
+        self._snapshot = None
+        self.commit()
+
+    def _state(self):
+        return (self.tables, self.index, self.progress)
+
+    def commit(self):
+        self._snapshot = copy.deepcopy(self._state())
+
+    def rollback(self):
+        self.tables, self.index, self.progress = copy.deepcopy(self._snapshot)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = []
+
+    def execute(self, sql, params=()):
+        db, params = self.db, list(params or ())
+        db.statements.append(sql)
+        if db.fail_on and db.fail_on in sql:
+            db.fail_on = None
+            raise RuntimeError("connection reset")
+        self._result = []
+        if f"INSERT INTO {PROGRESS_TABLE}" in sql:
+            db.progress.setdefault(params[0], [None, None, 0, 0, 0])
+        elif f"FROM {PROGRESS_TABLE}" in sql:
+            self._result = [tuple(db.progress[params[0]][:2])]
+        elif f"UPDATE {PROGRESS_TABLE}" in sql:
+            ts, rid, archived, errors, passes, job = params
+            p = db.progress[job]
+            db.progress[job] = [ts, rid, p[2] + archived, p[3] + errors, p[4] + passes]
+        elif "ORDER BY" in sql:
+            table = re.search(r"FROM (\w+)", sql).group(1)
+            col = re.search(r"ORDER BY (\w+)", sql).group(1)
+            days = int(re.search(r"INTERVAL '(\d+) days'", sql).group(1))
+            limit = params[-1]
+            cursor = tuple(params[:2]) if len(params) == 3 else None
+            rows = sorted(db.tables[table].values(), key=lambda r: (r[col], r["receipt_id"]))
+            rows = [r for r in rows if r[col] < NOW - timedelta(days=days)
+                    and (cursor is None or (r[col], r["receipt_id"]) > cursor)]
+            self._result = [tuple(r[c] for c in _HOT_COLUMNS) + (r[col],) for r in rows[:limit]]
+        elif sql.lstrip().startswith("INSERT INTO decision_receipts"):
+            dest = re.search(r"INSERT INTO (\w+)", sql).group(1)
+            source = re.search(r"FROM (\w+)", sql).group(1)
+            archived_at, source_tier, ids = params[0], params[1], params[2:]
+            for rid in ids:
+                if rid in db.tables[source] and rid not in db.tables[dest]:
+                    db.tables[dest][rid] = dict(db.tables[source][rid], archived_at=archived_at,
+                                                source_tier=source_tier)
+        elif "SELECT receipt_id, content_hash" in sql:
+            table = re.search(r"FROM (\w+)", sql).group(1)
+            self._result = [(rid, db.tables[table][rid]["content_hash"])
+                            for rid in params if rid in db.tables[table]]
+        elif sql.startswith("DELETE FROM"):
+            table = re.search(r"FROM (\w+)", sql).group(1)
+            for rid in params:
+                db.tables[table].pop(rid, None)
+        elif f"INSERT INTO {INDEX_TABLE}" in sql:
+            width = 10 if "retry_count" in sql else 9
+            for j in range(0, len(params), width):
+                rid, tier, loc, ch, _sig, _ts, _cl, _dom, status = params[j:j + 9]
+                prev = db.index.get(rid, {"retry_count": 0})
+                db.index[rid] = {
+                    "tier": tier, "storage_location": loc, "content_hash": ch,
+                    "archival_status": status,
+                    "last_error": params[j + 9] if width == 10 else None,
+                    "retry_count": prev["retry_count"] + (1 if width == 10 else 0),
+                }
+        else:
+            raise AssertionError(f"unscripted SQL: {sql}")
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return list(self._result)
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+
+class MemoryPackBackend(S3ColdBackend):
+    """S3ColdBackend with an in-memory bucket for put_pack / ranged get."""
+
+    def __init__(self, fail_packs=0):
+        self.objects: Dict[str, bytes] = {}
+        self.fail_packs = fail_packs
+
+    def put_pack(self, records, ts_utc, part_size):
+        if self.fail_packs:
+            self.fail_packs -= 1
+            raise ConnectionError("upload reset")
+        body, locs, pos = b"", [], 0
+        for _, _, blob in records:
+            body += blob + b"\n"
+            locs.append((pos, len(blob)))
+            pos += len(blob) + 1
+        key = self._make_pack_key(hashlib.sha256(body).hexdigest(), ts_utc)
+        self.objects[key] = body
+        return [pack_location(key, off, ln) for off, ln in locs]
+
+    def _get_packed(self, storage_location):
+        key, offset, length = parse_pack_location(storage_location)
+        return json.loads(self.objects[key][offset:offset + length])["receipt"]
+
+
+def _service(backend=None):
+    svc = ReceiptArchivalService(db_url="postgresql://test/test")
+    svc._cold_backend = backend or PostgreSQLColdBackend()
+    return svc
+
+
+def _seed(db, table, count, age_days, start=0):
+    for i in range(start, start + count):
+        db.tables[table][_receipt(i, 0)["receipt_id"]] = dict(
+            _receipt(i, age_days), archived_at=NOW - timedelta(days=age_days, seconds=i))
+    db.commit()
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HOT → WARM
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestHotToWarm:
+    def test_chunks_move_old_receipts_only(self, db):
+        _seed(db, HOT_TABLE, 23, age_days=40)
+        _seed(db, HOT_TABLE, 4, age_days=2, start=100)
+        archiver = ba.BulkReceiptArchiver(_service(), chunk_size=10, workers=3)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (23, 0)
+        db.rollback()   # only committed state counts
+        assert len(db.tables[WARM_TABLE]) == 23
+        assert len(db.tables[HOT_TABLE]) == 4
+        assert {e["archival_status"] for e in db.index.values()} == {"ARCHIVED"}
+        entry = db.index["OMNIX-TRD-000000000000"]
+        assert entry["storage_location"] == f"pg::{WARM_TABLE}::OMNIX-TRD-000000000000"
+        assert db.progress[ba.JOB_HOT_TO_WARM] == [None, None, 23, 0, 1]
+        copies = [s for s in db.statements if s.lstrip().startswith(f"INSERT INTO {WARM_TABLE}")]
+        assert len(copies) == 3
+
+    def test_conflicting_warm_row_is_an_error_and_retried(self, db):
+        _seed(db, HOT_TABLE, 5, age_days=40)
+        bad = _receipt(2, 40)
+        db.tables[WARM_TABLE][bad["receipt_id"]] = dict(bad, content_hash="f" * 64)
+        db.commit()
+        archiver = ba.BulkReceiptArchiver(_service(), chunk_size=50)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (4, 1)
+        assert list(db.tables[HOT_TABLE]) == [bad["receipt_id"]]
+        entry = db.index[bad["receipt_id"]]
+        assert entry["archival_status"] == "ERROR"
+        assert "hash mismatch" in entry["last_error"]
+        archiver.archive_hot_to_warm(FakeConn(db))
+        assert db.index[bad["receipt_id"]]["retry_count"] == 2
+
+    def test_invalid_signature_never_copied(self, db):
+        _seed(db, HOT_TABLE, 6, age_days=40)
+        tampered = _receipt(3, 40)["receipt_id"]
+
+        def verdict(row):
+            return False if row["receipt_id"] == tampered else None
+
+        with patch.object(ba, "_verify_pqc_signature", side_effect=verdict):
+            result = ba.BulkReceiptArchiver(_service(), workers=4).archive_hot_to_warm(FakeConn(db))
+        assert result == (5, 1)
+        assert tampered not in db.tables[WARM_TABLE]
+        assert tampered in db.tables[HOT_TABLE]
+        assert "PQC signature invalid" in db.index[tampered]["last_error"]
+
+    def test_service_routes_to_bulk_engine(self, db):
+        _seed(db, HOT_TABLE, 3, age_days=40)
+        svc = _service()
+        assert svc.bulk
+        assert svc.archive_hot_to_warm(FakeConn(db)) == (3, 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Checkpoints
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestCheckpoints:
+    def test_time_budget_resumes_from_cursor(self, db):
+        _seed(db, HOT_TABLE, 25, age_days=40)
+        archiver = ba.BulkReceiptArchiver(_service(), chunk_size=10, max_seconds=0)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (10, 0)
+        cursor_ts, cursor_id = db.progress[ba.JOB_HOT_TO_WARM][:2]
+        assert cursor_id == _receipt(15, 40)["receipt_id"]   # oldest first
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (10, 0)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (5, 0)
+        assert db.tables[HOT_TABLE] == {}
+        assert db.progress[ba.JOB_HOT_TO_WARM][:2] == [None, None]
+
+    def test_cursor_skips_error_rows_within_a_pass(self, db):
+        _seed(db, HOT_TABLE, 12, age_days=40)
+        for i in (0, 1):
+            bad = _receipt(i, 40)
+            db.tables[WARM_TABLE][bad["receipt_id"]] = dict(bad, content_hash="0" * 64)
+        db.commit()
+        archiver = ba.BulkReceiptArchiver(_service(), chunk_size=2)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (10, 2)
+        assert len(db.tables[HOT_TABLE]) == 2
+
+    def test_failed_chunk_rolls_back_and_keeps_cursor(self, db):
+        _seed(db, HOT_TABLE, 8, age_days=40)
+        db.fail_on = f"DELETE FROM {HOT_TABLE}"
+        archiver = ba.BulkReceiptArchiver(_service(), chunk_size=4)
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (0, 1)
+        assert len(db.tables[HOT_TABLE]) == 8
+        assert db.tables[WARM_TABLE] == {}
+        assert db.index == {}
+        assert archiver.archive_hot_to_warm(FakeConn(db)) == (8, 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# WARM → COLD
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestWarmToCold:
+    def test_postgres_fallback_copies_set_based(self, db):
+        _seed(db, WARM_TABLE, 7, age_days=400)
+        _seed(db, WARM_TABLE, 2, age_days=30, start=50)
+        assert ba.BulkReceiptArchiver(_service()).archive_warm_to_cold(FakeConn(db)) == (7, 0)
+        assert len(db.tables[COLD_TABLE]) == 7
+        assert len(db.tables[WARM_TABLE]) == 2
+        assert {e["tier"] for e in db.index.values()} == {"COLD"}
+        assert {r["source_tier"] for r in db.tables[COLD_TABLE].values()} == {"WARM"}
+
+    def test_s3_packs_many_receipts_per_object(self, db):
+        _seed(db, WARM_TABLE, 11, age_days=400)
+        backend = MemoryPackBackend()
+        svc = _service(backend)
+        archiver = ba.BulkReceiptArchiver(svc, chunk_size=100, pack_receipts=4)
+        assert archiver.archive_warm_to_cold(FakeConn(db)) == (11, 0)
+        assert len(backend.objects) == 3
+        assert db.tables[WARM_TABLE] == {} and db.tables[COLD_TABLE] == {}
+        rid = _receipt(6, 400)["receipt_id"]
+        location = db.index[rid]["storage_location"]
+        assert location.startswith("pack::receipts/packs/")
+        receipt, tier = svc.fetch_receipt_any_tier(
+            type("C", (), {"cursor": lambda self: _IndexOnlyCursor(db)})(), rid)
+        assert tier == "COLD"
+        assert receipt["receipt_id"] == rid
+        assert receipt["content_hash"] == _receipt(6, 400)["content_hash"]
+
+    def test_failed_pack_leaves_its_receipts_in_warm(self, db):
+        _seed(db, WARM_TABLE, 6, age_days=400)
+        backend = MemoryPackBackend(fail_packs=1)
+        archiver = ba.BulkReceiptArchiver(_service(backend), pack_receipts=3, workers=1)
+        assert archiver.archive_warm_to_cold(FakeConn(db)) == (3, 3)
+        assert len(db.tables[WARM_TABLE]) == 3
+        errored = [e for e in db.index.values() if e["archival_status"] == "ERROR"]
+        assert len(errored) == 3
+        assert all("upload reset" in e["last_error"] for e in errored)
+
+
+class _IndexOnlyCursor:
+    """Answers fetch_receipt_any_tier: HOT miss, then the archival_index row."""
+
+    def __init__(self, db):
+        self.db, self._row = db, None
+
+    def execute(self, sql, params=()):
+        entry = self.db.index.get(params[0]) if INDEX_TABLE in sql else None
+        self._row = (entry["tier"], entry["storage_location"], entry["content_hash"]) if entry else None
+
+    def fetchone(self):
+        return self._row
+
+    def close(self):
+        pass
+
+
+class TestPackLocation:
+    def test_round_trip(self):
+        loc = pack_location("receipts/packs/2025/01/ab.jsonl", 1024, 377)
+        assert parse_pack_location(loc) == ("receipts/packs/2025/01/ab.jsonl", 1024, 377)
+
+    def test_record_encoding_matches_single_object_envelope(self):
+        row = _receipt(1, 400)
+        body = json.loads(S3ColdBackend.encode_record(row, "2026-01-01T00:00:00+00:00"))
+        assert body["metadata"]["hash"] == row["content_hash"]
+        assert body["receipt"]["timestamp_utc"] == row["timestamp_utc"].isoformat()
@@ -0,0 +1,267 @@
+"""
+COLD Archive Block v2 (sha256-merkle-v2) — ADR-163
+==================================================
+  · StreamingMerkleRoot / _MerkleLevels agree with the RFC 6962 tree
+  · ColdBlockSealer.seal_stream: pooled hashing, proofs sidecar, bounded output
+  · omnix_atf_verify.py accepts v1 and v2 blocks, and single-artifact proofs
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+import omnix_core.evidence.cold_block_sealer as cbs
+from omnix_core.evidence import merkle_log
+from omnix_core.evidence.cold_block_sealer import (
+    HASH_ALGORITHM_V1,
+    HASH_ALGORITHM_V2,
+    ColdBlockSealer,
+    StreamingMerkleRoot,
+    compute_merkle_root,
+    compute_merkle_root_v2,
+    merkle_leaf_digest,
+    verify_artifact_proof,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_verifier():
+    path = ROOT / "docs" / "zenodo" / "submission_package" / "omnix_atf_verify.py"
+    spec = importlib.util.spec_from_file_location("omnix_atf_verify_v2", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["omnix_atf_verify_v2"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+verifier = _load_verifier()
+
+
+def _artifacts(n: int, evidence_class: str = "TELEMETRY") -> List[Dict]:
+    out = []
+    for i in range(n):
+        aid = f"ART-{uuid.uuid4().hex[:10].upper()}"
+        out.append({
+            "artifact_id": aid,
+            "evidence_class": evidence_class,
+            "content_hash": hashlib.sha256(f"{aid}:{i}".encode()).hexdigest(),
+        })
+    return out
+
+
+def _rfc6962_tree(hashes: List[str]) -> merkle_log.MerkleTree:
+    return merkle_log.MerkleTree(merkle_leaf_digest(h).hex() for h in hashes)
+
+
+def _read_proofs(result) -> List[Dict]:
+    with open(result.proofs_file) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def sealer(tmp_path):
+    return ColdBlockSealer(output_dir=str(tmp_path), hash_algorithm=HASH_ALGORITHM_V2,
+                           hash_workers=4)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tree construction
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestMerkleV2:
+    def test_streaming_root_matches_rfc6962(self):
+        hashes = [a["content_hash"] for a in _artifacts(70)]
+        for n in range(1, 71):
+            tree = _rfc6962_tree(hashes[:n])
+            assert compute_merkle_root_v2(hashes[:n]) == "sha256:" + tree.root()
+
+    def test_root_is_order_dependent(self):
+        hashes = [a["content_hash"] for a in _artifacts(4)]
+        assert compute_merkle_root_v2(hashes) != compute_merkle_root_v2(list(reversed(hashes)))
+        assert compute_merkle_root(hashes) == compute_merkle_root(list(reversed(hashes)))
+
+    def test_empty_root_matches_v1_sentinel(self):
+        assert compute_merkle_root_v2([]) == compute_merkle_root([])
+        assert StreamingMerkleRoot().count == 0
+
+    def test_spilled_levels_give_rfc6962_audit_paths(self, tmp_path):
+        hashes = [a["content_hash"] for a in _artifacts(37)]
+        for n in (1, 2, 5, 16, 37):
+            workdir = tmp_path / f"n{n}"
+            workdir.mkdir()
+            levels = cbs._MerkleLevels(workdir)
+            for h in hashes[:n]:
+                levels.append(merkle_leaf_digest(h))
+            tree = _rfc6962_tree(hashes[:n])
+            assert levels.build().hex() == tree.root()
+            for i in range(n):
+                assert levels.audit_path(i) == tree.inclusion_proof(i)
+            levels.close()
+
+    def test_verifier_root_matches_sealer(self):
+        hashes = [a["content_hash"] for a in _artifacts(23)]
+        assert verifier._compute_merkle_root_v2(hashes) == compute_merkle_root_v2(hashes)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# seal_stream
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestSealStream:
+    def test_generator_sealed_with_proofs_sidecar(self, sealer, tmp_path):
+        arts = _artifacts(45)
+        with patch.object(cbs, "_HASH_CHUNK_SIZE", 4):
+            result = sealer.seal_stream(a for a in arts)
+        assert result.success, result.errors
+        block = result.block
+        manifest = block.integrity_manifest
+        assert manifest["hash_algorithm"] == HASH_ALGORITHM_V2
+        assert "artifact_hashes" not in manifest
+        assert manifest["merkle_root"] == compute_merkle_root_v2(a["content_hash"] for a in arts)
+        assert block.artifact_count == manifest["leaf_count"] == 45
+        proofs = _read_proofs(result)
+        assert [p["artifact_id"] for p in proofs] == [a["artifact_id"] for a in arts]
+        for p in proofs:
+            assert verify_artifact_proof(p["content_hash"], p["leaf_index"], 45,
+                                         p["audit_path"], manifest["merkle_root"])
+        assert sorted(x.name for x in tmp_path.iterdir()) == sorted(
+            [block.block_file_name, block.proofs_file_name])
+
+    def test_canonical_hash_commits_to_v2(self, sealer):
+        result = sealer.seal_stream(_artifacts(3))
+        block = result.block
+        assert block.canonical_hash == cbs.compute_canonical_hash(
+            block.block_id, block.creation_timestamp_ns, block.artifact_count,
+            block.evidence_classes, block.integrity_manifest["merkle_root"],
+            block.predecessor_block_hash, hash_algorithm=HASH_ALGORITHM_V2,
+        )
+
+    def test_payload_bodies_hashed_on_pool(self, sealer, tmp_path):
+        blob = tmp_path / "blob.bin"
+        blob.write_bytes(b"x" * (3 * cbs._PAYLOAD_READ_SIZE + 17))
+        arts = [
+            {"artifact_id": "A-BYTES", "evidence_class": "OPS", "payload": b"hello"},
+            {"artifact_id": "A-FILE", "evidence_class": "OPS", "payload_path": str(blob)},
+        ]
+        result = sealer.seal_stream(arts)
+        assert result.success, result.errors
+        hashes = [p["content_hash"] for p in _read_proofs(result)]
+        assert hashes == [
+            "sha256:" + hashlib.sha256(b"hello").hexdigest(),
+            "sha256:" + hashlib.sha256(blob.read_bytes()).hexdigest(),
+        ]
+
+    def test_invalid_stream_writes_nothing(self, sealer, tmp_path):
+        arts = _artifacts(10)
+        del arts[6]["content_hash"]
+        arts.append({"artifact_id": "A-GONE", "payload_path": str(tmp_path / "missing")})
+        result = sealer.seal_stream(iter(arts))
+        assert not result.success
+        assert len(result.errors) == 2
+        assert "EAP-INV-001" in result.errors[0]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_custody_streamed_to_callback(self, sealer):
+        seen = []
+        result = sealer.seal_stream(_artifacts(7, "LEGAL"), trigger="halt_event",
+                                    on_custody=seen.append)
+        assert result.custody_entries == []
+        assert len(seen) == 7
+        assert {e.transition for e in seen} == {"EMERGENCY_COLD"}
+        assert {e.block_id for e in seen} == {result.block.block_id}
+        assert any("EAP-INV-002 advisory: 7" in w for w in result.warnings)
+
+    def test_seal_delegates_for_v2_sealer(self, sealer):
+        result = sealer.seal(_artifacts(5))
+        assert result.proofs_file
+        assert result.block.integrity_manifest["hash_algorithm"] == HASH_ALGORITHM_V2
+        assert len(result.custody_entries) == 5
+
+    def test_v1_default_unchanged(self, tmp_path):
+        result = ColdBlockSealer(output_dir=str(tmp_path)).seal(_artifacts(3))
+        assert result.block.integrity_manifest["hash_algorithm"] == HASH_ALGORITHM_V1
+        assert result.proofs_file is None
+
+    def test_unknown_algorithm_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ColdBlockSealer(output_dir=str(tmp_path), hash_algorithm="md5")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Offline verifier
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestVerifierV2:
+    def _sealed(self, sealer, n=19):
+        result = sealer.seal_stream(_artifacts(n))
+        return result.block.to_dict(), _read_proofs(result), result
+
+    def test_v2_block_with_proofs_passes(self, sealer):
+        block, proofs, _ = self._sealed(sealer)
+        res = verifier.verify_archive_block(block, proofs=iter(proofs))
+        assert res.verdict == verifier.VERDICT_PASS, res.failure_reasons
+        assert res.merkle_valid and res.merkle_checked
+        assert res.artifact_hashes_count == 19
+
+    def test_v2_block_without_proofs_warns(self, sealer):
+        block, _, _ = self._sealed(sealer)
+        res = verifier.verify_archive_block(block)
+        assert res.verdict == verifier.VERDICT_PASS
+        assert not res.merkle_checked
+        assert any("proofs file" in w for w in res.warnings)
+
+    def test_tampered_content_hash_detected(self, sealer):
+        block, proofs, _ = self._sealed(sealer)
+        proofs[4]["content_hash"] = "0" * 64
+        res = verifier.verify_archive_block(block, proofs=proofs)
+        assert res.verdict == verifier.VERDICT_INTEGRITY_VIOLATION
+        assert proofs[4]["artifact_id"] in res.failure_reasons[0]
+
+    def test_dropped_proof_line_detected(self, sealer):
+        block, proofs, _ = self._sealed(sealer)
+        res = verifier.verify_archive_block(block, proofs=proofs[:-1])
+        assert res.verdict == verifier.VERDICT_INTEGRITY_VIOLATION
+        assert not res.artifact_hashes_valid
+
+    def test_single_artifact_proof(self, sealer):
+        block, proofs, _ = self._sealed(sealer)
+        ok, _ = verifier.verify_artifact_proof(block, proofs[11])
+        assert ok
+        forged = dict(proofs[11], leaf_index=12)
+        assert not verifier.verify_artifact_proof(block, forged)[0]
+
+    def test_cli_auto_detects_sidecar_and_artifact_proof(self, sealer, tmp_path, capsys):
+        block, proofs, result = self._sealed(sealer)
+        proof_file = tmp_path / "one.json"
+        proof_file.write_text(json.dumps(proofs[3]))
+
+        with patch.object(sys, "argv", ["v", "--archive-block", result.block_file, "--json"]):
+            assert verifier.main() == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["merkle_checked"] and out["hash_algorithm"] == HASH_ALGORITHM_V2
+
+        proofs[3]["content_hash"] = "f" * 64
+        proof_file.write_text(json.dumps(proofs[3]))
+        with patch.object(sys, "argv", ["v", "--archive-block", result.block_file,
+                                        "--artifact-proof", str(proof_file), "--json"]):
+            assert verifier.main() == 1
+        out = json.loads(capsys.readouterr().out)
+        assert out["verdict"] == verifier.VERDICT_PASS
+        assert out["artifact_proof"]["valid"] is False
+
+    def test_v1_block_still_verifies(self, tmp_path):
+        result = ColdBlockSealer(output_dir=str(tmp_path)).seal(_artifacts(6))
+        res = verifier.verify_archive_block(result.block.to_dict())
+        assert res.verdict == verifier.VERDICT_PASS
+        assert res.merkle_checked
@@ -0,0 +1,195 @@
+"""
+Shared pooled connection provider
+(omnix_services/database_service/connection_provider.py)
+
+  TestPoolReuse          — connections are returned and reused, state reset
+  TestSubsystemLimits    — per-subsystem max + PoolTimeout + statement_timeout
+  TestForkSafety         — a new PID gets fresh pools; inherited ones are parked
+  TestPoolMetrics        — pool-wait stats exported via observe_pool_stats()
+
+Runs without a database: a fake driver stands in for psycopg / psycopg2.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+
+from omnix_services.database_service import connection_provider as cp
+
+
+class _FakeConn:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+        self.in_tx = False
+        self.autocommit = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        self.in_tx = True
+        return object()
+
+    def commit(self):
+        self.commits += 1
+        self.in_tx = False
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_tx = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeDriver(cp.PoolDriver):
+    name = "fake"
+    closes_on_exit = True
+
+    def __init__(self):
+        self.opened = []
+        self.timeouts = []
+
+    def connect(self, conninfo, statement_timeout_ms):
+        self.timeouts.append(statement_timeout_ms)
+        conn = _FakeConn(len(self.opened))
+        self.opened.append(conn)
+        return conn
+
+    def is_usable(self, conn):
+        return not conn.closed
+
+    def reset(self, conn):
+        if conn.in_tx:
+            conn.rollback()
+        conn.autocommit = False
+
+
+@pytest.fixture(autouse=True)
+def _pooling(monkeypatch):
+    monkeypatch.setenv("OMNIX_DB_POOLING", "true")
+    monkeypatch.setenv("OMNIX_DB_POOL_TIMEOUT_S", "0.05")
+    cp.close_all_pools()
+    yield
+    cp.close_all_pools()
+    cp._parked.clear()
+
+
+URL = "postgresql://fake/omnix"
+
+
+class TestPoolReuse:
+
+    def test_close_returns_connection_for_reuse(self):
+        drv = _FakeDriver()
+        c1 = cp.get_connection("bev", URL, driver=drv)
+        raw = c1._conn
+        c1.close()
+        c1.close()  # idempotent
+        c2 = cp.get_connection("bev", URL, driver=drv)
+        assert c2._conn is raw
+        assert len(drv.opened) == 1
+        c2.close()
+
+    def test_uncommitted_work_rolled_back_on_return(self):
+        drv = _FakeDriver()
+        conn = cp.get_connection("bev", URL, driver=drv)
+        conn.cursor()
+        conn.autocommit = True
+        raw = conn._conn
+        conn.close()
+        assert raw.rollbacks == 1 and raw.autocommit is False
+
+    def test_context_manager_commits_and_returns(self):
+        drv = _FakeDriver()
+        with cp.get_connection("bev", URL, driver=drv) as conn:
+            conn.cursor()
+        assert drv.opened[0].commits == 1
+        assert cp.get_pool_stats()["fake:bev"]["in_use"] == 0
+
+    def test_pooled_connection_rolls_back_on_error(self):
+        drv = _FakeDriver()
+        with pytest.raises(ValueError):
+            with cp.pooled_connection("bev", URL, driver=drv) as conn:
+                conn.cursor()
+                raise ValueError("boom")
+        assert drv.opened[0].rollbacks == 1
+        assert cp.get_pool_stats()["fake:bev"]["pool_available"] == 1
+
+    def test_broken_connection_discarded(self):
+        drv = _FakeDriver()
+        conn = cp.get_connection("bev", URL, driver=drv)
+        conn._conn.closed = True
+        conn.close()
+        stats = cp.get_pool_stats()["fake:bev"]
+        assert stats["pool_available"] == 0 and stats["discarded"] == 1
+
+    def test_no_url_returns_none(self, monkeypatch):
+        for var in ("DATABASE_URL", "OMNIX_DB_URL", "POSTGRES_URL", "DATABASE_PUBLIC_URL"):
+            monkeypatch.delenv(var, raising=False)
+        assert cp.get_connection("bev", driver=_FakeDriver()) is None
+
+    def test_pooling_disabled_connects_directly(self, monkeypatch):
+        monkeypatch.setenv("OMNIX_DB_POOLING", "false")
+        drv = _FakeDriver()
+        conn = cp.get_connection("bev", URL, driver=drv)
+        assert conn is drv.opened[0]
+        assert cp.get_pool_stats() == {}
+
+
+class TestSubsystemLimits:
+
+    def test_max_size_and_pool_timeout(self, monkeypatch):
+        monkeypatch.setenv("OMNIX_DB_POOL_ARCHIVAL_MAX", "1")
+        drv = _FakeDriver()
+        held = cp.get_connection("archival", URL, driver=drv)
+        with pytest.raises(cp.PoolTimeout):
+            cp.get_connection("archival", URL, driver=drv)
+        # Other subsystems are not starved by archival
+        cp.get_connection("web", URL, driver=drv).close()
+        held.close()
+        cp.get_connection("archival", URL, driver=drv).close()
+        assert cp.get_pool_stats()["fake:archival"]["timeouts"] == 1
+
+    def test_statement_timeout_per_subsystem(self, monkeypatch):
+        monkeypatch.setenv("OMNIX_DB_STATEMENT_TIMEOUT_MS_BEV", "1234")
+        drv = _FakeDriver()
+        cp.get_connection("bev", URL, driver=drv).close()
+        cp.get_connection("archival", URL, driver=drv).close()
+        assert drv.timeouts == [1234, cp._SUBSYSTEM_DEFAULTS["archival"][1]]
+
+    def test_statement_timeout_passed_as_server_option(self):
+        opts = cp.PoolDriver._options(15000)
+        assert opts["options"] == "-c statement_timeout=15000"
+        assert "options" not in cp.PoolDriver._options(0)
+
+
+class TestForkSafety:
+
+    def test_child_pid_gets_fresh_pool_and_parks_parent(self, monkeypatch):
+        drv = _FakeDriver()
+        cp.get_connection("bev", URL, driver=drv).close()
+        parent_conn = drv.opened[0]
+        monkeypatch.setattr(cp.os, "getpid", lambda: -1)
+        child = cp.get_connection("bev", URL, driver=drv)
+        assert child._conn is not parent_conn
+        assert parent_conn.closed is False       # parent's socket untouched
+        assert len(cp._parked) == 1
+        child.close()
+
+
+class TestPoolMetrics:
+
+    def test_observe_pool_stats_exports_subsystems(self):
+        from omnix_core.observability.metrics import GovernanceMetricsRegistry
+        drv = _FakeDriver()
+        for _ in range(3):
+            cp.get_connection("governance", URL, driver=drv).close()
+        snap = GovernanceMetricsRegistry.reset_for_testing().observe_pool_stats()
+        assert snap is not None
+        sub = snap.subsystems["fake:governance"]
+        assert sub["acquired"] == 3 and sub["opened"] == 1
+        assert sub["wait"]["count"] == 3 and sub["wait"]["p99_ms"] is not None
+        assert "subsystems" in snap.to_dict()
@@ -0,0 +1,182 @@
+"""
+CTCHC verified checkpoints — incremental verify_chain
+=====================================================
+  · a passing verify persists a K-boundary checkpoint; the next call re-hashes only the tail
+  · tampering after / at the checkpoint is still detected; forged checkpoints are ignored
+  · sealed chains are checkpointed at the tip; full=True always walks from genesis
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+
+
+def _engine(interval: int = 4) -> CTCHCEngine:
+    with patch.dict("os.environ", {"OMNIX_CTCHC_CHECKPOINT_INTERVAL": str(interval)}):
+        e = CTCHCEngine()
+    e._db_url = None
+    return e
+
+
+def _chain(engine: CTCHCEngine, session_id: str = "S-CP", turns: int = 10) -> None:
+    engine.initialize_chain(session_id, "RCP-001")
+    _extend(engine, session_id, 0, turns)
+
+
+def _extend(engine: CTCHCEngine, session_id: str, start: int, stop: int) -> None:
+    for i in range(start, stop):
+        engine.append_turn(session_id=session_id, turn_index=i, bar_id=f"BAR-{i}",
+                           ccs_id=f"CCS-{i}", output_hash=f"out-{i}",
+                           governing_receipt_id="RCP-001")
+
+
+@pytest.fixture(autouse=True)
+def _no_signing_key():
+    with patch("omnix_core.security.crypto_providers.get_signing_key", return_value=None):
+        yield
+
+
+class TestIncrementalVerify:
+    def test_first_verify_full_then_tail_only(self):
+        engine = _engine()
+        _chain(engine)
+        first = engine.verify_chain("S-CP")
+        assert first["verified"] and first["verification_mode"] == "full"
+        assert first["links_rehashed"] == 10
+        assert [c.turn_index for c in engine.get_checkpoints("S-CP")] == [7]
+
+        second = engine.verify_chain("S-CP")
+        assert second["verified"] and second["verification_mode"] == "incremental"
+        assert (second["checkpoint_turn"], second["links_rehashed"]) == (7, 2)
+        assert second["turn_count"] == 10
+
+    def test_checkpoint_advances_with_new_turns(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        _extend(engine, "S-CP", 10, 17)
+        result = engine.verify_chain("S-CP")
+        assert result["verified"] and result["links_rehashed"] == 9
+        assert engine.get_checkpoints("S-CP")[0].turn_index == 15
+        assert engine.verify_chain("S-CP")["links_rehashed"] == 1
+
+    def test_cost_bounded_by_interval(self):
+        engine = _engine(interval=500)
+        _chain(engine, turns=5000)
+        engine.verify_chain("S-CP")
+        with patch("omnix_core.bev.coherence_hash_chain.hashlib.sha3_256",
+                   wraps=__import__("hashlib").sha3_256) as sha3:
+            result = engine.verify_chain("S-CP")
+        assert result["verified"] and result["turn_count"] == 5000
+        assert result["links_rehashed"] < 500
+        assert sha3.call_count < 510
+
+    def test_full_mode_ignores_checkpoints(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        result = engine.verify_chain("S-CP", full=True)
+        assert result["verification_mode"] == "full" and result["links_rehashed"] == 10
+
+    def test_interval_zero_disables(self):
+        engine = _engine(interval=0)
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        assert engine.get_checkpoints("S-CP") == []
+        assert engine.verify_chain("S-CP")["verification_mode"] == "full"
+
+
+class TestTamperDetection:
+    def test_tail_tamper_detected_incrementally(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        engine._links_cache["S-CP"][9].turn_hash = "forged"
+        result = engine.verify_chain("S-CP")
+        assert result["verification_mode"] == "incremental"
+        assert not result["verified"]
+        assert "turn 9" in result["hash_errors"][0]
+
+    def test_anchor_mismatch_falls_back_to_full(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        engine._links_cache["S-CP"][7].chain_link_hash = "f" * 64
+        result = engine.verify_chain("S-CP")
+        assert result["verification_mode"] == "full"
+        assert not result["verified"]
+
+    def test_tail_gap_detected(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        del engine._links_cache["S-CP"][8]
+        result = engine.verify_chain("S-CP")
+        assert not result["bev_inv_012"]
+        assert any("Gap at turn_index 8" in e for e in result["hash_errors"])
+
+    def test_forged_checkpoint_ignored(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        engine._checkpoint_cache["S-CP"][0].link_hash = "0" * 64
+        assert engine.verify_chain("S-CP")["verification_mode"] == "full"
+
+    def test_unsigned_checkpoint_rejected_when_key_configured(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")
+        key = SimpleNamespace(public_key=b"pk", secret_key=b"sk")
+        with patch("omnix_core.security.crypto_providers.get_signing_key", return_value=key):
+            assert engine.verify_chain("S-CP")["verification_mode"] == "full"
+
+
+class TestSealedChain:
+    def test_sealed_tip_checkpoint_skips_seal_recompute(self):
+        engine = _engine()
+        _chain(engine)
+        engine.seal_chain("S-CP")
+        first = engine.verify_chain("S-CP")
+        assert first["verified"] and first["seal_valid"]
+        top = engine.get_checkpoints("S-CP")[0]
+        assert (top.turn_index, top.seal_hash) == (9, engine.get_chain("S-CP").seal_hash)
+
+        with patch.object(engine, "get_links", wraps=engine.get_links) as get_links:
+            second = engine.verify_chain("S-CP")
+        assert second["verified"] and second["seal_valid"]
+        assert second["links_rehashed"] == 0
+        get_links.assert_called_once_with("S-CP", from_turn=9)
+
+    def test_seal_checked_against_all_links_when_not_attested(self):
+        engine = _engine()
+        _chain(engine)
+        engine.verify_chain("S-CP")          # checkpoint at 7, unsealed
+        engine.seal_chain("S-CP")
+        engine.get_chain("S-CP").seal_hash = "0" * 64
+        result = engine.verify_chain("S-CP")
+        assert result["verification_mode"] == "incremental"
+        assert not result["seal_valid"] and not result["verified"]
+
+
+class TestPersistence:
+    def test_db_queries_use_turn_bound_and_newest_first(self):
+        engine = _engine()
+        engine._db_url = "postgresql://test/test"
+        cur = MagicMock()
+        cur.description = []
+        cur.fetchall.return_value = []
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        conn.cursor.return_value.__enter__.return_value = cur
+        with patch.object(engine, "_get_conn", return_value=conn):
+            engine.get_links("S-DB", from_turn=41)
+            engine.get_checkpoints("S-DB", limit=2)
+        (links_sql, links_params), (cp_sql, cp_params) = [c.args for c in cur.execute.call_args_list]
+        assert "turn_index>=%s" in links_sql and links_params == ("S-DB", 41)
+        assert "ORDER BY turn_index DESC LIMIT %s" in cp_sql and cp_params == ("S-DB", 2)
@@ -0,0 +1,212 @@
+"""
+Decision-analytics rollups (omnix_web/api/decision_rollups.py)
+
+  TestAccumulator  — minute / day / totals / checkpoint deltas from receipt rows
+  TestTailer       — one transaction per batch, watermark + version advance
+  TestReaders      — ETags and the exact per-client total
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+
+from omnix_web.api import decision_rollups as rollups
+
+T0 = datetime(2026, 3, 1, 12, 30, 15, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._result = []
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.conn.executed.append((sql, params))
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError("boom")
+        for needle, result in self.conn.results:
+            if needle in sql:
+                self._result = list(result)
+                return
+        self._result = []
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return list(self._result)
+
+    def fetchmany(self, size):
+        out, self._result = self._result[:size], self._result[size:]
+        return out
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, results=(), fail_on=None):
+        self.results = list(results)
+        self.fail_on = fail_on
+        self.executed = []
+        self.commits = self.rollbacks = self.closes = 0
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closes += 1
+
+    def sql(self, needle):
+        return [(s, p) for s, p in self.executed if needle in s]
+
+
+def _row(i, decision="APPROVED", domain="trading", client="acme", veto=None, ts=None):
+    return (ts or T0 + timedelta(seconds=i), f"OMNIX-{i:04d}", domain, decision, client, veto or [])
+
+
+class TestAccumulator:
+
+    def test_counts_per_dimension(self):
+        acc = rollups.RollupAccumulator()
+        for i in range(3):
+            acc.add(*_row(i))
+        acc.add(*_row(3, decision="BLOCKED", domain=None, client=None))
+        minute = T0.replace(second=0)
+        assert acc.minute[(minute, "trading", "APPROVED", "acme")] == 3
+        assert acc.minute[(minute, "", "BLOCKED", "")] == 1
+        assert acc.day[(T0.date(), "trading", "APPROVED", "acme")] == 3
+        count, first, last, last_id = acc.totals[("trading", "APPROVED", "acme")]
+        assert (count, first, last_id) == (3, T0, "OMNIX-0002")
+        assert acc.rows == 4
+        assert acc.last_key == (T0 + timedelta(seconds=3), "OMNIX-0003")
+
+    def test_blocking_checkpoints_only_for_blocked(self):
+        veto = ["CP-3: BLOCKED risk 82 > 70", "CP-4: passed", "CP-9: VETO aml"]
+        acc = rollups.RollupAccumulator()
+        acc.add(*_row(0, decision="BLOCKED", veto=veto))
+        acc.add(*_row(1, decision="BLOCK", veto='["CP-3: BLOCKED again"]'))
+        acc.add(*_row(2, decision="APPROVED", veto=veto))
+        assert acc.checkpoints == {"CP-3": 2, "CP-9": 1}
+
+    def test_minute_cutoff_skips_old_rows_but_keeps_day(self):
+        acc = rollups.RollupAccumulator(minute_since=T0 + timedelta(minutes=5))
+        acc.add(*_row(0))
+        assert acc.minute == {}
+        assert sum(acc.day.values()) == 1
+
+    def test_naive_timestamps_are_utc(self):
+        acc = rollups.RollupAccumulator()
+        acc.add(*_row(0, ts=T0.replace(tzinfo=None)))
+        assert next(iter(acc.minute))[0] == T0.replace(second=0)
+
+    def test_flush_issues_one_upsert_per_table(self):
+        acc = rollups.RollupAccumulator()
+        for i in range(5):
+            acc.add(*_row(i, decision="BLOCKED", veto=["CP-2: BLOCKED"]))
+        conn = FakeConn()
+        acc.flush(conn.cursor())
+        tables = [s.split()[2] for s, _ in conn.executed]
+        assert tables == [
+            "decision_rollup_minute", "decision_rollup_day",
+            "decision_rollup_totals", "decision_rollup_checkpoints",
+        ]
+        assert all("ON CONFLICT" in s for s, _ in conn.executed)
+
+
+class TestTailer:
+
+    def _conn(self, rows, **kw):
+        return FakeConn(results=[
+            ("FROM decision_rollup_state WHERE name = %s FOR UPDATE", [(rollups._EPOCH, "")]),
+            ("FROM decision_receipts WHERE (created_at, receipt_id) >", rows),
+        ], **kw)
+
+    def test_run_once_folds_batch_and_advances_watermark(self):
+        conn = self._conn([_row(i) for i in range(4)])
+        tailer = rollups.DecisionRollupTailer(lambda: conn, batch_size=10, lag_s=5)
+        assert tailer.run_once() == 4
+        update = conn.sql("UPDATE decision_rollup_state")
+        assert len(update) == 1
+        assert update[0][1][:2] == (T0 + timedelta(seconds=3), "OMNIX-0003")
+        assert "version = version + 1" in update[0][0]
+        select = conn.sql("FROM decision_receipts WHERE")[0]
+        assert select[1][-2:] == (5.0, 10)
+        assert conn.rollbacks == 0 and conn.closes == 1
+
+    def test_empty_batch_keeps_version(self):
+        conn = self._conn([])
+        tailer = rollups.DecisionRollupTailer(lambda: conn)
+        assert tailer.run_once() == 0
+        assert conn.sql("UPDATE decision_rollup_state") == []
+        assert conn.sql("INSERT INTO decision_rollup_minute") == []
+
+    def test_failure_rolls_back_whole_batch(self):
+        conn = self._conn([_row(0)], fail_on="INSERT INTO decision_rollup_totals")
+        tailer = rollups.DecisionRollupTailer(lambda: conn)
+        with pytest.raises(RuntimeError):
+            tailer.run_once()
+        assert conn.rollbacks == 1
+        assert conn.closes == 1
+
+    def test_catch_up_stops_on_short_batch(self):
+        batches = [[_row(i) for i in range(3)], [_row(3)]]
+        tailer = rollups.DecisionRollupTailer(lambda: self._conn(batches.pop(0)), batch_size=3)
+        assert tailer.catch_up() == 4
+        assert batches == []
+
+    def test_backfill_rebuilds_from_all_tiers(self):
+        hot = [_row(i) for i in range(5)]
+        warm = [_row(100 + i, ts=T0 - timedelta(days=90)) for i in range(2)]
+        conn = FakeConn(results=[
+            ("SELECT to_regclass(%s)", [("exists",)]),
+            ("FROM decision_receipts WHERE created_at IS NOT NULL", hot),
+            ("FROM decision_receipts_warm", warm),
+        ])
+        tailer = rollups.DecisionRollupTailer(lambda: conn, batch_size=2)
+        summary = tailer.backfill()
+        assert summary["by_table"] == {
+            "decision_receipts": 5, "decision_receipts_warm": 2, "decision_receipts_cold": 0,
+        }
+        assert summary["receipts"] == 7
+        assert conn.executed[len(conn.sql("CREATE")) + 1][0].startswith("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        assert len(conn.sql("DELETE FROM decision_rollup_totals")) == 1
+        update = conn.sql("UPDATE decision_rollup_state")[0]
+        assert update[1][:2] == (T0 + timedelta(seconds=4), "OMNIX-0004")
+        assert conn.commits == 2 and conn.rollbacks == 0
+
+    def test_no_connection(self):
+        assert rollups.DecisionRollupTailer(lambda: None).run_once() == 0
+
+
+class TestReaders:
+
+    def test_rollup_etag_tracks_version(self):
+        assert rollups.rollup_etag(None, "x") is None
+        assert rollups.rollup_etag(3, "x") != rollups.rollup_etag(4, "x")
+        assert rollups.rollup_etag(3, "x").startswith('W/"rollup-x-3-')
+
+    def test_payload_etag_ignores_timestamps(self):
+        a = {"metrics": {"n": 1}, "last_updated": "t1"}
+        b = {"metrics": {"n": 1}, "last_updated": "t2"}
+        assert rollups.payload_etag(a) == rollups.payload_etag(b)
+        assert rollups.payload_etag(a) != rollups.payload_etag({"metrics": {"n": 2}})
+
+    def test_client_total_adds_untailed_delta(self):
+        conn = FakeConn(results=[
+            ("FROM decision_rollup_totals WHERE client_id", [(40,)]),
+            ("FROM decision_receipts, decision_rollup_state", [(2,)]),
+        ])
+        assert rollups.read_client_total(conn.cursor(), "acme", "BLOCKED") == 42
+        for sql, params in conn.executed:
+            assert params[-2:] == ["acme", "BLOCKED"]
@@ -0,0 +1,156 @@
+"""
+GovernanceEvaluationEngine.evaluate_batch — vectorized batch mode
+
+  TestBatchParity   — every row equals evaluate() on the same signals
+  TestBatchInputs   — dict of arrays, structured arrays, NaN = omitted, per-row asset
+  TestBatchErrors   — ragged columns / mismatched asset lists rejected
+"""
+
+import json
+import random
+
+import pytest
+
+from omnix_core.governance.external_evaluator import (
+    CHECKPOINT_DEFAULTS,
+    OPTIONAL_SIGNAL_DEFAULTS,
+    REQUIRED_SIGNALS,
+    GovernanceEvaluationEngine,
+)
+
+np = pytest.importorskip("numpy")
+
+ALL_SIGNALS = REQUIRED_SIGNALS + list(OPTIONAL_SIGNAL_DEFAULTS)
+
+# CAG context that admits the session, so rows reach the checkpoint grid
+ADMIT_CFG = {
+    "cag_global_volatility": 10.0,
+    "cag_cross_pair_correlation": 10.0,
+    "cag_liquidity_score": 80.0,
+    "cag_macro_risk": 10.0,
+}
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("AVM_ENABLED", "false")
+    monkeypatch.setenv("TIE_ENABLED", "false")
+
+
+def _random_rows(n, seed=7, missing=0.15):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        row = {}
+        for name in ALL_SIGNALS:
+            if rng.random() < missing:
+                continue
+            # Land exactly on thresholds now and then to exercise ≥ / ≤ edges
+            if rng.random() < 0.1:
+                row[name] = float(rng.choice([cp["threshold"] for cp in CHECKPOINT_DEFAULTS]))
+            else:
+                row[name] = round(rng.uniform(20.0, 100.0), 3)
+        rows.append(row)
+    return rows
+
+
+def _columns(rows):
+    return {
+        name: np.array([row.get(name, np.nan) for row in rows], dtype=np.float64)
+        for name in ALL_SIGNALS
+    }
+
+
+class TestBatchParity:
+
+    def test_rows_match_scalar_path(self):
+        engine = GovernanceEvaluationEngine()
+        rows = _random_rows(300)
+        batch = engine.evaluate_batch(_columns(rows), "BTC/USD", "trading", compliance_config=ADMIT_CFG)
+        scalar = [engine.evaluate(row, "BTC/USD", "trading", compliance_config=ADMIT_CFG) for row in rows]
+        assert batch == scalar
+        # Same key order too — API responses serialize identically
+        assert json.dumps(batch, ensure_ascii=False) == json.dumps(scalar, ensure_ascii=False)
+        decisions = {r["decision"] for r in batch}
+        assert decisions == {"APPROVED", "BLOCKED"}
+
+    def test_veto_chain_order_matches(self):
+        engine = GovernanceEvaluationEngine()
+        row = dict.fromkeys(REQUIRED_SIGNALS, 30.0)
+        batch = engine.evaluate_batch({k: [v] for k, v in row.items()}, compliance_config=ADMIT_CFG)[0]
+        scalar = engine.evaluate(row, compliance_config=ADMIT_CFG)
+        assert [v["checkpoint_id"] for v in batch["veto_chain"]] == [
+            v["checkpoint_id"] for v in scalar["veto_chain"]
+        ]
+        assert batch["checkpoints_blocked"] == scalar["checkpoints_blocked"] > 0
+
+    def test_session_block_matches(self):
+        engine = GovernanceEvaluationEngine()
+        rows = _random_rows(20, seed=3)
+        block_cfg = {**ADMIT_CFG, "cag_enabled": True, "cag_macro_risk": 99.0}
+        batch = engine.evaluate_batch(_columns(rows), compliance_config=block_cfg)
+        scalar = [engine.evaluate(row, compliance_config=block_cfg) for row in rows]
+        assert batch == scalar
+        assert all(r["gate_results"] == [] for r in batch)
+
+    def test_custom_checkpoints_including_unknown_operator(self):
+        overrides = [dict(cp) for cp in CHECKPOINT_DEFAULTS]
+        overrides[1]["threshold"] = 70
+        overrides[2]["operator"] = "between"
+        engine = GovernanceEvaluationEngine(overrides)
+        rows = _random_rows(50, seed=11)
+        batch = engine.evaluate_batch(_columns(rows), compliance_config=ADMIT_CFG)
+        assert batch == [engine.evaluate(r, compliance_config=ADMIT_CFG) for r in rows]
+        assert all(r["decision"] == "BLOCKED" for r in batch)
+
+
+class TestBatchInputs:
+
+    def test_structured_array(self):
+        engine = GovernanceEvaluationEngine()
+        rows = _random_rows(40, seed=5, missing=0.0)
+        arr = np.zeros(len(rows), dtype=[(name, "f8") for name in ALL_SIGNALS])
+        for i, row in enumerate(rows):
+            for name, val in row.items():
+                arr[name][i] = val
+        assert engine.evaluate_batch(arr, compliance_config=ADMIT_CFG) == [
+            engine.evaluate(r, compliance_config=ADMIT_CFG) for r in rows
+        ]
+
+    def test_nan_means_default_applied(self):
+        engine = GovernanceEvaluationEngine()
+        cols = {name: [80.0] for name in REQUIRED_SIGNALS}
+        cols["risk_exposure"] = [20.0]
+        cols["signal_integrity"] = [np.nan]
+        result = engine.evaluate_batch(cols, compliance_config=ADMIT_CFG)[0]
+        assert result["applied_signal_defaults"] == OPTIONAL_SIGNAL_DEFAULTS
+        assert result["decision"] == "APPROVED"
+
+    def test_per_row_asset_and_metadata(self):
+        engine = GovernanceEvaluationEngine()
+        cols = {name: [60.0, 60.0] for name in REQUIRED_SIGNALS}
+        out = engine.evaluate_batch(
+            cols, asset=["LOAN-1", "LOAN-2"], domain="credit",
+            metadata=[{"row": 0}, {"row": 1}], compliance_config=ADMIT_CFG,
+        )
+        assert [r["asset"] for r in out] == ["LOAN-1", "LOAN-2"]
+        assert [r["metadata"] for r in out] == [{"row": 0}, {"row": 1}]
+
+    def test_empty_batch(self):
+        cols = {name: [] for name in REQUIRED_SIGNALS}
+        assert GovernanceEvaluationEngine().evaluate_batch(cols) == []
+
+
+class TestBatchErrors:
+
+    def test_ragged_columns_rejected(self):
+        with pytest.raises(ValueError):
+            GovernanceEvaluationEngine().evaluate_batch({"probability_score": [1, 2], "risk_exposure": [1]})
+
+    def test_asset_length_mismatch_rejected(self):
+        with pytest.raises(ValueError):
+            GovernanceEvaluationEngine().evaluate_batch({"probability_score": [1, 2]}, asset=["A"])
+
+    def test_unsupported_batch_type_rejected(self):
+        with pytest.raises(TypeError):
+            GovernanceEvaluationEngine().evaluate_batch([{"probability_score": 50}])
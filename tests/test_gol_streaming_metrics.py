@@ -0,0 +1,143 @@
+"""
+GOL streaming histograms and Prometheus exposition (ADR-198)
+============================================================
+  · LatencyHistogram percentiles within the sketch's relative accuracy
+  · per-thread shards merge losslessly; dead threads' samples are kept
+  · window rollover keeps cumulative count / mean / buckets
+  · export_prometheus: text format 0.0.4 with histogram, quantile and pool series
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import random
+import re
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from omnix_core.observability.metrics import (
+    PHASE_BAR_SIGN,
+    DBPoolStatsSnapshot,
+    GovernanceMetricsRegistry,
+    LatencyHistogram,
+    _prom_labels,
+)
+
+
+def _exact(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * p / 100.0), len(ordered) - 1)]
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(1.0, 1.2) for _ in range(1000)]
+        hist = LatencyHistogram("X", window=2000)
+        for v in samples:
+            hist.record(v)
+        stats = hist.to_dict()
+        for p, key in ((50, "p50_ms"), (95, "p95_ms"), (99, "p99_ms")):
+            assert stats[key] == pytest.approx(_exact(samples, p), rel=0.011)
+        assert stats["min_ms"] == round(min(samples), 3)
+        assert stats["max_ms"] == round(max(samples), 3)
+        assert stats["count"] == 1000
+        assert stats["mean_ms"] == pytest.approx(sum(samples) / 1000, abs=1e-3)
+
+    def test_empty_histogram(self):
+        stats = LatencyHistogram("X").to_dict()
+        assert stats["count"] == 0
+        assert stats["p50_ms"] is stats["min_ms"] is stats["mean_ms"] is None
+
+    def test_threads_record_into_shards(self):
+        hist = LatencyHistogram("X", window=100_000)
+
+        def work(offset):
+            for i in range(2000):
+                hist.record(offset + i % 10)
+
+        threads = [threading.Thread(target=work, args=(k * 100,)) for k in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert hist.sample_count() == 8000
+        assert hist.minimum() == 1e-3 and hist.maximum() == 309.0
+        assert hist._shards == [] and hist._retired.cumulative.count == 8000
+
+    def test_window_rollover_keeps_cumulative(self):
+        hist = LatencyHistogram("X", window=100)
+        for _ in range(500):
+            hist.record(1000.0)
+        for _ in range(100):
+            hist.record(1.0)
+        stats = hist.to_dict()
+        assert stats["p99_ms"] == pytest.approx(1.0, rel=0.01)
+        assert stats["max_ms"] == 1.0
+        assert stats["count"] == 600
+        assert hist.cumulative_buckets((10.0,))["buckets"] == [(10.0, 100)]
+
+    def test_merge(self):
+        a, b = LatencyHistogram("A"), LatencyHistogram("B")
+        for i in range(1, 101):
+            (a if i % 2 else b).record(float(i))
+        a.merge(b)
+        assert a.sample_count() == 100
+        assert a.percentile(50) == pytest.approx(51.0, rel=0.01)
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram("C", accuracy=0.05))
+
+
+class TestPrometheusExport:
+    @pytest.fixture
+    def registry(self):
+        reg = GovernanceMetricsRegistry.reset_for_testing()
+        yield reg
+        GovernanceMetricsRegistry.reset_for_testing()
+
+    def test_text_format(self, registry):
+        registry.on_session_start(SimpleNamespace(
+            session_id="S1", domain="general", started_at="t", compliance_tier="x"))
+        for ms in (0.2, 3.0, 40.0):
+            registry._record_phase_latency("S1", PHASE_BAR_SIGN, ms)
+        registry.on_db_error(TimeoutError("slow"))
+        with patch.object(registry, "observe_pool_stats"):
+            text = registry.export_prometheus()
+
+        assert text.endswith("\n")
+        for line in text.splitlines():
+            assert line.startswith("#") or re.match(r"^[a-z_]+(\{[^}]*\})? \S+$", line), line
+        assert "# TYPE omnix_gol_phase_latency_ms histogram" in text
+        assert 'omnix_gol_phase_latency_ms_bucket{phase="BAR_SIGN",le="0.5"} 1' in text
+        assert 'omnix_gol_phase_latency_ms_bucket{phase="BAR_SIGN",le="5.0"} 2' in text
+        assert 'omnix_gol_phase_latency_ms_bucket{phase="BAR_SIGN",le="+Inf"} 3' in text
+        assert 'omnix_gol_phase_latency_ms_count{phase="BAR_SIGN"} 3' in text
+        assert 'omnix_gol_phase_latency_window_ms{phase="BAR_SIGN",quantile="0.5"}' in text
+        assert "omnix_gol_sessions_active 1" in text
+        assert "omnix_gol_sessions_started_total 1" in text
+        assert "omnix_gol_db_errors_total{" in text
+        assert "omnix_gol_db_gateway_pool_size" not in text
+
+    def test_pool_series_labelled_by_pool(self, registry):
+        pools = {"psycopg2:receipts": {
+            "pool_size": 4, "pool_available": 3, "in_use": 1, "peak_in_use": 2,
+            "opened": 4, "acquired": 17, "timeouts": 0, "discarded": 1,
+            "wait": {"p50_ms": 0.1, "p95_ms": 0.4, "p99_ms": 0.9},
+        }}
+        registry._latest_pool_snapshot = DBPoolStatsSnapshot(
+            captured_at="t", status="ok", pool_size=8, pool_available=6, requests_waiting=0,
+            avg_query_time_ms=1.5, total_requests=40, subsystems=pools,
+        )
+        with patch.object(registry, "observe_pool_stats"):
+            text = registry.export_prometheus()
+        assert "omnix_gol_db_gateway_pool_size 8" in text
+        assert 'omnix_gol_db_pool_size{pool="psycopg2:receipts"} 4' in text
+        assert 'omnix_gol_db_pool_in_use{pool="psycopg2:receipts"} 1' in text
+        assert 'omnix_gol_db_pool_acquired_total{pool="psycopg2:receipts"} 17' in text
+        assert 'omnix_gol_db_pool_wait_ms{pool="psycopg2:receipts",quantile="0.99"} 0.9' in text
+
+    def test_label_escaping(self):
+        assert _prom_labels(pool='a"b\\c\nd') == '{pool="a\\"b\\\\c\\nd"}'
@@ -0,0 +1,171 @@
+"""
+gov_auth_rbac — API-key authentication cache
+
+  · positive entries served without touching the DB
+  · unknown keys negatively cached
+  · rotate / deactivate / reactivate invalidate the affected entries
+  · legacy-mode (empty b2b_clients) is a cached flag, not a COUNT(*) per call
+
+Runs without a database: _get_conn is replaced with an in-memory fake.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+os.environ.setdefault("DATABASE_URL", "postgresql://fake/omnix")
+
+from omnix_web.api import gov_auth_rbac as rbac
+
+
+class _FakeDB:
+    """Tiny b2b_clients table + query counter."""
+
+    def __init__(self):
+        self.clients = {}     # key_hash → row
+        self.queries = []
+
+    def add(self, client_id, api_key, active=True):
+        self.clients[rbac.hash_api_key(api_key)] = {
+            "client_id": client_id, "name": client_id, "email": None, "role": "standard",
+            "is_active": active, "created_at": None, "last_seen_at": None, "key_expires_at": None,
+        }
+
+    def connect(self):
+        return _FakeConn(self)
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = None
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        self.db.queries.append(" ".join(sql.split()))
+        if "EXISTS" in sql:
+            self._result = (bool(self.db.clients),)
+        elif "WHERE api_key_hash" in sql:
+            row = self.db.clients.get(params[0])
+            self._result = dict(row) if row and row["is_active"] else None
+        elif sql.lstrip().startswith("UPDATE"):
+            client_id = params[-1]
+            for key_hash, row in list(self.db.clients.items()):
+                if row["client_id"] == client_id:
+                    if "SET api_key_hash" in sql:
+                        self.db.clients[params[0]] = self.db.clients.pop(key_hash)
+                    elif "is_active = FALSE" in sql:
+                        row["is_active"] = False
+                    elif "is_active = TRUE" in sql:
+                        row["is_active"] = True
+                    self.rowcount = 1
+                    self._result = (key_hash,)
+
+    def fetchone(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class _FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = _FakeDB()
+    monkeypatch.setattr(rbac, "_get_conn", fake.connect)
+    monkeypatch.setattr(rbac._auth_cache, "ttl_s", 30.0)
+    monkeypatch.setattr(rbac._auth_cache, "negative_ttl_s", 10.0)
+    monkeypatch.delenv("B2B_API_KEY", raising=False)
+    rbac.clear_auth_cache()
+    yield fake
+    rbac.clear_auth_cache()
+
+
+def _lookups(db):
+    return sum(1 for q in db.queries if "WHERE api_key_hash" in q)
+
+
+class TestAuthCache:
+
+    def test_valid_key_served_from_cache(self, db):
+        db.add("fund-a", "KEY-A")
+        for _ in range(5):
+            client = rbac.authenticate_client("KEY-A")
+            assert client["client_id"] == "fund-a"
+        assert _lookups(db) == 1
+        assert not any("COUNT(*)" in q for q in db.queries)
+        assert rbac.get_auth_cache_stats()["hits"] == 4
+
+    def test_cached_row_is_a_copy(self, db):
+        db.add("fund-a", "KEY-A")
+        rbac.authenticate_client("KEY-A")["role"] = "admin"
+        assert rbac.authenticate_client("KEY-A")["role"] == "standard"
+
+    def test_unknown_key_negatively_cached(self, db):
+        db.add("fund-a", "KEY-A")
+        for _ in range(10):
+            assert rbac.authenticate_client("WRONG") is None
+        assert _lookups(db) == 1
+        assert rbac.get_auth_cache_stats()["negative_hits"] == 9
+
+    def test_deactivate_invalidates(self, db):
+        db.add("fund-a", "KEY-A")
+        assert rbac.authenticate_client("KEY-A") is not None
+        assert rbac.deactivate_client("fund-a") is True
+        assert rbac.authenticate_client("KEY-A") is None
+
+    def test_reactivate_drops_negative_entry(self, db):
+        db.add("fund-a", "KEY-A", active=False)
+        assert rbac.authenticate_client("KEY-A") is None
+        assert rbac.reactivate_client("fund-a") is True
+        assert rbac.authenticate_client("KEY-A")["client_id"] == "fund-a"
+
+    def test_rotate_invalidates_old_key(self, db):
+        db.add("fund-a", "KEY-A")
+        assert rbac.authenticate_client("KEY-A") is not None
+        new_key = rbac.rotate_api_key("fund-a")
+        assert rbac.authenticate_client("KEY-A") is None
+        assert rbac.authenticate_client(new_key)["client_id"] == "fund-a"
+
+    def test_lru_capacity_bounded(self, db, monkeypatch):
+        monkeypatch.setattr(rbac._auth_cache, "max_entries", 3)
+        db.add("fund-a", "KEY-A")
+        for i in range(6):
+            rbac.authenticate_client(f"BAD-{i}")
+        assert rbac.get_auth_cache_stats()["entries"] == 3
+
+    def test_ttl_zero_disables_cache(self, db, monkeypatch):
+        monkeypatch.setattr(rbac._auth_cache, "ttl_s", 0.0)
+        db.add("fund-a", "KEY-A")
+        rbac.authenticate_client("KEY-A")
+        rbac.authenticate_client("KEY-A")
+        assert _lookups(db) == 2
+
+
+class TestLegacyModeFlag:
+
+    def test_env_key_accepted_with_one_exists_query(self, db, monkeypatch):
+        monkeypatch.setenv("B2B_API_KEY", "ENV-KEY")
+        for _ in range(3):
+            assert rbac.authenticate_client("ENV-KEY")["client_id"] == "legacy-env-client"
+        assert sum(1 for q in db.queries if "EXISTS" in q) == 1
+
+    def test_non_env_key_rechecks_table(self, db, monkeypatch):
+        monkeypatch.setenv("B2B_API_KEY", "ENV-KEY")
+        assert rbac.authenticate_client("ENV-KEY") is not None
+        db.add("fund-a", "KEY-A")   # created by another worker
+        assert rbac.authenticate_client("KEY-A")["client_id"] == "fund-a"
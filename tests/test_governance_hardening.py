@@ -453,6 +453,95 @@ class TestReceiptWAL:
         wid = wal.wal_append(self._sample_receipt())
         assert wid == ""
 
+    def _make_segmented_wal(self, segment_max_records=4):
+        from omnix_core.evidence.receipt_wal import ReceiptWAL
+        path = os.path.join(tempfile.mkdtemp(), "wal.jsonl")
+        return ReceiptWAL(wal_path=path, segment_max_records=segment_max_records)
+
+    def test_wal_commit_appends_tombstone_without_rewrite(self):
+        """wal_commit() appends a tombstone; earlier segment bytes are untouched."""
+        wal = self._make_segmented_wal(segment_max_records=100)
+        wid = wal.wal_append(self._sample_receipt("R1"))
+        wal.wal_append(self._sample_receipt("R2"))
+        seg = wal._segment_path(wal._active_seq)
+        before = seg.read_bytes()
+        assert wal.wal_commit(wid) is True
+        after = seg.read_bytes()
+        assert after.startswith(before)
+        assert json.loads(after[len(before):])["_wal_commit"] == wid
+        assert wal.wal_commit(wid) is False
+
+    def test_wal_recovers_live_index_after_restart(self):
+        """A reopened WAL rebuilds pending entries from segments and tombstones."""
+        from omnix_core.evidence.receipt_wal import ReceiptWAL
+        wal = self._make_segmented_wal()
+        ids = [wal.wal_append(self._sample_receipt(f"R{i}")) for i in range(10)]
+        for wid in ids[:7]:
+            wal.wal_commit(wid)
+        wal.close()
+        reopened = ReceiptWAL(wal_path=wal.wal_path, segment_max_records=4)
+        assert reopened.wal_size() == 3
+        assert sorted(e["receipt_id"] for e in reopened.wal_entries()) == ["R7", "R8", "R9"]
+
+    def test_wal_deletes_fully_committed_segments(self):
+        """Sealed segments are unlinked once every entry in them is committed."""
+        wal = self._make_segmented_wal()
+        for i in range(40):
+            wal.wal_commit(wal.wal_append(self._sample_receipt(f"R{i}")))
+        assert wal.wal_size() == 0
+        assert wal.segment_stats()["segments"] <= 1
+
+    def test_wal_compaction_preserves_live_entries(self):
+        """Compacting a mostly-committed segment keeps its live entry reconcilable."""
+        from omnix_core.evidence.receipt_wal import ReceiptWAL
+        wal = self._make_segmented_wal()
+        stuck = wal.wal_append(self._sample_receipt("STUCK"))
+        for i in range(30):
+            wal.wal_commit(wal.wal_append(self._sample_receipt(f"R{i}")))
+        assert wal.segment_stats()["segments"] <= 2
+        wal.close()
+        reopened = ReceiptWAL(wal_path=wal.wal_path, segment_max_records=4)
+        entries = reopened.wal_entries()
+        assert [e["_wal_id"] for e in entries] == [stuck]
+        assert reopened.reconcile_wal(lambda r: True) == 1
+        assert reopened.wal_size() == 0
+
+    def test_wal_replays_legacy_single_file(self):
+        """A pre-segmentation WAL file is replayed and removed once drained."""
+        from omnix_core.evidence.receipt_wal import ReceiptWAL
+        path = os.path.join(tempfile.mkdtemp(), "wal.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"_wal_id": "WAL-LEGACY", **self._sample_receipt("L1")}) + "\n")
+        wal = ReceiptWAL(wal_path=path, segment_max_records=4)
+        assert wal.wal_size() == 1
+        assert wal.reconcile_wal(lambda r: True) == 1
+        for i in range(8):
+            wal.wal_commit(wal.wal_append(self._sample_receipt(f"R{i}")))
+        assert not os.path.exists(path)
+
+    def test_wal_writers_sharing_a_path_never_drop_each_others_entries(self):
+        """Two live writers on one path keep separate namespaces; a later writer adopts orphans."""
+        from omnix_core.evidence.receipt_wal import ReceiptWAL
+        a = self._make_segmented_wal()
+        b = ReceiptWAL(wal_path=a.wal_path, segment_max_records=4)
+        b.wal_append(self._sample_receipt("B1"))
+        for i in range(2):
+            a.wal_commit(a.wal_append(self._sample_receipt(f"A{i}")))
+        assert b.wal_size() == 1
+
+        fresh = ReceiptWAL(wal_path=a.wal_path, segment_max_records=4)
+        assert fresh.wal_size() == 0                  # b is alive: its namespace is not touched
+        fresh.close()
+        assert [e["receipt_id"] for e in b.wal_entries()] == ["B1"]
+
+        b.close()                                     # b "dies" with one receipt pending
+        adopter = ReceiptWAL(wal_path=a.wal_path, segment_max_records=4)
+        assert [e["receipt_id"] for e in adopter.wal_entries()] == ["B1"]
+        assert adopter.reconcile_wal(lambda r: True) == 1
+        adopter.close()
+        a.close()
+        assert os.listdir(os.path.dirname(a.wal_path)) == []
+
     def test_get_receipt_wal_singleton(self):
         """get_receipt_wal() returns the same instance."""
         import omnix_core.evidence.receipt_wal as m
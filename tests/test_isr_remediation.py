@@ -191,6 +191,133 @@ class TestISR013TransparencyChain:
         assert result is False
 
 
+class TestTransparencyChainWriter:
+    """Batched flushes that chain from the DB tip under the chain advisory lock."""
+
+    @staticmethod
+    def _verify(rows):
+        from omnix_core.evidence.transparency_chain import TransparencyChain
+        return TransparencyChain.__new__(TransparencyChain).verify_chain_integrity(rows)
+
+    def test_concurrent_submits_form_one_valid_chain(self, chain_db):
+        import threading
+        db, make_writer = chain_db
+        writer = make_writer(batch_size=32, flush_interval_s=0.01)
+
+        def submit_many(tag):
+            for i in range(50):
+                writer.submit(f"RCP-{tag}-{i}", "BTC", "APPROVED",
+                              hashlib.sha256(f"{tag}-{i}".encode()).hexdigest())
+
+        threads = [threading.Thread(target=submit_many, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert writer.flush()
+        writer.close()
+
+        assert len(db.rows) == 400
+        assert len(db.batches) < 400
+        assert all(len(b) <= 32 for b in db.batches)
+        assert self._verify(db.chain())["valid"] is True
+        assert db.tip_reads == len(db.batches)          # tip re-read inside every flush
+
+    def test_two_workers_share_one_chain(self, chain_db):
+        """Writers in different processes serialise on the lock instead of forking the log."""
+        import threading
+        db, make_writer = chain_db
+        workers = [make_writer(batch_size=8, flush_interval_s=0.005) for _ in range(2)]
+
+        def run(writer, tag):
+            for i in range(40):
+                writer.submit(f"RCP-{tag}-{i}", "BTC", "HOLD",
+                              hashlib.sha256(f"{tag}-{i}".encode()).hexdigest())
+
+        threads = [threading.Thread(target=run, args=(w, n)) for n, w in enumerate(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for w in workers:
+            assert w.flush()
+            w.close()
+
+        chain = db.chain()
+        assert len(chain) == 80
+        assert self._verify(chain)["valid"] is True
+        assert len({r["prev_log_hash"] for r in chain}) == 80   # no two entries share a parent
+
+    def test_flush_chains_from_current_db_tip(self, chain_db):
+        from omnix_core.evidence.transparency_chain import compute_rolling_merkle_root
+        db, make_writer = chain_db
+        db.add_row("b" * 64, "c" * 64, "2026-01-01T00:00:00+00:00")
+        writer = make_writer()
+        first = writer.submit("RCP-1", "ETH", "HOLD", "d" * 64, wait=True)
+        assert first["prev_log_hash"] == "b" * 64
+        assert first["merkle_root"] == compute_rolling_merkle_root("c" * 64, "d" * 64)
+
+        # Another worker appends meanwhile: the next flush must chain from it.
+        db.add_row("x" * 64, "y" * 64, "2099-01-01T00:00:00+00:00")
+        second = writer.submit("RCP-2", "ETH", "HOLD", "e" * 64, wait=True)
+        writer.close()
+        assert second["prev_log_hash"] == "x" * 64
+        assert second["ts_utc"] > "2099-01-01T00:00:00+00:00"
+        assert writer.tip() == ("e" * 64, second["merkle_root"])
+
+    def test_signature_covers_chain_fields(self, chain_db):
+        import base64
+        db, make_writer = chain_db
+        writer = make_writer()
+        entry = writer.submit("RCP-S", "BTC", "HOLD", "a" * 64, wait=True)
+        writer.close()
+        canonical = json.dumps({k: v for k, v in entry.items()
+                                if k not in ("tst_token", "signing_provider", "signature_b64")},
+                               sort_keys=True).encode("utf-8")
+        assert db.signer.payloads == [canonical]
+        assert entry["signing_provider"] == "fake-pqc"
+        assert base64.b64decode(entry["signature_b64"]) == b"sig:" + hashlib.sha256(canonical).digest()
+        assert db.rows[0]["signature_b64"] == entry["signature_b64"]
+        assert (entry["key_id"], entry["key_version"]) == ("fake-key", "3")
+        assert (db.rows[0]["key_id"], db.rows[0]["key_version"]) == ("fake-key", "3")
+
+    def test_retried_entry_signature_verifies(self, chain_db, monkeypatch):
+        import base64
+
+        import omnix_core.evidence.transparency_chain as tc
+        monkeypatch.setattr(tc, "_STORE_RETRY_DELAYS", (0.0, 0.0, 0.0))
+        db, make_writer = chain_db
+        db.fail_inserts = 1                          # attempt 1 signs, then the INSERT fails
+        writer = make_writer()
+        entry = writer.submit("RCP-R", "BTC", "HOLD", "f" * 64, wait=True)
+        writer.close()
+        row = db.rows[0]
+        canonical = json.dumps({k: v for k, v in entry.items()
+                                if k not in ("tst_token", "signing_provider", "signature_b64")},
+                               sort_keys=True).encode("utf-8")
+        assert db.signer.payloads[-1] == canonical and len(db.signer.payloads) == 2
+        assert base64.b64decode(row["signature_b64"]) == b"sig:" + hashlib.sha256(canonical).digest()
+
+    def test_wait_returns_none_when_store_fails(self, chain_db, monkeypatch):
+        import omnix_core.evidence.transparency_chain as tc
+        monkeypatch.setattr(tc, "_STORE_RETRY_DELAYS", (0.0, 0.0, 0.0))
+        db, make_writer = chain_db
+        db.fail = True
+        writer = make_writer()
+        pending = []
+        writer._chain._store_pending = lambda entry, reason="": pending.append(entry) or True
+        assert writer.submit("RCP-X", "BTC", "BLOCKED", "f" * 64, wait=True) is None
+        writer.close()
+        assert writer.stats()["entries_failed"] == 1
+        assert db.rows == [] and pending[0]["signing_provider"] == "fake-pqc"
+
+    def test_disabled_without_db(self):
+        from omnix_core.evidence.transparency_chain import TransparencyChainWriter
+        writer = TransparencyChainWriter()
+        writer._chain._db_url = None
+        assert writer.submit("RCP-N", "BTC", "HOLD", "a" * 64) is None
+
+
 # ─── ISR-017: LLM Prompt Injection Guard ─────────────────────────────────────
 
 class TestISR017InputSanitizer:
@@ -0,0 +1,180 @@
+"""
+Keyset (cursor) pagination for receipt listings
+
+  TestCursorCodec    — opaque tokens round-trip and are bound to their listing
+  TestPaging         — LIMIT n + 1 trimming, full iteration, planner estimates
+  TestChainPage      — TransparencyChain.get_chain_page keyset SQL + next_cursor
+  TestSDKIterator    — OmnixClient.iter_receipts follows next_cursor
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+
+from omnix_core.evidence import keyset_cursor as ks
+from omnix_core.evidence.transparency_chain import TransparencyChain
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "omnix_sdk", "python"))
+
+
+T0 = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _rows(n, start=0):
+    return [{"created_at": T0 - timedelta(seconds=i), "receipt_id": f"OMNIX-{i:04d}"}
+            for i in range(start, start + n)]
+
+
+def _key(row):
+    return row["created_at"], row["receipt_id"]
+
+
+class TestCursorCodec:
+
+    def test_round_trip(self):
+        token = ks.encode_cursor(T0, "OMNIX-0001", "scope-a")
+        assert "=" not in token and "/" not in token and "+" not in token
+        assert ks.decode_cursor(token, "scope-a") == (T0, "OMNIX-0001")
+
+    def test_naive_timestamp_is_utc(self):
+        token = ks.encode_cursor(T0.replace(tzinfo=None), "x")
+        assert ks.decode_cursor(token)[0] == T0
+
+    def test_scope_mismatch_rejected(self):
+        token = ks.encode_cursor(T0, "x", ks.cursor_scope("receipts", "acme", None))
+        with pytest.raises(ks.InvalidCursor):
+            ks.decode_cursor(token, ks.cursor_scope("receipts", "acme", "BLOCKED"))
+        with pytest.raises(ks.InvalidCursor):
+            ks.decode_cursor(token, ks.cursor_scope("receipts", "other", None))
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", "eyJ2IjoxfQ", "A" * 600])
+    def test_malformed_rejected(self, token):
+        with pytest.raises(ks.InvalidCursor):
+            ks.decode_cursor(token)
+
+    def test_invalid_cursor_is_value_error(self):
+        assert issubclass(ks.InvalidCursor, ValueError)
+
+
+class TestPaging:
+
+    def test_split_page_trims_probe_row(self):
+        page, cursor = ks.split_page(_rows(6), 5, _key, "s")
+        assert len(page) == 5
+        assert ks.decode_cursor(cursor, "s") == _key(page[-1])
+
+    def test_split_page_last_page_has_no_cursor(self):
+        page, cursor = ks.split_page(_rows(5), 5, _key)
+        assert len(page) == 5 and cursor is None
+
+    def test_iter_keyset_visits_every_row_once(self):
+        data = _rows(23)
+        calls = []
+
+        def fetch(after, size):
+            calls.append(after)
+            rows = [r for r in data if after is None or _key(r) < after]
+            return rows[:size]
+
+        out = list(ks.iter_keyset(fetch, _key, page_size=10))
+        assert out == data
+        assert calls == [None, _key(data[9]), _key(data[19])]
+
+    def test_ties_on_timestamp_broken_by_id(self):
+        data = [{"created_at": T0, "receipt_id": f"OMNIX-{i}"} for i in (3, 2, 1)]
+
+        def fetch(after, size):
+            return [r for r in data if after is None or _key(r) < after][:size]
+
+        assert list(ks.iter_keyset(fetch, _key, page_size=1)) == data
+
+    def test_estimate_count_reads_plan_rows(self):
+        cur = MagicMock()
+        cur.fetchone.return_value = ([{"Plan": {"Plan Rows": 1234}}],)
+        assert ks.estimate_count(cur, "SELECT 1 FROM t WHERE a = %s", ["x"]) == 1234
+        sql, params = cur.execute.call_args[0]
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT 1 FROM t")
+        assert params == ("x",)
+
+    def test_estimate_count_never_raises(self):
+        cur = MagicMock()
+        cur.execute.side_effect = RuntimeError("boom")
+        assert ks.estimate_count(cur, "SELECT 1") is None
+        cur.connection.rollback.assert_called_once()
+
+    def test_ndjson_lines(self):
+        lines = list(ks.ndjson_lines(iter([{"a": 1, "t": T0}])))
+        assert lines == ['{"a":1,"t":"2026-03-01T12:00:00+00:00"}\n']
+
+
+class TestChainPage:
+
+    def _chain(self, rows):
+        cur = MagicMock()
+        cur.description = [(c,) for c in (
+            "log_id", "receipt_id", "symbol", "event_type", "payload_hash",
+            "prev_log_hash", "merkle_root", "signing_provider", "ts_utc", "chain_version",
+        )]
+        cur.fetchall.return_value = rows
+        conn = MagicMock()
+        conn.cursor.return_value = cur
+        chain = TransparencyChain.__new__(TransparencyChain)
+        chain._db_url = "postgresql://test"
+        chain._get_conn = lambda: conn
+        chain.verify_chain_integrity = lambda entries: {"valid": True}
+        return chain, cur
+
+    def _entry(self, i):
+        return (f"LOG-{i}", f"R-{i}", "BTC", "decision", "h", "p", "m", "none",
+                T0 - timedelta(seconds=i), 1)
+
+    def test_first_page_fetches_limit_plus_one(self):
+        chain, cur = self._chain([self._entry(i) for i in range(4)])
+        page = chain.get_chain_page(symbol="BTC", limit=3)
+        sql, params = cur.execute.call_args[0]
+        assert "ORDER BY ts_utc DESC, log_id DESC" in sql
+        assert "(ts_utc, log_id) <" not in sql
+        assert params == ("BTC", 4)
+        assert [e["log_id"] for e in page["entries"]] == ["LOG-0", "LOG-1", "LOG-2"]
+        assert page["next_cursor"]
+
+    def test_cursor_continues_after_last_entry(self):
+        chain, cur = self._chain([self._entry(i) for i in range(4)])
+        cursor = chain.get_chain_page(symbol="BTC", limit=3)["next_cursor"]
+        cur.fetchall.return_value = [self._entry(3)]
+        page = chain.get_chain_page(symbol="BTC", limit=3, cursor=cursor)
+        sql, params = cur.execute.call_args[0]
+        assert "(ts_utc, log_id) < (%s, %s)" in sql
+        assert params == ("BTC", T0 - timedelta(seconds=2), "LOG-2", 4)
+        assert page["next_cursor"] is None
+        assert chain.get_chain(symbol="BTC", limit=3, cursor=cursor)[0]["log_id"] == "LOG-3"
+
+    def test_cursor_bound_to_symbol(self):
+        chain, _ = self._chain([self._entry(i) for i in range(4)])
+        cursor = chain.get_chain_page(symbol="BTC", limit=3)["next_cursor"]
+        with pytest.raises(ks.InvalidCursor):
+            chain.get_chain_page(symbol="ETH", limit=3, cursor=cursor)
+
+
+class TestSDKIterator:
+
+    def test_iter_receipts_follows_cursor(self):
+        from omnix_sdk import OmnixClient
+        client = OmnixClient.__new__(OmnixClient)
+        pages = [
+            {"receipts": [{"receipt_id": "A"}, {"receipt_id": "B"}], "next_cursor": "c1"},
+            {"receipts": [{"receipt_id": "C"}], "next_cursor": None},
+        ]
+        client._request = MagicMock(side_effect=pages)
+        ids = [r["receipt_id"] for r in client.iter_receipts(per_page=2, decision="BLOCKED")]
+        assert ids == ["A", "B", "C"]
+        first, second = [c.kwargs["params"] for c in client._request.call_args_list]
+        assert first["cursor"] is None and first["offset"] == 0
+        assert second["cursor"] == "c1" and second["offset"] is None
+        assert second["limit"] == 2 and second["total"] == "none"
+        assert second["decision"] == "BLOCKED"
@@ -0,0 +1,224 @@
+"""
+MarketDataHub — WebSocket-fed local market state
+================================================
+  · recorded WS messages replayed offline into tickers, books and candle rings
+  · L2 book CRC32 checksum: pass keeps the book, mismatch invalidates + resubscribes
+  · candle gap after a reconnect backfilled from REST; REST only for recovery
+  · local reads never touch REST while the state is fresh
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import time
+import zlib
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _load_hub():
+    """
+    Load market_data_hub from its file: the module is stdlib-only, but the
+    omnix_services / trading_service package __init__s pull in Telegram,
+    redis, openai, gTTS and websockets.
+    """
+    path = (Path(__file__).resolve().parent.parent
+            / "omnix_services" / "trading_service" / "market_data_hub.py")
+    spec = importlib.util.spec_from_file_location("omnix_market_data_hub", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["omnix_market_data_hub"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+mdh = _load_hub()
+
+
+def _kraken_crc(asks, bids):
+    """Reference checksum straight from Kraken's spec (independent of L2Book)."""
+    def f(v):
+        return v.replace(".", "").lstrip("0")
+    top_a = sorted(asks, key=lambda level: float(level[0]))[:10]
+    top_b = sorted(bids, key=lambda level: -float(level[0]))[:10]
+    s = "".join(f(p) + f(v) for p, v, *_ in top_a + top_b)
+    return zlib.crc32(s.encode()) & 0xFFFFFFFF
+
+
+ASKS = [["5541.30000", "2.50700000", "1534614248.123678"],
+        ["5541.80000", "0.33000000", "1534614098.345543"],
+        ["5542.70000", "0.64700000", "1534614244.654432"]]
+BIDS = [["5541.20000", "1.52900000", "1534614248.765567"],
+        ["5539.90000", "0.30000000", "1534614241.769870"],
+        ["5539.50000", "5.00000000", "1534613831.243486"]]
+
+TICKER = {"a": ["5525.4", 1, "1.0"], "b": ["5525.1", 1, "1.0"], "c": ["5525.1", "0.1"],
+          "v": ["2634.1", "3002.5"], "p": ["5631.4", "5653.7"], "t": [11493, 13000],
+          "l": ["5505.0", "5505.0"], "h": ["5783.0", "5783.0"], "o": ["5760.7", "5763.4"]}
+
+
+def _candle(start, close, interval=1):
+    etime = start + interval * 60
+    return [f"{start + 5}.0", f"{etime}.0", "100.0", "101.0", "99.0", str(close), "100.2", "3.5", 7]
+
+
+def _book_update(side, levels, checksum):
+    return [1234, {side: levels, "c": str(checksum)}, "book-10", "XBT/USD"]
+
+
+def _record(tmp_path, messages):
+    path = tmp_path / "ws_recording.jsonl"
+    with open(path, "w") as f:
+        for i, m in enumerate(messages):
+            f.write(json.dumps({"t": 1_700_000_000 + i, "m": m}) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def rest():
+    rest = MagicMock()
+    rest._rest_get_ohlc.return_value = []
+    return rest
+
+
+@pytest.fixture
+def hub(rest):
+    ws = MagicMock()
+    return mdh.MarketDataHub(rest=rest, ws=ws, stale_s=30, ohlc_stale_s=300,
+                             ring_size=50, book_depth=10, record_path="")
+
+
+class TestPairs:
+    @pytest.mark.parametrize("raw", ["BTC/USD", "XBTUSD", "XXBTZUSD", "xbt/usd", "BTC-USD"])
+    def test_normalize(self, raw):
+        assert mdh.normalize_pair(raw) == "XBT/USD"
+
+    def test_normalize_alts(self):
+        assert mdh.normalize_pair("ETHUSD") == "ETH/USD"
+        assert mdh.normalize_pair("SOLUSDT") == "SOL/USDT"
+
+
+class TestReplay:
+    def test_replay_builds_local_state(self, hub, rest, tmp_path):
+        path = _record(tmp_path, [
+            [340, TICKER, "ticker", "XBT/USD"],
+            [1234, {"as": ASKS}, {"bs": BIDS}, "book-10", "XBT/USD"],
+            [42, _candle(1_700_000_000, 100.5), "ohlc-1", "XBT/USD"],
+            [42, _candle(1_700_000_060, 101.5), "ohlc-1", "XBT/USD"],
+            [42, _candle(1_700_000_060, 102.0), "ohlc-1", "XBT/USD"],
+        ])
+        assert hub.replay(path) == 5
+
+        assert hub.get_ticker("XBTUSD")["c"] == ["5525.1", "0.1"]
+        book = hub.get_order_book("BTC/USD", count=2)
+        assert [a[0] for a in book["asks"]] == ["5541.30000", "5541.80000"]
+        assert [b[0] for b in book["bids"]] == ["5541.20000", "5539.90000"]
+        candles = hub.get_ohlc("XBTUSD", interval=1)
+        assert [c[0] for c in candles] == [1_700_000_000, 1_700_000_060]
+        assert candles[-1][4] == "102.0"
+        assert hub.get_ohlc("XBTUSD", interval=1, since=1_700_000_000) == candles[1:]
+
+        rest.assert_not_called()
+        assert hub.get_status()["rest_fallbacks"] == 0
+
+    def test_recording_roundtrip(self, rest, tmp_path):
+        path = str(tmp_path / "rec.jsonl")
+        recorder = mdh.MarketDataHub(rest=rest, record_path=path)
+        recorder.on_message(json.dumps([340, TICKER, "ticker", "XBT/USD"]))
+        replayed = mdh.MarketDataHub(rest=rest)
+        assert replayed.replay(path) == 1
+        assert replayed.peek_ticker("XBT/USD") == TICKER
+
+
+class TestBookChecksum:
+    def _snapshot(self, hub):
+        hub.on_message([1234, {"as": ASKS}, {"bs": BIDS}, "book-10", "XBT/USD"])
+
+    def test_checksum_matches_reference(self, hub):
+        self._snapshot(hub)
+        assert hub._books["XBT/USD"].checksum() == _kraken_crc(ASKS, BIDS)
+
+    def test_valid_update_applied(self, hub):
+        self._snapshot(hub)
+        new_asks = [a for a in ASKS if a[0] != "5541.80000"] + [["5541.50000", "1.00000000", "1"]]
+        hub.on_message(_book_update("a", [["5541.80000", "0.00000000", "2"],
+                                          ["5541.50000", "1.00000000", "1"]],
+                                    _kraken_crc(new_asks, BIDS)))
+        book = hub.peek_order_book("XBT/USD", count=3)
+        assert [a[0] for a in book["asks"]] == ["5541.30000", "5541.50000", "5542.70000"]
+        assert hub.checksum_failures == 0
+
+    def test_mismatch_invalidates_and_resubscribes(self, hub, rest):
+        self._snapshot(hub)
+        hub.on_message(_book_update("b", [["5541.00000", "1.00000000", "3"]], 12345))
+        assert hub.checksum_failures == 1
+        assert hub.peek_order_book("XBT/USD") is None
+        hub._ws.resubscribe.assert_called_once_with("book_XBT/USD")
+
+        rest._rest_get_order_book.return_value = {"asks": [], "bids": []}
+        assert hub.get_order_book("XBT/USD") == {"asks": [], "bids": []}
+        rest._rest_get_order_book.assert_called_once_with("XBT/USD", count=10)
+
+        self._snapshot(hub)                          # Kraken resends the snapshot
+        assert hub.peek_order_book("XBT/USD") is not None
+
+
+class TestCandles:
+    def test_gap_backfilled_from_rest(self, hub, rest):
+        base = 1_700_000_000
+        missed = [[base + 60, "1", "1", "1", "1", "1", "1", 1],
+                  [base + 120, "2", "2", "2", "2", "2", "2", 1]]
+        rest._rest_get_ohlc.return_value = missed
+        hub.on_message([42, _candle(base, 100.0), "ohlc-1", "XBT/USD"])
+        hub.on_message([42, _candle(base + 180, 103.0), "ohlc-1", "XBT/USD"])
+
+        deadline = time.monotonic() + 5
+        while hub.backfills == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        rest._rest_get_ohlc.assert_called_once_with("XBT/USD", interval=1, since=base)
+        assert [c[0] for c in hub.peek_ohlc("XBT/USD", 1)] == [base, base + 60, base + 120, base + 180]
+
+    def test_ring_is_bounded(self, hub):
+        for i in range(80):
+            hub.on_message([42, _candle(1_700_000_000 + i * 60, i), "ohlc-1", "XBT/USD"])
+        assert len(hub.peek_ohlc("XBT/USD", 1)) == 50
+
+    def test_missing_ring_seeded_from_rest_once(self, hub, rest):
+        rows = [[1_700_000_000 + i * 3600, "1", "1", "1", "1", "1", "1", 1] for i in range(3)]
+        rest._rest_get_ohlc.return_value = rows
+        assert hub.get_ohlc("ETHUSD", interval=60) == rows
+        assert hub.get_ohlc("ETH/USD", interval=60) == rows
+        assert rest._rest_get_ohlc.call_count == 1
+
+
+class TestStaleness:
+    def test_stale_ticker_falls_back_to_rest(self, hub, rest):
+        hub.on_message([340, TICKER, "ticker", "XBT/USD"])
+        hub._tickers["XBT/USD"] = (time.monotonic() - 60, TICKER)
+        rest._rest_get_ticker.return_value = {"c": ["1.0", "1"]}
+        assert hub.get_ticker("XBT/USD") == {"c": ["1.0", "1"]}
+        assert hub.peek_ticker("XBT/USD") is None
+
+
+class TestConsumers:
+    def test_correlation_inputs(self, hub):
+        hub.on_message([340, TICKER, "ticker", "XBT/USD"])
+        assert hub.correlation_inputs(["BTC", "ETH"]) == {
+            "BTC": {"price": 5525.1, "volume": 3002.5}}
+
+    def test_kraken_client_reads_hub_first(self, hub):
+        try:
+            from omnix_services.trading_service.kraken_client import KrakenAPIClient
+        except Exception:                           # pragma: no cover - optional deps
+            pytest.skip("omnix_services.trading_service not importable in test env")
+
+        client = KrakenAPIClient.__new__(KrakenAPIClient)
+        client._market_data_hub = hub
+        client._rest_get_ticker = MagicMock()
+        hub.on_message([340, TICKER, "ticker", "XBT/USD"])
+        assert client.get_ticker("XBTUSD") == TICKER
+        client._rest_get_ticker.assert_not_called()
@@ -0,0 +1,331 @@
+"""
+RFC 6962 Merkle transparency log (ADR-044)
+
+  TestTreeMath        — roots / inclusion / consistency vs a brute-force tree
+  TestBuilder         — MerkleTransparencyLog tailing the chain into stored nodes
+  TestOfflineVerifier — scripts/verify_tlog_proof_offline.py, zero OMNIX imports
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+
+from omnix_core.evidence import merkle_log as ml
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+T0 = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _brute_root(leaves):
+    if len(leaves) == 1:
+        return leaves[0]
+    k = ml._split(len(leaves))
+    return ml.node_hash(_brute_root(leaves[:k]), _brute_root(leaves[k:]))
+
+
+def _leaves(n):
+    return [ml.leaf_hash(f"leaf-{i}".encode()) for i in range(n)]
+
+
+class TestTreeMath:
+
+    def test_roots_match_recursive_definition(self):
+        leaves = _leaves(40)
+        for n in range(1, 41):
+            assert ml.MerkleTree(leaves[:n]).root() == _brute_root(leaves[:n])
+        assert ml.MerkleTree().root() == ml.EMPTY_ROOT
+
+    def test_domain_separation(self):
+        a, b = _leaves(2)
+        assert ml.leaf_hash(bytes.fromhex(a) + bytes.fromhex(b)) != ml.node_hash(a, b)
+
+    def test_incremental_extend_equals_bulk(self):
+        leaves = _leaves(37)
+        tree = ml.MerkleTree()
+        for chunk in (leaves[:1], leaves[1:8], leaves[8:9], leaves[9:37]):
+            tree.extend(chunk)
+        assert tree.nodes == ml.MerkleTree(leaves).nodes
+
+    def test_every_inclusion_proof_verifies(self):
+        leaves = _leaves(33)
+        for n in range(1, 34):
+            tree = ml.MerkleTree(leaves[:n])
+            for i in range(n):
+                path = tree.inclusion_proof(i)
+                assert len(path) <= (n - 1).bit_length()
+                assert ml.verify_inclusion(leaves[i], i, n, path, tree.root())
+
+    def test_inclusion_against_older_size(self):
+        tree = ml.MerkleTree(_leaves(20))
+        assert ml.verify_inclusion(tree.nodes[(0, 3)], 3, 11, tree.inclusion_proof(3, 11), tree.root(11))
+
+    def test_tampered_inclusion_rejected(self):
+        leaves = _leaves(13)
+        tree = ml.MerkleTree(leaves)
+        path = tree.inclusion_proof(6)
+        assert not ml.verify_inclusion(leaves[7], 6, 13, path, tree.root())
+        assert not ml.verify_inclusion(leaves[6], 5, 13, path, tree.root())
+        assert not ml.verify_inclusion(leaves[6], 6, 13, path[:-1], tree.root())
+        assert not ml.verify_inclusion(leaves[6], 6, 13, path + [leaves[0]], tree.root())
+        assert not ml.verify_inclusion(leaves[6], 13, 13, path, tree.root())
+
+    def test_every_consistency_proof_verifies(self):
+        tree = ml.MerkleTree(_leaves(33))
+        for n in range(1, 34):
+            for m in range(1, n + 1):
+                proof = tree.consistency_proof(m, n)
+                assert ml.verify_consistency(m, n, tree.root(m), tree.root(n), proof)
+
+    def test_rewritten_history_rejected(self):
+        leaves = _leaves(21)
+        honest = ml.MerkleTree(leaves)
+        forked = ml.MerkleTree(leaves[:4] + [ml.leaf_hash(b"evil")] + leaves[5:])
+        proof = forked.consistency_proof(7, 21)
+        assert not ml.verify_consistency(7, 21, honest.root(7), forked.root(), proof)
+        assert not ml.verify_consistency(7, 21, honest.root(7), honest.root(), proof[:-1])
+        assert not ml.verify_consistency(8, 7, honest.root(7), honest.root(), [])
+
+    def test_range_validation(self):
+        with pytest.raises(ValueError):
+            ml.inclusion_ranges(5, 5)
+        with pytest.raises(ValueError):
+            ml.consistency_ranges(0, 5)
+
+
+# ── fake DB: tables in dicts, scripted by SQL substring ──
+
+class FakeDB:
+    def __init__(self):
+        self.log = []            # governance_transparency_log rows, log_seq first
+        self.leaves = {}         # leaf_index → row
+        self.nodes = {}          # (level, index) → hash
+        self.heads = {}          # tree_size → sth tuple
+        self.state = None
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = []
+
+    def execute(self, sql, params=()):
+        db, params = self.db, list(params or ())
+        self._result = []
+        if "CREATE" in sql or "ALTER" in sql:
+            return
+        if "INSERT INTO transparency_merkle_state" in sql:
+            db.state = db.state or [0, 0]
+        elif "FROM transparency_merkle_state" in sql:
+            self._result = [tuple(db.state)]
+        elif "FROM governance_transparency_log" in sql:
+            last_seq, limit = params
+            logged = {leaf[1] for leaf in db.leaves.values()}
+            rows = sorted(r for r in db.log if r[0] > last_seq and r[1] not in logged)
+            self._result = rows[:limit]
+        elif "FROM transparency_merkle_nodes" in sql:
+            keys = list(zip(params[::2], params[1::2]))
+            self._result = [(lvl, i, db.nodes[(lvl, i)]) for lvl, i in keys if (lvl, i) in db.nodes]
+        elif "INSERT INTO transparency_merkle_leaves" in sql:
+            for j in range(0, len(params), 7):
+                db.leaves[params[j]] = params[j:j + 7]
+        elif "INSERT INTO transparency_merkle_nodes" in sql:
+            for j in range(0, len(params), 3):
+                db.nodes[(params[j], params[j + 1])] = params[j + 2]
+        elif "INSERT INTO transparency_tree_heads" in sql:
+            db.heads[params[0]] = tuple(params)
+        elif "UPDATE transparency_merkle_state" in sql:
+            db.state = [params[0], params[1]]
+        elif "FROM transparency_merkle_leaves" in sql:
+            hits = sorted(r for r in db.leaves.values() if r[2] == params[0])
+            self._result = [(r[0], r[2], r[3], r[4], r[5]) for r in hits[:1]]
+        elif "FROM transparency_tree_heads" in sql:
+            if params:
+                self._result = [db.heads[params[0]]] if params[0] in db.heads else []
+            else:
+                self._result = [db.heads[max(db.heads)]] if db.heads else []
+        else:
+            raise AssertionError(f"unscripted SQL: {sql}")
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return list(self._result)
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _unsigned_sth(size, root):
+    return {"log_id": ml.LOG_ID, "tree_size": size, "root_hash": root,
+            "timestamp": T0.isoformat(), "signing_provider": "none",
+            "signature_b64": None, "public_key_b64": None, "key_id": None}
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+@pytest.fixture
+def log(db):
+    with patch.object(ml, "sign_tree_head", _unsigned_sth):
+        yield ml.MerkleTransparencyLog(lambda: FakeConn(db), batch_size=4)
+
+
+def _append(db, start, n, ts=None):
+    for i in range(start, start + n):
+        db.log.append((len(db.log) + 1, f"LOG-{i:04d}", f"OMNIX-R-{i}", "decision", f"{i:064x}",
+                       ts or T0 + timedelta(seconds=i)))
+
+
+class TestBuilder:
+
+    def test_batches_build_the_same_tree_as_memory(self, db, log):
+        _append(db, 0, 11)
+        assert log.catch_up() == 11
+        assert db.state[0] == 11
+        assert sorted(db.heads) == [4, 8, 11]
+        expected = ml.MerkleTree(
+            ml.entry_leaf_hash(f"OMNIX-R-{i}", "decision", f"{i:064x}") for i in range(11)
+        )
+        assert db.nodes == expected.nodes
+        assert db.heads[11][1] == expected.root()
+        assert log.run_once() == 0
+
+    def test_watermark_resumes_after_new_entries(self, db, log):
+        _append(db, 0, 3)
+        log.catch_up()
+        _append(db, 3, 6)
+        assert log.catch_up() == 6
+        assert [r[1] for _, r in sorted(db.leaves.items())] == [f"LOG-{i:04d}" for i in range(9)]
+
+    def test_late_commit_with_old_timestamp_is_logged(self, db, log):
+        _append(db, 0, 5)
+        log.catch_up()
+        _append(db, 5, 1, ts=T0 - timedelta(days=1))      # reconciled pending entry
+        assert log.catch_up() == 1
+        assert db.state == [6, 6]
+        assert log.get_inclusion_proof("OMNIX-R-5")["status"] == "INCLUDED"
+
+    def test_entries_already_leaved_are_not_duplicated(self, db, log):
+        _append(db, 0, 6)
+        log.catch_up()
+        db.state = [6, 0]                                   # fresh last_seq after migration
+        assert log.run_once() == 0
+        assert len(db.leaves) == 6
+
+    def test_inclusion_proof_verifies_against_tree_head(self, db, log):
+        _append(db, 0, 10)
+        log.catch_up()
+        proof = log.get_inclusion_proof("OMNIX-R-6")
+        assert proof["status"] == "INCLUDED"
+        assert proof["leaf_index"] == 6 and proof["tree_size"] == 10
+        assert proof["signed_tree_head"]["root_hash"] == proof["root_hash"]
+        assert ml.verify_inclusion(proof["leaf_hash"], 6, 10, proof["audit_path"], proof["root_hash"])
+
+    def test_inclusion_proof_statuses(self, db, log):
+        _append(db, 0, 4)
+        log.catch_up()
+        db.leaves[4] = (4, "LOG-X", "OMNIX-LATE", "decision", "ab", "cd", T0)
+        assert log.get_inclusion_proof("OMNIX-LATE")["status"] == "PENDING"
+        assert log.get_inclusion_proof("OMNIX-NOPE")["status"] == "NOT_LOGGED"
+
+    def test_consistency_proof_between_tree_heads(self, db, log):
+        _append(db, 0, 11)
+        log.catch_up()
+        proof = log.get_consistency_proof(4)
+        assert proof["new_size"] == 11
+        assert proof["old_root"] == db.heads[4][1]
+        assert ml.verify_consistency(4, 11, proof["old_root"], proof["new_root"], proof["proof"])
+        assert log.get_consistency_proof(12) is None
+
+    def test_reads_never_raise(self):
+        def broken():
+            raise RuntimeError("db down")
+        log = ml.MerkleTransparencyLog(broken)
+        assert log.get_inclusion_proof("X") is None
+        assert log.get_tree_head() is None
+        assert ml.MerkleTransparencyLog(lambda: None).run_once() == 0
+
+    def test_sign_tree_head_unsigned_without_provider(self):
+        with patch("omnix_core.security.crypto_providers.get_active_provider",
+                   side_effect=RuntimeError("no provider")):
+            sth = ml.sign_tree_head(3, "ab" * 32)
+        assert sth["signing_provider"] == "none" and sth["signature_b64"] is None
+        assert sth["tree_size"] == 3
+
+
+def _load_verifier():
+    path = os.path.join(_ROOT, "scripts", "verify_tlog_proof_offline.py")
+    spec = importlib.util.spec_from_file_location("verify_tlog_proof_offline", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestOfflineVerifier:
+
+    def _run(self, tmp_path, payload, *extra):
+        verifier = _load_verifier()
+        f = tmp_path / "proof.json"
+        f.write_text(json.dumps(payload))
+        with patch.object(sys, "argv", ["verify", "--file", str(f), "--json", *extra]):
+            return verifier.main()
+
+    def test_verify_response_with_inclusion_proof(self, db, log, tmp_path):
+        _append(db, 0, 7)
+        log.catch_up()
+        body = {"found": True, "transparency_proof": log.get_inclusion_proof("OMNIX-R-5")}
+        assert self._run(tmp_path, body) == 0
+
+    def test_tampered_leaf_input_fails(self, db, log, tmp_path):
+        _append(db, 0, 7)
+        log.catch_up()
+        proof = log.get_inclusion_proof("OMNIX-R-5")
+        proof["leaf_input"]["payload_hash"] = "0" * 64
+        assert self._run(tmp_path, proof) == 1
+
+    def test_consistency_with_pinned_root(self, db, log, tmp_path):
+        _append(db, 0, 9)
+        log.catch_up()
+        proof = log.get_consistency_proof(4)
+        assert self._run(tmp_path, proof, "--old-root", db.heads[4][1]) == 0
+        assert self._run(tmp_path, proof, "--old-root", "f" * 64) == 1
+
+    def test_pending_and_garbage_are_exit_2(self, tmp_path):
+        assert self._run(tmp_path, {"transparency_proof": {"status": "PENDING"}}) == 2
+        assert self._run(tmp_path, {"hello": 1}) == 2
+
+    def test_verifier_matches_core_algorithms(self):
+        verifier = _load_verifier()
+        tree = ml.MerkleTree(_leaves(19))
+        for i in (0, 7, 18):
+            path = tree.inclusion_proof(i)
+            assert verifier._root_from_inclusion(tree.nodes[(0, i)], i, 19, path) == tree.root()
+        assert verifier._verify_consistency(5, 19, tree.root(5), tree.root(), tree.consistency_proof(5))
+        assert verifier._entry_leaf_input("R", "decision", "h") == ml.entry_leaf_input("R", "decision", "h")
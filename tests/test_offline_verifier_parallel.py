@@ -0,0 +1,212 @@
+"""
+Offline verifiers — parallel mode (--jobs, directory, benchmark)
+================================================================
+  · scripts/offline_verify_parallel.py is shared by the RTE-001, RCEP and PoGC verifiers
+  · batched ML-DSA-65 checks give the same checks and output as --jobs 1
+  · canonical-JSON hashes memoized per object within a run
+  · directory mode verifies packages in order; --benchmark prints checks/s
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import re
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+EVIDENCE = ROOT / "evidence_packages"
+PACKAGES = sorted(p for p in EVIDENCE.glob("OMNIX-RTE-001_*.json")
+                  if not p.name.endswith("_verification_report.json"))
+RCEP_PACKAGES = sorted(p for p in EVIDENCE.glob("omnix_evidence_package_*.json")
+                       if not p.name.endswith("_verification_report.json"))
+CERTIFICATES = sorted(EVIDENCE.glob("POGC-*.json"))
+
+
+def _load_script(filename, name):
+    spec = importlib.util.spec_from_file_location(name, ROOT / "scripts" / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+vt = _load_script("verify_treasury_execution_trace.py", "verify_rte001_parallel")
+ve = _load_script("verify_evidence_package.py", "verify_rcep_parallel")
+vp = _load_script("verify_pogc_offline.py", "verify_pogc_parallel")
+engine = vt._parallel
+
+pytestmark = pytest.mark.skipif(not PACKAGES, reason="no RTE-001 evidence packages")
+
+
+class _FakeVerifier:
+    """Deterministic stand-in for ML-DSA-65: about half the signatures 'verify'."""
+    pqc_enabled = True
+
+    def verify_signature(self, sig_bytes: bytes, msg_bytes: bytes, pk: bytes) -> bool:
+        return hashlib.sha256(sig_bytes + msg_bytes).digest()[0] % 2 == 0
+
+
+def _fake_load_pqc(pk_b64):
+    return _FakeVerifier(), b"pk"
+
+
+def _args(**overrides):
+    args = vt.argparse.Namespace(
+        package=None, json=False, jobs=1, benchmark=False,
+        treasury_protocol=False, mandate_timeline=False, chain_custody=False,
+        check_version=False, intake_report=False,
+        **{flag: False for flag, _ in vt._SUITES},
+    )
+    for key, value in overrides.items():
+        setattr(args, key, value)
+    return args
+
+
+_NOW = re.compile(r"(Now|Time): +\S+")
+
+
+def _run(pkg_path, jobs, capsys):
+    code, report = vt.verify_package_file(str(pkg_path), _args(jobs=jobs))
+    out = _NOW.sub("", capsys.readouterr().out)
+    checks = [{k: v for k, v in c.items() if k != "detail" or "Now:" not in v}
+              for c in report.checks]
+    return code, checks, out
+
+
+class TestSignatureBatch:
+    def test_jobs_output_identical_to_sequential(self, capsys):
+        with patch.object(vt, "_load_pqc", _fake_load_pqc):
+            seq = _run(PACKAGES[-1], 1, capsys)
+            par = _run(PACKAGES[-1], 3, capsys)
+        assert seq == par
+        statuses = {c["status"] for c in seq[1]}
+        assert {"PASS", "FAIL"} <= statuses and "SKIP" not in statuses
+        assert len(seq[1]) == vt.EXPECTED_TOTAL_CHECKS
+
+    def test_duplicate_signatures_verified_once(self):
+        batch = engine.SignatureBatch(_fake_load_pqc, "", jobs=2)
+        assert batch.verify(None, b"sig", b"msg", b"pk") is True
+        batch.verify(None, b"sig", b"msg", b"pk")
+        batch.verify(None, b"sig", b"other", b"pk")
+        assert batch.requested == 3 and len(batch.results) == 2
+
+    def test_pool_failure_falls_back_in_process(self, capsys):
+        with patch.object(vt, "_load_pqc", _fake_load_pqc), \
+             patch.object(engine, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            par = _run(PACKAGES[-1], 4, capsys)
+            seq = _run(PACKAGES[-1], 1, capsys)
+        assert par[1] == seq[1]
+
+    def test_errors_served_with_original_message(self):
+        class _Raising(_FakeVerifier):
+            def verify_signature(self, sig_bytes, msg_bytes, pk):
+                raise ValueError("bad length")
+
+        batch = engine.SignatureBatch(_fake_load_pqc, "", jobs=2)
+        batch.verify(None, b"sig", b"msg", b"pk")
+        with patch.object(engine, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            batch.resolve(_Raising(), b"pk")
+        with pytest.raises(RuntimeError, match="^bad length$"):
+            batch.verify(None, b"sig", b"msg", b"pk")
+        fake = _FakeVerifier()
+        assert batch.verify(fake, b"new", b"msg", b"pk") == fake.verify_signature(b"new", b"msg", b"pk")
+
+
+class TestHashMemo:
+    def test_hash_computed_once_per_object(self):
+        fields = {"a": 1, "content_hash": "x"}
+        with patch.object(vt, "_sha3", wraps=vt._sha3) as sha3:
+            h1 = vt._hash_default(fields, exclude=["content_hash"])
+            h2 = vt._hash_default(fields, exclude=["content_hash"])
+            vt._hash_default(fields, exclude=[])
+        assert h1 == h2 and sha3.call_count == 2
+        assert vt._hash_compact(fields, exclude=["content_hash"]) != h1
+        engine.clear_memo()
+
+    def test_memo_cleared_after_run(self, capsys):
+        vt.verify_package_file(str(PACKAGES[-1]), _args())
+        assert engine._HASH_MEMO == {}
+
+
+class TestDirectoryMode:
+    def test_packages_verified_in_order(self, tmp_path, capsys):
+        for p in PACKAGES[:3]:
+            shutil.copy(p, tmp_path / p.name)
+        (tmp_path / f"{PACKAGES[0].stem}_verification_report.json").write_text("{}")
+        code = vt.run_directory(str(tmp_path), _args(jobs=2))
+        out = capsys.readouterr().out
+        assert code == 0
+        assert "DIRECTORY SUMMARY — 3 package(s)" in out
+        positions = [out.index(f"File:     {tmp_path / p.name}") for p in PACKAGES[:3]]
+        assert positions == sorted(positions)
+
+    def test_bad_package_reported_as_error(self, tmp_path, capsys):
+        shutil.copy(PACKAGES[0], tmp_path / PACKAGES[0].name)
+        (tmp_path / "OMNIX-RTE-001_broken.json").write_text("{not json")
+        assert vt.run_directory(str(tmp_path), _args(jobs=2)) == 2
+        assert re.search(r"ERROR +0 checks  OMNIX-RTE-001_broken\.json", capsys.readouterr().out)
+
+    def test_empty_directory(self, tmp_path, capsys):
+        assert vt.run_directory(str(tmp_path), _args()) == 2
+
+    def test_benchmark_prints_checks_per_second(self, capsys):
+        assert vt.run_benchmark([str(PACKAGES[-1])], _args(jobs=2)) == 0
+        out = capsys.readouterr().out
+        assert len(re.findall(r"jobs=\d+ .* checks/s", out)) == 2
+
+
+@pytest.mark.skipif(not RCEP_PACKAGES, reason="no RCEP evidence packages")
+class TestEvidencePackageVerifier:
+    def _run(self, path, jobs, capsys):
+        with patch.object(ve, "_load_pqc", _fake_load_pqc):
+            code, report = ve.verify_package(str(path), jobs)
+        return code, report.checks, capsys.readouterr().out
+
+    def test_jobs_output_identical_to_sequential(self, tmp_path, capsys):
+        path = tmp_path / RCEP_PACKAGES[-1].name
+        shutil.copy(RCEP_PACKAGES[-1], path)
+        seq = self._run(path, 1, capsys)
+        par = self._run(path, 3, capsys)
+        assert seq == par
+        assert {"PASS", "FAIL"} <= {c["status"] for c in seq[1]}
+        assert (tmp_path / f"{path.stem}_verification_report.json").exists()
+
+    def test_hashes_memoized_per_record(self):
+        record = {"a": 1, "content_hash": "x"}
+        with patch.object(ve.hashlib, "sha3_256", wraps=hashlib.sha3_256) as sha3:
+            h1 = ve._hash_excluding(record, {"content_hash"}, ve._sha3_default)
+            h2 = ve._hash_excluding(record, {"content_hash"}, ve._sha3_default)
+        engine.clear_memo()
+        assert h1 == h2 == ve._sha3_default({"a": 1}) and sha3.call_count == 1
+
+    def test_directory_mode(self, tmp_path, capsys):
+        for p in RCEP_PACKAGES:
+            shutil.copy(p, tmp_path / p.name)
+        paths = ve._list_packages(str(tmp_path))
+        assert len(paths) == len(RCEP_PACKAGES)
+        assert engine.run_directory(ve._verify_checks, paths, 2) == 0
+        assert f"DIRECTORY SUMMARY — {len(paths)} package(s)" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not CERTIFICATES, reason="no PoGC certificates")
+class TestPogcVerifier:
+    def test_directory_mode_matches_sequential(self, tmp_path, capsys):
+        shutil.copy(CERTIFICATES[0], tmp_path / CERTIFICATES[0].name)
+        (tmp_path / "POGC-broken.json").write_text("{not json")
+        paths = vp._list_certificates(str(tmp_path))
+        verify_one = functools.partial(vp.verify_certificate_file, allow_sim=True)
+        strip = re.compile(r"Verified at.*")
+        seq = [(c, n, strip.sub("", o)) for _, c, n, o in engine.verify_many(verify_one, paths, 1)]
+        par = [(c, n, strip.sub("", o)) for _, c, n, o in engine.verify_many(verify_one, paths, 2)]
+        assert seq == par
+        assert [code for code, _, _ in seq][1] == 2 and seq[0][1] == 7
+        assert engine.run_directory(verify_one, paths, 2, unit="certificate") == 2
+        assert "DIRECTORY SUMMARY — 2 certificate(s)" in capsys.readouterr().out
@@ -0,0 +1,393 @@
+"""
+OGR bounded session cache and turn write-behind (ADR-184)
+=========================================================
+  · _SessionCache: closed / idle TTL, LRU capacity, pinned and no-DB sessions kept
+  · TurnWriteBehind: group commit, WAL durability, per-turn retry, reconcile
+  · GovernanceRuntime.record_turn: one bundle per turn, HALT committed synchronously
+  · default path: one transaction per turn under a per-session advisory lock,
+    state re-read from the session row, dead writers' WAL entries replayed
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+from omnix_core.evidence.receipt_wal import ReceiptWAL
+from omnix_core.govern import turn_write_behind as twb
+from omnix_core.govern.governance_runtime import (
+    STATUS_ACTIVE,
+    STATUS_CLOSED,
+    GovernanceRuntime,
+    OGRSession,
+    _SessionCache,
+)
+
+
+def _session(session_id: str, status: str = STATUS_ACTIVE) -> OGRSession:
+    return OGRSession(
+        session_id=session_id, agent_id="AID-T", governing_receipt_id="RCP-T",
+        domain="general", vertical="general", policy_name="default",
+        constraint_set={}, session_status=status, compliance_tier="ATF-BEV-Compliant",
+        turn_count=0, total_drift=0.0, chain_id=None, chain_genesis_hash=None,
+        chain_tip_hash=None, chain_sealed=False, chain_seal_hash=None,
+        last_verdict="CONFORMANT", halt_reason=None, oep_export_id=None,
+        atf_layers_active=[], mbr_id=None, mandate_bound=False,
+        started_at="2026-10-01T00:00:00+00:00", closed_at=None,
+    )
+
+
+_SESSION_COLUMNS = (
+    "session_id", "agent_id", "governing_receipt_id", "domain", "vertical",
+    "policy_name", "constraint_set", "session_status", "compliance_tier",
+    "turn_count", "total_drift", "chain_id", "chain_genesis_hash", "chain_tip_hash",
+    "chain_sealed", "last_verdict", "atf_layers_active", "started_at", "metadata",
+)
+
+
+class FakeDB:
+    """Records committed statements; keeps session rows and chain tips like the real tables."""
+
+    def __init__(self):
+        self.executed: List[tuple] = []
+        self.commits = 0
+        self.fail_when = None          # predicate over (sql, params) → raise
+        self.sessions = {}
+        self.tips = {}
+
+    def connect(self):
+        return FakeConn(self)
+
+    def apply(self, sql, params):
+        self.executed.append((sql, params))
+        if "INSERT INTO atf_ogr_sessions" in sql:
+            self.sessions.setdefault(params[0], dict(zip(_SESSION_COLUMNS, params)))
+        elif "UPDATE atf_ogr_sessions" in sql and "turn_count=%s" in sql:
+            row = self.sessions.get(params[6])
+            if row is not None and row["turn_count"] < params[7]:
+                row.update(zip(("turn_count", "total_drift", "chain_tip_hash", "last_verdict",
+                                "session_status", "halt_reason"), params[:6]))
+        elif "UPDATE atf_coherence_hash_chains" in sql:
+            self.tips[params[2]] = params[0]
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db, self._staged = db, []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        for sql, params in self._staged:
+            self.db.apply(sql, params)
+        self._staged = []
+        self.db.commits += 1
+
+    def rollback(self):
+        self._staged = []
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=()):
+        if self.conn.db.fail_when and self.conn.db.fail_when(sql, params):
+            raise RuntimeError("constraint violation")
+        self.conn._staged.append((sql, params))
+        self._row = None
+        db = self.conn.db
+        if sql.startswith("SELECT * FROM atf_ogr_sessions") and params[0] in db.sessions:
+            row = db.sessions[params[0]]
+            self.description = [(c,) for c in row]
+            self._row = tuple(row.values())
+        elif sql.startswith("SELECT current_tip_hash") and params[0] in db.sessions:
+            self._row = (db.tips.get(params[0]) or db.sessions[params[0]]["chain_tip_hash"],)
+
+    def fetchone(self):
+        return self._row
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+@pytest.fixture
+def wal(tmp_path):
+    w = ReceiptWAL(str(tmp_path / "ogr_wal.jsonl"), fsync=False)
+    yield w
+    w.close()
+
+
+def _tip(session_id: str, n: int):
+    return [("ctchc_tip", (f"tip-{n}", n + 1, session_id, n + 1))]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Session cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestSessionCache:
+    def test_closed_sessions_expire_before_active(self):
+        cache = _SessionCache(max_entries=100, idle_ttl_s=1000, closed_ttl_s=10, sweep_s=1e9)
+        cache["A"] = _session("A")
+        cache["C"] = _session("C", STATUS_CLOSED)
+        assert cache.sweep(now=cache._entries["C"][1] + 11) == 1
+        assert "A" in cache and "C" not in cache
+
+    def test_idle_active_evicted_only_with_db(self):
+        cache = _SessionCache(max_entries=100, idle_ttl_s=5, closed_ttl_s=5, sweep_s=1e9)
+        cache["A"] = _session("A")
+        later = cache._entries["A"][1] + 6
+        assert cache.sweep(now=later) == 0          # no DB: the cache is the only copy
+        cache.is_authoritative = lambda: False
+        assert cache.sweep(now=later) == 1
+
+    def test_capacity_evicts_lru_but_not_pinned(self):
+        cache = _SessionCache(max_entries=2, idle_ttl_s=1e9, closed_ttl_s=1e9, sweep_s=1e9)
+        cache.is_authoritative = lambda: False
+        cache.is_pinned = lambda sid: sid == "A"
+        cache["A"] = _session("A")
+        cache["B"] = _session("B")
+        cache.get("A")
+        cache["C"] = _session("C")
+        assert "A" in cache and "B" not in cache and "C" in cache
+        assert len(cache) == 2 and cache.evictions == 1
+
+    def test_dict_protocol(self):
+        cache = _SessionCache(sweep_s=1e9)
+        cache["A"] = _session("A")
+        assert cache["A"].session_id == "A"
+        with pytest.raises(KeyError):
+            cache["missing"]
+        assert cache.pop("A").session_id == "A" and cache.get("A") is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TurnWriteBehind
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestTurnWriteBehind:
+    def test_concurrent_turns_share_transactions(self, db, wal):
+        wb = twb.TurnWriteBehind(db.connect, wal=wal, batch_size=64, flush_ms=50)
+        threads = [threading.Thread(target=wb.submit, args=(f"S{i}", 0, _tip(f"S{i}", 0)))
+                   for i in range(40)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert wb.flush(timeout=5)
+        wb.stop()
+        assert len(db.executed) == 40
+        assert db.commits < 40
+        assert wal.wal_size() == 0
+
+    def test_statements_resolve_to_engine_sql(self, db, wal):
+        wb = twb.TurnWriteBehind(db.connect, wal=wal, flush_ms=0)
+        wb.submit("S1", 0, _tip("S1", 0), synchronous=True)
+        wb.stop()
+        sql, params = db.executed[0]
+        assert "UPDATE atf_coherence_hash_chains" in sql and "turn_count < %s" in sql
+        assert params == ("tip-0", 1, "S1", 1)
+        with pytest.raises(ValueError):
+            twb._statement_sql("nope")
+
+    def test_bad_turn_isolated_and_kept_in_wal(self, db, wal):
+        db.fail_when = lambda sql, params: params[2] == "BAD"
+        wb = twb.TurnWriteBehind(db.connect, wal=wal, batch_size=8, flush_ms=100)
+        for sid in ("S1", "BAD", "S2"):
+            wb.submit(sid, 0, _tip(sid, 0))
+        assert wb.flush(timeout=5)
+        wb.stop()
+        assert sorted(p[2] for _, p in db.executed) == ["S1", "S2"]
+        assert wb.turns_failed == 1 and wal.wal_size() == 1
+
+        db.fail_when = None
+        assert wb.reconcile() == 1
+        assert wal.wal_size() == 0 and db.executed[-1][1][2] == "BAD"
+
+    def test_wal_survives_crash_and_replays(self, db, tmp_path):
+        path = str(tmp_path / "crash_wal.jsonl")
+        db.fail_when = lambda sql, params: True      # DB down for the whole "process"
+        first = ReceiptWAL(path, fsync=False)
+        wb = twb.TurnWriteBehind(db.connect, wal=first, flush_ms=0)
+        wb.submit("S1", 0, _tip("S1", 0))
+        wb.submit("S1", 1, _tip("S1", 1))
+        wb.flush(timeout=5)
+        wb.stop()
+        first.close()
+
+        db.fail_when = None
+        restarted = twb.TurnWriteBehind(db.connect, wal=ReceiptWAL(path, fsync=False))
+        assert restarted.reconcile() == 2
+        restarted.stop()
+        assert [p[1] for _, p in db.executed] == [1, 2]
+
+    def test_queue_full_writes_inline(self, db, wal):
+        wb = twb.TurnWriteBehind(db.connect, wal=wal, max_queue=1, flush_ms=0)
+        wb.stop()                                    # no worker: the queue never drains
+        wb.submit("S1", 0, _tip("S1", 0))
+        wb.submit("S2", 0, _tip("S2", 0))
+        assert [p[2] for _, p in db.executed] == ["S2"]
+        assert wb.pending("S1") == 1 and wb.pending("S2") == 0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GovernanceRuntime integration
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _runtime(db, wal) -> GovernanceRuntime:
+    from omnix_core.bev.behavioral_anchor_record import BAREngine
+    from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+    from omnix_core.bev.constraint_conformance_signal import CCSEngine
+
+    rt = GovernanceRuntime()
+    rt._bar_engine, rt._ccs_engine, rt._ctchc_engine = BAREngine(), CCSEngine(), CTCHCEngine()
+    for engine in (rt._bar_engine, rt._ccs_engine, rt._ctchc_engine):
+        engine._db_url = None
+    rt._db_url = "postgresql://test/test"
+    rt._get_conn = db.connect
+    rt._write_behind_enabled = True
+    rt._write_behind = twb.TurnWriteBehind(db.connect, wal=wal, flush_ms=20)
+    return rt
+
+
+def _worker(db) -> GovernanceRuntime:
+    """A runtime with its own engines and caches — one gunicorn worker."""
+    from omnix_core.bev.behavioral_anchor_record import BAREngine
+    from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+    from omnix_core.bev.constraint_conformance_signal import CCSEngine
+
+    rt = GovernanceRuntime()
+    rt._bar_engine, rt._ccs_engine, rt._ctchc_engine = BAREngine(), CCSEngine(), CTCHCEngine()
+    rt._bar_engine._db_url = rt._ccs_engine._db_url = None
+    rt._ctchc_engine._get_conn = db.connect
+    rt._ctchc_engine._db_url = rt._db_url = "postgresql://test/test"
+    rt._get_conn = db.connect
+    rt._write_behind_enabled = False
+    return rt
+
+
+class TestRecordTurnWriteBehind:
+    def test_turn_written_as_one_bundle(self, db, wal):
+        rt = _runtime(db, wal)
+        session = rt.start_session("AID-WB", "RCP-WB-001")
+        commits_before = db.commits
+        for i in range(3):
+            rt.record_turn(session.session_id, f"Turn {i} output.")
+        assert rt._write_behind.flush(timeout=5)
+        rt._write_behind.stop()
+
+        turn_sql = [sql for sql, _ in db.executed[-18:]]
+        assert db.commits - commits_before <= 3
+        assert sum("INSERT INTO atf_behavioral_anchor_records" in q for q in turn_sql) == 3
+        assert sum("INSERT INTO atf_coherence_chain_links" in q for q in turn_sql) == 3
+        updates = [p for sql, p in db.executed if "UPDATE atf_ogr_sessions" in sql]
+        assert [p[0] for p in updates] == [1, 2, 3]
+        assert rt.get_session(session.session_id).turn_count == 3
+
+    def test_halt_turn_committed_before_return(self, db, wal):
+        rt = _runtime(db, wal)
+        session = rt.start_session(
+            "AID-WB", "RCP-WB-002", constraint_set={"halt_on_keywords": ["HALT_NOW"]},
+        )
+        result = rt.record_turn(session.session_id, "HALT_NOW please.")
+        assert result.should_halt
+        assert rt._write_behind.pending(session.session_id) == 0
+        rt._write_behind.stop()
+        halted = [p for sql, p in db.executed if "UPDATE atf_ogr_sessions" in sql]
+        assert halted[-1][4] == "HALTED"
+
+    def test_pending_session_not_evicted(self, db, wal):
+        rt = _runtime(db, wal)
+        session = rt.start_session("AID-WB", "RCP-WB-003")
+        rt._write_behind.stop()                      # hold the turn in the queue
+        rt.record_turn(session.session_id, "Queued turn.")
+        cache = rt._session_cache
+        cache._entries[session.session_id] = (cache.get(session.session_id), 0.0)
+        cache.idle_ttl_s = 1
+        assert cache.sweep() == 0
+        assert session.session_id in cache
+
+
+class TestRecordTurnLocked:
+    def test_turn_committed_once_under_session_lock(self, db):
+        rt = _worker(db)
+        session = rt.start_session("AID-SY", "RCP-SY-001")
+        commits_before = db.commits
+        result = rt.record_turn(session.session_id, "Synchronous turn.")
+        assert db.commits - commits_before == 1
+        sql = [q for q, _ in db.executed[-8:]]
+        lock = next(i for i, q in enumerate(sql) if "pg_advisory_xact_lock" in q)
+        assert sql[lock + 1].startswith("SELECT * FROM atf_ogr_sessions")
+        assert any("INSERT INTO atf_coherence_chain_links" in q for q in sql[lock:])
+        assert db.sessions[session.session_id]["turn_count"] == 1
+        assert db.sessions[session.session_id]["chain_tip_hash"] == result.chain_link_hash
+
+    def test_turns_alternating_between_workers_keep_one_chain(self, db):
+        a, b = _worker(db), _worker(db)
+        session = a.start_session("AID-SY", "RCP-SY-002")
+        first = a.record_turn(session.session_id, "Turn on worker A.")
+        second = b.record_turn(session.session_id, "Turn on worker B.")
+        third = a.record_turn(session.session_id, "Back on worker A.")
+        assert [first.turn_index, second.turn_index, third.turn_index] == [0, 1, 2]
+        links = [p for q, p in db.executed if "INSERT INTO atf_coherence_chain_links" in q]
+        assert [p[2] for p in links] == [0, 1, 2]                    # no reused turn_index
+        assert [p[3] for p in links[1:]] == [p[6] for p in links[:-1]]  # each link on the last tip
+        assert db.sessions[session.session_id]["turn_count"] == 3
+        assert db.tips[session.session_id] == third.chain_link_hash
+        assert a._ctchc_engine._tip_cache[session.session_id] == third.chain_link_hash
+
+    def test_get_session_reads_db_without_caching(self, db):
+        a, b = _worker(db), _worker(db)
+        session = a.start_session("AID-SY", "RCP-SY-003")
+        seen = b.get_session(session.session_id)
+        assert seen.turn_count == 0 and session.session_id not in b._session_cache
+        b.record_turn(session.session_id, "Turn on worker B.")
+        assert a.get_session(session.session_id).turn_count == 1     # A's cached copy is stale
+        assert session.session_id not in b._session_cache
+
+    def test_db_down_still_records_from_cache(self, db):
+        rt = _worker(db)
+        session = rt.start_session("AID-SY", "RCP-SY-004")
+        db.fail_when = lambda sql, params: "pg_advisory_xact_lock" in sql
+        result = rt.record_turn(session.session_id, "Unpersisted turn.")
+        assert result.turn_index == 0
+        assert db.sessions[session.session_id]["turn_count"] == 0
+
+
+class TestWALReplay:
+    def test_dead_writer_replayed_live_one_kept(self, db, tmp_path, monkeypatch):
+        path = str(tmp_path / "ogr_wal.jsonl")
+        monkeypatch.setenv("OMNIX_OGR_WAL_PATH", path)
+        entry = {"kind": "ogr_turn", "session_id": "S1", "turn_index": 0,
+                 "statements": _tip("S1", 0)}
+        live = ReceiptWAL(path, fsync=False)
+        live.wal_append(dict(entry, session_id="S2", statements=_tip("S2", 0)))
+        dead = ReceiptWAL(path, fsync=False)
+        dead.wal_append(entry)
+        dead.close()                                 # process exited with the turn unwritten
+        try:
+            assert twb.replay_wal(db.connect) == 1
+            assert [p[2] for _, p in db.executed] == ["S1"]
+            assert live.wal_size() == 1
+        finally:
+            live.close()
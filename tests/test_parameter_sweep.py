@@ -0,0 +1,146 @@
+"""
+Parallel parameter sweep over shared-memory OHLCV (omnix_testing)
+=================================================================
+  · SharedOHLCV round-trips the dataset; owner frees the block on close
+  · process-pool results equal the in-process backtest for every param set
+  · memoization by (strategy, params, data, range, engine) — no re-runs
+  · module-level callables run against the shared arrays
+  · walk-forward and strategy comparison on top of the sweep
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+try:
+    from omnix_testing.backtesting.vectorized_engine import VectorizedBacktestingEngine
+    from omnix_testing.parameter_sweep import ParameterSweep, SharedOHLCV, parameter_grid
+except Exception:                                   # pragma: no cover - optional deps
+    pytest.skip("omnix_testing not importable in test env", allow_module_level=True)
+
+
+def _ohlcv(n: int = 2000, seed: int = 4) -> "pd.DataFrame":
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="1h"),
+        "open": close, "high": close * 1.001, "low": close * 0.999, "close": close,
+        "volume": rng.uniform(1, 10, n),
+    })
+
+
+def mean_close(data, start, end, params):
+    """Module-level strategy callable (must be picklable)."""
+    close = data.column("close")[start:end]
+    return {"metrics": {"sharpe_ratio": float(close.mean()) * params["k"]}}
+
+
+GRID = {"fast_period": [5, 10, 15], "slow_period": [20, 30]}
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+class TestSharedOHLCV:
+    def test_roundtrip_and_release(self):
+        df = _ohlcv(100)
+        data = SharedOHLCV.from_dataframe(df)
+        other = SharedOHLCV.attach(data.spec)
+        assert np.array_equal(other.column("close"), df["close"].to_numpy())
+        assert (other.timestamps == df["timestamp"].to_numpy()).all()
+        assert not other.column("close").flags.writeable
+        pd.testing.assert_frame_equal(other.to_dataframe(10, 20), df.iloc[10:20].reset_index(drop=True),
+                                      check_dtype=False)
+        other.close()
+        name = data.spec.name
+        data.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_fingerprint_tracks_content(self):
+        df = _ohlcv(100)
+        with SharedOHLCV.from_dataframe(df) as a, SharedOHLCV.from_dataframe(df) as b:
+            assert a.spec.fingerprint == b.spec.fingerprint
+        df.loc[5, "close"] += 1
+        with SharedOHLCV.from_dataframe(df) as c:
+            assert c.spec.fingerprint != a.spec.fingerprint
+
+
+class TestParameterSweep:
+    def test_pool_matches_direct_backtest(self):
+        df = _ohlcv()
+        params = parameter_grid(GRID)
+        with ParameterSweep(df, max_workers=2) as sweep:
+            results = list(sweep.run("simple_ma_cross", params))
+        assert len(results) == 6 and all(r.ok and not r.cached for r in results)
+
+        engine = VectorizedBacktestingEngine(initial_capital=10000.0)
+        for r in results:
+            expected = engine.run_on_dataframe(df, "simple_ma_cross", r.params)
+            assert r.final_capital == expected["final_capital"]
+            assert r.metrics["total_trades"] == expected["metrics"]["total_trades"]
+
+    def test_memoized_by_params_and_range(self):
+        df = _ohlcv()
+        with ParameterSweep(df, max_workers=1) as sweep:
+            first = sweep.run_all("simple_ma_cross", parameter_grid(GRID) + [{"fast_period": 5, "slow_period": 20}])
+            assert sweep.evaluated == 6 and len(first) == 7
+            again = list(sweep.run("simple_ma_cross", parameter_grid(GRID)))
+            assert sweep.evaluated == 6 and all(r.cached for r in again)
+            list(sweep.run("simple_ma_cross", [{"fast_period": 5, "slow_period": 20}], data_range=(0, 1000)))
+            assert sweep.evaluated == 7
+            assert first[0].score() >= first[-1].score()
+
+    def test_cache_shared_across_sweeps_on_same_data(self):
+        df, cache = _ohlcv(), {}
+        with ParameterSweep(df, max_workers=1, cache=cache) as sweep:
+            list(sweep.run("buy_hold", [{}]))
+        with ParameterSweep(df, max_workers=1, cache=cache) as sweep:
+            assert next(sweep.run("buy_hold", [{}])).cached
+        with ParameterSweep(df, max_workers=1, cache=cache, slippage=0.001) as sweep:
+            assert not next(sweep.run("buy_hold", [{}])).cached
+
+    def test_callable_strategy_in_pool(self):
+        df = _ohlcv(500)
+        with ParameterSweep(df, max_workers=2) as sweep:
+            results = {r.params["k"]: r for r in sweep.run(mean_close, [{"k": 1}, {"k": 2}], (100, 200))}
+        expected = df["close"].iloc[100:200].mean()
+        assert results[1].metrics["sharpe_ratio"] == pytest.approx(expected)
+        assert results[2].metrics["sharpe_ratio"] == pytest.approx(2 * expected)
+
+    def test_errors_are_reported_not_raised(self):
+        with ParameterSweep(_ohlcv(200), max_workers=1) as sweep:
+            (result,) = sweep.run(mean_close, [{}])
+        assert not result.ok and "KeyError" in result.error
+        assert result.score() == float("-inf")
+
+
+class TestIntegrations:
+    def test_walk_forward_sweep(self):
+        from omnix_testing.professional_validator import ProfessionalValidator
+
+        df = _ohlcv(3000)
+        validator = ProfessionalValidator()
+        results = validator.run_walk_forward_sweep(
+            "simple_ma_cross", df, GRID, num_iterations=4, max_workers=2)
+        assert 1 <= len(results) <= 4
+        for r in results:
+            assert r.in_sample_metrics["best_params"] in parameter_grid(GRID)
+            assert "total_return_pct" in r.out_sample_metrics
+
+    def test_comparator_parameter_sets(self):
+        from omnix_testing.strategy_comparator import StrategyComparator
+
+        comparison = StrategyComparator().compare_parameter_sets(
+            "simple_ma_cross", GRID, _ohlcv(), max_workers=1)
+        ranked = comparison["results"]
+        assert len(ranked) == 6 and comparison["best"] == ranked[0]
+        assert ranked[0]["sharpe_ratio"] >= ranked[-1]["sharpe_ratio"]
@@ -192,6 +192,200 @@ class TestCryptoProviders:
         assert status["adr"] == "ADR-043"
 
 
+class _CountingProvider:
+    """Deterministic stand-in provider that counts keypair generations."""
+
+    def __init__(self):
+        self.keypairs = 0
+
+    def provider_id(self):
+        return "counting"
+
+    def algorithm_name(self):
+        return "Counting (test)"
+
+    def generate_keypair(self):
+        self.keypairs += 1
+        return b"pub-%d" % self.keypairs, b"sec-%d" % self.keypairs
+
+    def sign(self, message, secret_key):
+        return hashlib.sha256(secret_key + message).digest()
+
+
+class _CountingProviderEnv:
+    """Active provider = _CountingProvider, no env key, empty key cache."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, monkeypatch):
+        import omnix_core.evidence.transparency_chain  # noqa: F401 — import-time keys use the real provider
+        from omnix_core.security import crypto_providers
+        self.cp = crypto_providers
+        self.provider = _CountingProvider()
+        monkeypatch.setitem(crypto_providers._REGISTRY, "counting", self.provider)
+        monkeypatch.setenv("ACTIVE_SIGNING_PROVIDER", "counting")
+        for var in ("OMNIX_SIGNING_SECRET_KEY_B64", "OMNIX_SIGNING_PUBLIC_KEY_B64",
+                    "OMNIX_SIGNING_KEY_VERSION", "OMNIX_SIGNING_KEY_PROVIDER"):
+            monkeypatch.delenv(var, raising=False)
+        crypto_providers.reset_signing_key_cache()
+        yield
+        crypto_providers.reset_signing_key_cache()
+
+
+class TestSigningKeyCache(_CountingProviderEnv):
+
+    def test_env_key_decoded_once_with_metadata(self, monkeypatch):
+        pk = b"platform-public-key"
+        monkeypatch.setenv("OMNIX_SIGNING_SECRET_KEY_B64", base64.b64encode(b"platform-secret").decode())
+        monkeypatch.setenv("OMNIX_SIGNING_PUBLIC_KEY_B64", base64.b64encode(pk).decode())
+        monkeypatch.setenv("OMNIX_SIGNING_KEY_VERSION", "7")
+        monkeypatch.setenv("OMNIX_SIGNING_KEY_PROVIDER", "counting")
+        k1 = self.cp.get_signing_key()
+        k2 = self.cp.get_signing_key()
+        assert k1 is k2
+        assert k1.secret_key == b"platform-secret"
+        assert k1.source == "env"
+        assert k1.key_version == "7"
+        assert k1.key_id == hashlib.sha256(pk).hexdigest()[:16]
+        assert "secret_key" not in k1.metadata()
+        assert self.cp.decode_secret_key.cache_info().misses == 1
+
+    def test_env_key_never_served_to_another_provider(self, monkeypatch):
+        monkeypatch.setenv("OMNIX_SIGNING_SECRET_KEY_B64", base64.b64encode(b"platform-secret").decode())
+        assert self.cp.get_signing_key() is None                       # key is dilithium3's
+        assert self.cp.get_signing_key(allow_ephemeral=True) is None
+        assert self.cp.get_signing_key("dilithium3").secret_key == b"platform-secret"
+        assert self.provider.keypairs == 0
+
+    def test_no_env_key_returns_none_without_ephemeral(self):
+        assert self.cp.get_signing_key() is None
+        assert self.provider.keypairs == 0
+
+    def test_ephemeral_key_generated_once_per_process(self):
+        k1 = self.cp.get_signing_key(allow_ephemeral=True)
+        k2 = self.cp.get_signing_key(allow_ephemeral=True)
+        assert k1 is k2
+        assert k1.source == "ephemeral"
+        assert self.provider.keypairs == 1
+
+    def test_transparency_entries_share_one_signing_key(self):
+        from omnix_core.evidence.transparency_chain import TransparencyChain
+        chain = TransparencyChain.__new__(TransparencyChain)
+        entries = [{"log_id": f"TL-{i}", "payload_hash": "a" * 64} for i in range(5)]
+        sigs = []
+        for entry in entries:
+            sig_b64, provider_id = chain._sign_entry(entry)
+            assert provider_id == "counting"
+            sigs.append(base64.b64decode(sig_b64))
+        assert self.provider.keypairs == 1
+        key = self.cp.get_signing_key(allow_ephemeral=True)
+        for entry, sig in zip(entries, sigs):
+            assert (entry["key_id"], entry["key_version"]) == (key.key_id, key.key_version)
+            assert sig == self.provider.sign(json.dumps(entry, sort_keys=True).encode(), key.secret_key)
+
+
+class TestSigningService(_CountingProviderEnv):
+
+    def _expected(self, payloads):
+        key = self.cp.get_signing_key(allow_ephemeral=True)
+        return [self.provider.sign(p, key.secret_key) for p in payloads]
+
+    def test_inline_batch_is_aligned_and_timed(self):
+        from omnix_core.security.signing_service import SigningService
+        svc = SigningService(workers=0)
+        payloads = [b"payload-%d" % i for i in range(5)]
+        sigs = svc.sign_batch(payloads, allow_ephemeral=True)
+        assert sigs == self._expected(payloads)
+        stats = svc.stats()
+        assert stats["batches"] == 1 and stats["payloads"] == 5 and stats["unsigned"] == 0
+        assert stats["batch_latency"]["2-8"]["count"] == 1
+
+    def test_process_pool_matches_inline_signatures(self):
+        from omnix_core.security.signing_service import SigningService
+        svc = SigningService(workers=2, start_method="fork")
+        try:
+            payloads = [b"payload-%d" % i for i in range(20)]
+            futures = [svc.submit_batch(payloads, allow_ephemeral=True), svc.submit(b"single", allow_ephemeral=True)]
+            assert futures[0].result(timeout=30) == self._expected(payloads)
+            assert futures[1].result(timeout=30) == self._expected([b"single"])[0]
+            assert svc.stats()["pool_active"] is True
+            assert svc.stats()["batch_latency"]["9-64"]["count"] == 1
+        finally:
+            svc.close()
+
+    def test_no_key_resolves_to_unsigned(self):
+        from omnix_core.security.signing_service import SigningService
+        sigs = SigningService(workers=0).sign_batch([b"a", b"b"])
+        assert sigs == [None, None]
+        assert self.provider.keypairs == 0
+
+    def test_bar_signature_attached_on_complete(self, monkeypatch):
+        from types import SimpleNamespace
+        from omnix_core.bev.behavioral_anchor_record import BAREngine
+        monkeypatch.setenv("OMNIX_SIGNING_SECRET_KEY_B64", base64.b64encode(b"bar-secret").decode())
+        monkeypatch.setitem(self.cp._REGISTRY, "dilithium3", self.provider)   # BARs pin dilithium3
+        engine = BAREngine()
+        engine._db_url = None
+        engine._pqc = SimpleNamespace(pqc_enabled=True)
+        bar, fut = engine.begin_bar(
+            session_id="S-1", agent_id="agent", turn_index=0, output_text="hello",
+            governing_receipt_id="R-1", constraint_set={},
+        )
+        assert bar.pqc_signature is None and fut is not None
+        bar = engine.complete_bar(bar, fut)
+        payload = json.dumps({
+            "bar_id": bar.bar_id, "content_hash": bar.content_hash,
+            "governing_receipt_id": "R-1", "created_at": bar.created_at,
+        }, sort_keys=True).encode()
+        assert base64.b64decode(bar.pqc_signature) == self.provider.sign(payload, b"bar-secret")
+        assert bar.pqc_algorithm == "ML-DSA-65"
+
+    def test_bar_unsigned_when_env_key_belongs_to_another_provider(self, monkeypatch):
+        from types import SimpleNamespace
+        from omnix_core.bev.behavioral_anchor_record import BAREngine
+        monkeypatch.setenv("OMNIX_SIGNING_SECRET_KEY_B64", base64.b64encode(b"bar-secret").decode())
+        monkeypatch.setenv("OMNIX_SIGNING_KEY_PROVIDER", "counting")
+        engine = BAREngine()
+        engine._db_url = None
+        engine._pqc = SimpleNamespace(pqc_enabled=True)
+        bar, fut = engine.begin_bar(
+            session_id="S-2", agent_id="agent", turn_index=0, output_text="hello",
+            governing_receipt_id="R-2", constraint_set={},
+        )
+        bar = engine.complete_bar(bar, fut)
+        assert bar.pqc_signature is None and bar.pqc_algorithm is None
+
+
+class TestPinnedSigningProvider(_CountingProviderEnv):
+    """CTCHC and ATF sign with the Dilithium-3 env key while another provider is active."""
+
+    @pytest.fixture(autouse=True)
+    def _env_key(self, _isolate, monkeypatch):
+        monkeypatch.setenv("OMNIX_SIGNING_SECRET_KEY_B64", base64.b64encode(b"d3-secret").decode())
+        monkeypatch.setenv("OMNIX_SIGNING_PUBLIC_KEY_B64", base64.b64encode(b"d3-public").decode())
+        assert self.cp.get_signing_key() is None                      # active = counting
+
+    def test_ctchc_seal_signed(self):
+        from types import SimpleNamespace
+
+        from omnix_core.bev.coherence_hash_chain import CTCHCEngine
+        engine = CTCHCEngine()
+        engine._pqc = SimpleNamespace(pqc_enabled=True, sign_message=self.provider.sign)
+        sig, alg = engine._sign(b"seal-payload", "seal")
+        assert base64.b64decode(sig) == self.provider.sign(b"seal-payload", b"d3-secret")
+        assert alg == "ML-DSA-65"
+
+    def test_atf_receipts_signed(self):
+        from omnix_core.agents.atf.delegation_receipt import DelegationReceiptEngine
+        from omnix_core.agents.atf.temporal_authority import TemporalAuthorityEngine
+        expected = self.provider.sign(b"content-hash", b"d3-secret")
+        delegation, temporal = DelegationReceiptEngine(db_url=""), TemporalAuthorityEngine(db_url="")
+        delegation._provider = temporal._provider = self.provider
+        sig, _ = delegation._sign_with_agent_key("content-hash", None)    # platform fallback key
+        assert base64.b64decode(sig) == expected
+        sig, _ = temporal._sign("content-hash")
+        assert base64.b64decode(sig) == expected
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # ADR-044: Transparency Chain & Internal Timestamp
 # ──────────────────────────────────────────────────────────────────────────────
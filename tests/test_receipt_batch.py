@@ -0,0 +1,205 @@
+"""
+Batch evaluation receipts — POST /api/governance/evaluate:batch building blocks
+
+  TestSubmitMany       — TransparencyChainWriter.submit_many keeps a group contiguous
+  TestReceiptBatch     — receipts hash-linked in order, one store + one chain append
+  TestStoreReceipts    — multi-row INSERT with ordered created_at
+  TestUDCLReceiptEngine — UnifiedDecisionControlLayer.evaluate(receipt_engine=...)
+  TestBatchAdmission   — rate limit and quotas charged per item, batch refused whole
+"""
+
+import hashlib
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+# gov_blueprint is imported the way server.py does (`api.gov_blueprint`).
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "omnix_web"))
+
+from omnix_core.evidence.transparency_chain import TransparencyChain
+from omnix_web.api.omnix_engine.decision_receipt import DecisionReceiptEngine, ReceiptBatch
+
+
+def _items(n, tag="B"):
+    return [
+        {"receipt_id": f"RCP-{tag}-{i}", "symbol": "BTC",
+         "payload_hash": hashlib.sha256(f"{tag}-{i}".encode()).hexdigest()}
+        for i in range(n)
+    ]
+
+
+def _receipt_engine(db_url=None):
+    # SHA-256 path: independent of whichever provider/keys other tests left loaded
+    engine = DecisionReceiptEngine(db_url=db_url)
+    engine._provider = None
+    engine._signing_keys = None
+    return engine
+
+
+def _decision(i):
+    return {"asset": f"LOAN-{i}", "decision": "APPROVED", "decision_trace": [f"CP-1: pass {i}"]}
+
+
+class TestSubmitMany:
+
+    def test_group_is_one_flush_even_above_batch_size(self, chain_db):
+        db, make_writer = chain_db
+        writer = make_writer(batch_size=4, flush_interval_s=0.0)
+        entries = writer.submit_many(_items(10), wait=True)
+        writer.close()
+        assert [e["receipt_id"] for e in entries] == [f"RCP-B-{i}" for i in range(10)]
+        assert [[r["log_id"] for r in b] for b in db.batches] == [[e["log_id"] for e in entries]]
+        assert TransparencyChain.__new__(TransparencyChain).verify_chain_integrity(entries)["valid"]
+
+    def test_groups_are_not_split_or_interleaved(self, chain_db):
+        db, make_writer = chain_db
+        writer = make_writer(batch_size=5, flush_interval_s=0.05)
+        writer.submit("RCP-S-0", "BTC", "HOLD", "a" * 64)
+        group = writer.submit_many(_items(3))
+        writer.submit_many(_items(3, tag="C"))
+        assert writer.flush()
+        writer.close()
+        flat = [e["receipt_id"] for b in db.batches for e in b]
+        assert flat == ["RCP-S-0"] + [f"RCP-{t}-{i}" for t in "BC" for i in range(3)]
+        for tag in "BC":
+            # each group lands in exactly one flush
+            assert sum(any(e["receipt_id"].startswith(f"RCP-{tag}-") for e in b) for b in db.batches) == 1
+        assert all(len(b) <= 5 for b in db.batches)
+        assert group[0]["prev_log_hash"] == "a" * 64
+        assert writer.stats()["entries_flushed"] == 7
+
+    def test_empty_or_disabled(self, chain_db):
+        _, make_writer = chain_db
+        writer = make_writer()
+        assert writer.submit_many([]) is None
+        writer._chain._db_url = None
+        assert writer.submit_many(_items(2)) is None
+
+
+class TestReceiptBatch:
+
+    def _engine(self, tip="t" * 64):
+        engine = _receipt_engine()
+        engine.get_last_hash = MagicMock(return_value=tip)
+        engine.store_receipts = MagicMock(return_value=True)
+        return engine
+
+    def test_receipts_are_hash_linked_in_order(self):
+        engine = self._engine()
+        batch = ReceiptBatch(engine)
+        receipts = []
+        for i in range(4):
+            receipt = batch.generate_receipt(_decision(i), prev_hash=batch.get_last_hash())
+            batch.store_receipt(receipt)
+            receipts.append(receipt)
+        assert receipts[0]["prev_hash"] == "t" * 64
+        for prev, cur in zip(receipts, receipts[1:]):
+            assert cur["prev_hash"] == prev["content_hash"]
+        assert engine.get_last_hash.call_count == 1
+        assert len(batch) == 4
+
+    def test_commit_stores_once_and_appends_one_group(self):
+        engine = self._engine()
+        batch = ReceiptBatch(engine)
+        for i in range(3):
+            batch.store_receipt(batch.generate_receipt(_decision(i)))
+        writer = MagicMock()
+        with patch("omnix_core.evidence.transparency_chain.get_chain_writer", return_value=writer):
+            assert batch.commit() is True
+        engine.store_receipts.assert_called_once()
+        assert len(engine.store_receipts.call_args[0][0]) == 3
+        writer.submit_many.assert_called_once()
+        writer.submit.assert_not_called()
+        group = writer.submit_many.call_args[0][0]
+        assert [g["payload_hash"] for g in group] == [r["content_hash"] for r in batch.receipts]
+
+    def test_generate_does_not_touch_chain(self):
+        batch = ReceiptBatch(self._engine())
+        with patch("omnix_core.evidence.transparency_chain.get_chain_writer") as factory:
+            batch.generate_receipt(_decision(0))
+        factory.assert_not_called()
+
+    def test_empty_commit_is_noop(self):
+        engine = self._engine()
+        assert ReceiptBatch(engine).commit() is True
+        engine.store_receipts.assert_not_called()
+
+
+class TestStoreReceipts:
+
+    def test_single_multi_row_insert(self):
+        engine = _receipt_engine("postgresql://test")
+        receipts = [engine.build_receipt(_decision(i)) for i in range(3)]
+        conn = MagicMock()
+        cur = conn.cursor.return_value
+        with patch("omnix_web.api.omnix_engine.decision_receipt._get_db_connection", return_value=conn):
+            assert engine.store_receipts(receipts) is True
+        cur.execute.assert_called_once()
+        sql, params = cur.execute.call_args[0]
+        assert sql.count("INTERVAL '1 microsecond'") == 3
+        assert len(params) == 3 * 18
+        assert params[0] == receipts[0]["receipt_id"]
+        # created_at offsets keep the batch tip on the last row
+        assert [params[17], params[35], params[53]] == [0, 1, 2]
+        conn.commit.assert_called_once()
+
+    def test_failure_returns_false(self):
+        engine = _receipt_engine("postgresql://test")
+        conn = MagicMock()
+        conn.cursor.return_value.execute.side_effect = RuntimeError("boom")
+        with patch("omnix_web.api.omnix_engine.decision_receipt._get_db_connection", return_value=conn):
+            assert engine.store_receipts([engine.build_receipt(_decision(0))]) is False
+        conn.rollback.assert_called_once()
+
+
+class TestUDCLReceiptEngine:
+
+    def _udcl(self):
+        from omnix_core.governance.unified_control_layer import UnifiedDecisionControlLayer
+        receipt_cls = MagicMock(side_effect=AssertionError("receipt_engine_cls must not be used"))
+        return UnifiedDecisionControlLayer(MagicMock(), receipt_cls)
+
+    def test_injected_engine_receives_receipt(self):
+        udcl = self._udcl()
+        batch = ReceiptBatch(TestReceiptBatch()._engine())
+        pillar, receipt_id = udcl._run_pqc_receipt(
+            {"decision": "APPROVED"}, "LOAN-1", "credit", "client-1", {}, "CTL-1",
+            receipt_engine=batch,
+        )
+        assert pillar.passed is True
+        assert receipt_id == batch.receipts[0]["receipt_id"]
+        assert batch.receipts[0]["client_id"] == "client-1"
+        assert batch.receipts[0]["domain"] == "credit"
+
+
+class TestBatchAdmission:
+
+    @pytest.fixture
+    def bp(self):
+        pytest.importorskip("flask")
+        pytest.importorskip("psycopg2")
+        import api.gov_blueprint as gov_blueprint
+        gov_blueprint._client_rate_limit_store.clear()
+        yield gov_blueprint
+        gov_blueprint._client_rate_limit_store.clear()
+
+    def test_rate_limit_charged_per_item(self, bp):
+        room = bp._CLIENT_RATE_LIMIT_MAX
+        assert bp._is_client_rate_limited("c-1", cost=room - 5) is False
+        assert bp._is_client_rate_limited("c-1", cost=6) is True      # refused whole
+        assert len(bp._client_rate_limit_store["c-1"]) == room - 5
+        assert bp._is_client_rate_limited("c-1", cost=5) is False
+        assert bp._is_client_rate_limited("c-1") is True
+
+    def test_quota_counts_every_item(self, bp):
+        conn = MagicMock()
+        daily_used = bp._CLIENT_DAILY_QUOTA_MAX - 10
+        conn.cursor.return_value.fetchone.side_effect = [(daily_used,), (0,), (daily_used,)]
+        with patch.object(bp, "_get_db_conn", return_value=conn):
+            assert bp._check_client_quota("c-1", requested=10) == (True, "")
+            ok, message = bp._check_client_quota("c-1", requested=11)
+        assert ok is False
+        assert "Batch of 11 exceeds the 10 evaluations remaining" in message
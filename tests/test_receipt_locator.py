@@ -0,0 +1,296 @@
+"""
+Receipt locator (ADR-126) — lookup caches for fetch_receipt_any_tier
+====================================================================
+  · ReceiptBloomFilter / _LRUCache primitives
+  · ReceiptLocator: rebuild, top-up before every negative, never-raise negatives
+  · ReceiptArchivalService: cached tiers, COLD decode cache, batch lookup
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from unittest.mock import patch
+
+import pytest
+
+import omnix_core.evidence.receipt_locator as rl
+from omnix_core.evidence.receipt_archival import (
+    _HOT_COLUMNS,
+    COLD_TABLE,
+    HOT_TABLE,
+    INDEX_TABLE,
+    WARM_TABLE,
+    PostgreSQLColdBackend,
+    ReceiptArchivalService,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def _rid(i: int) -> str:
+    return f"OMNIX-TRD-{i:012X}"
+
+
+def _row(i: int, age_s: int = 0) -> Dict:
+    row = {c: None for c in _HOT_COLUMNS}
+    row.update(receipt_id=_rid(i), content_hash=f"{i:064x}",
+               created_at=NOW - timedelta(seconds=age_s))
+    return row
+
+
+class FakeDB:
+    def __init__(self):
+        self.tables = {HOT_TABLE: {}, WARM_TABLE: {}, COLD_TABLE: {}}
+        self.index: Dict[str, tuple] = {}
+        self.statements = []
+        self.broken = False
+
+    def put(self, table, i, age_s=0, tier=None):
+        self.tables[table][_rid(i)] = _row(i, age_s)
+        if tier:
+            self.index[_rid(i)] = (tier, f"pg::{table}::{_rid(i)}")
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db, self._rows = db, []
+
+    def execute(self, sql, params=()):
+        db, params = self.db, list(params or ())
+        db.statements.append(sql)
+        if db.broken:
+            raise RuntimeError("db down")
+        if "COUNT(*)" in sql:
+            self._rows = [(len(db.tables[HOT_TABLE]) + len(db.index),)]
+        elif "UNION ALL" in sql:
+            self._rows = [(r["receipt_id"], r["created_at"]) for r in db.tables[HOT_TABLE].values()]
+            self._rows += [(rid, None) for rid in db.index]
+        elif "SELECT receipt_id, created_at" in sql:
+            since = params[0] if params else None
+            self._rows = [(r["receipt_id"], r["created_at"]) for r in db.tables[HOT_TABLE].values()
+                          if since is None or r["created_at"] > since]
+        elif f"FROM {INDEX_TABLE}" in sql and "SELECT receipt_id, tier" in sql:
+            self._rows = [(rid,) + db.index[rid] for rid in params if rid in db.index]
+        elif f"FROM {INDEX_TABLE}" in sql:
+            entry = db.index.get(params[0])
+            self._rows = [entry + ("h",)] if entry else []
+        else:
+            table = re.search(r"FROM (\w+)", sql).group(1)
+            self._rows = [tuple(db.tables[table][rid][c] for c in _HOT_COLUMNS)
+                          for rid in params if rid in db.tables[table]]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def fetchmany(self, n):
+        out, self._rows = self._rows[:n], self._rows[n:]
+        return out
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, name=None):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+def _service(locator=None):
+    svc = ReceiptArchivalService(db_url="postgresql://test/test")
+    svc._cold_backend = PostgreSQLColdBackend()
+    svc._locator = locator or rl.ReceiptLocator()
+    return svc
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Primitives
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestPrimitives:
+    def test_bloom_has_no_false_negatives(self):
+        bloom = rl.ReceiptBloomFilter(5000, fp_rate=0.001)
+        for i in range(5000):
+            bloom.add(_rid(i))
+        assert all(_rid(i) in bloom for i in range(5000))
+        false_pos = sum(_rid(i) in bloom for i in range(10**6, 10**6 + 20000))
+        assert false_pos < 20000 * 0.005
+
+    def test_bloom_sizing(self):
+        bloom = rl.ReceiptBloomFilter(1000, fp_rate=0.01)
+        assert 9000 < bloom.num_bits < 10000
+        assert bloom.num_hashes == 7
+
+    def test_lru_evicts_least_recent(self):
+        cache = rl._LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert (cache.hits, cache.misses) == (3, 1)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Locator
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestLocator:
+    def test_unbuilt_filter_answers_maybe(self, db):
+        assert rl.ReceiptLocator().might_exist(FakeConn(db), "NOPE")
+        assert db.statements == []
+
+    def test_rebuild_covers_hot_and_archived(self, db):
+        db.put(HOT_TABLE, 1)
+        db.put(WARM_TABLE, 2, tier="WARM")
+        locator = rl.ReceiptLocator()
+        assert locator.rebuild(FakeConn(db))
+        conn = FakeConn(db)
+        db.statements.clear()
+        assert locator.might_exist(conn, _rid(1))
+        assert locator.might_exist(conn, _rid(2))
+        assert db.statements == []
+        assert not locator.might_exist(conn, "OMNIX-TRD-TYPO")
+        assert len(db.statements) == 1 and "created_at >" in db.statements[0]
+        assert locator.stats()["bloom_rejections"] == 1
+
+    def test_receipt_written_after_rebuild_is_found(self, db):
+        db.put(HOT_TABLE, 1, age_s=600)
+        locator = rl.ReceiptLocator()
+        locator.rebuild(FakeConn(db))
+        db.put(HOT_TABLE, 2)              # written right after the build
+        assert locator.might_exist(FakeConn(db), _rid(2))
+        since = [s for s in db.statements if "created_at >" in s]
+        assert len(since) == 1
+
+    def test_top_up_shared_by_lookups_started_before_it(self, db):
+        locator = rl.ReceiptLocator()
+        locator.rebuild(FakeConn(db))
+        started = rl.time.monotonic()
+        db.statements.clear()
+        assert not locator.might_exist(FakeConn(db), "A", started)
+        assert not locator.might_exist(FakeConn(db), "B", started)
+        assert len(db.statements) == 1
+
+    def test_failed_top_up_does_not_reject(self, db):
+        locator = rl.ReceiptLocator()
+        locator.rebuild(FakeConn(db))
+        db.broken = True
+        assert locator.might_exist(FakeConn(db), "OMNIX-TRD-NEW")
+
+    def test_failed_rebuild_keeps_previous_filter(self, db):
+        db.put(HOT_TABLE, 1)
+        locator = rl.ReceiptLocator()
+        locator.rebuild(FakeConn(db))
+        db.broken = True
+        assert not locator.rebuild(FakeConn(db))
+        assert locator.bloom_ready and locator.might_exist(FakeConn(db), _rid(1))
+
+    def test_singleton_rebuilt_after_fork(self):
+        first = rl.get_receipt_locator()
+        assert rl.get_receipt_locator() is first
+        with patch.object(rl.os, "getpid", return_value=first._pid + 1):
+            assert rl.get_receipt_locator() is not first
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ReceiptArchivalService lookups
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestFetchAnyTier:
+    def test_bloom_rejects_unknown_id_without_cascade(self, db):
+        db.put(HOT_TABLE, 1, age_s=600)
+        svc = _service()
+        svc._locator.rebuild(FakeConn(db))
+        db.statements.clear()
+        assert svc.fetch_receipt_any_tier(FakeConn(db), "omnix-trd-typo") == (None, None)
+        assert len(db.statements) == 1 and "created_at >" in db.statements[0]
+
+    def test_receipt_issued_after_rebuild_is_fetched(self, db):
+        svc = _service()
+        svc._locator.rebuild(FakeConn(db))
+        db.put(HOT_TABLE, 3)              # POST /evaluate, then GET /verify
+        receipt, tier = svc.fetch_receipt_any_tier(FakeConn(db), _rid(3))
+        assert tier == "HOT" and receipt["receipt_id"] == _rid(3)
+
+    def test_remembered_warm_tier_is_one_query(self, db):
+        db.put(WARM_TABLE, 5, tier="WARM")
+        svc = _service()
+        assert svc.fetch_receipt_any_tier(FakeConn(db), _rid(5))[1] == "WARM"
+        db.statements.clear()
+        receipt, tier = svc.fetch_receipt_any_tier(FakeConn(db), _rid(5))
+        assert tier == "WARM" and receipt["receipt_id"] == _rid(5)
+        assert len(db.statements) == 1 and WARM_TABLE in db.statements[0]
+
+    def test_stale_location_falls_back_to_cascade(self, db):
+        db.put(HOT_TABLE, 7)
+        svc = _service()
+        svc.fetch_receipt_any_tier(FakeConn(db), _rid(7))
+        # archival moved it HOT → WARM after it was cached
+        db.tables[WARM_TABLE][_rid(7)] = db.tables[HOT_TABLE].pop(_rid(7))
+        db.index[_rid(7)] = ("WARM", f"pg::{WARM_TABLE}::{_rid(7)}")
+        assert svc.fetch_receipt_any_tier(FakeConn(db), _rid(7))[1] == "WARM"
+        assert svc._locator.location(_rid(7)) == ("WARM", None)
+
+    def test_cold_receipts_decoded_once(self, db):
+        db.put(COLD_TABLE, 9, tier="COLD")
+        svc = _service()
+        with patch.object(PostgreSQLColdBackend, "get", autospec=True,
+                          side_effect=lambda self, loc, conn: dict(_row(9))) as get:
+            for _ in range(3):
+                receipt, tier = svc.fetch_receipt_any_tier(FakeConn(db), _rid(9))
+                assert tier == "COLD" and receipt["receipt_id"] == _rid(9)
+                receipt["receipt_id"] = "MUTATED"
+        assert get.call_count == 1
+
+
+class TestBatchFetch:
+    def test_grouped_by_tier(self, db):
+        for i in range(3):
+            db.put(HOT_TABLE, i)
+        for i in range(3, 6):
+            db.put(WARM_TABLE, i, tier="WARM")
+        db.put(COLD_TABLE, 6, tier="COLD")
+        svc = _service()
+        ids = [_rid(i).lower() for i in range(7)] + ["OMNIX-TRD-NOPE", _rid(0)]
+        out = svc.fetch_receipts_any_tier(FakeConn(db), ids)
+        assert [out[_rid(i)][1] for i in range(7)] == ["HOT"] * 3 + ["WARM"] * 3 + ["COLD"]
+        assert out["OMNIX-TRD-NOPE"] == (None, None)
+        assert len(out) == 8
+        # HOT, index, WARM, COLD — one statement each
+        assert len(db.statements) == 4
+
+    def test_second_batch_uses_remembered_tiers(self, db):
+        for i in range(4):
+            db.put(WARM_TABLE, i, tier="WARM")
+        svc = _service()
+        ids = [_rid(i) for i in range(4)]
+        svc.fetch_receipts_any_tier(FakeConn(db), ids)
+        db.statements.clear()
+        out = svc.fetch_receipts_any_tier(FakeConn(db), ids)
+        assert {tier for _, tier in out.values()} == {"WARM"}
+        assert len(db.statements) == 1 and WARM_TABLE in db.statements[0]
+
+    def test_bloom_rejections_share_one_top_up(self, db):
+        db.put(HOT_TABLE, 1, age_s=600)
+        svc = _service()
+        svc._locator.rebuild(FakeConn(db))
+        db.statements.clear()
+        out = svc.fetch_receipts_any_tier(FakeConn(db), ["A", "B"])
+        assert out == {"A": (None, None), "B": (None, None)}
+        assert len(db.statements) == 1 and "created_at >" in db.statements[0]
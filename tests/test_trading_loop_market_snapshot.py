@@ -0,0 +1,116 @@
+"""
+Multi-user trading loop — shared market snapshot per (pair, tick)
+=================================================================
+  · one get_ohlc call per pair per tick for price / volume / OHLC history
+  · _analyze_market runs once per pair per tick, whatever the user count
+  · each user gets its own copy of the snapshot to mutate
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("TESTING", "true")
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456789:ABCdefGHIjklMNOpqrsTUVwxyz12345678")
+
+try:
+    from omnix_core.bot import auto_trading_bot as atb
+except Exception:                                   # pragma: no cover - optional deps
+    pytest.skip("AutoTradingBot not importable in test env", allow_module_level=True)
+
+
+def _candles(n: int = 120):
+    return [[i, 100 + i, 101 + i, 99 + i, 100.5 + i, 0, 10.0 + i] for i in range(n)]
+
+
+def _bot():
+    bot = atb.AutoTradingBot.__new__(atb.AutoTradingBot)
+    bot.config = {"check_interval_seconds": 25, "trading_pairs": ["BTC/USD", "ETH/USD"]}
+    bot.state = {"running": True}
+    bot.trading_service = MagicMock()
+    bot.trading_service.get_ohlc.side_effect = lambda pair, interval: _candles()
+    bot.trading_profile = None
+    bot._market_tick = 0
+    bot._ohlc_cache, bot._ohlc_cache_lock = {}, threading.Lock()
+    bot._market_snapshots, bot._market_snapshot_lock = {}, threading.Lock()
+    bot._update_cag_signals_cache = MagicMock()
+    return bot
+
+
+class TestOHLCFetch:
+    def test_histories_share_one_fetch_per_tick(self):
+        bot = _bot()
+        bot._next_market_tick()
+        prices = bot._get_price_history("BTC/USD", days=100)
+        volumes = bot._get_volume_history("BTC/USD", days=100)
+        ohlc = bot._get_ohlc_history("BTC/USD", days=200)
+        assert len(prices) == len(volumes) == 100 and len(ohlc["closes"]) == 120
+        assert bot.trading_service.get_ohlc.call_count == 1
+
+        bot._get_price_history("ETH/USD")
+        bot._next_market_tick()
+        bot._get_price_history("BTC/USD")
+        assert bot.trading_service.get_ohlc.call_count == 3
+
+    def test_entry_expires_after_check_interval(self):
+        bot = _bot()
+        bot._get_price_history("BTC/USD")
+        with patch.object(atb.time, "monotonic", return_value=atb.time.monotonic() + 30):
+            bot._get_price_history("BTC/USD")
+        assert bot.trading_service.get_ohlc.call_count == 2
+
+
+class TestMarketSnapshot:
+    def test_analysis_computed_once_per_pair_under_concurrency(self):
+        bot = _bot()
+        calls = []
+        bot._analyze_market = lambda: calls.append(bot.config["trading_pair"]) or {
+            "symbol": bot.config["trading_pair"], "action": "HOLD", "reason": []}
+        tick = bot._next_market_tick()
+        results = []
+        threads = [threading.Thread(target=lambda p=p: results.append(bot._get_market_snapshot(p, tick)))
+                   for p in ["BTC/USD", "ETH/USD"] * 10]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(calls) == ["BTC/USD", "ETH/USD"]
+        assert all(r["symbol"] in ("BTC/USD", "ETH/USD") for r in results)
+        bot._next_market_tick()
+        bot._get_market_snapshot("BTC/USD", bot._market_tick)
+        assert len(calls) == 3
+
+    def test_users_fan_out_from_one_snapshot(self):
+        bot = _bot()
+        analyses = []
+        bot._analyze_market = MagicMock(side_effect=lambda: {
+            "symbol": bot.config["trading_pair"], "action": "BUY", "should_trade": True,
+            "amount_usd": 100.0, "reason": ["signal"]})
+        bot._check_open_positions_tp_sl = MagicMock()
+        bot._check_position_limit_early = MagicMock(return_value=False)
+        bot._run_cag_session_check = MagicMock(return_value=True)
+
+        def execute(analysis, user_id=None):
+            analyses.append((user_id, analysis))
+            analysis["amount_usd"] = 25.0
+            analysis["reason"].append(f"sized for {user_id}")
+            return {"error": "skip"}
+
+        bot._execute_smart_trade = execute
+        tick = bot._next_market_tick()
+        with patch.object(atb, "is_symbol_allowed", None):
+            for uid in ("u1", "u2", "u3"):
+                session = MagicMock(emergency_stop=False, trading_pairs=["BTC/USD", "ETH/USD"])
+                bot._process_user_trading_cycle(uid, session, tick=tick)
+
+        assert bot._analyze_market.call_count == 2
+        assert len(analyses) == 6
+        shared = bot._market_snapshots[("BTC/USD", tick)]
+        assert shared["amount_usd"] == 100.0 and shared["reason"] == ["signal"]
+        assert [a["reason"] for u, a in analyses if a["symbol"] == "BTC/USD"][0] == \
+            ["signal", "sized for u1"]
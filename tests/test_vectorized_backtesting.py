@@ -0,0 +1,115 @@
+"""
+Columnar vectorized backtesting core (omnix_testing)
+====================================================
+  · VectorizedBacktestingEngine.run_backtest matches BacktestingEngine.run_backtest
+    exactly (trades, equity curve, final capital, metrics) on OHLCV fixtures
+  · MA-cross signals reproduce the 100-price buffer and warm-up rules
+  · vectorized Monte Carlo consumes np.random like the nested loop
+  · ARES strategies fall back to the per-candle engine
+
+Harold Nunes — OMNIX QUANTUM LTD — October 2026
+"""
+from __future__ import annotations
+
+import math
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+try:
+    from omnix_testing.backtesting.backtesting_engine import BacktestingEngine
+    from omnix_testing.backtesting.vectorized_engine import (
+        VectorizedBacktestingEngine,
+        drawdown_series,
+        ma_cross_signals,
+    )
+except Exception:                                   # pragma: no cover - optional deps
+    pytest.skip("omnix_testing not importable in test env", allow_module_level=True)
+
+
+def _ohlcv(n: int, seed: int, freq: str = "1h") -> "pd.DataFrame":
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq=freq),
+        "open": close, "high": close * 1.001, "low": close * 0.999, "close": close,
+        "vwap": close, "volume": rng.uniform(1, 10, n), "count": 5,
+    })
+
+
+def _run(cls, df, strategy, params=None):
+    engine = cls(initial_capital=10000.0)
+    with patch.object(engine.data_downloader, "download_ohlcv", return_value=df), \
+            patch.object(engine, "_print_summary"):
+        return engine.run_backtest(strategy_name=strategy, strategy_params=params)
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)                      # KrakenDataDownloader creates its cache dir
+
+
+class TestParity:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("strategy,params", [
+        ("simple_ma_cross", None),
+        ("simple_ma_cross", {"fast_period": 5, "slow_period": 20}),
+        ("simple_ma_cross", {"fast_period": 120, "slow_period": 60}),
+        ("simple_ma_cross", {"slow_period": 100}),
+        ("buy_hold", None),
+        ("rsi_divergence", None),
+    ])
+    def test_matches_per_candle_engine(self, seed, strategy, params):
+        df = _ohlcv(2500, seed)
+        legacy = _run(BacktestingEngine, df, strategy, params)
+        fast = _run(VectorizedBacktestingEngine, df, strategy, params)
+
+        assert fast["trades"] == legacy["trades"]
+        assert fast["equity_curve"] == legacy["equity_curve"]
+        assert fast["final_capital"] == legacy["final_capital"]
+        assert fast["metrics"].keys() == legacy["metrics"].keys()
+        assert all(_same(fast["metrics"][k], legacy["metrics"][k]) for k in legacy["metrics"])
+        for key in ("start_date", "end_date", "total_candles", "strategy"):
+            assert fast[key] == legacy[key]
+
+    def test_insufficient_data(self):
+        assert _run(VectorizedBacktestingEngine, _ohlcv(20, 0), "buy_hold") == \
+            {"error": "Insufficient data"}
+
+    def test_ares_falls_back_to_per_candle_engine(self):
+        with patch.object(BacktestingEngine, "run_backtest", return_value={"legacy": True}) as legacy:
+            assert _run(VectorizedBacktestingEngine, _ohlcv(100, 0), "ares_v1_swing") == {"legacy": True}
+        assert legacy.call_args.args[4] == "ares_v1_swing"
+
+
+class TestSignals:
+    def test_no_signal_before_warmup(self):
+        close = np.concatenate([np.full(40, 100.0), np.linspace(90, 110, 60)])
+        bullish, bearish = ma_cross_signals(close, 10, 30)
+        assert not bullish[:30].any() and not bearish[:30].any()
+        assert ma_cross_signals(close, 10, 100)[0].sum() == 0
+
+    def test_drawdown_series(self):
+        dd = drawdown_series(np.array([100.0, 120.0, 90.0, 130.0]))
+        assert dd.tolist() == [0.0, 0.0, -25.0, 0.0]
+
+
+class TestMonteCarlo:
+    def test_same_draws_as_nested_loop(self):
+        trades = _run(BacktestingEngine, _ohlcv(2500, 1), "simple_ma_cross")["trades"]
+        assert len(trades) >= 10
+        legacy, fast = BacktestingEngine(), VectorizedBacktestingEngine()
+        np.random.seed(11)
+        expected = legacy.run_monte_carlo_simulation(trades, num_simulations=50, future_trades=20)
+        np.random.seed(11)
+        actual = fast.run_monte_carlo_simulation(trades, num_simulations=50, future_trades=20)
+        assert actual == expected